@@ -9,6 +9,9 @@ from .models import (
     TourInventory,
     SeasonalRate,
     RecurringRule,
+    DailyRate,
+    Amenity,
+    MediaBlob,
     Booking,
     GeniusProfile,
     Reward,
@@ -135,6 +138,35 @@ class RecurringRuleAdmin(admin.ModelAdmin):
     list_editable = ["is_available", "price_multiplier", "is_active"]
 
 
+@admin.register(DailyRate)
+class DailyRateAdmin(admin.ModelAdmin):
+    list_display = [
+        "date",
+        "accommodation",
+        "tour",
+        "price",
+        "min_stay",
+        "is_available",
+    ]
+    list_filter = ["is_available", "date"]
+    search_fields = ["accommodation__property_name", "tour__tour_name"]
+    date_hierarchy = "date"
+    readonly_fields = ["accommodation", "tour", "date", "price", "min_stay", "is_available", "updated_at"]
+
+
+@admin.register(Amenity)
+class AmenityAdmin(admin.ModelAdmin):
+    list_display = ["name"]
+    search_fields = ["name"]
+
+
+@admin.register(MediaBlob)
+class MediaBlobAdmin(admin.ModelAdmin):
+    list_display = ["name", "size", "ref_count", "created_at"]
+    search_fields = ["name"]
+    readonly_fields = ["name", "size", "ref_count", "created_at"]
+
+
 # ============================================================================
 # GENIUS REWARDS ADMIN
 # ============================================================================
@@ -1,7 +1,7 @@
 from rest_framework import viewsets, status
-from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.decorators import action, api_view, authentication_classes, permission_classes
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.shortcuts import get_object_or_404
 from django.db import transaction
 from django.utils import timezone
@@ -16,6 +16,11 @@ from .serializers import (
     DayRoomUpdateSerializer
 )
 from .permissions import IsListingOwner, IsListingOwnerFromParams
+from .calendar_utils import (
+    bulk_update_listing_calendar, evaluate_stay, expand_calendar_dates,
+    iter_dates, load_listing_calendar_matrix
+)
+from .destination_index import AUTOCOMPLETE_TOP_K, autocomplete
 import logging
 
 logger = logging.getLogger(__name__)
@@ -62,14 +67,12 @@ class CalendarViewSet(viewsets.ViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Get all dates in range
-            current_date = from_date
-            calendar_data = []
-            
-            while current_date <= to_date:
-                day_data = self._get_day_data(listing, current_date)
-                calendar_data.append(day_data)
-                current_date += timedelta(days=1)
+            # Load the whole window once, then build each day from memory
+            matrix = load_listing_calendar_matrix(listing, from_date, to_date)
+            calendar_data = [
+                self._get_day_data(listing, current_date, matrix)
+                for current_date in iter_dates(from_date, to_date)
+            ]
             
             return Response({
                 'listing': {
@@ -89,16 +92,23 @@ class CalendarViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def _get_day_data(self, listing, date):
-        """Get comprehensive day data including room inventory"""
+    def _get_day_data(self, listing, date, matrix=None):
+        """
+        Get comprehensive day data including room inventory.
+        Pass a matrix from load_listing_calendar_matrix to avoid per-day queries.
+        """
+        if matrix is None:
+            matrix = load_listing_calendar_matrix(listing, date, date)
+        room_types, availability_days, inventories = matrix
+        
         # Get availability day data
-        try:
-            availability_day = AvailabilityDay.objects.get(listing=listing, date=date)
+        availability_day = availability_days.get(date)
+        if availability_day:
             day_status = availability_day.status
             day_price = availability_day.price
             day_min_stay = availability_day.min_stay
             day_notes = availability_day.notes
-        except AvailabilityDay.DoesNotExist:
+        else:
             day_status = 'OPEN'
             day_price = None
             day_min_stay = None
@@ -110,13 +120,9 @@ class CalendarViewSet(viewsets.ViewSet):
         total_capacity = 0
         stop_sell_count = 0
         
-        for room_type in listing.room_types.filter(is_active=True):
-            try:
-                inventory = DayRoomInventory.objects.get(
-                    listing=listing,
-                    room_type=room_type,
-                    date=date
-                )
+        for room_type in room_types:
+            inventory = inventories.get((date, room_type.id))
+            if inventory:
                 available = inventory.available
                 total_available += available
                 total_capacity += room_type.total_units
@@ -137,7 +143,7 @@ class CalendarViewSet(viewsets.ViewSet):
                     'override_price': str(inventory.override_price) if inventory.override_price else None,
                     'note': inventory.note,
                 })
-            except DayRoomInventory.DoesNotExist:
+            else:
                 # No inventory record - assume all units available at base price
                 available = room_type.total_units
                 total_available += available
@@ -382,12 +388,7 @@ class CalendarViewSet(viewsets.ViewSet):
                 )
             
             # Generate dates to update
-            dates_to_update = []
-            current_date = from_date
-            while current_date <= to_date:
-                if not weekday_filter or current_date.weekday() in weekday_filter:
-                    dates_to_update.append(current_date)
-                current_date += timedelta(days=1)
+            dates_to_update = expand_calendar_dates(from_date, to_date, weekday_filter)
             
             if not dates_to_update:
                 return Response(
@@ -395,91 +396,16 @@ class CalendarViewSet(viewsets.ViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            errors = []
-            updated_dates = []
-            
-            with transaction.atomic():
-                for date in dates_to_update:
-                    try:
-                        # Update availability day if specified
-                        if any(key in updates for key in ['status', 'price', 'min_stay', 'notes']):
-                            availability_day, created = AvailabilityDay.objects.get_or_create(
-                                listing=listing,
-                                date=date,
-                                defaults={}
-                            )
-                            
-                            if 'status' in updates:
-                                availability_day.status = updates['status']
-                            if 'price' in updates:
-                                availability_day.price = updates['price']
-                            if 'min_stay' in updates:
-                                availability_day.min_stay = updates['min_stay']
-                            if 'notes' in updates:
-                                availability_day.notes = updates['notes']
-                            
-                            availability_day.save()
-                        
-                        # Update room inventory if specified
-                        if any(key in updates for key in ['units_open', 'stop_sell', 'cta', 'ctd', 'override_price', 'note']):
-                            for room_type in listing.room_types.filter(is_active=True):
-                                inventory, created = DayRoomInventory.objects.get_or_create(
-                                    listing=listing,
-                                    room_type=room_type,
-                                    date=date,
-                                    defaults={'units_open': room_type.total_units}
-                                )
-                                
-                                # Apply inventory updates
-                                if 'units_open' in updates:
-                                    units_open = updates['units_open']
-                                    # Handle percentage
-                                    if isinstance(units_open, str) and units_open.endswith('%'):
-                                        percentage = float(units_open[:-1]) / 100
-                                        units_open = int(room_type.total_units * percentage)
-                                    
-                                    if units_open < inventory.units_booked:
-                                        errors.append({
-                                            'date': date.isoformat(),
-                                            'room_type': room_type.name,
-                                            'error': f'Cannot set units_open below {inventory.units_booked} booked units'
-                                        })
-                                        continue
-                                    
-                                    inventory.units_open = min(units_open, room_type.total_units)
-                                
-                                if 'stop_sell' in updates:
-                                    inventory.stop_sell = updates['stop_sell']
-                                if 'cta' in updates:
-                                    inventory.cta = updates['cta']
-                                if 'ctd' in updates:
-                                    inventory.ctd = updates['ctd']
-                                if 'override_price' in updates:
-                                    override_price = updates['override_price']
-                                    if isinstance(override_price, str) and override_price.startswith('+'):
-                                        # Relative price adjustment
-                                        adjustment = float(override_price[1:])
-                                        base_price = inventory.override_price or room_type.base_price
-                                        inventory.override_price = base_price * (1 + adjustment / 100)
-                                    elif isinstance(override_price, str) and override_price.startswith('-'):
-                                        # Relative price adjustment
-                                        adjustment = float(override_price[1:])
-                                        base_price = inventory.override_price or room_type.base_price
-                                        inventory.override_price = base_price * (1 - adjustment / 100)
-                                    else:
-                                        inventory.override_price = override_price
-                                if 'note' in updates:
-                                    inventory.note = updates['note']
-                                
-                                inventory.save()
-                        
-                        updated_dates.append(date.isoformat())
-                        
-                    except Exception as e:
-                        errors.append({
-                            'date': date.isoformat(),
-                            'error': str(e)
-                        })
+            try:
+                with transaction.atomic():
+                    errors = bulk_update_listing_calendar(listing, dates_to_update, updates)
+            except ValueError as e:
+                return Response(
+                    {'error': str(e)},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            updated_dates = [date.isoformat() for date in dates_to_update]
             
             if errors:
                 return Response({
@@ -500,3 +426,72 @@ class CalendarViewSet(viewsets.ViewSet):
                 {'error': 'Internal server error'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def stay_quote(request, listing_id):
+    """
+    Check bookability and quote a stay for one room type of a published listing
+    Query params: room_type, check_in, check_out (YYYY-MM-DD), guests
+    """
+    try:
+        room_type_id = int(request.query_params.get('room_type', ''))
+        check_in = datetime.strptime(request.query_params.get('check_in', ''), '%Y-%m-%d').date()
+        check_out = datetime.strptime(request.query_params.get('check_out', ''), '%Y-%m-%d').date()
+        guests = int(request.query_params.get('guests', 1))
+    except ValueError:
+        return Response(
+            {'error': 'room_type and guests must be numbers, check_in and check_out YYYY-MM-DD'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    if guests < 1:
+        return Response(
+            {'error': 'guests must be at least 1'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    listing = get_object_or_404(Listing, id=listing_id, is_active=True, is_published=True)
+    room_type = get_object_or_404(RoomType, id=room_type_id, listing=listing)
+    
+    try:
+        quote = evaluate_stay(listing, room_type, check_in, check_out, guests)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    quote['nightly'] = [
+        {'date': night['date'], 'price': str(night['price'])}
+        for night in quote['nightly']
+    ]
+    quote['total_price'] = str(quote['total_price'])
+    
+    return Response({
+        'listing_id': listing.id,
+        'room_type_id': room_type.id,
+        'check_in': check_in.isoformat(),
+        'check_out': check_out.isoformat(),
+        'guests': guests,
+        **quote,
+    })
+
+
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def destination_autocomplete(request):
+    """
+    Destination suggestions (countries, cities, attractions) for the search box
+    Query params: q (typed prefix), limit (default and max AUTOCOMPLETE_TOP_K)
+    Served from the in-memory trie; no authentication so no session lookup either
+    """
+    query = request.query_params.get('q', '')
+    try:
+        limit = max(1, min(int(request.query_params.get('limit', AUTOCOMPLETE_TOP_K)), AUTOCOMPLETE_TOP_K))
+    except ValueError:
+        limit = AUTOCOMPLETE_TOP_K
+    
+    return Response({
+        'query': query,
+        'results': autocomplete(query, limit),
+    })
@@ -21,6 +21,7 @@ from .models import (
     TourAvailability,
     CalendarBulkUpdate
 )
+from .calendar_utils import bulk_upsert_accommodation_calendar, load_accommodation_calendar, load_tour_calendar
 
 
 @login_required
@@ -42,62 +43,28 @@ def get_accommodation_calendar(request, accommodation_id):
     except (ValueError, TypeError):
         return JsonResponse({'error': 'Invalid date format. Use YYYY-MM-DD'}, status=400)
     
-    # Get availability records for date range
-    availabilities = AccommodationAvailability.objects.filter(
-        accommodation=accommodation,
-        date__gte=start_date,
-        date__lte=end_date
-    ).order_by('date')
-    
-    # Build calendar data
+    # Build calendar data from one range read (stored dates + materialized rates)
     calendar_data = []
-    current_date = start_date
     
-    while current_date <= end_date:
-        # Try to get existing availability record
-        availability = availabilities.filter(date=current_date).first()
-        
-        if availability:
-            calendar_data.append({
-                'date': current_date.isoformat(),
-                'is_available': availability.is_available,
-                'is_blocked': availability.is_blocked,
-                'price': float(availability.price_per_night),
-                'original_price': float(availability.original_price) if availability.original_price else None,
-                'minimum_stay': availability.minimum_stay,
-                'maximum_stay': availability.maximum_stay,
-                'total_rooms': availability.total_rooms,
-                'rooms_available': availability.rooms_available,
-                'rooms_booked': availability.rooms_booked,
-                'rooms_blocked': availability.rooms_blocked,
-                'is_fully_booked': availability.is_fully_booked,
-                'occupancy_percentage': float(availability.occupancy_percentage),
-                'is_special_rate': availability.is_special_rate,
-                'rate_type': availability.rate_type,
-                'rate_note': availability.rate_note,
-            })
-        else:
-            # Use default values from accommodation
-            calendar_data.append({
-                'date': current_date.isoformat(),
-                'is_available': True,
-                'is_blocked': False,
-                'price': float(accommodation.base_price) if accommodation.base_price else 0,
-                'original_price': None,
-                'minimum_stay': 1,
-                'maximum_stay': None,
-                'total_rooms': 1,
-                'rooms_available': 1,
-                'rooms_booked': 0,
-                'rooms_blocked': 0,
-                'is_fully_booked': False,
-                'occupancy_percentage': 0,
-                'is_special_rate': False,
-                'rate_type': '',
-                'rate_note': '',
-            })
-        
-        current_date += timedelta(days=1)
+    for current_date, availability in load_accommodation_calendar(accommodation, start_date, end_date):
+        calendar_data.append({
+            'date': current_date.isoformat(),
+            'is_available': availability.is_available,
+            'is_blocked': availability.is_blocked,
+            'price': float(availability.price_per_night),
+            'original_price': float(availability.original_price) if availability.original_price else None,
+            'minimum_stay': availability.minimum_stay,
+            'maximum_stay': availability.maximum_stay,
+            'total_rooms': availability.total_rooms,
+            'rooms_available': availability.rooms_available,
+            'rooms_booked': availability.rooms_booked,
+            'rooms_blocked': availability.rooms_blocked,
+            'is_fully_booked': availability.is_fully_booked,
+            'occupancy_percentage': float(availability.occupancy_percentage),
+            'is_special_rate': availability.is_special_rate,
+            'rate_type': availability.rate_type,
+            'rate_note': availability.rate_note,
+        })
     
     # Calculate statistics
     stats = {
@@ -201,7 +168,8 @@ def bulk_update_accommodation_dates(request, accommodation_id):
     Bulk update multiple dates at once
     Body: JSON with start_date, end_date, and fields to update
     """
-    accommodation = get_object_or_404(Accommodation, id=accommodation_id, host=request.user.profile)
+    # Filter by User, not UserProfile (host field is ForeignKey to User)
+    accommodation = get_object_or_404(Accommodation, id=accommodation_id, host=request.user)
     
     try:
         data = json.loads(request.body)
@@ -223,64 +191,33 @@ def bulk_update_accommodation_dates(request, accommodation_id):
     if end_date < start_date:
         return JsonResponse({'error': 'end_date must be after start_date'}, status=400)
     
-    # Store previous values for audit
-    previous_values = {}
-    new_values = {}
+    # Collect the field updates once; they apply to every date in the range
+    updates = {}
+    if 'is_available' in data:
+        updates['is_available'] = bool(data['is_available'])
+    if 'is_blocked' in data:
+        updates['is_blocked'] = bool(data['is_blocked'])
+    if 'price' in data:
+        updates['price_per_night'] = Decimal(str(data['price']))
+    if 'original_price' in data:
+        updates['original_price'] = Decimal(str(data['original_price'])) if data['original_price'] else None
+    if 'minimum_stay' in data:
+        updates['minimum_stay'] = int(data['minimum_stay'])
+    if 'maximum_stay' in data:
+        updates['maximum_stay'] = int(data['maximum_stay']) if data['maximum_stay'] else None
+    if 'is_special_rate' in data:
+        updates['is_special_rate'] = bool(data['is_special_rate'])
+    if 'rate_type' in data:
+        updates['rate_type'] = data['rate_type']
+    if 'rate_note' in data:
+        updates['rate_note'] = data['rate_note']
     
     with transaction.atomic():
-        current_date = start_date
-        updated_count = 0
-        
-        while current_date <= end_date:
-            # Get or create availability record
-            availability, created = AccommodationAvailability.objects.get_or_create(
-                accommodation=accommodation,
-                date=current_date,
-                defaults={
-                    'price_per_night': accommodation.price_per_night if hasattr(accommodation, 'price_per_night') else 0,
-                    'total_rooms': 1,
-                }
-            )
-            
-            # Store previous values if not created
-            if not created:
-                previous_values[current_date.isoformat()] = {
-                    'price': float(availability.price_per_night),
-                    'is_available': availability.is_available,
-                    'is_blocked': availability.is_blocked,
-                }
-            
-            # Update fields
-            if 'is_available' in data:
-                availability.is_available = bool(data['is_available'])
-            if 'is_blocked' in data:
-                availability.is_blocked = bool(data['is_blocked'])
-            if 'price' in data:
-                availability.price_per_night = Decimal(str(data['price']))
-            if 'original_price' in data:
-                availability.original_price = Decimal(str(data['original_price'])) if data['original_price'] else None
-            if 'minimum_stay' in data:
-                availability.minimum_stay = int(data['minimum_stay'])
-            if 'maximum_stay' in data:
-                availability.maximum_stay = int(data['maximum_stay']) if data['maximum_stay'] else None
-            if 'is_special_rate' in data:
-                availability.is_special_rate = bool(data['is_special_rate'])
-            if 'rate_type' in data:
-                availability.rate_type = data['rate_type']
-            if 'rate_note' in data:
-                availability.rate_note = data['rate_note']
-            
-            availability.save()
-            
-            # Store new values
-            new_values[current_date.isoformat()] = {
-                'price': float(availability.price_per_night),
-                'is_available': availability.is_available,
-                'is_blocked': availability.is_blocked,
-            }
-            
-            updated_count += 1
-            current_date += timedelta(days=1)
+        # One read plus chunked upserts, regardless of range length
+        previous_values, new_values = bulk_upsert_accommodation_calendar(
+            accommodation, start_date, end_date, updates
+        )
+        updated_count = len(new_values)
         
         # Create bulk update record for audit
         CalendarBulkUpdate.objects.create(
@@ -311,7 +248,8 @@ def get_tour_calendar(request, tour_id):
     Get calendar data for a specific tour
     Query params: start_date, end_date (YYYY-MM-DD format)
     """
-    tour = get_object_or_404(Tour, id=tour_id, host=request.user.profile)
+    # Filter by User, not UserProfile (host field is ForeignKey to User)
+    tour = get_object_or_404(Tour, id=tour_id, host=request.user)
     
     start_date_str = request.GET.get('start_date')
     end_date_str = request.GET.get('end_date')
@@ -322,39 +260,33 @@ def get_tour_calendar(request, tour_id):
     except (ValueError, TypeError):
         return JsonResponse({'error': 'Invalid date format. Use YYYY-MM-DD'}, status=400)
     
-    # Get availability records for date range
-    availabilities = TourAvailability.objects.filter(
-        tour=tour,
-        date__gte=start_date,
-        date__lte=end_date
-    ).order_by('date', 'start_time')
-    
-    # Build calendar data
+    # Build calendar data from one range read (stored slots + materialized rates)
     calendar_data = []
     
-    for availability in availabilities:
-        calendar_data.append({
-            'id': availability.id,
-            'date': availability.date.isoformat(),
-            'is_available': availability.is_available,
-            'is_blocked': availability.is_blocked,
-            'price': float(availability.price_per_person),
-            'original_price': float(availability.original_price) if availability.original_price else None,
-            'max_participants': availability.max_participants,
-            'spots_available': availability.spots_available,
-            'participants_booked': availability.participants_booked,
-            'min_participants': availability.min_participants,
-            'is_fully_booked': availability.is_fully_booked,
-            'meets_minimum': availability.meets_minimum,
-            'occupancy_percentage': float(availability.occupancy_percentage),
-            'start_time': availability.start_time.isoformat() if availability.start_time else None,
-            'end_time': availability.end_time.isoformat() if availability.end_time else None,
-            'is_special_rate': availability.is_special_rate,
-            'rate_type': availability.rate_type,
-            'rate_note': availability.rate_note,
-            'group_discount_percentage': float(availability.group_discount_percentage),
-            'group_size_threshold': availability.group_size_threshold,
-        })
+    for _, availabilities in load_tour_calendar(tour, start_date, end_date):
+        for availability in availabilities:
+            calendar_data.append({
+                'id': availability.id,
+                'date': availability.date.isoformat(),
+                'is_available': availability.is_available,
+                'is_blocked': availability.is_blocked,
+                'price': float(availability.price_per_person),
+                'original_price': float(availability.original_price) if availability.original_price else None,
+                'max_participants': availability.max_participants,
+                'spots_available': availability.spots_available,
+                'participants_booked': availability.participants_booked,
+                'min_participants': availability.min_participants,
+                'is_fully_booked': availability.is_fully_booked,
+                'meets_minimum': availability.meets_minimum,
+                'occupancy_percentage': float(availability.occupancy_percentage),
+                'start_time': availability.start_time.isoformat() if availability.start_time else None,
+                'end_time': availability.end_time.isoformat() if availability.end_time else None,
+                'is_special_rate': availability.is_special_rate,
+                'rate_type': availability.rate_type,
+                'rate_note': availability.rate_note,
+                'group_discount_percentage': float(availability.group_discount_percentage),
+                'group_size_threshold': availability.group_size_threshold,
+            })
     
     # Calculate statistics
     stats = {
@@ -370,7 +302,7 @@ def get_tour_calendar(request, tour_id):
         'success': True,
         'tour': {
             'id': tour.id,
-            'name': tour.name,
+            'name': tour.tour_name,
         },
         'calendar': calendar_data,
         'stats': stats,
@@ -398,36 +330,16 @@ def get_public_accommodation_availability(request, accommodation_id):
     except ValueError:
         return JsonResponse({'error': 'Invalid date format. Use YYYY-MM-DD'}, status=400)
     
-    # Get availability for date range
-    availabilities = AccommodationAvailability.objects.filter(
-        accommodation=accommodation,
-        date__gte=start_date,
-        date__lte=end_date
-    ).order_by('date')
-    
+    # Get availability for date range in one range read
     calendar_data = {}
-    current_date = start_date
     
-    while current_date <= end_date:
-        availability = availabilities.filter(date=current_date).first()
-        
-        if availability:
-            calendar_data[current_date.isoformat()] = {
-                'available': availability.is_available and not availability.is_blocked and availability.rooms_available > 0,
-                'price': float(availability.price_per_night),
-                'rooms_available': availability.rooms_available,
-                'minimum_stay': availability.minimum_stay,
-            }
-        else:
-            # Default: available with base price
-            calendar_data[current_date.isoformat()] = {
-                'available': True,
-                'price': float(accommodation.price_per_night) if hasattr(accommodation, 'price_per_night') else 0,
-                'rooms_available': 1,
-                'minimum_stay': 1,
-            }
-        
-        current_date += timedelta(days=1)
+    for current_date, availability in load_accommodation_calendar(accommodation, start_date, end_date):
+        calendar_data[current_date.isoformat()] = {
+            'available': availability.is_available and not availability.is_blocked and availability.rooms_available > 0,
+            'price': float(availability.price_per_night),
+            'rooms_available': availability.rooms_available,
+            'minimum_stay': availability.minimum_stay,
+        }
     
     return JsonResponse({
         'success': True,
@@ -0,0 +1,505 @@
+"""
+Calendar Utility Functions for BedBees
+Loads and writes per-date availability for whole date ranges in a constant
+number of queries, shared by the calendar API views.
+"""
+
+import math
+from datetime import timedelta
+from decimal import Decimal, InvalidOperation
+
+from .models import AccommodationAvailability, AvailabilityDay, DailyRate, DayRoomInventory, TourAvailability
+
+
+# Rows per INSERT ... ON CONFLICT statement for bulk calendar writes
+BULK_BATCH_SIZE = 500
+
+# Fields accepted by the multi-room bulk calendar update
+DAY_UPDATE_FIELDS = ['status', 'price', 'min_stay', 'notes']
+ROOM_UPDATE_FIELDS = ['units_open', 'stop_sell', 'cta', 'ctd', 'override_price', 'note']
+
+# AvailabilityDay statuses that close the whole listing for the night
+CLOSED_DAY_STATUSES = ['CLOSED', 'BLOCKED']
+
+
+def iter_dates(start_date, end_date):
+    """
+    Yield every date from start_date to end_date (inclusive).
+    """
+    current_date = start_date
+    while current_date <= end_date:
+        yield current_date
+        current_date += timedelta(days=1)
+
+
+def default_accommodation_availability(accommodation, date, daily_rate=None):
+    """
+    Build an unsaved availability record for a date the host has not edited.
+
+    Uses the model defaults (available, one room, no stay limits) priced from
+    the materialized DailyRate when one exists, else the accommodation's
+    base_price.
+    """
+    if daily_rate:
+        return AccommodationAvailability(
+            accommodation=accommodation,
+            date=date,
+            price_per_night=daily_rate.price,
+            minimum_stay=daily_rate.min_stay,
+            is_available=daily_rate.is_available,
+        )
+
+    return AccommodationAvailability(
+        accommodation=accommodation,
+        date=date,
+        price_per_night=accommodation.base_price or 0,
+    )
+
+
+def load_accommodation_calendar(accommodation, start_date, end_date):
+    """
+    Load availability for every date in a range.
+
+    Reads the stored AccommodationAvailability rows and the DailyRate rows
+    used for gaps, one query each.
+
+    Args:
+        accommodation: The Accommodation to load
+        start_date: First date of the range
+        end_date: Last date of the range (inclusive)
+
+    Returns:
+        List of (date, AccommodationAvailability) tuples, one per day in order.
+        Days without a stored record get an unsaved default record.
+    """
+    availabilities = {
+        availability.date: availability
+        for availability in AccommodationAvailability.objects.filter(
+            accommodation=accommodation,
+            date__gte=start_date,
+            date__lte=end_date,
+        )
+    }
+    daily_rates = {
+        daily_rate.date: daily_rate
+        for daily_rate in DailyRate.objects.filter(
+            accommodation=accommodation,
+            date__gte=start_date,
+            date__lte=end_date,
+        )
+    }
+
+    return [
+        (
+            current_date,
+            availabilities.get(current_date)
+            or default_accommodation_availability(accommodation, current_date, daily_rates.get(current_date)),
+        )
+        for current_date in iter_dates(start_date, end_date)
+    ]
+
+
+def default_tour_availability(tour, date, daily_rate=None):
+    """
+    Build an unsaved slot for a tour date the host has not scheduled.
+
+    Takes the tour's participant limits, priced and opened from the
+    materialized DailyRate when one exists, else the tour's price_per_person.
+    """
+    return TourAvailability(
+        tour=tour,
+        date=date,
+        price_per_person=daily_rate.price if daily_rate else tour.price_per_person or 0,
+        is_available=daily_rate.is_available if daily_rate else True,
+        max_participants=tour.max_participants,
+        min_participants=tour.min_participants,
+    )
+
+
+def load_tour_calendar(tour, start_date, end_date):
+    """
+    Load the tour slots of every date in a range.
+
+    Reads the stored TourAvailability slots and the DailyRate rows used for
+    unscheduled dates, one query each.
+
+    Returns:
+        List of (date, [TourAvailability]) tuples, one per day in order.
+        Days without a stored slot get one unsaved default slot.
+    """
+    slots = {}
+    for availability in TourAvailability.objects.filter(
+        tour=tour,
+        date__gte=start_date,
+        date__lte=end_date,
+    ).order_by('date', 'start_time'):
+        slots.setdefault(availability.date, []).append(availability)
+
+    daily_rates = {
+        daily_rate.date: daily_rate
+        for daily_rate in DailyRate.objects.filter(
+            tour=tour,
+            date__gte=start_date,
+            date__lte=end_date,
+        )
+    }
+
+    return [
+        (
+            current_date,
+            slots.get(current_date)
+            or [default_tour_availability(tour, current_date, daily_rates.get(current_date))],
+        )
+        for current_date in iter_dates(start_date, end_date)
+    ]
+
+
+def _calendar_audit_values(availability):
+    """
+    Snapshot of the fields recorded in CalendarBulkUpdate for one date.
+    """
+    return {
+        'price': float(availability.price_per_night),
+        'is_available': availability.is_available,
+        'is_blocked': availability.is_blocked,
+    }
+
+
+def bulk_upsert_accommodation_calendar(accommodation, start_date, end_date, updates, batch_size=BULK_BATCH_SIZE):
+    """
+    Apply the same field updates to every date in a range.
+
+    Existing rows are read in one query, the changes and audit diff are
+    computed in memory and everything is written back with chunked upserts,
+    so the number of queries does not grow with the length of the range.
+
+    Args:
+        accommodation: The Accommodation to update
+        start_date: First date of the range
+        end_date: Last date of the range (inclusive)
+        updates: Dict of AccommodationAvailability field names to new values
+        batch_size: Rows written per INSERT ... ON CONFLICT statement
+
+    Returns:
+        Tuple of (previous_values, new_values) keyed by ISO date, in the
+        format stored on CalendarBulkUpdate.
+    """
+    previous_values = {}
+    new_values = {}
+    rows = []
+
+    for current_date, availability in load_accommodation_calendar(accommodation, start_date, end_date):
+        if availability.pk:
+            previous_values[current_date.isoformat()] = _calendar_audit_values(availability)
+
+        for field, value in updates.items():
+            setattr(availability, field, value)
+
+        new_values[current_date.isoformat()] = _calendar_audit_values(availability)
+        rows.append(availability)
+
+    AccommodationAvailability.objects.bulk_create(
+        rows,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=['accommodation', 'date'],
+        update_fields=list(updates) + ['updated_at'],
+    )
+
+    return previous_values, new_values
+
+
+def load_listing_calendar_matrix(listing, start_date, end_date):
+    """
+    Load the dates x room types calendar of a multi-room listing in three queries.
+
+    Args:
+        listing: The Listing to load
+        start_date: First date of the range
+        end_date: Last date of the range (inclusive)
+
+    Returns:
+        Tuple of (room_types, availability_days, inventories):
+            room_types: Active RoomTypes of the listing, ordered by name
+            availability_days: Dict of date -> AvailabilityDay
+            inventories: Dict of (date, room_type_id) -> DayRoomInventory
+        Dates or rooms without a stored record are simply missing from the dicts.
+    """
+    room_types = list(listing.room_types.filter(is_active=True))
+
+    availability_days = {
+        day.date: day
+        for day in AvailabilityDay.objects.filter(
+            listing=listing,
+            date__gte=start_date,
+            date__lte=end_date,
+        )
+    }
+
+    inventories = {
+        (inventory.date, inventory.room_type_id): inventory
+        for inventory in DayRoomInventory.objects.filter(
+            listing=listing,
+            date__gte=start_date,
+            date__lte=end_date,
+        )
+    }
+
+    return room_types, availability_days, inventories
+
+
+def expand_calendar_dates(start_date, end_date, weekday_filter=None):
+    """
+    List the dates in a range, optionally keeping only some weekdays.
+
+    Args:
+        weekday_filter: Optional list of weekday numbers (0=Monday)
+    """
+    weekdays = set(weekday_filter) if weekday_filter else None
+    return [
+        current_date
+        for current_date in iter_dates(start_date, end_date)
+        if weekdays is None or current_date.weekday() in weekdays
+    ]
+
+
+def _parse_units_open(units_open, room_types):
+    """
+    Resolve a units_open update to a target per room type id.
+
+    Accepts an absolute number of units or a percentage string such as "50%"
+    of each room type's total_units. Raises ValueError for anything else.
+    """
+    try:
+        if isinstance(units_open, str) and units_open.endswith('%'):
+            percentage = float(units_open[:-1]) / 100
+            return {room_type.id: int(room_type.total_units * percentage) for room_type in room_types}
+
+        units_open = int(units_open)
+    except (TypeError, ValueError):
+        raise ValueError(f'Invalid units_open: {units_open}')
+
+    return {room_type.id: units_open for room_type in room_types}
+
+
+def _parse_override_price(override_price):
+    """
+    Parse an override_price update into (factor, absolute_price).
+
+    "+10" / "-10" strings adjust the current price by a percentage and return a
+    multiplier; anything else is an absolute price (or None to clear it).
+    Raises ValueError for malformed values.
+    """
+    if override_price is None:
+        return None, None
+
+    try:
+        if isinstance(override_price, str) and override_price[:1] in ('+', '-'):
+            adjustment = Decimal(override_price[1:]) / 100
+            factor = 1 + adjustment if override_price[0] == '+' else 1 - adjustment
+            return factor, None
+
+        return None, Decimal(str(override_price))
+    except InvalidOperation:
+        raise ValueError(f'Invalid override_price: {override_price}')
+
+
+def bulk_update_listing_calendar(listing, dates, updates, batch_size=BULK_BATCH_SIZE):
+    """
+    Apply the same updates to many dates across all active room types.
+
+    Everything is parsed once, existing rows are read with
+    load_listing_calendar_matrix, units_open is validated against
+    units_booked in memory and the result is written with chunked upserts.
+
+    Args:
+        listing: The Listing to update
+        dates: Sorted list of dates to update
+        updates: Dict of DAY_UPDATE_FIELDS / ROOM_UPDATE_FIELDS to new values
+        batch_size: Rows written per INSERT ... ON CONFLICT statement
+
+    Returns:
+        List of per-row error dicts for room inventory rows that were skipped.
+
+    Raises:
+        ValueError: If units_open or override_price cannot be parsed.
+    """
+    room_types, availability_days, inventories = load_listing_calendar_matrix(listing, dates[0], dates[-1])
+    errors = []
+
+    day_fields = [field for field in DAY_UPDATE_FIELDS if field in updates]
+    room_fields = [field for field in ROOM_UPDATE_FIELDS if field in updates]
+
+    # Parse the room-level values once for the whole request
+    units_open_targets = _parse_units_open(updates['units_open'], room_types) if 'units_open' in updates else None
+    price_factor, absolute_price = _parse_override_price(updates.get('override_price'))
+
+    if day_fields:
+        days = []
+        for current_date in dates:
+            availability_day = availability_days.get(current_date) or AvailabilityDay(listing=listing, date=current_date)
+            for field in day_fields:
+                setattr(availability_day, field, updates[field])
+            days.append(availability_day)
+
+        AvailabilityDay.objects.bulk_create(
+            days,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['listing', 'date'],
+            update_fields=day_fields + ['updated_at'],
+        )
+
+    if room_fields:
+        rows = []
+        for current_date in dates:
+            for room_type in room_types:
+                inventory = inventories.get((current_date, room_type.id)) or DayRoomInventory(
+                    listing=listing,
+                    room_type=room_type,
+                    date=current_date,
+                    units_open=room_type.total_units,
+                )
+
+                if units_open_targets is not None:
+                    units_open = units_open_targets[room_type.id]
+                    if units_open < inventory.units_booked:
+                        errors.append({
+                            'date': current_date.isoformat(),
+                            'room_type': room_type.name,
+                            'error': f'Cannot set units_open below {inventory.units_booked} booked units'
+                        })
+                        continue
+                    inventory.units_open = min(units_open, room_type.total_units)
+
+                if 'stop_sell' in updates:
+                    inventory.stop_sell = updates['stop_sell']
+                if 'cta' in updates:
+                    inventory.cta = updates['cta']
+                if 'ctd' in updates:
+                    inventory.ctd = updates['ctd']
+                if 'override_price' in updates:
+                    if price_factor is not None:
+                        base_price = inventory.override_price or room_type.base_price
+                        inventory.override_price = (base_price * price_factor).quantize(Decimal('0.01'))
+                    else:
+                        inventory.override_price = absolute_price
+                if 'note' in updates:
+                    inventory.note = updates['note']
+
+                rows.append(inventory)
+
+        DayRoomInventory.objects.bulk_create(
+            rows,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['listing', 'room_type', 'date'],
+            update_fields=room_fields + ['updated_at'],
+        )
+
+    return errors
+
+
+def evaluate_stay(listing, room_type, check_in, check_out, guests=1):
+    """
+    Check whether a room type can be booked for a stay and quote its price.
+
+    Loads the AvailabilityDay and DayRoomInventory rows of the stay window in
+    two queries and applies the listing status, stop_sell, close-to-arrival on
+    check_in, close-to-departure on check_out and the effective minimum stay
+    of the arrival day. Nights without an inventory record have every unit
+    open at the room type's base price.
+
+    Args:
+        listing: The Listing being booked
+        room_type: RoomType of that listing
+        check_in: Arrival date
+        check_out: Departure date (not charged)
+        guests: Party size; split across units using room_type.max_occupancy
+
+    Returns:
+        Dict with bookable, reasons, nights, units, min_stay, nightly
+        ([{'date', 'price'}] per unit), total_price and currency.
+
+    Raises:
+        ValueError: If check_out is not after check_in.
+    """
+    nights = (check_out - check_in).days
+    if nights < 1:
+        raise ValueError('check_out must be after check_in')
+
+    availability_days = {
+        day.date: day
+        for day in AvailabilityDay.objects.filter(
+            listing=listing,
+            date__gte=check_in,
+            date__lt=check_out,
+        )
+    }
+    inventories = {
+        inventory.date: inventory
+        for inventory in DayRoomInventory.objects.filter(
+            listing=listing,
+            room_type=room_type,
+            date__gte=check_in,
+            date__lte=check_out,
+        )
+    }
+
+    # Reuse the objects we already hold instead of lazy-loading them per night
+    for day in availability_days.values():
+        day.listing = listing
+    for inventory in inventories.values():
+        inventory.room_type = room_type
+
+    reasons = []
+
+    if room_type.max_occupancy:
+        units = max(1, math.ceil(guests / room_type.max_occupancy))
+    else:
+        units = 1
+    if not room_type.is_active:
+        reasons.append(f'{room_type.name} is not available')
+    if units > room_type.total_units:
+        reasons.append(f'{room_type.name} cannot host {guests} guests')
+
+    arrival_day = availability_days.get(check_in)
+    min_stay = arrival_day.get_effective_min_stay() if arrival_day else listing.default_min_stay
+    if nights < min_stay:
+        reasons.append(f'Minimum stay is {min_stay} nights')
+
+    arrival = inventories.get(check_in)
+    if arrival and arrival.cta:
+        reasons.append(f'Arrival is not allowed on {check_in.isoformat()}')
+    departure = inventories.get(check_out)
+    if departure and departure.ctd:
+        reasons.append(f'Departure is not allowed on {check_out.isoformat()}')
+
+    nightly = []
+    for night in iter_dates(check_in, check_out - timedelta(days=1)):
+        day = availability_days.get(night)
+        if day and day.status in CLOSED_DAY_STATUSES:
+            reasons.append(f'{night.isoformat()} is {day.status.lower()}')
+
+        inventory = inventories.get(night)
+        if inventory:
+            if inventory.stop_sell:
+                reasons.append(f'{night.isoformat()} is not for sale')
+            elif inventory.available < units:
+                reasons.append(f'Only {inventory.available} units available on {night.isoformat()}')
+            price = inventory.get_effective_price()
+        else:
+            price = room_type.base_price
+
+        nightly.append({'date': night.isoformat(), 'price': price})
+
+    return {
+        'bookable': not reasons,
+        'reasons': reasons,
+        'nights': nights,
+        'units': units,
+        'min_stay': min_stay,
+        'nightly': nightly,
+        'total_price': sum(night['price'] for night in nightly) * units,
+        'currency': listing.currency,
+    }
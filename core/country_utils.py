@@ -0,0 +1,141 @@
+"""
+Country Count Utility Functions for BedBees
+Maintains the denormalized Country.accommodations_count and tours_count
+columns so destination pages can show live listing counts without counting
+per country on every request.
+
+Listings are matched to a country by name, case-insensitively, and only
+published, active listings are counted.
+"""
+
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Lower
+
+from .models import Accommodation, Country, Tour
+
+
+# Country column holding each listing model's count
+COUNT_FIELDS = {
+    Accommodation: 'accommodations_count',
+    Tour: 'tours_count',
+}
+
+
+def is_counted(is_published, is_active):
+    """Whether a listing with these flags counts towards its country"""
+    return bool(is_published and is_active)
+
+
+def adjust_country_count(model, country, delta):
+    """
+    Atomically add delta to one country's count for a listing model.
+
+    Args:
+        model: Accommodation or Tour
+        country: Country name as stored on the listing
+        delta: Amount to add, usually 1 or -1
+    """
+    if not country or not delta:
+        return
+    field = COUNT_FIELDS[model]
+    Country.objects.filter(name__iexact=country).update(**{field: F(field) + delta})
+
+
+def update_listing_visibility(queryset, **flags):
+    """
+    queryset.update() of is_published/is_active that keeps the country
+    counts in step. update() skips the save signals, so the listings whose
+    counted state changes are read first and their countries adjusted in
+    one grouped update each.
+
+    Args:
+        queryset: Accommodation or Tour queryset to update
+        **flags: New is_published and/or is_active values
+
+    Returns:
+        Tuple of (number of rows updated, set of (city, country) pairs
+        whose listings were counted in or out).
+    """
+    model = queryset.model
+    deltas = Counter()
+    changed = set()
+    with transaction.atomic():
+        rows = queryset.select_for_update().values_list('city', 'country', 'is_published', 'is_active')
+        for city, country, is_published, is_active in rows:
+            was_counted = is_counted(is_published, is_active)
+            now_counted = is_counted(flags.get('is_published', is_published), flags.get('is_active', is_active))
+            if was_counted != now_counted:
+                deltas[country.lower()] += 1 if now_counted else -1
+                changed.add((city, country))
+
+        updated = queryset.update(**flags)
+        for country, delta in deltas.items():
+            adjust_country_count(model, country, delta)
+    return updated, changed
+
+
+def reconcile_country_counts():
+    """
+    Recompute every country's counts from the listing tables and fix any
+    that drifted, e.g. after bulk updates that bypass signals.
+
+    Returns:
+        Number of countries whose counts were corrected.
+    """
+    totals = {}
+    for model, field in COUNT_FIELDS.items():
+        rows = (
+            model.objects.filter(is_published=True, is_active=True)
+            .values(name=Lower('country'))
+            .annotate(total=Count('id'))
+        )
+        totals[field] = {row['name']: row['total'] for row in rows}
+
+    changed = []
+    for country in Country.objects.only('id', 'name', *COUNT_FIELDS.values()):
+        stale = False
+        for field, counts in totals.items():
+            value = counts.get(country.name.lower(), 0)
+            if getattr(country, field) != value:
+                setattr(country, field, value)
+                stale = True
+        if stale:
+            changed.append(country)
+
+    Country.objects.bulk_update(changed, list(COUNT_FIELDS.values()))
+    return len(changed)
+
+
+def get_country_counts():
+    """
+    Current listing counts for every country, read from the counter columns.
+
+    Returns:
+        Dict of country slug to {'accommodations_count', 'tours_count'}.
+    """
+    return {
+        row.pop('slug'): row
+        for row in Country.objects.values('slug', *COUNT_FIELDS.values())
+    }
+
+
+def apply_country_counts(countries, key='code'):
+    """
+    Replace the counts on country dicts with live ones, in place.
+    Countries without a Country row count as having no listings.
+
+    Args:
+        countries: List of country dicts
+        key: Dict key holding the country slug
+
+    Returns:
+        The same list.
+    """
+    counts = get_country_counts()
+    empty = dict.fromkeys(COUNT_FIELDS.values(), 0)
+    for country in countries:
+        country.update(counts.get(country[key], empty))
+    return countries
@@ -1,9 +1,29 @@
 """
 Data package for BedBees application.
-Contains countries data and attractions data extracted from views.py
+Contains countries, attractions and demo listing data extracted from views.py,
+plus demo photo placeholders, stored as memory-mapped JSON-lines files
+(see store.py).
 """
 
-from .countries_data import countries_data
-from .demo_attractions import demo_attractions
+from .store import LazyDataset
 
-__all__ = ['countries_data', 'demo_attractions']
+countries_data = LazyDataset('countries_data.jsonl')
+demo_attractions = LazyDataset('demo_attractions.jsonl', depth=2)
+
+# Demo listing pages, by (country, slug) and by booking id
+demo_accommodation_details = LazyDataset('demo_accommodation_details.jsonl', depth=2)
+demo_tour_details = LazyDataset('demo_tour_details.jsonl', depth=2)
+demo_booking_accommodations = LazyDataset('demo_booking_accommodations.jsonl')
+
+# Inline blurred previews of demo photos, by image URL
+photo_placeholders = LazyDataset('photo_placeholders.jsonl')
+
+
+__all__ = [
+    'countries_data',
+    'demo_attractions',
+    'demo_accommodation_details',
+    'demo_tour_details',
+    'demo_booking_accommodations',
+    'photo_placeholders',
+]
@@ -1,361 +1,132 @@
 # Demo accommodations data for Bedbees
-demo_accommodations_data = {
-    # Homes Guests Love - Featured Properties
-    '1': {
-        'id': '1',
-        'name': 'Luxury Villa with Infinity Pool',
-        'location': 'Dubai Marina, UAE',
-        'city': 'Dubai',
-        'country': 'UAE',
-        'description': 'Stunning 4-bedroom villa with private infinity pool and panoramic city views. Perfect for families and groups seeking luxury.',
-        'long_description': 'Experience the epitome of luxury living in this magnificent 4-bedroom villa located in the prestigious Dubai Marina. This contemporary masterpiece features floor-to-ceiling windows, high-end furnishings, and a private infinity pool with breathtaking views of the city skyline. The villa includes a spacious living area, fully equipped gourmet kitchen, master suite with walk-in closet, and three additional bedrooms. Guests enjoy access to premium amenities including 24/7 concierge service, private beach access, and complimentary transfers to major attractions.',
-        'price': 450,
-        'currency': 'USD',
-        'rating': 9.8,
-        'reviews': 324,
-        'type': 'villa',
-        'room_type': 'Entire Villa',
-        'bedrooms': 4,
-        'bathrooms': 3,
-        'max_guests': 8,
-        'property_size': '3500 sq ft',
-        'amenities': ['Private Pool', 'Beach Access', 'Concierge', 'WiFi', 'Parking', 'Kitchen', 'Washer', 'AC', 'Balcony'],
-        'image': 'https://images.unsplash.com/photo-1566073771259-6a8506099945?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        'photos': [
-            'https://images.unsplash.com/photo-1566073771259-6a8506099945?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1582719478250-c89cae4dc85b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1560448204-e02f11c3d0e2?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1571003123894-1f0594d2b5d9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        ],
-        'featured': True,
-        'guest_favorite': True,
-    },
-    '2': {
-        'id': '2',
-        'name': 'Boutique Desert Retreat',
-        'location': 'Wadi Rum, Jordan',
-        'city': 'Wadi Rum',
-        'country': 'Jordan',
-        'description': 'Eco-luxury desert camp with panoramic views of red sand dunes. Authentic Bedouin experience with modern comfort.',
-        'long_description': 'Immerse yourself in the otherworldly beauty of Wadi Rum at this exclusive boutique desert retreat. Our eco-luxury camp offers the perfect blend of authentic Bedouin culture and modern comfort. Each elegantly appointed tent features traditional Arabian décor, modern amenities, and private terraces with stunning desert views. Enjoy gourmet Middle Eastern cuisine, stargazing experiences, camel trekking, and guided tours of the protected desert landscape. This sustainable accommodation provides an unforgettable connection with nature while supporting local communities.',
-        'price': 280,
-        'currency': 'USD',
-        'rating': 9.6,
-        'reviews': 156,
-        'type': 'glamping',
-        'room_type': 'Luxury Desert Tent',
-        'bedrooms': 2,
-        'bathrooms': 2,
-        'max_guests': 4,
-        'property_size': '1200 sq ft',
-        'amenities': ['Desert Tours', 'Stargazing', 'Restaurant', 'WiFi', 'AC', 'Private Terrace', 'Camel Rides', 'Cultural Activities'],
-        'image': 'https://images.unsplash.com/photo-1571003123894-1f0594d2b5d9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        'photos': [
-            'https://images.unsplash.com/photo-1571003123894-1f0594d2b5d9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1520637736862-4d197d17c862?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1590490360182-c33d57733427?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        ],
-        'featured': True,
-        'guest_favorite': True,
-    },
-    '3': {
-        'id': '3',
-        'name': 'Historic Cave Hotel',
-        'location': 'Cappadocia, Turkey',
-        'city': 'Cappadocia',
-        'country': 'Turkey',
-        'description': 'Unique cave hotel carved into ancient rock formations. Romantic getaway with hot air balloon views and authentic Turkish hospitality.',
-        'long_description': 'Experience the magic of Cappadocia in this extraordinary cave hotel carved directly into the region\'s famous fairy chimneys. This boutique property offers a unique blend of ancient architecture and modern luxury, featuring rooms with natural stone walls, authentic Turkish décor, and stunning views of the surreal landscape. Wake up to the breathtaking sight of hundreds of hot air balloons floating over the valley. The hotel offers balloon ride packages, wine tasting in underground cellars, traditional Turkish baths, and guided tours of the region\'s historic churches and underground cities.',
-        'price': 320,
-        'currency': 'USD',
-        'rating': 9.7,
-        'reviews': 289,
-        'type': 'boutique_hotel',
-        'room_type': 'Cave Suite',
-        'bedrooms': 1,
-        'bathrooms': 1,
-        'max_guests': 2,
-        'property_size': '850 sq ft',
-        'amenities': ['Hot Air Balloon Views', 'Turkish Bath', 'Wine Cellar', 'WiFi', 'Heating', 'Terrace', 'Cultural Tours', 'Spa'],
-        'image': 'https://images.unsplash.com/photo-1582719478250-c89cae4dc85b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        'photos': [
-            'https://images.unsplash.com/photo-1582719478250-c89cae4dc85b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1590490360182-c33d57733427?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        ],
-        'featured': True,
-        'guest_favorite': True,
-    },
+import re
+from bisect import bisect_left
 
-    # Unique Properties
-    '4': {
-        'id': '4',
-        'name': 'Underwater Suite Experience',
-        'location': 'Atlantis, Dubai',
-        'city': 'Dubai',
-        'country': 'UAE',
-        'description': 'Once-in-a-lifetime underwater accommodation with panoramic aquarium views. Sleep surrounded by marine life in luxury.',
-        'long_description': 'Dive into an extraordinary experience at this world-renowned underwater suite. Located within a marine habitat, this exclusive accommodation offers floor-to-ceiling windows providing 180-degree views of over 65,000 marine animals. The suite features a king-size bed facing the Ambassador Lagoon, a separate living area, marble bathroom with deep soaking tub, and 24-hour butler service. Guests enjoy exclusive access to marine experiences, private aquarium tours, dining with sharks, and personalized marine biologist presentations.',
-        'price': 890,
-        'currency': 'USD',
-        'rating': 9.9,
-        'reviews': 78,
-        'type': 'unique',
-        'room_type': 'Underwater Suite',
-        'bedrooms': 1,
-        'bathrooms': 1,
-        'max_guests': 2,
-        'property_size': '1650 sq ft',
-        'amenities': ['Aquarium Views', 'Butler Service', 'Marine Tours', 'Fine Dining', 'Spa Access', 'WiFi', 'AC', 'Exclusive Access'],
-        'image': 'https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        'photos': [
-            'https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1566073771259-6a8506099945?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1571003123894-1f0594d2b5d9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1582719478250-c89cae4dc85b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        ],
-        'featured': True,
-        'unique': True,
-    },
-    '5': {
-        'id': '5',
-        'name': 'Glass Desert Dome',
-        'location': 'Sahara Desert, Morocco',
-        'city': 'Merzouga',
-        'country': 'Morocco',
-        'description': 'Transparent dome accommodation for stargazing. Sleep under the stars while enjoying luxury amenities in the desert.',
-        'long_description': 'Experience the ultimate desert luxury in this innovative glass dome accommodation. Located in the heart of the Sahara Desert, this architectural marvel features a completely transparent ceiling and walls, offering unobstructed 360-degree views of the desert landscape and pristine night sky. The climate-controlled dome includes a comfortable bedroom area, lounge space, and private bathroom. Enjoy gourmet Moroccan cuisine, camel trekking, sandboarding, and world-class stargazing with professional telescopes. This eco-friendly accommodation combines cutting-edge design with minimal environmental impact.',
-        'price': 650,
-        'currency': 'USD',
-        'rating': 9.8,
-        'reviews': 134,
-        'type': 'unique',
-        'room_type': 'Glass Dome',
-        'bedrooms': 1,
-        'bathrooms': 1,
-        'max_guests': 2,
-        'property_size': '950 sq ft',
-        'amenities': ['Stargazing', 'Climate Control', 'Desert Tours', 'Gourmet Dining', 'Telescope', 'WiFi', 'Eco-Friendly', 'Camel Rides'],
-        'image': 'https://images.unsplash.com/photo-1520637836862-4d197d17c862?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        'photos': [
-            'https://images.unsplash.com/photo-1520637836862-4d197d17c862?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1590490360182-c33d57733427?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1571003123894-1f0594d2b5d9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        ],
-        'featured': True,
-        'unique': True,
-    },
+from .store import LazyDataset
 
-    # Popular Hotels
-    '6': {
-        'id': '6',
-        'name': 'Grand Palace Hotel',
-        'location': 'Dubai Downtown, UAE',
-        'city': 'Dubai',
-        'country': 'UAE',
-        'description': 'Luxury hotel in the heart of Dubai with world-class amenities and stunning city views.',
-        'long_description': 'Experience unparalleled luxury at the Grand Palace Hotel, located in the prestigious Downtown Dubai district. This five-star property offers elegant accommodations with panoramic views of the Burj Khalifa and Dubai Fountain. Each room and suite features contemporary décor, marble bathrooms, and state-of-the-art technology. Guests enjoy access to multiple dining venues, a rooftop infinity pool, world-class spa, fitness center, and personalized concierge services. The hotel is perfectly positioned within walking distance of Dubai Mall, Burj Khalifa, and the vibrant DIFC business district.',
-        'price': 380,
-        'currency': 'USD',
-        'rating': 4.8,
-        'reviews': 1847,
-        'type': 'luxury_hotel',
-        'room_type': 'Deluxe Room',
-        'bedrooms': 1,
-        'bathrooms': 1,
-        'max_guests': 2,
-        'property_size': '450 sq ft',
-        'amenities': ['Pool', 'Spa', 'Fitness Center', 'Restaurant', 'Bar', 'Concierge', 'WiFi', 'AC', 'City Views'],
-        'image': 'https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        'photos': [
-            'https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1566073771259-6a8506099945?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1571003123894-1f0594d2b5d9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1582719478250-c89cae4dc85b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        ],
-        'featured': False,
-        'popular': True,
-    },
-    '7': {
-        'id': '7',
-        'name': 'Heritage Boutique Istanbul',
-        'location': 'Sultanahmet, Istanbul',
-        'city': 'Istanbul',
-        'country': 'Turkey',
-        'description': 'Historic boutique hotel in Old City with Ottoman architecture and modern luxury amenities.',
-        'long_description': 'Step into history at this exquisite boutique hotel located in the heart of Istanbul\'s historic Sultanahmet district. Housed in a beautifully restored Ottoman mansion, this intimate property seamlessly blends traditional Turkish architecture with contemporary luxury. Each uniquely designed room features handcrafted furnishings, Turkish textiles, and modern amenities. Guests are within walking distance of iconic landmarks including Hagia Sophia, Blue Mosque, and Topkapi Palace. The hotel offers a rooftop terrace with panoramic views, traditional Turkish breakfast, and personalized service that reflects the warmth of Turkish hospitality.',
-        'price': 220,
-        'currency': 'USD',
-        'rating': 4.6,
-        'reviews': 923,
-        'type': 'boutique_hotel',
-        'room_type': 'Heritage Room',
-        'bedrooms': 1,
-        'bathrooms': 1,
-        'max_guests': 2,
-        'property_size': '350 sq ft',
-        'amenities': ['Historic Building', 'Rooftop Terrace', 'Turkish Breakfast', 'WiFi', 'AC', 'Concierge', 'Cultural Tours'],
-        'image': 'https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        'photos': [
-            'https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1582719478250-c89cae4dc85b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1590490360182-c33d57733427?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        ],
-        'featured': False,
-        'popular': True,
-    },
-    '8': {
-        'id': '8',
-        'name': 'Nile Luxury Hotel',
-        'location': 'Cairo Corniche, Egypt',
-        'city': 'Cairo',
-        'country': 'Egypt',
-        'description': 'Riverside luxury hotel with Nile views, close to pyramids and museums.',
-        'long_description': 'Discover the timeless elegance of this luxury hotel situated along the famous Nile Corniche in Cairo. This sophisticated property offers breathtaking views of the Nile River and the city skyline. Each elegantly appointed room and suite features classic décor, marble bathrooms, and panoramic river or city views. The hotel serves as the perfect base for exploring Cairo\'s ancient treasures, with the Egyptian Museum, Khan el-Khalili bazaar, and Islamic Cairo within easy reach. Guests enjoy fine dining restaurants, a riverside pool deck, spa services, and guided tours to the nearby Giza Pyramids.',
-        'price': 180,
-        'currency': 'USD',
-        'rating': 4.7,
-        'reviews': 1456,
-        'type': 'luxury_hotel',
-        'room_type': 'Nile View Room',
-        'bedrooms': 1,
-        'bathrooms': 1,
-        'max_guests': 2,
-        'property_size': '400 sq ft',
-        'amenities': ['Nile Views', 'Pool', 'Spa', 'Restaurant', 'Bar', 'WiFi', 'AC', 'Tour Desk', 'Airport Transfer'],
-        'image': 'https://images.unsplash.com/photo-1590490360182-c33d57733427?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        'photos': [
-            'https://images.unsplash.com/photo-1590490360182-c33d57733427?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1571003123894-1f0594d2b5d9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1566073771259-6a8506099945?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        ],
-        'featured': False,
-        'popular': True,
-    },
-    '9': {
-        'id': '9',
-        'name': 'Desert Star Resort',
-        'location': 'Petra Valley, Jordan',
-        'city': 'Petra',
-        'country': 'Jordan',
-        'description': 'Luxury resort with panoramic desert views and easy access to Petra archaeological site.',
-        'long_description': 'Experience the wonders of ancient Petra from this luxury resort nestled in the dramatic landscapes of southern Jordan. This award-winning property offers stunning accommodations with panoramic views of the rose-red mountains and easy access to the UNESCO World Heritage Site. Each spacious room and suite features traditional Jordanian décor, modern amenities, and private terraces overlooking the desert valley. The resort provides guided tours to Petra, Little Petra, and Wadi Rum, along with cultural experiences including traditional Bedouin dinners, cooking classes, and handicraft workshops.',
-        'price': 290,
-        'currency': 'USD',
-        'rating': 4.9,
-        'reviews': 672,
-        'type': 'resort',
-        'room_type': 'Desert View Suite',
-        'bedrooms': 1,
-        'bathrooms': 1,
-        'max_guests': 3,
-        'property_size': '550 sq ft',
-        'amenities': ['Desert Views', 'Pool', 'Spa', 'Restaurant', 'Cultural Tours', 'WiFi', 'AC', 'Private Terrace'],
-        'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        'photos': [
-            'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1571003123894-1f0594d2b5d9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'https://images.unsplash.com/photo-1590490360182-c33d57733427?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-        ],
-        'featured': False,
-        'popular': True,
-    },
-}
+# Records live in demo_accommodations.jsonl and are decoded on lookup
+demo_accommodations_data = LazyDataset('demo_accommodations.jsonl')
 
-# Additional accommodations for grid display
-additional_accommodations = {
-    '10': {
-        'id': '10',
-        'name': 'Beachfront Resort & Spa',
-        'location': 'Sharm El Sheikh, Egypt',
-        'city': 'Sharm El Sheikh',
-        'country': 'Egypt',
-        'description': 'All-inclusive beachfront resort with coral reef access and world-class diving.',
-        'price': 320,
-        'rating': 4.5,
-        'reviews': 890,
-        'type': 'resort',
-        'room_type': 'Ocean View Room',
-        'bedrooms': 1,
-        'bathrooms': 1,
-        'max_guests': 2,
-        'image': 'https://images.unsplash.com/photo-1571003123894-1f0594d2b5d9?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80',
-        'amenities': ['Beach Access', 'Pool', 'Spa', 'Diving Center', 'All-Inclusive', 'WiFi', 'AC'],
-    },
-    '11': {
-        'id': '11',
-        'name': 'Mountain Lodge Retreat',
-        'location': 'Jbel Toubkal, Morocco',
-        'city': 'Atlas Mountains',
-        'country': 'Morocco',
-        'description': 'Eco-luxury mountain lodge with hiking trails and panoramic Atlas Mountain views.',
-        'price': 195,
-        'rating': 4.7,
-        'reviews': 445,
-        'type': 'lodge',
-        'room_type': 'Mountain View Room',
-        'bedrooms': 1,
-        'bathrooms': 1,
-        'max_guests': 2,
-        'image': 'https://images.unsplash.com/photo-1520637836862-4d197d17c862?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80',
-        'amenities': ['Mountain Views', 'Hiking Trails', 'Restaurant', 'Eco-Friendly', 'WiFi', 'Heating'],
-    },
-    '12': {
-        'id': '12',
-        'name': 'City Center Apartment',
-        'location': 'Amman Downtown, Jordan',
-        'city': 'Amman',
-        'country': 'Jordan',
-        'description': 'Modern apartment in the heart of Amman with easy access to historical sites.',
-        'price': 85,
-        'rating': 4.3,
-        'reviews': 234,
-        'type': 'apartment',
-        'room_type': 'Entire Apartment',
-        'bedrooms': 2,
-        'bathrooms': 1,
-        'max_guests': 4,
-        'image': 'https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80',
-        'amenities': ['Kitchen', 'WiFi', 'AC', 'City Center', 'Parking'],
-    },
-}
+# Search index, built once on first use
+_TOKEN_PATTERN = re.compile(r'\w+')
+_search_index = None
+
+
+def _tokenize(text):
+    """Split text into lowercase word tokens"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _build_search_index():
+    """
+    Build inverted indexes over demo_accommodations_data.
+
+    tokens and location_tokens map each word to the ids containing it (with a
+    sorted key list for prefix lookups), types and flags map a type or flag
+    name to ids, and position keeps the original ordering of the data.
+    """
+    tokens = {}
+    location_tokens = {}
+    types = {}
+    flags = {}
+    position = {}
+
+    for index, (key, accommodation) in enumerate(demo_accommodations_data.items()):
+        position[key] = index
+
+        searchable = [
+            accommodation.get('name', ''),
+            accommodation.get('location', ''),
+            accommodation.get('description', ''),
+            accommodation.get('type', ''),
+        ] + accommodation.get('amenities', [])
+        for text in searchable:
+            for token in _tokenize(text):
+                tokens.setdefault(token, set()).add(key)
+
+        for text in (accommodation.get('location', ''), accommodation.get('city', '')):
+            for token in _tokenize(text):
+                location_tokens.setdefault(token, set()).add(key)
+
+        types.setdefault(accommodation.get('type'), []).append(key)
+        for flag in ('featured', 'guest_favorite', 'unique', 'popular'):
+            if accommodation.get(flag, False):
+                flags.setdefault(flag, []).append(key)
+
+    return {
+        'tokens': tokens,
+        'sorted_tokens': sorted(tokens),
+        'location_tokens': location_tokens,
+        'sorted_location_tokens': sorted(location_tokens),
+        'types': types,
+        'flags': flags,
+        'position': position,
+    }
+
+
+def _get_search_index():
+    global _search_index
+    if _search_index is None:
+        _search_index = _build_search_index()
+    return _search_index
+
+
+def _match_tokens(query, token_index, sorted_tokens):
+    """
+    Ids whose indexed words start with every word of the query.
+    Each query word is resolved with a binary search over the sorted words.
+    """
+    matches = None
+    for query_token in _tokenize(query):
+        ids = set()
+        start = bisect_left(sorted_tokens, query_token)
+        for token in sorted_tokens[start:]:
+            if not token.startswith(query_token):
+                break
+            ids |= token_index[token]
+
+        matches = ids if matches is None else matches & ids
+        if not matches:
+            return []
+
+    if matches is None:
+        return []
+    position = _get_search_index()['position']
+    return sorted(matches, key=position.__getitem__)
+
+
+def _select(keys):
+    return {key: demo_accommodations_data[key] for key in keys}
+
+
+def search_accommodations(query):
+    """Return accommodations whose name, location, description, type or amenities match every word of the query"""
+    index = _get_search_index()
+    return _select(_match_tokens(query, index['tokens'], index['sorted_tokens']))
 
-# Merge all accommodations
-demo_accommodations_data.update(additional_accommodations)
 
 # Utility functions for filtering
 def get_featured_accommodations():
     """Return accommodations marked as featured"""
-    return {k: v for k, v in demo_accommodations_data.items() if v.get('featured', False)}
+    return _select(_get_search_index()['flags'].get('featured', []))
 
 def get_guest_favorite_accommodations():
     """Return accommodations marked as guest favorites"""
-    return {k: v for k, v in demo_accommodations_data.items() if v.get('guest_favorite', False)}
+    return _select(_get_search_index()['flags'].get('guest_favorite', []))
 
 def get_unique_accommodations():
     """Return accommodations marked as unique"""
-    return {k: v for k, v in demo_accommodations_data.items() if v.get('unique', False)}
+    return _select(_get_search_index()['flags'].get('unique', []))
 
 def get_popular_accommodations():
     """Return accommodations marked as popular"""
-    return {k: v for k, v in demo_accommodations_data.items() if v.get('popular', False)}
+    return _select(_get_search_index()['flags'].get('popular', []))
 
 def get_accommodations_by_type(accommodation_type):
     """Return accommodations filtered by type"""
-    return {k: v for k, v in demo_accommodations_data.items() if v.get('type') == accommodation_type}
+    return _select(_get_search_index()['types'].get(accommodation_type, []))
 
 def get_accommodations_by_location(location):
     """Return accommodations filtered by location"""
-    return {k: v for k, v in demo_accommodations_data.items()
-            if location.lower() in v.get('location', '').lower() or location.lower() in v.get('city', '').lower()}
\ No newline at end of file
+    index = _get_search_index()
+    return _select(_match_tokens(location, index['location_tokens'], index['sorted_location_tokens']))
@@ -0,0 +1,112 @@
+"""
+Read-only storage for the BedBees demo datasets.
+
+Each dataset is a JSON-lines file in this package. Every line is one record,
+prefixed with its tab-separated key path: "key<TAB>{...}" for flat datasets
+and "country<TAB>slug<TAB>{...}" for nested ones.
+
+Files are memory-mapped read-only, so all worker processes share the same
+page-cache pages instead of each parsing and holding the whole dataset.
+First access only builds a small offset index of the keys; records are
+decoded from the mapping when looked up.
+"""
+
+import json
+import mmap
+import os
+import threading
+from collections.abc import Mapping
+
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class _MappedFile:
+    """A memory-mapped JSON-lines file and its key -> (start, end) offset index"""
+
+    def __init__(self, filename, depth):
+        self.path = os.path.join(DATA_DIR, filename)
+        self.depth = depth
+        self._data = None
+        self._index = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._index is not None:
+                return
+
+            with open(self.path, 'rb') as f:
+                # mmap cannot map an empty file
+                empty = os.fstat(f.fileno()).st_size == 0
+                data = b'' if empty else mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            index = {}
+            position = 0
+            size = len(data)
+            while position < size:
+                end = data.find(b'\n', position)
+                if end == -1:
+                    end = size
+
+                keys = []
+                for _ in range(self.depth):
+                    tab = data.find(b'\t', position, end)
+                    keys.append(data[position:tab].decode('utf-8'))
+                    position = tab + 1
+
+                node = index
+                for key in keys[:-1]:
+                    node = node.setdefault(key, {})
+                node[keys[-1]] = (position, end)
+                position = end + 1
+
+            self._data = data
+            self._index = index
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._load()
+        return self._index
+
+    def decode(self, span):
+        start, end = span
+        return json.loads(self._data[start:end])
+
+
+class LazyDataset(Mapping):
+    """
+    Read-only mapping over a memory-mapped dataset.
+
+    Behaves like the dict literal it replaces: lookups return freshly decoded
+    records and nested levels are LazyDataset views themselves.
+    """
+
+    def __init__(self, filename, depth=1, _file=None, _path=()):
+        self._file = _file or _MappedFile(filename, depth)
+        self._path = _path
+
+    def _node(self):
+        node = self._file.index
+        for key in self._path:
+            node = node[key]
+        return node
+
+    def __getitem__(self, key):
+        value = self._node()[key]
+        if isinstance(value, dict):
+            return LazyDataset(None, _file=self._file, _path=self._path + (key,))
+        return self._file.decode(value)
+
+    def __contains__(self, key):
+        return key in self._node()
+
+    def __iter__(self):
+        return iter(self._node())
+
+    def __len__(self):
+        return len(self._node())
+
+    def __repr__(self):
+        return f'<LazyDataset {os.path.basename(self._file.path)} {"/".join(self._path)}>'
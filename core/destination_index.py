@@ -0,0 +1,330 @@
+"""
+Destination Autocomplete Index for BedBees
+In-memory prefix trie over countries, listing cities and demo attractions.
+Every trie node keeps its own top-k entries by popularity, so a lookup is a
+walk down the typed prefix with no database query.
+
+Saves update the trie in place through the signals. Once it is older than
+DESTINATION_INDEX_TTL a fresh trie is built in a background thread and
+swapped in, while lookups keep using the current one.
+"""
+
+import logging
+import threading
+import time
+import unicodedata
+from urllib.parse import urlencode
+
+from django.db import close_old_connections
+from django.db.models import Count
+from django.urls import reverse
+
+from .data import demo_attractions
+from .models import Accommodation, Country, Tour
+
+logger = logging.getLogger(__name__)
+
+# Entries kept per trie node, i.e. the largest limit a lookup can return
+AUTOCOMPLETE_TOP_K = 10
+
+# Seconds before a worker rebuilds its copy, picking up changes made in
+# other processes
+DESTINATION_INDEX_TTL = 600
+
+# Popularity of a demo attraction, which has no listings to count
+ATTRACTION_SCORE = 1
+
+_index = None
+_built_at = 0
+# Guards reads and in-place updates of the trie
+_lock = threading.RLock()
+# Held while a trie is being built, so only one build runs at a time
+_build_lock = threading.Lock()
+# Updates made while a build runs, replayed onto the new trie before the swap
+_pending = None
+
+
+def normalize(text):
+    """Lowercase and strip accents so "Göreme" matches "gore" """
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower().strip()
+
+
+class _Node:
+    __slots__ = ('children', 'entries', 'top')
+
+    def __init__(self):
+        self.children = {}
+        self.entries = set()
+        self.top = []
+
+
+class DestinationTrie:
+    """
+    Prefix trie of destination entries.
+
+    An entry is reachable from the start of its label and from the start of
+    every later word in it ("Dead Sea" matches "dead" and "sea"). Node top
+    lists are maintained bottom-up on every insert, update and removal.
+    """
+
+    def __init__(self, top_k=AUTOCOMPLETE_TOP_K):
+        self.top_k = top_k
+        self.root = _Node()
+        self.entries = {}
+
+    def _keys(self, label):
+        words = normalize(label).split()
+        return {' '.join(words[start:]) for start in range(len(words))}
+
+    def _rank(self, key):
+        entry = self.entries[key]
+        return (-entry['score'], entry['label'])
+
+    def _refresh(self, path):
+        """Recompute top lists from the deepest node on path up to the root"""
+        for node in reversed(path):
+            candidates = set(node.entries)
+            for child in node.children.values():
+                candidates.update(child.top)
+            node.top = sorted(candidates, key=self._rank)[:self.top_k]
+
+    def _walk(self, key, create=False):
+        node = self.root
+        path = [node]
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[char] = _Node()
+            node = child
+            path.append(node)
+        return path
+
+    def upsert(self, key, label, kind, url, score):
+        """Add an entry or change its label, url or score"""
+        if key in self.entries:
+            self.remove(key)
+        self.entries[key] = {'label': label, 'type': kind, 'url': url, 'score': score}
+
+        for text in self._keys(label):
+            path = self._walk(text, create=True)
+            path[-1].entries.add(key)
+            self._refresh(path)
+
+    def remove(self, key):
+        """Drop an entry if present"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return
+
+        paths = [self._walk(text) for text in self._keys(entry['label'])]
+        for path in paths:
+            path[-1].entries.discard(key)
+        # Later paths re-refresh any shared ancestor, so the entry is gone
+        # from every top list once the last path is done
+        for path in paths:
+            self._refresh(path)
+        del self.entries[key]
+
+    def search(self, prefix, limit=AUTOCOMPLETE_TOP_K):
+        """Top entries by popularity whose label or a word in it starts with prefix"""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        path = self._walk(prefix)
+        if path is None:
+            return []
+        return [
+            {field: self.entries[key][field] for field in ('label', 'type', 'url')}
+            for key in path[-1].top[:limit]
+        ]
+
+
+def _city_url(city):
+    return f"{reverse('core:search_results')}?{urlencode({'destination': city})}"
+
+
+def _city_key(city, country):
+    return ('city', normalize(city), normalize(country))
+
+
+def _city_scores(city=None, country=None):
+    """
+    Published listings per city, optionally for a single city.
+
+    Returns:
+        Dict of city key to (city name, label, listing count).
+    """
+    scores = {}
+    for model in (Accommodation, Tour):
+        listings = model.objects.filter(is_published=True, is_active=True)
+        if city is not None:
+            listings = listings.filter(city__iexact=city, country__iexact=country)
+        for row in listings.values('city', 'country').annotate(total=Count('id')):
+            key = _city_key(row['city'], row['country'])
+            name = row['city'].strip()
+            name, label, total = scores.get(key, (name, f"{name}, {row['country'].strip()}", 0))
+            scores[key] = (name, label, total + row['total'])
+    return scores
+
+
+def build_index():
+    """Build a fresh trie from countries, listing cities and demo attractions"""
+    trie = DestinationTrie()
+
+    for country in Country.objects.filter(is_active=True).values(
+        'name', 'slug', 'accommodations_count', 'tours_count'
+    ):
+        trie.upsert(
+            ('country', country['slug']),
+            country['name'],
+            'country',
+            reverse('core:country_detail', args=[country['slug']]),
+            country['accommodations_count'] + country['tours_count'],
+        )
+
+    for key, (name, label, score) in _city_scores().items():
+        trie.upsert(key, label, 'city', _city_url(name), score)
+
+    for country_slug, attractions in demo_attractions.items():
+        for slug, attraction in attractions.items():
+            trie.upsert(
+                ('attraction', country_slug, slug),
+                attraction['name'],
+                'attraction',
+                reverse('core:attraction_detail', args=[country_slug, slug]),
+                ATTRACTION_SCORE,
+            )
+
+    return trie
+
+
+def rebuild_index():
+    """
+    Build a fresh trie and swap it in for this process.
+
+    The build runs without holding the index lock, so lookups and signal
+    updates carry on against the current trie. Updates made meanwhile are
+    replayed onto the new trie before it replaces the old one.
+    """
+    global _index, _built_at, _pending
+    with _build_lock:
+        with _lock:
+            _pending = []
+        try:
+            trie = build_index()
+            with _lock:
+                for method, args in _pending:
+                    getattr(trie, method)(*args)
+                _index = trie
+                _built_at = time.monotonic()
+        finally:
+            with _lock:
+                _pending = None
+
+
+def _rebuild_in_background():
+    close_old_connections()
+    try:
+        rebuild_index()
+    except Exception:
+        # Nothing waits on the thread; the current trie keeps serving
+        logger.exception('Could not rebuild the destination index')
+    finally:
+        close_old_connections()
+
+
+def get_index():
+    """
+    The process-wide trie. Built on first use; once older than
+    DESTINATION_INDEX_TTL it is rebuilt in a background thread and the
+    current trie is returned until the new one is ready.
+    """
+    global _built_at
+    if _index is None:
+        with _build_lock:
+            built = _index is not None
+        if not built:
+            rebuild_index()
+        return _index
+
+    with _lock:
+        stale = time.monotonic() - _built_at > DESTINATION_INDEX_TTL
+        if stale:
+            # Start the clock again so only one request starts a rebuild
+            _built_at = time.monotonic()
+    if stale:
+        threading.Thread(target=_rebuild_in_background, name='destination-index', daemon=True).start()
+    return _index
+
+
+def _apply(method, *args):
+    """Update the current trie and any trie being built (call with _lock held)"""
+    if _index is not None:
+        getattr(_index, method)(*args)
+    if _pending is not None:
+        _pending.append((method, args))
+
+
+def _is_loaded():
+    """Whether this process has a trie or is building one"""
+    return _index is not None or _pending is not None
+
+
+def autocomplete(prefix, limit=AUTOCOMPLETE_TOP_K):
+    """
+    Destination suggestions for a typed prefix.
+
+    Returns:
+        List of {'label', 'type', 'url'} dicts, most popular first.
+    """
+    index = get_index()
+    with _lock:
+        return index.search(prefix, min(limit, AUTOCOMPLETE_TOP_K))
+
+
+def refresh_city(city, country):
+    """
+    Recount one city's published listings and update its entry in this
+    process's trie. Does nothing until the trie has been built.
+    """
+    if not _is_loaded() or not city or not country:
+        return
+
+    key = _city_key(city, country)
+    name, label, score = _city_scores(city, country).get(key, (None, None, 0))
+    with _lock:
+        if score:
+            _apply('upsert', key, label, 'city', _city_url(name), score)
+        else:
+            _apply('remove', key)
+
+
+def refresh_country(country):
+    """Update or drop one Country entry in this process's trie"""
+    if not _is_loaded():
+        return
+
+    key = ('country', country.slug)
+    with _lock:
+        if country.is_active:
+            _apply(
+                'upsert',
+                key,
+                country.name,
+                'country',
+                reverse('core:country_detail', args=[country.slug]),
+                country.accommodations_count + country.tours_count,
+            )
+        else:
+            _apply('remove', key)
+
+
+def remove_country(slug):
+    """Drop a deleted Country from this process's trie"""
+    if not _is_loaded():
+        return
+    with _lock:
+        _apply('remove', ('country', slug))
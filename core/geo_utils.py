@@ -0,0 +1,222 @@
+"""
+Geo Utility Functions for BedBees
+Geohash cells for accommodation coordinates, used as a B-tree index to
+narrow radius and map viewport searches before exact distance checks.
+"""
+
+import math
+import re
+
+from django.db.models import Q
+
+
+# Stored cell precision; 7 characters is roughly a 150m x 150m cell
+GEOHASH_PRECISION = 7
+
+# Upper bound on cell prefixes a single search expands to
+MAX_COVER_CELLS = 32
+
+# Default radius for "stays near this attraction"
+NEARBY_RADIUS_KM = 25
+
+EARTH_RADIUS_KM = 6371.0088
+
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+# Sorts after every geohash character, closing prefix ranges
+_PREFIX_END = '{'
+
+_COORDINATE_PATTERN = re.compile(
+    r'(-?\d+(?:\.\d+)?)\s*°?\s*([NS])?\s*,\s*(-?\d+(?:\.\d+)?)\s*°?\s*([EW])?', re.IGNORECASE
+)
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """Encode a coordinate as a geohash string"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    latitude = float(latitude)
+    longitude = float(longitude)
+
+    geohash = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(geohash) < precision:
+        value, bounds = (longitude, lng_range) if even else (latitude, lat_range)
+        middle = (bounds[0] + bounds[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            bounds[0] = middle
+        else:
+            bounds[1] = middle
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return ''.join(geohash)
+
+
+def _cell_size(precision):
+    """(height, width) in degrees of a geohash cell at a precision"""
+    total_bits = 5 * precision
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def cover_cells(south, west, north, east, max_cells=MAX_COVER_CELLS):
+    """
+    Geohash prefixes covering a bounding box.
+
+    Picks the finest precision (up to GEOHASH_PRECISION) that covers the box
+    with at most max_cells cells. A box crossing the antimeridian
+    (west > east) is split in two.
+
+    Returns:
+        Sorted list of geohash prefixes.
+    """
+    if west > east:
+        return sorted(set(
+            cover_cells(south, west, north, 180.0, max_cells // 2)
+            + cover_cells(south, -180.0, north, east, max_cells // 2)
+        ))
+
+    south, north = max(south, -90.0), min(north, 90.0)
+    west, east = max(west, -180.0), min(east, 180.0)
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = _cell_size(precision)
+        rows = math.floor((north + 90.0) / height) - math.floor((south + 90.0) / height) + 1
+        columns = math.floor((east + 180.0) / width) - math.floor((west + 180.0) / width) + 1
+        if rows * columns <= max_cells or precision == 1:
+            break
+
+    first_row = math.floor((south + 90.0) / height)
+    first_column = math.floor((west + 180.0) / width)
+    cells = set()
+    for row in range(first_row, first_row + rows):
+        for column in range(first_column, first_column + columns):
+            center_lat = min(-90.0 + (row + 0.5) * height, 90.0)
+            center_lng = min(-180.0 + (column + 0.5) * width, 180.0)
+            cells.add(encode_geohash(center_lat, center_lng, precision))
+    return sorted(cells)
+
+
+def cells_filter(cells, field='geo_cell'):
+    """
+    Q matching rows whose geohash starts with any of the cells.
+    Written as string ranges so both SQLite and PostgreSQL use the B-tree index.
+    """
+    condition = Q()
+    for cell in cells:
+        condition |= Q(**{f'{field}__gte': cell, f'{field}__lt': cell + _PREFIX_END})
+    return condition
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Great-circle distance in kilometres"""
+    lat1, lng1, lat2, lng2 = map(math.radians, (float(lat1), float(lng1), float(lat2), float(lng2)))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def radius_bounds(latitude, longitude, radius_km):
+    """Bounding box (south, west, north, east) enclosing a circle"""
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = math.cos(math.radians(latitude))
+    lng_delta = 180.0 if cos_lat < 1e-6 else min(180.0, lat_delta / cos_lat)
+
+    west, east = longitude - lng_delta, longitude + lng_delta
+    if lng_delta >= 180.0:
+        west, east = -180.0, 180.0
+    else:
+        if west < -180.0:
+            west += 360.0
+        if east > 180.0:
+            east -= 360.0
+    return latitude - lat_delta, west, latitude + lat_delta, east
+
+
+def filter_in_viewport(queryset, south, west, north, east):
+    """
+    Keep listings inside a map viewport.
+    The geohash cell index narrows the candidates and the exact latitude and
+    longitude bounds are then checked in the same query.
+    """
+    bounds = Q(latitude__gte=south, latitude__lte=north)
+    if west > east:
+        bounds &= Q(longitude__gte=west) | Q(longitude__lte=east)
+    else:
+        bounds &= Q(longitude__gte=west, longitude__lte=east)
+    return queryset.filter(cells_filter(cover_cells(south, west, north, east))).filter(bounds)
+
+
+def listings_within_radius(queryset, latitude, longitude, radius_km=NEARBY_RADIUS_KM, limit=None):
+    """
+    Listings within radius_km of a point, nearest first.
+
+    Candidates come from the geohash cells covering the circle's bounding box;
+    the exact haversine distance is only computed for those.
+
+    Returns:
+        List of listings, each with a distance_km attribute.
+    """
+    latitude, longitude = float(latitude), float(longitude)
+    candidates = filter_in_viewport(queryset, *radius_bounds(latitude, longitude, radius_km))
+
+    nearby = []
+    for listing in candidates:
+        listing.distance_km = haversine_km(latitude, longitude, listing.latitude, listing.longitude)
+        if listing.distance_km <= radius_km:
+            nearby.append(listing)
+
+    nearby.sort(key=lambda listing: listing.distance_km)
+    return nearby[:limit] if limit else nearby
+
+
+def parse_coordinates(text):
+    """
+    Parse a coordinate string such as "30.3285° N, 35.4444° E" or "30.3, 35.4".
+
+    Returns:
+        Tuple of (latitude, longitude), or None when the text cannot be parsed.
+    """
+    match = _COORDINATE_PATTERN.search(text or '')
+    if not match:
+        return None
+
+    latitude, lat_hemisphere, longitude, lng_hemisphere = match.groups()
+    latitude, longitude = float(latitude), float(longitude)
+    if lat_hemisphere and lat_hemisphere.upper() == 'S':
+        latitude = -latitude
+    if lng_hemisphere and lng_hemisphere.upper() == 'W':
+        longitude = -longitude
+
+    if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+        return None
+    return latitude, longitude
+
+
+def parse_bbox(value):
+    """
+    Parse a "south,west,north,east" viewport parameter.
+
+    Returns:
+        Tuple of four floats, or None when the value is missing or malformed.
+    """
+    try:
+        south, west, north, east = (float(part) for part in (value or '').split(','))
+    except ValueError:
+        return None
+    if not (-90.0 <= south <= north <= 90.0 and -180.0 <= west <= 180.0 and -180.0 <= east <= 180.0):
+        return None
+    return south, west, north, east
@@ -0,0 +1,222 @@
+"""
+Resized Image Cache for BedBees
+Photo and static image variants rendered on first request and kept in a
+sharded on-disk cache. Hits touch the file's mtime, and once the cache grows
+past IMAGE_CACHE_MAX_BYTES the least recently used variants are evicted.
+
+Variant URLs carry a version derived from the source, so responses can be
+cached forever and a replaced image simply gets a new URL.
+"""
+
+import hashlib
+import io
+import os
+import threading
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.files import locks
+from django.templatetags.static import static
+from django.urls import reverse
+from PIL import Image, ImageOps, features
+
+
+CACHE_DIR = getattr(settings, 'IMAGE_CACHE_DIR', os.path.join(settings.BASE_DIR, 'cache', 'images'))
+
+# Upper bound on the cache's total size
+MAX_BYTES = getattr(settings, 'IMAGE_CACHE_MAX_BYTES', 512 * 1024 * 1024)
+
+# Widths the endpoint renders; anything else is a 404 so the cache stays bounded
+RESIZE_WIDTHS = (160, 320, 480, 640, 960, 1280, 1440, 1920, 2048)
+
+# URL extension -> (Pillow format, content type, quality)
+FORMATS = {
+    'webp': ('WEBP', 'image/webp', 80),
+    'jpg': ('JPEG', 'image/jpeg', 82),
+}
+if features.check('avif'):
+    FORMATS['avif'] = ('AVIF', 'image/avif', 60)
+
+# Bytes written by this process, as a share of MAX_BYTES, between size checks
+SWEEP_INTERVAL = 0.05
+
+# Eviction stops once the cache is back under this share of MAX_BYTES
+SWEEP_TARGET = 0.9
+
+# Photo models served by the endpoint, by the URL's kind segment
+PHOTO_KINDS = {
+    'AccommodationPhoto': 'accommodation',
+    'TourPhoto': 'tour',
+}
+
+_written = 0
+_written_lock = threading.Lock()
+
+
+def source_version(identity):
+    """Short URL version for a source; changes whenever the source does"""
+    return hashlib.sha256(identity.encode()).hexdigest()[:12]
+
+
+def cache_key(identity, width, fmt):
+    return hashlib.sha256(f'{identity}|{width}|{fmt}'.encode()).hexdigest()
+
+
+def cache_path(key, fmt):
+    """Sharded path of a cached variant, e.g. <CACHE_DIR>/ab/cd/abcd....webp"""
+    return os.path.join(CACHE_DIR, key[:2], key[2:4], f'{key}.{fmt}')
+
+
+def render_variant(source, width, fmt):
+    """
+    Encode an image at most width pixels wide.
+
+    Args:
+        source: Open binary file of the source image
+        width: Target width; smaller images are not upscaled
+        fmt: Key of FORMATS
+
+    Returns:
+        Encoded bytes.
+    """
+    pillow_format, _, quality = FORMATS[fmt]
+    with Image.open(source) as img:
+        img = ImageOps.exif_transpose(img)
+        if pillow_format == 'JPEG':
+            img = img.convert('RGB')
+        elif img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA' if 'A' in img.getbands() or 'transparency' in img.info else 'RGB')
+        if img.width > width:
+            img.thumbnail((width, img.height), Image.Resampling.LANCZOS)
+
+        buffer = io.BytesIO()
+        img.save(buffer, pillow_format, quality=quality)
+    return buffer.getvalue()
+
+
+def get_variant(key, fmt, width, open_source):
+    """
+    Path of a cached variant, rendering and storing it on a miss.
+
+    Args:
+        key: cache_key() of the variant
+        fmt: Key of FORMATS
+        width: Target width
+        open_source: Callable returning the open source file
+    """
+    path = cache_path(key, fmt)
+    try:
+        # Mark as recently used for eviction
+        os.utime(path)
+        return path
+    except FileNotFoundError:
+        pass
+
+    with open_source() as source:
+        data = render_variant(source, width, fmt)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+    _record_write(len(data))
+    return path
+
+
+def _record_write(size):
+    global _written
+    with _written_lock:
+        _written += size
+        due = _written >= MAX_BYTES * SWEEP_INTERVAL
+        if due:
+            _written = 0
+    if due:
+        evict()
+
+
+def evict(max_bytes=MAX_BYTES):
+    """
+    Delete least recently used variants until the cache is under
+    SWEEP_TARGET of max_bytes. Skipped if another process is sweeping.
+
+    Returns:
+        Number of files deleted.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(os.path.join(CACHE_DIR, '.lock'), 'wb') as lock_file:
+        if not locks.lock(lock_file, locks.LOCK_EX | locks.LOCK_NB):
+            return 0
+        try:
+            entries = []
+            total = 0
+            for directory, _, filenames in os.walk(CACHE_DIR):
+                for filename in filenames:
+                    if filename.startswith('.') or filename.endswith('.tmp'):
+                        continue
+                    path = os.path.join(directory, filename)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+                    total += stat.st_size
+
+            if total <= max_bytes:
+                return 0
+
+            deleted = 0
+            for _, size, path in sorted(entries):
+                if total <= max_bytes * SWEEP_TARGET:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                deleted += 1
+            return deleted
+        finally:
+            locks.unlock(lock_file)
+
+
+def resized_photo_url(photo, width, fmt='webp'):
+    """URL of a photo's original resized to one of RESIZE_WIDTHS"""
+    return reverse('core:resized_photo', kwargs={
+        'kind': PHOTO_KINDS[type(photo).__name__],
+        'photo_id': photo.pk,
+        'version': source_version(photo.original_file.name),
+        'width': width,
+        'fmt': fmt,
+    })
+
+
+def resized_static_url(path, width, fmt='webp'):
+    """URL of a static image resized to one of RESIZE_WIDTHS, or its plain static URL if not found"""
+    found = finders.find(path)
+    if not found:
+        return static(path)
+    stat = os.stat(found)
+    return reverse('core:resized_static', kwargs={
+        'version': source_version(static_identity(path, stat)),
+        'width': width,
+        'fmt': fmt,
+        'path': path,
+    })
+
+
+def static_identity(path, stat):
+    return f'static:{path}:{stat.st_size}:{stat.st_mtime_ns}'
+
+
+def photo_srcset(photo, fmt='webp'):
+    """
+    srcset for a stored photo at every RESIZE_WIDTHS breakpoint up to its
+    own width, served by the resize endpoint.
+    """
+    name = photo.original_file.name if photo.original_file else ''
+    if not name or name.startswith(('http://', 'https://')):
+        return ''
+    widths = [width for width in RESIZE_WIDTHS if not photo.width or width <= photo.width] or RESIZE_WIDTHS[:1]
+    return ', '.join(f'{resized_photo_url(photo, width, fmt)} {width}w' for width in widths)
@@ -0,0 +1,360 @@
+"""
+Image Utility Functions for BedBees
+Reads upload metadata from the image header, and generates the WebP size
+variants (thumbnail, small, medium, large, xl) and a tiny inline placeholder
+for AccommodationPhoto and TourPhoto uploads.
+
+Derivatives are built off the request path in a small thread pool once the
+upload's transaction commits. Generation is idempotent: a photo whose
+variants and metadata are already stored is left alone unless forced, and a
+byte-identical upload reuses the variants of the photo it duplicates.
+"""
+
+import base64
+import io
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from PIL import ExifTags, Image, ImageOps, UnidentifiedImageError
+
+from .models import AccommodationPhoto, TourPhoto
+from .storage import is_blob
+
+logger = logging.getLogger(__name__)
+
+
+# Derivative field -> maximum width in pixels, served through get_image_url()
+DERIVATIVE_WIDTHS = {
+    'thumbnail': 320,
+    'small': 480,
+    'medium': 960,
+    'large': 1440,
+    'xl': 2048,
+}
+
+WEBP_QUALITY = 82
+
+# WebP encoder effort; 6 is only marginally smaller and several times slower
+WEBP_METHOD = 4
+
+# Threads generating derivatives in each web process
+IMAGE_WORKERS = getattr(settings, 'IMAGE_DERIVATIVE_WORKERS', 2)
+
+# Width of the blurred preview shown while a photo loads
+PLACEHOLDER_WIDTH = 20
+PLACEHOLDER_QUALITY = 40
+
+# Longest EXIF string value kept in exif_data
+MAX_EXIF_VALUE_LENGTH = 200
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix='image-derivatives')
+    return _executor
+
+
+def is_stored_original(photo):
+    """Whether the photo's original is a stored file rather than a remote URL"""
+    name = photo.original_file.name if photo.original_file else ''
+    return bool(name) and not name.startswith(('http://', 'https://'))
+
+
+def has_variants(photo):
+    """Whether every size variant and the dimensions are stored"""
+    return photo.width is not None and all(getattr(photo, field) for field in DERIVATIVE_WIDTHS)
+
+
+def needs_derivatives(photo):
+    """Whether a stored image is missing any size variant, its dimensions or its placeholder"""
+    if photo.media_type != 'image' or not is_stored_original(photo):
+        return False
+    return not photo.placeholder or not has_variants(photo)
+
+
+def stored_images_filter():
+    """Q matching image photos whose original is a stored file"""
+    return (
+        Q(media_type='image')
+        & ~Q(original_file='')
+        & ~Q(original_file__startswith='http://')
+        & ~Q(original_file__startswith='https://')
+    )
+
+
+def pending_derivatives_filter():
+    """Q matching stored images with a missing variant, dimensions or placeholder"""
+    missing = Q(width__isnull=True) | Q(placeholder='')
+    for field in DERIVATIVE_WIDTHS:
+        missing |= Q(**{f'{field}__isnull': True}) | Q(**{field: ''})
+    return stored_images_filter() & missing
+
+
+def extract_exif(image):
+    """
+    Readable EXIF tags of an opened image as a JSON-serializable dict.
+    Binary values such as maker notes are dropped.
+    """
+    exif = image.getexif()
+    tags = dict(exif)
+    tags.update(exif.get_ifd(ExifTags.IFD.Exif))
+
+    data = {}
+    for tag, value in tags.items():
+        name = ExifTags.TAGS.get(tag)
+        if not name or isinstance(value, bytes):
+            continue
+        if isinstance(value, (int, float, str)):
+            data[name] = value[:MAX_EXIF_VALUE_LENGTH] if isinstance(value, str) else value
+        else:
+            try:
+                data[name] = float(value)
+            except (TypeError, ValueError):
+                data[name] = str(value)[:MAX_EXIF_VALUE_LENGTH]
+    return data
+
+
+# EXIF orientations that rotate the image by 90 or 270 degrees
+TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+
+def read_upload_metadata(photo):
+    """
+    Fill width, height, file_size, mime_type and exif_data of a photo whose
+    original has just been uploaded, reading only the image header and EXIF
+    block. Pillow opens images lazily, so no pixel data is decoded and large
+    phone photos cost no more memory than small ones.
+
+    Width and height are those of the image as displayed, after its EXIF
+    orientation is applied.
+
+    Returns:
+        True if the metadata was read, False if the original is not a new
+        upload or not a readable image.
+    """
+    original = photo.original_file
+    if photo.media_type != 'image' or not original or original._committed:
+        return False
+
+    upload = original.file
+    try:
+        with Image.open(upload) as image:
+            width, height = image.size
+            # PNG only has its EXIF chunk in the header if it precedes the
+            # pixel data; asking for it otherwise would decode the image
+            exif = image.getexif() if 'exif' in image.info else Image.Exif()
+            if exif.get(ExifTags.Base.Orientation) in TRANSPOSED_ORIENTATIONS:
+                width, height = height, width
+            mime_type = Image.MIME.get(image.format)
+            exif_data = extract_exif(image) if exif else {}
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        return False
+    finally:
+        upload.seek(0)
+
+    photo.width, photo.height = width, height
+    photo.file_size = original.size
+    photo.mime_type = mime_type
+    photo.exif_data = exif_data or None
+    return True
+
+
+# Derivative metadata copied along with the variants of a duplicate upload
+METADATA_FIELDS = ('width', 'height', 'file_size', 'mime_type', 'exif_data', 'placeholder')
+
+
+def find_donor(photo):
+    """
+    Another complete photo stored as the same content-addressed blob, whose
+    variants and metadata can be shared instead of re-encoding identical
+    bytes.
+
+    Returns:
+        The donor photo, or None.
+    """
+    name = photo.original_file.name if photo.original_file else ''
+    if not is_blob(name):
+        return None
+
+    for model in (AccommodationPhoto, TourPhoto):
+        donors = model.objects.filter(original_file=name, width__isnull=False)
+        if model is type(photo):
+            donors = donors.exclude(pk=photo.pk)
+        donor = next((donor for donor in donors[:5] if not needs_derivatives(donor)), None)
+        if donor is not None:
+            return donor
+    return None
+
+
+def _lock_photo(photo, force):
+    """
+    Re-read a photo under a row lock before its derivatives are stored.
+
+    Returns:
+        The locked photo, or None if it was deleted, its original replaced
+        or, unless forced, its derivatives completed by another worker.
+    """
+    current = type(photo).objects.select_for_update().filter(pk=photo.pk).first()
+    if current is None or current.original_file.name != photo.original_file.name:
+        return None
+    if not force and not needs_derivatives(current):
+        return None
+    return current
+
+
+def make_placeholder(image):
+    """
+    Blurred preview of an opened image as a data URI, small enough to inline
+    in the page (a few hundred bytes).
+    """
+    preview = image.copy()
+    preview.thumbnail((PLACEHOLDER_WIDTH, PLACEHOLDER_WIDTH), Image.Resampling.BOX)
+    buffer = io.BytesIO()
+    preview.save(buffer, 'WEBP', quality=PLACEHOLDER_QUALITY)
+    return 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def _encode_webp(image, width):
+    variant = image.copy()
+    if variant.width > width:
+        variant.thumbnail((width, variant.height), Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    variant.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=WEBP_METHOD)
+    return buffer.getvalue()
+
+
+def generate_derivatives(photo, force=False):
+    """
+    Build every WebP size variant, the metadata and the placeholder for one
+    photo. A photo missing only its placeholder just gets that.
+
+    Images are encoded first; the variants are then written and the row
+    saved in one transaction holding the photo's row lock, so concurrent
+    workers and deletes cannot double-count or orphan blobs. Newly written
+    blobs are removed again if the save fails.
+
+    Args:
+        photo: AccommodationPhoto or TourPhoto
+        force: Regenerate even if all variants already exist
+
+    Returns:
+        True if the photo was updated, False if there was nothing to do.
+    """
+    # media_utils imports DERIVATIVE_WIDTHS from this module
+    from .media_utils import delete_unreferenced_blobs
+
+    if not is_stored_original(photo) or photo.media_type != 'image':
+        return False
+    if not force and not needs_derivatives(photo):
+        return False
+
+    donor = find_donor(photo)
+    if donor is None:
+        original = photo.original_file
+        original.open('rb')
+        try:
+            with Image.open(original) as source:
+                mime_type = Image.MIME.get(source.format)
+                exif_data = extract_exif(source)
+                image = ImageOps.exif_transpose(source)
+                if image.mode not in ('RGB', 'RGBA'):
+                    image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+                image.load()
+            file_size = original.size
+        finally:
+            original.close()
+
+        placeholder = make_placeholder(image)
+        placeholder_only = not force and has_variants(photo)
+        variants = {} if placeholder_only else {
+            field: _encode_webp(image, width) for field, width in DERIVATIVE_WIDTHS.items()
+        }
+
+    written = []
+    try:
+        with transaction.atomic():
+            current = _lock_photo(photo, force)
+            if current is None:
+                return False
+
+            if donor is not None:
+                for field in (*DERIVATIVE_WIDTHS, *METADATA_FIELDS):
+                    value = getattr(donor, field)
+                    setattr(current, field, value.name if field in DERIVATIVE_WIDTHS else value)
+                current.save(update_fields=[*DERIVATIVE_WIDTHS, *METADATA_FIELDS, 'updated_at'])
+                return True
+
+            current.placeholder = placeholder
+            if placeholder_only:
+                current.save(update_fields=['placeholder', 'updated_at'])
+                return True
+
+            stem = os.path.splitext(os.path.basename(current.original_file.name))[0]
+            for field, data in variants.items():
+                variant = getattr(current, field)
+                if variant.name and not is_blob(variant.name):
+                    # Pre-store files belong to this photo alone; blobs are
+                    # released by reference count when the photo is saved
+                    transaction.on_commit(lambda storage=variant.storage, name=variant.name: storage.delete(name))
+                variant.save(f'{stem}_{field}.webp', ContentFile(data), save=False)
+                written.append(variant.name)
+
+            current.width, current.height = image.size
+            current.file_size = file_size
+            current.mime_type = mime_type
+            current.exif_data = exif_data or None
+            current.save(update_fields=[*DERIVATIVE_WIDTHS, *METADATA_FIELDS, 'updated_at'])
+    except Exception:
+        delete_unreferenced_blobs(written)
+        raise
+    return True
+
+
+def process_photo(model_label, photo_id, force=False):
+    """
+    Load a photo by id and generate its derivatives, logging any failure.
+
+    Returns:
+        True if the photo was updated.
+    """
+    model = apps.get_model(model_label)
+    photo = model.objects.filter(pk=photo_id).first()
+    if photo is None:
+        return False
+    try:
+        return generate_derivatives(photo, force=force)
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        logger.exception('Could not generate derivatives for %s %s', model_label, photo_id)
+        return False
+
+
+def _run_in_worker(model_label, photo_id, force):
+    close_old_connections()
+    try:
+        process_photo(model_label, photo_id, force=force)
+    except Exception:
+        # Nothing waits on the future, so anything not logged here is lost
+        logger.exception('Derivative worker failed for %s %s', model_label, photo_id)
+    finally:
+        close_old_connections()
+
+
+def queue_derivatives(photo, force=False):
+    """
+    Generate a photo's derivatives in the worker pool once the current
+    transaction commits, keeping image processing off the request path.
+    """
+    model_label = photo._meta.label
+    photo_id = photo.pk
+    transaction.on_commit(
+        lambda: _get_executor().submit(_run_in_worker, model_label, photo_id, force)
+    )
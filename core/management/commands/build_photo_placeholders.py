@@ -0,0 +1,95 @@
+"""
+Django management command to precompute placeholders for demo attraction photos
+Usage: python manage.py build_photo_placeholders [--fetch-remote] [--rebuild]
+
+Writes core/data/photo_placeholders.jsonl, mapping each photo URL to a tiny
+blurred WebP data URI. Listing photos get theirs with their size variants.
+"""
+
+import io
+import json
+import os
+
+import requests
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from ...data import demo_attractions, photo_placeholders
+from ...data.store import DATA_DIR
+from ...images import make_placeholder
+
+OUTPUT_FILE = "photo_placeholders.jsonl"
+
+
+def attraction_photo_urls():
+    """Every photo URL used by the demo attraction pages"""
+    urls = set()
+    for attractions in demo_attractions.values():
+        for attraction in attractions.values():
+            urls.update(attraction.get("photos") or [])
+            for field in ("image", "hero_image"):
+                if attraction.get(field):
+                    urls.add(attraction[field])
+    return urls
+
+
+class Command(BaseCommand):
+    help = "Precompute inline blurred placeholders for demo attraction photos"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fetch-remote",
+            action="store_true",
+            help="Also download remote (e.g. Unsplash) photos to build their placeholders",
+        )
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Recompute placeholders that already exist",
+        )
+
+    def handle(self, *args, **options):
+        placeholders = {} if options["rebuild"] else dict(photo_placeholders.items())
+
+        built = skipped = 0
+        for url in sorted(attraction_photo_urls()):
+            if url in placeholders:
+                continue
+            source = self.open_source(url, options["fetch_remote"])
+            if source is None:
+                skipped += 1
+                continue
+            try:
+                with source, Image.open(source) as img:
+                    placeholders[url] = make_placeholder(ImageOps.exif_transpose(img).convert("RGB"))
+                built += 1
+            except (OSError, UnidentifiedImageError):
+                self.stderr.write(f"Could not read {url}")
+                skipped += 1
+
+        path = os.path.join(DATA_DIR, OUTPUT_FILE)
+        with open(path, "w") as f:
+            for url in sorted(placeholders):
+                f.write(f"{url}\t{json.dumps(placeholders[url])}\n")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Built {built} placeholder(s), {len(placeholders)} in total; {skipped} photo(s) skipped"
+            )
+        )
+
+    def open_source(self, url, fetch_remote):
+        if url.startswith(settings.STATIC_URL):
+            found = finders.find(url[len(settings.STATIC_URL):])
+            return open(found, "rb") if found else None
+        if url.startswith(("http://", "https://")) and fetch_remote:
+            try:
+                response = requests.get(url, timeout=15)
+                response.raise_for_status()
+            except requests.RequestException:
+                self.stderr.write(f"Could not download {url}")
+                return None
+            return io.BytesIO(response.content)
+        return None
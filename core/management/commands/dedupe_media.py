@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from ...media_utils import PHOTO_FILE_FIELDS, acquire_blobs, blob_references
+from ...photo_utils import LISTING_FIELDS, invalidate_photo_manifest
+from ...storage import is_blob, media_storage
+
+
+class Command(BaseCommand):
+    help = 'Move existing listing photo files into the content-addressed store, sharing duplicates'
+
+    def handle(self, *args, **options):
+        storage = media_storage()
+        moved = {}
+
+        for model, fields in PHOTO_FILE_FIELDS.items():
+            listing_field = [LISTING_FIELDS[model]] if model in LISTING_FIELDS else []
+            for photo in model.objects.only('id', *fields, *listing_field).iterator():
+                changes = {}
+                for field in fields:
+                    name = getattr(photo, field).name
+                    if not name or is_blob(name) or name.startswith(('http://', 'https://')):
+                        continue
+                    if name not in moved:
+                        if not storage.exists(name):
+                            continue
+                        with storage.open(name) as f:
+                            moved[name] = storage.save(name, f)
+                    changes[field] = moved[name]
+
+                if changes:
+                    # Update the row directly: the content is unchanged, so
+                    # the photo must not be treated as replaced
+                    model.objects.filter(pk=photo.pk).update(**changes)
+                    acquire_blobs(blob_references(changes.values()))
+                    if listing_field:
+                        invalidate_photo_manifest(photo)
+
+        if not moved:
+            self.stdout.write('All photo files are already in the media store')
+            return
+
+        freed = 0
+        for name in moved:
+            freed += storage.size(name)
+            storage.delete(name)
+        freed -= sum(storage.size(blob) for blob in set(moved.values()))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Moved {len(moved)} file(s) into {len(set(moved.values()))} blob(s), '
+                f'freeing {freed / 1048576:.2f}MB'
+            )
+        )
@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...images import IMAGE_WORKERS, pending_derivatives_filter, process_photo, stored_images_filter
+from ...models import AccommodationPhoto, TourPhoto
+
+
+def _process(model_label, photo_id, force):
+    try:
+        return process_photo(model_label, photo_id, force=force)
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    help = 'Generate WebP size variants, metadata and placeholders for existing accommodation and tour photos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerate variants for every stored image, not only incomplete ones',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=IMAGE_WORKERS,
+            help='Photos processed in parallel',
+        )
+
+    def handle(self, *args, **options):
+        force = options['force']
+        photo_filter = stored_images_filter() if force else pending_derivatives_filter()
+
+        jobs = []
+        for model in (AccommodationPhoto, TourPhoto):
+            photo_ids = model.objects.filter(photo_filter).order_by('id').values_list('id', flat=True)
+            jobs.extend((model._meta.label, photo_id) for photo_id in photo_ids)
+
+        if not jobs:
+            self.stdout.write('All photos already have their size variants and placeholders')
+            return
+
+        with ThreadPoolExecutor(max_workers=max(options['workers'], 1)) as executor:
+            results = list(executor.map(lambda job: _process(*job, force), jobs))
+
+        updated = sum(results)
+        self.stdout.write(
+            self.style.SUCCESS(f'Generated variants for {updated} of {len(jobs)} photo(s)')
+        )
+        if updated < len(jobs):
+            self.stdout.write(
+                self.style.WARNING(f'{len(jobs) - updated} photo(s) could not be processed; see the log')
+            )
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+from datetime import timedelta
+from django.utils import timezone
+from ...models import Accommodation, Tour, DailyRate
+from ...rate_utils import RATE_HORIZON_DAYS, materialize_rates
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the materialized DailyRate table from seasonal and recurring rate rules'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--accommodation-id',
+            type=int,
+            help='Only rebuild this accommodation',
+        )
+        parser.add_argument(
+            '--tour-id',
+            type=int,
+            help='Only rebuild this tour',
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=RATE_HORIZON_DAYS,
+            help=f'Number of days ahead to materialize (default: {RATE_HORIZON_DAYS})',
+        )
+
+    def handle(self, *args, **options):
+        accommodation_id = options.get('accommodation_id')
+        tour_id = options.get('tour_id')
+        today = timezone.localdate()
+        end_date = today + timedelta(days=options['days'] - 1)
+
+        if accommodation_id or tour_id:
+            accommodations = Accommodation.objects.filter(id=accommodation_id)
+            tours = Tour.objects.filter(id=tour_id)
+        else:
+            accommodations = Accommodation.objects.filter(is_active=True)
+            tours = Tour.objects.filter(is_active=True)
+
+            # Past nights are never read again
+            deleted, _ = DailyRate.objects.filter(date__lt=today).delete()
+            if deleted:
+                self.stdout.write(f'Removed {deleted} past daily rates')
+
+        total_rows = 0
+        for listing in list(accommodations) + list(tours):
+            total_rows += materialize_rates(listing, today, end_date)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Materialized {total_rows} daily rates for '
+                f'{accommodations.count()} accommodation(s) and {tours.count()} tour(s)'
+            )
+        )
@@ -0,0 +1,283 @@
+"""
+Django management command to convert static and media images to WebP
+Usage: python manage.py optimize_media [paths ...] [--preset NAME] [--quality N]
+       [--workers N] [--delete-originals] [--dry-run]
+
+Replaces optimize_images.py, optimize_media.py and convert_to_webp.py.
+Each root directory keeps a manifest of content hash -> WebP output, so
+re-runs only touch files that are new or changed since the last run.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from PIL import Image
+
+from ...images import WEBP_METHOD
+
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+
+# Name -> (max width, max height, WebP quality)
+PRESETS = {
+    "hero": (1920, 1080, 85),
+    "gallery": (1200, 900, 85),
+    "standard": (800, 600, 85),
+    "thumbnail": (400, 300, 80),
+}
+
+MANIFEST_NAME = ".optimize_media.json"
+MANIFEST_VERSION = 1
+
+
+def file_hash(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def preset_for(relative_path):
+    """Pick a preset from the file's name and folder, as the old scripts did"""
+    lowered = relative_path.lower()
+    name = os.path.basename(lowered)
+    if "hero" in name or "banner" in name:
+        return "hero"
+    if "thumb" in lowered:
+        return "thumbnail"
+    if "gallery" in lowered:
+        return "gallery"
+    return "standard"
+
+
+def convert_image(source, output, max_width, max_height, quality):
+    """
+    Convert one image to a size-capped WebP. Runs in a worker process.
+
+    Returns:
+        Tuple of (source bytes, output bytes, output hash); output bytes and
+        hash are None when a WebP source is already within bounds.
+    """
+    source_size = os.path.getsize(source)
+    with Image.open(source) as img:
+        within_bounds = img.width <= max_width and img.height <= max_height
+        if source == output and img.format == "WEBP" and within_bounds:
+            return source_size, None, None
+
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB")
+        if not within_bounds:
+            img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+
+        temporary = f"{output}.tmp"
+        img.save(temporary, "WEBP", quality=quality, method=WEBP_METHOD)
+
+    os.replace(temporary, output)
+    return source_size, os.path.getsize(output), file_hash(output)
+
+
+class Manifest:
+    """
+    Per-root record of converted files.
+
+    "sources" maps a source content hash to its output and the preset it was
+    built with; "stat" caches each path's (size, mtime) -> hash so unchanged
+    files are not even re-read.
+    """
+
+    def __init__(self, root):
+        self.path = os.path.join(root, MANIFEST_NAME)
+        self.sources = {}
+        self.stat = {}
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self.sources = data["sources"]
+                self.stat = data["stat"]
+        self.outputs = {entry["output_hash"] for entry in self.sources.values() if entry["output_hash"]}
+
+    def hash_of(self, root, relative_path):
+        stat = os.stat(os.path.join(root, relative_path))
+        key = [stat.st_size, stat.st_mtime_ns]
+        cached = self.stat.get(relative_path)
+        if cached and cached[:2] == key:
+            return cached[2]
+        digest = file_hash(os.path.join(root, relative_path))
+        self.stat[relative_path] = key + [digest]
+        return digest
+
+    def is_current(self, root, digest, signature):
+        """Whether a source with this hash was converted with these settings"""
+        if digest in self.outputs:
+            return True
+        entry = self.sources.get(digest)
+        if not entry or entry["preset"] != signature:
+            return False
+        if entry["output_hash"] is None:
+            return True
+        output = os.path.join(root, entry["output"])
+        return os.path.exists(output) and self.hash_of(root, entry["output"]) == entry["output_hash"]
+
+    def record(self, root, digest, output, signature, output_hash):
+        self.sources[digest] = {"output": output, "preset": signature, "output_hash": output_hash}
+        if output_hash:
+            self.outputs.add(output_hash)
+            self.stat.pop(output, None)
+            self.hash_of(root, output)
+
+    def prune(self, relative_paths):
+        """Drop cached hashes of files that no longer exist"""
+        present = set(relative_paths)
+        self.stat = {path: value for path, value in self.stat.items() if path in present}
+
+    def forget(self, relative_path):
+        self.stat.pop(relative_path, None)
+
+    def save(self):
+        with open(self.path, "w") as f:
+            json.dump(
+                {"version": MANIFEST_VERSION, "sources": self.sources, "stat": self.stat},
+                f,
+                sort_keys=True,
+            )
+
+
+class Command(BaseCommand):
+    help = "Convert images to size-capped WebP in parallel, skipping files unchanged since the last run"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            help="Directories to optimize (default: STATICFILES_DIRS)",
+        )
+        parser.add_argument(
+            "--preset",
+            choices=sorted(PRESETS),
+            help="Use one preset for every image instead of choosing by file name",
+        )
+        parser.add_argument(
+            "--quality",
+            type=int,
+            help="Override the preset's WebP quality (1-100)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Images converted in parallel",
+        )
+        parser.add_argument(
+            "--delete-originals",
+            action="store_true",
+            help="Remove JPEG/PNG/GIF sources once their WebP is written",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the images that would be converted",
+        )
+
+    def handle(self, *args, **options):
+        if options["quality"] is not None and not 1 <= options["quality"] <= 100:
+            raise CommandError("--quality must be between 1 and 100")
+
+        roots = options["paths"] or [str(path) for path in settings.STATICFILES_DIRS]
+        for root in roots:
+            if not os.path.isdir(root):
+                raise CommandError(f"Directory not found: {root}")
+
+        totals = {"converted": 0, "skipped": 0, "failed": 0, "before": 0, "after": 0}
+        for root in roots:
+            self.optimize_root(os.path.abspath(root), options, totals)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Converted {totals['converted']} image(s), "
+                f"{totals['skipped']} unchanged, {totals['failed']} failed"
+            )
+        )
+        if totals["before"]:
+            saved = totals["before"] - totals["after"]
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{totals['before'] / 1048576:.2f}MB -> {totals['after'] / 1048576:.2f}MB "
+                    f"({saved / totals['before'] * 100:.1f}% saved)"
+                )
+            )
+
+    def find_images(self, root):
+        for directory, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(name for name in dirnames if "backup" not in name.lower())
+            for filename in sorted(filenames):
+                if filename.lower().endswith(IMAGE_EXTENSIONS):
+                    yield os.path.relpath(os.path.join(directory, filename), root)
+
+    def optimize_root(self, root, options, totals):
+        manifest = Manifest(root)
+        jobs = []
+        found = list(self.find_images(root))
+        manifest.prune(found)
+        for relative_path in found:
+            preset = options["preset"] or preset_for(relative_path)
+            max_width, max_height, quality = PRESETS[preset]
+            quality = options["quality"] or quality
+            signature = f"{max_width}x{max_height}q{quality}"
+
+            digest = manifest.hash_of(root, relative_path)
+            if manifest.is_current(root, digest, signature):
+                totals["skipped"] += 1
+                continue
+
+            output = os.path.splitext(relative_path)[0] + ".webp"
+            if (
+                output != relative_path
+                and os.path.exists(os.path.join(root, output))
+                and manifest.hash_of(root, output) not in manifest.outputs
+            ):
+                # A WebP with this name exists that this command did not build
+                totals["skipped"] += 1
+                continue
+            jobs.append((relative_path, output, digest, signature, (max_width, max_height, quality)))
+
+        if options["dry_run"]:
+            for relative_path, output, *_ in jobs:
+                self.stdout.write(f"Would convert {relative_path} -> {output}")
+            return
+
+        if jobs:
+            with ProcessPoolExecutor(max_workers=max(options["workers"], 1)) as executor:
+                futures = [
+                    executor.submit(
+                        convert_image, os.path.join(root, source), os.path.join(root, output), *bounds
+                    )
+                    for source, output, _, _, bounds in jobs
+                ]
+                for (source, output, digest, signature, _), future in zip(jobs, futures):
+                    try:
+                        before, after, output_hash = future.result()
+                    except (OSError, Image.DecompressionBombError) as e:
+                        totals["failed"] += 1
+                        self.stderr.write(f"Could not convert {source}: {e}")
+                        continue
+
+                    manifest.record(root, digest, output, signature, output_hash)
+                    if output_hash is None:
+                        totals["skipped"] += 1
+                        continue
+                    totals["converted"] += 1
+                    totals["before"] += before
+                    totals["after"] += after if after is not None else before
+
+                    if options["delete_originals"] and output != source:
+                        os.remove(os.path.join(root, source))
+                        manifest.forget(source)
+
+        manifest.save()
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from ...models import Accommodation, Tour
+from ...search_index import fulltext_supported, reindex_listings
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for accommodations and tours'
+
+    def handle(self, *args, **options):
+        if not fulltext_supported():
+            self.stdout.write(
+                self.style.WARNING('This database has no full-text index; search uses icontains filters')
+            )
+            return
+
+        accommodations = reindex_listings(Accommodation)
+        tours = reindex_listings(Tour)
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Reindexed {accommodations} accommodation(s) and {tours} tour(s)')
+        )
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from ...country_utils import reconcile_country_counts
+
+
+class Command(BaseCommand):
+    help = 'Recompute country accommodation and tour counts from the listing tables'
+
+    def handle(self, *args, **options):
+        changed = reconcile_country_counts()
+
+        if not changed:
+            self.stdout.write('All country counts are up to date')
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Corrected counts for {changed} country(ies)')
+        )
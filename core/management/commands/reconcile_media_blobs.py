@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from ...media_utils import reconcile_blobs
+
+
+class Command(BaseCommand):
+    help = 'Recompute media blob reference counts from the photo tables and delete unreferenced blob files'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would change without changing anything',
+        )
+
+    def handle(self, *args, **options):
+        result = reconcile_blobs(dry_run=options['dry_run'])
+        prefix = 'Would fix' if options['dry_run'] else 'Fixed'
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix} {result['corrected']} blob count(s), "
+                f"{result['removed']} unreferenced blob row(s) and "
+                f"{result['deleted']} orphan file(s)"
+            )
+        )
@@ -7,8 +7,8 @@ from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
 from django.db import transaction
 from core.models import UserProfile, Country
-from core.data.countries_data import countries_data
-from core.data.demo_attractions import demo_attractions
+from core.country_utils import reconcile_country_counts
+from core.data import countries_data, demo_attractions
 import json
 
 
@@ -43,6 +43,7 @@ class Command(BaseCommand):
         # Seed data
         with transaction.atomic():
             self.seed_countries()
+            reconcile_country_counts()
 
         self.stdout.write(self.style.SUCCESS("\n" + "=" * 80))
         self.stdout.write(
@@ -119,8 +120,6 @@ class Command(BaseCommand):
                     "code": country_info.get("code", country_slug.upper()[:3]),
                     "description": country_info.get("description", ""),
                     "image": country_info.get("image", ""),
-                    "accommodations_count": country_info.get("accommodations_count", 0),
-                    "tours_count": country_info.get("tours_count", 0),
                     "is_active": True,
                 },
             )
@@ -14,6 +14,7 @@ from core.models import (
     TourPhoto,
     Country,
 )
+from core.country_utils import reconcile_country_counts
 from slugify import slugify
 import json
 
@@ -45,7 +46,7 @@ class Command(BaseCommand):
 
         # Extract data from views.py by reading the file directly
         self.stdout.write(self.style.WARNING("\n📖 Reading data from views.py..."))
-        countries_data, demo_attractions = self.extract_data_from_views()
+        countries_data, demo_attractions = self.load_demo_data()
         self.stdout.write(
             self.style.SUCCESS(f"   ✅ Loaded {len(countries_data)} countries")
         )
@@ -64,6 +65,7 @@ class Command(BaseCommand):
         # Seed data
         with transaction.atomic():
             self.seed_countries(countries_data, demo_attractions)
+            reconcile_country_counts()
 
             if not options["countries_only"]:
                 self.stdout.write(
@@ -76,61 +78,11 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS("DATABASE SEEDING COMPLETED"))
         self.stdout.write(self.style.SUCCESS("=" * 70))
 
-    def extract_data_from_views(self):
-        """Extract countries_data and demo_attractions from views.py"""
-        import os
-
-        views_path = os.path.join(os.path.dirname(__file__), "..", "..", "views.py")
-
-        with open(views_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Execute the code to extract the variables
-        # Find the dictionaries in the file and evaluate them
-        namespace = {}
-
-        # Extract countries_data
-        countries_start = content.find("countries_data = {")
-        if countries_start == -1:
-            raise ValueError("Could not find countries_data in views.py")
-
-        # Find matching closing brace for countries_data
-        brace_count = 0
-        dict_start_pos = countries_start + len("countries_data = ")
-        for i, char in enumerate(content[dict_start_pos:], start=dict_start_pos):
-            if char == "{":
-                brace_count += 1
-            elif char == "}":
-                brace_count -= 1
-                if brace_count == 0:
-                    countries_end = i + 1
-                    break
-
-        countries_code = "countries_data = " + content[dict_start_pos:countries_end]
-
-        # Extract demo_attractions
-        demo_start = content.find("demo_attractions = {")
-        if demo_start == -1:
-            raise ValueError("Could not find demo_attractions in views.py")
-
-        brace_count = 0
-        dict_start_pos = demo_start + len("demo_attractions = ")
-        for i, char in enumerate(content[dict_start_pos:], start=dict_start_pos):
-            if char == "{":
-                brace_count += 1
-            elif char == "}":
-                brace_count -= 1
-                if brace_count == 0:
-                    demo_end = i + 1
-                    break
-
-        demo_code = "demo_attractions = " + content[dict_start_pos:demo_end]
-
-        # Execute both dictionary definitions
-        exec(countries_code, namespace)
-        exec(demo_code, namespace)
-
-        return namespace["countries_data"], namespace["demo_attractions"]
+    def load_demo_data(self):
+        """Load countries_data and demo_attractions from the core.data files"""
+        from ...data import countries_data, demo_attractions
+
+        return countries_data, demo_attractions
 
     def clear_database(self):
         """Clear existing data"""
@@ -198,8 +150,6 @@ class Command(BaseCommand):
                     "code": country_info.get("code", country_slug.upper()[:3]),
                     "description": country_info.get("description", ""),
                     "image": country_info.get("image", ""),
-                    "accommodations_count": country_info.get("accommodations_count", 0),
-                    "tours_count": country_info.get("tours_count", 0),
                     "is_active": True,
                 },
             )
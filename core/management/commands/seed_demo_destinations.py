@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from core.models import Country
+from core.country_utils import reconcile_country_counts
 
 
 class Command(BaseCommand):
@@ -42,8 +43,6 @@ class Command(BaseCommand):
                 'code': 'jordan',
                 'description': 'Explore the ancient wonders of Jordan, from the rose-red city of Petra to the salty shores of the Dead Sea.',
                 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80',
-                'accommodations_count': 245,
-                'tours_count': 450,
                 'attractions': ['Petra', 'Dead Sea', 'Wadi Rum', 'Jerash', 'Amman Citadel']
             },
             {
@@ -51,8 +50,6 @@ class Command(BaseCommand):
                 'code': 'tunisia',
                 'description': 'Discover the Mediterranean jewel with Roman ruins, Sahara Desert, and ancient Carthage.',
                 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 298,
-                'tours_count': 142,
                 'attractions': ['Carthage', 'Sidi Bou Said', 'Djerba Island', 'Sahara Desert', 'Tunis Medina']
             },
             {
@@ -60,8 +57,6 @@ class Command(BaseCommand):
                 'code': 'algeria',
                 'description': 'Experience North Africa\'s largest country with ancient Roman cities, stunning Sahara, and Mediterranean coast.',
                 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 215,
-                'tours_count': 98,
                 'attractions': ['Algiers Casbah', 'Timgad', 'Djemila', 'Tassili n\'Ajjer', 'Tipaza']
             },
             {
@@ -69,8 +64,6 @@ class Command(BaseCommand):
                 'code': 'turkey',
                 'description': 'Bridge between Europe and Asia, offering rich history, stunning landscapes, and warm hospitality.',
                 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 423,
-                'tours_count': 950,
                 'attractions': ['Istanbul', 'Cappadocia', 'Pamukkale', 'Ephesus', 'Antalya']
             },
             {
@@ -78,8 +71,6 @@ class Command(BaseCommand):
                 'code': 'egypt',
                 'description': 'Home to the ancient pyramids and pharaohs, with a rich history spanning thousands of years.',
                 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 389,
-                'tours_count': 600,
                 'attractions': ['Pyramids of Giza', 'Luxor', 'Aswan', 'Cairo', 'Red Sea']
             },
             {
@@ -87,8 +78,6 @@ class Command(BaseCommand):
                 'code': 'morocco',
                 'description': 'A land of contrasts with bustling souks, stunning deserts, and the majestic Atlas Mountains.',
                 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 278,
-                'tours_count': 145,
                 'attractions': ['Marrakech', 'Sahara Desert', 'Chefchaouen', 'Atlas Mountains', 'Fes']
             },
             {
@@ -96,8 +85,6 @@ class Command(BaseCommand):
                 'code': 'uae',
                 'description': 'A modern oasis of luxury and innovation, blending traditional Arabian culture with cutting-edge architecture.',
                 'image': 'https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 892,
-                'tours_count': 800,
                 'attractions': ['Burj Khalifa', 'Palm Jumeirah', 'Dubai Mall', 'Sheikh Zayed Mosque', 'Dubai Desert Safari']
             },
             {
@@ -105,8 +92,6 @@ class Command(BaseCommand):
                 'code': 'lebanon',
                 'description': 'A Mediterranean jewel known for its ancient history, vibrant culture, and stunning coastal beauty.',
                 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 234,
-                'tours_count': 350,
                 'attractions': ['Beirut', 'Baalbek', 'Byblos', 'Jeita Grotto', 'Cedars of God']
             },
             {
@@ -114,8 +99,6 @@ class Command(BaseCommand):
                 'code': 'qatar',
                 'description': 'A modern Arabian nation blending rich heritage with world-class luxury and sporting excellence.',
                 'image': 'https://images.unsplash.com/photo-1539037116277-4db20889f2d4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 167,
-                'tours_count': 280,
                 'attractions': ['Doha', 'Museum of Islamic Art', 'Souq Waqif', 'Katara Cultural Village', 'Al Zubarah Fort']
             },
             {
@@ -123,8 +106,6 @@ class Command(BaseCommand):
                 'code': 'saudi-arabia',
                 'description': 'The heart of Islam with ancient deserts, modern cities, and sacred pilgrimage sites.',
                 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 445,
-                'tours_count': 320,
                 'attractions': ['Mecca', 'Medina', 'Riyadh', 'AlUla', 'Red Sea Coast']
             },
             {
@@ -132,8 +113,6 @@ class Command(BaseCommand):
                 'code': 'kuwait',
                 'description': 'A modern Gulf state with rich cultural heritage, stunning desert landscapes, and warm hospitality.',
                 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 123,
-                'tours_count': 180,
                 'attractions': ['Kuwait City', 'Kuwait Towers', 'Liberation Tower', 'Tareq Rajab Museum', 'Al Shaheed Park']
             },
             {
@@ -141,8 +120,6 @@ class Command(BaseCommand):
                 'code': 'bahrain',
                 'description': 'An island kingdom blending ancient Dilmun civilization with modern Arabian Gulf culture.',
                 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 89,
-                'tours_count': 120,
                 'attractions': ['Manama', 'Bahrain Fort', 'Al Fateh Grand Mosque', 'Bahrain World Trade Center', 'Tree of Life']
             },
             {
@@ -150,8 +127,6 @@ class Command(BaseCommand):
                 'code': 'oman',
                 'description': 'An Arabian paradise of stunning deserts, turquoise coasts, and ancient fortresses.',
                 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 156,
-                'tours_count': 250,
                 'attractions': ['Muscat', 'Nizwa Fort', 'Wahiba Sands', 'Jebel Shams', 'Sur']
             },
             {
@@ -159,8 +134,6 @@ class Command(BaseCommand):
                 'code': 'syria',
                 'description': 'Ancient land of civilization with rich history, stunning architecture, and Mediterranean charm.',
                 'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 89,
-                'tours_count': 150,
                 'attractions': ['Damascus', 'Aleppo', 'Palmyra', 'Krak des Chevaliers', 'Bosra']
             },
             {
@@ -168,8 +141,6 @@ class Command(BaseCommand):
                 'code': 'iraq',
                 'description': 'Land of ancient Mesopotamia with rich history, archaeological treasures, and cultural heritage.',
                 'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 67,
-                'tours_count': 100,
                 'attractions': ['Baghdad', 'Babylon', 'Uruk', 'Karbala', 'Erbil Citadel']
             },
             {
@@ -177,8 +148,6 @@ class Command(BaseCommand):
                 'code': 'yemen',
                 'description': 'Ancient land of spices, towering mountains, and rich cultural heritage.',
                 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'accommodations_count': 45,
-                'tours_count': 80,
                 'attractions': ['Sana\'a', 'Socotra Island', 'Zabid', 'Shibam', 'Aden']
             }
         ]
@@ -194,5 +163,6 @@ class Command(BaseCommand):
                     self.stdout.write(f'Created country: {country.name}')
                 else:
                     self.stdout.write(f'Country already exists: {country.name}')
+            reconcile_country_counts()
 
         return countries
\ No newline at end of file
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from ...popularity_utils import rebuild_popularity_scores, score_pending_bookings
+
+
+class Command(BaseCommand):
+    help = 'Add newly completed bookings to accommodation and tour popularity scores (run periodically)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Reset all scores and recount every completed booking',
+        )
+
+    def handle(self, *args, **options):
+        if options['rebuild']:
+            bookings, listings = rebuild_popularity_scores()
+        else:
+            bookings, listings = score_pending_bookings()
+
+        if not bookings:
+            self.stdout.write('No new completed bookings')
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Scored {bookings} booking(s) across {listings} listing(s)')
+        )
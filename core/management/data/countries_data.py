@@ -1,601 +0,0 @@
-# Auto-generated from views.py
-countries_data = {
-        'jordan': {
-            'name': 'Jordan',
-            'description': 'Explore the ancient wonders of Jordan, from the rose-red city of Petra to the salty shores of the Dead Sea.',
-            'long_description': 'Jordan, a country steeped in history and natural beauty, offers travelers an unforgettable journey through time. From the majestic rock-cut architecture of Petra to the therapeutic waters of the Dead Sea, every corner tells a story of ancient civilizations and breathtaking landscapes.',
-            'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80',
-            'hero_image': '/static/core/images/ruined-ancient-building-made-large-towers-rocks-clear-sky.jpg',
-            'accommodations_count': 245,
-            'tours_count': 89,
-            'attractions': [
-                {'name': 'Petra', 'slug': 'petra', 'description': 'Ancient rock-cut city and UNESCO World Heritage Site', 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Wadi Rum', 'slug': 'wadi-rum', 'description': 'Desert landscape known as Valley of the Moon', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dead Sea', 'slug': 'dead-sea', 'description': 'Lowest point on Earth with mineral-rich waters', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Jerash', 'slug': 'jerash', 'description': 'Ancient Roman city with well-preserved ruins', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Mount Nebo', 'slug': 'mount-nebo', 'description': 'Sacred biblical site where Moses viewed the Promised Land', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Madaba', 'slug': 'madaba', 'description': 'City of Mosaics with famous 6th-century Byzantine map', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Amman Citadel', 'slug': 'amman-citadel', 'description': 'Ancient fortress with Temple of Hercules', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Aqaba', 'slug': 'aqaba', 'description': 'Red Sea resort city with diving and beaches', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Bethany Beyond the Jordan', 'slug': 'bethany-beyond-jordan', 'description': 'UNESCO baptism site of Jesus', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Ajloun Castle', 'slug': 'ajloun-castle', 'description': '12th-century fortress built by Saladin\'s forces', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Karak Castle', 'slug': 'karak-castle', 'description': 'Largest Crusader castle in the Levant', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dana Biosphere Reserve', 'slug': 'dana-reserve', 'description': 'Jordan\'s largest nature reserve with diverse ecosystems', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Umm Qais (Gadara)', 'slug': 'umm-qais', 'description': 'Ancient Decapolis city with views over three countries', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Qasr Amra', 'slug': 'qasr-amra', 'description': 'UNESCO desert castle with 8th-century frescoes', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Azraq Wetland Reserve', 'slug': 'azraq-wetland', 'description': 'Desert oasis and bird sanctuary', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Wadi Mujib', 'slug': 'wadi-mujib', 'description': 'Jordan\'s Grand Canyon with canyoning adventures', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Little Petra', 'slug': 'little-petra', 'description': 'Nabataean site with rare ancient frescoes', 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Shobak Castle', 'slug': 'shobak-castle', 'description': 'First Crusader castle in the region', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Pella', 'slug': 'pella', 'description': 'Ancient city with 8,000 years of history', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Rainbow Street', 'slug': 'rainbow-street', 'description': 'Vibrant cultural hub in Amman', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Petra Marriott\'s Wadi Rum Nabatean Resort', 'location': 'Wadi Rum', 'rating': 4.8, 'price': 250, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Mövenpick Resort Petra', 'location': 'Petra', 'rating': 4.6, 'price': 180, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Kempinski Hotel Ishtar Dead Sea', 'location': 'Dead Sea', 'rating': 4.7, 'price': 220, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'tours': [
-                {'name': 'Petra Full Day Tour', 'duration': '8 hours', 'price': 85, 'rating': 4.9, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Wadi Rum Desert Safari', 'duration': '6 hours', 'price': 65, 'rating': 4.8, 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dead Sea Experience', 'duration': '4 hours', 'price': 45, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'tunisia': {
-            'name': 'Tunisia',
-            'description': 'Discover the Mediterranean jewel with Roman ruins, Sahara Desert, and ancient Carthage.',
-            'long_description': 'Tunisia, the northernmost country in Africa, offers a fascinating blend of Mediterranean culture, ancient Roman history, and Saharan adventure. From the ruins of Carthage to the blue waters of the Mediterranean, Tunisia provides an unforgettable journey through time with its rich cultural heritage, stunning landscapes, and warm hospitality.',
-            'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'accommodations_count': 298,
-            'tours_count': 142,
-            'attractions': [
-                {'name': 'Carthage Archaeological Site', 'slug': 'carthage-archaeological-site', 'description': 'Ancient Phoenician city UNESCO World Heritage', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sidi Bou Said', 'slug': 'sidi-bou-said', 'description': 'Charming blue and white village', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Djerba Island', 'slug': 'djerba-island', 'description': 'Island of legends with ancient synagogue', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dougga Ancient City', 'slug': 'dougga-ancient-city', 'description': 'UNESCO Roman city ruins', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Tunis Medina', 'slug': 'tunis-medina', 'description': 'UNESCO historic old city', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Bardo Museum', 'slug': 'bardo-museum', 'description': 'World\'s largest Roman mosaic collection', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sahara Desert', 'slug': 'sahara-desert', 'description': 'Dune seas and desert camps', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'El Jem Amphitheater', 'slug': 'el-jem-amphitheater', 'description': 'UNESCO Roman colosseum', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Kairouan', 'slug': 'kairouan', 'description': 'Fourth holiest Islamic city', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sousse Medina', 'slug': 'sousse-medina', 'description': 'UNESCO ribat fortress', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Matmata', 'slug': 'matmata', 'description': 'Troglodyte underground homes', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Hammamet', 'slug': 'hammamet', 'description': 'Mediterranean beach resort', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Tozeur', 'slug': 'tozeur', 'description': 'Gateway to the Sahara', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Cap Bon Peninsula', 'slug': 'cap-bon-peninsula', 'description': 'Vineyards and coastal beauty', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Zaghouan Aqueduct', 'slug': 'zaghouan-aqueduct', 'description': 'Roman water system', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Chebika Oasis', 'slug': 'chebika-oasis', 'description': 'Mountain oasis village', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Nabeul', 'slug': 'nabeul', 'description': 'Pottery capital and beaches', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Mahdia', 'slug': 'mahdia', 'description': 'Fatimid caliphate capital', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Tabarka', 'slug': 'tabarka', 'description': 'Coral coast and Genoese fort', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Tataouine', 'slug': 'tataouine', 'description': 'Berber villages and Star Wars locations', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Dar El Jeld Hotel & Spa', 'location': 'Tunis', 'rating': 4.8, 'price': 220, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Hasdrubal Thalassa & Spa Yasmine Hammamet', 'location': 'Hammamet', 'rating': 4.7, 'price': 180, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Palmeraie Palace Hotel', 'location': 'Tozeur', 'rating': 4.6, 'price': 150, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'tours': [
-                {'name': 'Carthage & Tunis Medina Tour', 'duration': '6 hours', 'price': 45, 'rating': 4.8, 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sahara Desert Experience', 'duration': '2 days', 'price': 120, 'rating': 4.9, 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Roman Tunisia Tour', 'duration': '8 hours', 'price': 65, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'algeria': {
-            'name': 'Algeria',
-            'description': 'A North African gem blending Mediterranean charm with Saharan adventure, featuring stunning coastlines and ancient history.',
-            'long_description': 'Algeria, the largest country in Africa, offers an extraordinary blend of Mediterranean culture and Saharan wilderness. From the vibrant streets of Algiers to the vast dunes of the Sahara Desert, Algeria provides an unforgettable journey through ancient Roman ruins, stunning coastal landscapes, and the warm hospitality of its people.',
-            'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'accommodations_count': 234,
-            'tours_count': 156,
-            'attractions': [
-                {'name': 'Algiers Casbah', 'slug': 'algiers-casbah', 'description': 'UNESCO World Heritage Site with Ottoman architecture', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Timgad Roman Ruins', 'slug': 'timgad-roman-ruins', 'description': 'UNESCO site with well-preserved Roman theater', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Djémila Roman Ruins', 'slug': 'djémila-roman-ruins', 'description': 'UNESCO hilltop Roman city with temples', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Tipaza Roman Ruins', 'slug': 'tipaza-roman-ruins', 'description': 'UNESCO coastal ruins with Punic tombs', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Hoggar Mountains', 'slug': 'hoggar-mountains', 'description': 'Sahara volcanic peaks with Tuareg culture', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Ahaggar National Park', 'slug': 'ahaggar-national-park', 'description': 'UNESCO biosphere with desert wildlife', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Tassili n\'Ajjer', 'slug': 'tassili-najjer', 'description': 'UNESCO rock art dating back 12,000 years', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Constantine Bridges', 'slug': 'constantine-bridges', 'description': 'Historic city with Roman bridges over gorges', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Oran Cathedral', 'slug': 'oran-cathedral', 'description': 'Neo-Byzantine cathedral in Mediterranean port', 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Annaba Basilica', 'slug': 'annaba-basilica', 'description': 'Ruins of largest Roman basilica in North Africa', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Bejaia Souk', 'slug': 'bejaia-souk', 'description': 'Traditional market in coastal Berber town', 'image': 'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Ghardaia M\'Zab Valley', 'slug': 'ghardaia-mzab-valley', 'description': 'UNESCO oasis with traditional mud-brick architecture', 'image': 'https://images.unsplash.com/photo-1555529669-e69e7aa0ba9a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Chrea National Park', 'slug': 'chrea-national-park', 'description': 'Algerian Switzerland with cedar forests', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Tlemcen Ruins', 'slug': 'tlemcen-ruins', 'description': 'Medieval Islamic city with Great Mosque', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sahara Erg', 'slug': 'sahara-erg', 'description': 'Vast sand dunes and desert landscapes', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Kabylie Mountains', 'slug': 'kabylie-mountains', 'description': 'Berber villages and coastal scenery', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'El Kantara Gorge', 'slug': 'el-kantara-gorge', 'description': 'Natural gorge with Roman bridge ruins', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Timimoun Oasis', 'slug': 'timimoun-oasis', 'description': 'Saharan oasis with red mud-brick ksars', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Cherchell Ruins', 'slug': 'cherchell-ruins', 'description': 'Punic and Roman archaeological site', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Taghit Zodiac', 'slug': 'taghit-zodiac', 'description': 'Ancient astronomical rock carvings', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Hotel El Aurassi', 'location': 'Algiers', 'rating': 4.8, 'price': 220, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sahara Desert Camp', 'location': 'Hoggar', 'rating': 4.7, 'price': 180, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Royal Hotel Constantine', 'location': 'Constantine', 'rating': 4.6, 'price': 150, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'}
-            ],
-            'tours': [
-                {'name': 'Algiers Cultural Tour', 'duration': '4 hours', 'price': 45, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sahara Desert Adventure', 'duration': '3 days', 'price': 280, 'rating': 4.9, 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Roman Algeria Tour', 'duration': '5 days', 'price': 320, 'rating': 4.8, 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'turkey': {
-            'name': 'Turkey',
-            'description': 'Bridge between Europe and Asia, offering rich history, stunning landscapes, and warm hospitality.',
-            'long_description': 'Turkey, straddling two continents, offers a fascinating blend of Eastern and Western cultures. From the majestic Hagia Sophia in Istanbul to the surreal fairy chimneys of Cappadocia, Turkey provides an incredible diversity of experiences from ancient ruins to modern cities.',
-            'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': 'https://images.unsplash.com/photo-1527838832700-5059252407fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'accommodations_count': 423,
-            'tours_count': 950,
-            'attractions': [
-                {'name': 'Istanbul', 'slug': 'istanbul', 'description': 'Transcontinental city bridging Europe and Asia', 'image': 'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Hagia Sophia', 'slug': 'hagia-sophia', 'description': 'Byzantine-Ottoman architectural masterpiece', 'image': 'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Blue Mosque', 'slug': 'blue-mosque', 'description': 'Six minarets Ottoman imperial mosque', 'image': 'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Cappadocia', 'slug': 'cappadocia', 'description': 'Fairy chimneys and hot air balloons', 'image': 'https://images.unsplash.com/photo-1578271887552-5ac9e7c7b5d2?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Ephesus', 'slug': 'ephesus', 'description': 'Best preserved ancient Roman city', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Pamukkale', 'slug': 'pamukkale', 'description': 'White travertine terraces Cotton Castle', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Topkapi Palace', 'slug': 'topkapi-palace', 'description': 'Ottoman sultans imperial palace', 'image': 'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Grand Bazaar', 'slug': 'grand-bazaar', 'description': 'World\'s oldest covered market', 'image': 'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Göreme Open Air Museum', 'slug': 'goreme-open-air-museum', 'description': 'Cave churches UNESCO World Heritage', 'image': 'https://images.unsplash.com/photo-1578271887552-5ac9e7c7b5d2?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Antalya', 'slug': 'antalya', 'description': 'Turkish Riviera Mediterranean gateway', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Troy', 'slug': 'troy', 'description': 'Legendary ancient city of Trojan War', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Mount Nemrut', 'slug': 'mount-nemrut', 'description': 'Summit sanctuary with giant stone heads', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sumela Monastery', 'slug': 'sumela-monastery', 'description': 'Greek Orthodox cliffside monastery', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Bodrum', 'slug': 'bodrum', 'description': 'Aegean resort with Crusader castle', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Pergamon', 'slug': 'pergamon', 'description': 'Ancient Greek capital acropolis ruins', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Oludeniz', 'slug': 'oludeniz', 'description': 'Blue Lagoon paragliding paradise', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Mevlana Museum', 'slug': 'mevlana-museum', 'description': 'Whirling dervishes Sufi shrine Konya', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Galata Tower', 'slug': 'galata-tower', 'description': 'Medieval Genoese tower Istanbul', 'image': 'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Aspendos Theater', 'slug': 'aspendos-theater', 'description': 'Best preserved Roman amphitheater', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Basilica Cistern', 'slug': 'basilica-cistern', 'description': 'Byzantine underground water reservoir', 'image': 'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Ciragan Palace Kempinski Istanbul', 'location': 'Istanbul', 'rating': 4.9, 'price': 420, 'image': 'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Museum Hotel Cappadocia', 'location': 'Cappadocia', 'rating': 4.8, 'price': 280, 'image': 'https://images.unsplash.com/photo-1578271887552-5ac9e7c7b5d2?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Regnum Carya Golf & Spa Resort', 'location': 'Antalya', 'rating': 4.7, 'price': 250, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'tours': [
-                {'name': 'Istanbul Cultural Heritage Tour', 'duration': '7 hours', 'price': 75, 'rating': 4.8, 'image': 'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Cappadocia Hot Air Balloon Tour', 'duration': '4 hours', 'price': 180, 'rating': 4.9, 'image': 'https://images.unsplash.com/photo-1578271887552-5ac9e7c7b5d2?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Ephesus and Pamukkale Day Trip', 'duration': '12 hours', 'price': 95, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'egypt': {
-            'name': 'Egypt',
-            'description': 'Home to the ancient pyramids and pharaohs, with a rich history spanning thousands of years.',
-            'long_description': 'Egypt, the land of the pharaohs, offers an unparalleled journey through one of the world\'s greatest ancient civilizations. From the majestic pyramids of Giza to the temples of Luxor, Egypt combines archaeological wonders with modern cities and the stunning Red Sea coastline.',
-            'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': '/static/core/images/young-man-walking-towards-great-sphinx-giza.jpg',
-            'accommodations_count': 389,
-            'tours_count': 600,
-            'attractions': [
-                {'name': 'Pyramids of Giza & Sphinx', 'slug': 'pyramids-of-giza', 'description': 'Legendary pyramids and one of the Seven Wonders of the Ancient World', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Grand Egyptian Museum', 'slug': 'grand-egyptian-museum', 'description': 'World\'s largest archaeological museum housing Tutankhamun treasures', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Valley of the Kings', 'slug': 'valley-of-the-kings', 'description': 'Royal burial site with rock-cut tombs of pharaohs including Tutankhamun', 'image': 'https://images.unsplash.com/photo-1464822759844-d150f38d609c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Karnak Temple Complex', 'slug': 'karnak-temple', 'description': 'One of the largest religious sites with towering columns and ancient ruins', 'image': 'https://images.unsplash.com/photo-1464822759844-d150f38d609c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Luxor Temple', 'slug': 'luxor-temple', 'description': 'Ancient temple dedicated to Amun, stunning when illuminated at night', 'image': 'https://images.unsplash.com/photo-1464822759844-d150f38d609c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Abu Simbel Temples', 'slug': 'abu-simbel', 'description': 'Rock-hewn temples of Ramses II and Queen Nefertari', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Philae Temple', 'slug': 'philae-temple', 'description': 'Island temple dedicated to goddess Isis with scenic boat access', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Egyptian Museum Cairo', 'slug': 'egyptian-museum', 'description': 'Tahrir Square museum with 120,000 artifacts and Tutankhamun gold mask', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Islamic Cairo', 'slug': 'islamic-cairo', 'description': 'Historic district with Sultan Hassan Mosque and Khan El Khalili bazaar', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Muhammad Ali Mosque', 'slug': 'muhammad-ali-mosque', 'description': 'Alabaster mosque atop Cairo Citadel with panoramic city views', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Hurghada', 'slug': 'hurghada', 'description': 'Premier Red Sea resort for SCUBA diving and snorkeling', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sharm El-Sheikh', 'slug': 'sharm-el-sheikh', 'description': 'Luxury Red Sea destination with world-class diving sites', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Bibliotheca Alexandrina', 'slug': 'bibliotheca-alexandrina', 'description': 'Modern library honoring the ancient Library of Alexandria', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Citadel of Qaitbay', 'slug': 'citadel-qaitbay', 'description': 'Fortress built on ruins of the ancient Pharos Lighthouse', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Aswan High Dam', 'slug': 'aswan-high-dam', 'description': 'Engineering marvel controlling Nile flooding with Lake Nasser views', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Siwa Oasis', 'slug': 'siwa-oasis', 'description': 'Remote desert oasis with natural springs and Temple of Oracle of Amun', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Hatshepsut Temple', 'slug': 'hatshepsut-temple', 'description': 'Memorial temple of Egypt\'s female pharaoh carved into cliffsides', 'image': 'https://images.unsplash.com/photo-1464822759844-d150f38d609c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dahab', 'slug': 'dahab', 'description': 'Laid-back Red Sea town famous for diving at Blue Hole', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Marsa Alam', 'slug': 'marsa-alam', 'description': 'Pristine Red Sea destination for marine life and ocean activities', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Catacombs of Kom El Shoqafa', 'slug': 'catacombs-kom-el-shoqafa', 'description': 'Fascinating underground necropolis blending Egyptian and Roman art', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Four Seasons Hotel Cairo at Nile Plaza', 'location': 'Cairo', 'rating': 4.8, 'price': 320, 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Kempinski Nile Hotel Cairo', 'location': 'Cairo', 'rating': 4.7, 'price': 280, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Jaz Makadi Star & Spa Resort', 'location': 'Red Sea', 'rating': 4.6, 'price': 220, 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'tours': [
-                {'name': 'Pyramids and Sphinx Full Day Tour', 'duration': '8 hours', 'price': 65, 'rating': 4.8, 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Luxor and Karnak Temple Tour', 'duration': '6 hours', 'price': 55, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1464822759844-d150f38d609c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Nile River Felucca Cruise', 'duration': '3 hours', 'price': 35, 'rating': 4.6, 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'morocco': {
-            'name': 'Morocco',
-            'description': 'A land of contrasts with bustling souks, stunning deserts, and the majestic Atlas Mountains.',
-            'long_description': 'Morocco, a North African gem, offers an exotic blend of ancient traditions and vibrant modernity. From the bustling souks of Marrakech to the vast Sahara Desert, Morocco provides an unforgettable journey through colorful markets, stunning architecture, and breathtaking landscapes.',
-            'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'accommodations_count': 278,
-            'tours_count': 145,
-            'attractions': [
-                {'name': 'Djemaa el-Fna Square Marrakech', 'slug': 'djemaa-el-fna-square-marrakech', 'description': 'Old medina center with markets', 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Koutoubia Mosque Marrakech', 'slug': 'koutoubia-mosque-marrakech', 'description': 'Iconic red city mosque', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Majorelle Gardens Marrakech', 'slug': 'majorelle-gardens-marrakech', 'description': 'Yves Saint Laurent gardens', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Bahia Palace Marrakech', 'slug': 'bahia-palace-marrakech', 'description': '19th century palace', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Saadian Tombs Marrakech', 'slug': 'saadian-tombs-marrakech', 'description': 'Royal necropolis', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Fes el-Bali Medina', 'slug': 'fes-el-bali-medina', 'description': 'UNESCO maze of narrow streets', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'University of Al Quaraouiyine Fes', 'slug': 'university-of-al-quaraouiyine-fes', 'description': 'World\'s oldest university 859 AD', 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Fes Tanneries', 'slug': 'fes-tanneries', 'description': 'Ancient leather processing', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Hassan II Mosque Casablanca', 'slug': 'hassan-ii-mosque-casablanca', 'description': 'World\'s biggest minaret Atlantic coast', 'image': 'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Casablanca Corniche', 'slug': 'casablanca-corniche', 'description': 'Seafront promenade', 'image': 'https://images.unsplash.com/photo-1555529669-e69e7aa0ba9a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Merzouga Sahara Desert', 'slug': 'merzouga-sahara-desert', 'description': 'Erg Chebbi dunes camel treks', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Chefchaouen', 'slug': 'chefchaouen', 'description': 'Blue-painted mountain town', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Essaouira', 'slug': 'essaouira', 'description': 'UNESCO coastal medina blue and white buildings', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Ait Benhaddou', 'slug': 'ait-benhaddou', 'description': 'UNESCO Kasbah from Game of Thrones', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Rabat Hassan Tower', 'slug': 'rabat-hassan-tower', 'description': 'Capital city minaret', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Meknes Bab Mansour Gate', 'slug': 'meknes-bab-mansour-gate', 'description': 'UNESCO 11th century', 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Todra Gorge', 'slug': 'todra-gorge', 'description': 'Red-rock canyon for hiking', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Volubilis', 'slug': 'volubilis', 'description': 'Roman ruins UNESCO site', 'image': 'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Atlas Mountains', 'slug': 'atlas-mountains', 'description': 'Berber villages and hiking', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Agadir Beach', 'slug': 'agadir-beach', 'description': 'Atlantic resort town', 'image': 'https://images.unsplash.com/photo-1555529669-e69e7aa0ba9a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Nomad Palace Camp', 'location': 'Sahara Desert', 'rating': 4.8, 'price': 180, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Riad Kniza Marrakech', 'location': 'Marrakech', 'rating': 4.7, 'price': 150, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dar Moha Hotel', 'location': 'Marrakech', 'rating': 4.6, 'price': 120, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'}
-            ],
-            'tours': [
-                {'name': 'Marrakech Medina Walking Tour', 'duration': '4 hours', 'price': 35, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Atlas Mountains Trek', 'duration': '3 days', 'price': 280, 'rating': 4.8, 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sahara Desert Camel Trek', 'duration': '2 days', 'price': 220, 'rating': 4.9, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'uae': {
-            'name': 'United Arab Emirates',
-            'description': 'A modern oasis of luxury and innovation, blending traditional Arabian culture with cutting-edge architecture.',
-            'long_description': 'The United Arab Emirates represents the pinnacle of modern luxury and cultural fusion. From the iconic Burj Khalifa in Dubai to the traditional souks of Abu Dhabi, the UAE offers an extraordinary blend of ancient Bedouin heritage and futuristic innovation.',
-            'image': 'https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': '/static/core/images/futuristic-dubai-landscape.jpg',
-            'accommodations_count': 892,
-            'tours_count': 345,
-            'attractions': [
-                {'name': 'Burj Khalifa', 'slug': 'burj-khalifa', 'description': 'World\'s tallest building with stunning city views', 'image': 'https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sheikh Zayed Grand Mosque', 'slug': 'sheikh-zayed-mosque', 'description': 'Magnificent mosque with intricate Islamic architecture', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Palm Jumeirah', 'slug': 'palm-jumeirah', 'description': 'Artificial island paradise with luxury resorts', 'image': 'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dubai Mall', 'slug': 'dubai-mall', 'description': 'World\'s largest shopping and entertainment complex', 'image': 'https://images.unsplash.com/photo-1555529669-e69e7aa0ba9a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dubai Desert Safari', 'slug': 'dubai-desert-safari', 'description': 'Thrilling desert adventure with dune bashing', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dubai Marina', 'slug': 'dubai-marina', 'description': 'Modern waterfront district with luxury yachts and entertainment', 'image': 'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Burj Al Arab', 'slug': 'burj-al-arab', 'description': 'Iconic seven-star hotel with world-class luxury', 'image': 'https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dubai Fountain', 'slug': 'dubai-fountain', 'description': 'World\'s largest choreographed fountain system', 'image': 'https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Louvre Abu Dhabi', 'slug': 'louvre-abu-dhabi', 'description': 'World-class art museum with universal collection', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dubai Creek', 'slug': 'dubai-creek', 'description': 'Historic waterway dividing old and new Dubai', 'image': 'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Jumeirah Beach', 'slug': 'jumeirah-beach', 'description': 'Pristine beach with luxury resorts and water activities', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dubai Museum', 'slug': 'dubai-museum', 'description': 'Ancient fort showcasing Dubai\'s history and culture', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Al Fahidi Historical Neighbourhood', 'slug': 'al-fahidi-historical', 'description': 'Traditional wind-tower houses and cultural district', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dubai Frame', 'slug': 'dubai-frame', 'description': 'Massive picture frame structure with city views', 'image': 'https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dubai Miracle Garden', 'slug': 'dubai-miracle-garden', 'description': 'World\'s largest flower garden with floral displays', 'image': 'https://images.unsplash.com/photo-1416879595882-3373a0480b5b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Global Village Dubai', 'slug': 'global-village-dubai', 'description': 'Cultural theme park showcasing world cultures', 'image': 'https://images.unsplash.com/photo-1542204165-65bf26472b9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Ferrari World Abu Dhabi', 'slug': 'ferrari-world-abu-dhabi', 'description': 'High-speed racing theme park with Ferrari experiences', 'image': 'https://images.unsplash.com/photo-1558618666-fcd25c85cd64?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Yas Marina Circuit', 'slug': 'yas-marina-circuit', 'description': 'F1 race track and entertainment complex', 'image': 'https://images.unsplash.com/photo-1558618666-fcd25c85cd64?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Abu Dhabi Corniche', 'slug': 'abu-dhabi-corniche', 'description': 'Scenic waterfront promenade with beaches and parks', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dubai Aquarium', 'slug': 'dubai-aquarium', 'description': 'Massive underwater aquarium with tunnel experience', 'image': 'https://images.unsplash.com/photo-1558618666-fcd25c85cd64?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Ski Dubai', 'slug': 'ski-dubai', 'description': 'Indoor ski resort in the desert with slopes and penguins', 'image': 'https://images.unsplash.com/photo-1551698618-1dfe5d97d256?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Atlantis The Palm', 'slug': 'atlantis-the-palm', 'description': 'Luxury resort with water park and marine attractions', 'image': 'https://images.unsplash.com/photo-1571003123894-1f0594d2b5d9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Wild Wadi Water Park', 'slug': 'wild-wadi-water-park', 'description': 'Adventure water park with thrilling slides and waves', 'image': 'https://images.unsplash.com/photo-1530549387789-4c1017266635?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dubai Zoo', 'slug': 'dubai-zoo', 'description': 'Modern zoo with diverse animal exhibits and conservation', 'image': 'https://images.unsplash.com/photo-1558618666-fcd25c85cd64?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Burj Al Arab Jumeirah', 'location': 'Dubai', 'rating': 4.9, 'price': 1200, 'image': 'https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Armani Hotel Dubai', 'location': 'Dubai', 'rating': 4.8, 'price': 450, 'image': 'https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Emirates Palace', 'location': 'Abu Dhabi', 'rating': 4.9, 'price': 580, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'tours': [
-                {'name': 'Dubai City Highlights Tour', 'duration': '8 hours', 'price': 95, 'rating': 4.8, 'image': 'https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Abu Dhabi Cultural Tour', 'duration': '6 hours', 'price': 85, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Desert Safari Experience', 'duration': '6 hours', 'price': 75, 'rating': 4.9, 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'lebanon': {
-            'name': 'Lebanon',
-            'description': 'A Mediterranean jewel known for its ancient history, vibrant culture, and stunning coastal beauty.',
-            'long_description': 'Lebanon, often called the "Paris of the Middle East," offers a fascinating blend of ancient Phoenician heritage and modern Mediterranean charm. From the historic ruins of Baalbek to the vibrant streets of Beirut, Lebanon provides an unforgettable journey through time and culture.',
-            'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': '/static/core/images/beautiful-view-pigeon-rocks-promenade-center-beirut-lebanon.jpg',
-            'accommodations_count': 234,
-            'tours_count': 350,
-            'attractions': [
-                {'name': 'Baalbek Temples', 'slug': 'baalbek-temples', 'description': 'City of the Sun Roman temples', 'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Byblos', 'slug': 'byblos', 'description': 'Oldest inhabited city ancient port', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Jeita Grotto', 'slug': 'jeita-grotto', 'description': 'Limestone caves New 7 Wonders finalist', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Cedars of God', 'slug': 'cedars-of-god', 'description': 'UNESCO ancient cedar forest', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Qadisha Valley', 'slug': 'qadisha-valley', 'description': 'UNESCO monasteries and hiking', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Pigeon Rocks Raouché', 'slug': 'pigeon-rocks-raouche', 'description': 'Natural offshore rock formations', 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Mohammad Al-Amin Mosque Beirut', 'slug': 'mohammad-al-amin-mosque-beirut', 'description': 'Blue Mosque Ottoman architecture', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Beirut Souks', 'slug': 'beirut-souks', 'description': '200+ shopping outlets', 'image': 'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'National Museum Beirut', 'slug': 'national-museum-beirut', 'description': '100,000 antiquities archaeology museum', 'image': 'https://images.unsplash.com/photo-1555529669-e69e7aa0ba9a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Our Lady of Lebanon Harissa', 'slug': 'our-lady-of-lebanon-harissa', 'description': 'Pilgrimage bronze sculpture', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Beirut Corniche', 'slug': 'beirut-corniche', 'description': '5km shoreline boardwalk', 'image': 'https://images.unsplash.com/photo-1556909114-f6e7ad7d3136?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Tyre', 'slug': 'tyre', 'description': 'Historic Phoenician city Roman Hippodrome', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Anjar', 'slug': 'anjar', 'description': 'Umayyad-era Islamic city', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'MIM Mineral Museum Beirut', 'slug': 'mim-mineral-museum-beirut', 'description': '2000 minerals 450 species', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Tripoli Citadel', 'slug': 'tripoli-citadel', 'description': 'Crusader castle old souks', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sidon Sea Castle', 'slug': 'sidon-sea-castle', 'description': 'Crusader fortress', 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Tannourine Cedars Reserve', 'slug': 'tannourine-cedars-reserve', 'description': 'Protected cedar forest', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Batroun', 'slug': 'batroun', 'description': 'Phoenician seaside town', 'image': 'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Four Seasons Hotel Beirut', 'location': 'Beirut', 'rating': 4.8, 'price': 350, 'image': 'https://images.unsplash.com/photo-1556909114-f6e7ad7d3136?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Le Gray Beirut', 'location': 'Beirut', 'rating': 4.7, 'price': 280, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'The Mayflower Hotel', 'location': 'Beirut', 'rating': 4.6, 'price': 220, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'}
-            ],
-            'tours': [
-                {'name': 'Beirut City Exploration', 'duration': '4 hours', 'price': 45, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1556909114-f6e7ad7d3136?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Baalbek and Anjar Day Trip', 'duration': '8 hours', 'price': 85, 'rating': 4.8, 'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Byblos and Jbeil Coastal Tour', 'duration': '6 hours', 'price': 65, 'rating': 4.6, 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'qatar': {
-            'name': 'Qatar',
-            'description': 'A modern Arabian nation blending rich heritage with world-class luxury and sporting excellence.',
-            'long_description': 'Qatar, a peninsula nation in the Arabian Gulf, represents the perfect fusion of ancient Bedouin traditions and modern architectural marvels. From the stunning Museum of Islamic Art in Doha to the spectacular venues that hosted the FIFA World Cup, Qatar offers an extraordinary cultural and sporting experience.',
-            'image': 'https://images.unsplash.com/photo-1539037116277-4db20889f2d4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': '/static/core/images/skyline-doha-city-center-qatar-middle-east.jpg',
-            'accommodations_count': 167,
-            'tours_count': 280,
-            'attractions': [
-                {'name': 'Doha', 'slug': 'doha', 'description': 'Modern capital with stunning Islamic architecture', 'image': 'https://images.unsplash.com/photo-1539037116277-4db20889f2d4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Museum of Islamic Art', 'slug': 'museum-of-islamic-art', 'description': 'World-class museum showcasing Islamic art and culture', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Souq Waqif', 'slug': 'souq-waqif', 'description': 'Traditional market with authentic Arabian atmosphere', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Katara Cultural Village', 'slug': 'katara-cultural-village', 'description': 'Cultural complex showcasing Qatari heritage', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Al Zubarah Fort', 'slug': 'al-zubarah-fort', 'description': '18th-century fort and UNESCO World Heritage Site', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'The Pearl-Qatar', 'slug': 'the-pearl-qatar', 'description': 'Luxury artificial island with marina, dining, and shopping', 'image': 'https://images.unsplash.com/photo-1512917774080-9991f1c4c750?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'National Museum of Qatar', 'slug': 'national-museum-qatar', 'description': 'Stunning museum designed by Jean Nouvel showcasing Qatar\'s history', 'image': 'https://images.unsplash.com/photo-1566073771259-6a8506099945?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Aspire Park', 'slug': 'aspire-park', 'description': 'Largest park in Doha with lake and Aspire Tower views', 'image': 'https://images.unsplash.com/photo-1584743704154-8f1e5e3e5b2f?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Inland Sea (Khor Al Adaid)', 'slug': 'inland-sea', 'description': 'Natural seawater inlet surrounded by desert dunes', 'image': 'https://images.unsplash.com/photo-1509023464722-18d996393ca8?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Lusail City', 'slug': 'lusail-city', 'description': 'Futuristic planned city and FIFA World Cup venue', 'image': 'https://images.unsplash.com/photo-1599586120429-48bb03e200c8?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': '974 Stadium', 'slug': '974-stadium', 'description': 'Unique stadium built from shipping containers', 'image': 'https://images.unsplash.com/photo-1577223625816-7546f15602c3?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Al Wakrah Beach', 'slug': 'al-wakrah-beach', 'description': 'Beautiful beach town with heritage village', 'image': 'https://images.unsplash.com/photo-1507525428034-b723cf961d3e?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Doha Corniche', 'slug': 'doha-corniche', 'description': 'Scenic waterfront promenade with stunning city views', 'image': 'https://images.unsplash.com/photo-1539017116277-4db20889f2d4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Villagio Mall', 'slug': 'villagio-mall', 'description': 'Venetian-themed shopping mall with indoor canal', 'image': 'https://images.unsplash.com/photo-1519567241046-7f570eee3ce6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Al Thakira Mangroves', 'slug': 'al-thakira-mangroves', 'description': 'Natural mangrove forest perfect for kayaking', 'image': 'https://images.unsplash.com/photo-1564760055775-d63b17a55c44?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Four Seasons Hotel Doha', 'location': 'Doha', 'rating': 4.9, 'price': 420, 'image': 'https://images.unsplash.com/photo-1539037116277-4db20889f2d4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Mandarin Oriental Doha', 'location': 'Doha', 'rating': 4.8, 'price': 380, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'The St. Regis Doha', 'location': 'Doha', 'rating': 4.7, 'price': 320, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'}
-            ],
-            'tours': [
-                {'name': 'Doha City Highlights Tour', 'duration': '6 hours', 'price': 75, 'rating': 4.8, 'image': 'https://images.unsplash.com/photo-1539037116277-4db20889f2d4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Desert Safari Adventure', 'duration': '8 hours', 'price': 120, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Cultural Heritage Tour', 'duration': '4 hours', 'price': 55, 'rating': 4.6, 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'saudi-arabia': {
-            'name': 'Saudi Arabia',
-            'description': 'The heart of Islam with ancient deserts, modern cities, and sacred pilgrimage sites.',
-            'long_description': 'Saudi Arabia, the birthplace of Islam and home to its holiest sites, offers a profound journey through ancient deserts and ultramodern cities. From the sacred mosques of Mecca and Medina to the futuristic developments of Riyadh and NEOM, Saudi Arabia represents the perfect blend of spiritual heritage and visionary innovation.',
-            'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': '/static/core/images/view-buildings-against-cloudy-sky.jpg',
-            'accommodations_count': 445,
-            'tours_count': 320,
-            'attractions': [
-                {'name': 'AlUla Hegra', 'slug': 'alula-hegra', 'description': 'UNESCO Nabataean tombs', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Masjid al-Haram Mecca', 'slug': 'masjid-al-haram-mecca', 'description': 'World\'s largest mosque with Kaaba', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Madinah Al-Masjid an-Nabawi', 'slug': 'madinah-al-masjid-an-nabawi', 'description': 'Second holiest site green dome', 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Masmak Fortress Riyadh', 'slug': 'masmak-fortress-riyadh', 'description': 'Mud brick birthplace of kingdom', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Kingdom Centre Tower Riyadh', 'slug': 'kingdom-centre-tower-riyadh', 'description': '99-floor skyscraper', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Edge of the World Riyadh', 'slug': 'edge-of-the-world-riyadh', 'description': 'Dramatic cliff escarpment', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Diriyah At-Turaif District', 'slug': 'diriyah-at-turaif-district', 'description': 'UNESCO first Saudi capital', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Al-Balad Jeddah', 'slug': 'al-balad-jeddah', 'description': 'UNESCO historic coral-stone buildings', 'image': 'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Jeddah Corniche', 'slug': 'jeddah-corniche', 'description': 'Red Sea palm-lined waterfront', 'image': 'https://images.unsplash.com/photo-1555529669-e69e7aa0ba9a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Al Ahsa Oasis', 'slug': 'al-ahsa-oasis', 'description': 'UNESCO world\'s largest oasis 30,000 acres', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Farasan Islands', 'slug': 'farasan-islands', 'description': 'Red Sea coral reefs diving', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Taif', 'slug': 'taif', 'description': 'Mountain city rose gardens', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Jabal Ikmah AlUla', 'slug': 'jabal-ikmah-alula', 'description': 'Open library rock inscriptions', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Nasseef House Jeddah', 'slug': 'nasseef-house-jeddah', 'description': '1872 museum cultural center', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Rijal Almaa', 'slug': 'rijal-almaa', 'description': 'Mountain village painted houses museum', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Dumat Al-Jandal', 'slug': 'dumat-al-jandal', 'description': 'Ancient fort and mosque', 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Ushaiger Heritage Village', 'slug': 'ushaiger-heritage-village', 'description': 'Mud brick Najdi architecture', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Red Sea Project', 'slug': 'red-sea-project', 'description': 'Luxury coastal resort development', 'image': 'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Abha', 'slug': 'abha', 'description': 'Asir region mountains and cable car', 'image': 'https://images.unsplash.com/photo-1555529669-e69e7aa0ba9a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'National Museum Riyadh', 'slug': 'national-museum-riyadh', 'description': 'Saudi history culture heritage', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Four Seasons Hotel Riyadh', 'location': 'Riyadh', 'rating': 4.9, 'price': 380, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'The Ritz-Carlton Riyadh', 'location': 'Riyadh', 'rating': 4.8, 'price': 350, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Shangri-La Hotel AlUla', 'location': 'AlUla', 'rating': 4.9, 'price': 420, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'tours': [
-                {'name': 'Riyadh Cultural Tour', 'duration': '6 hours', 'price': 85, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'AlUla Ancient Wonders Tour', 'duration': '8 hours', 'price': 120, 'rating': 4.9, 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Red Sea Coastal Adventure', 'duration': '10 hours', 'price': 150, 'rating': 4.8, 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'kuwait': {
-            'name': 'Kuwait',
-            'description': 'A modern Gulf state with rich cultural heritage, stunning desert landscapes, and warm hospitality.',
-            'long_description': 'Kuwait, a small but vibrant Gulf nation, offers a perfect blend of traditional Arabian culture and modern urban sophistication. From the magnificent Kuwait Towers to the pristine beaches along the Arabian Gulf, Kuwait provides an authentic Arabian experience with world-class museums and cultural sites.',
-            'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': '/static/core/images/drone-photo-kuwait-city-kuwait-tower-from-sky.jpg',
-            'accommodations_count': 123,
-            'tours_count': 180,
-            'attractions': [
-                {'name': 'Kuwait City', 'slug': 'kuwait-city', 'description': 'Modern capital with traditional souks and contemporary architecture', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Kuwait Towers', 'slug': 'kuwait-towers', 'description': 'Iconic water towers symbolizing Kuwait\'s modernity', 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Liberation Tower', 'slug': 'liberation-tower', 'description': 'Tallest structure in Kuwait with panoramic views', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Tareq Rajab Museum', 'slug': 'tareq-rajab-museum', 'description': 'Cultural museum showcasing Kuwaiti heritage', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Al Shaheed Park', 'slug': 'al-shaheed-park', 'description': 'Beautiful urban park with museums and botanical gardens', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Grand Mosque', 'slug': 'grand-mosque-kuwait', 'description': 'Kuwait\'s largest and official state mosque', 'image': 'https://images.unsplash.com/photo-1564769625905-50e93615e769?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Souk Al-Mubarakiya', 'slug': 'souk-al-mubarakiya', 'description': 'Historic traditional market over 200 years old', 'image': 'https://images.unsplash.com/photo-1598778893240-584b0e8b3b6d?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'The Avenues Mall', 'slug': 'the-avenues-mall', 'description': 'One of the largest shopping malls in the Middle East', 'image': 'https://images.unsplash.com/photo-1519567241046-7f570eee3ce6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Kuwait National Museum', 'slug': 'kuwait-national-museum', 'description': 'Premier cultural museum showcasing Kuwait\'s history', 'image': 'https://images.unsplash.com/photo-1565084888279-aca607ecce6c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Failaka Island', 'slug': 'failaka-island', 'description': 'Historic island with ancient ruins and beaches', 'image': 'https://images.unsplash.com/photo-1559827260-dc66d52bef19?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Scientific Center', 'slug': 'scientific-center-kuwait', 'description': 'Marine aquarium and IMAX theater complex', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Seif Palace', 'slug': 'seif-palace', 'description': 'Historic palace with distinctive blue-tiled watchtower', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'The Regency Hotel Kuwait', 'location': 'Kuwait City', 'rating': 4.7, 'price': 220, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Crowne Plaza Kuwait', 'location': 'Kuwait City', 'rating': 4.6, 'price': 180, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Marina Hotel Kuwait', 'location': 'Kuwait City', 'rating': 4.5, 'price': 150, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'tours': [
-                {'name': 'Kuwait City Sightseeing Tour', 'duration': '4 hours', 'price': 45, 'rating': 4.6, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Desert Safari Experience', 'duration': '6 hours', 'price': 85, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Cultural Heritage Tour', 'duration': '5 hours', 'price': 55, 'rating': 4.5, 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'bahrain': {
-            'name': 'Bahrain',
-            'description': 'An island kingdom blending ancient Dilmun civilization with modern Arabian Gulf culture.',
-            'long_description': 'Bahrain, the smallest Arab country, offers a fascinating journey through 5,000 years of civilization. From the ancient Bahrain Fort to the modern Bahrain World Trade Center, this island kingdom provides an authentic Arabian experience with pristine beaches, rich cultural heritage, and warm hospitality.',
-            'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': '/static/core/images/reflection-illuminated-buildings-water-against-bahrain-skyline.jpg',
-            'accommodations_count': 89,
-            'tours_count': 120,
-            'attractions': [
-                {'name': 'Manama', 'slug': 'manama', 'description': 'Vibrant capital with modern skyscrapers and traditional souks', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Bahrain Fort', 'slug': 'bahrain-fort', 'description': 'Ancient fort dating back to 2800 BC', 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Al Fateh Grand Mosque', 'slug': 'al-fateh-grand-mosque', 'description': 'Largest mosque in Bahrain with stunning architecture', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Tree of Life', 'slug': 'tree-of-life', 'description': 'Ancient tree in the desert, a natural wonder', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Bahrain National Museum', 'slug': 'bahrain-national-museum', 'description': 'Premier museum showcasing 6,000 years of Bahraini history', 'image': 'https://images.unsplash.com/photo-1566127444979-b3d2b3dbb224?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Bahrain World Trade Center', 'slug': 'bahrain-world-trade-center', 'description': 'Iconic twin towers with integrated wind turbines', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Bab Al Bahrain', 'slug': 'bab-al-bahrain', 'description': 'Historic gateway to the Manama Souq', 'image': 'https://images.unsplash.com/photo-1449844908441-8829872d2607?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Muharraq Pearling Path', 'slug': 'muharraq-pearling-path', 'description': 'UNESCO World Heritage Site showcasing pearling heritage', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Al Areen Wildlife Park', 'slug': 'al-areen-wildlife-park', 'description': 'Nature reserve with Arabian wildlife and botanical gardens', 'image': 'https://images.unsplash.com/photo-1564760055775-d63b17a55c44?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Qal\'at al-Bahrain Museum', 'slug': 'qalat-al-bahrain-museum', 'description': 'Museum at the ancient Dilmun civilization site', 'image': 'https://images.unsplash.com/photo-1566127444979-b3d2b3dbb224?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Adhari Park', 'slug': 'adhari-park', 'description': 'Family entertainment park with rides and attractions', 'image': 'https://images.unsplash.com/photo-1575550959106-5a7defe28b56?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'The Lost Paradise of Dilmun', 'slug': 'lost-paradise-dilmun', 'description': 'Largest water park in Bahrain with Arabian-themed attractions', 'image': 'https://images.unsplash.com/photo-1561679337-1beec43c91fc?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Four Seasons Hotel Bahrain Bay', 'location': 'Manama', 'rating': 4.8, 'price': 320, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'The Ritz-Carlton Bahrain', 'location': 'Manama', 'rating': 4.7, 'price': 280, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Gulf Hotel Bahrain', 'location': 'Manama', 'rating': 4.5, 'price': 180, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'tours': [
-                {'name': 'Manama City Tour', 'duration': '4 hours', 'price': 45, 'rating': 4.6, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Historical Bahrain Tour', 'duration': '6 hours', 'price': 65, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Desert and Coastal Adventure', 'duration': '8 hours', 'price': 95, 'rating': 4.8, 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'oman': {
-            'name': 'Oman',
-            'description': 'An Arabian paradise of stunning deserts, turquoise coasts, and ancient fortresses.',
-            'long_description': 'Oman, a land of dramatic landscapes and rich maritime heritage, offers an extraordinary Arabian experience. From the rugged Hajar Mountains to the pristine beaches of the Arabian Sea, Oman combines ancient forts and traditional souks with modern luxury resorts and warm Omani hospitality.',
-            'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': '/static/core/images/historical-casbah-taourirt-ouarzazate-morocco-with-white.jpg',
-            'accommodations_count': 156,
-            'tours_count': 250,
-            'attractions': [
-                {'name': 'Muscat', 'slug': 'muscat', 'description': 'Beautiful capital with white-washed buildings and harbor', 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sultan Qaboos Grand Mosque', 'slug': 'sultan-qaboos-grand-mosque', 'description': 'Magnificent mosque with world\'s second largest Persian carpet', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Nizwa Fort', 'slug': 'nizwa-fort', 'description': 'Impressive 17th-century fort with circular towers', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Wahiba Sands', 'slug': 'wahiba-sands', 'description': 'Spectacular desert with red dunes and Bedouin camps', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Jebel Shams', 'slug': 'jebel-shams', 'description': 'Highest mountain in Oman with breathtaking views', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Wadi Shab', 'slug': 'wadi-shab', 'description': 'Stunning canyon with turquoise pools and waterfalls', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Mutrah Souq', 'slug': 'mutrah-souq', 'description': 'Traditional Arabian market with frankincense and spices', 'image': 'https://images.unsplash.com/photo-1449844908441-8829872d2607?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Bahla Fort', 'slug': 'bahla-fort', 'description': 'UNESCO World Heritage Site, Oman\'s largest fort', 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Sur', 'slug': 'sur', 'description': 'Coastal town famous for traditional dhow building', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Jabal Akhdar', 'slug': 'jabal-akhdar', 'description': 'Green Mountain with terraced rose gardens and villages', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Ras Al Jinz', 'slug': 'ras-al-jinz', 'description': 'Turtle reserve with nesting green turtles', 'image': 'https://images.unsplash.com/photo-1564760055775-d63b17a55c44?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Royal Opera House Muscat', 'slug': 'royal-opera-house-muscat', 'description': 'Premier venue for musical arts and culture', 'image': 'https://images.unsplash.com/photo-1566127444979-b3d2b3dbb224?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'The Chedi Muscat', 'location': 'Muscat', 'rating': 4.9, 'price': 380, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Al Bustan Palace', 'location': 'Muscat', 'rating': 4.8, 'price': 420, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Anantara Al Jabal Al Akhdar Resort', 'location': 'Jabal Akhdar', 'rating': 4.7, 'price': 280, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'tours': [
-                {'name': 'Muscat City and Forts Tour', 'duration': '6 hours', 'price': 75, 'rating': 4.8, 'image': 'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Desert Safari Adventure', 'duration': '8 hours', 'price': 120, 'rating': 4.9, 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Mountain and Coastal Exploration', 'duration': '10 hours', 'price': 150, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'syria': {
-            'name': 'Syria',
-            'description': 'Ancient land of civilization with rich history, stunning architecture, and Mediterranean charm.',
-            'long_description': 'Syria, the cradle of civilization, offers an extraordinary journey through thousands of years of human history. From the ancient city of Damascus to the stunning Crusader castles, Syria represents the perfect blend of Mediterranean culture, Islamic architecture, and archaeological wonders.',
-            'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': '/static/core/images/building-with-clock-front-cloudy-sky-background.jpg',
-            'accommodations_count': 89,
-            'tours_count': 150,
-            'attractions': [
-                {'name': 'Damascus', 'slug': 'damascus', 'description': 'World\'s oldest continuously inhabited capital city', 'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Umayyad Mosque Damascus', 'slug': 'umayyad-mosque', 'description': 'One of largest and oldest mosques in world', 'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Palmyra', 'slug': 'palmyra', 'description': 'Ancient oasis city UNESCO World Heritage', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Krak des Chevaliers', 'slug': 'krak-des-chevaliers', 'description': 'Best-preserved Crusader castle UNESCO site', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Aleppo Citadel', 'slug': 'aleppo-citadel', 'description': 'Massive medieval fortress UNESCO site', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Bosra', 'slug': 'bosra', 'description': 'Ancient Roman theater and Nabatean city', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Apamea', 'slug': 'apamea', 'description': 'Greco-Roman archaeological site with colonnaded street', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Saydnaya', 'slug': 'saydnaya', 'description': 'Ancient Christian monastery town', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Maaloula', 'slug': 'maaloula', 'description': 'Village where Aramaic still spoken', 'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Saladin Castle', 'slug': 'saladin-castle', 'description': 'Mountain fortress UNESCO World Heritage', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Tartus', 'slug': 'tartus', 'description': 'Mediterranean coastal city with Crusader heritage', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Latakia', 'slug': 'latakia', 'description': 'Major port city and Mediterranean resort', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Four Seasons Hotel Damascus', 'location': 'Damascus', 'rating': 4.6, 'price': 220, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sham Palace Hotel', 'location': 'Damascus', 'rating': 4.4, 'price': 150, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Dedeman Damascus Hotel', 'location': 'Damascus', 'rating': 4.3, 'price': 120, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'tours': [
-                {'name': 'Damascus Old City Tour', 'duration': '4 hours', 'price': 35, 'rating': 4.5, 'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Palmyra and Krak des Chevaliers', 'duration': '10 hours', 'price': 85, 'rating': 4.7, 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Aleppo Cultural Heritage Tour', 'duration': '6 hours', 'price': 55, 'rating': 4.4, 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'iraq': {
-            'name': 'Iraq',
-            'description': 'Land of ancient Mesopotamia with rich history, archaeological treasures, and cultural heritage.',
-            'long_description': 'Iraq, the birthplace of civilization, offers an unparalleled journey through the cradle of human history. From the ancient ziggurats of Mesopotamia to the magnificent mosques of Baghdad, Iraq represents thousands of years of cultural and scientific achievements that shaped the modern world.',
-            'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': '/static/core/images/vertical-historical-al-rabi-tower-against-blue-cloudy-sky-united-arab-emirates.jpg',
-            'accommodations_count': 67,
-            'tours_count': 100,
-            'attractions': [
-                {'name': 'Baghdad', 'slug': 'baghdad', 'description': 'Capital city on Tigris River, center of Islamic Golden Age', 'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Babylon', 'slug': 'babylon', 'description': 'Ancient Mesopotamian city Hanging Gardens site', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Karbala', 'slug': 'karbala', 'description': 'Holy city with Imam Hussein Shrine pilgrimage', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Najaf', 'slug': 'najaf', 'description': 'Sacred city with Imam Ali Shrine pilgrimage', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Erbil Citadel', 'slug': 'erbil-citadel', 'description': 'Oldest continuously inhabited settlement UNESCO site', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Ur Ziggurat', 'slug': 'ur-ziggurat', 'description': 'Ancient Sumerian ziggurat temple birthplace of Abraham', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Hatra', 'slug': 'hatra', 'description': 'Parthian city ruins UNESCO World Heritage', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Samarra', 'slug': 'samarra', 'description': 'Historic city with spiral Great Mosque minaret', 'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Ctesiphon', 'slug': 'ctesiphon', 'description': 'Ancient Persian capital with Taq Kasra arch', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Basra', 'slug': 'basra', 'description': 'Southern port city on Shatt al-Arab waterway', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Sulaymaniyah', 'slug': 'sulaymaniyah', 'description': 'Kurdish cultural capital with museums and bazaars', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Marshlands', 'slug': 'mesopotamian-marshes', 'description': 'Ancient wetlands UNESCO World Heritage', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Palestine Hotel Baghdad', 'location': 'Baghdad', 'rating': 4.2, 'price': 120, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Erbil Rotana Hotel', 'location': 'Erbil', 'rating': 4.4, 'price': 150, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Karbala Meridien Hotel', 'location': 'Karbala', 'rating': 4.1, 'price': 100, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'tours': [
-                {'name': 'Baghdad Historical Tour', 'duration': '4 hours', 'price': 35, 'rating': 4.3, 'image': 'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Mesopotamia Ancient Sites Tour', 'duration': '8 hours', 'price': 75, 'rating': 4.5, 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Kurdish Cultural Experience', 'duration': '6 hours', 'price': 55, 'rating': 4.4, 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        },
-        'yemen': {
-            'name': 'Yemen',
-            'description': 'Ancient land of spices, towering mountains, and rich cultural heritage.',
-            'long_description': 'Yemen, the land of the Queen of Sheba, offers an extraordinary journey through ancient history and stunning landscapes. From the towering mud-brick skyscrapers of Sana\'a to the pristine Socotra islands, Yemen represents a unique blend of Arabian culture, ancient architecture, and natural wonders.',
-            'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-            'hero_image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80',
-            'accommodations_count': 45,
-            'tours_count': 80,
-            'attractions': [
-                {'name': 'Sana\'a', 'description': 'Ancient capital with unique mud-brick architecture', 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Socotra Island', 'slug': 'socotra-island', 'description': 'Unique island with dragon\'s blood trees and biodiversity', 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Zabid', 'slug': 'zabid', 'description': 'Historic city and UNESCO World Heritage Site', 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Shibam', 'slug': 'shibam', 'description': 'Manhattan of the desert with mud skyscrapers', 'image': 'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Aden', 'slug': 'aden', 'description': 'Port city with volcanic crater and British colonial history', 'image': 'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'accommodations': [
-                {'name': 'Moevenpick Hotel Sana\'a', 'location': 'Sana\'a', 'rating': 4.3, 'price': 140, 'image': 'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Hilton Aden Resort', 'location': 'Aden', 'rating': 4.2, 'price': 120, 'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'},
-                {'name': 'Socotra Hotel', 'location': 'Socotra', 'rating': 3.8, 'price': 80, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ],
-            'tours': [
-                {'name': 'Sana\'a Old City Walking Tour', 'duration': '3 hours', 'price': 25, 'rating': 4.2, 'image': 'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Socotra Island Adventure', 'duration': '5 days', 'price': 450, 'rating': 4.6, 'image': 'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'},
-                {'name': 'Wadi Hadramaut Exploration', 'duration': '4 hours', 'price': 45, 'rating': 4.1, 'image': 'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'}
-            ]
-        }
-    }
\ No newline at end of file
@@ -1,8529 +0,0 @@
-# Auto-generated from views.py
-demo_attractions = {
-        'jordan': {
-            'petra': {
-                'id': 'petra',
-                'name': 'Petra',
-                'location': 'Ma\'an Governorate, Jordan',
-                'description': 'Ancient rock-cut city and UNESCO World Heritage Site, famous for its stunning architecture carved into rose-red sandstone cliffs.',
-                'long_description': 'Petra, often called the "Rose City" due to the color of the stone from which it is carved, is one of the world\'s most famous archaeological sites and a UNESCO World Heritage Site. This ancient Nabataean city, hidden in the rugged mountains of southern Jordan, features spectacular rock-cut architecture and water conduit systems that are engineering marvels of the ancient world.',
-                'historical_significance': 'Petra was established as the capital of the Nabataean Kingdom around the 4th century BCE. The Nabataeans were Arab traders who controlled the spice routes between Arabia, Egypt, Syria, and the Mediterranean. They developed sophisticated water management systems and carved elaborate tombs and temples directly into the sandstone cliffs. The city flourished for centuries, reaching its peak in the 1st century CE with a population of around 20,000-30,000 people.',
-                'discovery': 'Petra remained largely unknown to the Western world until 1812 when it was rediscovered by Swiss explorer Johann Ludwig Burckhardt. He was told about the site by local Bedouins and entered the city disguised as an Arab pilgrim. The site became famous worldwide after being featured in films like "Indiana Jones and the Last Crusade."',
-                'architecture': 'Petra\'s most famous structure is the Treasury (Al-Khazneh), a magnificent facade carved into the rock that served as a tomb for Nabataean kings. Other notable sites include the Monastery (Ad Deir), the largest rock-cut monument in Petra; the Royal Tombs, elaborate burial chambers for the Nabataean elite; and the Great Temple, a complex of buildings that served as the city\'s main religious center.',
-                'water_system': 'One of Petra\'s most remarkable achievements was its sophisticated water management system. The Nabataeans built dams, cisterns, and channels to capture and store rainwater from the surrounding mountains. This allowed the city to thrive in the arid desert environment and support its large population.',
-                'cultural_impact': 'Petra has been designated a UNESCO World Heritage Site and is considered one of the New Seven Wonders of the World. It attracts over 1 million visitors annually and has been featured in numerous films, books, and works of art. The site continues to be an active area of archaeological research.',
-                'best_time_to_visit': 'The best time to visit Petra is during the cooler months from March to May or September to November. Summer temperatures can exceed 40°C (104°F), making exploration difficult. Winter months are mild but can be rainy.',
-                'how_to_get_there': 'Petra is located about 240 km (150 miles) south of Amman. Most visitors arrive by organized tour bus, taxi, or rental car. The journey takes about 3-4 hours by road. There are also domestic flights from Amman to Ma\'an Airport, about 120 km from Petra.',
-                'entrance_fees': 'Entrance fees for foreigners are approximately 50 JOD (about $70 USD) for a one-day pass, or 55 JOD for a two-day pass. Jordanian citizens and residents of Arab countries pay reduced rates. Children under 12 enter free.',
-                'opening_hours': 'Petra opens at 6:00 AM year-round. Closing times vary by season: 6:00 PM in summer (April 15-October 15) and 4:00 PM in winter (October 16-April 14).',
-                'what_to_wear': 'Comfortable walking shoes are essential as there is a lot of walking on uneven terrain. Wear light, breathable clothing in summer and layers in cooler months. Bring a hat, sunglasses, and sunscreen. Modest clothing is recommended when visiting religious sites.',
-                'health_safety': 'Stay hydrated, especially in summer. The site has medical facilities and first aid stations. Some areas involve climbing stairs or uneven terrain, so visitors with mobility issues should check accessibility. Horse and donkey rides are available but should be approached with caution.',
-                'guided_tours': 'Guided tours are highly recommended to fully appreciate Petra\'s history and significance. Official guides are available at the entrance and provide detailed explanations of the sites. Audio guides are also available in multiple languages.',
-                'nearby_attractions': 'Nearby attractions include Little Petra (Siq al-Barid), a smaller Nabataean site; Wadi Rum desert; and the Dead Sea. Many visitors combine Petra with these sites in multi-day tours.',
-                'conservation': 'Petra faces challenges from weathering, tourism, and development. UNESCO and the Jordanian government have implemented conservation programs to protect the site. Visitors are asked to stay on marked paths and not climb on the monuments.',
-                'facts': [
-                    'Petra is mentioned in the Bible as the place where Moses struck a rock to bring forth water',
-                    'The city was an important trading hub for frankincense, myrrh, and spices',
-                    'Petra\'s water system could supply the city for several months during dry periods',
-                    'The Treasury facade is 30 meters high and 25 meters wide',
-                    'Petra was occupied for over 1,000 years before being largely abandoned',
-                    'The site covers an area of about 264 square kilometers',
-                    'Petra receives over 1 million visitors annually',
-                    'The Monastery is located 800 steps up a mountain and offers panoramic views'
-                ],
-                'key_sites': [
-                    {
-                        'name': 'The Treasury (Al-Khazneh)',
-                        'description': 'The most famous monument in Petra, a magnificent rock-cut tomb with intricate carvings and a mysterious urn on top.',
-                        'significance': 'Built around 100 CE as a tomb for Nabataean kings. The urn was believed to contain treasure, hence the name "Treasury."'
-                    },
-                    {
-                        'name': 'The Monastery (Ad Deir)',
-                        'description': 'The largest rock-cut monument in Petra, measuring 50 meters wide and 45 meters high.',
-                        'significance': 'Located high on a mountain, it served as a religious center. The name "Monastery" was given by Bedouins who used it as a hermitage.'
-                    },
-                    {
-                        'name': 'The Royal Tombs',
-                        'description': 'Elaborate burial chambers carved into the cliffs, including the Urn Tomb, Silk Tomb, and Corinthian Tomb.',
-                        'significance': 'These tombs demonstrate the Nabataeans\' advanced architectural skills and their reverence for their rulers.'
-                    },
-                    {
-                        'name': 'The Great Temple',
-                        'description': 'A complex of buildings that served as Petra\'s main religious and civic center.',
-                        'significance': 'Features colonnaded courtyards, temples, and administrative buildings, showing the city\'s urban sophistication.'
-                    },
-                    {
-                        'name': 'The Siq',
-                        'description': 'A narrow canyon, 1.2 km long, that serves as the main entrance to Petra.',
-                        'significance': 'This natural gorge was enhanced by the Nabataeans with water channels and carvings. It creates dramatic anticipation before revealing the Treasury.'
-                    }
-                ],
-                'visitor_tips': [
-                    'Start early in the morning to avoid crowds and heat',
-                    'Bring plenty of water and snacks',
-                    'Consider a guided tour for deeper understanding',
-                    'Horse or donkey rides are available but walking is recommended for the full experience',
-                    'Allow at least 4-6 hours to explore the main sites',
-                    'Purchase tickets online in advance during peak season',
-                    'Respect the site by not climbing on monuments or removing artifacts'
-                ],
-                'image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80',
-                'hero_image': 'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80',
-                'photos': [
-                    'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80',
-                    'https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1522708323590-d24dbb6b0267?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1570077188670-e3a8d69ac5ff?ixlib=rb-4.0.3&auto=format&fit=crop&w=2069&q=80',
-                    'https://images.unsplash.com/photo-1613395877344-13d4a8e0d49e?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '30.3285° N, 35.4444° E',
-                'unesco_status': 'UNESCO World Heritage Site since 1985',
-                'area': '264 square kilometers',
-                'peak_population': '20,000-30,000 (1st century CE)',
-                'annual_visitors': 'Over 1 million',
-                'entrance_fee': '50 JOD (approx. $70 USD) for one day',
-                'best_time': 'March-May or September-November',
-                'climate': 'Desert climate with hot summers and mild winters'
-            },
-            'wadi-rum': {
-                'id': 'wadi-rum',
-                'name': 'Wadi Rum',
-                'location': 'Aqaba Governorate, Jordan',
-                'description': 'Desert wilderness also known as the Valley of the Moon, featuring dramatic sandstone mountains and vast red sand dunes.',
-                'long_description': 'Wadi Rum, also known as the Valley of the Moon, is a valley cut into sandstone and granite rock in southern Jordan. With an area of 720 km², it is the largest wadi in Jordan. The desert landscape stretches into the horizon, with red sandy terrain punctuated by fantastic rock formations, craggy mountains and narrow canyons. Gargantuan rock formations, rippled sand dunes, and clear night skies create an almost fairy-tale setting across an unpopulated area the size of New York City.',
-                'historical_significance': 'Various human cultures have inhabited Wadi Rum since prehistoric times, with many cultures–including the Nabataeans–leaving their mark in the form of petroglyphs, inscriptions, and temple ruins. The area was part of the Kingdom of Edom between the 13th and 6th centuries BCE. The Nabateans reigned for about 500 years (400 BCE - 106 CE) in Arabia until they were annexed by the Romans in 106 CE.',
-                'discovery': 'The vast desert expanse of Wadi Rum became a pivotal backdrop for Lawrence\'s wartime activities, when in 1917 he was tasked with supporting the Arab Revolt against Ottoman rule. Wadi Rum was one of the theatres of the revolt, as Prince Faisal and British officer T.E. Lawrence recruited Bedouin tribes to join and fight the Ottomans.',
-                'cultural_impact': 'Desert scenes of Wadi Rum in Lawrence of Arabia from 1962 kick-started Jordan\'s tourism industry. The Wadi Rum Protected Area has been a UNESCO World Heritage site since 2011. Today, Wadi Rum is one of Jordan\'s most popular tourist sites, attracting 162,000 tourists in 2017.',
-                'entrance_fees': 'Entry to the Wadi Rum Protected Area costs 5 JOD (about $7 USD) for foreigners. Visitors with Jordan Pass enter free.',
-                'opening_hours': 'The protected area is open 24/7, but visitor center hours are 8:00 AM to 4:00 PM',
-                'best_time': 'October to April for mild temperatures',
-                'how_to_get_there': 'Wadi Rum is about 60 km east of Aqaba and 320 km south of Amman. Most visitors arrive by organized tour, rental car, or taxi from Aqaba or Petra.',
-                'what_to_wear': 'Light, breathable clothing in layers. Bring warm clothes for evenings as desert temperatures drop significantly at night. Comfortable walking shoes and sandals.',
-                'guided_tours': 'Bedouin guides offer jeep tours, camel rides, and overnight camping experiences. Most tours depart from Wadi Rum village.',
-                'nearby_attractions': 'Petra (120 km north), Aqaba Red Sea coast (60 km west), and the Desert Highway connecting to the Dead Sea.',
-                'facts': [
-                    'The geological features include massive mesas that pop straight up from the sea of sand',
-                    'The area is colored red by iron oxide, making it the "reddest" part of Jordan',
-                    'Lawrence of Arabia used Wadi Rum as his base during the Arab Revolt',
-                    'The village was only established around 1980; before this, locals lived nomadically',
-                    'Wadi Rum has been featured in films like The Martian, Star Wars, and Dune',
-                    'The Nabateans built a dam and temple ruins that can still be seen today'
-                ],
-                'key_sites': [
-                    {'name': 'Seven Pillars of Wisdom', 'slug': 'seven-pillars-of-wisdom', 'description': 'A massive rock formation named after T.E. Lawrence\'s book', 'significance': 'One of the most iconic landmarks in Wadi Rum'},
-                    {'name': 'Lawrence\'s Spring', 'description': 'A natural spring with Nabataean inscriptions and a water tank', 'significance': 'Named after T.E. Lawrence who reportedly bathed here'},
-                    {'name': 'Khazali Canyon', 'slug': 'khazali-canyon', 'description': 'A narrow siq with ancient petroglyphs and inscriptions', 'significance': 'Contains 4,000-year-old rock art depicting humans and animals'},
-                    {'name': 'Umm Fruth Rock Bridge', 'slug': 'umm-fruth-rock-bridge', 'description': 'A natural rock bridge arch formation', 'significance': 'Popular for climbing and photography'}
-                ],
-                'visitor_tips': [
-                    'Stay overnight in a Bedouin camp for the full desert experience',
-                    'Book jeep tours in advance during peak season',
-                    'Bring cash as most camps don\'t accept cards',
-                    'Watch the sunset and sunrise for spectacular desert colors',
-                    'Stargazing at night is phenomenal due to no light pollution'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '29.5753° N, 35.4207° E',
-                'unesco_status': 'UNESCO World Heritage Site since 2011',
-                'area': '720 square kilometers',
-                'annual_visitors': '162,000 (2017)',
-                'climate': 'Desert climate with extreme temperature variations between day and night'
-            },
-            'dead-sea': {
-                'id': 'dead-sea',
-                'name': 'Dead Sea',
-                'location': 'Jordan-Israel Border',
-                'description': 'The lowest point on Earth at 439 meters below sea level, famous for its extremely salty waters and therapeutic mud.',
-                'long_description': 'The Dead Sea is a landlocked salt lake bordered by Jordan to the east and Israel to the west. As of 2025, its surface is 439.78 meters below sea level, making its shores the lowest land-based elevation on Earth. With a salinity of 342 g/kg, or 34.2%, it is one of the world\'s saltiest bodies of water, 9.6 times as salty as the ocean. This extreme salinity creates buoyancy that allows people to float effortlessly on the water\'s surface.',
-                'historical_significance': 'The Dead Sea has been a place of refuge and health resort since ancient times. It is mentioned in the Bible and was one of the world\'s first health resorts for Herod the Great. The ancient Egyptians used salts from the Dead Sea for mummification.',
-                'facts': [
-                    'The Dead Sea is 304 meters deep, the deepest hypersaline lake in the world',
-                    'Its main tributary is the Jordan River',
-                    'The water level drops by about 1 meter annually',
-                    'The surface area has shrunk from 1,050 km² in 1930 to 605 km² today',
-                    'The high salt content means no fish or aquatic life can survive',
-                    'The mineral-rich mud has therapeutic properties for skin conditions'
-                ],
-                'entrance_fees': 'Access through various beach resorts ranges from 15-30 JOD. Public beaches may be free or charge minimal fees.',
-                'opening_hours': 'Beach resorts typically open 8:00 AM to 6:00 PM',
-                'best_time': 'March-May and September-November for moderate temperatures',
-                'how_to_get_there': 'The Dead Sea is about 50 km from Amman, accessible by car or organized tour. Many hotels offer shuttle services.',
-                'what_to_wear': 'Swimwear and waterproof sandals. Avoid shaving before visiting as salt water stings cuts.',
-                'health_safety': 'Do not stay in the water for more than 15-20 minutes. Avoid getting water in eyes or mouth. Shower immediately after. Not recommended for people with open wounds or certain health conditions.',
-                'guided_tours': 'Most visits are independent, but tours from Amman often combine the Dead Sea with other sites like Mount Nebo or Bethany.',
-                'nearby_attractions': 'Mount Nebo (30 km), Bethany Beyond the Jordan (40 km), and Madaba (40 km).',
-                'conservation': 'The Dead Sea is receding at an alarming rate due to water diversion from the Jordan River. The Red Sea-Dead Sea Water Conveyance project aims to help stabilize water levels.',
-                'visitor_tips': [
-                    'Float on your back and avoid splashing',
-                    'Apply mineral mud for therapeutic benefits',
-                    'Bring flip-flops as the salt deposits can be sharp',
-                    'Don\'t shave 24 hours before visiting',
-                    'Bring fresh water to rinse eyes in case of splashing',
-                    'Visit early morning or late afternoon to avoid midday heat'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.5° N, 35.5° E',
-                'area': '605 square kilometers (currently)',
-                'climate': 'Hot desert climate, year-round warm temperatures'
-            },
-            'jerash': {
-                'id': 'jerash',
-                'name': 'Jerash',
-                'location': 'Jerash Governorate, Jordan',
-                'description': 'One of the best-preserved Roman provincial towns in the world, known as the "Pompeii of the Middle East".',
-                'long_description': 'The ruined city of Jerash is Jordan\'s largest and most interesting Roman site. The city\'s golden age came under Roman rule, during which time it was known as Gerasa. The site is now generally acknowledged to be one of the best-preserved Roman provincial towns in the world. The ancient city boasts an unbroken chain of human occupation dating back more than 6,500 years.',
-                'historical_significance': 'Jerash was inhabited since the 4th century BC and abandoned after an earthquake in 749 AD. Its imposing ceremonial gates, colonnaded avenues, temples and theatres all speak to the time when this was an important imperial centre. The city was part of the Decapolis, a league of ten cities in the eastern Roman Empire.',
-                'architecture': 'The site includes several remarkable structures: the Oval Forum with 56 Ionic columns, the Cardo Maximus stretching 800m, Hadrian\'s Arch built in 129 AD, the South Theatre with capacity for 5,000 spectators, and the massive hippodrome that could seat 15,000 spectators.',
-                'facts': [
-                    'The Oval Forum is unusual for its shape: 90m long and 80m wide',
-                    'The Cardo Maximus is still paved with original stones rutted by ancient chariots',
-                    'Hadrian\'s Arch was built to commemorate Emperor Hadrian\'s visit in 129 AD',
-                    'The Nymphaeum fountain was constructed in 191 AD with water cascading through lion\'s heads',
-                    'Walking at leisure takes a minimum of 3-4 hours to see the main ruins',
-                    'Jerash is the second-most popular tourist attraction in Jordan after Petra'
-                ],
-                'key_sites': [
-                    {'name': 'Oval Forum', 'slug': 'oval-forum', 'description': 'Unique oval-shaped plaza surrounded by 56 Ionic columns', 'significance': 'Links the cardo maximus with the Temple of Zeus'},
-                    {'name': 'Cardo Maximus', 'slug': 'cardo-maximus', 'description': '800-meter colonnaded street with original paving stones', 'significance': 'The city\'s main thoroughfare showing ancient urban planning'},
-                    {'name': 'Hadrian\'s Arch', 'description': 'Splendid triumphal arch at the southern entrance', 'significance': 'Built to honor Emperor Hadrian\'s visit in 129 AD'},
-                    {'name': 'South Theatre', 'slug': 'south-theatre', 'description': '1st-century theatre with 5,000-seat capacity', 'significance': 'Still used for performances during the Jerash Festival'},
-                    {'name': 'Nymphaeum', 'slug': 'nymphaeum', 'description': 'Ornamental fountain from 191 AD', 'significance': 'Dedicated to the Nymphs with elaborate marble and plaster decoration'}
-                ],
-                'entrance_fees': '10 JOD (about $14 USD) for foreigners. Free with Jordan Pass.',
-                'opening_hours': 'Summer (Apr-Oct): 8:00 AM to 7:00 PM; Winter (Nov-Mar): 8:00 AM to 4:00 PM',
-                'best_time': 'Spring (March-May) or fall (September-November) for pleasant weather',
-                'how_to_get_there': 'Jerash is 50 km north of Amman, accessible by rental car, taxi, or organized tour. The journey takes about 1 hour.',
-                'what_to_wear': 'Comfortable walking shoes, hat, sunglasses. Modest clothing recommended.',
-                'guided_tours': 'Official guides available at the entrance provide detailed historical explanations. Audio guides available in multiple languages.',
-                'nearby_attractions': 'Ajloun Castle (30 km west), Umm Qais (50 km north), and Amman (50 km south).',
-                'conservation': 'UNESCO and Jordanian authorities work to preserve the site. The Jerash Festival of Culture and Arts is held annually in July.',
-                'visitor_tips': [
-                    'Visit early morning to avoid crowds and heat',
-                    'Allow at least 3-4 hours to explore properly',
-                    'Bring water and snacks as there are limited facilities inside',
-                    'The Roman Army and Chariot Experience show is worth seeing',
-                    'Visit during the Jerash Festival in July for cultural performances'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '32.2811° N, 35.8911° E',
-                'annual_visitors': 'Over 250,000',
-                'climate': 'Mediterranean climate with hot summers and mild winters'
-            },
-            'mount-nebo': {
-                'id': 'mount-nebo',
-                'name': 'Mount Nebo',
-                'location': 'Madaba Governorate, Jordan',
-                'description': 'Sacred biblical site where Moses viewed the Promised Land before his death, offering panoramic views of the Holy Land.',
-                'long_description': 'Mount Nebo is an elevated ridge approximately 700 meters above sea level, part of the Abarim mountain range. According to the Bible, Moses ascended Mount Nebo in the land of Moab and from there he saw the Land of Canaan, which God had said he would not enter. Moses then died there and the Bible says his burial place was unknown.',
-                'historical_significance': 'The church was first constructed in the second half of the 4th century to commemorate the place of Moses\' death. On the highest point of the mountain, Syagha, the remains of a Byzantine church and monastery were discovered in 1933. It has been a pilgrimage site for many people and is a sacred location for three major religions.',
-                'facts': [
-                    'The view from the summit provides a panorama across the Jordan River valley',
-                    'On clear days, Jerusalem is visible from the summit',
-                    'The city of Jericho is usually visible from the top',
-                    'Pope John Paul II visited on March 20, 2000, and planted an olive tree',
-                    'The olive tree planted by the Pope symbolizes peace',
-                    'A serpentine cross sculpture stands outside, symbolizing Moses\' bronze serpent and Jesus\' crucifixion'
-                ],
-                'key_sites': [
-                    {'name': 'Byzantine Church', 'slug': 'byzantine-church', 'description': 'Ruins of a 4th-century church with beautiful mosaics', 'significance': 'Built to commemorate Moses\' death, contains some of the finest Byzantine mosaics'},
-                    {'name': 'Memorial Church of Moses', 'slug': 'memorial-church-of-moses', 'description': 'Modern church built over the original Byzantine structure', 'significance': 'Active place of worship and pilgrimage'},
-                    {'name': 'Brazen Serpent Monument', 'slug': 'brazen-serpent-monument', 'description': 'Serpentine cross sculpture by Giovanni Fantoni', 'significance': 'Symbolizes Moses\' bronze serpent and Christ\'s crucifixion'},
-                    {'name': 'Pope\'s Olive Tree', 'description': 'Olive tree planted by Pope John Paul II in 2000', 'significance': 'Symbol of peace planted during papal visit'}
-                ],
-                'entrance_fees': '2 JOD (about $3 USD). Free with Jordan Pass.',
-                'opening_hours': 'Summer: 8:00 AM to 6:00 PM; Winter: 8:00 AM to 4:00 PM',
-                'best_time': 'Early morning for clearest views and cooler temperatures',
-                'how_to_get_there': 'Mount Nebo is 10 km from Madaba and 40 km from Amman. Accessible by car or organized tour.',
-                'what_to_wear': 'Comfortable shoes for walking. Modest clothing required as it\'s a religious site.',
-                'guided_tours': 'Guides available on-site. Many tours combine Mount Nebo with Madaba and the Dead Sea.',
-                'nearby_attractions': 'Madaba with its famous mosaic map (10 km), Dead Sea (30 km), and Bethany Beyond the Jordan (35 km).',
-                'visitor_tips': [
-                    'Visit on a clear day for the best views',
-                    'Combine with a visit to Madaba\'s mosaic churches',
-                    'Respect the religious significance of the site',
-                    'The gift shop supports the local Franciscan community',
-                    'Allow 1-2 hours for the visit'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.7690° N, 35.7272° E',
-                'unesco_status': 'Part of the Bethany Beyond the Jordan UNESCO World Heritage Site',
-                'climate': 'Mediterranean climate with cool winters and warm summers'
-            },
-            'madaba': {
-                'id': 'madaba',
-                'name': 'Madaba',
-                'location': 'Madaba Governorate, Jordan',
-                'description': 'The "City of Mosaics" famous for the 6th-century Byzantine mosaic map of the Holy Land.',
-                'long_description': 'Madaba is best known for its spectacular Byzantine and Umayyad mosaics, especially the famous 6th-century Mosaic Map of Jerusalem and the Holy Land in the Greek Orthodox Church of St. George. With two million pieces of colored stone, the map depicts an area from Lebanon to the Nile Delta and from the Mediterranean to the Eastern Desert.',
-                'historical_significance': 'The Madaba Map was constructed in the second half of the sixth century CE, possibly during the reign of Byzantine Emperor Justinian. Originally measuring 21 by 7 meters, it is the oldest surviving map of the Holy Land and a key source on Byzantine Jerusalem. The map was discovered during church construction in 1884.',
-                'cultural_impact': 'The Madaba Map is a unique artifact representing the world\'s oldest floor map and the most impressive surviving example of Byzantine map-making. The city contains numerous other mosaics in various churches and the Archaeological Park.',
-                'facts': [
-                    'The original mosaic map had over two million tesserae (colored stone pieces)',
-                    'Current dimensions are 16 by 5 meters (originally 21 by 7 meters)',
-                    'The map was created between 542 and 614 CE',
-                    'Madaba is mentioned in the Bible and was conquered by King David',
-                    'The city has been inhabited since the Bronze Age',
-                    'Over 50 churches have been discovered in Madaba and surroundings'
-                ],
-                'key_sites': [
-                    {'name': 'St. George\'s Church Mosaic Map', 'description': '6th-century mosaic floor map of the Holy Land', 'significance': 'The oldest known geographic floor mosaic in art history'},
-                    {'name': 'Archaeological Park', 'slug': 'archaeological-park', 'description': 'Complex of Byzantine churches with stunning mosaics', 'significance': 'Contains the Church of the Virgin and Hippolytus Hall mosaics'},
-                    {'name': 'Madaba Museum', 'slug': 'madaba-museum', 'description': 'Museum housed in old houses displaying local artifacts', 'significance': 'Features mosaics and artifacts from various periods'},
-                    {'name': 'Church of the Apostles', 'slug': 'church-of-the-apostles', 'description': 'Church with personification of the sea mosaic', 'significance': 'Contains one of the most famous mosaics in Madaba'}
-                ],
-                'entrance_fees': 'St. George Church: 1 JOD. Archaeological Park: 3 JOD. Free with Jordan Pass.',
-                'opening_hours': 'Most sites: 8:00 AM to 6:00 PM (may vary by season)',
-                'best_time': 'Year-round, but spring and fall offer the most pleasant weather',
-                'how_to_get_there': 'Madaba is 30 km southwest of Amman, about 30 minutes by car or bus.',
-                'what_to_wear': 'Modest clothing for church visits. Comfortable walking shoes.',
-                'guided_tours': 'Local guides available. Often combined with Mount Nebo and Dead Sea tours.',
-                'nearby_attractions': 'Mount Nebo (10 km), Dead Sea (40 km), and Bethany Beyond the Jordan (40 km).',
-                'visitor_tips': [
-                    'Visit St. George\'s Church when it\'s not during services',
-                    'Allow 2-3 hours to see the main mosaic sites',
-                    'The Archaeological Park ticket includes multiple churches',
-                    'Shop for modern mosaics in the town\'s craft shops',
-                    'Combine with Mount Nebo for a half-day trip'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.7197° N, 35.7936° E',
-                'annual_visitors': 'Over 100,000',
-                'climate': 'Mediterranean climate with mild winters and warm summers'
-            },
-            'amman-citadel': {
-                'id': 'amman-citadel',
-                'name': 'Amman Citadel',
-                'location': 'Amman, Jordan',
-                'description': 'Ancient fortress site on Jebel al-Qal\'a featuring the Temple of Hercules and offering panoramic views of Amman.',
-                'long_description': 'The Amman Citadel, known as Jebel al-Qal\'a, is a historical site located on one of the seven hills of Amman. The site has been inhabited since the Bronze Age and contains remains from the Roman, Byzantine, and Umayyad periods. The most notable structure is the Temple of Hercules, built during the reign of Roman co-emperors Marcus Aurelius and Lucius Verus.',
-                'historical_significance': 'The Citadel has been continuously occupied for over 7,000 years. The Temple of Hercules was built around 162-166 AD when Geminius Marcianus was governor of the Province of Arabia. The hand of Hercules, a massive marble fragment, is believed to be part of a colossal statue that could have measured 40 feet high.',
-                'architecture': 'The Temple of Hercules stood on a podium 43 by 27 meters. The restored columns measure 13.5 meters tall. The portico at the front had six columns, making it one of the most impressive Roman temples in the region.',
-                'facts': [
-                    'The Hand of Hercules represents three fingers from a colossal statue',
-                    'The original Hercules statue may have been 40 feet tall',
-                    'Three columns have been restored, becoming an icon of Amman\'s skyline',
-                    'The site includes a Byzantine church and Umayyad Palace',
-                    'The Jordan Archaeological Museum is located on the Citadel grounds',
-                    'Offers 360-degree panoramic views of Amman'
-                ],
-                'key_sites': [
-                    {'name': 'Temple of Hercules', 'slug': 'temple-of-hercules', 'description': 'Roman temple with massive restored columns', 'significance': 'Dedicated to co-emperors Marcus Aurelius and Lucius Verus'},
-                    {'name': 'Hand of Hercules', 'slug': 'hand-of-hercules', 'description': 'Massive marble hand fragment from colossal statue', 'significance': 'One of the largest known marble statue fragments from antiquity'},
-                    {'name': 'Umayyad Palace', 'slug': 'umayyad-palace', 'description': 'Large palatial complex from the 8th century', 'significance': 'Shows the Islamic period\'s architectural achievements'},
-                    {'name': 'Byzantine Church', 'slug': 'byzantine-church', 'description': 'Ruins of an early Christian basilica', 'significance': 'Evidence of early Christianity in the region'}
-                ],
-                'entrance_fees': '3 JOD (about $4 USD). Free with Jordan Pass.',
-                'opening_hours': 'Summer: 8:00 AM to 7:00 PM; Winter: 8:00 AM to 4:00 PM',
-                'best_time': 'Late afternoon for sunset views over Amman',
-                'how_to_get_there': 'Located in downtown Amman, accessible by taxi or on foot from the Roman Theatre area.',
-                'what_to_wear': 'Comfortable walking shoes. Sun protection recommended.',
-                'guided_tours': 'Guides available at the entrance. Often combined with Roman Theatre and downtown Amman tours.',
-                'nearby_attractions': 'Roman Theatre (walking distance), Jordan Museum (3 km), and Rainbow Street (2 km).',
-                'conservation': 'Ongoing conservation by the Department of Antiquities. The three restored columns are now an iconic symbol of Amman.',
-                'visitor_tips': [
-                    'Visit late afternoon for beautiful sunset views',
-                    'Combine with the nearby Roman Theatre',
-                    'Visit the Jordan Archaeological Museum on-site',
-                    'Allow 1-2 hours for exploration',
-                    'Great for photography, especially the Hand of Hercules'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.9539° N, 35.9346° E',
-                'climate': 'Mediterranean climate with hot summers and mild winters'
-            },
-            'aqaba': {
-                'id': 'aqaba',
-                'name': 'Aqaba',
-                'location': 'Aqaba Governorate, Jordan',
-                'description': 'Jordan\'s only coastal city on the Red Sea, famous for diving, beaches, and coral reefs.',
-                'long_description': 'Aqaba is Jordan\'s only seaport and major tourism resort on the northern tip of the Red Sea. With the red mountains of Wadi Rum in the background and pristine coral reefs offshore, Aqaba offers a unique combination of desert adventures and underwater exploration. The city features year-round warm weather and crystal-clear waters perfect for diving and snorkeling.',
-                'historical_significance': 'Aqaba has been an important trading port since ancient times. The city was conquered by various civilizations including the Nabataeans, Romans, and Crusaders. The Mamluk Fort dates from the 16th century and represents the Islamic period of the city.',
-                'facts': [
-                    'The Red Sea has more than 1,200 species of fish',
-                    '44 species of sharks live in the Red Sea',
-                    'Nearly 20% of Red Sea marine species are found nowhere else',
-                    'Water temperature averages 66°F in winter, 84°F in summer',
-                    'The Aqaba Marine Park includes 21 dive sites',
-                    '14 dive sites are accessible from shore',
-                    'Aqaba is a tax-free economic zone'
-                ],
-                'key_sites': [
-                    {'name': 'Aqaba Marine Park', 'slug': 'aqaba-marine-park', 'description': 'Protected area with 21 dive sites featuring coral reefs', 'significance': 'Home to diverse marine life and well-preserved coral gardens'},
-                    {'name': 'Aqaba Fort', 'slug': 'aqaba-fort', 'description': '16th-century Mamluk fortress', 'significance': 'Historical military structure overlooking the city'},
-                    {'name': 'Public Beach', 'slug': 'public-beach', 'description': 'Free public beach with facilities', 'significance': 'Accessible beach for swimming and relaxation'},
-                    {'name': 'Dive Centers', 'slug': 'dive-centers', 'description': 'Multiple PADI-certified dive centers', 'significance': 'Offer diving courses and trips to coral reefs and wrecks'}
-                ],
-                'entrance_fees': 'Beaches vary: public beaches free, resort beaches 10-30 JOD',
-                'opening_hours': 'Beaches and dive centers typically 8:00 AM to sunset',
-                'best_time': 'October to April for diving; year-round for beaches',
-                'how_to_get_there': 'Aqaba is 330 km south of Amman (4-hour drive). King Hussein International Airport serves the city with domestic and international flights.',
-                'what_to_wear': 'Swimwear, waterproof sandals, sun protection. Bring or rent diving equipment.',
-                'health_safety': 'Stay hydrated. Use reef-safe sunscreen to protect coral. Follow dive safety guidelines.',
-                'guided_tours': 'Diving tours, snorkeling trips, glass-bottom boat tours, and day trips to Wadi Rum available.',
-                'nearby_attractions': 'Wadi Rum (60 km), Petra (120 km), and the Saudi Arabia border crossing.',
-                'conservation': 'The Aqaba Marine Park protects coral reefs. Visitors must follow environmental guidelines to preserve the ecosystem.',
-                'visitor_tips': [
-                    'Book diving trips in advance during peak season',
-                    'Try night diving for a different perspective',
-                    'Visit the wreck dive sites for unique underwater exploration',
-                    'Combine beach time with a desert trip to Wadi Rum',
-                    'Tax-free shopping available in Aqaba Special Economic Zone'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '29.5269° N, 35.0071° E',
-                'annual_visitors': 'Over 500,000',
-                'climate': 'Hot desert climate with mild winters and very hot summers'
-            },
-            'bethany-beyond-jordan': {
-                'id': 'bethany-beyond-jordan',
-                'name': 'Bethany Beyond the Jordan',
-                'location': 'Balqa Governorate, Jordan',
-                'description': 'UNESCO World Heritage baptism site where Jesus was baptized by John the Baptist.',
-                'long_description': 'Bethany Beyond the Jordan, also known as Al-Maghtas, is considered by the majority of Christian Churches to be the location where John the Baptist baptized Jesus. This archaeological World Heritage Site on the east bank of the Jordan River features Roman and Byzantine remains including churches, chapels, monasteries, caves used by hermits, and baptismal pools.',
-                'historical_significance': 'The site consists of two distinct areas: Tell Al-Kharrar (Elijah\'s Hill) and the area of churches near the river. The remains of more than 20 Christian sites have been discovered, testifying to the religious character of the place since Byzantine times. Dr. Mohammad Waheeb rediscovered the ancient site in 1997.',
-                'cultural_impact': 'The site was designated a UNESCO World Heritage Site in 2015. Pope John Paul II became the first papal to visit Bethany Beyond the Jordan in 2000. Jordan fully reopened Al-Maghtas in 2002, and it has since become one of the most important Christian pilgrimage sites in the Middle East.',
-                'facts': [
-                    'The archaeological site has remains from Roman and Byzantine periods',
-                    'More than 20 Christian sites have been discovered',
-                    'Features sophisticated water reticulation system',
-                    'Pope John Paul II visited in 2000',
-                    'Designated UNESCO World Heritage Site in 2015',
-                    'Jordan reopened the site in 2002 after extensive excavation'
-                ],
-                'key_sites': [
-                    {'name': 'Tell Al-Kharrar (Elijah\'s Hill)', 'description': 'Archaeological tel with Byzantine church remains', 'significance': 'Believed to be where Elijah ascended to heaven and John the Baptist lived'},
-                    {'name': 'Churches of St. John the Baptist', 'slug': 'churches-of-st-john-the-baptist', 'description': 'Complex of churches near the Jordan River', 'significance': 'Multiple churches built over centuries at the baptism site'},
-                    {'name': 'Baptismal Pools', 'slug': 'baptismal-pools', 'description': 'Ancient pools used for baptism ceremonies', 'significance': 'Show the continuous use of the site for baptisms'},
-                    {'name': 'Hermit Caves', 'slug': 'hermit-caves', 'description': 'Caves used by early Christian hermits', 'significance': 'Evidence of early monastic life in the area'}
-                ],
-                'entrance_fees': '12 JOD (about $17 USD). Free with Jordan Pass.',
-                'opening_hours': 'Summer: 8:00 AM to 6:00 PM; Winter: 8:00 AM to 4:00 PM',
-                'best_time': 'Spring and fall for moderate temperatures',
-                'how_to_get_there': 'Located 9 km north of the Dead Sea, about 50 km from Amman. Accessible by tour or rental car.',
-                'what_to_wear': 'Modest clothing required. Comfortable walking shoes.',
-                'guided_tours': 'Guided tours included with admission. Tours explain the biblical and archaeological significance.',
-                'nearby_attractions': 'Dead Sea (9 km), Mount Nebo (35 km), and Madaba (40 km).',
-                'conservation': 'UNESCO and Jordanian authorities work to preserve the site. Ongoing archaeological excavations continue to uncover new findings.',
-                'visitor_tips': [
-                    'Guided tour is mandatory and included in the ticket price',
-                    'Allow 1.5-2 hours for the full tour',
-                    'Bring baptism certificate if you wish to be baptized',
-                    'Photography is allowed',
-                    'Respect the sacred nature of the site'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.8367° N, 35.5486° E',
-                'unesco_status': 'UNESCO World Heritage Site since 2015',
-                'climate': 'Hot desert climate with mild winters'
-            },
-            'ajloun-castle': {
-                'id': 'ajloun-castle',
-                'name': 'Ajloun Castle',
-                'location': 'Ajloun Governorate, Jordan',
-                'description': '12th-century Muslim fortress built by Saladin\'s forces to defend against Crusaders.',
-                'long_description': 'Ajloun Castle, also known as Qal\'at ar-Rabad, is a 12th-century Muslim castle situated in northwestern Jordan at 1,250 meters above sea level. Built between 1184-1188 by Izz al-Din Usama, a general of Saladin, the castle served as a military outpost to protect the region from Crusader invasions and control iron mining operations.',
-                'historical_significance': 'The fortress was built on Saladin\'s order as part of a major military tactic to stop the expansion of Crusader territory. From its strategic location, it dominated the northern Jordan Valley and controlled three main passages. It was also part of a chain of beacons and pigeon posts enabling messages to be transmitted from Damascus to Cairo in a single day.',
-                'architecture': 'The original castle had four corner towers connected by curtain walls and a double gate. Arrow slits were incorporated in thick walls, and it was surrounded by a moat averaging 16 meters wide and 12-15 meters deep. The castle was enlarged in 1214-1215 by Mamluk governor Aibak ibn Abdullah.',
-                'facts': [
-                    'Built between 1184-1188 by Saladin\'s nephew Izz al-Din Usama',
-                    'Part of a defensive network against Crusaders',
-                    'Protected communication routes between southern Jordan and Syria',
-                    'Also protected iron mines of Ajloun',
-                    'Part of beacon chain from Damascus to Cairo',
-                    'Damaged by earthquakes in 1837 and 1927',
-                    'Recently restored by Department of Antiquities'
-                ],
-                'key_sites': [
-                    {'name': 'Corner Towers', 'slug': 'corner-towers', 'description': 'Four defensive towers at castle corners', 'significance': 'Provided 360-degree defensive coverage'},
-                    {'name': 'Moat', 'slug': 'moat', 'description': 'Defensive ditch 16m wide and 12-15m deep', 'significance': 'Protected the castle from ground attacks'},
-                    {'name': 'Museum Exhibition', 'slug': 'museum-exhibition', 'description': 'Display of artifacts from various periods', 'significance': 'Shows the history of the region through artifacts'},
-                    {'name': 'Arrow Slits', 'slug': 'arrow-slits', 'description': 'Narrow openings in thick walls', 'significance': 'Allowed archers to defend while protected'}
-                ],
-                'entrance_fees': '3 JOD (about $4 USD). Free with Jordan Pass.',
-                'opening_hours': 'Summer: 8:00 AM to 7:00 PM; Winter: 8:00 AM to 4:00 PM',
-                'best_time': 'Spring and fall for pleasant weather and green landscapes',
-                'how_to_get_there': 'Ajloun is 75 km northwest of Amman, about 1.5 hours by car. Often combined with Jerash visits.',
-                'what_to_wear': 'Comfortable walking shoes for exploring the castle. Layers recommended as it can be cool.',
-                'guided_tours': 'Guides available at entrance. Museum exhibitions provide historical context.',
-                'nearby_attractions': 'Jerash Roman ruins (30 km), Ajloun Forest Reserve, and Dibeen Forest Reserve.',
-                'conservation': 'The Department of Antiquities has sponsored restoration and consolidation of walls and rebuilt the bridge over the moat.',
-                'visitor_tips': [
-                    'Visit in spring when surrounding hills are green',
-                    'Combine with Jerash for a full day trip',
-                    'Explore the museum inside the castle',
-                    'Enjoy panoramic views from the towers',
-                    'Allow 1-2 hours for visit'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '32.3319° N, 35.7519° E',
-                'climate': 'Mediterranean climate with cool winters and mild summers'
-            },
-            'karak-castle': {
-                'id': 'karak-castle',
-                'name': 'Karak Castle',
-                'location': 'Karak Governorate, Jordan',
-                'description': 'One of the largest Crusader castles in the Levant, built in the 12th century.',
-                'long_description': 'Kerak Castle is a large medieval castle located in al-Karak, Jordan, sitting 900m above sea level inside the walls of the old city. It is one of the largest castles in the Levant. Construction began in the 1140s under Pagan and Fulk, King of Jerusalem. The castle controlled trade routes from Damascus to Egypt and Mecca due to its strategic position east of the Dead Sea.',
-                'historical_significance': 'The Crusaders called it Crac des Moabites. In 1176, Raynald of Châtillon gained possession and used it to harass trade caravans and even attempted an attack on Mecca. Saladin besieged the castle in 1183, and it finally surrendered in 1188 after the Crusader defeat at the Battle of Hattin, having been in Crusader hands for only 46 years.',
-                'architecture': 'The castle extends across seven levels including towers, barracks, a kitchen, a church and mosque, prison cells, an underground marketplace, a museum, and a palace. The most notable Crusader feature is the north wall with immense arched halls on two levels used for living quarters, stables, and as fighting galleries.',
-                'facts': [
-                    'Construction began in the 1140s',
-                    'In Crusader hands for 46 years',
-                    'Raynald of Châtillon attacked trade caravans from here',
-                    'Fell to Saladin in 1188 after year-long siege',
-                    'Extends across seven levels',
-                    'Located on the ancient King\'s Highway',
-                    '140 km south of Amman'
-                ],
-                'key_sites': [
-                    {'name': 'North Wall Galleries', 'slug': 'north-wall-galleries', 'description': 'Crusader arched halls on two levels', 'significance': 'Used for living, stables, and defense'},
-                    {'name': 'Underground Passages', 'slug': 'underground-passages', 'description': 'Network of tunnels and rooms', 'significance': 'Includes marketplace, prison cells, and storage'},
-                    {'name': 'Church and Mosque', 'slug': 'church-and-mosque', 'description': 'Religious structures from different periods', 'significance': 'Shows the castle\'s changing occupants'},
-                    {'name': 'Museum', 'slug': 'museum', 'description': 'Displays artifacts and castle history', 'significance': 'Provides historical context'}
-                ],
-                'entrance_fees': '2 JOD (about $3 USD). Free with Jordan Pass.',
-                'opening_hours': 'October-March: 8:00 AM to 4:00 PM; April-September: 8:00 AM to 7:00 PM',
-                'best_time': 'Spring and fall for moderate temperatures',
-                'how_to_get_there': 'Al-Karak is 140 km south of Amman on the ancient King\'s Highway, about 2 hours by car.',
-                'what_to_wear': 'Comfortable walking shoes. The castle has many stairs and levels to explore.',
-                'guided_tours': 'Local guides available. Exploring independently with a map is also possible.',
-                'nearby_attractions': 'Dana Biosphere Reserve (40 km), Dead Sea (50 km), and Petra (100 km south).',
-                'conservation': 'Ongoing preservation work by Jordanian authorities. The castle remains remarkably well-preserved.',
-                'visitor_tips': [
-                    'Allow 2-3 hours to properly explore all seven levels',
-                    'Visit early to avoid midday heat',
-                    'Bring a flashlight for darker underground areas',
-                    'The castle offers great views of the surrounding landscape',
-                    'Combine with King\'s Highway scenic route'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.1843° N, 35.7049° E',
-                'climate': 'Mediterranean climate with cool winters and warm summers'
-            },
-            'dana-reserve': {
-                'id': 'dana-reserve',
-                'name': 'Dana Biosphere Reserve',
-                'location': 'Tafilah Governorate, Jordan',
-                'description': 'Jordan\'s largest nature reserve with diverse ecosystems and spectacular landscapes.',
-                'long_description': 'Dana Biosphere Reserve is Jordan\'s largest nature reserve, comprising 308 square kilometers. Founded in 1989, it became Jordan\'s first biosphere reserve according to UNESCO classifications in 1998. The reserve drops from 1,500 meters on the Qadisiyah plateau to the low-lying Wadi Araba, encompassing four different bio-geographical zones.',
-                'historical_significance': 'Human settlement in Dana dates back over 6,000 years, with archaeological discoveries suggesting Palaeolithic, Egyptian, Nabataean, and Roman settlement. The Dana village itself is a well-preserved 15th-century Ottoman stone village.',
-                'facts': [
-                    'Jordan\'s largest nature reserve at 308 square kilometers',
-                    'Only reserve in Jordan with four bio-geographical zones',
-                    'Home to 800 plant species',
-                    '449 animal species recorded',
-                    '25 endangered species including Sand Cat and Syrian Wolf',
-                    'Largest breeding colony of Syrian serin',
-                    'Human habitation for over 6,000 years'
-                ],
-                'key_sites': [
-                    {'name': 'Dana Village', 'slug': 'dana-village', 'description': '15th-century Ottoman stone village', 'significance': 'Well-preserved historical village with traditional architecture'},
-                    {'name': 'Wadi Dana Trail', 'slug': 'wadi-dana-trail', 'description': '14 km hiking trail through the reserve', 'significance': 'Descends through all four bio-geographical zones'},
-                    {'name': 'Feynan Eco-lodge', 'slug': 'feynan-eco-lodge', 'description': 'Award-winning sustainable lodge', 'significance': 'First solar-powered lodge in the Middle East'},
-                    {'name': 'Copper Mines', 'slug': 'copper-mines', 'description': 'Ancient copper mining sites', 'significance': 'Evidence of historical metal working'}
-                ],
-                'entrance_fees': 'Day visit: 7 JOD. Free with Jordan Pass. Hiking permits required for trails.',
-                'opening_hours': 'Reserve accessible year-round. Visitor center: 8:00 AM to 3:00 PM',
-                'best_time': 'Spring (March-May) and fall (September-November) for hiking',
-                'how_to_get_there': 'Dana village is on the King\'s Highway between Tafilah and Shobak, about 220 km south of Amman.',
-                'what_to_wear': 'Hiking boots, layered clothing, sun protection. Bring water for hikes.',
-                'health_safety': 'Hire local guides for longer hikes. Some trails are strenuous. Stay on marked paths.',
-                'guided_tours': 'Local Bedouin guides offer various hiking trails and camping experiences.',
-                'nearby_attractions': 'Shobak Castle (30 km), Petra (60 km), and Wadi Feynan (within reserve).',
-                'conservation': 'The reserve protects endangered species and supports sustainable tourism. Local communities are involved in conservation efforts.',
-                'visitor_tips': [
-                    'Book Feynan Eco-lodge in advance',
-                    'Hire a local guide for the best experience',
-                    'The Wadi Dana trail is strenuous but spectacular',
-                    'Stay overnight to experience the reserve fully',
-                    'Support local crafts made by Dana cooperative'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '30.6833° N, 35.6000° E',
-                'area': '308 square kilometers',
-                'climate': 'Varies by elevation: Mediterranean to desert climates'
-            },
-            'umm-qais': {
-                'id': 'umm-qais',
-                'name': 'Umm Qais (Gadara)',
-                'location': 'Irbid Governorate, Jordan',
-                'description': 'Ancient Decapolis city perched on a hilltop with stunning views over three countries.',
-                'long_description': 'Umm Qais expanded from the ruins of ancient Gadara, located on a ridge 378 meters above sea level, overlooking the Sea of Tiberias, the Golan Heights, and the Yarmouk River gorge. Known in ancient times as Gadara, it was one of the cities of the Decapolis—a group of ten cities on the eastern frontier of the Roman Empire. Gadara was renowned as a cultural center and was once called "a new Athens" by a poet.',
-                'historical_significance': 'Gadara was originally built by the Greeks in the 4th century BC. When Roman general Pompey conquered the region in 63 BC, he oversaw the rebuilding of Gadara and made it one of the semi-autonomous cities of the Roman Decapolis. It was the home of several classical poets and philosophers, including Theodorus, founder of a rhetorical school in Rome.',
-                'architecture': 'The site features an impressive colonnaded street, a vaulted terrace, and the ruins of two theaters. One theater is unique in Jordan for its westward orientation and construction from basalt stone, holding up to 5,000 spectators with perfect acoustics.',
-                'facts': [
-                    'Gadara was the end point of the 170 km long Qanat Fir\'aun water system',
-                    '106 km of the water system ran underground, the longest tunnel of antiquity',
-                    'The site offers views over three countries: Jordan, Syria, and Israel',
-                    'Named among the \'Best Tourism Villages 2022\' by UNWTO',
-                    'The western theater is unique in Jordan for its basalt construction',
-                    'Gadara was home to famous poets and philosophers in ancient times'
-                ],
-                'key_sites': [
-                    {'name': 'West Theatre', 'slug': 'west-theatre', 'description': 'Unique basalt theater with 5,000-seat capacity', 'significance': 'Only westward-facing theater in Jordan with perfect acoustics'},
-                    {'name': 'Colonnaded Street', 'slug': 'colonnaded-street', 'description': 'Impressive main street with columns', 'significance': 'Shows the grandeur of the Decapolis city'},
-                    {'name': 'Ottoman Village', 'slug': 'ottoman-village', 'description': 'Well-preserved 19th-century Ottoman village', 'significance': 'Demonstrates later periods of habitation'},
-                    {'name': 'Basilica Terrace', 'slug': 'basilica-terrace', 'description': 'Byzantine church complex', 'significance': 'Evidence of early Christian presence'}
-                ],
-                'entrance_fees': '3 JOD (about $4 USD). Free with Jordan Pass.',
-                'opening_hours': 'Summer: 8:00 AM to 7:00 PM; Winter: 8:00 AM to 4:00 PM',
-                'best_time': 'Spring for wildflowers and clear views',
-                'how_to_get_there': 'Umm Qais is 120 km north of Amman, about 2 hours by car. Can be combined with Jerash and Ajloun.',
-                'what_to_wear': 'Comfortable walking shoes, hat, sunglasses.',
-                'guided_tours': 'Local guides available. Restaurant with panoramic terrace on site.',
-                'nearby_attractions': 'Jerash (75 km), Ajloun Castle (50 km), and Yarmouk Forest Reserve.',
-                'conservation': 'Ongoing preservation by Department of Antiquities. Recognition as UNWTO Best Tourism Village.',
-                'visitor_tips': [
-                    'Visit on a clear day for the best panoramic views',
-                    'Have lunch at the restaurant with terrace overlooking three countries',
-                    'Explore both the Greek-Roman ruins and Ottoman village',
-                    'Allow 2-3 hours for full exploration',
-                    'Combine with other northern Jordan sites'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '32.6539° N, 35.6828° E',
-                'annual_visitors': 'Over 50,000',
-                'climate': 'Mediterranean climate with mild winters'
-            },
-            'qasr-amra': {
-                'id': 'qasr-amra',
-                'name': 'Qasr Amra',
-                'location': 'Zarqa Governorate, Jordan',
-                'description': 'UNESCO World Heritage desert castle famous for its unique 8th-century frescoes.',
-                'long_description': 'Qusayr Amra is the best-known of the desert castles in eastern Jordan. Built between 723-743 by Walid Ibn Yazid, the future Umayyad caliph Walid II, it is considered one of the most important examples of early Islamic art and architecture. The extensive fresco paintings are unique for Islamic architecture of the Umayyad period.',
-                'historical_significance': 'This exceptionally well-preserved desert castle was both a fortress with a garrison and a residence of the Umayyad caliphs. The frescoes, painted around 730-740 AD, are an extremely rare example of the rich decorative culture of the Umayyads.',
-                'cultural_impact': 'The castle was made a UNESCO World Heritage Site in 1985. The frescoes were restored in the 1970s and 1990s, revealing rich colors that had not been visible before.',
-                'facts': [
-                    'Built between 723-743 AD by future caliph Walid II',
-                    'UNESCO World Heritage Site since 1985',
-                    'Frescoes depict bathing scenes, hunting, crafts, and animals',
-                    'Contains one of the earliest known celestial domes',
-                    'Features completely nude figures, unusual for the period',
-                    'The Painting of the Six Kings depicts rulers from different empires',
-                    'Inscriptions in both Greek and Arabic'
-                ],
-                'key_sites': [
-                    {'name': 'Reception Hall', 'slug': 'reception-hall', 'description': 'Main hall with extensive frescoes', 'significance': 'Contains the famous Painting of the Six Kings'},
-                    {'name': 'Bath House', 'slug': 'bath-house', 'description': 'Three-room bathing complex', 'significance': 'Shows Umayyad bathing culture with unique frescoes'},
-                    {'name': 'Caldarium Dome', 'slug': 'caldarium-dome', 'description': 'Hot room with zodiac ceiling', 'significance': 'One of earliest surviving celestial maps on a dome'},
-                    {'name': 'Frescoed Walls', 'slug': 'frescoed-walls', 'description': 'Walls covered in 8th-century paintings', 'significance': 'Rare example of Umayyad decorative art'}
-                ],
-                'entrance_fees': '3 JOD (about $4 USD). Free with Jordan Pass.',
-                'opening_hours': 'Summer: 8:00 AM to 6:00 PM; Winter: 8:00 AM to 4:00 PM',
-                'best_time': 'Spring and fall for moderate temperatures',
-                'how_to_get_there': 'About 85 km east of Amman on the highway to Azraq. Often part of "Desert Castles Loop" tour.',
-                'what_to_wear': 'Sun protection, comfortable shoes. Modest clothing recommended.',
-                'guided_tours': 'Guides available. Often combined with other desert castles like Qasr Kharana and Qasr Azraq.',
-                'nearby_attractions': 'Qasr Kharana (15 km), Qasr Azraq (35 km), and Azraq Wetland Reserve.',
-                'conservation': 'Restoration programs in 1970s and 1990s. Ongoing UNESCO protection.',
-                'visitor_tips': [
-                    'Visit as part of the Desert Castles Loop',
-                    'Allow 45 minutes to 1 hour for visit',
-                    'Photography allowed inside',
-                    'Best light for photography in morning',
-                    'Combine with Azraq Wetland Reserve visit'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.8017° N, 36.5842° E',
-                'unesco_status': 'UNESCO World Heritage Site since 1985',
-                'climate': 'Desert climate with hot summers and cool winters'
-            },
-            'azraq-wetland': {
-                'id': 'azraq-wetland',
-                'name': 'Azraq Wetland Reserve',
-                'location': 'Zarqa Governorate, Jordan',
-                'description': 'Unique desert oasis and migratory bird sanctuary in the heart of Jordan\'s eastern desert.',
-                'long_description': 'The Azraq Wetland Reserve was established in 1978 and covers 12 square kilometers, serving as an oasis for migratory birds. The name "Azraq" means "blue" in Arabic, referring to the water that once filled this desert oasis. Located between a limestone desert and a basalt desert, it represents a crucial stopover for birds migrating between Africa, Asia, and Europe.',
-                'historical_significance': 'The natural springs dried up in 1992 due to over-pumping for urban water supply. Through RSCN management, the wetlands have been partially restored to 10% of their original size, bringing back migratory species and creating opportunities for local communities.',
-                'conservation': 'Artificial springs maintain the site today. The RSCN has successfully rehabilitated the oasis, resulting in the return of several migratory species including the hoopoe lark, Cetti\'s warbler, desert finch, and marsh harrier.',
-                'facts': [
-                    'Established as a reserve in 1978',
-                    'Lost 99.6% of its water and plant cover by 1992',
-                    'Now restored to 10% of original wetland',
-                    'Home to the Azraq Killifish, Jordan\'s only endemic vertebrate',
-                    '280 migratory bird species recorded',
-                    'Migratory stopover for birds from three continents',
-                    'Water pumping supplied 60 million cubic meters annually to cities'
-                ],
-                'key_sites': [
-                    {'name': 'Boardwalk Trails', 'slug': 'boardwalk-trails', 'description': 'Elevated walkways through wetland', 'significance': 'Allow close observation of birds and fish'},
-                    {'name': 'Observation Points', 'slug': 'observation-points', 'description': 'Bird watching platforms', 'significance': 'Best spots for viewing migratory species'},
-                    {'name': 'Marshland Pools', 'slug': 'marshland-pools', 'description': 'Restored wetland areas', 'significance': 'Habitat for endemic Azraq Killifish'},
-                    {'name': 'Visitor Center', 'slug': 'visitor-center', 'description': 'Educational facility with exhibits', 'significance': 'Explains wetland ecology and conservation'}
-                ],
-                'entrance_fees': '5 JOD (about $7 USD). Free with Jordan Pass.',
-                'opening_hours': 'Summer: 8:00 AM to 6:00 PM; Winter: 8:00 AM to 4:00 PM',
-                'best_time': 'Spring and fall for peak bird migration',
-                'how_to_get_there': 'Located 100 km east of Amman near Azraq town. Accessible by car or as part of desert castles tour.',
-                'what_to_wear': 'Comfortable walking shoes, sun protection. Bring binoculars for bird watching.',
-                'health_safety': 'Stay on marked boardwalks. Bring water and sun protection.',
-                'guided_tours': 'Guided walks available. Bird watching tours can be arranged.',
-                'nearby_attractions': 'Qasr Azraq fortress (in Azraq town), Shaumari Wildlife Reserve (15 km), and desert castles.',
-                'visitor_tips': [
-                    'Visit early morning for best bird watching',
-                    'Bring binoculars and camera with telephoto lens',
-                    'Walk the full boardwalk circuit',
-                    'Visit during migration seasons for maximum species',
-                    'Allow 1-2 hours for visit'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.8211° N, 36.8211° E',
-                'area': '12 square kilometers',
-                'climate': 'Desert climate with hot summers and cool winters'
-            },
-            'wadi-mujib': {
-                'id': 'wadi-mujib',
-                'name': 'Wadi Mujib',
-                'location': 'Karak and Madaba Governorates, Jordan',
-                'description': 'Jordan\'s "Grand Canyon" - the lowest nature reserve in the world with spectacular canyoning adventures.',
-                'long_description': 'The Mujib Biosphere Reserve is the lowest nature reserve in the world, located within the deep Wadi Mujib gorge, which enters the Dead Sea at 410 meters below sea level. The reserve extends to the Karak and Madaba mountains, reaching 900 meters above sea level, creating a dramatic 1,300-meter variation in elevation.',
-                'historical_significance': 'The wadi has been a natural corridor for thousands of years. Its dramatic landscapes and year-round water flow have supported human activity since ancient times.',
-                'facts': [
-                    'Lowest nature reserve in the world at 410m below sea level',
-                    '1,300-meter elevation variation from canyon to mountains',
-                    'Often called Jordan\'s Grand Canyon',
-                    'Features waterfalls, natural waterslides, and slot canyons',
-                    'Home to Nubian ibex and striped hyenas',
-                    'Open April to October for wet trails',
-                    'Siq Trail is the most popular adventure route'
-                ],
-                'key_sites': [
-                    {'name': 'Siq Trail', 'slug': 'siq-trail', 'description': 'River hike through slot canyon to waterfall', 'significance': 'Most popular 2-4 hour adventure with swimming and climbing'},
-                    {'name': 'Malaqi Trail', 'slug': 'malaqi-trail', 'description': 'Longer route with waterfall rappelling', 'significance': 'Advanced canyoning experience requiring guides'},
-                    {'name': 'Canyon Trail', 'slug': 'canyon-trail', 'description': 'Full-day canyon descent', 'significance': 'Technical route with multiple waterfalls'},
-                    {'name': 'Ibex Trail', 'slug': 'ibex-trail', 'description': 'Dry hiking trail', 'significance': 'Only year-round trail, good for wildlife spotting'}
-                ],
-                'entrance_fees': 'Siq Trail: 21 JOD (about $30 USD). Other trails: 28-70 JOD. Not included in Jordan Pass.',
-                'opening_hours': 'April to October: 8:00 AM to 4:00 PM for wet trails. Ibex Trail: Year-round',
-                'best_time': 'April-May and September-October for ideal water temperatures',
-                'how_to_get_there': 'Located on the Dead Sea Highway, about 90 km from Amman. Entrance is well-marked along the road.',
-                'what_to_wear': 'Swimwear, water shoes with good grip, dry bag for valuables. Wetsuits available for rental.',
-                'health_safety': 'Must be able to swim. Follow safety instructions. Trails can be physically demanding. Not recommended for young children.',
-                'guided_tours': 'Guides mandatory for Malaqi and Canyon trails. Siq Trail can be done independently but guides recommended.',
-                'nearby_attractions': 'Dead Sea resorts (15-30 km), Bethany Beyond the Jordan (40 km), and Mount Nebo (60 km).',
-                'conservation': 'Protected biosphere reserve. Visitors must follow environmental guidelines. Flash flood monitoring in place.',
-                'visitor_tips': [
-                    'Book in advance during peak season',
-                    'Start early to avoid crowds',
-                    'Bring waterproof bag for phones and valuables',
-                    'Wear shoes with good grip - surfaces are slippery',
-                    'Check weather forecast - trails close during rain',
-                    'Physical fitness required for all wet trails'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.4503° N, 35.5831° E',
-                'area': 'Reserve extends over 212 square kilometers',
-                'climate': 'Hot desert climate with year-round water flow'
-            },
-            'little-petra': {
-                'id': 'little-petra',
-                'name': 'Little Petra (Siq al-Barid)',
-                'location': 'Ma\'an Governorate, Jordan',
-                'description': 'Smaller Nabataean archaeological site featuring rare ancient frescoes and rock-cut architecture.',
-                'long_description': 'Little Petra, also known as Siq al-Barid (meaning "the cold canyon"), is a Nabataean archaeological site located 8 kilometers north of Petra. Like its larger neighbor, it features buildings carved into sandstone canyon walls. The site consists of three wider areas connected by a 450-meter canyon and was likely a suburb of Petra meant to house visiting traders.',
-                'historical_significance': 'Built during the height of Nabataean influence in the 1st century CE, Little Petra served as a commercial suburb of the capital. The site features the Painted Biclinium, the only known example of interior Nabataean figurative painting in situ, dated to 40 BCE-25 CE through radiocarbon analysis.',
-                'cultural_impact': 'The Painted Biclinium represents a very rare large-scale example of Hellenistic painting, considered superior even to similar later Roman paintings at Herculaneum. The site is part of Petra\'s UNESCO World Heritage inscription.',
-                'facts': [
-                    'Located 8 km north of Petra',
-                    'Connected by a 450-meter canyon',
-                    'Built in the 1st century BCE',
-                    'Houses the only known Nabataean interior figurative paintings',
-                    'Frescoes dated to 40 BCE-25 CE',
-                    'Free to visit and less crowded than Petra',
-                    'Part of Petra UNESCO World Heritage Site'
-                ],
-                'key_sites': [
-                    {'name': 'Painted Biclinium', 'slug': 'painted-biclinium', 'description': 'Rock-cut dining room with rare frescoes', 'significance': 'Only surviving example of Nabataean interior figurative painting'},
-                    {'name': 'Rock-Cut Tombs', 'slug': 'rock-cut-tombs', 'description': 'Elaborate burial chambers', 'significance': 'Show Nabataean funerary architecture'},
-                    {'name': 'Water Channels', 'slug': 'water-channels', 'description': 'Sophisticated water management system', 'significance': 'Demonstrates Nabataean engineering skills'},
-                    {'name': 'Temple Facades', 'slug': 'temple-facades', 'description': 'Carved building fronts', 'significance': 'Smaller-scale versions of Petra\'s monuments'}
-                ],
-                'entrance_fees': 'Free admission',
-                'opening_hours': '6:00 AM to 6:00 PM (similar to Petra)',
-                'best_time': 'Morning or late afternoon for best light and fewer visitors',
-                'how_to_get_there': 'Located 8 km north of Petra\'s visitor center. Accessible by car or taxi. Can also hike from Petra (5 km trail).',
-                'what_to_wear': 'Comfortable walking shoes, sun protection, layers for temperature changes.',
-                'guided_tours': 'Local guides available. Can be visited independently. Often combined with Petra visits.',
-                'nearby_attractions': 'Petra (8 km), Al-Beidha Neolithic village (nearby), and Wadi Rum (80 km).',
-                'conservation': 'Protected as part of Petra Archaeological Park. Ongoing preservation of the Painted Biclinium frescoes.',
-                'visitor_tips': [
-                    'Visit before or after Petra to avoid crowds',
-                    'Free admission makes it great value',
-                    'Allow 1-2 hours for exploration',
-                    'Bring flashlight to see Painted Biclinium details',
-                    'Less strenuous than Petra but still requires walking',
-                    'Can hike to Petra from here via backdoor trail'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80'
-                ],
-                'coordinates': '30.3667° N, 35.4667° E',
-                'unesco_status': 'Part of Petra UNESCO World Heritage Site',
-                'climate': 'Desert climate similar to Petra'
-            },
-            'shobak-castle': {
-                'id': 'shobak-castle',
-                'name': 'Shobak Castle (Montreal)',
-                'location': 'Ma\'an Governorate, Jordan',
-                'description': 'First Crusader castle in the region, dramatically perched on a conical mountain.',
-                'long_description': 'Montreal, known in Arabic as Qal\'at ash-Shawbak, is a Crusader castle built on a conical mountain summit and later expanded by the Mamluks. The castle was built by King Baldwin I in 1115 CE with the dual purpose of extending Frankish settlement east of the Dead Sea and controlling the desert road used by caravans between Syria and Egypt.',
-                'historical_significance': 'The first Crusader castle took only eighteen days to build. To commemorate the king\'s personal involvement, it was named "Mont Real" (Mount Royal). The castle was strategically important as it dominated the main passage from Egypt to Syria, allowing control of trade routes and taxation of pilgrims to Mecca and Medina.',
-                'architecture': 'The castle solved its water shortage problem through a remarkable tunnel down the hill to two spring-fed cisterns, allowing defenders to retrieve water without exposure to attackers. The most significant Crusader remains include a curtain wall inside later Muslim additions and two chapels.',
-                'facts': [
-                    'Built by Baldwin I in 1115 CE in just 18 days',
-                    'Named Mont Real (Mount Royal) after the king',
-                    'First major Crusader fortress in the region',
-                    'Besieged by Saladin for almost two years',
-                    'Fell to Saladin in May 1189',
-                    'Features 350-step tunnel to underground water source',
-                    'Decorated with 14th-century Mamluk inscriptions'
-                ],
-                'key_sites': [
-                    {'name': 'Water Tunnel', 'slug': 'water-tunnel', 'description': '350-step tunnel to cisterns', 'significance': 'Ingenious solution to water shortage problem'},
-                    {'name': 'Crusader Chapels', 'slug': 'crusader-chapels', 'description': 'Two Christian chapels', 'significance': 'Best-preserved Crusader religious structures'},
-                    {'name': 'Curtain Wall', 'slug': 'curtain-wall', 'description': 'Original Crusader defensive wall', 'significance': 'Shows medieval military architecture'},
-                    {'name': 'Mamluk Towers', 'slug': 'mamluk-towers', 'description': 'Later Islamic additions with inscriptions', 'significance': '14th-century modifications and decorations'}
-                ],
-                'entrance_fees': '2 JOD (about $3 USD). Free with Jordan Pass.',
-                'opening_hours': 'Summer: 8:00 AM to 6:00 PM; Winter: 8:00 AM to 4:00 PM',
-                'best_time': 'Spring and fall for moderate temperatures',
-                'how_to_get_there': 'Located 30 km north of Petra on the King\'s Highway. About 180 km south of Amman.',
-                'what_to_wear': 'Sturdy shoes for exploring ruins and tunnel. Flashlight helpful for dark areas.',
-                'health_safety': 'Tunnel descent is steep and can be slippery. Not suitable for those with mobility issues.',
-                'guided_tours': 'Local guides available at entrance. Site can be explored independently.',
-                'nearby_attractions': 'Petra (30 km), Dana Biosphere Reserve (30 km), and Wadi Musa.',
-                'conservation': 'Ongoing preservation work. Site less visited than other castles, maintaining authentic atmosphere.',
-                'visitor_tips': [
-                    'Bring flashlight for exploring the water tunnel',
-                    'Allow 1.5-2 hours for full exploration',
-                    'Less crowded than Karak Castle',
-                    'Combine with Dana Reserve or Petra visit',
-                    'Stunning views from the ramparts',
-                    'The tunnel descent is steep - wear good shoes'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '30.5333° N, 35.5667° E',
-                'climate': 'Mediterranean climate with cooler temperatures at altitude'
-            },
-            'pella': {
-                'id': 'pella',
-                'name': 'Pella (Tabaqat Fahl)',
-                'location': 'Irbid Governorate, Jordan',
-                'description': 'Ancient Decapolis city with 8,000 years of continuous human occupation.',
-                'long_description': 'Pella was an ancient city in northwest Jordan containing ruins from the Neolithic, Chalcolithic, Bronze Age, Iron Age, Canaanite, Hellenistic, and Islamic periods. Located near a rich water source in the Jordan Valley, the site has been continuously occupied for over 8,000 years, making it one of the oldest and most archaeologically significant sites in the Middle East.',
-                'historical_significance': 'Over 45 years of excavations by the University of Sydney have unearthed Neolithic housing (ca. 6000 BCE), Early Bronze Age defensive platforms (ca. 3200 BCE), massive Middle Bronze Age city walls (ca. 1800 BCE), Late Bronze Age Egyptian governors\' residence with clay tablets (ca. 1350 BCE), and large areas of a Hellenistic city. In 2010, a city wall dating to 3400-3600 BCE was discovered.',
-                'facts': [
-                    'Over 8,000 years of continuous human occupation',
-                    'Member of the Decapolis league of cities',
-                    'Excavations reveal settlements from 6000 BCE',
-                    'City walls discovered from 3600 BCE',
-                    'Late Bronze Age Egyptian governors\' residence found',
-                    'Rich water source in the Jordan Valley',
-                    'Strategic location in fertile valley'
-                ],
-                'key_sites': [
-                    {'name': 'Tell al-Husn', 'slug': 'tell-al-husn', 'description': 'Main archaeological mound with Byzantine fort', 'significance': 'Overlooks site with remains from multiple periods'},
-                    {'name': 'Roman Civic Complex', 'slug': 'roman-civic-complex', 'description': 'Public buildings and forum area', 'significance': 'Shows city\'s importance in Roman period'},
-                    {'name': 'Byzantine Churches', 'slug': 'byzantine-churches', 'description': 'Three excavated church complexes', 'significance': 'Evidence of early Christian community'},
-                    {'name': 'Neolithic Settlement', 'slug': 'neolithic-settlement', 'description': 'Earliest housing remains', 'significance': 'Some of oldest permanent structures in region'}
-                ],
-                'entrance_fees': '3 JOD (about $4 USD). Free with Jordan Pass.',
-                'opening_hours': 'Daily 8:00 AM to 5:00 PM',
-                'best_time': 'Spring when valley is green and temperatures moderate',
-                'how_to_get_there': 'Located 27 km south of the Sea of Galilee, 130 km north of Amman. About 30 km west of Irbid.',
-                'what_to_wear': 'Comfortable walking shoes, sun protection. Valley can be hot in summer.',
-                'guided_tours': 'Local guides available. Site requires walking across uneven terrain.',
-                'nearby_attractions': 'Umm Qais (40 km), Jordan Valley sites, and Beit She\'an in Israel.',
-                'conservation': 'Ongoing excavations and preservation. UNESCO tentative list site.',
-                'visitor_tips': [
-                    'Less visited than other sites - more authentic experience',
-                    'Significant archaeological importance despite fewer standing structures',
-                    'Best for history enthusiasts interested in ancient civilizations',
-                    'Allow 2 hours for exploration',
-                    'Combine with Umm Qais or northern Jordan sites',
-                    'Fertile valley setting makes it scenic in spring'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '32.4419° N, 35.6117° E',
-                'climate': 'Warm Mediterranean climate, can be hot in summer'
-            },
-            'rainbow-street': {
-                'id': 'rainbow-street',
-                'name': 'Rainbow Street',
-                'location': 'Amman, Jordan',
-                'description': 'Vibrant cultural hub in Amman with art galleries, cafes, and traditional Jordanian atmosphere.',
-                'long_description': 'Rainbow Street is one of Amman\'s most vibrant and culturally rich streets, located in the heart of the city. This pedestrian-friendly street is lined with art galleries, independent cafes, restaurants, and boutiques. It represents modern Jordanian culture while maintaining traditional charm, making it a favorite gathering spot for locals and tourists alike.',
-                'historical_significance': 'Rainbow Street has evolved from a quiet residential area into Amman\'s cultural and social hub. The street and surrounding Jabal Amman neighborhood represent the city\'s transformation while preserving its heritage character.',
-                'cultural_impact': 'The street has become a symbol of Amman\'s contemporary urban culture. It showcases Jordan\'s modern creative scene with art galleries, live music venues, and innovative cafes while serving traditional Jordanian coffee and cuisine.',
-                'facts': [
-                    'Named after the colorful houses along the street',
-                    'Center of Amman\'s contemporary cultural scene',
-                    'Features mix of Ottoman and modern architecture',
-                    'Popular with both locals and tourists',
-                    'Home to independent art galleries and shops',
-                    'Offers panoramic city views from various points',
-                    'Walking street with pedestrian priority'
-                ],
-                'key_sites': [
-                    {'name': 'Books@Cafe', 'slug': 'bookscafe', 'description': 'Popular bookstore cafe', 'significance': 'Cultural gathering spot with terrace views'},
-                    {'name': 'Wild Jordan Center', 'slug': 'wild-jordan-center', 'description': 'RSCN cafe and visitor center', 'significance': 'Organic food and nature reserve information'},
-                    {'name': 'Paris Circle', 'slug': 'paris-circle', 'description': 'Historic roundabout at street\'s top', 'significance': 'Starting point with city views'},
-                    {'name': 'Independent Galleries', 'slug': 'independent-galleries', 'description': 'Art spaces and studios', 'significance': 'Showcase local Jordanian artists'}
-                ],
-                'entrance_fees': 'Free to walk. Individual cafes and shops have their own pricing.',
-                'opening_hours': 'Street accessible 24/7. Most businesses open 9:00 AM to midnight',
-                'best_time': 'Late afternoon to evening for atmosphere and cooler temperatures',
-                'how_to_get_there': 'Located in Jabal Amman, downtown. Accessible by taxi or walking from downtown Amman.',
-                'what_to_wear': 'Casual comfortable clothing. Street is pedestrian-friendly.',
-                'guided_tours': 'Walking tours of Amman often include Rainbow Street. Can be explored independently.',
-                'nearby_attractions': 'Amman Citadel (1 km), Roman Theatre (1.5 km), Duke\'s Diwan (on street), and Jordan Museum.',
-                'visitor_tips': [
-                    'Visit in late afternoon or evening for best atmosphere',
-                    'Stop at rooftop cafes for sunset city views',
-                    'Try traditional Jordanian coffee at local cafes',
-                    'Browse local art galleries and craft shops',
-                    'Perfect for people watching and experiencing local culture',
-                    'Safe and walkable area'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.9539° N, 35.9246° E',
-                'climate': 'Mediterranean climate, pleasant most of year'
-            }
-        },
-        'egypt': {
-            'pyramids-of-giza': {
-                'id': 'pyramids-of-giza',
-                'name': 'Pyramids of Giza & Sphinx',
-                'location': 'Giza, Egypt',
-                'description': 'Ancient architectural marvels and the only surviving Wonder of the Ancient World',
-                'long_description': 'The Giza Pyramid Complex, located approximately 9 km west of the Nile River in Giza, Egypt, stands as one of humanity\'s greatest architectural achievements. Part of the UNESCO World Heritage Site "Memphis and its Necropolis," this ancient complex features the iconic Great Pyramid of Khufu, the Pyramid of Khafre, the Pyramid of Menkaure, and the enigmatic Great Sphinx. These monuments were constructed during the Fourth Dynasty of the Old Kingdom (c. 2600-2500 BC) and continue to captivate millions of visitors annually with their precision, scale, and enduring mystery.',
-                'historical_significance': 'Built during Egypt\'s Fourth Dynasty Old Kingdom period, the pyramids served as elaborate tombs for pharaohs, designed to house their "ka" (spirit) and provide resources for the afterlife. The Great Pyramid of Khufu was constructed by an estimated workforce of 10,000 skilled laborers over approximately 30 years. Contrary to popular belief, these workers were not slaves but skilled craftsmen and laborers who lived in a workers\' village discovered near the pyramids. The pyramids were built using limestone from the Mokattam Formation and were precisely aligned to cardinal directions, suggesting advanced astronomical knowledge.',
-                'cultural_impact': 'UNESCO World Heritage Site since 1979. As the only surviving Wonder of the Ancient World, the Pyramids of Giza attract millions of visitors annually and remain central to Egypt\'s cultural identity and tourism economy. The complex recently underwent a €17 million renovation to enhance visitor facilities and experience.',
-                'best_time_to_visit': 'October to April when temperatures are cooler. Early morning visits (6-9 AM) offer the best light for photography and fewer crowds.',
-                'how_to_get_there': 'Located 13 km southwest of Cairo city center. Accessible by taxi, Uber, or organized tour buses. The journey from central Cairo takes 30-45 minutes.',
-                'entrance_fees': 'General admission approximately 200 EGP (Egyptian Pounds). Additional fees for entering the pyramids. Guided tours range from $50-150 USD.',
-                'opening_hours': 'Open daily from 8:00 AM to 5:00 PM (winter) and 7:00 AM to 7:00 PM (summer). Seasonal variations apply.',
-                'what_to_wear': 'Light, breathable clothing in summer; layers in winter. Comfortable walking shoes essential. Hat, sunglasses, and sunscreen recommended.',
-                'guided_tours': 'Official guides available at entrance. Audio guides offered in multiple languages. Private tours provide deeper historical context and skip-the-line access.',
-                'nearby_attractions': 'Grand Egyptian Museum (2 km), Memphis archaeological site, Saqqara Step Pyramid, Solar Boat Museum',
-                'facts': [
-                    'Only surviving Wonder of the Ancient World',
-                    'Great Pyramid was world\'s tallest structure for 3,800 years',
-                    'Built by skilled laborers, not slaves as commonly believed',
-                    'Workers\' village discovered nearby housed pyramid builders',
-                    'Pyramids precisely aligned to cardinal directions',
-                    'Construction took approximately 30 years with 10,000 workers',
-                    'Great Sphinx is 73 meters long and 20 meters high',
-                    'Hosts occasional cultural events including concerts'
-                ],
-                'visitor_tips': [
-                    'Visit early morning to avoid heat and crowds',
-                    'Bring plenty of water and stay hydrated',
-                    'Negotiate prices for camel rides beforehand',
-                    'Beware of unofficial guides and touts',
-                    'Allow 3-4 hours for comprehensive exploration',
-                    'Consider visiting the Solar Boat Museum',
-                    'New visitor center offers amenities and free Wi-Fi'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1553913861-c0fddf2619ee?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '29.9792° N, 31.1342° E',
-                'unesco_status': 'UNESCO World Heritage Site (Memphis and its Necropolis) since 1979',
-                'climate': 'Hot desert climate with very hot summers (40°C+) and mild winters (15-25°C)'
-            },
-            'grand-egyptian-museum': {
-                'id': 'grand-egyptian-museum',
-                'name': 'Grand Egyptian Museum',
-                'location': 'Giza, Egypt',
-                'description': 'World\'s largest museum dedicated to a single civilization',
-                'long_description': 'The Grand Egyptian Museum (GEM), located just 2 kilometers from the Giza Pyramid Complex, stands as the world\'s largest archaeological museum dedicated to a single civilization. Designed by Dublin-based Heneghan Peng Architects and shaped like a chamfered triangle aligned with the Great Pyramid of Khufu, the museum houses over 100,000 artifacts spanning from the Predynastic Period to the Greco-Roman era. The building features translucent alabaster stone facades and represents a billion-dollar investment in preserving and showcasing Egypt\'s unparalleled archaeological heritage.',
-                'historical_significance': 'First announced in 1992 with construction beginning in 2005, the Grand Egyptian Museum took nearly two decades to complete at a cost of $1 billion. The museum officially opened in 2023, offering partial public access to its treasures. The project represents Egypt\'s commitment to modern museology and cultural preservation, bringing together artifacts previously scattered across multiple facilities. Most notably, it houses the complete 5,398-piece King Tutankhamun collection, many items displayed publicly for the first time.',
-                'cultural_impact': 'The Grand Egyptian Museum serves as an international center for museum communication and Egyptology. With 12 galleries arranged chronologically and thematically, the museum offers unprecedented access to Egypt\'s archaeological treasures. Official full opening scheduled for November 1, 2025. The facility includes a children\'s museum, conference center, conservation labs, and training facilities.',
-                'best_time_to_visit': 'October to April for pleasant weather. Weekday mornings typically less crowded. Plan for 4-6 hours minimum.',
-                'how_to_get_there': 'Located 2 km from Pyramids of Giza. Accessible by taxi, Uber, or organized tours. 20 km from central Cairo (45-minute drive).',
-                'entrance_fees': 'Ticket prices vary by section. Full access approximately 500-1000 EGP. Special exhibitions may require additional fees.',
-                'opening_hours': 'Daily 9:00 AM to 6:00 PM. Extended hours during peak season. Advance booking recommended.',
-                'what_to_wear': 'Comfortable walking shoes for extensive galleries. Casual, modest clothing. Temperature-controlled interior.',
-                'guided_tours': 'Professional guides available in multiple languages. Audio guides included with admission. Specialized tours for archaeology enthusiasts.',
-                'nearby_attractions': 'Pyramids of Giza (2 km), Solar Boat Museum, Sound and Light Show at Pyramids, Memphis ruins',
-                'facts': [
-                    'World\'s largest museum dedicated to single civilization',
-                    'Houses over 100,000 artifacts',
-                    'Complete King Tutankhamun collection (5,398 pieces)',
-                    'Construction cost exceeded $1 billion',
-                    'Building covers 500,000 square meters',
-                    'Facade aligned with Great Pyramid of Khufu',
-                    'Features Khufu\'s second restored solar ship',
-                    'Includes conservation laboratories and training facilities'
-                ],
-                'visitor_tips': [
-                    'Book tickets online in advance to avoid queues',
-                    'Allow minimum 4-6 hours for comprehensive visit',
-                    'Start with King Tutankhamun galleries',
-                    'Visit children\'s museum if traveling with family',
-                    'Photography restrictions apply in certain areas',
-                    'Museum restaurant offers Nile views',
-                    'Combine visit with Pyramids of Giza for full day experience'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1553913861-c0fddf2619ee?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '29.9932° N, 31.1175° E',
-                'unesco_status': 'Not a UNESCO site but houses UNESCO-recognized artifacts',
-                'climate': 'Hot desert climate. Museum is fully climate-controlled year-round.'
-            },
-            'valley-of-the-kings': {
-                'id': 'valley-of-the-kings',
-                'name': 'Valley of the Kings',
-                'location': 'Luxor, Egypt',
-                'description': 'Ancient necropolis housing tombs of Egyptian pharaohs and nobles',
-                'long_description': 'The Valley of the Kings, located on the west bank of the Nile near Luxor, served as Egypt\'s royal burial ground during the New Kingdom period (1539-1075 BC). This remarkable necropolis contains 65 known tombs and chambers carved into limestone cliffs, including the famous tomb of Tutankhamun (KV62) discovered by Howard Carter in 1922. The valley replaced earlier pyramid burials, with rock-cut tombs decorated with religious texts and scenes from Egyptian mythology designed to guide pharaohs through the afterlife.',
-                'historical_significance': 'For nearly 500 years, the Valley of the Kings served as the primary burial site for pharaohs, queens, and powerful nobles during Egypt\'s New Kingdom period. The shift from pyramid tombs to hidden rock-cut chambers reflected efforts to prevent tomb robbery. Despite these precautions, most tombs were plundered in antiquity, making the discovery of Tutankhamun\'s nearly intact tomb in 1922 extraordinarily significant. The valley has been a major focus of Egyptological exploration for two centuries, providing invaluable insights into ancient Egyptian funerary practices, religious beliefs, and royal life.',
-                'cultural_impact': 'UNESCO World Heritage Site since 1979 as part of "Ancient Thebes with its Necropolis." The valley receives 4,000-5,000 daily visitors and remains an active archaeological site with ongoing discoveries. Only 18 tombs occasionally open to public, with rotation to minimize damage from humidity and carbon dioxide.',
-                'best_time_to_visit': 'October to April for cooler temperatures. Visit early morning (6-8 AM) to avoid extreme heat and crowds.',
-                'how_to_get_there': 'Located 5 km west of Luxor across the Nile. Accessible by ferry and taxi, organized tours, or private car. Most visitors combine with other West Bank sites.',
-                'entrance_fees': 'General admission approximately 240 EGP. Special tombs (including Tutankhamun) require additional tickets. Photography fees apply.',
-                'opening_hours': 'Daily 6:00 AM to 5:00 PM (winter), 6:00 AM to 6:00 PM (summer). Last entry one hour before closing.',
-                'what_to_wear': 'Light, breathable clothing. Comfortable walking shoes. Hat and sunglasses essential. Modest dress recommended.',
-                'guided_tours': 'Highly recommended for historical context. Egyptologist-led tours provide detailed explanations of hieroglyphics and tomb significance.',
-                'nearby_attractions': 'Hatshepsut Temple, Valley of the Queens, Tombs of the Nobles, Medinet Habu, Colossi of Memnon, Luxor Temple',
-                'facts': [
-                    'Contains 65 known tombs and chambers',
-                    'Used for royal burials for nearly 500 years (1539-1075 BC)',
-                    'Tutankhamun\'s tomb (KV62) discovered in 1922 nearly intact',
-                    'UNESCO World Heritage Site since 1979',
-                    'Most tombs robbed in antiquity',
-                    'Carved over 1,000 feet of limestone and sedimentary rock',
-                    'Receives 4,000-5,000 daily visitors',
-                    'Only 18 tombs occasionally open to public'
-                ],
-                'visitor_tips': [
-                    'Purchase combination ticket for multiple tombs',
-                    'Visit Tutankhamun tomb early as crowds form quickly',
-                    'Bring flashlight for darker tomb sections',
-                    'Photography prohibited inside tombs (fees at entrance only)',
-                    'Stay hydrated - limited shade available',
-                    'Hire guide for maximum educational value',
-                    'Allow 2-3 hours minimum for visit'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1553913861-c0fddf2619ee?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.7402° N, 32.6014° E',
-                'unesco_status': 'UNESCO World Heritage Site (Ancient Thebes with its Necropolis) since 1979',
-                'climate': 'Hot desert climate. Summer temperatures exceed 40°C. Winter mild (15-25°C).'
-            },
-            'karnak-temple': {
-                'id': 'karnak-temple',
-                'name': 'Karnak Temple Complex',
-                'location': 'Luxor, Egypt',
-                'description': 'Massive ancient temple complex and Egypt\'s second most-visited site',
-                'long_description': 'The Karnak Temple Complex, located near Luxor in ancient Thebes, represents one of the largest religious complexes ever constructed. Known in ancient Egyptian as "The Most Select of Places," this vast site covers multiple precincts built over 2,000 years from the Middle Kingdom (c. 2000-1700 BC) through the Ptolemaic period (305-30 BC). The complex reached its zenith during the 18th Dynasty when Thebes became Egypt\'s capital. The magnificent Great Hypostyle Hall alone covers 5,000 square meters with 134 massive columns ranging from 10-21 meters tall, creating a forest of stone that continues to awe visitors.',
-                'historical_significance': 'Construction at Karnak spanned over 2,000 years with contributions from approximately 30 pharaohs, making it a living chronicle of ancient Egyptian architectural evolution and religious practices. Dedicated primarily to Amun-Re, chief deity of the Theban Triad, the complex served as the most important religious center in ancient Egypt during the New Kingdom. The site demonstrates remarkable continuity of worship, with the complex later adapted for Coptic Christian use. The scale and ambition of Karnak reflects the power and resources of ancient Egyptian civilization at its height.',
-                'cultural_impact': 'UNESCO World Heritage Site since 1979 as part of "Ancient Thebes with its Necropolis." Second most-visited historical site in Egypt after the Giza pyramids. Currently, only the Precinct of Amun-Re is open to the public, featuring an Open Air Museum.',
-                'best_time_to_visit': 'October to April for pleasant weather. Late afternoon visits (3-5 PM) offer beautiful golden light. Sound and Light show available evening.',
-                'how_to_get_there': 'Located 3 km north of Luxor city center. Easily accessible by taxi, Uber, or short walk from most Luxor hotels.',
-                'entrance_fees': 'General admission approximately 200 EGP. Sound and Light show additional 300 EGP. Student discounts available.',
-                'opening_hours': 'Daily 6:00 AM to 5:30 PM (winter), 6:00 AM to 6:30 PM (summer). Sound and Light shows at sunset.',
-                'what_to_wear': 'Comfortable walking shoes essential. Light, modest clothing. Hat and sunscreen. Layers for evening shows.',
-                'guided_tours': 'Highly recommended for understanding complex history. Audio guides available. Specialized Egyptologist tours offer deep insights.',
-                'nearby_attractions': 'Luxor Temple (2.7 km via Avenue of Sphinxes), Luxor Museum, Mummification Museum, Valley of the Kings (across Nile)',
-                'facts': [
-                    'Construction spanned over 2,000 years',
-                    'Approximately 30 pharaohs contributed to construction',
-                    'Great Hypostyle Hall covers 5,000 square meters',
-                    'Contains 134 massive columns (10-21 meters tall)',
-                    'Houses one of Egypt\'s largest obelisks (328 tons, 29 meters)',
-                    'UNESCO World Heritage Site since 1979',
-                    'Second most-visited site in Egypt',
-                    'Connected to Luxor Temple via 2.7 km Avenue of Sphinxes'
-                ],
-                'visitor_tips': [
-                    'Visit early morning or late afternoon for best light',
-                    'Allow minimum 2-3 hours for exploration',
-                    'Combine visit with Luxor Temple via Avenue of Sphinxes',
-                    'Attend evening Sound and Light show',
-                    'Bring water - limited shade in complex',
-                    'Hire qualified Egyptologist guide for rich historical context',
-                    'Visit Open Air Museum for impressive artifacts'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1553913861-c0fddf2619ee?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.7188° N, 32.6573° E',
-                'unesco_status': 'UNESCO World Heritage Site (Ancient Thebes with its Necropolis) since 1979',
-                'climate': 'Hot desert climate. Summer extremely hot (40°C+). Winter pleasant (15-25°C).'
-            },
-            'luxor-temple': {
-                'id': 'luxor-temple',
-                'name': 'Luxor Temple',
-                'location': 'Luxor, Egypt',
-                'description': 'Ancient temple dedicated to kingship rejuvenation on Nile\'s east bank',
-                'long_description': 'Luxor Temple, known in ancient Egyptian as "ipet resyt" (the southern sanctuary), stands majestically on the east bank of the Nile River in the heart of modern Luxor. Constructed around 1400 BCE using Nubian sandstone from Gebel el-Silsila, this architectural masterpiece was dedicated not to a specific cult god but to the rejuvenation of kingship. The temple features unique architectural illusions, grand colonnades, and multiple courtyards. Two original obelisks graced the entrance, though one now stands in Paris\'s Place de la Concorde. The temple represents over 3,400 years of continuous religious worship.',
-                'historical_significance': 'Built primarily by Amenhotep III around 1400 BCE and later expanded by Tutankhamun and Ramesses II, Luxor Temple served as the focal point of the annual Opet Festival, celebrating the rejuvenation of the pharaoh\'s divine power. The temple was associated with the Theban Triad (Amun, Mut, and Khonsu) and potentially served as the symbolic coronation site for pharaohs. The complex experienced remarkable continuity through history - converted into a Roman legionary fortress, then later housing an active mosque (Abu Haggag Mosque) still functioning today within the ancient walls.',
-                'cultural_impact': 'UNESCO World Heritage Site since 1979 as part of "Ancient Thebes with its Necropolis." Connected to Karnak Temple by the recently restored 2.7 km Avenue of Sphinxes, creating a monumental processional route. Extensive excavation beginning in 1884 revealed extraordinary preservation.',
-                'best_time_to_visit': 'October to April for comfortable weather. Evening visits stunning when temple illuminated. Avoid midday summer heat.',
-                'how_to_get_there': 'Located in central Luxor city on the Corniche. Walking distance from most Luxor hotels. 2.7 km south of Karnak Temple.',
-                'entrance_fees': 'General admission approximately 160 EGP. Photography fees may apply. Combination tickets with other Luxor sites available.',
-                'opening_hours': 'Daily 6:00 AM to 9:00 PM. Extended evening hours allow atmospheric illuminated visits.',
-                'what_to_wear': 'Modest, comfortable clothing. Walking shoes recommended. Evening visits may require light jacket in winter.',
-                'guided_tours': 'Professional guides offer insights into architectural illusions and hieroglyphic meanings. Audio guides available in multiple languages.',
-                'nearby_attractions': 'Karnak Temple (2.7 km), Luxor Museum, Avenue of Sphinxes, Mummification Museum, Winter Palace Hotel',
-                'facts': [
-                    'Built around 1400 BCE using Nubian sandstone',
-                    'Dedicated to kingship rejuvenation, not specific deity',
-                    'One original obelisk now in Paris (Place de la Concorde)',
-                    'Connected to Karnak via 2.7 km Avenue of Sphinxes',
-                    'Contains functioning mosque (Abu Haggag) within ancient walls',
-                    'Represents 3,400+ years continuous religious worship',
-                    'UNESCO World Heritage Site since 1979',
-                    'Features unique architectural "illusionism" techniques'
-                ],
-                'visitor_tips': [
-                    'Visit at sunset for spectacular illumination',
-                    'Walk Avenue of Sphinxes to/from Karnak Temple',
-                    'Allow 1.5-2 hours for thorough exploration',
-                    'Evening visits cooler and beautifully lit',
-                    'Respect active Abu Haggag Mosque within complex',
-                    'Photography excellent in golden hour',
-                    'Combine with Luxor Museum visit'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.6990° N, 32.6390° E',
-                'unesco_status': 'UNESCO World Heritage Site (Ancient Thebes with its Necropolis) since 1979',
-                'climate': 'Hot desert climate. Summer very hot (40°C+). Winter mild and pleasant (15-25°C).'
-            },
-            'abu-simbel': {
-                'id': 'abu-simbel',
-                'name': 'Abu Simbel Temples',
-                'location': 'Aswan Governorate, Egypt',
-                'description': 'Colossal rock-cut temples relocated to save them from flooding',
-                'long_description': 'The Abu Simbel Temples, located near Egypt\'s border with Sudan in Aswan Governorate, represent one of ancient Egypt\'s most spectacular monuments and modern archaeology\'s greatest rescue operations. Built by Ramesses II around 1264 BC, these two massive rock-cut temples were carved directly into a mountainside. The Great Temple features four colossal 20-meter statues of Ramesses II guarding the entrance, while the Small Temple honors Queen Nefertari and the goddess Hathor. In an unprecedented engineering feat, the entire complex was relocated in 1968, cut into 1,036 blocks and reassembled 208 meters inland to prevent submersion by Lake Nasser.',
-                'historical_significance': 'Commissioned by Ramesses II during the 13th century BC, the Great Temple was dedicated to the gods Ra-Horakhty, Ptah, Amun, and the deified Ramesses himself. The temples feature intricate bas-reliefs depicting Ramesses II\'s military campaigns, particularly the Battle of Kadesh. The Small Temple is remarkable for depicting Queen Nefertari with statues equal in size to the pharaoh, extremely rare in Egyptian history. The temples demonstrate the pinnacle of New Kingdom architectural ambition and the pharaoh\'s determination to assert Egyptian power in Nubia.',
-                'cultural_impact': 'UNESCO World Heritage Site. The 1960s relocation involved a $41.7 million international UNESCO campaign funded by 48 countries, representing one of archaeology\'s greatest achievements. The temples feature remarkable solar alignment - twice yearly, sunlight penetrates the inner sanctuary to illuminate specific statues.',
-                'best_time_to_visit': 'October to April for moderate temperatures. February 22 and October 22 for solar alignment phenomenon (sun festival).',
-                'how_to_get_there': 'Located 280 km south of Aswan. Accessible by 3-hour bus/car journey, domestic flights to Abu Simbel Airport, or Lake Nasser cruise.',
-                'entrance_fees': 'General admission approximately 240 EGP. Sound and Light show additional fee. Early morning flights from Aswan often include entrance.',
-                'opening_hours': 'Daily 5:00 AM to 6:00 PM. Sound and Light shows evening (weather permitting).',
-                'what_to_wear': 'Light, breathable clothing. Comfortable walking shoes. Sun protection essential. Early morning visits may require light jacket.',
-                'guided_tours': 'Organized day trips from Aswan include transport, guide, and entrance fees. Egyptologist guides enhance understanding of relocation and history.',
-                'nearby_attractions': 'Lake Nasser, Nubian villages, Aswan High Dam, Kalabsha Temple (on Lake Nasser), Sudan border region',
-                'facts': [
-                    'Built by Ramesses II around 1264 BC',
-                    'Four colossal 20-meter statues guard Great Temple entrance',
-                    'Relocated in 1968 using 1,036 individual blocks',
-                    'Moved 208 meters inland to prevent Lake Nasser flooding',
-                    'Relocation cost $41.7 million funded by 48 countries',
-                    'Solar alignment illuminates inner sanctuary twice yearly',
-                    'Small Temple rare example of queen equal-sized to pharaoh',
-                    'UNESCO World Heritage Site'
-                ],
-                'visitor_tips': [
-                    'Book early morning flight from Aswan for day trip',
-                    'Visit during sun festival (Feb 22, Oct 22) for solar alignment',
-                    'Allow 2-3 hours for both temples',
-                    'Bring water and snacks - limited facilities',
-                    'Photography allowed but tripods prohibited',
-                    'Sound and Light show worth attending',
-                    'Consider Lake Nasser cruise for leisurely visit'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1553913861-c0fddf2619ee?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '22.3372° N, 31.6258° E',
-                'unesco_status': 'UNESCO World Heritage Site (Nubian Monuments from Abu Simbel to Philae)',
-                'climate': 'Hot desert climate. Extremely hot summers (45°C+). Mild winters (15-25°C).'
-            },
-            'philae-temple': {
-                'id': 'philae-temple',
-                'name': 'Philae Temple',
-                'location': 'Aswan, Egypt',
-                'description': 'Sacred island temple complex dedicated to goddess Isis, relocated to Agilkia Island',
-                'long_description': 'The Philae Temple Complex, originally located on Philae Island near the First Cataract of the Nile, served as one of ancient Egypt\'s most sacred sites dedicated to the goddess Isis. This remarkable complex existed from the 7th/6th century BC to the 6th century AD, functioning as an important religious and cultural center for Egyptians, Nubians, and Mediterranean pilgrims. The temples feature stunning Ptolemaic and Roman-era architecture with intricate hieroglyphic reliefs. Threatened by flooding from both the Aswan Low Dam and High Dam, UNESCO orchestrated a heroic rescue operation between 1977-1980, carefully dismantling 40,000 individual pieces and reconstructing the entire complex on nearby Agilkia Island.',
-                'historical_significance': 'Philae\'s oldest known structure dates to the reign of Pharaoh Taharqa (7th century BC), though most surviving buildings were constructed during the Ptolemaic and Roman periods. The temple served as one of the last strongholds of ancient Egyptian religion, with the last known hieroglyphic inscription dated 394 AD carved here. The complex functioned as a pagan religious site until officially closed in 537 AD by Byzantine emperor Justinian I, after which it transitioned to Christian use. This long history represents over 1,200 years of continuous religious worship.',
-                'cultural_impact': 'UNESCO World Heritage Site since 1979 as part of "Nubian Monuments from Abu Simbel to Philae." The temple\'s successful relocation set precedent for preserving endangered archaeological sites worldwide. Evening Sound and Light shows illuminate the complex\'s history.',
-                'best_time_to_visit': 'October to April for pleasant weather. Evening Sound and Light shows particularly atmospheric. Avoid summer heat.',
-                'how_to_get_there': 'Located 12 km south of Aswan. Accessible only by motorboat from Shellal marina. Most visitors join organized tours from Aswan.',
-                'entrance_fees': 'General admission approximately 140 EGP. Boat transfer additional 30-50 EGP. Sound and Light show extra fee.',
-                'opening_hours': 'Daily 7:00 AM to 5:00 PM (winter), 7:00 AM to 6:00 PM (summer). Sound and Light shows at sunset.',
-                'what_to_wear': 'Comfortable walking shoes for island exploration. Modest clothing. Sun protection. Light layers for boat ride.',
-                'guided_tours': 'Organized tours from Aswan include boat transfer and guided tour. Audio guides available. Egyptologist tours offer deeper historical context.',
-                'nearby_attractions': 'Aswan High Dam, Unfinished Obelisk, Nubian villages, Elephantine Island, Aswan Museum, Abu Simbel Temples',
-                'facts': [
-                    'Dedicated primarily to goddess Isis',
-                    'Existed from 7th/6th century BC to 6th century AD',
-                    'Last known hieroglyphic inscription (394 AD) carved here',
-                    'Relocated 1977-1980 using 40,000 individual pieces',
-                    'Moved from Philae Island to Agilkia Island',
-                    'Closed as pagan site in 537 AD by Justinian I',
-                    'UNESCO World Heritage Site since 1979',
-                    'Accessible only by boat from mainland'
-                ],
-                'visitor_tips': [
-                    'Combine visit with Aswan High Dam and Unfinished Obelisk',
-                    'Attend evening Sound and Light show',
-                    'Negotiate boat fare before departure',
-                    'Allow 2-3 hours for island exploration',
-                    'Bring water - limited facilities on island',
-                    'Morning visits offer better photography light',
-                    'Wear comfortable shoes for temple walkways'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '24.0207° N, 32.8845° E',
-                'unesco_status': 'UNESCO World Heritage Site (Nubian Monuments from Abu Simbel to Philae) since 1979',
-                'climate': 'Hot desert climate. Very hot summers (40°C+). Mild, pleasant winters (15-25°C).'
-            },
-            'egyptian-museum': {
-                'id': 'egyptian-museum',
-                'name': 'Egyptian Museum Cairo',
-                'location': 'Cairo, Egypt',
-                'description': 'World\'s largest collection of Egyptian antiquities in iconic Tahrir Square building',
-                'long_description': 'The Egyptian Museum, located in Cairo\'s historic Tahrir Square, houses the world\'s largest collection of Egyptian antiquities with over 120,000 items spanning prehistoric to Roman periods. Established in 1835 and housed in its current iconic building since 1902, this pink neoclassical palace designed by French architect Marcel Dourgnon has served as the primary repository of Egypt\'s archaeological treasures for over a century. The museum\'s most famous collection is the treasure of Tutankhamun, including his iconic gold burial mask, alongside countless mummies, statues, jewelry, and artifacts that chronicle ancient Egyptian civilization.',
-                'historical_significance': 'The Egyptian Museum represents the world\'s first national museum dedicated to a single civilization. Founded in 1835, it moved through several locations before settling in its current purpose-built structure in 1902. The museum has witnessed Egypt\'s modern history, including damage during the 2011 Revolution when looters stole and damaged artifacts. In 2021, 22 royal mummies were transferred in a spectacular "Pharaohs\' Golden Parade" to the new National Museum of Egyptian Civilization, marking the beginning of a transition as some collections move to the new Grand Egyptian Museum.',
-                'cultural_impact': 'Considered Africa\'s largest museum and one of the world\'s most important Egyptological institutions. Contains invaluable research materials and a library with over 50,000 volumes on Egyptian antiquities. The museum underwent major renovations in 2016 to improve facilities and conservation.',
-                'best_time_to_visit': 'October to April for pleasant weather. Weekday mornings (9-11 AM) typically less crowded. Allow 3-4 hours minimum.',
-                'how_to_get_there': 'Located at Tahrir Square in central Cairo. Accessible by Cairo Metro (Sadat Station), taxi, or Uber. Walking distance from Nile Corniche hotels.',
-                'entrance_fees': 'General admission approximately 200 EGP. Additional fee for Royal Mummy Room. Photography fees 50 EGP. Student discounts available.',
-                'opening_hours': 'Daily 9:00 AM to 7:00 PM. Extended hours during peak season. Closed on major holidays.',
-                'what_to_wear': 'Comfortable walking shoes essential. Modest, casual clothing. Museum is climate-controlled but can be warm.',
-                'guided_tours': 'Professional Egyptologist guides highly recommended. Audio guides available in multiple languages. Specialized tours for specific collections offered.',
-                'nearby_attractions': 'Tahrir Square, Nile River Corniche, Cairo Tower, Downtown Cairo, Khan el-Khalili Bazaar (4 km), Islamic Cairo',
-                'facts': [
-                    'Houses over 120,000 Egyptian antiquities',
-                    'Established in 1835, current building opened 1902',
-                    'Contains Tutankhamun\'s gold burial mask',
-                    'Designed by French architect Marcel Dourgnon',
-                    'Library holds over 50,000 volumes',
-                    'Considered Africa\'s largest museum',
-                    'Experienced artifact damage during 2011 Revolution',
-                    '22 royal mummies transferred to new museum in 2021'
-                ],
-                'visitor_tips': [
-                    'Visit early to avoid crowds, especially for Tutankhamun galleries',
-                    'Hire Egyptologist guide for maximum educational value',
-                    'Allow minimum 3-4 hours for comprehensive visit',
-                    'Pay extra for Royal Mummy Room - worth it',
-                    'Photography allowed in most areas (50 EGP fee)',
-                    'Museum shop offers quality replicas and books',
-                    'Combine with Tahrir Square and downtown Cairo exploration'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1553913861-c0fddf2619ee?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '30.0478° N, 31.2336° E',
-                'unesco_status': 'Not a UNESCO site but houses UNESCO-recognized artifacts',
-                'climate': 'Hot desert climate. Museum climate-controlled year-round. Visit October-April for pleasant outdoor weather.'
-            },
-            'islamic-cairo': {
-                'id': 'islamic-cairo',
-                'name': 'Islamic Cairo',
-                'location': 'Cairo, Egypt',
-                'description': 'Historic medieval district with hundreds of mosques, markets, and Islamic monuments',
-                'long_description': 'Islamic Cairo, founded in 969 CE by the Fatimid Caliphate, encompasses one of the world\'s oldest and most concentrated collections of Islamic architecture and monuments. This historic district served as Egypt\'s royal city and administrative capital through multiple ruling dynasties including the Fatimids, Ayyubids, Mamluks, Ottomans, and Muhammad Ali\'s dynasty. The area features hundreds of historic mosques, madrasas, mausoleums, gates, walls, and the famous Khan el-Khalili bazaar. Notable landmarks include Al-Azhar Mosque, Ibn Tulun Mosque, the Citadel, and the vibrant Al-Mu\'izz Street, creating a living museum of Islamic civilization spanning over a millennium.',
-                'historical_significance': 'Islamic Cairo represents over 1,000 years of continuous Islamic civilization and architectural evolution. Founded as Al-Qahira (The Victorious) by the Fatimids, the district became the political and cultural heart of medieval Islamic Egypt. The area preserves extraordinary examples of Fatimid, Ayyubid, Mamluk, and Ottoman architecture. Al-Azhar Mosque, founded in 970 CE, became one of Islam\'s oldest universities and remains a premier center of Islamic learning. The historic street Al-Mu\'izz li-Din Allah contains the greatest concentration of medieval architectural treasures in the Islamic world.',
-                'cultural_impact': 'UNESCO World Heritage Site since 1979, recognized as "one of the world\'s oldest Islamic cities" covering 523.66 hectares. The area suffers from neglect and decay but ongoing restoration efforts by government and international organizations work to preserve this irreplaceable heritage. Khan el-Khalili bazaar remains a vibrant commercial center.',
-                'best_time_to_visit': 'October to April for comfortable weather. Early morning or late afternoon for exploring markets. Friday mornings busy with prayers.',
-                'how_to_get_there': 'Central Cairo location accessible by taxi, Uber, or Cairo Metro. Walking distance from Downtown Cairo. Many hotels in proximity.',
-                'entrance_fees': 'Individual monuments charge separate fees (typically 60-100 EGP each). Combination tickets available. Bazaar free to explore.',
-                'opening_hours': 'Varies by site. Mosques generally 9:00 AM to 5:00 PM (closed during prayers). Bazaar opens morning to late evening.',
-                'what_to_wear': 'Modest clothing essential. Women should cover shoulders and knees. Headscarf recommended for mosque visits. Comfortable walking shoes.',
-                'guided_tours': 'Professional guides recommended for navigating complex history and architecture. Walking tours of Al-Mu\'izz Street popular. Specialized Islamic architecture tours available.',
-                'nearby_attractions': 'Khan el-Khalili Bazaar, Al-Azhar Mosque, Citadel of Cairo, Ibn Tulun Mosque, Egyptian Museum (4 km), Nile River',
-                'facts': [
-                    'Founded in 969 CE by Fatimid Caliphate',
-                    'UNESCO World Heritage Site since 1979',
-                    'Covers 523.66 hectares',
-                    'Al-Azhar University founded 970 CE (oldest in Islam)',
-                    'Al-Mu\'izz Street: greatest concentration of medieval Islamic monuments',
-                    'Includes hundreds of historic mosques and monuments',
-                    'Spans Fatimid, Ayyubid, Mamluk, Ottoman periods',
-                    'Khan el-Khalili bazaar dates to 14th century'
-                ],
-                'visitor_tips': [
-                    'Hire knowledgeable guide for historical context',
-                    'Start early to avoid heat and crowds',
-                    'Allow full day for comprehensive exploration',
-                    'Dress modestly - required for mosque entry',
-                    'Bargain in Khan el-Khalili bazaar (start at 50% asking price)',
-                    'Visit Al-Mu\'izz Street pedestrian area',
-                    'Try traditional Egyptian coffee at historic cafes'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1553913861-c0fddf2619ee?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '30.0489° N, 31.2622° E',
-                'unesco_status': 'UNESCO World Heritage Site (Historic Cairo) since 1979',
-                'climate': 'Hot desert climate. Very hot summers (35-40°C). Mild winters (15-25°C). Best October-April.'
-            },
-            'muhammad-ali-mosque': {
-                'id': 'muhammad-ali-mosque',
-                'name': 'Muhammad Ali Mosque',
-                'location': 'Cairo, Egypt',
-                'description': 'Ottoman-style alabaster mosque crowning Cairo\'s historic Citadel',
-                'long_description': 'The Muhammad Ali Mosque, also known as the Alabaster Mosque, dominates Cairo\'s skyline from its commanding position within the Cairo Citadel. Commissioned by Muhammad Ali Pasha, an Ottoman governor who modernized Egypt, construction began in 1830 and was completed in 1857. This magnificent Ottoman-style mosque, designed with European influences, features extensive alabaster facing that gives it its nickname. The mosque showcases a central dome 21 meters in diameter reaching 52 meters high, flanked by two soaring 82-meter cylindrical minarets. The rectangular courtyard measures 55 by 57 meters, and the mosque can accommodate approximately 10,000 worshippers.',
-                'historical_significance': 'Muhammad Ali Pasha commissioned this mosque to symbolize his break from Istanbul and establish his dynasty\'s legitimacy. The design intentionally departed from traditional Cairene architectural styles, instead drawing inspiration from Istanbul\'s Blue Mosque and Hagia Sophia. This represented Muhammad Ali\'s modernization efforts and political independence from the Ottoman capital. The mosque contains Muhammad Ali\'s tomb in the western corner of the prayer hall. A monumental clock tower, gifted by French King Louis Philippe in exchange for the Luxor Obelisk, stands in the courtyard though it never functioned properly.',
-                'cultural_impact': 'One of Cairo\'s most prominent landmarks, visible across the city. Represents a radical architectural departure from traditional Islamic Cairo. The mosque symbolizes 19th-century Egypt\'s cultural and political transformations under Muhammad Ali\'s modernizing rule.',
-                'best_time_to_visit': 'October to April for pleasant weather. Early morning or late afternoon for best light. Sunset views of Cairo spectacular.',
-                'how_to_get_there': 'Located within Cairo Citadel in southern Cairo. Accessible by taxi or Uber. 15-20 minutes from Downtown Cairo.',
-                'entrance_fees': 'Citadel entrance approximately 200 EGP (includes mosque and other Citadel sites). Photography permitted.',
-                'opening_hours': 'Daily 8:00 AM to 5:00 PM. Closed to tourists during prayer times (approximately 15 minutes five times daily).',
-                'what_to_wear': 'Modest clothing required. Women must cover hair, shoulders, and knees. Headscarves provided if needed. Remove shoes before entering.',
-                'guided_tours': 'Included in most Citadel tours. Audio guides available. Egyptologist tours provide historical and architectural context.',
-                'nearby_attractions': 'Cairo Citadel, Sultan Hassan Mosque, Al-Rifai Mosque, Islamic Cairo, Ibn Tulun Mosque, Gayer-Anderson Museum',
-                'facts': [
-                    'Commissioned by Muhammad Ali Pasha in 1830',
-                    'Completed in 1857 after 27 years construction',
-                    'Known as "Alabaster Mosque" for extensive alabaster facing',
-                    'Central dome 21 meters diameter, 52 meters high',
-                    'Two 82-meter tall minarets',
-                    'Capacity approximately 10,000 people',
-                    'Contains Muhammad Ali\'s tomb',
-                    'French clock tower gift never functioned properly'
-                ],
-                'visitor_tips': [
-                    'Visit in morning for fewer crowds',
-                    'Combine with other Citadel attractions',
-                    'Panoramic Cairo views from Citadel walls',
-                    'Respect prayer times - mosque temporarily closes',
-                    'Photography allowed inside with restrictions',
-                    'Shoes removed and stored at entrance',
-                    'Allow 45-60 minutes for mosque visit'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '30.0288° N, 31.2602° E',
-                'unesco_status': 'Part of Historic Cairo UNESCO World Heritage Site',
-                'climate': 'Hot desert climate. Very hot summers (35-40°C). Mild winters (15-25°C). Best October-April.'
-            },
-            'hurghada': {
-                'id': 'hurghada',
-                'name': 'Hurghada',
-                'location': 'Red Sea, Egypt',
-                'description': 'Premier Red Sea resort destination famous for diving, beaches, and watersports',
-                'long_description': 'Hurghada, the capital of Egypt\'s Red Sea Governorate, has transformed from a small fishing village founded in 1905 into one of the world\'s premier resort destinations. This coastal city extends approximately 36 kilometers along the Red Sea coast and attracts over 1 million visitors annually. Known for crystal-clear waters, vibrant coral reefs, diverse marine life, and year-round warm climate, Hurghada offers world-class diving, snorkeling, windsurfing, and kitesurfing. The city features numerous beach resorts, the Hurghada Grand Aquarium, Hurghada Museum, and serves as a gateway for day trips to Luxor and Cairo.',
-                'historical_significance': 'While Hurghada itself is relatively modern (founded 1905), the region has ancient roots with Roman settlements nearby dating to the 4th century. The city\'s rapid transformation began in the 1980s when it emerged as Egypt\'s primary Red Sea resort destination. Hurghada\'s development represents Egypt\'s modern tourism industry evolution, with the city becoming home to a large Russian expatriate community and international resort infrastructure. The Hurghada Museum, opened recently, showcases artifacts from across Egyptian history.',
-                'cultural_impact': 'Hurghada serves as Egypt\'s primary Red Sea resort, attracting over 1 million annual visitors. The city is served by Hurghada International Airport, Egypt\'s second-busiest airport. Hurghada has become a major center for Red Sea diving tourism and marine conservation efforts.',
-                'best_time_to_visit': 'September to November and March to May for ideal weather. Year-round diving possible. Summer (June-August) very hot but water activities remain popular.',
-                'how_to_get_there': 'Hurghada International Airport receives international and domestic flights. 450 km from Cairo (5-hour drive). Regular bus services from Cairo and Luxor.',
-                'entrance_fees': 'City access free. Individual attractions charge separate fees: Hurghada Grand Aquarium (approximately 200 EGP), Hurghada Museum (100 EGP).',
-                'opening_hours': 'City operates 24/7. Museums and aquarium typically 9:00 AM to 5:00 PM. Dive centers operate dawn to dusk.',
-                'what_to_wear': 'Beach and resort casual. Swimwear for beaches and pools. Modest clothing for venturing into town. Sun protection essential.',
-                'guided_tours': 'Numerous diving centers offer PADI courses and guided dives. Day trips to Luxor, Cairo, and Giftun Islands widely available. Desert safari tours popular.',
-                'nearby_attractions': 'Giftun Islands, Mahmya Island, Makadi Bay, Sahl Hasheesh, El Gouna, Luxor (300 km), Cairo (450 km)',
-                'facts': [
-                    'Founded in 1905 as fishing village',
-                    'Over 1 million annual visitors',
-                    'Extends 36 kilometers along Red Sea coast',
-                    'Second busiest airport in Egypt',
-                    'Average annual sea temperature 24°C',
-                    'Population 214,247 (2023)',
-                    'Large Russian expatriate community',
-                    'Major center for Red Sea diving tourism'
-                ],
-                'visitor_tips': [
-                    'Book diving trips through reputable PADI-certified centers',
-                    'Giftun Islands day trips excellent for snorkeling',
-                    'Negotiate prices for watersports and excursions',
-                    'Many resorts offer all-inclusive packages',
-                    'Visit Hurghada Grand Aquarium on hot days',
-                    'Day trips to Luxor best booked through hotel',
-                    'Stay hydrated in summer heat'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1583037189850-1921ae7c6c22?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1559827260-dc66d52bef19?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1582719478250-c89cae4dc85b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1559827260-dc66d52bef19?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '27.2579° N, 33.8116° E',
-                'unesco_status': 'Not a UNESCO site but gateway to marine protected areas',
-                'climate': 'Subtropical desert climate. Very hot summers (up to 46°C). Mild winters. Average sea temperature 24°C year-round.'
-            },
-            'sharm-el-sheikh': {
-                'id': 'sharm-el-sheikh',
-                'name': 'Sharm El-Sheikh',
-                'location': 'Sinai Peninsula, Egypt',
-                'description': 'World-class diving resort at Sinai\'s southern tip, the "City of Peace"',
-                'long_description': 'Sharm El-Sheikh, located on the southern tip of Egypt\'s Sinai Peninsula along the Red Sea coast, has evolved from a small fishing village and military base into one of the world\'s premier resort destinations. Developed initially by Israel beginning in 1968 and returned to Egypt in 1982 following the Camp David Accords, the city is nicknamed the "City of Peace" for hosting numerous international peace conferences. Home to 91 resorts, Sharm El-Sheikh is renowned for year-round dry climate, crystal-clear calm waters, exceptional scuba diving and snorkeling around Ras Muhammad National Park, with 250 types of coral reefs and 1,000 fish species.',
-                'historical_significance': 'Originally a small fishing village and military base, Sharm El-Sheikh\'s modern development began in 1968 during Israeli occupation. The city was returned to Egypt in 1982 under the Camp David Accords and has since grown into Egypt\'s premier Sinai resort. The nickname "City of Peace" reflects its role hosting international conferences including Middle East peace summits. In 2022, Sharm El-Sheikh hosted the COP27 climate conference, demonstrating its evolution into an international diplomatic venue alongside its tourism role.',
-                'cultural_impact': 'Major international resort destination with world-class diving facilities. Hosted COP27 climate conference in 2022. Ras Muhammad National Park (established 1983) protects unique marine ecosystems. Sharm El-Sheikh serves as a model for sustainable Red Sea tourism development.',
-                'best_time_to_visit': 'September to November and March to May for ideal conditions. Year-round diving excellent. Winter (December-February) mild and pleasant.',
-                'how_to_get_there': 'Sharm El-Sheikh International Airport receives international and domestic flights. Regular coach services from Cairo (6-7 hours). Marina accommodates cruise ships and private yachts.',
-                'entrance_fees': 'City access free. Ras Muhammad National Park entrance approximately 100 EGP. Individual dive trips and excursions priced separately.',
-                'opening_hours': 'City operates 24/7. Ras Muhammad National Park 8:00 AM to 5:00 PM. Dive centers operate dawn to dusk.',
-                'what_to_wear': 'Beach resort casual. Swimwear for beaches and watersports. Modest clothing for town areas. Sun protection essential year-round.',
-                'guided_tours': 'Numerous PADI diving centers offer courses and guided dives. Desert safari tours, Mount Sinai sunrise treks, St. Catherine\'s Monastery visits popular.',
-                'nearby_attractions': 'Ras Muhammad National Park, Naama Bay, Shark Reef, Yolanda Reef, Mount Sinai, St. Catherine\'s Monastery, Dahab (90 km)',
-                'facts': [
-                    'Located at southern tip of Sinai Peninsula',
-                    'Nicknamed "City of Peace" for hosting peace conferences',
-                    'Home to 91 resorts (as of 2000)',
-                    'Red Sea temperatures 21-28°C year-round',
-                    '250 coral reef types, 1,000 fish species',
-                    'Ras Muhammad National Park established 1983',
-                    'Hosted COP27 climate conference 2022',
-                    'Returned to Egypt 1982 after Camp David Accords'
-                ],
-                'visitor_tips': [
-                    'Book diving trips through reputable PADI centers',
-                    'Visit Ras Muhammad National Park for best diving',
-                    'Naama Bay offers restaurants and nightlife',
-                    'Mount Sinai sunrise trek unforgettable experience',
-                    'All-inclusive resorts offer excellent value',
-                    'Respect marine life - no touching coral',
-                    'Airport transfers typically included in resort packages'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1582719478250-c89cae4dc85b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1583037189850-1921ae7c6c22?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1559827260-dc66d52bef19?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1559827260-dc66d52bef19?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '27.9158° N, 34.3300° E',
-                'unesco_status': 'Ras Muhammad National Park (nearby) internationally protected marine area',
-                'climate': 'Subtropical arid climate. Temperatures 18-23°C (January) to 33-37°C (August). Very low precipitation.'
-            },
-            'bibliotheca-alexandrina': {
-                'id': 'bibliotheca-alexandrina',
-                'name': 'Bibliotheca Alexandrina',
-                'location': 'Alexandria, Egypt',
-                'description': 'Modern revival of the ancient Library of Alexandria, major cultural center',
-                'long_description': 'The Bibliotheca Alexandrina, officially inaugurated on October 16, 2002, commemorates and revives the legendary ancient Library of Alexandria on the Mediterranean Sea coastline. Designed by Norwegian architectural firm Snøhetta (selected from 524 international competition entries), this US$220 million cultural complex features a distinctive tilted cylindrical form with a 32-meter-high glass-paneled roof resembling a sundial. The main reading room spans 20,000 square meters with shelf space for 8 million books. The complex includes specialized libraries, four museums, four art galleries, 15 permanent exhibitions, a planetarium, conference center, and manuscript restoration laboratory.',
-                'historical_significance': 'The Bibliotheca Alexandrina represents Egypt and UNESCO\'s effort to revive the spirit of the ancient Library of Alexandria, one of antiquity\'s greatest centers of learning destroyed centuries ago. The modern library received a 500,000-book donation from France\'s Bibliothèque nationale in 2009 and a $5 million donation plus 10 billion archived web pages from the Internet Archive. During Egypt\'s 2011 Revolution, the library was protected by citizens forming human chains, demonstrating its cultural importance. The library houses collections in classical Arabic, English, and French, plus the Nobel Prize Laureates in Literature collection.',
-                'cultural_impact': 'Major cultural and educational landmark for Egypt and the Mediterranean region. Houses extensive digital archives and serves as regional hub for Internet Archive. The library survived and was protected during 2011 Revolution. Serves as international conference center and educational institution.',
-                'best_time_to_visit': 'October to April for pleasant Mediterranean weather. Library less crowded weekday mornings. Allow 3-4 hours for comprehensive visit.',
-                'how_to_get_there': 'Located in Alexandria\'s Eastern Harbor area. Accessible by taxi, tram, or bus from central Alexandria. 220 km from Cairo (3-hour drive).',
-                'entrance_fees': 'General admission approximately 70 EGP. Additional fees for planetarium and special exhibitions. Photography fees apply.',
-                'opening_hours': 'Daily 10:00 AM to 7:00 PM. Closed Fridays and public holidays. Reduced summer hours during Ramadan.',
-                'what_to_wear': 'Casual, modest clothing. Comfortable shoes for exploring multiple levels. Library climate-controlled.',
-                'guided_tours': 'Professional guided tours available in multiple languages. Specialized architectural tours offered. Educational programs for students and researchers.',
-                'nearby_attractions': 'Citadel of Qaitbay (3 km), Alexandria Corniche, Catacombs of Kom El Shoqafa, Montaza Palace, Roman Amphitheater',
-                'facts': [
-                    'Inaugurated October 16, 2002',
-                    'Construction cost US$220 million',
-                    'Shelf space for 8 million books',
-                    'Main reading room 20,000 square meters',
-                    'Designed by Norwegian firm Snøhetta',
-                    'Selected from 524 competition entries',
-                    'Walls carved with 120 different scripts',
-                    'Internet Archive donated $5 million and 10 billion web pages'
-                ],
-                'visitor_tips': [
-                    'Allow 3-4 hours for comprehensive visit',
-                    'Visit planetarium show (additional ticket)',
-                    'Explore specialized libraries and exhibitions',
-                    'Library cafe offers Mediterranean views',
-                    'Photography permitted (fee required)',
-                    'Combine with Alexandria Corniche walk',
-                    'Research facilities available for scholars'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1553913861-c0fddf2619ee?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.2089° N, 29.9097° E',
-                'unesco_status': 'Not a UNESCO site but UNESCO-supported project',
-                'climate': 'Mediterranean climate. Mild winters (10-18°C). Warm summers (25-30°C). Best October-April.'
-            },
-            'citadel-qaitbay': {
-                'id': 'citadel-qaitbay',
-                'name': 'Citadel of Qaitbay',
-                'location': 'Alexandria, Egypt',
-                'description': 'Medieval fortress built on ancient Lighthouse of Alexandria foundations',
-                'long_description': 'The Citadel of Qaitbay, standing 17 meters high on Alexandria\'s Mediterranean coast, represents one of Egypt\'s most important defensive fortifications. Built between 1477-1479 AD by Mamluk Sultan Al-Ashraf Sayf al-Din Qa\'it Bay, this fortress was constructed on the exact site of the legendary Lighthouse of Alexandria (Pharos), one of the Seven Wonders of the Ancient World. The citadel\'s builders incorporated stones from the lighthouse ruins into the fortress walls. The site served critical defensive roles during the Mamluk period, protecting Alexandria against potential Ottoman threats, and now functions as a Maritime Museum.',
-                'historical_significance': 'Built on the site of the ancient Pharos Lighthouse (one of the Seven Wonders of the Ancient World), the Citadel of Qaitbay incorporated stones from the lighthouse ruins destroyed by earthquakes. Constructed during the Mamluk period to defend against Ottoman expansion, the fortress represents Mamluk military architecture. The citadel suffered damage during the British bombardment of Alexandria in 1882 during the Urabi Revolt. Muhammad Ali Pasha renovated the structure in 1805, and the Egyptian Antiquities Organization restored it in 1984. The citadel has witnessed Alexandria\'s transitions through Mamluk, Ottoman, and modern Egyptian periods.',
-                'cultural_impact': 'Considered "one of the most important defensive strongholds" along the Mediterranean coast during the Mamluk period. Now functions as Maritime Museum. Popular tourist attraction offering Mediterranean views and connection to ancient Alexandria.',
-                'best_time_to_visit': 'October to April for pleasant Mediterranean weather. Sunset visits particularly scenic. Combine with Alexandria Corniche walk.',
-                'how_to_get_there': 'Located at eastern tip of Pharos Island in Alexandria. Accessible by taxi or tram from central Alexandria. Walking distance from Alexandria Corniche.',
-                'entrance_fees': 'General admission approximately 60 EGP. Additional fee for Maritime Museum. Photography permitted.',
-                'opening_hours': 'Daily 9:00 AM to 5:00 PM (winter), 9:00 AM to 6:00 PM (summer). Friday mornings may have restrictions.',
-                'what_to_wear': 'Comfortable walking shoes for fortress exploration. Casual, modest clothing. Sun protection recommended.',
-                'guided_tours': 'Professional guides available explaining Mamluk architecture and Pharos Lighthouse history. Audio guides in multiple languages.',
-                'nearby_attractions': 'Bibliotheca Alexandrina (3 km), Alexandria Corniche, Montaza Palace, Catacombs of Kom El Shoqafa, Pompey\'s Pillar',
-                'facts': [
-                    'Built 1477-1479 AD by Sultan Qa\'it Bay',
-                    'Constructed on site of ancient Pharos Lighthouse',
-                    'Incorporates stones from lighthouse ruins',
-                    'Height 17 meters',
-                    'Damaged in British bombardment of 1882',
-                    'Renovated by Muhammad Ali Pasha in 1805',
-                    'Restored by Egyptian Antiquities Organization in 1984',
-                    'Now functions as Maritime Museum'
-                ],
-                'visitor_tips': [
-                    'Visit at sunset for spectacular Mediterranean views',
-                    'Explore Maritime Museum inside fortress',
-                    'Combine with Bibliotheca Alexandrina visit',
-                    'Walk Alexandria Corniche to/from citadel',
-                    'Allow 1-2 hours for exploration',
-                    'Fortress offers excellent photo opportunities',
-                    'Learn about ancient Pharos Lighthouse from guides'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.2138° N, 29.8856° E',
-                'unesco_status': 'Not a UNESCO site but built on former Wonder of the World location',
-                'climate': 'Mediterranean climate. Mild winters (10-18°C). Warm summers (25-30°C). Sea breezes moderate temperatures.'
-            },
-            'aswan-high-dam': {
-                'id': 'aswan-high-dam',
-                'name': 'Aswan High Dam',
-                'location': 'Aswan, Egypt',
-                'description': 'Massive engineering marvel controlling Nile floods and generating hydroelectric power',
-                'long_description': 'The Aswan High Dam, one of the world\'s largest embankment dams, stands as a monument to modern engineering and Egypt\'s 20th-century development ambitions. Constructed between 1960-1970 and designed by Nikolai Aleksandrovich Malyshev from Moscow\'s Hydroproject Institute, the dam measures 3,830 meters long, 980 meters wide at the base, and 111 meters high. The project created Lake Nasser, a massive 500-kilometer-long reservoir with capacity for 132 cubic kilometers of water. Built primarily with Soviet funding after the United States and UK withdrew support, 25,000 Egyptian engineers and workers contributed to this transformative project.',
-                'historical_significance': 'The Aswan High Dam represented Egypt\'s modernization under President Gamal Abdel Nasser and a major Cold War-era infrastructure project symbolizing Soviet-Egyptian cooperation. The dam mitigated periodic floods and droughts that had plagued Egypt for millennia, increased irrigated land by one-third, enabled two crop cycles annually, and reclaimed approximately 840,000 hectares of land. Twelve generators produce 2.1 gigawatts of power, bringing electricity to many Egyptian villages for the first time. However, the project displaced over 100,000 Nubian people and submerged archaeological sites, prompting the famous UNESCO campaign to relocate Abu Simbel and other monuments.',
-                'cultural_impact': 'Symbolized Egypt\'s modernization and technological ambition under Nasser. Required displacement of 100,000+ Nubians and submersion of archaeological sites. Prompted UNESCO\'s largest archaeological rescue operation (relocating Abu Simbel, Philae, and other monuments). Changed Nile ecology and Mediterranean fisheries.',
-                'best_time_to_visit': 'October to April for pleasant weather. Early morning visits offer cooler temperatures and clearer views. Combine with Philae Temple visit.',
-                'how_to_get_there': 'Located 13 km south of Aswan. Accessible by taxi or organized tours from Aswan. Often combined with Philae Temple and Unfinished Obelisk tours.',
-                'entrance_fees': 'General admission approximately 75 EGP. Photography permitted. Guided tours available.',
-                'opening_hours': 'Daily 7:00 AM to 5:00 PM. Security checkpoints at entrance. Photography restrictions in certain areas.',
-                'what_to_wear': 'Comfortable walking shoes. Sun protection essential. Modest clothing. Windy conditions possible near dam.',
-                'guided_tours': 'Tours from Aswan hotels include dam visit, Philae Temple, and Unfinished Obelisk. Guides explain engineering and historical significance.',
-                'nearby_attractions': 'Philae Temple, Unfinished Obelisk, Lake Nasser, Kalabsha Temple, Abu Simbel Temples (280 km south), Nubian villages',
-                'facts': [
-                    'Constructed 1960-1970',
-                    'Length 3,830 meters, height 111 meters',
-                    'Created Lake Nasser (500 km long)',
-                    'Reservoir capacity 132 cubic kilometers',
-                    '12 generators produce 2.1 gigawatts',
-                    'Displaced 100,000+ Nubian people',
-                    'Increased irrigated land by one-third',
-                    'Built with Soviet funding and Egyptian labor'
-                ],
-                'visitor_tips': [
-                    'Visit morning for best views and cooler weather',
-                    'Combine with Philae Temple and Unfinished Obelisk',
-                    'Allow 45-60 minutes for visit',
-                    'Bring ID - security checkpoints present',
-                    'Photography restricted in certain areas',
-                    'Panoramic Lake Nasser views from dam top',
-                    'Learn about Nubian displacement from guides'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '23.9703° N, 32.8773° E',
-                'unesco_status': 'Not a UNESCO site but prompted major UNESCO archaeological rescue campaign',
-                'climate': 'Hot desert climate. Extremely hot summers (40°C+). Mild winters (15-25°C). Best October-April.'
-            },
-            'siwa-oasis': {
-                'id': 'siwa-oasis',
-                'name': 'Siwa Oasis',
-                'location': 'Western Desert, Egypt',
-                'description': 'Remote desert oasis famous for Oracle of Amun, visited by Alexander the Great',
-                'long_description': 'Siwa Oasis, located in Egypt\'s Western Desert approximately 560 km from Cairo, sits between the Qattara Depression and the Great Sand Sea at 19 meters below sea level. This remarkable oasis covers about 80 km in length and 20 km in width, featuring around 200 natural springs that have sustained settlement since at least the 10th millennium BCE. Known in ancient Egypt as the "Field of Trees," Siwa gained fame for its Oracle of Amun, which Alexander the Great visited in 331 BCE. The predominantly Berber population of around 30,000 people speaks the Siwi language and maintains unique cultural traditions including distinctive silver jewelry and the Siyaha Festival.',
-                'historical_significance': 'Siwa has been continuously inhabited since at least the 10th millennium BCE. The Oracle of Amun at Siwa was one of the ancient world\'s most famous oracles, consulted by Alexander the Great in 331 BCE who traveled here to legitimize his rule as pharaoh. The oasis was relatively isolated until annexed by Muhammad Ali of Egypt in 1820. During World Wars I and II, the region experienced significant military activity due to its strategic location. The ancient fortress of Shali Ghadi and the Mountain of the Dead (Gebel al Mawta) containing ancient tombs testify to Siwa\'s long history.',
-                'cultural_impact': 'Siwa\'s Berber culture remains distinct from mainstream Egyptian culture. The oasis is famous for unique cultural traditions, handicrafts, and the natural spring known as "Cleopatra\'s Bath." Growing tourism sector brings economic opportunity while challenging cultural preservation.',
-                'best_time_to_visit': 'October to April for moderate temperatures. Summer extremely hot (up to 48°C). October Siyaha Festival offers cultural immersion.',
-                'how_to_get_there': 'Located 560 km from Cairo. Accessible by 8-10 hour bus journey from Cairo or Marsa Matrouh. 4WD vehicles recommended for desert exploration.',
-                'entrance_fees': 'Oasis access free. Individual sites charge fees: Oracle Temple (approximately 30 EGP), Mountain of the Dead (30 EGP).',
-                'opening_hours': 'Oasis operates 24/7. Archaeological sites typically 8:00 AM to 5:00 PM. Natural springs accessible dawn to dusk.',
-                'what_to_wear': 'Modest clothing respecting conservative local culture. Comfortable shoes for oasis exploration. Sun protection essential. Layers for temperature variations.',
-                'guided_tours': 'Organized tours from Cairo include transport and accommodation. Local guides offer desert safaris and cultural tours. Multi-day trips recommended.',
-                'nearby_attractions': 'Oracle Temple of Amun, Shali Ghadi fortress, Gebel al Mawta (Mountain of the Dead), Cleopatra\'s Bath spring, Great Sand Sea',
-                'facts': [
-                    'Located 560 km from Cairo, 19 meters below sea level',
-                    'Settled since 10th millennium BCE',
-                    'Oracle of Amun visited by Alexander the Great (331 BCE)',
-                    'Around 200 natural springs',
-                    'Covers 80 km length, 20 km width',
-                    'Population approximately 30,000 Berber people',
-                    'Speaks unique Siwi language',
-                    'Summer temperatures reach 48°C'
-                ],
-                'visitor_tips': [
-                    'Plan minimum 2-3 days to experience oasis properly',
-                    'Dress modestly - conservative Berber community',
-                    'Book accommodation in advance (limited options)',
-                    'Try dates and olives - primary local crops',
-                    'Visit natural springs for refreshing swim',
-                    'Explore Shali Ghadi fortress at sunset',
-                    'Hire local guide for desert safaris'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '29.2028° N, 25.5194° E',
-                'unesco_status': 'Not formally UNESCO listed but culturally significant',
-                'climate': 'Hot desert climate. Extremely hot summers (up to 48°C). Mild winters. Very low precipitation.'
-            },
-            'hatshepsut-temple': {
-                'id': 'hatshepsut-temple',
-                'name': 'Hatshepsut Temple',
-                'location': 'Luxor, Egypt',
-                'description': 'Spectacular mortuary temple of Egypt\'s female pharaoh carved into cliff face',
-                'long_description': 'The Mortuary Temple of Hatshepsut at Deir el-Bahari, located opposite Luxor, stands as one of ancient Egypt\'s greatest architectural wonders. Built during Hatshepsut\'s reign in the 15th century BC, this spectacular temple features three massive terraces rising into limestone cliff faces, constructed with limestone, sandstone, and granite. Inspired by the adjacent Temple of Mentuhotep II, the complex includes shrines to Hathor, Anubis, and Amun, with unique porticoes featuring remarkable relief artwork depicting Hatshepsut\'s expedition to Punt and her divine birth. The temple was aligned with Karnak Temple across the Nile and served the mortuary cults of Hatshepsut and her father Thutmose I.',
-                'historical_significance': 'Built by Egypt\'s most successful female pharaoh Hatshepsut in the 15th century BC, the temple demonstrated her architectural and political ambitions. The temple served as the endpoint of the annual Beautiful Festival of the Valley procession from Karnak. After Hatshepsut\'s death, her successor Thutmose III systematically defaced her images and cartouches in an attempt to erase her from history. The temple suffered further damage during the Amarna Period and from earthquakes in the Third Intermediate Period. Extensively excavated between 1893-1936, ongoing Polish archaeological missions continue restoration work. The temple partially opened to tourists in 2000 and fully reopened in March 2023.',
-                'cultural_impact': 'Considered "one of the great architectural wonders of the ancient world." Represents rare example of female pharaoh\'s monumental architecture. Extensive excavation and restoration by Polish missions since 1960s. Fully reopened to public in March 2023.',
-                'best_time_to_visit': 'October to April for comfortable weather. Early morning visits (6-8 AM) avoid extreme heat and crowds. Combine with Valley of the Kings.',
-                'how_to_get_there': 'Located on Luxor\'s West Bank in Deir el-Bahari. Accessible by ferry from East Bank, then taxi or tour bus. Often combined with Valley of the Kings.',
-                'entrance_fees': 'General admission approximately 140 EGP. Combination tickets with other West Bank sites available. Photography permitted.',
-                'opening_hours': 'Daily 6:00 AM to 5:00 PM (winter), 6:00 AM to 6:00 PM (summer). Last entry one hour before closing.',
-                'what_to_wear': 'Comfortable walking shoes for temple terraces. Light, breathable clothing. Hat and sun protection essential. Modest dress recommended.',
-                'guided_tours': 'Egyptologist-led tours highly recommended for understanding Hatshepsut\'s history and temple symbolism. Audio guides available.',
-                'nearby_attractions': 'Valley of the Kings, Valley of the Queens, Medinet Habu, Colossi of Memnon, Tombs of the Nobles, Ramesseum',
-                'facts': [
-                    'Built in 15th century BC by female pharaoh Hatshepsut',
-                    'Considered "one of great architectural wonders of ancient world"',
-                    'Features three massive terraces rising into cliffs',
-                    'Aligned with Karnak Temple across Nile',
-                    'Defaced by Thutmose III after Hatshepsut\'s death',
-                    'Excavated extensively 1893-1936',
-                    'Ongoing Polish restoration since 1960s',
-                    'Fully reopened March 2023 after restoration'
-                ],
-                'visitor_tips': [
-                    'Visit early morning to avoid heat',
-                    'Combine with Valley of the Kings (nearby)',
-                    'Allow 1.5-2 hours for exploration',
-                    'Climb all three terraces for full experience',
-                    'Study Punt expedition reliefs - historically significant',
-                    'Photography excellent in morning light',
-                    'Hire Egyptologist guide for Hatshepsut\'s fascinating story'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1503177119275-0aa32b3a9368?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1553913861-c0fddf2619ee?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.7380° N, 32.6065° E',
-                'unesco_status': 'UNESCO World Heritage Site (Ancient Thebes with its Necropolis) since 1979',
-                'climate': 'Hot desert climate. Summer extremely hot (40°C+). Winter pleasant (15-25°C). Best October-April.'
-            },
-            'dahab': {
-                'id': 'dahab',
-                'name': 'Dahab',
-                'location': 'Sinai Peninsula, Egypt',
-                'description': 'Laid-back Bedouin beach town famous for world-class windsurfing and diving',
-                'long_description': 'Dahab, located on the southeast coast of Egypt\'s Sinai Peninsula approximately 80 km northeast of Sharm el-Sheikh, has evolved from a small Bedouin fishing village into a world-renowned destination for windsurfing, diving, and alternative tourism. Situated at 21 meters above sea level, the town is divided into three main parts: Masbat (including the Bedouin village Asalah with its beachfront cafes), Mashraba, and Medina. Dahab offers a more relaxed, bohemian atmosphere than Sharm el-Sheikh, with beach cafes, budget accommodations, and some of the Red Sea\'s best diving sites. The town features Neoproterozoic rock formations and mineral deposits including rutile, zircon, and gold.',
-                'historical_significance': 'Dahab is mentioned in biblical texts (Deuteronomy) as "דִ֥י זָהָֽב" (dî zāhāḇ). During the Six-Day War in 1967, it was occupied by Israel and known as Di-Zahav, serving as a small military outpost and beginning its transformation into a tourist destination. The town was returned to Egyptian control in 1982 under the Egypt-Israel peace treaty. Since then, Dahab has developed its reputation as a windsurfing and diving destination while maintaining its laid-back Bedouin character. The town remains less developed and more authentic than nearby Sharm el-Sheikh.',
-                'cultural_impact': 'World-renowned for windsurfing and kitesurfing, attracting international enthusiasts. Known for relaxed, bohemian atmosphere and Bedouin cultural influence. Popular budget alternative to Sharm el-Sheikh. Part of Red Sea Riviera tourism region.',
-                'best_time_to_visit': 'March to May and September to November for ideal conditions. Year-round windsurfing excellent. Winter (December-February) cooler but still pleasant.',
-                'how_to_get_there': 'Located 80 km northeast of Sharm el-Sheikh. Accessible by bus or shared taxi from Sharm, Cairo, or Nuweiba. Sharm el-Sheikh Airport nearest international airport.',
-                'entrance_fees': 'Town access free. Individual dive sites and activities priced separately. Beach cafes typically free with food/drink purchase.',
-                'opening_hours': 'Town operates 24/7. Beach cafes open dawn to late night. Dive centers operate 7:00 AM to 6:00 PM.',
-                'what_to_wear': 'Beach casual and bohemian style common. Modest clothing for venturing beyond beach areas. Wetsuit for diving. Sun protection essential.',
-                'guided_tours': 'Numerous dive centers offer PADI courses and guided dives. Windsurfing and kitesurfing instruction available. Bedouin desert safari tours popular.',
-                'nearby_attractions': 'Blue Hole dive site, Lighthouse dive site, Ras Abu Gallum nature reserve, Mount Sinai, Colored Canyon, St. Catherine\'s Monastery',
-                'facts': [
-                    'Located 80 km northeast of Sharm el-Sheikh',
-                    'Population approximately 3,169 (2023)',
-                    'World-renowned for windsurfing and kitesurfing',
-                    'Mentioned in biblical Deuteronomy',
-                    'Occupied by Israel 1967-1982',
-                    'Hot desert climate (Köppen: BWh)',
-                    'Elevation 21 meters above sea level',
-                    'Contains mineral deposits including gold'
-                ],
-                'visitor_tips': [
-                    'Blue Hole dive site world-famous but challenging',
-                    'Beach cafes offer cushioned seating and shisha',
-                    'Negotiate accommodation prices - many budget options',
-                    'Respect Bedouin culture and traditions',
-                    'Try camel treks to Ras Abu Gallum',
-                    'More laid-back atmosphere than Sharm el-Sheikh',
-                    'Local Bedouin children often sell handmade crafts'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1582719478250-c89cae4dc85b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1583037189850-1921ae7c6c22?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1559827260-dc66d52bef19?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '28.4928° N, 34.5044° E',
-                'unesco_status': 'Not a UNESCO site but near protected areas',
-                'climate': 'Hot desert climate. Extremely hot summer days/nights. Warm winter days, mild nights. Minimal precipitation.'
-            },
-            'marsa-alam': {
-                'id': 'marsa-alam',
-                'name': 'Marsa Alam',
-                'location': 'Red Sea, Egypt',
-                'description': 'Emerging Red Sea resort known as "Egyptian Maldives" for pristine beaches and marine life',
-                'long_description': 'Marsa Alam, located in southeastern Egypt on the Red Sea\'s western shore, sits 274 km south of Hurghada and 134 km south of Qusayr. This relatively new resort town, with development beginning in 1995 by Kuwait\'s Al-Kharafi Group, covers 38,433 square kilometers at approximately 60 meters elevation. Known as the "Egyptian Maldives" for its crystal-clear water and white sandy beaches, Marsa Alam offers exceptional underwater diving, kitesurfing, and safaris. The region features Wadi El Gemal National Park with diverse wildlife including mountain goats, gazelles, dugongs, green turtles, and whale sharks. The area also provides access to historic emerald mines and the Temple of Seti I at Khanais.',
-                'historical_significance': 'While Marsa Alam itself is modern (development from 1995), the region has ancient significance with historic emerald mines that supplied the Roman Empire and the Temple of Seti I at nearby Khanais dating to the 19th Dynasty. The town\'s growth accelerated with the opening of Marsa Alam International Airport in 2003, transforming it from a small fishing village into an international resort destination. The establishment of Wadi El Gemal National Park protects the region\'s unique desert and marine ecosystems. Marsa Alam represents Egypt\'s effort to develop sustainable Red Sea tourism south of traditional centers like Hurghada.',
-                'cultural_impact': 'Nicknamed "Egyptian Maldives" for pristine beaches and marine life. Wadi El Gemal National Park protects unique ecosystems including dugongs, whale sharks, and mangroves. Growing reputation for eco-tourism and sustainable diving. Port Ghalib Marina developed for yacht tourism.',
-                'best_time_to_visit': 'September to November and March to May for ideal weather. Year-round diving excellent. Red Sea water temperatures 22-29°C.',
-                'how_to_get_there': 'Marsa Alam International Airport receives international and domestic flights. Located 274 km south of Hurghada (4-hour drive). Road access from Cairo and Luxor.',
-                'entrance_fees': 'Town access free. Wadi El Gemal National Park entrance approximately 100 EGP. Individual dive trips priced separately.',
-                'opening_hours': 'Town operates 24/7. Wadi El Gemal National Park 8:00 AM to 5:00 PM. Dive centers operate dawn to dusk.',
-                'what_to_wear': 'Beach resort casual. Swimwear for beaches and watersports. Modest clothing for town areas. Sun protection essential year-round.',
-                'guided_tours': 'PADI diving centers offer courses and guided dives to pristine reefs. Desert safaris to historic emerald mines popular. Dolphin and dugong watching tours available.',
-                'nearby_attractions': 'Wadi El Gemal National Park, Port Ghalib, Temple of Seti I at Khanais, historic emerald mines, Hamata Islands, Luxor (300 km)',
-                'facts': [
-                    'Development began 1995 by Kuwaiti Al-Kharafi Group',
-                    'Known as "Egyptian Maldives"',
-                    'Covers 38,433 square kilometers',
-                    'Marsa Alam Airport opened 2003',
-                    'Red Sea temperatures 22-29°C',
-                    'January temperatures 22-25°C, August 33-40°C',
-                    'Wadi El Gemal National Park protects dugongs, whale sharks',
-                    'Historic emerald mines supplied Roman Empire'
-                ],
-                'visitor_tips': [
-                    'Less crowded alternative to Hurghada',
-                    'Excellent for spotting dugongs and dolphins',
-                    'Visit Wadi El Gemal National Park for wildlife',
-                    'Pristine reefs less damaged than northern Red Sea',
-                    'Port Ghalib offers upscale marina and shopping',
-                    'Consider day trip to historic emerald mines',
-                    'Book diving trips through reputable PADI centers'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1559827260-dc66d52bef19?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1582719478250-c89cae4dc85b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1583037189850-1921ae7c6c22?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.0631° N, 34.8914° E',
-                'unesco_status': 'Wadi El Gemal National Park (nearby) nationally protected area',
-                'climate': 'Hot desert climate. Minimal rainfall. January 22-25°C, August 33-40°C. Red Sea water 22-29°C year-round.'
-            },
-            'catacombs-kom-el-shoqafa': {
-                'id': 'catacombs-kom-el-shoqafa',
-                'name': 'Catacombs of Kom El Shoqafa',
-                'location': 'Alexandria, Egypt',
-                'description': 'Underground necropolis blending Egyptian, Greek, and Roman cultural elements',
-                'long_description': 'The Catacombs of Kom El Shoqafa, located in Alexandria, represent one of the "Seven Wonders of the Middle Ages" and one of the largest Roman-period burial sites in Egypt. Established in the 2nd century CE during the Antonine emperors\' period, this remarkable underground complex consists of three levels cut through solid rock, featuring a six-pillared central shaft and circular staircase for transporting deceased bodies. The catacombs demonstrate a unique fusion of Roman, Greek, and Egyptian cultural attributes, with statues and artwork displaying Egyptian-style sculptures bearing Roman clothes and hairstyles. The site was rediscovered in 1900 when a donkey accidentally fell into the access shaft.',
-                'historical_significance': 'Built in the 2nd century CE and used through the 4th century CE, the Catacombs of Kom El Shoqafa represent the cultural melting pot of Greco-Roman Alexandria. Originally believed to be intended for a single family, the complex expanded to accommodate multiple burials. The catacombs feature a triclinium (funeral banquet hall) where families gathered to honor the deceased, three large stone sarcophagi with intricate decorations, and the "Hall of Caracalla" containing horse bones from young men supposedly killed by Emperor Caracalla. The site\'s name "Kom El Shoqafa" (Mound of Shards) derives from broken pottery left by visitors bringing food offerings.',
-                'cultural_impact': 'Considered one of the "Seven Wonders of the Middle Ages." Represents unique blend of Egyptian, Greek, and Roman funerary traditions. Rediscovered accidentally in 1900. Depth reaches approximately 100 feet underground.',
-                'best_time_to_visit': 'October to April for pleasant Alexandria weather. Underground temperature constant year-round. Allow 1-1.5 hours for visit.',
-                'how_to_get_there': 'Located in Alexandria\'s Karmouz district. Accessible by taxi or tram from central Alexandria. 3-4 km from Alexandria Corniche.',
-                'entrance_fees': 'General admission approximately 80 EGP. Student discounts available. Photography fees may apply.',
-                'opening_hours': 'Daily 9:00 AM to 5:00 PM. Last entry 4:30 PM. May close early on Fridays.',
-                'what_to_wear': 'Comfortable walking shoes for underground stairs and passages. Modest clothing. Temperature cool underground - light jacket recommended.',
-                'guided_tours': 'Professional guides available explaining Greco-Roman funerary practices and architectural symbolism. Audio guides in multiple languages.',
-                'nearby_attractions': 'Pompey\'s Pillar (nearby), Citadel of Qaitbay, Bibliotheca Alexandrina, Alexandria Corniche, Roman Amphitheater, Alexandria National Museum',
-                'facts': [
-                    'Established 2nd century CE',
-                    'Considered "Seven Wonders of the Middle Ages"',
-                    'Rediscovered 1900 when donkey fell into shaft',
-                    'Three underground levels cut through solid rock',
-                    'Blends Egyptian, Greek, and Roman cultural elements',
-                    'Used for burials 2nd-4th centuries CE',
-                    'Depth approximately 100 feet underground',
-                    '"Hall of Caracalla" contains horse bones'
-                ],
-                'visitor_tips': [
-                    'Bring light jacket - cool underground',
-                    'Watch your step on circular staircase',
-                    'Hire guide for understanding cultural fusion',
-                    'Combine with Pompey\'s Pillar (nearby)',
-                    'Photography restrictions may apply',
-                    'Allow 1-1.5 hours for exploration',
-                    'Study statues showing cultural blend'
-                ],
-                'photos': [
-                    'https://images.unsplash.com/photo-1553913861-c0fddf2619ee?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568322445389-f64ac2515020?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1572252009286-268acec5ca0a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1539768942893-daf53e448371?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '31.1781° N, 29.8925° E',
-                'unesco_status': 'Not formally UNESCO listed but historically significant',
-                'climate': 'Mediterranean climate above ground. Underground temperature constant and cool year-round. Best October-April.'
-            }
-        },
-        'uae': {
-            'burj-khalifa': {
-                'id': 'burj-khalifa',
-                'name': 'Burj Khalifa',
-                'location': 'Dubai, UAE',
-                'description': 'The world\'s tallest building standing at 828 meters with 163 floors and panoramic observation decks.',
-                'long_description': 'Burj Khalifa stands as the world\'s tallest building at over 828 meters with 163 floors, receiving 6 million visitors annually. This architectural marvel dominates Dubai\'s skyline and offers unparalleled panoramic views of the city, desert, and ocean from its observation decks on the 124th, 125th, and 148th floors.',
-                'historical_significance': 'Completed in 2010, Burj Khalifa was designed by Adrian Smith of Skidmore, Owings & Merrill. The tower broke numerous height records and remains the tallest free-standing structure in the world. Its construction represented Dubai\'s emergence as a global city.',
-                'architecture': 'The building\'s Y-shaped floor plan is designed to maximize views of the Arabian Gulf. The structure is built using over 330,000 cubic meters of concrete and 39,000 tonnes of steel. The exterior cladding consists of reflective glazing and aluminum panels.',
-                'discovery': 'Burj Khalifa emerged as a symbol of Dubai\'s ambition during the global financial crisis. The project continued despite economic challenges, representing resilience and vision. The tower\'s design evolved through multiple iterations, with the final Y-shaped plan chosen for structural stability and aesthetic appeal. Its completion in 2010 marked a new era in skyscraper construction.',
-                'cultural_impact': 'Burj Khalifa has become an iconic symbol of modern Dubai and the UAE\'s emergence as a global destination. The tower appears in countless photographs, films, and media representations of the city. It has inspired architectural innovation worldwide and represents the UAE\'s blend of traditional Islamic design principles with cutting-edge engineering. The building hosts cultural events and exhibitions, contributing to Dubai\'s cultural landscape.',
-                'conservation': 'Burj Khalifa incorporates sustainable design features including high-performance glazing, efficient lighting systems, and advanced building management technology. The tower uses recycled water for landscaping and implements energy-efficient systems throughout. Regular maintenance and structural monitoring ensure the building\'s longevity and safety. The development includes green spaces and pedestrian-friendly areas around the base.',
-                'health_safety': 'The tower features advanced safety systems including earthquake-resistant design, fire suppression systems, and emergency evacuation procedures. Observation decks have capacity limits and safety barriers. Visitors should wear comfortable shoes for extensive walking and queuing. The building provides accessibility features for visitors with disabilities. Medical facilities are available in the surrounding Dubai Mall.',
-                'guided_tours': 'Official guided tours are available through the Burj Khalifa website and authorized operators. Audio guides in multiple languages provide detailed information about the building\'s construction and history. VIP tours offer exclusive access to restricted areas. Photography tours and architectural walking tours are available for special interest groups. Educational programs for students focus on engineering and design principles.',
-                'facts': [
-                    'World\'s tallest building at 828 meters',
-                    'Has 163 floors above ground',
-                    'Receives 6 million visitors annually',
-                    'Observation decks on 124th, 125th, and 148th floors',
-                    'Contains 57 elevators and 8 escalators',
-                    'The building sways up to 1.5 meters at the top during high winds',
-                    'Construction took 6 years from 2004-2010'
-                ],
-                'key_sites': [
-                    {'name': 'At The Top (Level 124-125)', 'slug': 'at-the-top-level-124-125', 'description': 'Observation deck at 452-456 meters', 'significance': 'Standard observation experience with 360-degree views'},
-                    {'name': 'At The Top SKY (Level 148)', 'slug': 'at-the-top-sky-level-148', 'description': 'Highest observation deck at 555 meters', 'significance': 'Premium experience with highest outdoor terrace in the world'},
-                    {'name': 'The Lounge', 'slug': 'the-lounge', 'description': 'Luxury lounge on levels 152-154', 'significance': 'Exclusive refreshments with stunning views'},
-                    {'name': 'Armani Hotel', 'slug': 'armani-hotel', 'description': 'Hotel occupying floors 1-8 and 38-39', 'significance': 'World\'s first Armani Hotel designed by Giorgio Armani'}
-                ],
-                'entrance_fees': 'At The Top: 149-189 AED. At The Top SKY: 378-533 AED. Prices vary by time slot.',
-                'opening_hours': '8:30 AM to 11:00 PM daily. Last entry at 10:00 PM.',
-                'best_time': 'Sunset hours (around 6-7 PM) for spectacular views. Book in advance.',
-                'how_to_get_there': 'Located in Downtown Dubai. Metro: Dubai Mall/Burj Khalifa Station. Taxi and private car access available.',
-                'what_to_wear': 'Casual smart attire. Comfortable shoes for queues.',
-                'visitor_tips': [
-                    'Book tickets online in advance to skip queues',
-                    'Visit at sunset for day and night views',
-                    'Non-prime hours (early morning) have lower prices',
-                    'Dubai Fountain show visible from base every 30 minutes',
-                    'Photography allowed on all observation decks',
-                    'Allow 2-3 hours for complete experience'
-                ],
-                'nearby_attractions': 'Dubai Mall (adjacent), Dubai Fountain (base), Souk Al Bahar (500m), Dubai Opera (1km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.1972° N, 55.2744° E',
-                'annual_visitors': '6 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'sheikh-zayed-mosque': {
-                'id': 'sheikh-zayed-mosque',
-                'name': 'Sheikh Zayed Grand Mosque',
-                'location': 'Abu Dhabi, UAE',
-                'description': 'One of the largest mosques in the world with capacity for 41,000 worshippers, featuring stunning white marble architecture.',
-                'long_description': 'The Sheikh Zayed Grand Mosque is one of the largest mosques ever built with capacity for 41,000 worshippers. This architectural masterpiece features 82 domes, over 1,000 columns, 24-carat gold gilded chandeliers, and the world\'s largest hand-knotted carpet. Visiting the mosque is free of charge.',
-                'historical_significance': 'Named after Sheikh Zayed bin Sultan Al Nahyan, the founder and first president of the UAE. Construction began in 1996 and was completed in 2007. The mosque represents the late president\'s vision of cultural diversity and tolerance.',
-                'architecture': 'The mosque combines architectural styles from different Muslim civilizations. It features 82 domes of seven different sizes, over 1,000 columns, and is adorned with semi-precious stones including lapis lazuli, red agate, amethyst, and mother of pearl.',
-                'discovery': 'The Sheikh Zayed Grand Mosque was commissioned by the late Sheikh Zayed bin Sultan Al Nahyan as a symbol of Islamic civilization and cultural diversity. The mosque was designed to showcase the best of Islamic architecture while welcoming people of all faiths. Its construction involved artisans from around the world, creating a masterpiece that represents unity and peace.',
-                'cultural_impact': 'The mosque has become a symbol of Abu Dhabi\'s cultural heritage and Islamic architectural excellence. It serves as an educational center, hosting interfaith dialogues and cultural events. The mosque\'s design influences modern Islamic architecture worldwide and represents the UAE\'s commitment to cultural preservation and religious tolerance.',
-                'health_safety': 'The mosque provides a safe and respectful environment for visitors. Modest dress is required, with abayas and headscarves provided for women. Wheelchair accessibility is available throughout the complex. Medical facilities are on-site, and security measures ensure visitor safety. Respectful behavior is essential in this sacred space.',
-                'facts': [
-                    'Capacity for 41,000 worshippers',
-                    '82 domes of varying sizes',
-                    'Over 1,000 columns inlaid with semi-precious stones',
-                    'World\'s largest hand-knotted carpet (5,627 square meters)',
-                    'Seven crystal chandeliers, the largest weighing 12 tonnes',
-                    'Construction took 11 years (1996-2007)',
-                    'Free entry for all visitors'
-                ],
-                'key_sites': [
-                    {'name': 'Main Prayer Hall', 'slug': 'main-prayer-hall', 'description': 'Massive hall with world\'s largest carpet', 'significance': 'Features Swarovski crystal chandeliers and holds 7,000 worshippers'},
-                    {'name': 'Courtyard', 'slug': 'courtyard', 'description': 'Marble courtyard with floral mosaic', 'significance': 'World\'s largest marble mosaic covering 17,000 square meters'},
-                    {'name': 'Reflective Pools', 'slug': 'reflective-pools', 'description': 'Surrounding pools that mirror the mosque', 'significance': 'Create stunning visual effects especially at night'},
-                    {'name': 'Minarets', 'slug': 'minarets', 'description': 'Four 107-meter tall minarets', 'significance': 'Mark the four corners of the mosque'}
-                ],
-                'entrance_fees': 'Free admission',
-                'opening_hours': 'Saturday-Thursday: 9:00 AM - 10:00 PM (last tour 9:30 PM). Friday: 4:30 PM - 10:00 PM. Closed to visitors during prayer times.',
-                'best_time': 'Late afternoon for daylight and evening illumination. Avoid Friday mornings.',
-                'how_to_get_there': 'Located on Sheikh Rashid Bin Saeed Street, Abu Dhabi. Free shuttle from Abu Dhabi Bus Station. Taxi and private car access available.',
-                'what_to_wear': 'Modest clothing mandatory. Women must wear abaya and headscarf (provided free at entrance). Men: long trousers and shirts with sleeves. Remove shoes before entering.',
-                'guided_tours': 'Free guided tours available daily. Audio guides in multiple languages. Tours last approximately 45 minutes.',
-                'visitor_tips': [
-                    'Dress modestly - abayas and headscarves provided for women',
-                    'Visit at sunset for beautiful lighting',
-                    'Photography allowed but respect prayer areas',
-                    'Free guided tours highly recommended',
-                    'Closed during prayer times - check schedule',
-                    'Allow 1.5-2 hours for visit'
-                ],
-                'nearby_attractions': 'Louvre Abu Dhabi (15 km), Emirates Palace (10 km), Wahat Al Karama memorial (5 km).',
-                'conservation': 'Regular maintenance and restoration to preserve the intricate details and precious materials.',
-                'photos': [
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '24.4128° N, 54.4747° E',
-                'annual_visitors': 'Over 5 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'palm-jumeirah': {
-                'id': 'palm-jumeirah',
-                'name': 'Palm Jumeirah',
-                'location': 'Dubai, UAE',
-                'description': 'Artificial island shaped like a palm tree, featuring luxury resorts, private beaches, and world-class entertainment.',
-                'long_description': 'Palm Jumeirah is the world\'s largest artificial island, shaped like a palm tree and extending 5 km into the Persian Gulf. This engineering marvel features luxury resorts, private villas, pristine beaches, and world-class entertainment venues. The island is connected to the mainland by a 300-meter-long causeway.',
-                'historical_significance': 'Construction began in 2001 and was completed in 2006. Palm Jumeirah was the first of three planned palm-shaped islands (Palm Jebel Ali and Palm Deira were later developed). The project represented Dubai\'s ambitious vision to create new land for tourism and real estate development.',
-                'architecture': 'The island consists of a trunk, 16 fronds, and a surrounding crescent. The trunk houses luxury hotels and apartments, while the fronds feature private villas and beachfront properties. The crescent contains the famous Atlantis The Palm resort and marina.',
-                'discovery': 'Palm Jumeirah was conceived as part of Dubai\'s vision to create artificial islands that would add valuable coastline to the city. The project began with feasibility studies in the late 1990s, with construction starting in 2001. The palm-shaped design was chosen to maximize beachfront property while creating a distinctive landmark visible from space.',
-                'cultural_impact': 'Palm Jumeirah has become a symbol of Dubai\'s engineering prowess and transformed the city\'s skyline. It represents the UAE\'s ability to reshape its geography and create new possibilities for tourism and real estate. The island has influenced similar projects worldwide and showcases Arabian innovation in modern architecture.',
-                'health_safety': 'The island features extensive safety measures including 24/7 security, lifeguard services at beaches, and emergency medical facilities. Monorail and pedestrian bridges ensure safe transportation. Visitors should follow local guidelines, stay hydrated, and avoid swimming in unauthorized areas. The development includes shaded walkways and cooling stations.',
-                'guided_tours': 'Official guided tours are available through Dubai Tourism and Atlantis The Palm. Walking tours explore the island\'s architecture and history, while boat tours provide water-level perspectives. Photography tours capture the island\'s unique features, and VIP experiences include private access to exclusive areas.',
-                'facts': [
-                    'World\'s largest artificial island at 5.6 km²',
-                    'Took 6 years to construct (2001-2006)',
-                    'Used 94 million cubic meters of sand and 5.5 million tonnes of rock',
-                    'Features 1,400 luxury villas and apartments',
-                    'Home to Atlantis The Palm, one of Dubai\'s most luxurious resorts',
-                    'Connected to mainland by 300-meter causeway',
-                    'Part of larger Palm Islands development project'
-                ],
-                'key_sites': [
-                    {'name': 'Atlantis The Palm', 'slug': 'atlantis-the-palm', 'description': 'Iconic luxury resort with water park and aquarium', 'significance': 'World-famous hotel with underwater dining and marine attractions'},
-                    {'name': 'The Pointe', 'slug': 'the-pointe', 'description': 'Shopping and entertainment complex at the island\'s tip', 'significance': 'Features restaurants, bars, and panoramic views'},
-                    {'name': 'Golden Mile', 'slug': 'golden-mile', 'description': 'Beachfront promenade with luxury hotels', 'significance': 'Home to prestigious hotels like Jumeirah Zabeel Saray'},
-                    {'name': 'Trunk Road', 'slug': 'trunk-road', 'description': 'Main artery connecting the island', 'significance': 'Features luxury shopping and dining options'}
-                ],
-                'entrance_fees': 'Free to visit the island. Individual attractions have their own fees.',
-                'opening_hours': '24/7 access. Individual venues have varying hours.',
-                'best_time': 'Evening for illuminated views and cooler temperatures.',
-                'how_to_get_there': 'Located off Dubai\'s coast. Taxi, private car, or monorail from Dubai Marina. Water taxi available.',
-                'what_to_wear': 'Beachwear for resorts, smart casual for dining and entertainment.',
-                'visitor_tips': [
-                    'Visit Atlantis The Palm for world-class entertainment',
-                    'Take the monorail for scenic views of the island',
-                    'Book water taxi for romantic approach to resorts',
-                    'Explore the fronds for stunning sunset views',
-                    'Visit during Dubai Summer Surprises for discounted rates',
-                    'Allow 2-3 hours to explore the main attractions'
-                ],
-                'nearby_attractions': 'Dubai Marina (adjacent), Jumeirah Beach Residence (1 km), Mall of the Emirates (5 km).',
-                'conservation': 'Ongoing maintenance to protect the artificial island structure and marine environment.',
-                'photos': [
-                    'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.1124° N, 55.1390° E',
-                'annual_visitors': 'Over 10 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'dubai-mall': {
-                'id': 'dubai-mall',
-                'name': 'Dubai Mall',
-                'location': 'Dubai, UAE',
-                'description': 'World\'s largest shopping and entertainment complex featuring over 1,200 stores, aquarium, and ice rink.',
-                'long_description': 'Dubai Mall is the world\'s largest shopping and entertainment complex, spanning 1.1 million square meters. Connected to the Burj Khalifa, it features over 1,200 retail outlets, a massive aquarium, indoor ice rink, and numerous dining and entertainment options. The mall receives over 80 million visitors annually.',
-                'historical_significance': 'Opened in 2008 alongside the Burj Khalifa, Dubai Mall represents Dubai\'s transformation into a global shopping and tourism destination. It was designed to complement the world\'s tallest building and create an integrated entertainment district.',
-                'architecture': 'The mall features a modern design with glass facades and spacious interiors. It includes the Dubai Aquarium & Underwater Zoo, VR Park, and KidZania educational entertainment center. The mall\'s design emphasizes luxury shopping and family entertainment.',
-                'facts': [
-                    'World\'s largest shopping mall at 1.1 million square meters',
-                    'Over 1,200 retail stores and outlets',
-                    'Receives 80 million visitors annually',
-                    'Features world\'s largest acrylic panel aquarium tunnel',
-                    'Home to Dubai Ice Rink and VR Park',
-                    'Contains over 200 food and beverage outlets',
-                    'Connected directly to Burj Khalifa'
-                ],
-                'key_sites': [
-                    {'name': 'Dubai Aquarium & Underwater Zoo', 'slug': 'dubai-aquarium-underwater-zoo', 'description': 'World\'s largest acrylic panel tunnel with marine life', 'significance': 'Features sharks, rays, and underwater viewing experiences'},
-                    {'name': 'Dubai Ice Rink', 'slug': 'dubai-ice-rink', 'description': 'Olympic-sized ice skating rink', 'significance': 'Year-round skating in desert climate'},
-                    {'name': 'Fashion Avenue', 'slug': 'fashion-avenue', 'description': 'Luxury shopping district with high-end brands', 'significance': 'Features flagship stores of international designers'},
-                    {'name': 'KidZania', 'slug': 'kidzania', 'description': 'Educational entertainment center for children', 'significance': 'Interactive learning through role-playing activities'}
-                ],
-                'entrance_fees': 'Free entry to mall. Individual attractions: Aquarium (95-140 AED), Ice Rink (50-80 AED), VR Park (95 AED).',
-                'opening_hours': '10:00 AM to 10:00 PM Sunday-Wednesday, 10:00 AM to 11:00 PM Thursday-Saturday.',
-                'best_time': 'Evening for shopping and entertainment. Weekends are busiest.',
-                'how_to_get_there': 'Connected to Burj Khalifa. Metro: Dubai Mall Station. Multiple parking levels available.',
-                'what_to_wear': 'Smart casual attire. Comfortable shoes for extensive walking.',
-                'visitor_tips': [
-                    'Visit early morning or late evening to avoid crowds',
-                    'Download mall app for navigation and offers',
-                    'Book aquarium and VR experiences in advance',
-                    'Take advantage of free shuttle to Burj Khalifa',
-                    'Explore the outdoor terraces for Burj Khalifa views',
-                    'Allow 3-4 hours for comprehensive visit'
-                ],
-                'nearby_attractions': 'Burj Khalifa (connected), Dubai Fountain (adjacent), Souk Al Bahar (adjacent).',
-                'conservation': 'Modern facility with sustainable design features and waste management systems.',
-                'discovery': 'Dubai Mall emerged as a visionary project to create the world\'s largest shopping and entertainment destination. The mall was conceived as an integral part of the Burj Khalifa development, designed to complement the world\'s tallest building and establish Dubai as a global shopping capital. Its discovery represents Dubai\'s transformation from traditional trading to modern retail excellence.',
-                'architecture': 'Dubai Mall showcases contemporary architectural excellence with its expansive glass facades, soaring atriums, and integrated design that seamlessly connects indoor and outdoor spaces. The mall\'s architecture incorporates sustainable design elements including energy-efficient lighting, advanced HVAC systems, and water recycling facilities. The structure features multiple levels of retail space, entertainment zones, and public areas that create an immersive shopping experience.',
-                'cultural_impact': 'Dubai Mall has redefined shopping culture in the Middle East, introducing world-class retail experiences and entertainment options that blend international brands with local hospitality. The mall has become a social hub where diverse cultures converge, fostering community events, cultural exhibitions, and family-oriented entertainment. It represents Dubai\'s ability to preserve traditional values while embracing global consumerism.',
-                'health_safety': 'The mall maintains strict health and safety standards with comprehensive security systems, emergency protocols, and regular safety inspections. Temperature-controlled environments provide comfort throughout the year. Medical facilities and first aid stations are available, along with accessibility features for visitors with disabilities. Security personnel and CCTV monitoring ensure a safe shopping environment.',
-                'guided_tours': 'Official guided tours are available through the Dubai Tourism Department, offering insights into the mall\'s architecture, history, and attractions. Specialized tours focus on the aquarium, VR experiences, and shopping districts. Audio guides in multiple languages provide self-guided exploration options. Group tours can be arranged for educational and corporate visits.',
-                'photos': [
-                    'https://images.unsplash.com/photo-1555529669-e69e7aa0ba9a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.1972° N, 55.2791° E',
-                'annual_visitors': '80 million',
-                'climate': 'Air-conditioned indoor environment.'
-            },
-            'dubai-desert-safari': {
-                'id': 'dubai-desert-safari',
-                'name': 'Dubai Desert Safari',
-                'location': 'Dubai Desert, UAE',
-                'description': 'Thrilling desert adventure combining dune bashing, camel riding, falconry shows, and traditional Bedouin hospitality.',
-                'long_description': 'Dubai Desert Safari offers an authentic Arabian desert experience just minutes from the city. This adventure combines high-speed dune bashing in 4x4 vehicles, camel riding, traditional Bedouin camp entertainment, and stunning desert landscapes. The safari provides a glimpse into traditional Emirati culture and the natural beauty of the Arabian Desert.',
-                'historical_significance': 'The desert safari experience draws from centuries-old Bedouin traditions of desert travel and hospitality. The activity has become a cornerstone of Dubai\'s tourism industry, showcasing the country\'s heritage while providing modern adventure experiences.',
-                'facts': [
-                    'Covers over 600 square kilometers of desert',
-                    'Features 100-meter high sand dunes',
-                    'Includes traditional Bedouin camp with entertainment',
-                    'Camel riding and falconry demonstrations',
-                    'Tanoura dance and belly dancing performances',
-                    'Arabic coffee and dates served in traditional style',
-                    'Sunset views over Dubai skyline from desert'
-                ],
-                'key_sites': [
-                    {'name': 'Sand Dunes', 'slug': 'sand-dunes', 'description': 'Massive red sand dunes for 4x4 adventures', 'significance': 'Thrilling dune bashing experiences with professional drivers'},
-                    {'name': 'Bedouin Camp', 'slug': 'bedouin-camp', 'description': 'Traditional desert camp with entertainment', 'significance': 'Authentic Arabian hospitality and cultural performances'},
-                    {'name': 'Camel Farm', 'slug': 'camel-farm', 'description': 'Camel riding and interaction area', 'significance': 'Experience traditional desert transportation'},
-                    {'name': 'Falconry Display', 'slug': 'falconry-display', 'description': 'Traditional Emirati falconry demonstration', 'significance': 'Showcases ancient Arabian hunting tradition'}
-                ],
-                'entrance_fees': 'Standard safari: 150-250 AED. Premium options: 300-500 AED. Prices vary by package.',
-                'opening_hours': 'Sunset safaris depart 3:00-4:00 PM. Evening safaris 7:00-8:00 PM.',
-                'best_time': 'Winter months (November-March) for cooler temperatures.',
-                'how_to_get_there': 'Pickup from major Dubai hotels. Desert location is 45-60 minutes from city center.',
-                'what_to_wear': 'Comfortable clothing, closed-toe shoes, light jacket for evening. Scarf for face protection.',
-                'visitor_tips': [
-                    'Book in advance, especially during peak season',
-                    'Choose morning pickup for better dune conditions',
-                    'Stay seated during dune bashing for safety',
-                    'Try traditional Arabic food at the camp',
-                    'Photography opportunities throughout the experience',
-                    'Allow 4-5 hours for complete safari experience'
-                ],
-                'nearby_attractions': 'Al Ain Oasis (90 km), Hatta Mountain Pools (60 km), Dubai city center (45 km).',
-                'conservation': 'Operates under environmental guidelines to protect desert ecosystem.',
-                'discovery': 'Dubai Desert Safari emerged as a pioneering tourism concept that transformed desert exploration into a structured adventure experience. The safari concept was developed to showcase the natural beauty of the Arabian Desert while providing authentic cultural encounters. It became a cornerstone of Dubai\'s tourism industry, blending traditional Bedouin hospitality with modern adventure tourism.',
-                'architecture': 'The desert safari experience features specially designed 4x4 vehicles equipped for extreme terrain, traditional Bedouin-style camps with climate-controlled tents, and open-air dining pavilions. The camps incorporate authentic Arabian architectural elements with modern safety features, creating immersive environments that transport visitors to traditional desert life while ensuring comfort and security.',
-                'cultural_impact': 'Dubai Desert Safari has become a cultural bridge, introducing millions of visitors to traditional Emirati customs, Bedouin hospitality, and desert heritage. The experience has preserved and promoted authentic cultural practices while creating economic opportunities for local communities. It represents Dubai\'s ability to maintain cultural authenticity while embracing global tourism trends.',
-                'health_safety': 'All safaris operate with professional drivers trained in desert navigation and emergency procedures. Vehicles are equipped with communication devices, first aid kits, and GPS tracking. Passengers receive safety briefings and are required to wear seatbelts during dune bashing. Medical facilities are available at camp locations, and all activities follow strict safety protocols.',
-                'guided_tours': 'Professional guides provide historical context and cultural insights throughout the safari experience. Multilingual guides explain desert ecology, traditional Bedouin life, and local customs. Specialized photography tours and cultural immersion experiences are available. Group tours can be customized for educational institutions and corporate events.',
-                'photos': [
-                    'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '24.9167° N, 55.2833° E',
-                'annual_visitors': 'Over 2 million',
-                'climate': 'Desert climate. Best experienced November-March.'
-            },
-            'dubai-marina': {
-                'id': 'dubai-marina',
-                'name': 'Dubai Marina',
-                'location': 'Dubai, UAE',
-                'description': 'Modern waterfront district featuring luxury yachts, high-rise towers, and vibrant dining and entertainment scene.',
-                'long_description': 'Dubai Marina is a modern waterfront development featuring luxury residential towers, a man-made marina, and vibrant lifestyle amenities. The district offers stunning views of the Persian Gulf, world-class dining, shopping, and entertainment options. It\'s home to over 150 restaurants and the famous Dubai Marina Mall.',
-                'historical_significance': 'Developed in the early 2000s as part of Dubai\'s expansion, Dubai Marina represents the city\'s transformation from oil-dependent economy to tourism and real estate hub. The marina was designed to create a European-style waterfront lifestyle in the desert.',
-                'architecture': 'The district features over 200 residential towers, many over 50 stories high. The marina can accommodate over 3,000 yachts and features a promenade with palm-lined walkways, fountains, and modern sculptures.',
-                'facts': [
-                    'Home to over 120,000 residents',
-                    'Features 3,000+ yacht berths in the marina',
-                    'Over 200 residential and commercial towers',
-                    'Contains Dubai Marina Mall with 160 stores',
-                    '150+ restaurants and cafes',
-                    'JBR Beach and promenade stretching 3 km',
-                    'Average tower height of 50+ stories'
-                ],
-                'key_sites': [
-                    {'name': 'Dubai Marina Mall', 'slug': 'dubai-marina-mall', 'description': 'Modern shopping and entertainment complex', 'significance': 'Features cinema, bowling, and diverse dining options'},
-                    {'name': 'JBR Beach', 'slug': 'jbr-beach', 'description': 'Artificial beach with promenade and water activities', 'significance': 'Popular recreational area with beach volleyball and dining'},
-                    {'name': 'Marina Walk', 'slug': 'marina-walk', 'description': 'Waterfront promenade with restaurants and shops', 'significance': 'Scenic walking path with views of yachts and towers'},
-                    {'name': 'Pier 7', 'slug': 'pier-7', 'description': 'Entertainment complex with bars and restaurants', 'significance': 'Vibrant nightlife and dining destination'}
-                ],
-                'entrance_fees': 'Free access to public areas. Individual venues have their own fees.',
-                'opening_hours': '24/7 access to marina. Shops and restaurants vary.',
-                'best_time': 'Evening for dining and entertainment. Cooler months for outdoor activities.',
-                'how_to_get_there': 'Located between Jumeirah Beach Residence and Palm Jumeirah. Metro: Dubai Marina Station.',
-                'what_to_wear': 'Casual attire for daytime, smart casual for evening dining.',
-                'visitor_tips': [
-                    'Visit Marina Mall for shopping and entertainment',
-                    'Walk the JBR promenade for people-watching',
-                    'Try waterfront dining with yacht views',
-                    'Take a yacht tour of the marina',
-                    'Visit during Dubai Summer Surprises for deals',
-                    'Allow 2-3 hours to explore the district'
-                ],
-                'nearby_attractions': 'Palm Jumeirah (adjacent), Jumeirah Beach Residence (adjacent), Mall of the Emirates (3 km).',
-                'conservation': 'Modern development with sustainable design features.',
-                'discovery': 'Dubai Marina emerged as a visionary waterfront development project that transformed Dubai\'s coastline into a modern lifestyle destination. The marina concept was pioneered in the early 2000s, creating the first man-made marina in the Middle East and establishing a new paradigm for urban waterfront living. It became a catalyst for Dubai\'s transformation from traditional trading hub to global lifestyle destination.',
-                'architecture': 'Dubai Marina showcases innovative architectural design with over 200 high-rise residential towers featuring contemporary aesthetics and functional layouts. The marina incorporates advanced engineering with a 3,000-berth harbor, pedestrian promenades, and integrated retail and entertainment spaces. The development blends modern skyscrapers with traditional Arabian design elements, creating a harmonious urban landscape.',
-                'cultural_impact': 'Dubai Marina has redefined urban living in the UAE, introducing cosmopolitan lifestyle concepts and creating a melting pot of international cultures. The development has fostered community building through waterfront events, international cuisine, and diverse entertainment options. It represents Dubai\'s evolution from traditional society to modern multicultural metropolis while maintaining cultural authenticity.',
-                'health_safety': 'The marina district maintains comprehensive security systems with 24/7 surveillance, professional security personnel, and emergency response protocols. All buildings meet international safety standards with fire prevention systems and accessibility features. Water safety measures are implemented throughout the marina area, and medical facilities are readily available in the vicinity.',
-                'guided_tours': 'Official guided tours are available through Dubai Tourism, offering architectural insights and historical context about the marina\'s development. Yacht tours provide unique perspectives of the waterfront, while walking tours explore the promenade and key attractions. Specialized photography tours capture the marina\'s skyline and architectural highlights.',
-                'photos': [
-                    'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.0783° N, 55.1403° E',
-                'annual_visitors': 'Over 15 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'burj-al-arab': {
-                'id': 'burj-al-arab',
-                'name': 'Burj Al Arab',
-                'location': 'Dubai, UAE',
-                'description': 'Iconic luxury hotel shaped like a sail, featuring seven-star service and the world\'s highest atrium lounge.',
-                'long_description': 'Burj Al Arab is a luxury hotel located in Dubai, United Arab Emirates. At 321 meters (1,053 ft), it is the fourth tallest hotel in the world. The hotel is the first and only hotel to be awarded a seven-star rating by its creator, and is often described as "the world\'s most luxurious hotel".',
-                'historical_significance': 'Opened in 1999, Burj Al Arab was built to showcase Dubai\'s emergence as a luxury tourism destination. The hotel was designed to resemble the sail of a dhow, traditional Arabian boat, and became an instant icon of modern Dubai.',
-                'architecture': 'The hotel features a distinctive sail-shaped silhouette and is built on an artificial island 280 meters offshore. It includes the world\'s highest atrium lounge, a helipad on the 28th floor, and luxury suites with panoramic views.',
-                'facts': [
-                    'World\'s first seven-star hotel',
-                    '321 meters tall (1,053 feet)',
-                    'Built on artificial island 280 meters offshore',
-                    'Features world\'s highest atrium lounge',
-                    'Helipad on the 28th floor',
-                    'Suites start at 170 square meters',
-                    'Construction cost $650 million'
-                ],
-                'key_sites': [
-                    {'name': 'Atrium Lounge', 'slug': 'atrium-lounge', 'description': 'World\'s highest atrium lounge at 200 meters', 'significance': 'Panoramic views and afternoon tea experience'},
-                    {'name': 'Gold Leaf Restaurant', 'slug': 'gold-leaf-restaurant', 'description': 'Signature restaurant with gold leaf decor', 'significance': 'Fine dining with views of Dubai Fountain'},
-                    {'name': 'Royal Suite', 'slug': 'royal-suite', 'description': 'Presidential suite spanning 780 square meters', 'significance': 'Most luxurious accommodation in Dubai'},
-                    {'name': 'Private Beach', 'slug': 'private-beach', 'description': 'Exclusive beach with cabana services', 'significance': 'Secluded relaxation area with luxury amenities'}
-                ],
-                'entrance_fees': 'Public areas accessible. Restaurant reservations required. Day passes available for some facilities.',
-                'opening_hours': '24/7 hotel operations. Public areas accessible during business hours.',
-                'best_time': 'Evening for illuminated views and sunset dining.',
-                'how_to_get_there': 'Located on Jumeirah Beach. Taxi or private car recommended.',
-                'what_to_wear': 'Smart casual for public areas, formal for fine dining.',
-                'visitor_tips': [
-                    'Book afternoon tea at the Atrium Lounge in advance',
-                    'Visit at sunset for spectacular views',
-                    'Experience the helipad arrival (by arrangement)',
-                    'Try the signature Gold Leaf restaurant',
-                    'Photography allowed in public areas',
-                    'Allow 2-3 hours for complete experience'
-                ],
-                'nearby_attractions': 'Dubai Fountain (adjacent), Wild Wadi Water Park (adjacent), Jumeirah Beach (adjacent).',
-                'conservation': 'Modern luxury facility with sustainable design features.',
-                'discovery': 'Burj Al Arab emerged as a revolutionary concept in luxury hospitality, introducing seven-star service standards and redefining the boundaries of luxury accommodation. The hotel was conceived as a symbol of Dubai\'s emergence as a global luxury destination, combining traditional Arabian hospitality with world-class service excellence. Its discovery marked a new era in Middle Eastern tourism and hospitality.',
-                'architecture': 'Burj Al Arab showcases distinctive architectural innovation with its sail-shaped silhouette inspired by traditional Arabian dhow boats. The hotel features advanced engineering including a helipad, atrium lounge, and artificial island construction. The interior design incorporates gold leaf accents, marble finishes, and contemporary Arabian motifs, creating an opulent yet functional luxury environment.',
-                'cultural_impact': 'Burj Al Arab has become an iconic symbol of modern Dubai, representing the city\'s transformation from traditional trading hub to luxury tourism destination. The hotel has influenced global hospitality standards and inspired similar luxury developments worldwide. It serves as a cultural bridge, blending traditional Emirati values with international luxury expectations.',
-                'health_safety': 'The hotel maintains the highest standards of health and safety with comprehensive security systems, emergency protocols, and medical facilities on-site. All areas are monitored 24/7, and the hotel follows international hygiene and safety standards. Private security personnel and advanced surveillance systems ensure guest safety throughout the property.',
-                'guided_tours': 'Official guided tours are available through the hotel\'s concierge services, offering insights into the architectural design, historical significance, and luxury amenities. Specialized tours include helipad experiences, suite previews, and behind-the-scenes access to service areas. Private tours can be arranged for VIP guests and special occasions.',
-                'photos': [
-                    'https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.1412° N, 55.1853° E',
-                'annual_visitors': 'Over 1 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'dubai-fountain': {
-                'id': 'dubai-fountain',
-                'name': 'Dubai Fountain',
-                'location': 'Dubai, UAE',
-                'description': 'World\'s largest choreographed fountain system performing to music with water jets reaching 150 meters.',
-                'long_description': 'Dubai Fountain is a choreographed fountain system located at the base of the Burj Khalifa. It is the world\'s largest fountain system, with water jets reaching 150 meters into the air, accompanied by colored lights and music. The fountain performs every 30 minutes from 6:00 PM to 11:00 PM.',
-                'historical_significance': 'Opened in 2009, Dubai Fountain was created to complement the Burj Khalifa and enhance Dubai\'s reputation as an entertainment destination. It represents Dubai\'s investment in world-class attractions and technological innovation.',
-                'facts': [
-                    'World\'s largest choreographed fountain',
-                    'Water jets reach 150 meters (492 feet)',
-                    'Contains 6,600 lights and 25 colored projectors',
-                    'Uses 83,000 liters of water per show',
-                    'Performs to 6 different musical pieces',
-                    'Shows every 30 minutes from 6 PM to 11 PM',
-                    'Cost $218 million to build'
-                ],
-                'key_sites': [
-                    {'name': 'Main Fountain Basin', 'slug': 'main-fountain-basin', 'description': '660-foot long lake with fountain system', 'significance': 'Features the world\'s largest fountain display'},
-                    {'name': 'Burj Khalifa View', 'slug': 'burj-khalifa-view', 'description': 'Fountain viewed against the world\'s tallest building', 'significance': 'Creates spectacular visual contrast'},
-                    {'name': 'Surrounding Walkways', 'slug': 'surrounding-walkways', 'description': 'Pedestrian paths around the fountain', 'significance': 'Best viewing locations for the shows'}
-                ],
-                'entrance_fees': 'Free to view from surrounding areas. Premium viewing areas may have fees.',
-                'opening_hours': 'Shows every 30 minutes from 6:00 PM to 11:00 PM daily.',
-                'best_time': 'Evening shows for full illumination and cooler temperatures.',
-                'how_to_get_there': 'Located at Burj Khalifa base. Metro: Dubai Mall Station.',
-                'what_to_wear': 'Comfortable clothing for evening viewing.',
-                'visitor_tips': [
-                    'Arrive 30 minutes early for good viewing spots',
-                    'Visit during weekends for larger crowds',
-                    'Combine with Burj Khalifa visit',
-                    'Best viewed from Dubai Mall terrace or bridge',
-                    'Shows are synchronized to music',
-                    'Photography encouraged'
-                ],
-                'discovery': 'Dubai Fountain was inaugurated in 2009 as part of the Burj Khalifa development project. The fountain system was designed by WET Design, the same company that created the Bellagio fountains in Las Vegas. The project involved extensive engineering to create a fountain system that could operate in Dubai\'s desert climate while providing spectacular water displays.',
-                'architecture': 'The fountain spans 275 meters in length and features 6,600 lights and 50 colored projectors. The system uses 83,000 liters of water per show, propelled by 5,000 nozzles that can shoot water up to 150 meters high. The engineering includes advanced computer systems that synchronize the water jets, lights, and music for precise performances.',
-                'cultural_impact': 'Dubai Fountain has become an iconic symbol of Dubai\'s modern identity, representing the city\'s technological innovation and entertainment excellence. It has transformed Dubai into a global entertainment destination and inspired similar projects worldwide. The fountain has become a cultural landmark that showcases Dubai\'s ability to blend tradition with cutting-edge technology.',
-                'conservation': 'The fountain uses recycled water from Burj Khalifa\'s air conditioning system, making it an environmentally conscious attraction. Advanced filtration systems ensure water quality, and energy-efficient LED lighting reduces power consumption. Regular maintenance programs preserve the fountain\'s performance and visual impact.',
-                'health_safety': 'The fountain area is monitored by security personnel and features clear pathways for visitors. During hot weather, stay hydrated and seek shade when not viewing shows. Some areas may be slippery near water features. Follow local guidelines and maintain safe distances from the water displays.',
-                'guided_tours': 'Official guided tours are available through Dubai Tourism, providing insights into the fountain\'s engineering and history. Audio guides in multiple languages offer self-paced exploration. Special VIP experiences include behind-the-scenes access and premium viewing areas during shows.',
-                'nearby_attractions': 'Burj Khalifa (adjacent), Dubai Mall (adjacent), Souk Al Bahar (adjacent).',
-                'conservation': 'Uses recycled water and energy-efficient lighting systems.',
-                'photos': [
-                    'https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.1972° N, 55.2744° E',
-                'annual_visitors': 'Over 10 million',
-                'climate': 'Desert climate. Shows run year-round.'
-            },
-            'louvre-abu-dhabi': {
-                'id': 'louvre-abu-dhabi',
-                'name': 'Louvre Abu Dhabi',
-                'location': 'Abu Dhabi, UAE',
-                'description': 'World-class art museum featuring masterpieces from around the world in a stunning desert location.',
-                'long_description': 'Louvre Abu Dhabi is a world-class art museum located on Saadiyat Island in Abu Dhabi. The museum houses over 600 artworks from around the world, spanning 3,000 years of human creativity. The building features a distinctive dome with 7,850 stars that filter light into the galleries below.',
-                'historical_significance': 'Opened in 2017, Louvre Abu Dhabi represents the first Louvre museum outside France. The museum\'s collection includes works from the Louvre in Paris and other prestigious institutions, showcasing universal art and culture.',
-                'architecture': 'Designed by Jean Nouvel, the museum features a large dome with intricate star-shaped perforations that create a "rain of light" effect. The building is surrounded by water and integrates traditional Islamic architectural elements with modern design.',
-                'facts': [
-                    'First Louvre museum outside France',
-                    'Houses over 600 artworks from 3,000 years',
-                    'Dome features 7,850 stars filtering light',
-                    'Collection includes works from Louvre Paris',
-                    'Features universal museum concept',
-                    'Cost $653 million to build',
-                    'Spans 24,000 square meters'
-                ],
-                'key_sites': [
-                    {'name': 'Main Dome', 'slug': 'main-dome', 'description': 'Iconic dome with star-shaped perforations', 'significance': 'Creates "rain of light" effect in galleries'},
-                    {'name': 'Pavilion of Islamic Art', 'slug': 'pavilion-of-islamic-art', 'description': 'Dedicated gallery for Islamic masterpieces', 'significance': 'Showcases Islamic art and artifacts'},
-                    {'name': 'Modern Art Gallery', 'slug': 'modern-art-gallery', 'description': 'Contemporary art collection', 'significance': 'Features works from 20th and 21st centuries'},
-                    {'name': 'Ancient Civilizations', 'slug': 'ancient-civilizations', 'description': 'Artifacts from ancient cultures', 'significance': 'Includes Egyptian, Greek, and Roman works'}
-                ],
-                'entrance_fees': '63 AED for adults. Free for children under 13.',
-                'opening_hours': '10:00 AM to 8:00 PM Saturday-Wednesday, 10:00 AM to 10:00 PM Thursday-Friday.',
-                'best_time': 'Evening for cooler temperatures and illuminated dome.',
-                'how_to_get_there': 'Located on Saadiyat Island. Free shuttle from Abu Dhabi Mall.',
-                'what_to_wear': 'Modest attire. Comfortable shoes for extensive walking.',
-                'visitor_tips': [
-                    'Book tickets online to avoid queues',
-                    'Allow 3-4 hours for comprehensive visit',
-                    'Audio guide enhances the experience',
-                    'Visit during special exhibitions',
-                    'Photography allowed in most areas',
-                    'Take the free shuttle from city center'
-                ],
-                'discovery': 'The Louvre Abu Dhabi project was conceived in 2007 as part of Abu Dhabi\'s cultural development initiative. The museum represents the first Louvre outside France and was designed to showcase universal art and culture. The architectural concept was developed by French architect Jean Nouvel, who created the distinctive dome with 7,850 stars that filter desert light into the galleries.',
-                'cultural_impact': 'Louvre Abu Dhabi has transformed Abu Dhabi into a global cultural destination, attracting millions of visitors annually. The museum promotes cultural exchange between East and West, featuring artworks from diverse civilizations. It has inspired similar cultural initiatives across the UAE and positioned Abu Dhabi as a center for arts and heritage preservation.',
-                'conservation': 'The museum employs state-of-the-art climate control systems to protect priceless artworks from the desert environment. Advanced security measures and conservation laboratories ensure the preservation of the collection. The dome\'s innovative design filters harmful UV rays while allowing natural light to illuminate the galleries.',
-                'health_safety': 'The museum maintains comfortable indoor temperatures year-round. Wheelchair accessibility is available throughout, and audio guides in multiple languages assist visitors. Security measures ensure a safe environment, and medical facilities are available on-site. Visitors should wear comfortable shoes for extensive walking.',
-                'guided_tours': 'Official guided tours are available in multiple languages, providing historical and artistic context for the collections. Audio guides offer self-paced exploration with detailed information about artworks. Special themed tours focus on Islamic art, modern collections, and architectural features.',
-                'nearby_attractions': 'Ferrari World (adjacent), Yas Island (5 km), Abu Dhabi city center (15 km).',
-                'conservation': 'State-of-the-art climate control and security systems protect artworks.',
-                'photos': [
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '24.5333° N, 54.4000° E',
-                'annual_visitors': 'Over 2 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'dubai-creek': {
-                'id': 'dubai-creek',
-                'name': 'Dubai Creek',
-                'location': 'Dubai, UAE',
-                'description': 'Historic waterway that has shaped Dubai\'s development, offering traditional dhow rides and cultural experiences.',
-                'long_description': 'Dubai Creek is a saltwater creek that has played a pivotal role in Dubai\'s history and development. This natural inlet from the Arabian Gulf has served as a natural harbor for centuries, facilitating trade and transportation. Today, it divides the city into two parts - Deira and Bur Dubai - and offers visitors a glimpse into Dubai\'s maritime heritage with traditional wooden dhow boats, bustling souks, and waterfront promenades.',
-                'historical_significance': 'Dubai Creek has been Dubai\'s lifeline since the 19th century when the Bani Yas tribe settled along its banks. The creek enabled Dubai to become a major trading hub for pearls, spices, and textiles. The discovery of oil in 1966 transformed Dubai, but the creek remains a symbol of the city\'s maritime heritage and traditional way of life. The creek has witnessed Dubai\'s transformation from a small fishing village to a global metropolis.',
-                'discovery': 'Dubai Creek was first documented by British explorers in the early 19th century. The creek\'s strategic location made it a natural choice for settlement, with evidence of human habitation dating back thousands of years. The creek became internationally famous during Dubai\'s oil boom in the 1960s and 1970s, when it served as the primary transportation route for goods and people.',
-                'architecture': 'The creek features traditional wind-tower houses (barjeel) that were designed to provide natural cooling through wind catchers. The Dhow Wharfage showcases Dubai\'s maritime architecture with traditional wooden boat building yards. Modern developments along the creek include contemporary bridges and waterfront promenades that blend traditional and modern architectural styles.',
-                'cultural_impact': 'Dubai Creek represents the heart of traditional Emirati culture and maritime heritage. It has inspired numerous works of art, literature, and photography showcasing Dubai\'s transformation. The creek continues to be a gathering place for locals and tourists, preserving traditional practices while embracing modernity. It has become a symbol of Dubai\'s ability to maintain its cultural roots while embracing global change.',
-                'facts': [
-                    'Natural saltwater creek extending 14 km inland',
-                    'Divides Dubai into Deira and Bur Dubai districts',
-                    'Traditional dhow harbor with over 200 wooden boats',
-                    'Historic trading center since the 19th century',
-                    'Features the world\'s largest wooden dhow building yard',
-                    'Home to Dubai Creek Park and promenade',
-                    'UNESCO tentative World Heritage Site',
-                    'Hosts the annual Dubai Creek Festival'
-                ],
-                'key_sites': [
-                    {'name': 'Dhow Wharfage', 'slug': 'dhow-wharfage', 'description': 'Traditional wooden boat harbor and repair area', 'significance': 'Showcases Dubai\'s maritime heritage and boat-building tradition'},
-                    {'name': 'Dubai Creek Park', 'slug': 'dubai-creek-park', 'description': 'Riverside park with walking paths and picnic areas', 'significance': 'Popular recreational area with views of the creek and city skyline'},
-                    {'name': 'Al Seef', 'slug': 'al-seef', 'description': 'Heritage district with restored traditional buildings', 'significance': 'Preserves Dubai\'s architectural heritage from the 19th and 20th centuries'},
-                    {'name': 'Creek Side Promenade', 'slug': 'creek-side-promenade', 'description': 'Waterfront walkway connecting Deira and Bur Dubai', 'significance': 'Offers scenic views and connects historic districts'}
-                ],
-                'entrance_fees': 'Free access to public areas. Abra rides: 1 AED per person.',
-                'opening_hours': '24/7 access to public areas. Abra rides: 6:00 AM to 10:00 PM.',
-                'best_time': 'Early morning or evening for cooler temperatures and fewer crowds.',
-                'how_to_get_there': 'Located in central Dubai. Metro: Al Ras or Deira City Centre stations.',
-                'what_to_wear': 'Comfortable clothing and shoes. Modest attire recommended.',
-                'visitor_tips': [
-                    'Take an abra ride across the creek for authentic experience',
-                    'Visit during Dubai Creek Festival for special events',
-                    'Explore the souks on both sides of the creek',
-                    'Try traditional Emirati food at waterfront restaurants',
-                    'Visit early morning to see fishermen and boat activity',
-                    'Allow 2-3 hours to explore both sides'
-                ],
-                'nearby_attractions': 'Dubai Museum (adjacent), Al Fahidi Historical Neighbourhood (nearby), Gold Souk (walking distance).',
-                'conservation': 'Dubai Creek is undergoing preservation efforts to maintain its cultural and environmental significance. The Dubai Future Foundation works to protect the creek\'s heritage while promoting sustainable development. Traditional boat building techniques are being preserved, and environmental monitoring ensures water quality is maintained.',
-                'health_safety': 'Stay hydrated, especially during summer visits. Some areas may be slippery near water. Follow local guidelines and respect cultural sites. Avoid swimming in the creek due to strong currents and water quality concerns.',
-                'guided_tours': 'Official guided tours are available through the Dubai Tourism Department. Local guides provide historical context and cultural insights. Boat tours offer unique perspectives of the creek and surrounding areas.',
-                'photos': [
-                    'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2631° N, 55.3103° E',
-                'annual_visitors': 'Over 5 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'jumeirah-beach': {
-                'id': 'jumeirah-beach',
-                'name': 'Jumeirah Beach',
-                'location': 'Dubai, UAE',
-                'description': 'Pristine beach along Dubai\'s coastline featuring luxury resorts, water sports, and stunning Arabian Gulf views.',
-                'long_description': 'Jumeirah Beach is one of Dubai\'s most popular beaches, stretching along the Arabian Gulf coastline. This pristine sandy beach offers crystal-clear waters, luxury beach clubs, and a wide range of water sports activities. The beach is lined with some of Dubai\'s most iconic hotels and resorts, creating a perfect blend of relaxation and entertainment.',
-                'facts': [
-                    'Stretches over 7 km along Dubai\'s coastline',
-                    'Features fine white sand and clear turquoise waters',
-                    'Home to luxury beach clubs and resorts',
-                    'Offers various water sports including jet skiing and parasailing',
-                    'Part of Dubai\'s extensive beach network',
-                    'Popular for sunset views and evening strolls',
-                    'Accessible public areas with facilities',
-                    'Temperature-controlled swimming pools available'
-                ],
-                'key_sites': [
-                    {'name': 'Jumeirah Beach Park', 'slug': 'jumeirah-beach-park', 'description': 'Public beach area with facilities and activities', 'significance': 'Free public access with beach volleyball and picnic areas'},
-                    {'name': 'Burj Al Arab Beach', 'slug': 'burj-al-arab-beach', 'description': 'Private beach area for Burj Al Arab guests', 'significance': 'Exclusive luxury beach experience'},
-                    {'name': 'Wild Wadi Beach', 'slug': 'wild-wadi-beach', 'description': 'Beach area adjacent to the water park', 'significance': 'Family-friendly beach with water park access'},
-                    {'name': 'Jumeirah Beach Residence Beach', 'slug': 'jumeirah-beach-residence-beach', 'description': 'Beachfront promenade with restaurants', 'significance': 'Modern beach area with dining and shopping'}
-                ],
-                'entrance_fees': 'Free public access. Beach clubs charge 50-200 AED for day passes.',
-                'opening_hours': '24/7 access. Beach clubs: 10:00 AM to sunset.',
-                'best_time': 'October to April for comfortable swimming temperatures.',
-                'how_to_get_there': 'Located along Jumeirah Road. Taxi or private car recommended.',
-                'what_to_wear': 'Swimwear at beach clubs. Modest attire in public areas.',
-                'visitor_tips': [
-                    'Visit beach clubs for premium facilities and service',
-                    'Try water sports like jet skiing and parasailing',
-                    'Bring sunscreen and stay hydrated',
-                    'Visit during weekdays to avoid crowds',
-                    'Enjoy sunset views from the beach',
-                    'Check water quality and safety flags'
-                ],
-                'discovery': 'Jumeirah Beach was developed as part of Dubai\'s coastal reclamation and tourism development in the 1990s. The beach emerged as a premier recreational destination following the construction of luxury hotels and resorts along the shoreline. Its pristine white sand and clear waters quickly made it a favorite among locals and international visitors.',
-                'architecture': 'The beach features modern beachfront architecture with luxury hotels and resorts designed to complement the natural coastal environment. Beach clubs incorporate contemporary design elements with traditional Arabian architectural influences. The promenade areas feature shaded walkways and recreational facilities integrated with the natural landscape.',
-                'cultural_impact': 'Jumeirah Beach has become a cultural melting pot where traditional Emirati hospitality meets international tourism. It represents Dubai\'s transformation into a global beach destination and has influenced the development of similar coastal resorts across the UAE. The beach has become a symbol of Dubai\'s modern lifestyle and recreational excellence.',
-                'conservation': 'Jumeirah Beach maintains strict environmental standards with regular water quality monitoring and beach cleaning programs. Sustainable practices include energy-efficient lighting for beach facilities and eco-friendly waste management. The beach supports marine conservation efforts and maintains natural dune ecosystems.',
-                'health_safety': 'The beach has designated swimming areas with lifeguard supervision during operating hours. Safety flags indicate water conditions, and medical facilities are available at nearby resorts. Visitors should stay hydrated, use sunscreen, and follow local beach guidelines. Some areas may have strong currents.',
-                'guided_tours': 'Beach resort tours are available through luxury hotels, offering insights into marine life and coastal ecosystems. Water sports operators provide guided activities with certified instructors. Cultural tours highlight the beach\'s role in Dubai\'s tourism development and traditional maritime activities.',
-                'nearby_attractions': 'Burj Al Arab (adjacent), Wild Wadi Water Park (adjacent), Dubai Marina (2 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2333° N, 55.2667° E',
-                'annual_visitors': 'Over 3 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'dubai-museum': {
-                'id': 'dubai-museum',
-                'name': 'Dubai Museum',
-                'location': 'Dubai, UAE',
-                'description': 'Located in Al Fahidi Fort, this museum chronicles Dubai\'s history from ancient times to modern development.',
-                'long_description': 'Dubai Museum, housed in the restored Al Fahidi Fort, offers a comprehensive journey through Dubai\'s rich history. Built in 1787, the fort served as a defensive structure and government headquarters. The museum features archaeological artifacts, traditional exhibits, and interactive displays that showcase Dubai\'s transformation from a small fishing village to a global metropolis.',
-                'historical_significance': 'Al Fahidi Fort was constructed in 1787 by order of Sheikh Maktoum bin Butti, founder of the Al Maktoum dynasty. It served as a defensive fortification, residence for rulers, and administrative center. The fort witnessed key events in Dubai\'s history and now preserves the city\'s heritage for future generations.',
-                'facts': [
-                    'Located in Dubai\'s oldest building, Al Fahidi Fort (1787)',
-                    'Features archaeological finds from ancient settlements',
-                    'Interactive exhibits on Bedouin life and pearl diving',
-                    'Shows Dubai\'s transformation from fishing village to city',
-                    'Includes traditional souk and wind tower house exhibits',
-                    'Underground galleries with artifacts from 3,000 BCE',
-                    'Multimedia presentations on modern Dubai',
-                    'Regular cultural events and exhibitions'
-                ],
-                'key_sites': [
-                    {'name': 'Archaeological Gallery', 'slug': 'archaeological-gallery', 'description': 'Underground exhibits of ancient artifacts', 'significance': 'Showcases finds from Dubai\'s earliest settlements'},
-                    {'name': 'Traditional Life Gallery', 'slug': 'traditional-life-gallery', 'description': 'Reconstructed souk and traditional house', 'significance': 'Demonstrates pre-oil Dubai lifestyle'},
-                    {'name': 'Pearl Diving Exhibit', 'slug': 'pearl-diving-exhibit', 'description': 'Interactive display on pearl diving industry', 'significance': 'Highlights Dubai\'s maritime heritage'},
-                    {'name': 'Modern Dubai Gallery', 'slug': 'modern-dubai-gallery', 'description': 'Multimedia presentation of city\'s development', 'significance': 'Shows Dubai\'s rapid modernization'}
-                ],
-                'entrance_fees': '5 AED for adults. Free for children under 6.',
-                'opening_hours': '8:30 AM to 8:30 PM Saturday-Thursday, 2:30 PM to 8:30 PM Friday.',
-                'best_time': 'Early morning or late afternoon to avoid midday heat.',
-                'how_to_get_there': 'Located near Dubai Creek. Walking distance from Abra station.',
-                'what_to_wear': 'Comfortable clothing. Modest attire recommended.',
-                'visitor_tips': [
-                    'Start with the archaeological galleries',
-                    'Allow 1-2 hours for complete visit',
-                    'Audio guide available in multiple languages',
-                    'Visit during cultural events for special programs',
-                    'Combine with Al Fahidi Historical Neighbourhood',
-                    'Photography allowed in most areas'
-                ],
-                'discovery': 'Dubai Museum was established in 1971 in the historic Al Fahidi Fort, making it one of the oldest museums in the UAE. The fort itself dates back to 1787 and served as a defensive structure during Dubai\'s early history. The museum was created to preserve and showcase Dubai\'s cultural heritage and archaeological finds.',
-                'architecture': 'The museum is housed in the restored Al Fahidi Fort, featuring traditional Gulf architecture with wind towers for natural cooling. The fort\'s design includes thick walls, strategic defensive positions, and traditional construction methods. Modern museum facilities have been integrated while preserving the historic structure.',
-                'cultural_impact': 'Dubai Museum plays a crucial role in preserving Emirati cultural heritage and educating visitors about the UAE\'s history. It has become a cornerstone of Dubai\'s cultural tourism, attracting visitors from around the world. The museum has inspired similar cultural preservation efforts across the UAE and contributed to national identity.',
-                'conservation': 'The museum employs advanced conservation techniques to protect archaeological artifacts and maintain the historic fort structure. Climate-controlled environments preserve delicate items, and restoration work continues to maintain the building\'s architectural integrity. Educational programs promote cultural preservation awareness.',
-                'health_safety': 'The museum maintains comfortable indoor temperatures with air conditioning. Wheelchair accessibility is available throughout the main areas. Security measures ensure visitor safety, and medical facilities are nearby. The museum recommends comfortable walking shoes due to extensive exploration.',
-                'guided_tours': 'Official guided tours are available in multiple languages, providing historical context and detailed explanations of exhibits. Audio guides offer self-paced exploration with comprehensive information. Special themed tours focus on specific aspects of Dubai\'s history and culture.',
-                'nearby_attractions': 'Al Fahidi Historical Neighbourhood (adjacent), Dubai Creek (walking distance), Gold Souk (nearby).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2639° N, 55.2978° E',
-                'annual_visitors': 'Over 500,000',
-                'climate': 'Air-conditioned museum.'
-            },
-            'al-fahidi-historical': {
-                'id': 'al-fahidi-historical',
-                'name': 'Al Fahidi Historical Neighbourhood',
-                'location': 'Dubai, UAE',
-                'description': 'Dubai\'s oldest district featuring restored wind-tower houses, museums, and traditional architecture.',
-                'long_description': 'Al Fahidi Historical Neighbourhood, also known as Bastakiya, is Dubai\'s oldest district and a UNESCO tentative World Heritage Site. This restored area features traditional wind-tower houses, narrow alleyways, and cultural institutions. The neighbourhood showcases Dubai\'s architectural heritage and serves as a cultural hub with art galleries, museums, and traditional crafts.',
-                'historical_significance': 'Bastakiya was settled by Iranian merchants in the late 19th century. The distinctive wind-tower houses were designed to provide natural cooling through wind catchers. The area declined after the 1970s but was restored in the 1990s to preserve Dubai\'s cultural heritage.',
-                'facts': [
-                    'Dubai\'s oldest residential district',
-                    'Features over 50 restored wind-tower houses',
-                    'UNESCO tentative World Heritage Site',
-                    'Traditional Iranian-influenced architecture',
-                    'Wind towers provide natural air conditioning',
-                    'Home to art galleries and cultural institutions',
-                    'Features narrow alleyways and courtyards',
-                    'Preserves pre-oil Dubai architecture'
-                ],
-                'key_sites': [
-                    {'name': 'Wind Tower Houses', 'slug': 'wind-tower-houses', 'description': 'Traditional houses with distinctive wind catchers', 'significance': 'Showcase Persian Gulf architectural heritage'},
-                    {'name': 'Majlis Gallery', 'slug': 'majlis-gallery', 'description': 'Contemporary art gallery in restored house', 'significance': 'Features rotating exhibitions of local and international artists'},
-                    {'name': 'Bastakiya Art Fair', 'slug': 'bastakiya-art-fair', 'description': 'Annual art event in the neighbourhood', 'significance': 'Showcases contemporary art in historic setting'},
-                    {'name': 'Traditional Courtyards', 'slug': 'traditional-courtyards', 'description': 'Restored open spaces with fountains', 'significance': 'Provide respite from heat and social gathering spaces'}
-                ],
-                'entrance_fees': 'Free access to public areas. Museum fees vary.',
-                'opening_hours': 'Galleries typically 10:00 AM to 6:00 PM.',
-                'best_time': 'Early morning or evening for cooler exploration.',
-                'how_to_get_there': 'Near Dubai Creek. Walking distance from Dubai Museum.',
-                'what_to_wear': 'Comfortable walking shoes. Modest attire.',
-                'visitor_tips': [
-                    'Explore the narrow alleyways on foot',
-                    'Visit art galleries for contemporary exhibits',
-                    'Try traditional Arabic coffee at local cafes',
-                    'Attend Bastakiya Art Fair when in season',
-                    'Combine with Dubai Museum visit',
-                    'Allow 1-2 hours to explore thoroughly'
-                ],
-                'discovery': 'Al Fahidi Historical Neighbourhood was rediscovered in the 1990s when Dubai began its cultural preservation efforts. The area, originally settled by Iranian merchants in the late 19th century, had fallen into disrepair but was restored to preserve Dubai\'s architectural heritage. The restoration project transformed the neighbourhood into a living museum showcasing traditional Gulf architecture.',
-                'architecture': 'The neighbourhood features distinctive wind-tower houses (barjeel) with traditional Persian Gulf architectural elements. The wind towers provide natural air conditioning through wind catchers, while the narrow alleyways and courtyards create shaded, comfortable spaces. Modern restoration has preserved the original construction methods while adding contemporary amenities.',
-                'cultural_impact': 'Bastakiya has become a symbol of Dubai\'s commitment to cultural preservation amidst rapid modernization. It hosts art galleries, cultural events, and traditional crafts, serving as a bridge between Dubai\'s past and present. The neighbourhood has inspired similar preservation projects across the UAE and contributes to national cultural identity.',
-                'conservation': 'Ongoing conservation efforts maintain the architectural integrity of the wind-tower houses and traditional structures. The Dubai Future Foundation supports preservation programs that balance tourism needs with cultural authenticity. Environmental monitoring ensures the neighbourhood remains a sustainable cultural destination.',
-                'health_safety': 'The neighbourhood features shaded alleyways and courtyards that provide respite from heat. Security measures ensure visitor safety, and medical facilities are nearby. Visitors should wear comfortable walking shoes for the uneven traditional pathways and stay hydrated during exploration.',
-                'guided_tours': 'Official guided tours are available through the Dubai Tourism Department, providing historical context and architectural insights. Local guides offer cultural experiences including traditional coffee ceremonies. Art gallery tours showcase contemporary Emirati artists and their work in historic settings.',
-                'nearby_attractions': 'Dubai Museum (adjacent), Dubai Creek (walking distance), Gold Souk (nearby).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2647° N, 55.2994° E',
-                'annual_visitors': 'Over 1 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'dubai-frame': {
-                'id': 'dubai-frame',
-                'name': 'Dubai Frame',
-                'location': 'Dubai, UAE',
-                'description': 'Massive picture frame structure offering panoramic views of old and new Dubai from elevated platforms.',
-                'long_description': 'Dubai Frame is a massive architectural structure designed as a giant picture frame, symbolizing Dubai\'s journey from past to present. Standing 150 meters tall, this modern monument offers visitors panoramic views of Dubai\'s historic and contemporary landscapes from its elevated observation platforms. The structure represents the frame of a picture, with old Dubai on one side and new Dubai on the other.',
-                'historical_significance': 'Dubai Frame was inaugurated in 2018 as part of Dubai\'s 2020 urban regeneration project. The structure symbolizes Dubai\'s transformation from a small fishing village to a global metropolis. It represents the "frame" that connects Dubai\'s rich heritage with its futuristic vision.',
-                'facts': [
-                    '150 meters tall (equivalent to 50-story building)',
-                    'Designed as a giant picture frame',
-                    'Two observation decks at different heights',
-                    'Bridges connect old and new Dubai symbolically',
-                    'Features multimedia exhibits on Dubai\'s history',
-                    'Night illumination creates stunning visual effects',
-                    'Part of Dubai 2040 Urban Master Plan',
-                    'Cost 170 million AED to construct'
-                ],
-                'key_sites': [
-                    {'name': 'Upper Observation Deck', 'slug': 'upper-observation-deck', 'description': '360-degree views at 150 meters', 'significance': 'Highest public viewpoint in Dubai Frame'},
-                    {'name': 'Lower Observation Deck', 'slug': 'lower-observation-deck', 'description': 'Views at 93 meters with glass floor', 'significance': 'Offers different perspective with transparent floor'},
-                    {'name': 'Multimedia Gallery', 'slug': 'multimedia-gallery', 'description': 'Interactive exhibits on Dubai\'s history', 'significance': 'Educational displays on city\'s development'},
-                    {'name': 'Bridge of Progress', 'slug': 'bridge-of-progress', 'description': 'Connecting bridge between platforms', 'significance': 'Symbolizes connection between past and future'}
-                ],
-                'entrance_fees': '50 AED for adults. Free for children under 6.',
-                'opening_hours': '9:00 AM to 9:00 PM daily.',
-                'best_time': 'Evening for illuminated views and cooler temperatures.',
-                'how_to_get_there': 'Located in Zabeel Park. Metro: Dubai Frame station.',
-                'what_to_wear': 'Comfortable clothing and shoes.',
-                'visitor_tips': [
-                    'Book tickets online to skip queues',
-                    'Visit at sunset for spectacular views',
-                    'Experience the glass floor on lower deck',
-                    'Allow 1-2 hours for complete visit',
-                    'Night visits offer illuminated city views',
-                    'Photography encouraged from observation decks'
-                ],
-                'discovery': 'Dubai Frame was conceived as part of Dubai\'s urban regeneration project in 2018, symbolizing the city\'s transformation from traditional to modern. The structure represents a "frame" that captures both Dubai\'s heritage and its futuristic vision, offering visitors a unique perspective on the city\'s evolution through contrasting viewpoints of old and new Dubai.',
-                'architecture': 'The 150-meter-tall structure is designed as a massive picture frame with two observation decks at different heights. The upper deck provides panoramic views at 150 meters, while the lower deck features a glass floor for a thrilling transparent experience. The design incorporates modern engineering with symbolic elements representing Dubai\'s journey from past to present.',
-                'cultural_impact': 'Dubai Frame has become an iconic symbol of Dubai\'s modern identity, representing the city\'s ability to preserve heritage while embracing innovation. It serves as a cultural bridge between traditional and contemporary Dubai, attracting visitors from around the world and contributing to the city\'s global image as a destination that honors both history and progress.',
-                'conservation': 'The structure incorporates sustainable design elements including energy-efficient lighting and materials. As part of Dubai\'s broader conservation efforts, Dubai Frame promotes environmental awareness through its exhibits on urban regeneration and sustainable development. The surrounding Zabeel Park contributes to green space preservation in the city.',
-                'health_safety': 'The attraction features multiple safety measures including secure access controls, emergency evacuation procedures, and medical facilities nearby. Visitors should wear comfortable shoes for extended standing on observation decks and stay hydrated. The glass floor area has safety barriers, and staff monitor visitor capacity to ensure comfortable viewing conditions.',
-                'guided_tours': 'Official guided tours are available in multiple languages, providing historical context about Dubai\'s development and architectural significance. Audio guides offer self-paced exploration with detailed information about the city\'s transformation. Special evening tours showcase the illuminated structure and night-time city views.',
-                'nearby_attractions': 'Zabeel Park (surrounding), Dubai Miracle Garden (nearby), Dubai Safari Park (adjacent).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2367° N, 55.3028° E',
-                'annual_visitors': 'Over 2 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'dubai-miracle-garden': {
-                'id': 'dubai-miracle-garden',
-                'name': 'Dubai Miracle Garden',
-                'location': 'Dubai, UAE',
-                'description': 'World\'s largest flower garden featuring millions of flowers arranged in spectacular displays and sculptures.',
-                'long_description': 'Dubai Miracle Garden is the world\'s largest flower garden, spanning 72,000 square meters and featuring over 150 million flowers. This floral paradise showcases spectacular displays including the world\'s largest flower sculpture, heart-shaped installations, and themed gardens. The garden represents Dubai\'s commitment to creating world-class attractions that celebrate nature and beauty.',
-                'facts': [
-                    'World\'s largest flower garden at 72,000 square meters',
-                    'Features over 150 million flowers',
-                    'World\'s largest flower sculpture (15 meters tall)',
-                    'Over 250 varieties of flowers and plants',
-                    'Heart-shaped installations and photo opportunities',
-                    'Butterfly garden and children\'s play areas',
-                    'Seasonal flower displays and themed gardens',
-                    'Sustainable irrigation systems used throughout'
-                ],
-                'key_sites': [
-                    {'name': 'World\'s Largest Flower Sculpture', 'description': '15-meter tall floral structure', 'significance': 'Guinness World Record holder and iconic photo spot'},
-                    {'name': 'Heart of Love', 'slug': 'heart-of-love', 'description': 'Massive heart-shaped flower installation', 'significance': 'Popular romantic photo location'},
-                    {'name': 'Butterfly Garden', 'slug': 'butterfly-garden', 'description': 'Enclosed garden with butterflies and flowers', 'significance': 'Interactive nature experience'},
-                    {'name': 'Seasonal Gardens', 'slug': 'seasonal-gardens', 'description': 'Themed floral displays that change with seasons', 'significance': 'Showcases different flower varieties throughout year'}
-                ],
-                'entrance_fees': '60 AED for adults. 30 AED for children 3-12.',
-                'opening_hours': '9:00 AM to 9:00 PM daily.',
-                'best_time': 'Early morning or late afternoon. Cooler months October-April.',
-                'how_to_get_there': 'Located in Al Barsha South. Taxi or private car recommended.',
-                'what_to_wear': 'Comfortable walking shoes. Light clothing.',
-                'visitor_tips': [
-                    'Visit early morning to avoid heat and crowds',
-                    'Bring water and stay hydrated',
-                    'Allow 2-3 hours to explore all areas',
-                    'Best photographed during golden hour',
-                    'Wheelchair accessible throughout',
-                    'Photography encouraged in all areas'
-                ],
-                'discovery': 'Dubai Miracle Garden was established in 2013 as part of Dubai\'s initiative to create world-class floral attractions. The garden emerged from Dubai\'s vision to transform desert landscapes into spectacular displays of nature and beauty, showcasing innovative horticulture in the Middle East. It represents Dubai\'s commitment to sustainable tourism and floral excellence.',
-                'architecture': 'The garden spans 72,000 square meters with meticulously planned floral arrangements and sculptures. The design incorporates sustainable irrigation systems, shaded walkways, and themed areas that create immersive experiences. The world\'s largest flower sculpture and heart installations demonstrate advanced floral engineering and artistic design in a desert environment.',
-                'cultural_impact': 'Dubai Miracle Garden has become a symbol of Dubai\'s ability to create beauty from barren landscapes, inspiring similar projects across the UAE and Middle East. It promotes environmental awareness and showcases sustainable horticulture practices. The garden has become a popular destination for families, couples, and tourists seeking natural beauty in an urban setting.',
-                'conservation': 'The garden implements advanced water conservation techniques and sustainable horticulture practices. It uses recycled water systems and energy-efficient operations to minimize environmental impact. Conservation programs educate visitors about desert agriculture and floral biodiversity, contributing to broader environmental awareness in the region.',
-                'health_safety': 'The garden features shaded walkways and covered areas to protect visitors from heat. Medical facilities are available on-site, and staff monitor visitor safety throughout the park. Wheelchair accessibility ensures inclusive access for all visitors, with smooth pathways and ramps throughout the garden.',
-                'guided_tours': 'Official guided tours provide insights into the garden\'s horticulture and floral arrangements. Photography tours help visitors capture the best shots of the flower displays. Family-oriented tours include interactive elements and educational content about plants and sustainability.',
-                'nearby_attractions': 'Dubai Butterfly Garden (adjacent), Dubai Frame (nearby), Mall of Emirates (5 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1416879595882-3373a0480b5b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.0667° N, 55.2333° E',
-                'annual_visitors': 'Over 1.5 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'global-village-dubai': {
-                'id': 'global-village-dubai',
-                'name': 'Global Village Dubai',
-                'description': 'Cultural theme park showcasing pavilions from around the world with food, entertainment, and shopping.',
-                'long_description': 'Global Village Dubai is a cultural theme park that brings the world to Dubai through authentic reproductions of famous landmarks and cultural pavilions. Featuring over 30 international pavilions, the park offers visitors a journey through global cultures with traditional food, shopping, entertainment, and architectural displays. It\'s one of Dubai\'s most popular seasonal attractions.',
-                'facts': [
-                    'Spans 17.5 million square feet (1.6 million square meters)',
-                    'Features over 30 international pavilions',
-                    'Authentic reproductions of world landmarks',
-                    'Over 100 restaurants serving international cuisine',
-                    'Daily cultural performances and shows',
-                    'Seasonal attraction open October-April',
-                    'Features shopping, entertainment, and dining',
-                    'Accommodates up to 30,000 visitors daily'
-                ],
-                'key_sites': [
-                    {'name': 'International Pavilions', 'slug': 'international-pavilions', 'description': 'Authentic reproductions of world landmarks', 'significance': 'Showcase architecture and culture from different countries'},
-                    {'name': 'Cultural Shows', 'slug': 'cultural-shows', 'description': 'Daily performances of traditional dances and music', 'significance': 'Entertainment featuring artists from around the world'},
-                    {'name': 'Food Court', 'slug': 'food-court', 'description': 'Diverse international cuisine options', 'significance': 'Culinary journey through global flavors'},
-                    {'name': 'Shopping Areas', 'slug': 'shopping-areas', 'description': 'Traditional crafts and souvenirs', 'significance': 'Authentic handicrafts from different cultures'}
-                ],
-                'entrance_fees': '15 AED for adults. Free for children under 3.',
-                'opening_hours': '4:00 PM to 12:00 AM daily (seasonal).',
-                'best_time': 'Evening for cooler temperatures and night shows.',
-                'how_to_get_there': 'Located in Dubai Festival City. Free shuttle from nearby malls.',
-                'what_to_wear': 'Comfortable casual attire.',
-                'visitor_tips': [
-                    'Visit in the evening for cooler weather',
-                    'Try food from different country pavilions',
-                    'Watch cultural performances at designated times',
-                    'Allow 3-4 hours to explore thoroughly',
-                    'Free parking and shuttle services available',
-                    'Best experienced with family or groups'
-                ],
-                'discovery': 'Global Village Dubai opened in 1997 as Dubai\'s first cultural theme park, evolving from a small seasonal market to a major international attraction. The park was created to bring world cultures to Dubai residents and visitors, fostering cultural exchange and understanding. It has grown to become one of the largest seasonal attractions in the Middle East.',
-                'architecture': 'The park features authentic reproductions of iconic world landmarks and cultural buildings from different countries. Each pavilion showcases traditional architectural styles and designs, from European castles to Asian temples. The layout creates a global journey through diverse architectural traditions, with themed entertainment areas and cultural displays.',
-                'cultural_impact': 'Global Village has become a bridge between cultures, promoting understanding and appreciation of global diversity. It serves as an educational platform for cultural exchange and has influenced similar cultural attractions across the UAE. The park contributes to Dubai\'s image as a cosmopolitan city that celebrates international cultures.',
-                'conservation': 'The park incorporates sustainable practices in its seasonal operations, including energy-efficient lighting and waste management systems. Cultural preservation efforts ensure authentic representations of world landmarks and traditions. Environmental initiatives include green spaces and water conservation measures throughout the park.',
-                'health_safety': 'The park maintains high safety standards with security personnel, emergency medical services, and crowd management systems. Shaded areas and covered walkways provide protection from weather. Accessibility features ensure inclusive access for visitors with disabilities, with ramps and accessible facilities throughout.',
-                'guided_tours': 'Cultural guided tours explore different country pavilions with historical and cultural context. Family tours include interactive elements and cultural performances. Photography tours help visitors capture the best views of the international landmarks and cultural displays.',
-                'nearby_attractions': 'Dubai Festival City (adjacent), Dubai Miracle Garden (nearby), Dubai Frame (5 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1542204165-65bf26472b9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.0667° N, 55.3000° E',
-                'annual_visitors': 'Over 5 million',
-                'climate': 'Desert climate. Seasonal attraction.'
-            },
-            'ferrari-world-abu-dhabi': {
-                'id': 'ferrari-world-abu-dhabi',
-                'name': 'Ferrari World Abu Dhabi',
-                'location': 'Abu Dhabi, UAE',
-                'description': 'High-speed racing theme park featuring the world\'s fastest roller coaster and Ferrari experiences.',
-                'long_description': 'Ferrari World Abu Dhabi is a racing-themed amusement park located on Yas Island. This Ferrari-branded attraction features the world\'s fastest roller coaster, interactive racing experiences, and exhibits showcasing Ferrari\'s racing heritage. The park offers a complete Ferrari experience with rides, shows, and merchandise.',
-                'facts': [
-                    'World\'s first Ferrari-themed amusement park',
-                    'Features Formula Rossa, world\'s fastest roller coaster (240 km/h)',
-                    'Spans 200,000 square meters',
-                    'Over 20 rides and attractions',
-                    'Interactive racing simulators and go-kart tracks',
-                    'Ferrari merchandise and memorabilia',
-                    'Multiple restaurants and food outlets',
-                    'Capacity for 30,000 visitors daily'
-                ],
-                'key_sites': [
-                    {'name': 'Formula Rossa', 'slug': 'formula-rossa', 'description': 'World\'s fastest roller coaster reaching 240 km/h', 'significance': 'Guinness World Record holder and park\'s signature ride'},
-                    {'name': 'Racing Legends', 'slug': 'racing-legends', 'description': 'Interactive exhibit on Ferrari\'s racing history', 'significance': 'Showcases Ferrari\'s championship-winning cars'},
-                    {'name': 'Junior GP Karting', 'slug': 'junior-gp-karting', 'description': 'Go-kart track for children and families', 'significance': 'Safe racing experience for younger visitors'},
-                    {'name': 'Ferrari Racing Academy', 'slug': 'ferrari-racing-academy', 'description': 'Professional racing simulators', 'significance': 'High-tech racing experience with real F1 cars'}
-                ],
-                'entrance_fees': '295 AED for adults. 255 AED for children 3-12.',
-                'opening_hours': '11:00 AM to 8:00 PM Saturday-Wednesday, 11:00 AM to 10:00 PM Thursday-Friday.',
-                'best_time': 'Early morning or evening to avoid peak heat.',
-                'how_to_get_there': 'Located on Yas Island. Free shuttle from Yas Mall.',
-                'what_to_wear': 'Comfortable clothing and closed-toe shoes.',
-                'visitor_tips': [
-                    'Book tickets online for faster entry',
-                    'Ride Formula Rossa first before lines get long',
-                    'Stay hydrated and use sunscreen',
-                    'Allow 4-6 hours for full park experience',
-                    'Wheelchair accessible throughout',
-                    'Photography allowed in most areas'
-                ],
-                'discovery': 'Ferrari World Abu Dhabi opened in 2010 as the world\'s first Ferrari-themed amusement park, built on Yas Island. The park emerged from Abu Dhabi\'s vision to create world-class entertainment attractions and celebrate automotive excellence. It represents the partnership between Italian automotive heritage and Emirati hospitality.',
-                'architecture': 'The park\'s design incorporates Ferrari\'s racing heritage with modern amusement park architecture. The signature red structures and racing-themed buildings create an immersive Ferrari experience. The layout includes high-speed roller coaster tracks, interactive exhibit halls, and themed entertainment areas that showcase automotive engineering.',
-                'cultural_impact': 'Ferrari World has become a symbol of Abu Dhabi\'s emergence as a global entertainment destination, blending Italian racing culture with Emirati values. It has influenced motorsport tourism in the UAE and contributed to the development of Yas Island as an entertainment hub. The park promotes automotive heritage and engineering excellence.',
-                'conservation': 'The park implements energy-efficient systems and sustainable practices in its operations. Water conservation measures and waste management systems minimize environmental impact. Ferrari World supports conservation education through exhibits on automotive technology and sustainable racing practices.',
-                'health_safety': 'Comprehensive safety measures include trained staff, emergency response systems, and medical facilities. Ride safety protocols ensure visitor security on high-speed attractions. Heat protection measures and hydration stations address desert climate challenges, with shaded areas throughout the park.',
-                'guided_tours': 'Racing heritage tours provide insights into Ferrari\'s history and Abu Dhabi\'s motorsport legacy. VIP tours offer exclusive access to exhibits and behind-the-scenes areas. Family tours include interactive elements and educational content about automotive engineering.',
-                'nearby_attractions': 'Yas Marina Circuit (adjacent), Yas Waterworld (nearby), Louvre Abu Dhabi (10 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1558618666-fcd25c85cd64?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '24.4833° N, 54.6167° E',
-                'annual_visitors': 'Over 2 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'yas-marina-circuit': {
-                'id': 'yas-marina-circuit',
-                'name': 'Yas Marina Circuit',
-                'location': 'Abu Dhabi, UAE',
-                'description': 'F1 race track and entertainment complex hosting the Abu Dhabi Grand Prix and various events.',
-                'long_description': 'Yas Marina Circuit is a motor racing circuit on Yas Island, Abu Dhabi. The track hosts the Abu Dhabi Grand Prix, the final race of the Formula One World Championship. Beyond racing, the circuit features entertainment venues, restaurants, and attractions that operate year-round, making it a major tourist destination.',
-                'facts': [
-                    'Hosts Abu Dhabi Grand Prix, final F1 race of season',
-                    'Track length of 5.554 km (3.451 miles)',
-                    'Features Yas Marina Hotel built into the circuit',
-                    'Capacity for 60,000 spectators',
-                    'Year-round entertainment and dining venues',
-                    'Home to Ferrari World Abu Dhabi',
-                    'Features the world\'s first circuit hotel',
-                    'Hosts various motorsport and entertainment events'
-                ],
-                'key_sites': [
-                    {'name': 'F1 Race Track', 'slug': 'f1-race-track', 'description': 'Professional Formula One circuit', 'significance': 'Hosts Abu Dhabi Grand Prix and other racing events'},
-                    {'name': 'Yas Marina Hotel', 'slug': 'yas-marina-hotel', 'description': 'Hotel built into the circuit with track views', 'significance': 'Unique accommodation with F1 racing views'},
-                    {'name': 'Entertainment Venues', 'slug': 'entertainment-venues', 'description': 'Restaurants, bars, and entertainment complexes', 'significance': 'Year-round dining and entertainment options'},
-                    {'name': 'VIP Areas', 'slug': 'vip-areas', 'description': 'Premium viewing and hospitality areas', 'significance': 'Exclusive experiences during race weekends'}
-                ],
-                'entrance_fees': 'Varies by event. Circuit tours available when no events.',
-                'opening_hours': 'Varies by events. Entertainment areas open daily.',
-                'best_time': 'During Abu Dhabi Grand Prix (December) or other events.',
-                'how_to_get_there': 'Located on Yas Island. Taxi or private car recommended.',
-                'what_to_wear': 'Casual attire for entertainment, smart casual for events.',
-                'visitor_tips': [
-                    'Book Grand Prix tickets well in advance',
-                    'Visit Ferrari World while at the circuit',
-                    'Explore dining options in entertainment areas',
-                    'Take circuit tours when available',
-                    'Best experienced during race weekends',
-                    'Allow time for traffic during events'
-                ],
-                'discovery': 'Yas Marina Circuit was inaugurated in 2009 as the venue for the Abu Dhabi Grand Prix, the final race of the Formula One World Championship. The circuit was built on Yas Island as part of Abu Dhabi\'s strategy to become a global motorsport destination. It represents the emirate\'s investment in world-class sporting infrastructure.',
-                'architecture': 'The circuit features a unique design with the Yas Marina Hotel built directly over the track, creating a one-of-a-kind architectural landmark. The track layout incorporates challenging corners and high-speed straights, with the iconic hotel providing a stunning backdrop. Modern engineering ensures safety and performance for both racing and entertainment.',
-                'cultural_impact': 'Yas Marina Circuit has elevated Abu Dhabi\'s global profile as a premier motorsport destination and contributed to the development of Yas Island as an entertainment complex. It has inspired motorsport tourism across the UAE and fostered international sporting events. The circuit represents Abu Dhabi\'s commitment to excellence in sports and entertainment.',
-                'conservation': 'The circuit incorporates sustainable design elements including energy-efficient lighting and water conservation systems. Environmental monitoring ensures minimal impact on the surrounding marine ecosystem. The venue supports conservation through educational programs about motorsport and environmental stewardship.',
-                'health_safety': 'Comprehensive safety protocols include advanced track security systems, emergency medical services, and crowd management during events. The circuit maintains high safety standards for both race weekends and public visits. Medical facilities and security personnel ensure visitor safety throughout the venue.',
-                'guided_tours': 'Circuit tours provide behind-the-scenes access to the track and pit areas. Grand Prix experience tours offer insights into Formula One racing. VIP tours include access to the Yas Marina Hotel and exclusive viewing areas during events.',
-                'nearby_attractions': 'Ferrari World Abu Dhabi (adjacent), Yas Waterworld (nearby), Louvre Abu Dhabi (10 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1558618666-fcd25c85cd64?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '24.4833° N, 54.6167° E',
-                'annual_visitors': 'Over 3 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'abu-dhabi-corniche': {
-                'id': 'abu-dhabi-corniche',
-                'name': 'Abu Dhabi Corniche',
-                'description': 'Scenic waterfront promenade featuring beaches, parks, luxury hotels, and stunning Arabian Gulf views.',
-                'long_description': 'Abu Dhabi Corniche is a stunning waterfront promenade that stretches along the Arabian Gulf coastline. This scenic area features pristine beaches, lush parks, luxury hotels, and modern architecture. It serves as Abu Dhabi\'s premier recreational area, offering residents and visitors a perfect blend of relaxation, entertainment, and cultural experiences.',
-                'facts': [
-                    'Stretches 7 km along Abu Dhabi\'s coastline',
-                    'Features pristine beaches and waterfront promenade',
-                    'Home to luxury hotels and modern architecture',
-                    'Multiple parks and recreational areas',
-                    'Popular for jogging, cycling, and picnics',
-                    'Features the iconic Abu Dhabi skyline views',
-                    'Evening entertainment with fountains and lights',
-                    'Cultural events and festivals held regularly'
-                ],
-                'key_sites': [
-                    {'name': 'Corniche Beach', 'slug': 'corniche-beach', 'description': 'Pristine sandy beach with facilities', 'significance': 'Popular swimming and relaxation area'},
-                    {'name': 'Emirates Palace Hotel', 'slug': 'emirates-palace-hotel', 'description': 'Luxury hotel with corniche views', 'significance': 'Iconic landmark and hospitality venue'},
-                    {'name': 'Corniche Park', 'slug': 'corniche-park', 'description': 'Green spaces with walking paths', 'significance': 'Recreational area for outdoor activities'},
-                    {'name': 'Waterfront Promenade', 'slug': 'waterfront-promenade', 'description': 'Scenic walkway with shops and cafes', 'significance': 'Popular for evening strolls and dining'}
-                ],
-                'entrance_fees': 'Free access to public areas.',
-                'opening_hours': '24/7 access to promenade.',
-                'best_time': 'Evening for cooler temperatures and illuminated views.',
-                'how_to_get_there': 'Central Abu Dhabi location. Walking distance from many hotels.',
-                'what_to_wear': 'Casual attire. Swimwear at designated beach areas.',
-                'visitor_tips': [
-                    'Visit during evening for spectacular views',
-                    'Rent bikes for scenic rides along the promenade',
-                    'Try waterfront dining at beach clubs',
-                    'Watch the sunset from the corniche',
-                    'Join locals for evening walks',
-                    'Allow 2-3 hours to explore the full length'
-                ],
-                'discovery': 'Abu Dhabi Corniche was developed in the 1960s as part of the city\'s modernization efforts, transforming coastal land into a scenic waterfront promenade. The corniche emerged from Abu Dhabi\'s urban planning vision to create public spaces that blend traditional culture with modern amenities. It has evolved into the city\'s premier recreational area.',
-                'architecture': 'The corniche features a harmonious blend of modern architecture with traditional Islamic design elements. Luxury hotels, contemporary sculptures, and landscaped gardens line the waterfront. The promenade incorporates sustainable design with shaded walkways, fountains, and recreational facilities that create an inviting public space.',
-                'cultural_impact': 'The Corniche has become the heart of Abu Dhabi\'s social and cultural life, serving as a gathering place for locals and visitors. It represents Abu Dhabi\'s identity as a modern Islamic city that values public spaces and community. The corniche has influenced urban planning across the UAE and become a symbol of the emirate\'s development.',
-                'conservation': 'The corniche incorporates environmental protection measures including marine ecosystem preservation and sustainable landscaping. Water features and green spaces contribute to urban biodiversity. Conservation efforts focus on maintaining the natural coastal environment while providing recreational amenities.',
-                'health_safety': 'The promenade features well-lit pathways, security cameras, and regular patrols ensuring visitor safety. Medical facilities are nearby, and the design includes shaded areas for heat protection. Accessibility features ensure inclusive access for all visitors along the waterfront.',
-                'guided_tours': 'Cultural walking tours explore the corniche\'s history and architecture. Photography tours capture the best views of the waterfront and skyline. Evening tours showcase the illuminated landmarks and waterfront entertainment.',
-                'nearby_attractions': 'Emirates Palace (adjacent), Heritage Village (nearby), Abu Dhabi Mall (2 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '24.4667° N, 54.3667° E',
-                'annual_visitors': 'Over 10 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'dubai-aquarium': {
-                'id': 'dubai-aquarium',
-                'name': 'Dubai Aquarium',
-                'location': 'Dubai, UAE',
-                'description': 'Massive underwater aquarium featuring a 270-degree viewing tunnel and thousands of marine species.',
-                'long_description': 'Dubai Aquarium & Underwater Zoo is one of the world\'s largest suspended aquariums, featuring a massive 270-degree viewing tunnel. The aquarium houses over 33,000 marine animals representing 140 species, including sharks, rays, and colorful tropical fish. It offers an immersive underwater experience with interactive exhibits and educational programs.',
-                'facts': [
-                    'World\'s largest suspended aquarium',
-                    '270-degree viewing tunnel (51 meters long)',
-                    'Over 33,000 marine animals',
-                    '140 different species including sharks and rays',
-                    '10 million liters of water',
-                    'Features underwater restaurant and hotel',
-                    'Interactive touch pools and exhibits',
-                    'Educational programs and conservation focus'
-                ],
-                'key_sites': [
-                    {'name': 'Main Viewing Tunnel', 'slug': 'main-viewing-tunnel', 'description': '51-meter suspended tunnel with marine life', 'significance': 'Immersive underwater experience with sharks swimming overhead'},
-                    {'name': 'Shark Aquarium', 'slug': 'shark-aquarium', 'description': 'Dedicated shark exhibit with various species', 'significance': 'Features sand tiger sharks, hammerheads, and reef sharks'},
-                    {'name': 'Ray Lagoon', 'slug': 'ray-lagoon', 'description': 'Interactive area with stingrays', 'significance': 'Touch and feed experience with gentle rays'},
-                    {'name': 'Penguin Expedition', 'slug': 'penguin-expedition', 'description': 'Antarctic penguin habitat', 'significance': 'Climate-controlled environment for penguin species'}
-                ],
-                'entrance_fees': 'Dubai Aquarium: 95 AED. Underwater Zoo: 140 AED. Combined: 185 AED.',
-                'opening_hours': '10:00 AM to 10:00 PM daily.',
-                'best_time': 'Early morning or late afternoon to avoid crowds.',
-                'how_to_get_there': 'Located in Dubai Mall. Direct access from mall.',
-                'what_to_wear': 'Comfortable clothing and shoes.',
-                'visitor_tips': [
-                    'Book tickets online to skip queues',
-                    'Visit early morning for fewer crowds',
-                    'Allow 2-3 hours for complete experience',
-                    'Photography allowed throughout',
-                    'Wheelchair accessible',
-                    'Touch pools available for interactive experience'
-                ],
-                'discovery': 'Dubai Aquarium opened in 2008 as part of Dubai Mall, emerging from Dubai\'s vision to create world-class entertainment and educational attractions. The aquarium was designed to showcase marine biodiversity and provide immersive underwater experiences. It represents Dubai\'s commitment to combining entertainment with environmental education.',
-                'architecture': 'The aquarium features a massive 270-degree viewing tunnel suspended within a 10 million liter tank, creating an immersive underwater experience. The design incorporates modern aquarium technology with educational exhibits and interactive displays. The underwater restaurant and hotel add unique architectural elements to the marine experience.',
-                'cultural_impact': 'Dubai Aquarium has become a cultural landmark that promotes marine conservation awareness and environmental education. It has influenced aquarium design worldwide and contributed to Dubai\'s reputation as an innovative entertainment destination. The attraction fosters appreciation for marine ecosystems and biodiversity.',
-                'conservation': 'The aquarium supports marine conservation through breeding programs and educational exhibits. Sustainable practices include energy-efficient systems and water recycling. Conservation partnerships work to protect marine species and promote ocean awareness among visitors.',
-                'health_safety': 'The facility maintains strict safety protocols with trained staff and emergency response systems. Accessibility features ensure inclusive access for all visitors. Medical facilities are available on-site, and the climate-controlled environment provides comfort throughout the visit.',
-                'guided_tours': 'Marine biology tours provide educational insights into aquatic life and conservation. Family tours include interactive elements and touch pool experiences. Photography tours help visitors capture the best underwater views and marine life.',
-                'nearby_attractions': 'Dubai Mall (connected), Burj Khalifa (adjacent), Dubai Fountain (nearby).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1558618666-fcd25c85cd64?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.1972° N, 55.2791° E',
-                'annual_visitors': 'Over 5 million',
-                'climate': 'Air-conditioned aquarium.'
-            },
-            'ski-dubai': {
-                'id': 'ski-dubai',
-                'name': 'Ski Dubai',
-                'location': 'Dubai, UAE',
-                'description': 'Indoor ski resort in the desert featuring slopes, penguins, and winter activities year-round.',
-                'long_description': 'Ski Dubai is the Middle East\'s first indoor ski resort, located inside Mall of the Emirates. This climate-controlled facility features five different slopes, a penguin habitat, and various winter activities. Despite being in the desert, Ski Dubai offers a complete winter sports experience with real snow and ice.',
-                'facts': [
-                    'Middle East\'s first indoor ski resort',
-                    'Five different ski slopes of varying difficulty',
-                    'Temperature maintained at -1°C to -6°C',
-                    'Features 22,500 square meters of skiable area',
-                    'Home to penguins in climate-controlled habitat',
-                    'Snow park with jumps and rails',
-                    'Ski and snowboard rental available',
-                    'Professional instruction for all levels'
-                ],
-                'key_sites': [
-                    {'name': 'Main Slope', 'slug': 'main-slope', 'description': 'Primary ski run for all skill levels', 'significance': 'Features varying difficulty sections'},
-                    {'name': 'Snow Park', 'slug': 'snow-park', 'description': 'Terrain park with jumps and obstacles', 'significance': 'For advanced skiers and snowboarders'},
-                    {'name': 'Penguin Habitat', 'slug': 'penguin-habitat', 'description': 'Climate-controlled enclosure with Gentoo penguins', 'significance': 'Unique desert-meets-Arctic experience'},
-                    {'name': 'Kids\' Slope', 'description': 'Gentle slope for children and beginners', 'significance': 'Safe learning environment for young skiers'}
-                ],
-                'entrance_fees': 'Basic entry: 260 AED. Premium packages: 350-450 AED.',
-                'opening_hours': '10:00 AM to 11:00 PM Sunday-Wednesday, 10:00 AM to 12:00 AM Thursday-Saturday.',
-                'best_time': 'Early morning for fewer crowds and better snow conditions.',
-                'how_to_get_there': 'Located in Mall of the Emirates. Direct access from mall.',
-                'what_to_wear': 'Warm clothing provided. Gloves and hats recommended.',
-                'visitor_tips': [
-                    'Book lessons in advance for beginners',
-                    'Warm clothing and gloves provided at entrance',
-                    'Visit penguin habitat for unique experience',
-                    'Allow 2-4 hours depending on activities',
-                    'Photography allowed throughout',
-                    'Best experienced with family or groups'
-                ],
-                'discovery': 'Ski Dubai opened in 2005 as the Middle East\'s first indoor ski resort, revolutionizing winter sports in desert climates. The resort emerged from Dubai\'s innovative approach to creating year-round recreational attractions. It represents Dubai\'s ability to engineer winter experiences in tropical environments.',
-                'architecture': 'The resort features a climate-controlled dome maintaining sub-zero temperatures with real snow surfaces. The design includes multiple ski slopes, a snow park, and integrated penguin habitat. Advanced refrigeration technology creates authentic winter conditions within a desert environment.',
-                'cultural_impact': 'Ski Dubai has become a symbol of Dubai\'s engineering innovation and ability to create impossible attractions. It has influenced indoor ski resort design worldwide and contributed to Dubai\'s image as a city of superlatives. The resort promotes winter sports culture in non-traditional climates.',
-                'conservation': 'The resort incorporates energy-efficient refrigeration systems and sustainable practices. Environmental monitoring ensures minimal ecological impact. Conservation education focuses on climate science and the importance of polar ecosystems through the penguin habitat.',
-                'health_safety': 'Comprehensive safety measures include ski patrol, medical facilities, and equipment safety checks. Professional instruction ensures appropriate skill levels for slope access. The controlled environment provides protection from external weather while maintaining safe recreational conditions.',
-                'guided_tours': 'Ski instruction tours provide lessons for all skill levels. Penguin habitat tours offer insights into Antarctic wildlife. Family tours combine skiing experiences with educational elements about winter sports and climate.',
-                'nearby_attractions': 'Mall of the Emirates (connected), Dubai Miracle Garden (nearby), Wild Wadi Water Park (adjacent).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1551698618-1dfe5d97d256?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.1183° N, 55.2000° E',
-                'annual_visitors': 'Over 1 million',
-                'climate': 'Artificially maintained winter conditions.'
-            },
-            'atlantis-the-palm': {
-                'id': 'atlantis-the-palm',
-                'name': 'Atlantis The Palm',
-                'location': 'Dubai, UAE',
-                'description': 'Luxury resort on Palm Jumeirah featuring water park, marine attractions, and underwater experiences.',
-                'long_description': 'Atlantis The Palm is a luxury beach resort located at the tip of Palm Jumeirah. This iconic hotel features a massive water park, marine-themed attractions, and underwater experiences. The resort offers a complete entertainment experience with dining, shopping, and recreational facilities.',
-                'facts': [
-                    'Features world\'s largest open-air marine habitat',
-                    'Over 1,500 marine species in aquarium',
-                    'Water park with 30+ slides and attractions',
-                    'Underwater restaurant with ocean views',
-                    'Private beach and lagoon',
-                    'Multiple dining options from casual to fine dining',
-                    'Spa and wellness facilities',
-                    'Capacity for 1,500 guests'
-                ],
-                'key_sites': [
-                    {'name': 'Aquaventure Water Park', 'slug': 'aquaventure-water-park', 'description': 'Massive water park with slides and marine habitats', 'significance': 'Features world\'s largest open-air marine habitat'},
-                    {'name': 'The Lost Chambers Aquarium', 'slug': 'the-lost-chambers-aquarium', 'description': 'Underwater aquarium with marine exhibits', 'significance': 'Showcases over 65,000 marine creatures'},
-                    {'name': 'Underwater Suite', 'slug': 'underwater-suite', 'description': 'Luxury suite with underwater views', 'significance': 'Unique accommodation with marine life views'},
-                    {'name': 'Dolphin Bay', 'slug': 'dolphin-bay', 'description': 'Interactive dolphin and sea lion shows', 'significance': 'Educational and entertaining marine performances'}
-                ],
-                'entrance_fees': 'Water park day pass: 350 AED. Aquarium: 100 AED.',
-                'opening_hours': 'Water park: 10:00 AM to 6:00 PM. Hotel facilities vary.',
-                'best_time': 'October to April for outdoor activities.',
-                'how_to_get_there': 'Located at Palm Jumeirah tip. Taxi or private car recommended.',
-                'what_to_wear': 'Swimwear for water park. Smart casual for dining.',
-                'visitor_tips': [
-                    'Book water park tickets online in advance',
-                    'Visit early morning to avoid peak heat',
-                    'Try the underwater restaurant experience',
-                    'Allow full day for complete exploration',
-                    'Wheelchair accessible throughout',
-                    'Photography encouraged in most areas'
-                ],
-                'discovery': 'Atlantis The Palm opened in 2008 as the centerpiece of Palm Jumeirah, emerging from Dubai\'s ambitious land reclamation and tourism development projects. The resort represents the culmination of engineering innovation and luxury hospitality. It was designed to create a mythical underwater experience in the desert.',
-                'architecture': 'The resort features distinctive architectural elements including an underwater suite and marine-themed design. The Aquaventure water park incorporates natural rock formations and marine habitats. The structure blends modern luxury with oceanic themes, creating an immersive underwater fantasy world.',
-                'cultural_impact': 'Atlantis has become an iconic symbol of Dubai\'s architectural ambition and hospitality excellence. It has influenced resort design worldwide and contributed to Dubai\'s reputation as a destination for extraordinary experiences. The resort promotes marine conservation and environmental awareness through its exhibits.',
-                'conservation': 'The resort supports marine conservation through its extensive aquarium and breeding programs. Sustainable practices include energy-efficient systems and water conservation measures. Environmental education focuses on ocean ecosystems and marine biodiversity protection.',
-                'health_safety': 'Comprehensive safety protocols include lifeguard supervision, medical facilities, and emergency response systems. The resort maintains high standards for water park safety and guest security. Accessibility features ensure inclusive access throughout the property.',
-                'guided_tours': 'Marine discovery tours explore the aquarium and underwater habitats. Resort tours showcase the architectural features and luxury accommodations. Family tours combine water park experiences with educational marine exhibits.',
-                'nearby_attractions': 'Palm Jumeirah (surrounding), Dubai Marina (nearby), Burj Al Arab (adjacent).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1571003123894-1f0594d2b5d9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.1300° N, 55.1172° E',
-                'annual_visitors': 'Over 2 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'wild-wadi-water-park': {
-                'id': 'wild-wadi-water-park',
-                'name': 'Wild Wadi Water Park',
-                'location': 'Dubai, UAE',
-                'description': 'Adventure water park featuring thrilling slides, wave pools, and family-friendly attractions.',
-                'long_description': 'Wild Wadi Water Park is Dubai\'s premier water adventure park, featuring over 30 thrilling slides and attractions. Inspired by the Arabian Nights tales, the park offers a complete water adventure experience with slides for all ages, wave pools, lazy rivers, and family-friendly areas.',
-                'facts': [
-                    'Over 30 slides and water attractions',
-                    'Features Jumeirah Sceirah, world\'s largest water coaster',
-                    'Wave pool with 3-meter waves',
-                    'Lazy river and family play areas',
-                    'Capacity for 5,000 visitors daily',
-                    'Multiple restaurants and food outlets',
-                    'Changing facilities and lockers available',
-                    'Lifeguards and safety measures throughout'
-                ],
-                'key_sites': [
-                    {'name': 'Jumeirah Sceirah', 'slug': 'jumeirah-sceirah', 'description': 'World\'s largest water coaster with dark ride elements', 'significance': 'Signature attraction combining coaster and water slide'},
-                    {'name': 'Burj Suraj', 'slug': 'burj-suraj', 'description': 'Multi-level water playground', 'significance': 'Family-friendly area with various slides'},
-                    {'name': 'Riptide Racers', 'slug': 'riptide-racers', 'description': '4-person racing slides', 'significance': 'Thrilling competition between friends'},
-                    {'name': 'Wave Pool', 'slug': 'wave-pool', 'description': 'Large pool with generated waves', 'significance': 'Surfing and wave-riding experience'}
-                ],
-                'entrance_fees': 'Adult day pass: 295 AED. Child day pass: 265 AED.',
-                'opening_hours': '10:00 AM to 6:00 PM daily (seasonal).',
-                'best_time': 'October to April for comfortable temperatures.',
-                'how_to_get_there': 'Located next to Burj Al Arab. Taxi or private car recommended.',
-                'what_to_wear': 'Swimwear required. Bring sunscreen and hat.',
-                'visitor_tips': [
-                    'Book tickets online to skip queues',
-                    'Visit early morning for shorter lines',
-                    'Use lockers for valuables',
-                    'Stay hydrated and use sunscreen',
-                    'Allow 4-6 hours for full experience',
-                    'Wheelchair accessible areas available'
-                ],
-                'discovery': 'Wild Wadi Water Park opened in 1999 as Jumeirah Beach\'s companion attraction, emerging from Dubai\'s vision to create world-class water entertainment. The park was inspired by Arabian Nights tales and designed to provide thrilling water adventures. It represents Dubai\'s early commitment to family-oriented tourism attractions.',
-                'architecture': 'The park features Jumeirah Sceirah, the world\'s largest water coaster, with innovative water ride technology. The design incorporates natural rock formations, themed areas, and wave pools. Modern engineering creates safe and exciting water experiences with various ride intensities for all ages.',
-                'cultural_impact': 'Wild Wadi has become a cultural institution in Dubai, influencing water park design in the region. It promotes family entertainment and water safety education. The park has contributed to Dubai\'s image as a family-friendly destination and fostered community recreational activities.',
-                'conservation': 'The park implements water conservation measures and sustainable filtration systems. Environmental education focuses on water safety and marine conservation. The facility supports local biodiversity through landscaping that incorporates native desert plants.',
-                'health_safety': 'Comprehensive safety measures include lifeguard supervision, medical facilities, and ride safety protocols. The park maintains strict water quality standards and provides shaded areas for heat protection. Emergency response systems ensure visitor safety throughout the facility.',
-                'guided_tours': 'Adventure tours highlight the park\'s signature rides and attractions. Family tours include safety briefings and age-appropriate activity recommendations. Photography tours help visitors capture the best views of the water park features.',
-                'nearby_attractions': 'Burj Al Arab (adjacent), Jumeirah Beach (adjacent), Dubai Marina (2 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1530549387789-4c1017266635?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.1390° N, 55.1856° E',
-                'annual_visitors': 'Over 1.5 million',
-                'climate': 'Desert climate. Best visited October-April.'
-            },
-            'dubai-zoo': {
-                'id': 'dubai-zoo',
-                'name': 'Dubai Zoo',
-                'location': 'Dubai, UAE',
-                'description': 'Modern zoological park featuring diverse animal exhibits, conservation programs, and family attractions.',
-                'long_description': 'Dubai Zoo is a modern zoological park that showcases a diverse collection of animals from around the world. The zoo focuses on conservation, education, and providing enriching environments for its residents. With over 300 species, the zoo offers an educational and entertaining experience for visitors of all ages.',
-                'facts': [
-                    'Features over 300 animal species',
-                    'Spans 1.6 million square feet',
-                    'Conservation-focused exhibits',
-                    'Educational programs and animal encounters',
-                    'Multiple themed areas and habitats',
-                    'Daily animal feeding demonstrations',
-                    'Wheelchair accessible throughout',
-                    'Capacity for 4,000 visitors daily'
-                ],
-                'key_sites': [
-                    {'name': 'African Savanna', 'slug': 'african-savanna', 'description': 'Large habitat with giraffes and zebras', 'significance': 'Recreates African grassland environment'},
-                    {'name': 'Asian Elephant Habitat', 'slug': 'asian-elephant-habitat', 'description': 'Dedicated area for Asian elephants', 'significance': 'Features conservation and enrichment programs'},
-                    {'name': 'Primate Island', 'slug': 'primate-island', 'description': 'Monkey and ape exhibits', 'significance': 'Interactive viewing of primate behavior'},
-                    {'name': 'Bird Aviary', 'slug': 'bird-aviary', 'description': 'Large walk-through bird enclosure', 'significance': 'Features tropical and exotic bird species'}
-                ],
-                'entrance_fees': 'Adult: 25 AED. Child (3-12): 15 AED.',
-                'opening_hours': '10:00 AM to 6:00 PM daily.',
-                'best_time': 'Early morning or late afternoon to avoid heat.',
-                'how_to_get_there': 'Located in Jumeirah. Taxi or private car recommended.',
-                'what_to_wear': 'Comfortable clothing and walking shoes.',
-                'visitor_tips': [
-                    'Visit early morning for animal activity',
-                    'Stay on designated paths',
-                    'Bring water and sunscreen',
-                    'Allow 2-3 hours for complete visit',
-                    'Photography allowed in most areas',
-                    'Check feeding demonstration schedules'
-                ],
-                'discovery': 'Dubai Zoo opened in 1967 as one of the UAE\'s first zoological parks, evolving from a small collection to a modern conservation-focused facility. The zoo emerged from Dubai\'s commitment to wildlife preservation and environmental education. It has transformed into a center for animal welfare and biodiversity conservation.',
-                'architecture': 'The zoo features modern habitat designs that prioritize animal welfare and naturalistic environments. The layout includes themed areas, educational exhibits, and conservation-focused displays. Contemporary architecture incorporates shaded walkways, interactive exhibits, and accessible viewing areas.',
-                'cultural_impact': 'Dubai Zoo has become a cornerstone of environmental education in the UAE, promoting wildlife conservation and biodiversity awareness. It has influenced zoo design in the region and contributed to national conservation efforts. The zoo fosters community engagement with wildlife and environmental stewardship.',
-                'conservation': 'The zoo actively participates in breeding programs and species conservation initiatives. Environmental education programs teach visitors about wildlife protection and habitat preservation. Sustainable practices include energy-efficient operations and waste management systems that minimize ecological impact.',
-                'health_safety': 'The facility maintains high safety standards with secure enclosures, emergency medical services, and visitor supervision. Accessibility features ensure inclusive access for all visitors. Educational safety programs teach visitors about wildlife behavior and responsible viewing practices.',
-                'guided_tours': 'Conservation tours provide insights into animal welfare and breeding programs. Educational tours include interactive learning experiences about wildlife. Family tours combine animal viewing with educational content about conservation.',
-                'nearby_attractions': 'Jumeirah Beach (adjacent), Wild Wadi Water Park (nearby), Burj Al Arab (2 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1558618666-fcd25c85cd64?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2333° N, 55.2667° E',
-                'annual_visitors': 'Over 800,000',
-                'climate': 'Desert climate. Best visited October-April.'
-            }
-        },
-        'qatar': {
-            'museum-of-islamic-art': {
-                'id': 'museum-of-islamic-art',
-                'name': 'Museum of Islamic Art',
-                'location': 'Doha, Qatar',
-                'description': 'World-renowned museum showcasing Islamic art spanning 1,400 years across three continents.',
-                'long_description': 'The Museum of Islamic Art (MIA) in Doha is an architectural masterpiece designed by renowned architect I.M. Pei. This cultural institution houses one of the world\'s most comprehensive collections of Islamic art, spanning 1,400 years and representing cultures from three continents. The museum\'s collection includes rare manuscripts, textiles, ceramics, metalwork, glass, and precious stones from the Islamic world.',
-                'facts': [
-                    'Designed by legendary architect I.M. Pei',
-                    'Opened in 2008 after five years of construction',
-                    'Houses over 800 artworks spanning 1,400 years',
-                    'Collection represents Islamic cultures from Spain to India',
-                    'Features rare Quran manuscripts and calligraphy',
-                    'Architectural design inspired by Islamic geometric patterns',
-                    'Located on artificial island in Doha Bay',
-                    'First museum of its kind in the Arabian Gulf'
-                ],
-                'key_sites': [
-                    {'name': 'Central Atrium', 'slug': 'central-atrium', 'description': 'Five-story domed space with natural light', 'significance': 'Architectural centerpiece showcasing Islamic geometric design'},
-                    {'name': 'Manuscript Gallery', 'slug': 'manuscript-gallery', 'description': 'Rare Quran manuscripts and calligraphy', 'significance': 'Houses some of the oldest and most valuable Islamic texts'},
-                    {'name': 'Ceramics Collection', 'slug': 'ceramics-collection', 'description': 'Islamic pottery spanning multiple dynasties', 'significance': 'Demonstrates evolution of ceramic art across Islamic world'},
-                    {'name': 'MIA Park', 'slug': 'mia-park', 'description': 'Waterfront park with sculptures and views', 'significance': 'Richard Serra sculpture and panoramic Doha skyline views'}
-                ],
-                'entrance_fees': 'Free admission for permanent collection. Special exhibitions may have fees.',
-                'opening_hours': 'Saturday-Thursday: 9:00 AM to 7:00 PM. Friday: 1:30 PM to 7:00 PM.',
-                'best_time': 'October to April for comfortable weather. Early morning or late afternoon to avoid crowds.',
-                'how_to_get_there': 'Located on Corniche Road. Accessible by taxi, Doha Metro (Gold Line to Msheireb), or bus.',
-                'what_to_wear': 'Modest dress recommended. Shoulders and knees should be covered.',
-                'visitor_tips': [
-                    'Allow at least 2-3 hours for comprehensive visit',
-                    'Free guided tours available daily',
-                    'Photography allowed without flash',
-                    'Visit MIA Park for stunning Doha skyline views',
-                    'Museum café offers excellent dining with harbor views',
-                    'Download the MIA app for audio guides',
-                    'Check schedule for special exhibitions and events',
-                    'Wheelchair accessible throughout'
-                ],
-                'discovery': 'The Museum of Islamic Art emerged from Qatar\'s vision to become a global cultural hub. The Qatar Museums Authority commissioned I.M. Pei, who came out of retirement at age 87 to design the museum. Pei traveled extensively throughout the Islamic world researching architecture before creating his design, which opened in 2008 as Qatar\'s premier cultural institution.',
-                'architecture': 'I.M. Pei\'s design draws inspiration from the Ibn Tulun Mosque in Cairo and Islamic geometric patterns. The limestone building features a distinctive cubic form with a five-story atrium topped by a geometric steel dome. The museum sits on an artificial island, creating dramatic views of Doha Bay. Interior spaces are designed to showcase artworks with natural light filtering through geometric windows.',
-                'cultural_impact': 'MIA has transformed Doha into a major cultural destination and elevated Qatar\'s international cultural standing. The museum has influenced museum design across the Gulf region and fostered dialogue between Islamic and Western cultures. It serves as an educational center promoting understanding of Islamic civilization and artistic traditions.',
-                'conservation': 'The museum employs state-of-the-art conservation facilities to preserve fragile artifacts. Climate-controlled galleries maintain optimal conditions for manuscripts, textiles, and historical objects. The conservation team collaborates internationally on preservation projects and research. Sustainable building practices include energy-efficient systems and water conservation measures.',
-                'health_safety': 'The facility maintains international museum safety standards with advanced security systems and climate control. Medical services are available on-site. Accessibility features include elevators, ramps, and wheelchairs. Emergency evacuation procedures ensure visitor safety.',
-                'guided_tours': 'Free daily tours led by expert docents explore the permanent collection. Specialized tours focus on calligraphy, ceramics, or specific dynasties. School programs offer age-appropriate educational experiences. Private tours can be arranged for groups. Audio guides available in multiple languages via mobile app.',
-                'nearby_attractions': 'Corniche Promenade (adjacent), Souq Waqif (2 km), Katara Cultural Village (5 km), National Museum of Qatar (3 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1555881813-69a2e024c87e?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1542652694-40abf526446e?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2958° N, 51.5394° E',
-                'annual_visitors': 'Over 500,000',
-                'climate': 'Desert climate. Air-conditioned interiors. Best visited October-April.'
-            },
-            'souq-waqif': {
-                'id': 'souq-waqif',
-                'name': 'Souq Waqif',
-                'location': 'Doha, Qatar',
-                'description': 'Historic marketplace offering traditional handicrafts, spices, perfumes, textiles, and authentic Qatari dining experiences.',
-                'long_description': 'Souq Waqif (Standing Market) is Doha\'s most atmospheric marketplace, dating back over a century. This traditional bazaar has been beautifully restored to preserve its authentic character while offering modern amenities. The souq features labyrinthine alleyways filled with vendors selling spices, perfumes, traditional garments, handicrafts, and falcons. It serves as a cultural hub where visitors experience traditional Qatari commerce, dining, and hospitality.',
-                'facts': [
-                    'Over 100 years old, dating to late 19th century',
-                    'Restored in 2006 maintaining traditional architecture',
-                    'Features traditional mud-rendered buildings',
-                    'Home to Falcon Souq with birds of prey',
-                    'Over 200 shops and 30 restaurants',
-                    'Traditional handicrafts from local artisans',
-                    'Live cultural performances on weekends',
-                    'One of Qatar\'s most photographed locations'
-                ],
-                'key_sites': [
-                    {'name': 'Falcon Souq', 'slug': 'falcon-souq', 'description': 'Traditional falcon market and hospital', 'significance': 'Experience Qatar\'s falconry heritage and see prized hunting birds'},
-                    {'name': 'Spice Souq', 'slug': 'spice-souq', 'description': 'Aromatic alleyway with spice vendors', 'significance': 'Authentic Middle Eastern spices, saffron, and traditional remedies'},
-                    {'name': 'Textile Souq', 'slug': 'textile-souq', 'description': 'Traditional fabrics and garments', 'significance': 'Qatari thobes, abayas, and traditional textiles'},
-                    {'name': 'Art Center', 'slug': 'art-center', 'description': 'Galleries showcasing local artists', 'significance': 'Contemporary and traditional Qatari art'}
-                ],
-                'entrance_fees': 'Free admission. Shopping and dining costs vary.',
-                'opening_hours': 'Shops: 8:00 AM to 12:00 PM, 4:00 PM to 10:00 PM. Restaurants: longer hours.',
-                'best_time': 'Evening hours (after 5 PM) for cooler temperatures and vibrant atmosphere. Weekends for cultural performances.',
-                'how_to_get_there': 'Central Doha location. Doha Metro (Gold Line to Al Souq station), taxi, or ride-share services.',
-                'what_to_wear': 'Modest clothing recommended. Comfortable walking shoes essential for cobblestone paths.',
-                'visitor_tips': [
-                    'Bargaining is expected and part of the experience',
-                    'Visit in evening for cooler weather and atmosphere',
-                    'Try traditional Qatari cuisine at restaurants',
-                    'Don\'t miss the Falcon Souq for unique experience',
-                    'Cash preferred by many vendors',
-                    'Allow 2-3 hours to explore thoroughly',
-                    'Visit Art Center for local handicrafts',
-                    'Weekend evenings feature live performances',
-                    'Photographers paradise - bring your camera'
-                ],
-                'discovery': 'Souq Waqif\'s origins trace to Bedouin traders who gathered to trade livestock and goods over a century ago. The "standing market" name comes from traders standing with their goods. By early 20th century, it evolved into Doha\'s central marketplace. A major restoration in 2006 preserved the souq\'s traditional architecture while modernizing infrastructure, transforming it into a cultural landmark.',
-                'architecture': 'The souq features traditional Qatari architecture with mud-rendered shops, exposed wooden beams, and narrow alleyways designed to provide shade. Restoration efforts preserved original building methods using traditional materials. The layout maintains the organic, maze-like character of historic Arab markets. Modern amenities were integrated subtly to preserve authentic atmosphere.',
-                'cultural_impact': 'Souq Waqif serves as a living museum of Qatari commerce and culture. It has become Doha\'s cultural heart, hosting festivals, art exhibitions, and traditional performances. The souq preserves heritage crafts, falconry traditions, and Qatari hospitality. It attracts both locals and tourists, fostering cultural exchange and preserving traditional lifeways.',
-                'conservation': 'The 2006 restoration followed traditional building techniques using authentic materials. Ongoing maintenance preserves architectural integrity while ensuring safety standards. Heritage crafts are supported through artisan programs. Environmental initiatives include waste management and sustainable tourism practices.',
-                'health_safety': 'Well-maintained walkways with emergency services nearby. Security personnel patrol regularly. Medical facilities accessible within walking distance. Summer heat requires precautions - stay hydrated and seek shade. Most areas accessible, though cobblestones may challenge mobility.',
-                'guided_tours': 'Cultural walking tours explain souq history and trading traditions. Food tours sample traditional Qatari cuisine. Handicraft tours meet local artisans. Falconry demonstrations showcase Qatari heritage. Private tours can be customized. Tours available through Qatar Tourism Authority.',
-                'nearby_attractions': 'Museum of Islamic Art (2 km), Corniche Promenade (1 km), Abdullah Bin Zaid Al Mahmoud Islamic Cultural Center (adjacent), National Museum of Qatar (3 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1590842772865-e57c82e8d789?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1582719366489-6cc5c79cf9dd?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2867° N, 51.5333° E',
-                'annual_visitors': 'Over 2 million',
-                'climate': 'Desert climate. Best visited October-April. Evening visits recommended in summer.'
-            },
-            'katara-cultural-village': {
-                'id': 'katara-cultural-village',
-                'name': 'Katara Cultural Village',
-                'location': 'Doha, Qatar',
-                'description': 'Premier cultural destination featuring galleries, amphitheaters, traditional architecture, and waterfront dining showcasing Arab heritage.',
-                'long_description': 'Katara Cultural Village is Qatar\'s premier destination for arts, culture, and entertainment. This sprawling waterfront complex celebrates Arab and Islamic cultural heritage through architecture, galleries, performance venues, and festivals. The village hosts international cultural events, art exhibitions, theatrical performances, and traditional celebrations, serving as a bridge between Qatar\'s heritage and contemporary global culture.',
-                'facts': [
-                    'Opened in 2010 as Qatar\'s cultural hub',
-                    'Spans 1 million square meters of waterfront',
-                    'Features amphitheater with 5,000-seat capacity',
-                    'Over 30 cultural venues and galleries',
-                    'Traditional souq and handicraft center',
-                    'Multiple mosques with diverse architectural styles',
-                    'Public beach and marina facilities',
-                    'Hosts over 500 cultural events annually'
-                ],
-                'key_sites': [
-                    {'name': 'Katara Amphitheatre', 'slug': 'katara-amphitheatre', 'description': 'Greek-inspired outdoor theater', 'significance': 'Hosts concerts, performances, and cultural festivals for 5,000 attendees'},
-                    {'name': 'Katara Mosque', 'slug': 'katara-mosque', 'description': 'Mosque featuring Persian-style blue tiles', 'significance': 'Architectural masterpiece blending Islamic and Persian design'},
-                    {'name': 'Pigeon Towers', 'slug': 'pigeon-towers', 'description': 'Traditional dovecotes recreating Qatari heritage', 'significance': 'Historic pigeon keeping tradition architectural landmarks'},
-                    {'name': 'Katara Beach', 'slug': 'katara-beach', 'description': 'Public beach with water sports', 'significance': 'Family-friendly beach with dhow harbor views'}
-                ],
-                'entrance_fees': 'Free admission to village. Individual venue and event fees vary.',
-                'opening_hours': 'Village: 24 hours. Individual venues: typically 9:00 AM to 10:00 PM.',
-                'best_time': 'October to April for outdoor events. Evening hours year-round for cooler temperatures.',
-                'how_to_get_there': 'Located on Doha\'s eastern coast. Taxi, ride-share, or bus services. Parking available.',
-                'what_to_wear': 'Modest dress recommended for cultural respect. Beachwear for beach areas only.',
-                'visitor_tips': [
-                    'Check event calendar for festivals and performances',
-                    'Allow 3-4 hours to explore thoroughly',
-                    'Visit mosques outside prayer times (remove shoes)',
-                    'Evening visits offer cooler weather and atmosphere',
-                    'Multiple dining options from casual to fine dining',
-                    'Photography encouraged throughout village',
-                    'Visit galleries for contemporary Middle Eastern art',
-                    'Parking can be challenging during major events',
-                    'Beach access free for public use'
-                ],
-                'discovery': 'Katara Cultural Village was developed as part of Qatar\'s vision to become a regional cultural hub. The project began in 2005 and opened in 2010, named after "Katara," the historical name for the Qatar Peninsula. The development aimed to create a space where diverse cultures meet and traditional arts thrive alongside contemporary expressions.',
-                'architecture': 'Katara showcases diverse Islamic and Arab architectural styles from across the region. Buildings feature traditional Arabian design elements including wind towers, courtyards, and decorative facades. The Blue Mosque incorporates Persian-style tile work. The amphitheater draws inspiration from Greek and Roman designs adapted to local aesthetics. Modern infrastructure integrates seamlessly with traditional design.',
-                'cultural_impact': 'Katara has transformed Qatar\'s cultural landscape, hosting world-class festivals, exhibitions, and performances. It promotes cultural dialogue between East and West while preserving Arab heritage. The village has become a regional cultural center attracting artists, performers, and cultural organizations globally. It fosters local artistic talent and cultural industries.',
-                'conservation': 'The village promotes cultural heritage preservation through exhibitions, performances, and educational programs. Traditional crafts and art forms are supported through workshops and markets. Environmental initiatives include coastal conservation and sustainable tourism. The complex balances modern development with heritage preservation.',
-                'health_safety': 'Well-maintained facilities with security personnel throughout. Medical services accessible nearby. Wheelchair accessibility in most areas. Beach safety with lifeguards during peak seasons. Well-lit pathways for evening visits. Emergency services on call.',
-                'guided_tours': 'Cultural walking tours explore architectural heritage and venues. Art gallery tours showcase contemporary Middle Eastern artists. Architecture tours explain diverse Islamic design styles. Photography tours capture best vantage points. Private tours available for groups. Qatar Tourism Authority offers scheduled tours.',
-                'nearby_attractions': 'The Pearl-Qatar (2 km), Museum of Islamic Art (5 km), Aspire Park (4 km), Corniche Promenade (6 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1566073771259-6a8506099945?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1512632578888-169bbbc64f33?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.3524° N, 51.5311° E',
-                'annual_visitors': 'Over 1.5 million',
-                'climate': 'Desert climate. Waterfront location provides sea breeze. Best visited October-April.'
-            },
-            'al-zubarah-fort': {
-                'id': 'al-zubarah-fort',
-                'name': 'Al Zubarah Fort',
-                'location': 'Al Zubarah, Qatar',
-                'description': 'UNESCO World Heritage Site showcasing an ancient fortified town and Qatar\'s pearl trading heritage.',
-                'long_description': 'Al Zubarah Fort and Archaeological Site is Qatar\'s only UNESCO World Heritage Site, representing one of the Gulf\'s best-preserved examples of an 18th-19th century merchant town. The fortified coastal settlement flourished as a center for pearl diving and trade, connecting the Gulf region with the wider Indian Ocean world. Today, the site offers insights into traditional Gulf architecture, urban planning, and the region\'s maritime heritage.',
-                'facts': [
-                    'UNESCO World Heritage Site since 2013',
-                    'Founded in 1760 as pearl trading center',
-                    'Fort built in 1938 for coastal defense',
-                    'Archaeological site spans 60 hectares',
-                    'Preserved courtyard houses and markets',
-                    'Remains of defensive walls and towers',
-                    'One of Gulf\'s most complete historic settlements',
-                    'Active archaeological excavations ongoing'
-                ],
-                'key_sites': [
-                    {'name': 'Al Zubarah Fort', 'slug': 'al-zubarah-fort', 'description': 'Military fortress and visitor center', 'significance': 'Built 1938, now houses museum explaining site history'},
-                    {'name': 'Town Walls', 'slug': 'town-walls', 'description': 'Defensive fortifications around settlement', 'significance': 'Protected thriving merchant community from threats'},
-                    {'name': 'Courtyard Houses', 'slug': 'courtyard-houses', 'description': 'Residential structures of merchant families', 'significance': 'Demonstrate traditional Gulf domestic architecture'},
-                    {'name': 'Souq Area', 'slug': 'souq-area', 'description': 'Marketplace ruins', 'significance': 'Commercial center for pearl and trade goods'}
-                ],
-                'entrance_fees': 'Free admission.',
-                'opening_hours': 'Saturday-Thursday: 9:00 AM to 4:30 PM. Friday: 2:00 PM to 6:00 PM. Closed on public holidays.',
-                'best_time': 'October to April for comfortable weather. Morning visits recommended to avoid heat.',
-                'how_to_get_there': '105 km northwest of Doha (1.5-hour drive). Rental car recommended as public transport limited. Follow signs to Al Zubarah from Al Shamal Road.',
-                'what_to_wear': 'Comfortable clothing and sturdy walking shoes. Hat and sunscreen essential. Modest dress recommended.',
-                'visitor_tips': [
-                    'Allow 2-3 hours for fort and archaeological site',
-                    'Bring plenty of water - facilities limited',
-                    'Start at fort museum for historical context',
-                    'Follow marked paths through archaeological site',
-                    'Photography allowed throughout',
-                    'Best light for photos in early morning',
-                    'Combine with visit to nearby Al Thakira Mangroves',
-                    'No food facilities - bring snacks',
-                    'Guided tours available with advance booking'
-                ],
-                'discovery': 'Al Zubarah was founded around 1760 by merchants from Kuwait and flourished as a pearling and trading port. The town connected Gulf traders with merchants from Persia, Oman, India, and East Africa. After conflicts in the early 19th century, the town declined and was abandoned by the 1900s. Archaeological excavations began in the 1970s, revealing exceptional preservation beneath desert sands. UNESCO recognition came in 2013.',
-                'architecture': 'The site showcases traditional Gulf architecture adapted to harsh desert climate. Buildings feature thick coral-stone walls, wind towers for natural cooling, and inward-facing courtyard designs for privacy and shade. The fort demonstrates military architecture with corner towers and defensive positions. Urban planning reveals sophisticated water management and defensive strategies.',
-                'cultural_impact': 'Al Zubarah represents Qatar\'s maritime heritage and the Gulf\'s historical role in global trade networks. The site demonstrates how coastal communities thrived through pearl diving and commerce. UNESCO recognition elevated awareness of Gulf archaeological heritage. The site contributes to understanding pre-oil Gulf societies and cultural traditions.',
-                'conservation': 'Qatar Museums oversees site preservation following international standards. Ongoing archaeological excavations reveal new insights while ensuring protection. Conservation efforts stabilize structures threatened by desert conditions. Educational programs promote heritage awareness. The site management plan balances tourism with preservation.',
-                'health_safety': 'Desert location requires heat precautions - bring water and sun protection. Mobile phone coverage available. Emergency services accessible from nearby towns. Well-marked paths ensure visitor safety. First aid available at visitor center. Visitors should inform staff before exploring archaeological areas.',
-                'guided_tours': 'Guided tours explain pearling heritage and archaeological findings. Architecture tours highlight traditional building techniques. Photography tours capture desert fort atmosphere. School programs offer educational experiences. Private tours can be arranged through Qatar Museums. Audio guides available at visitor center.',
-                'nearby_attractions': 'Al Thakira Mangroves (30 km), Purple Island (35 km), Al Shamal (10 km), Bir Zekreet desert area (50 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1583511655857-d19b40a7a54e?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1512632578888-169bbbc64f33?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.9755° N, 51.0316° E',
-                'annual_visitors': 'Over 50,000',
-                'climate': 'Desert climate. Extremely hot May-September. Best visited October-April.'
-            },
-            'doha': {
-                'id': 'doha',
-                'name': 'Doha City',
-                'location': 'Doha, Qatar',
-                'description': 'Qatar\'s vibrant capital blending futuristic architecture with traditional culture along the Arabian Gulf waterfront.',
-                'long_description': 'Doha, the capital of Qatar, is a dynamic metropolis that has transformed from a small fishing and pearling village into a global city. The city skyline features stunning modern architecture including the iconic twisting towers of Tornado Tower and distinctive torch-shaped building of Aspire Tower. Doha successfully blends ultra-modern development with preservation of cultural heritage, hosting world-class museums, traditional souqs, and the FIFA 2022 World Cup infrastructure.',
-                'facts': [
-                    'Population over 2 million (80% of Qatar)',
-                    'Hosted FIFA World Cup 2022',
-                    'Home to Education City and numerous universities',
-                    'Features 7 km Corniche promenade',
-                    'Over 40 museums and cultural institutions',
-                    'Major international air hub via Hamad Airport',
-                    'One of world\'s richest cities per capita',
-                    'Rapidly growing business and finance center'
-                ],
-                'key_sites': [
-                    {'name': 'The Pearl-Qatar', 'slug': 'the-pearl-qatar', 'description': 'Luxury artificial island development', 'significance': 'Upscale living, dining, and entertainment destination'},
-                    {'name': 'Corniche Promenade', 'slug': 'corniche-promenade', 'description': '7 km waterfront walkway', 'significance': 'Iconic curved bay with skyline views and recreational spaces'},
-                    {'name': 'Msheireb Downtown', 'slug': 'msheireb-downtown', 'description': 'Sustainable heritage district', 'significance': 'World\'s first sustainable downtown regeneration project'},
-                    {'name': 'Aspire Park', 'slug': 'aspire-park', 'description': 'Largest park in Doha', 'significance': 'Green space with lake, playgrounds, and Aspire Tower views'}
-                ],
-                'entrance_fees': 'City access free. Individual attractions vary.',
-                'opening_hours': 'City operates 24/7. Attractions and businesses have individual hours.',
-                'best_time': 'October to April for comfortable weather. December-February ideal.',
-                'how_to_get_there': 'Hamad International Airport with global connections. Doha Metro system efficient for city travel. Taxis and ride-sharing widely available.',
-                'what_to_wear': 'Modest dress in public areas. Shoulders and knees covered recommended. Beachwear only at beaches and hotel pools.',
-                'visitor_tips': [
-                    'Use Doha Metro for efficient city travel',
-                    'Visit Corniche in evening for cooler temperatures',
-                    'Explore both modern developments and traditional areas',
-                    'Try traditional Qatari cuisine at local restaurants',
-                    'Respect local customs and dress modestly',
-                    'Stay hydrated during outdoor activities',
-                    'Many attractions offer free admission',
-                    'Weekend (Friday-Saturday) different pace than weekdays',
-                    'Combine museum visits with waterfront dining'
-                ],
-                'discovery': 'Doha\'s history spans over 200 years from a small fishing village. The name "Doha" means "rounded bays" in Arabic, referring to its distinctive curved coastline. Pearl diving sustained the economy until the 1930s. Oil and gas discovery transformed Doha into a modern city from the 1950s onward. Massive development accelerated in the 2000s, culminating in hosting the 2022 FIFA World Cup.',
-                'architecture': 'Doha\'s skyline showcases bold contemporary architecture including the Museum of Islamic Art by I.M. Pei, the National Library by OMA, and numerous iconic skyscrapers. Traditional architecture is preserved in areas like Souq Waqif and Msheireb Downtown. The city balances futuristic design with Islamic architectural principles, creating a unique urban landscape. Sustainable design features prominently in recent developments.',
-                'cultural_impact': 'Doha has emerged as a global cultural and sporting hub, hosting major international events and institutions. The city bridges East and West, fostering cultural dialogue through museums, universities, and festivals. Qatar Foundation\'s Education City brings world-class universities to Doha. The city promotes arts through public art installations, galleries, and cultural festivals.',
-                'conservation': 'Doha implements sustainability initiatives including green buildings, renewable energy, and public transport expansion. Heritage conservation preserves historic districts alongside modern development. Coastal and marine conservation protects Arabian Gulf ecosystems. The city aims to balance rapid growth with environmental stewardship.',
-                'health_safety': 'Doha maintains high safety standards with excellent healthcare facilities. Low crime rates ensure visitor security. Summer heat requires precautions. Emergency services are efficient and accessible. Air-conditioned environments widespread. The city is generally safe for solo travelers and families.',
-                'guided_tours': 'City tours cover major landmarks, museums, and cultural sites. Desert safari excursions explore Qatar\'s interior. Dhow boat tours cruise Doha Bay. Cultural tours visit traditional markets and heritage sites. Food tours sample Qatari and international cuisine. Architectural tours highlight iconic buildings.',
-                'nearby_attractions': 'Al Zubarah Fort UNESCO Site (105 km), Inland Sea / Khor Al Adaid (85 km), Al Wakrah Heritage Village (15 km), Education City (10 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1539017129681-bb82959786a9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1550424249-a653f649e3c5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2854° N, 51.5310° E',
-                'annual_visitors': 'Over 3 million international visitors',
-                'climate': 'Desert climate. Hot summers (May-Sept: 35-45°C). Mild winters (Nov-March: 15-25°C).'
-            },
-            'the-pearl-qatar': {
-                'id': 'the-pearl-qatar',
-                'name': 'The Pearl-Qatar',
-                'location': 'Doha, Qatar',
-                'description': 'Luxury artificial island featuring upscale living, marina, international dining, and designer shopping.',
-                'long_description': 'The Pearl-Qatar is an exclusive artificial island spanning nearly 4 million square meters off Doha\'s West Bay coastline. This luxurious development recreates the ambiance of Mediterranean resort towns with marinas, yacht-lined harbors, residential towers, boutiques, and gourmet restaurants. The Pearl represents Qatar\'s vision of world-class urban development, offering a cosmopolitan lifestyle within a stunning waterfront setting.',
-                'facts': [
-                    'First land in Qatar available for freehold ownership by foreign nationals',
-                    'Spans nearly 4 million square meters',
-                    'Cost over $15 billion to develop',
-                    'Features 12 distinct precincts with unique architecture',
-                    'Over 200 retail outlets and restaurants',
-                    'Luxury yacht marina with 800+ berths',
-                    'Population capacity of 45,000 residents',
-                    'Arabesque and Mediterranean-inspired architecture'
-                ],
-                'key_sites': [
-                    {'name': 'Porto Arabia', 'slug': 'porto-arabia', 'description': 'Mediterranean-style boardwalk with restaurants and shops', 'significance': 'Main entertainment and dining hub'},
-                    {'name': 'Qanat Quartier', 'slug': 'qanat-quartier', 'description': 'Venetian-themed district with canals', 'significance': 'Colorful Venetian architecture and water features'},
-                    {'name': 'Medina Centrale', 'slug': 'medina-centrale', 'description': 'Traditional Arabian market atmosphere', 'significance': 'Blends traditional souq style with luxury retail'},
-                    {'name': 'Marsa Arabia', 'slug': 'marsa-arabia', 'description': 'Luxury marina and yacht club', 'significance': 'Premier yachting destination in the Gulf'}
-                ],
-                'entrance_fees': 'Free admission. Shopping, dining, and activities vary.',
-                'opening_hours': 'Island accessible 24/7. Shops: 10:00 AM to 10:00 PM. Restaurants: extended hours.',
-                'best_time': 'October to April for outdoor dining and strolling. Evening hours year-round for atmosphere.',
-                'how_to_get_there': 'Located off West Bay. Accessible by taxi, ride-share, or private car. Connected to mainland via bridges.',
-                'what_to_wear': 'Smart casual attire for dining. Modest beachwear acceptable in marina areas.',
-                'visitor_tips': [
-                    'Visit Porto Arabia boardwalk for dining with marina views',
-                    'Explore Qanat Quartier\'s colorful Venetian-style canals',
-                    'Evening strolls offer cooler temperatures and vibrant atmosphere',
-                    'Parking available throughout but can be busy weekends',
-                    'Many high-end restaurants require reservations',
-                    'Photography spots at Venice-inspired bridges',
-                    'Beach access at certain precincts',
-                    'Luxury shopping from international brands',
-                    'Boat tours and yacht charters available'
-                ],
-                'discovery': 'The Pearl-Qatar was conceived in the early 2000s as part of Qatar\'s economic diversification strategy. Construction began in 2004 on the site of a former pearl diving location, symbolically connecting to Qatar\'s heritage. The first phase opened in 2008. The development was groundbreaking as Qatar\'s first freehold property available to foreign buyers, marking a major shift in the country\'s property laws.',
-                'architecture': 'The Pearl features diverse architectural styles across its 12 precincts, from Mediterranean and Venetian to Arabian and contemporary designs. Porto Arabia showcases Mediterranean boardwalk style, while Qanat Quartier replicates Venice with colorful buildings and canals. Medina Centrale blends traditional Arabian architecture with modern luxury. The design emphasizes waterfront living with marinas integrated throughout.',
-                'cultural_impact': 'The Pearl transformed Doha\'s lifestyle scene, introducing cosmopolitan living and international cuisine to Qatar. It has become a symbol of Qatar\'s modernization and global ambitions. The development influenced subsequent luxury projects across the Gulf region. It serves as a social hub where expatriates and Qataris mingle, fostering cultural exchange.',
-                'conservation': 'The Pearl implements sustainability measures including water recycling, energy-efficient buildings, and waste management systems. Marina facilities follow environmental protocols to protect marine life. Green spaces incorporate native plants requiring minimal irrigation. The development balances luxury with environmental responsibility.',
-                'health_safety': 'The island maintains high security standards with 24/7 surveillance and security personnel. Medical facilities accessible within minutes. Well-lit pathways and pedestrian-friendly design. Emergency services on call. Family-friendly environment with safe public spaces.',
-                'guided_tours': 'Walking tours explore architectural diversity across precincts. Food tours sample international cuisines at top restaurants. Photography tours capture Venetian canals and marina views. Yacht tours offer perspective from the water. Private tours can be customized.',
-                'nearby_attractions': 'Katara Cultural Village (adjacent), Museum of Islamic Art (5 km), Corniche Promenade (3 km), Souq Waqif (6 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1512917774080-9991f1c4c750?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1582719366489-6cc5c79cf9dd?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.3717° N, 51.5408° E',
-                'annual_visitors': 'Over 5 million',
-                'climate': 'Desert climate with sea breeze. Best visited October-April.'
-            },
-            'national-museum-qatar': {
-                'id': 'national-museum-qatar',
-                'name': 'National Museum of Qatar',
-                'location': 'Doha, Qatar',
-                'description': 'Architectural masterpiece designed by Jean Nouvel, showcasing Qatar\'s journey from Bedouin roots to modern nation.',
-                'long_description': 'The National Museum of Qatar is a stunning architectural achievement designed by Pritzker Prize-winning architect Jean Nouvel. The building\'s design is inspired by the desert rose crystal formation, creating an iconic structure with interlocking discs. The museum tells Qatar\'s story through immersive galleries spanning from ancient geology to contemporary developments, including Qatar\'s Bedouin heritage, pearl diving traditions, and transformation into a modern nation.',
-                'facts': [
-                    'Designed by Jean Nouvel, opened March 2019',
-                    'Inspired by desert rose crystal formations',
-                    'Building spans 52,000 square meters',
-                    'Features 539 interlocking discs at various angles',
-                    '11 galleries covering Qatar\'s natural and human history',
-                    'Incorporates Sheikh Abdullah Bin Jassim Al Thani Palace',
-                    'Houses Bedouin tent, traditional dhow boat, and pearl diving exhibits',
-                    'State-of-the-art multimedia and immersive experiences'
-                ],
-                'key_sites': [
-                    {'name': 'Gallery of Beginnings', 'slug': 'gallery-beginnings', 'description': 'Geological formation of Qatar peninsula', 'significance': 'Explores Qatar\'s prehistoric origins and natural history'},
-                    {'name': 'Gallery of Life in Qatar', 'slug': 'gallery-life-qatar', 'description': 'Bedouin traditions and desert life', 'significance': 'Authentic Bedouin tent and traditional lifestyle exhibits'},
-                    {'name': 'Gallery of Building the Nation', 'slug': 'gallery-building-nation', 'description': 'Modern Qatar\'s development', 'significance': 'Chronicles oil discovery to contemporary nation'},
-                    {'name': 'Sheikh Abdullah Palace', 'slug': 'sheikh-abdullah-palace', 'description': 'Historic palace integrated into museum', 'significance': 'Former royal residence restored as heritage site'}
-                ],
-                'entrance_fees': 'Adults: 50 QAR. Students and children under 16: Free. Qatar ID holders: Free.',
-                'opening_hours': 'Saturday-Thursday: 9:00 AM to 7:00 PM. Friday: 1:30 PM to 7:00 PM.',
-                'best_time': 'Mornings for fewer crowds. Allow 2-3 hours for complete visit.',
-                'how_to_get_there': 'Located on Doha Corniche. Doha Metro (Green Line to Corniche station), taxi, or ride-share.',
-                'what_to_wear': 'Modest dress recommended. Comfortable shoes for walking through galleries.',
-                'visitor_tips': [
-                    'Allow minimum 2-3 hours for comprehensive visit',
-                    'Start with introductory film for context',
-                    'Photography allowed in most areas (no flash)',
-                    'Museum café offers refreshments with garden views',
-                    'Gift shop features Qatar-designed items',
-                    'Download museum app for enhanced experience',
-                    'Wheelchair accessible throughout',
-                    'Guided tours available in multiple languages',
-                    'Visit adjacent gardens and lagoon'
-                ],
-                'discovery': 'The National Museum of Qatar project was announced in 2008 with Jean Nouvel selected as architect. Construction began in 2012 and the museum opened to the public on March 28, 2019. The project aimed to create an iconic museum that tells Qatar\'s story while becoming an architectural landmark. The historic Sheikh Abdullah Palace, built in 1912, was integrated into the new structure.',
-                'architecture': 'Jean Nouvel\'s design was inspired by the desert rose, a crystalline formation found in Qatar\'s desert. The building features 539 interlocking discs of varying sizes arranged at different angles, creating a complex geometric structure. The discs are clad in fiber-reinforced concrete with colors matching desert sand. Interior spaces flow organically, with galleries designed for immersive storytelling through audiovisual installations.',
-                'cultural_impact': 'The museum has become a symbol of Qatar\'s cultural ambitions and national identity. It preserves and celebrates Qatari heritage while embracing contemporary museum practices. The building itself has become an architectural pilgrimage site. The museum fosters national pride and educates visitors about Qatar\'s unique journey from nomadic Bedouin culture to modern nation-state.',
-                'conservation': 'The museum employs climate-controlled galleries to preserve artifacts. Conservation laboratories work on archaeological finds and historical objects. Digital preservation captures intangible cultural heritage through recordings. The building incorporates sustainable design including solar shading from disc overhangs and efficient HVAC systems.',
-                'health_safety': 'Advanced climate control maintains optimal conditions. Security systems protect artifacts and visitors. Accessible design accommodates visitors with disabilities. Medical facilities nearby. Emergency protocols in place. Well-maintained walkways prevent accidents.',
-                'guided_tours': 'Expert-led tours explore Qatar\'s history and museum architecture. Architecture tours focus on Jean Nouvel\'s desert rose design. Family tours include interactive activities for children. School programs offer age-appropriate educational experiences. Private tours can be arranged.',
-                'nearby_attractions': 'Corniche Promenade (adjacent), Museum of Islamic Art (2 km), Souq Waqif (3 km), Katara Cultural Village (4 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1566073771259-6a8506099945?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2906° N, 51.5489° E',
-                'annual_visitors': 'Over 300,000',
-                'climate': 'Air-conditioned museum. Best visited October-April for exploring exterior.'
-            },
-            'aspire-park': {
-                'id': 'aspire-park',
-                'name': 'Aspire Park',
-                'location': 'Doha, Qatar',
-                'description': 'Largest park in Doha featuring lush gardens, artificial lake, and iconic Aspire Tower views.',
-                'long_description': 'Aspire Park (Aspire Zone Foundation) is Doha\'s largest and most popular green space, covering 88 hectares. The park features beautifully landscaped gardens, walking paths, an artificial lake with fountain, playgrounds, and sports facilities. Dominated by the iconic torch-shaped Aspire Tower, the park offers a peaceful retreat from urban life and hosts community events, outdoor activities, and family gatherings.',
-                'facts': [
-                    'Largest park in Doha at 88 hectares',
-                    'Features artificial lake with dancing fountain',
-                    'Over 850 trees and thousands of plants',
-                    'Walking and jogging tracks totaling 4 km',
-                    'Multiple playgrounds for different age groups',
-                    'Food kiosks and cafés throughout',
-                    'Adjacent to Aspire Tower and Khalifa International Stadium',
-                    'Hosts cultural events and festivals'
-                ],
-                'key_sites': [
-                    {'name': 'Aspire Lake', 'slug': 'aspire-lake', 'description': 'Artificial lake with musical fountain shows', 'significance': 'Centerpiece with evening light and water shows'},
-                    {'name': 'Aspire Tower', 'slug': 'aspire-tower', 'description': 'Iconic torch-shaped tower (300m tall)', 'significance': 'Qatar\'s tallest building and sports complex'},
-                    {'name': 'Children\'s Playgrounds', 'slug': 'children-playgrounds', 'description': 'Multiple play areas with modern equipment', 'significance': 'Family-friendly zones for kids of all ages'},
-                    {'name': 'Walking Paths', 'slug': 'walking-paths', 'description': 'Tree-lined pathways throughout park', 'significance': 'Popular for jogging, walking, and cycling'}
-                ],
-                'entrance_fees': 'Free admission.',
-                'opening_hours': '6:00 AM to 11:00 PM daily.',
-                'best_time': 'October to April for daytime visits. Early morning or evening in summer. Weekends for fountain shows.',
-                'how_to_get_there': 'Located in Aspire Zone. Taxi, ride-share, or private car. Ample parking available.',
-                'what_to_wear': 'Casual outdoor clothing. Comfortable shoes for walking. Modest dress recommended.',
-                'visitor_tips': [
-                    'Visit early morning for cooler temperatures and exercise',
-                    'Evening hours popular for families and picnics',
-                    'Fountain shows at lake during evenings and weekends',
-                    'Bring picnic supplies - grassy areas available',
-                    'Food kiosks sell snacks and refreshments',
-                    'Playgrounds busy on weekends - weekdays quieter',
-                    'Great for outdoor photography',
-                    'Combine with visit to Khalifa International Stadium',
-                    'Pet-friendly areas available'
-                ],
-                'discovery': 'Aspire Park was developed as part of the Aspire Zone sports complex in preparation for the 2006 Asian Games hosted by Qatar. The park opened to the public as a community green space, addressing Doha\'s need for large recreational areas. Over the years, continuous improvements have enhanced landscaping, facilities, and amenities, making it Doha\'s premier urban park.',
-                'architecture': 'The park features contemporary landscape architecture with manicured lawns, tree-lined avenues, and geometric garden layouts. The artificial lake serves as the focal point with surrounding pathways and seating areas. Modern playground equipment and sports facilities integrate seamlessly into the natural setting. The iconic Aspire Tower provides a dramatic backdrop, visible throughout the park.',
-                'cultural_impact': 'Aspire Park has become Doha\'s social hub where families, fitness enthusiasts, and communities gather. It promotes outdoor lifestyle and healthy living in Qatar. The park hosts cultural festivals, outdoor cinema events, and community celebrations. It represents Doha\'s commitment to providing quality public spaces and improving residents\' quality of life.',
-                'conservation': 'The park implements water-efficient irrigation systems and incorporates drought-resistant plants. Sustainable landscaping practices minimize water usage. Waste management and recycling programs promote environmental responsibility. The park\'s green spaces contribute to urban cooling and air quality improvement.',
-                'health_safety': 'Well-maintained pathways ensure visitor safety. Security personnel patrol regularly. First aid stations available. Well-lit areas for evening visits. Family-friendly environment with designated play zones. Emergency services accessible. Clean facilities maintained throughout.',
-                'guided_tours': 'Self-guided tours explore various garden areas and features. Fitness groups offer guided running and walking sessions. Photography tours capture scenic lake and tower views. Community events provide guided nature walks. School groups arrange educational environmental tours.',
-                'nearby_attractions': 'Khalifa International Stadium (adjacent), Villaggio Mall (1 km), Education City (3 km), National Museum of Qatar (5 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1584743704154-8f1e5e3e5b2f?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1539017129681-bb82959786a9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2607° N, 51.4439° E',
-                'annual_visitors': 'Over 2 million',
-                'climate': 'Outdoor park. Best visited October-April. Summer mornings/evenings recommended.'
-            },
-            'inland-sea': {
-                'id': 'inland-sea',
-                'name': 'Inland Sea (Khor Al Adaid)',
-                'location': 'Southeast Qatar',
-                'description': 'UNESCO-recognized natural wonder where desert dunes meet turquoise seawater, accessible only by 4x4.',
-                'long_description': 'Khor Al Adaid, known as the Inland Sea, is a spectacular natural phenomenon where the Arabian Gulf\'s turquoise waters penetrate deep into the desert, surrounded by towering sand dunes. This UNESCO-recognized natural reserve is one of few places globally where the sea encroaches on the desert. Accessible only by 4x4 vehicles through dramatic dune landscapes, the Inland Sea offers breathtaking scenery, unique ecosystems, and unforgettable desert-sea experiences.',
-                'facts': [
-                    'UNESCO-recognized natural reserve',
-                    'One of few places where sea meets desert directly',
-                    'Located 85 km southeast of Doha',
-                    'Accessible only by 4x4 vehicle through dunes',
-                    'Border with Saudi Arabia visible across water',
-                    'Home to diverse wildlife including dugongs and sea turtles',
-                    'Popular for camping, swimming, and water sports',
-                    'Spectacular sunset and stargazing location'
-                ],
-                'key_sites': [
-                    {'name': 'Khor Al Adaid Beach', 'slug': 'khor-al-adaid-beach', 'description': 'Where desert dunes meet turquoise sea', 'significance': 'Stunning natural phenomenon and swimming area'},
-                    {'name': 'Dune Bashing Routes', 'slug': 'dune-bashing-routes', 'description': 'Thrilling 4x4 routes through massive dunes', 'significance': 'Adventure experience reaching the Inland Sea'},
-                    {'name': 'Camping Areas', 'slug': 'camping-areas', 'description': 'Designated spots for overnight desert camping', 'significance': 'Authentic Bedouin-style camping under stars'},
-                    {'name': 'Wildlife Viewing Points', 'slug': 'wildlife-viewing', 'description': 'Areas to spot marine and desert wildlife', 'significance': 'Observe dugongs, turtles, and desert fauna'}
-                ],
-                'entrance_fees': 'Free access. 4x4 vehicle rental or tour costs vary (tours from 200-500 QAR).',
-                'opening_hours': 'Accessible 24/7. Tour operators typically offer morning and afternoon departures.',
-                'best_time': 'October to April for comfortable temperatures. Sunset trips highly recommended. Avoid summer heat.',
-                'how_to_get_there': '85 km southeast of Doha. Accessible only by 4x4 vehicle. Join organized tour or rent 4x4 with experienced driver. Journey takes 1.5-2 hours.',
-                'what_to_wear': 'Light, breathable clothing. Swimwear for water activities. Hat and sunglasses essential. Closed-toe shoes for sand.',
-                'visitor_tips': [
-                    'Must use 4x4 vehicle - sedan cars cannot access',
-                    'Join organized tour if unfamiliar with dune driving',
-                    'Deflate tires for sand driving (tour guides handle this)',
-                    'Bring plenty of water - no facilities available',
-                    'Sunset timing offers best light and cooler temperatures',
-                    'Swimming possible in calm waters',
-                    'Overnight camping requires permits',
-                    'No cell phone coverage - inform others of plans',
-                    'Pack trash out - pristine environment must be preserved',
-                    'Respect wildlife and natural habitat'
-                ],
-                'discovery': 'Khor Al Adaid has been known to Bedouins for centuries as a unique natural feature. The site gained international recognition when it was designated a UNESCO natural reserve in recognition of its ecological significance and unique geology. Scientific studies have documented its importance as habitat for marine species including the endangered dugong and sea turtles. It has become one of Qatar\'s top natural attractions.',
-                'architecture': 'The Inland Sea is a natural formation created by tidal waters penetrating inland through the desert. The landscape features massive crescentic sand dunes (barchan dunes) towering over 40 meters high. The desert\'s golden sands contrast dramatically with turquoise waters, creating stunning visual compositions. The area remains undeveloped, preserving its natural pristine state.',
-                'cultural_impact': 'Khor Al Adaid holds cultural significance as part of Qatar\'s desert heritage. It represents the connection between traditional Bedouin lifestyle and Qatar\'s natural environment. The site has become emblematic of Qatar\'s commitment to preserving natural wonders. It attracts eco-tourists and adventure seekers, contributing to sustainable tourism initiatives.',
-                'conservation': 'The area is protected as a UNESCO natural reserve with regulations to preserve its ecosystem. Designated routes minimize environmental impact. Wildlife protection measures safeguard dugongs, sea turtles, and migratory birds. Visitor education emphasizes leave-no-trace principles. Conservation programs monitor ecosystem health and biodiversity.',
-                'health_safety': 'Remote location requires careful preparation. Bring adequate water and supplies. Inform others of travel plans - no cell coverage. Travel with experienced 4x4 drivers familiar with dune navigation. First aid kits essential. Avoid swimming alone. Summer heat dangerous - visit during cooler months. Emergency rescue can take time due to remoteness.',
-                'guided_tours': 'Desert safari tours include dune bashing, beach time, and sunset viewing. Overnight camping tours provide authentic Bedouin experience. Photography tours time visits for optimal lighting. Wildlife-focused tours highlight marine and desert ecology. Private tours offer customized experiences.',
-                'nearby_attractions': 'Sealine Beach Resort (35 km), Mesaieed Industrial City (30 km), Al Wakrah Heritage Village (60 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1509023464722-18d996393ca8?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1473496169904-658ba7c44d8a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '24.7039° N, 51.3450° E',
-                'annual_visitors': 'Over 100,000',
-                'climate': 'Desert climate. Extremely hot May-September. Best visited October-April.'
-            },
-            'lusail-city': {
-                'id': 'lusail-city',
-                'name': 'Lusail City',
-                'location': 'North of Doha, Qatar',
-                'description': 'Futuristic smart city hosting FIFA World Cup 2022 final, featuring innovative architecture and sustainable design.',
-                'long_description': 'Lusail City is Qatar\'s futuristic planned city spanning 38 square kilometers north of Doha. Conceived as a smart, sustainable city of the future, Lusail features cutting-edge architecture, advanced infrastructure, and innovative urban planning. The city gained global attention as the venue for the FIFA World Cup 2022 final at Lusail Stadium. With its waterfront promenades, luxury residences, entertainment complexes, and business districts, Lusail represents Qatar\'s vision for 21st-century urban living.',
-                'facts': [
-                    'Covers 38 square kilometers north of Doha',
-                    'Designed to house 200,000 residents',
-                    'Cost over $45 billion to develop',
-                    'Hosted FIFA World Cup 2022 final at Lusail Stadium',
-                    'Features district cooling system for sustainability',
-                    'Connected by Lusail Tram - Qatar\'s first tram network',
-                    'Four islands and 19 districts with distinct themes',
-                    'Smart city technology throughout'
-                ],
-                'key_sites': [
-                    {'name': 'Lusail Stadium', 'slug': 'lusail-stadium', 'description': '80,000-capacity stadium that hosted World Cup final', 'significance': 'Iconic venue with golden bowl design'},
-                    {'name': 'The Boulevard', 'slug': 'the-boulevard', 'description': 'Waterfront promenade with retail and dining', 'significance': 'Social hub with marina views and entertainment'},
-                    {'name': 'Place Vendome Mall', 'slug': 'place-vendome-mall', 'description': 'Luxury shopping destination', 'significance': 'French-inspired architecture with high-end brands'},
-                    {'name': 'Lusail Marina', 'slug': 'lusail-marina', 'description': 'Yacht marina with waterfront residences', 'significance': 'Exclusive yachting destination'}
-                ],
-                'entrance_fees': 'City access free. Attractions, shopping, dining costs vary.',
-                'opening_hours': 'City accessible 24/7. Attractions and businesses have individual hours.',
-                'best_time': 'October to April for exploring outdoors. Evenings year-round for waterfront dining.',
-                'how_to_get_there': '15 km north of Doha. Doha Metro (Red Line to various Lusail stations), Lusail Tram, taxi, or private car.',
-                'what_to_wear': 'Smart casual for dining and entertainment venues. Modest dress in public areas.',
-                'visitor_tips': [
-                    'Use Lusail Tram for convenient city transport',
-                    'Visit The Boulevard for waterfront dining',
-                    'Lusail Stadium offers tours (check availability)',
-                    'Place Vendome Mall for luxury shopping',
-                    'Evening hours best for outdoor activities',
-                    'Photography opportunities throughout modern architecture',
-                    'Many restaurants require reservations',
-                    'Explore different districts - each with unique character',
-                    'Marina area perfect for sunset strolls'
-                ],
-                'discovery': 'Lusail City was announced in 2005 as Qatar\'s vision for future urban development. Master planning began in 2006 with construction starting in 2007. The city was designed by international architects to showcase sustainable, smart city concepts. Lusail gained worldwide attention when selected to host the FIFA World Cup 2022 final match. The city continues to develop with ongoing construction and population growth.',
-                'architecture': 'Lusail showcases contemporary architecture from leading international firms. The city\'s master plan incorporates distinct themed districts with varied architectural styles. Lusail Stadium\'s golden bowl design became an icon. High-rise towers feature modern glass and steel construction. Waterfront developments blend residential, commercial, and recreational spaces. Smart city infrastructure integrates technology throughout.',
-                'cultural_impact': 'Lusail represents Qatar\'s vision of future urban living and ambitious development goals. Hosting the World Cup final elevated its global profile. The city attracts expatriates and professionals, creating a cosmopolitan community. It demonstrates Qatar\'s commitment to innovation, sustainability, and quality of life. Lusail has become a symbol of Gulf urban development.',
-                'conservation': 'Lusail implements advanced sustainability features including district cooling systems reducing energy consumption by 40%. Smart grid technology optimizes energy distribution. Green spaces and parks integrated throughout. Water recycling and efficient irrigation systems. Public transport infrastructure reduces car dependency. The city aims for LEED certification across developments.',
-                'health_safety': 'Modern infrastructure with advanced safety systems. Well-maintained pedestrian pathways. Smart traffic management improves road safety. Emergency services strategically located. Healthcare facilities within the city. Well-lit public spaces. Security presence throughout.',
-                'guided_tours': 'City tours explore architectural landmarks and urban planning innovations. Lusail Stadium tours showcase the World Cup venue. Architecture tours highlight contemporary design. Evening tours capture illuminated skyline. Private tours can be customized to specific interests.',
-                'nearby_attractions': 'Al Thakira Mangroves (15 km), The Pearl-Qatar (8 km), Katara Cultural Village (10 km), Souq Waqif (18 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1599586120429-48bb03e200c8?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1577223625816-7546f15602c3?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.4200° N, 51.4969° E',
-                'annual_visitors': 'Over 1 million',
-                'climate': 'Desert climate. Best visited October-April. Waterfront areas have sea breeze.'
-            },
-            '974-stadium': {
-                'id': '974-stadium',
-                'name': '974 Stadium',
-                'location': 'Ras Abu Aboud, Doha, Qatar',
-                'description': 'Revolutionary stadium built from 974 shipping containers, designed to be fully dismantled and relocated.',
-                'long_description': 'Stadium 974 is an architectural and engineering marvel that hosted FIFA World Cup 2022 matches. Built from 974 shipping containers and modular steel, it\'s the first fully demountable World Cup stadium. The number 974 represents both Qatar\'s international dialing code and the number of containers used. Located on the waterfront with Doha skyline views, the stadium showcases sustainable design and innovative construction that can be relocated or repurposed after the tournament.',
-                'facts': [
-                    'Built from 974 shipping containers',
-                    '974 is Qatar\'s international dialing code',
-                    'Capacity: 40,000 spectators',
-                    'First fully demountable FIFA World Cup stadium',
-                    'Designed by Fenwick Iribarren Architects',
-                    'No air conditioning - natural ventilation from sea breeze',
-                    'Can be dismantled and rebuilt elsewhere',
-                    'Stunning Doha Bay and skyline views'
-                ],
-                'key_sites': [
-                    {'name': 'Container Architecture', 'slug': 'container-architecture', 'description': 'Visible shipping containers forming stadium structure', 'significance': 'Innovative sustainable construction method'},
-                    {'name': 'Waterfront Location', 'slug': 'waterfront-location', 'description': 'Stadium positioned on Doha Bay coastline', 'significance': 'Panoramic views of city skyline and water'},
-                    {'name': 'Open-Air Design', 'slug': 'open-air-design', 'description': 'Naturally ventilated seating areas', 'significance': 'Eco-friendly cooling using sea breeze'},
-                    {'name': 'Viewing Platforms', 'slug': 'viewing-platforms', 'description': 'Public areas with stadium and bay views', 'significance': 'Photography spots and scenic perspectives'}
-                ],
-                'entrance_fees': 'Stadium tours available (check Qatar Tourism website for current prices and availability).',
-                'opening_hours': 'Tours available on select days. Check official website for current schedule.',
-                'best_time': 'October to April for comfortable temperatures. Evening hours for best lighting and atmosphere.',
-                'how_to_get_there': 'Located in Ras Abu Aboud area. Doha Metro (Gold Line to Ras Abu Aboud station), taxi, or ride-share.',
-                'what_to_wear': 'Casual comfortable clothing. Modest dress recommended. Comfortable shoes for walking.',
-                'visitor_tips': [
-                    'Book stadium tours in advance online',
-                    'Best photography during golden hour',
-                    'Combine visit with nearby waterfront walk',
-                    'Learn about sustainable construction methods',
-                    'Check for special events or exhibitions',
-                    'Waterfront area offers dining options',
-                    'Metro access makes visit convenient',
-                    'Allow 1-2 hours for tour and exploration',
-                    'Unique perspective on sustainable architecture'
-                ],
-                'discovery': 'Stadium 974 was announced as part of Qatar\'s 2022 FIFA World Cup preparations, designed to address sustainability concerns about building permanent stadiums with limited post-tournament use. Fenwick Iribarren Architects conceived the innovative shipping container design. Construction began in 2017 and completed in 2021. The stadium hosted seven World Cup matches in 2022 and demonstrated feasibility of temporary mega-infrastructure.',
-                'architecture': 'The stadium\'s revolutionary design uses 974 shipping containers as modular building blocks, combined with steel framework. The structure is fully demountable, with all components designed for disassembly and relocation. Open-air design eliminates need for air conditioning, utilizing natural ventilation from sea breezes. The industrial aesthetic celebrates the shipping containers rather than hiding them. The waterfront location provides stunning backdrop.',
-                'cultural_impact': 'Stadium 974 challenged traditional stadium design and set new standards for sustainable mega-events. It demonstrated that temporary infrastructure can host major sporting events without long-term environmental burden. The project influenced discussions about legacy planning for future World Cups and Olympics. It showcased Qatar\'s commitment to sustainability and innovative thinking in architecture.',
-                'conservation': 'The stadium represents ultimate sustainability through its demountable design, preventing construction waste. Materials can be reused or relocated rather than demolished. Natural ventilation eliminates energy consumption for cooling. Modular construction reduced material waste during building. The project demonstrates circular economy principles in mega-infrastructure. Post-tournament, components may be used in Qatar or donated to nations needing sports infrastructure.',
-                'health_safety': 'Stadium designed to international safety standards despite temporary nature. Structural integrity ensured through engineering. Emergency exits and evacuation procedures in place. Security personnel present during events. Medical facilities accessible. Natural ventilation reduces indoor air quality concerns. Well-maintained facilities ensure visitor safety.',
-                'guided_tours': 'Stadium tours explain innovative container construction and sustainable design. Architecture tours focus on engineering and modular systems. World Cup legacy tours share tournament memories and future plans. Photography tours capture unique architectural angles. Private group tours available.',
-                'nearby_attractions': 'Doha Corniche (2 km), Museum of Islamic Art (3 km), Souq Waqif (4 km), Katara Cultural Village (6 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1577223625816-7546f15602c3?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1508944360659-46e9eb61d8c6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2681° N, 51.5548° E',
-                'annual_visitors': 'Varies based on events and tour availability',
-                'climate': 'Outdoor venue. Best visited October-April. Natural sea breeze provides cooling.'
-            },
-            'al-wakrah-beach': {
-                'id': 'al-wakrah-beach',
-                'name': 'Al Wakrah Beach',
-                'location': 'Al Wakrah, Qatar',
-                'description': 'Beautiful coastal town featuring pristine beaches, heritage village, and traditional architecture.',
-                'long_description': 'Al Wakrah is a charming coastal town 20 km south of Doha, known for its beautiful beaches, restored heritage village, and laid-back atmosphere. Once a prominent pearl diving and fishing village, Al Wakrah has preserved its traditional character while offering modern beach facilities. The area features a picturesque harbor, traditional souq, restored heritage buildings, and the stunning Al Wakrah Sports Club designed by Zaha Hadid for the FIFA World Cup 2022.',
-                'facts': [
-                    'Historic pearling and fishing village',
-                    'Located 20 km south of Doha',
-                    'Restored heritage village with traditional architecture',
-                    'Al Janoub Stadium (Zaha Hadid design) nearby',
-                    'Family-friendly public beach with facilities',
-                    'Traditional dhow boats in historic harbor',
-                    'Al Wakrah Souq with authentic atmosphere',
-                    'Coastal promenade for walking and cycling'
-                ],
-                'key_sites': [
-                    {'name': 'Al Wakrah Heritage Village', 'slug': 'al-wakrah-heritage-village', 'description': 'Restored traditional village with museums', 'significance': 'Preserves pearl diving and fishing heritage'},
-                    {'name': 'Al Wakrah Beach', 'slug': 'al-wakrah-beach', 'description': 'Public beach with facilities and lifeguards', 'significance': 'Family-friendly swimming and relaxation'},
-                    {'name': 'Al Wakrah Souq', 'slug': 'al-wakrah-souq', 'description': 'Traditional market with local goods', 'significance': 'Authentic shopping experience less touristy than Doha'},
-                    {'name': 'Al Wakrah Harbor', 'slug': 'al-wakrah-harbor', 'description': 'Historic harbor with traditional dhows', 'significance': 'Photogenic scene of traditional boats'}
-                ],
-                'entrance_fees': 'Free access to beach and heritage village.',
-                'opening_hours': 'Beach and public areas accessible 24/7. Heritage village: 8:00 AM to 10:00 PM.',
-                'best_time': 'October to April for beach activities. Early morning or evening in summer. Weekends lively with families.',
-                'how_to_get_there': '20 km south of Doha. Accessible by taxi, ride-share, or private car. Public bus service available.',
-                'what_to_wear': 'Modest swimwear at beach. Modest dress for heritage village and souq. Comfortable shoes.',
-                'visitor_tips': [
-                    'Less crowded alternative to Doha beaches',
-                    'Visit heritage village for cultural insights',
-                    'Traditional restaurants serve fresh seafood',
-                    'Bring beach supplies - limited rental facilities',
-                    'Photograph traditional dhow boats at harbor',
-                    'Combine beach visit with heritage exploration',
-                    'Souq offers authentic local shopping',
-                    'Parking available near beach and heritage areas',
-                    'Family-friendly with playgrounds'
-                ],
-                'discovery': 'Al Wakrah\'s history dates back centuries as a pearling and fishing settlement. The town thrived during Qatar\'s pearl diving era in the 19th and early 20th centuries. After pearl industry decline, fishing remained important. In recent years, Qatar Museums restored the heritage village to preserve traditional architecture and culture. Preparation for FIFA World Cup 2022 brought new infrastructure while maintaining the town\'s character.',
-                'architecture': 'Al Wakrah Heritage Village showcases traditional Qatari architecture with coral stone buildings, wind towers (barjeel), and courtyard houses. The restoration preserved authentic construction methods and materials. Buildings demonstrate adaptations to hot climate including thick walls and strategic ventilation. The nearby Al Janoub Stadium, designed by Zaha Hadid, contrasts modern architecture with traditional surroundings.',
-                'cultural_impact': 'Al Wakrah preserves Qatar\'s coastal heritage and traditional lifestyle. The heritage village serves as living museum educating visitors about pearl diving, fishing, and traditional crafts. The town maintains a more authentic, less commercial atmosphere than Doha. It represents Qatar\'s commitment to heritage preservation alongside modernization.',
-                'conservation': 'Heritage village restoration followed traditional methods using sustainable materials. Coastal conservation protects marine ecosystems and beach habitats. The town balances development with preservation of character. Environmental education programs promote marine conservation awareness. Beach cleanup initiatives maintain pristine conditions.',
-                'health_safety': 'Public beach has lifeguards during peak hours. Clean facilities and changing rooms available. Well-maintained promenades and pathways. Security presence in heritage areas. Emergency services accessible. Family-friendly environment with designated play areas. Sun protection essential during summer.',
-                'guided_tours': 'Heritage village tours explain traditional architecture and pearl diving history. Cultural tours visit souq and meet local artisans. Food tours sample traditional seafood dishes. Photography tours capture harbor scenes and traditional architecture. Walking tours combine beach and heritage areas.',
-                'nearby_attractions': 'Al Janoub Stadium (2 km), Inland Sea / Khor Al Adaid (60 km), Doha (20 km), Sealine Beach (25 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1507525428034-b723cf961d3e?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1590394948226-b7eeb6dc4a6e?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.1671° N, 51.6023° E',
-                'annual_visitors': 'Over 500,000',
-                'climate': 'Coastal desert climate. Sea breeze provides cooling. Best visited October-April.'
-            },
-            'doha-corniche': {
-                'id': 'doha-corniche',
-                'name': 'Doha Corniche',
-                'location': 'Doha, Qatar',
-                'description': 'Iconic 7-kilometer waterfront promenade showcasing Doha\'s stunning skyline and offering recreation and dining.',
-                'long_description': 'The Doha Corniche is a crescent-shaped waterfront promenade extending 7 kilometers along Doha Bay. This scenic walkway offers breathtaking views of the city\'s modern skyline, traditional dhow boats, and the Arabian Gulf. The Corniche features parks, beaches, restaurants, and cultural landmarks including the Museum of Islamic Art and National Museum of Qatar. It serves as Doha\'s social heart where residents and visitors gather for exercise, leisure, and entertainment.',
-                'facts': [
-                    'Extends 7 km along Doha Bay',
-                    'Crescent-shaped promenade with parks and beaches',
-                    'Iconic views of Doha\'s modern skyline',
-                    'Hosts major events and celebrations',
-                    'Dedicated lanes for walking, running, and cycling',
-                    'Traditional dhow boats offer cruises',
-                    'Multiple playgrounds and family areas',
-                    'Restaurants and cafés along waterfront'
-                ],
-                'key_sites': [
-                    {'name': 'Museum of Islamic Art Park', 'slug': 'mia-park', 'description': 'Waterfront park with art installations', 'significance': 'Richard Serra sculpture and museum views'},
-                    {'name': 'Sheraton Park', 'slug': 'sheraton-park', 'description': 'Central park with pyramid-shaped hotel backdrop', 'significance': 'Popular gathering spot with facilities'},
-                    {'name': 'Dhow Harbor', 'slug': 'dhow-harbor', 'description': 'Traditional wooden boats offering cruises', 'significance': 'Experience traditional boat rides'},
-                    {'name': 'Corniche Beach', 'slug': 'corniche-beach', 'description': 'Public beach with facilities', 'significance': 'Swimming and beach activities'}
-                ],
-                'entrance_fees': 'Free access. Dhow cruise costs vary (100-300 QAR).',
-                'opening_hours': 'Accessible 24/7. Restaurants and attractions have individual hours.',
-                'best_time': 'October to April for daytime walks. Evening hours year-round for cooler temperatures and illuminated skyline. Weekends festive atmosphere.',
-                'how_to_get_there': 'Central Doha location. Doha Metro (various stations along route), taxi, ride-share, or car. Parking available.',
-                'what_to_wear': 'Casual comfortable clothing for walking. Modest dress recommended. Comfortable shoes essential.',
-                'visitor_tips': [
-                    'Visit during sunset for spectacular lighting',
-                    'Bring water and sun protection during day',
-                    'Rent bicycles for efficient exploration',
-                    'Try traditional dhow cruise for unique perspective',
-                    'Multiple entry points along 7 km length',
-                    'Photography opportunities at every turn',
-                    'Playgrounds keep children entertained',
-                    'Restaurants offer diverse international cuisine',
-                    'Weekend evenings particularly vibrant',
-                    'Watch traditional dhow boats sailing'
-                ],
-                'discovery': 'The Doha Corniche evolved from a simple waterfront into an iconic urban landmark. Early development began in the 1970s and 1980s as Doha modernized. Major upgrades occurred in preparation for the 2006 Asian Games and continued through the 2000s. The most recent enhancement came before the 2022 FIFA World Cup, adding improved facilities, landscaping, and accessibility. The Corniche has become synonymous with Doha\'s identity.',
-                'architecture': 'The Corniche showcases Doha\'s architectural evolution with the Museum of Islamic Art\'s geometric forms, the National Museum\'s desert rose design, and West Bay\'s modern skyscrapers creating a stunning skyline. The promenade features contemporary urban design with green spaces, seating areas, and public art installations. Traditional elements include dhow harbors connecting to maritime heritage.',
-                'cultural_impact': 'The Corniche serves as Doha\'s central public space where diverse communities converge. It hosts national celebrations, cultural festivals, and sporting events. The waterfront has become integral to Doha\'s lifestyle, promoting fitness, social interaction, and community building. It represents Qatar\'s transformation from pearling village to global city.',
-                'conservation': 'Coastal conservation efforts protect marine environments along the Corniche. Sustainable landscaping uses native plants and efficient irrigation. Beach cleanup programs maintain pristine conditions. Public awareness campaigns promote environmental responsibility. The promenade balances urban development with ecological preservation.',
-                'health_safety': 'Well-maintained walkways ensure pedestrian safety. Lifeguards at beach areas during peak hours. Security personnel patrol regularly. Emergency services easily accessible. Well-lit for evening walks. Family-friendly environment. Facilities including restrooms and first aid available.',
-                'guided_tours': 'Walking tours explore architectural landmarks and cultural sites. Running groups organize morning and evening sessions. Cycling tours cover the full 7 km length. Dhow cruise tours provide water perspective. Photography tours capture skyline and sunset views. Cultural tours visit museums and parks.',
-                'nearby_attractions': 'Museum of Islamic Art (along Corniche), National Museum of Qatar (along Corniche), Souq Waqif (1 km), Katara Cultural Village (5 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1539017129681-bb82959786a9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1582719366489-6cc5c79cf9dd?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2924° N, 51.5346° E',
-                'annual_visitors': 'Over 5 million',
-                'climate': 'Waterfront location with sea breeze. Best visited October-April. Evening walks comfortable year-round.'
-            },
-            'villagio-mall': {
-                'id': 'villagio-mall',
-                'name': 'Villagio Mall',
-                'location': 'Aspire Zone, Doha, Qatar',
-                'description': 'Venetian-themed luxury shopping mall featuring indoor canal, gondola rides, and international brands.',
-                'long_description': 'Villagio Mall is Qatar\'s most distinctive shopping destination, replicating Venice with an indoor canal, gondola rides, and Italian Renaissance architecture. This luxury mall features over 200 stores including international fashion brands, electronics, jewelry, and home goods. The centerpiece is the indoor Venice-themed section with painted sky ceiling, canal with gondolas, and charming bridges. Beyond shopping, Villagio offers dining, entertainment including an IMAX cinema, and family attractions.',
-                'facts': [
-                    'Venetian-themed architecture with indoor canal',
-                    'Gondola rides through mall\'s central canal',
-                    'Painted sky ceiling simulating day/night',
-                    'Over 200 retail stores and 50+ restaurants',
-                    'IMAX cinema with latest technology',
-                    'Indoor theme park - Gondolania',
-                    'Located in Aspire Zone near Aspire Park',
-                    'Luxury brands and international retailers'
-                ],
-                'key_sites': [
-                    {'name': 'Venice Canal', 'slug': 'venice-canal', 'description': 'Indoor canal with gondola rides', 'significance': 'Unique shopping mall feature replicating Venice'},
-                    {'name': 'Gondolania Theme Park', 'slug': 'gondolania-theme-park', 'description': 'Indoor amusement park with rides', 'significance': 'Family entertainment with bowling and arcade'},
-                    {'name': 'Luxury Brand District', 'slug': 'luxury-brands', 'description': 'High-end fashion boutiques', 'significance': 'Designer shopping from global brands'},
-                    {'name': 'IMAX Cinema', 'slug': 'imax-cinema', 'description': 'Premium movie theater', 'significance': 'Latest blockbusters in IMAX format'}
-                ],
-                'entrance_fees': 'Free mall access. Gondola rides: 30 QAR per person. Theme park tickets vary.',
-                'opening_hours': 'Sunday-Wednesday: 10:00 AM to 10:00 PM. Thursday-Saturday: 10:00 AM to 11:00 PM.',
-                'best_time': 'Weekday mornings less crowded. Evenings and weekends busier with families. Year-round air-conditioned comfort.',
-                'how_to_get_there': 'Located in Aspire Zone. Taxi, ride-share, or private car. Ample parking available. Near Aspire Park.',
-                'what_to_wear': 'Casual or smart casual attire. Modest dress recommended. Comfortable shoes for walking.',
-                'visitor_tips': [
-                    'Take gondola ride for unique photo opportunity',
-                    'Visit Gondolania theme park with children',
-                    'Weekday mornings best for less crowded shopping',
-                    'Diverse dining options from fast food to fine dining',
-                    'IMAX cinema for entertainment',
-                    'Multiple floors - use escalators or elevators',
-                    'Currency exchange and ATMs available',
-                    'Prayer rooms and family facilities provided',
-                    'Combine with Aspire Park visit nearby',
-                    'Painted sky ceiling changes throughout day'
-                ],
-                'discovery': 'Villagio Mall opened in 2008 as Qatar\'s most ambitious retail project, aiming to create a unique shopping experience beyond typical malls. The Venetian theme was chosen to differentiate from other developments and create an immersive atmosphere. The mall quickly became a social destination for families and tourists. Continuous additions and renovations have maintained its position as a premier shopping venue.',
-                'architecture': 'The mall\'s architecture recreates Italian Renaissance style with frescoed ceilings, Roman columns, and Venetian facades. The central feature is the indoor canal with painted sky ceiling that simulates day fading to dusk. The design creates an outdoor piazza feel despite being indoors. The attention to detail includes bridges, balconies, and streetscapes reminiscent of Venice.',
-                'cultural_impact': 'Villagio introduced theatrical retail design to Qatar, influencing subsequent mall developments. It became a social hub where shopping merges with entertainment and dining. The mall\'s popularity reflects Qatar\'s shopping culture and desire for family-oriented destinations. It demonstrates how retail spaces can become tourist attractions through creative theming.',
-                'conservation': 'The mall implements energy-efficient cooling systems managing the large indoor space. Waste management and recycling programs operate throughout. Water conservation measures include efficient fixtures. The enclosed design actually improves energy efficiency compared to open-air alternatives. Lighting systems optimize energy usage while maintaining ambiance.',
-                'health_safety': 'Advanced fire safety systems throughout mall. Security personnel and surveillance ensure visitor safety. Emergency exits clearly marked. Medical facilities accessible nearby. Elevators and escalators well-maintained. Family-friendly environment with child-safety features. Air quality monitored and controlled.',
-                'guided_tours': 'Shopping assistance available for personal shopping services. Family tours highlight theme park and entertainment options. Food tours sample diverse international cuisines. Photography tours capture Venetian-themed architecture. Group tours can be arranged.',
-                'nearby_attractions': 'Aspire Park (adjacent), Aspire Tower (500m), Khalifa International Stadium (1 km), Education City (3 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1519567241046-7f570eee3ce6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1441986300917-64674bd600d8?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.2574° N, 51.4426° E',
-                'annual_visitors': 'Over 10 million',
-                'climate': 'Fully air-conditioned interior. Comfortable year-round shopping.'
-            },
-            'al-thakira-mangroves': {
-                'id': 'al-thakira-mangroves',
-                'name': 'Al Thakira Mangroves',
-                'location': 'Al Thakira, North Qatar',
-                'description': 'Natural mangrove forest ecosystem perfect for kayaking, wildlife viewing, and eco-tourism.',
-                'long_description': 'Al Thakira Mangroves is a protected natural ecosystem located in northern Qatar near Al Khor. This tranquil mangrove forest features winding waterways perfect for kayaking and paddleboarding. The mangroves provide crucial habitat for diverse wildlife including herons, flamingos, crabs, and fish. The area offers a peaceful escape into nature, showcasing Qatar\'s commitment to environmental conservation and providing eco-tourism opportunities in a serene coastal setting.',
-                'facts': [
-                    'Protected natural mangrove ecosystem',
-                    'Located 50 km north of Doha near Al Khor',
-                    'Popular for kayaking and paddleboarding',
-                    'Home to herons, flamingos, and other birds',
-                    'Mangroves crucial for marine ecosystem',
-                    'Peaceful nature escape from urban Doha',
-                    'Boardwalks for viewing without disturbing habitat',
-                    'Environmental education programs available'
-                ],
-                'key_sites': [
-                    {'name': 'Kayaking Channels', 'slug': 'kayaking-channels', 'description': 'Winding waterways through mangrove forests', 'significance': 'Explore ecosystem by kayak or paddleboard'},
-                    {'name': 'Viewing Boardwalks', 'slug': 'viewing-boardwalks', 'description': 'Raised wooden paths through mangroves', 'significance': 'Wildlife observation without disturbing habitat'},
-                    {'name': 'Purple Island (Bin Ghannam Island)', 'slug': 'purple-island', 'description': 'Nearby island with ancient settlement', 'significance': 'Archaeological site and beach access'},
-                    {'name': 'Bird Watching Areas', 'slug': 'bird-watching', 'description': 'Prime spots for observing migratory birds', 'significance': 'Herons, flamingos, and seasonal species'}
-                ],
-                'entrance_fees': 'Free access. Kayak rentals available from operators (prices vary, typically 50-100 QAR per person).',
-                'opening_hours': 'Accessible during daylight hours. Best visits during morning or late afternoon.',
-                'best_time': 'October to April for comfortable temperatures and migratory bird season. Early morning or late afternoon for wildlife activity. Avoid midday summer heat.',
-                'how_to_get_there': '50 km north of Doha near Al Khor city. Private car or organized tour recommended. Follow signs to Al Thakira.',
-                'what_to_wear': 'Light, breathable clothing. Water shoes or sandals for kayaking. Hat, sunglasses, and sunscreen essential. Bring change of clothes.',
-                'visitor_tips': [
-                    'Book kayak tour with reputable operator in advance',
-                    'Bring water and snacks - limited facilities',
-                    'Early morning best for wildlife and cooler temperatures',
-                    'Binoculars enhance bird watching experience',
-                    'Wear sun protection - minimal shade available',
-                    'Respect wildlife and maintain quiet for observations',
-                    'Photography opportunities abundant - bring camera',
-                    'Combine with Purple Island visit',
-                    'Check tides for optimal kayaking conditions',
-                    'Waterproof bag protects electronics in kayak'
-                ],
-                'discovery': 'Al Thakira Mangroves have existed for centuries as part of Qatar\'s coastal ecosystem. Traditional communities recognized their importance for fishing and coastal protection. Environmental awareness in recent decades led to conservation efforts and eco-tourism development. The area gained popularity as a nature destination in the 2010s. Qatar continues investing in boardwalks, facilities, and conservation programs to protect this valuable ecosystem.',
-                'architecture': 'The mangroves represent natural architecture with intricate root systems and canopy structures. Wooden boardwalks were designed to minimize environmental impact while providing access. The structures blend with natural surroundings using sustainable materials. Observation platforms strategically placed for wildlife viewing without disturbance. The development prioritizes conservation over construction.',
-                'cultural_impact': 'Al Thakira Mangroves promote environmental awareness and appreciation for Qatar\'s natural heritage. The site demonstrates that Qatar offers diverse experiences beyond urban attractions. It fosters eco-tourism and outdoor recreation culture. The mangroves educate visitors about coastal ecosystems\' importance. They represent Qatar\'s commitment to environmental conservation alongside development.',
-                'conservation': 'The mangroves are protected as crucial coastal ecosystem providing nursery habitat for marine life. Conservation programs monitor ecosystem health and biodiversity. Visitor education emphasizes minimal impact practices. Boardwalks and designated channels prevent habitat disturbance. Research programs study mangrove ecology and climate resilience. The area is vital for carbon sequestration and coastal protection.',
-                'health_safety': 'Wear life jackets during kayaking (provided by operators). Apply sun protection and stay hydrated. Be aware of tides and currents. Follow guide instructions during tours. Wildlife viewing from safe distance. First aid kits carried by tour operators. Cell phone coverage available for emergencies. Inform others of visit plans.',
-                'guided_tours': 'Kayak tours explore mangrove channels with knowledgeable guides. Bird watching tours focus on wildlife observation and identification. Photography tours time visits for optimal lighting and wildlife activity. Educational tours explain mangrove ecology and conservation. Sunrise tours offer magical early morning experiences.',
-                'nearby_attractions': 'Purple Island / Bin Ghannam Island (adjacent), Al Khor (10 km), Al Zubarah Fort (60 km), Lusail City (30 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1564760055775-d63b17a55c44?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1559827260-dc66d52bef19?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.6650° N, 51.5361° E',
-                'annual_visitors': 'Over 75,000',
-                'climate': 'Coastal climate. Best visited October-April. Bring sun protection year-round.'
-            }
-        },
-        'saudi-arabia': {
-            'alula-hegra': {
-                'id': 'alula-hegra',
-                'name': 'AlUla & Hegra (Mada\'in Salih)',
-                'location': 'AlUla, Northwestern Saudi Arabia',
-                'description': 'UNESCO World Heritage Site featuring spectacular Nabataean tombs carved into sandstone cliffs, Saudi Arabia\'s first UNESCO site.',
-                'long_description': 'Hegra, also known as Mada\'in Salih, is Saudi Arabia\'s first UNESCO World Heritage Site and the most iconic archaeological destination in the kingdom. This ancient Nabataean city features over 110 monumental tombs carved into towering sandstone outcrops, dating from the 1st century BC to the 1st century AD. The site represents the southern capital of the Nabataean Kingdom, complementing Petra in Jordan. The surrounding AlUla region offers dramatic desert landscapes, ancient rock art, and modern luxury resorts, making it Saudi Arabia\'s premier cultural destination.',
-                'facts': [
-                    'Saudi Arabia\'s first UNESCO World Heritage Site (2008)',
-                    'Over 110 monumental Nabataean tombs',
-                    'Dates from 1st century BC to 1st century AD',
-                    'Southern capital of Nabataean Kingdom',
-                    'Features Qasr al-Farid, iconic solitary tomb',
-                    'Ancient trade route connecting Arabia to Mediterranean',
-                    'Covers 52 hectares of archaeological significance',
-                    'Contains thousands of ancient inscriptions'
-                ],
-                'key_sites': [
-                    {'name': 'Qasr al-Farid', 'slug': 'qasr-al-farid', 'description': 'Iconic solitary tomb carved from single rock', 'significance': 'Most photographed monument, symbol of AlUla'},
-                    {'name': 'Jabal Ithlib', 'slug': 'jabal-ithlib', 'description': 'Mountain with religious sites and Diwan', 'significance': 'Sacred ceremonial area with ancient inscriptions'},
-                    {'name': 'Tomb of Lihyan Son of Kuza', 'slug': 'tomb-lihyan', 'description': 'Largest tomb with elaborate facade', 'significance': 'Finest example of Nabataean architecture at Hegra'},
-                    {'name': 'Hijaz Railway Station', 'slug': 'hijaz-railway', 'description': 'Ottoman-era railway ruins', 'significance': 'Historical connection to Lawrence of Arabia'}
-                ],
-                'entrance_fees': 'Hegra tickets: 95 SAR adults. AlUla Pass for multiple sites: from 250 SAR.',
-                'opening_hours': 'October-March: 9:00 AM to 6:00 PM. Closed Tuesdays. Advance booking required.',
-                'best_time': 'October to March for comfortable temperatures (15-25°C). Winter Festival (December-January) features cultural events.',
-                'how_to_get_there': 'AlUla Airport serves domestic and international flights. 1,100 km from Riyadh (2-hour flight), 380 km from Medina (4-hour drive). Tours available from major cities.',
-                'what_to_wear': 'Modest clothing covering shoulders and knees. Comfortable walking shoes. Hat and sunscreen essential. Layers for temperature changes.',
-                'visitor_tips': [
-                    'Book tickets online in advance - limited daily capacity',
-                    'Join guided tour for comprehensive historical context',
-                    'Visit at sunrise or late afternoon for best lighting',
-                    'AlUla Pass provides access to multiple sites',
-                    'Allow full day to explore Hegra and surrounding areas',
-                    'Photography encouraged but no drones without permit',
-                    'Stay at AlUla resort for multi-day exploration',
-                    'Combine with Elephant Rock and Old Town AlUla',
-                    'Winter Festival offers cultural performances and dining',
-                    'Respect archaeological site - no touching monuments'
-                ],
-                'discovery': 'Hegra was known to locals for centuries but remained largely unexplored until the 20th century. European travelers began documenting the site in the 1800s. Systematic archaeological excavations started in 2002 by Saudi-French teams. UNESCO inscribed Hegra as World Heritage Site in 2008, marking Saudi Arabia\'s first inscription. The Saudi government launched ambitious AlUla development plans in 2017, opening the region to tourism while preserving archaeological integrity.',
-                'architecture': 'Hegra\'s tombs showcase magnificent Nabataean rock-cut architecture with Hellenistic, Egyptian, and Mesopotamian influences. Facades feature stepped crenellations, columns, pediments, and intricate decorative elements. The monuments demonstrate advanced engineering with precise geometric proportions. The sandstone\'s natural layering creates striking visual effects. Each tomb was customized for wealthy families with inscriptions detailing ownership and burial rights.',
-                'cultural_impact': 'Hegra represents Saudi Arabia\'s cultural opening and tourism development. The site connects Saudi heritage to broader ancient civilizations. AlUla has become a symbol of Vision 2030\'s cultural transformation. International partnerships bring global attention to Saudi archaeology. The region hosts major cultural events attracting international artists and visitors. Hegra demonstrates Saudi commitment to heritage preservation while embracing tourism.',
-                'conservation': 'The Royal Commission for AlUla oversees comprehensive conservation programs. International archaeological teams conduct ongoing research and preservation. Climate monitoring protects fragile sandstone from erosion. Visitor management limits daily capacity to prevent damage. Digital documentation creates 3D models of monuments. Conservation balances public access with long-term preservation. Traditional building techniques inform restoration efforts.',
-                'health_safety': 'Well-maintained pathways throughout archaeological sites. Medical facilities available in AlUla town. Guided tours mandatory for visitor safety. Summer heat dangerous - site closed June-September. Hydration stations provided. Emergency services accessible. Security personnel patrol sites. Visitors must follow designated paths.',
-                'guided_tours': 'Expert-led tours explain Nabataean history and archaeology. Specialized tours focus on architecture, inscriptions, or cultural context. Sunrise and sunset tours offer optimal lighting and atmosphere. Private tours provide personalized experiences. Photography workshops teach composition techniques. Multi-day tours explore entire AlUla region.',
-                'nearby_attractions': 'Elephant Rock / Jabal AlFil (12 km), Old Town AlUla (20 km), Dadan and Ikmah Inscriptions (15 km), Maraya Concert Hall (18 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '26.7889° N, 37.9544° E',
-                'annual_visitors': 'Over 250,000 (growing rapidly)',
-                'climate': 'Desert climate. Very hot May-September (closed to visitors). Best visited October-April.'
-            },
-            'masjid-al-haram-mecca': {
-                'id': 'masjid-al-haram-mecca',
-                'name': 'Masjid al-Haram (The Grand Mosque)',
-                'location': 'Mecca, Western Saudi Arabia',
-                'description': 'Islam\'s holiest site and the world\'s largest mosque, surrounding the sacred Kaaba where millions perform Hajj and Umrah.',
-                'long_description': 'Masjid al-Haram (The Sacred Mosque) is the holiest site in Islam, surrounding the Kaaba at its center. This magnificent mosque can accommodate over 2.5 million worshippers simultaneously, making it the world\'s largest mosque. Muslims worldwide face toward the Kaaba during daily prayers. The mosque complex has been expanded over centuries, with recent developments creating stunning modern architecture integrated with spiritual significance. Hajj pilgrimage and year-round Umrah bring millions of Muslims to Mecca annually.',
-                'facts': [
-                    'Holiest site in Islam, qibla direction for prayers worldwide',
-                    'Surrounds the Kaaba, built by Prophet Ibrahim (Abraham)',
-                    'Capacity for over 2.5 million worshippers',
-                    'Covers 400,800 square meters',
-                    'Features seven minarets up to 89 meters tall',
-                    'Annual Hajj pilgrimage brings 2-3 million pilgrims',
-                    'Zamzam Well provides sacred water',
-                    'Expansion projects costing over $100 billion'
-                ],
-                'key_sites': [
-                    {'name': 'The Kaaba', 'slug': 'the-kaaba', 'description': 'Cubic structure draped in black silk kiswah', 'significance': 'Most sacred site in Islam, focus of prayer and pilgrimage'},
-                    {'name': 'Black Stone (Hajar al-Aswad)', 'slug': 'black-stone', 'description': 'Ancient stone set in Kaaba\'s eastern corner', 'significance': 'Pilgrims aspire to touch or point toward it during tawaf'},
-                    {'name': 'Maqam Ibrahim', 'slug': 'maqam-ibrahim', 'description': 'Station of Abraham with sacred footprint', 'significance': 'Where Prophet Ibrahim stood while building Kaaba'},
-                    {'name': 'Zamzam Well', 'slug': 'zamzam-well', 'description': 'Sacred water source', 'significance': 'Blessed water for pilgrims since time of Ismail'}
-                ],
-                'entrance_fees': 'Access restricted to Muslims only. No entrance fee. Hajj requires official visa and package.',
-                'opening_hours': 'Open 24/7 for prayers and pilgrimage rituals.',
-                'best_time': 'Ramadan for spiritual atmosphere. Off-season (Safar, Rajab months) less crowded. Avoid Hajj season unless performing pilgrimage.',
-                'how_to_get_there': 'Fly to King Abdulaziz International Airport Jeddah (80 km) or Prince Mohammad Bin Abdulaziz Airport Medina (450 km). Haramain High Speed Railway connects Jeddah-Mecca-Medina. Taxis and buses widely available.',
-                'what_to_wear': 'Men: Ihram (two white seamless cloths) for Hajj/Umrah. Regular modest clothing for prayers. Women: Modest dress covering body except face and hands. Comfortable shoes for walking.',
-                'visitor_tips': [
-                    'Non-Muslims not permitted in Mecca',
-                    'Book Umrah package through licensed operators',
-                    'Prepare physically - extensive walking required',
-                    'Stay hydrated - water stations throughout mosque',
-                    'Weekdays less crowded than Friday/weekends',
-                    'Learn tawaf and sa\'i rituals before arriving',
-                    'Keep personal belongings secure in crowds',
-                    'Wheelchairs available for elderly/disabled',
-                    'Cooling systems maintain comfortable temperature',
-                    'Respect spiritual atmosphere and fellow pilgrims'
-                ],
-                'discovery': 'The Kaaba\'s origins trace to Prophet Ibrahim (Abraham) around 2000 BC according to Islamic tradition. Prophet Muhammad restored monotheistic worship in 630 CE. The mosque has been expanded by successive Islamic dynasties - Rashidun, Umayyad, Abbasid, Mamluk, Ottoman, and Saudi governments. Massive modern expansions (1950s-present) accommodate growing numbers of pilgrims. The current structure represents centuries of Islamic architectural evolution.',
-                'architecture': 'The mosque blends traditional Islamic architecture with modern engineering. Nine minarets tower up to 89 meters. The mataf (circumambulation area) around Kaaba features multi-level marble floors. Ottoman-style archways surround the courtyard. Recent expansions added contemporary elements including retractable umbrellas, air conditioning, and moving walkways. The design prioritizes accommodating maximum worshippers while maintaining spiritual atmosphere. Traditional marble and modern materials create timeless aesthetic.',
-                'cultural_impact': 'Masjid al-Haram is the spiritual center of 1.8 billion Muslims worldwide. The Kaaba establishes the qibla (prayer direction) for all Muslims. Hajj pilgrimage unites diverse Muslim communities annually. The mosque symbolizes Islamic unity transcending nationality and ethnicity. Its expansion reflects Saudi Arabia\'s role as custodian of Islam\'s holy sites. The site has profound impact on Islamic architecture, art, and culture globally.',
-                'conservation': 'The Saudi government invests billions in maintaining and expanding the mosque. Advanced technology monitors structural integrity. Climate control preserves marble and stone. Historic elements are carefully preserved during expansions. Conservation teams maintain the Kaaba\'s kiswah (changed annually). Water management systems handle millions of pilgrims. Sustainability initiatives reduce environmental impact of mass gatherings.',
-                'health_safety': 'Comprehensive medical facilities throughout the complex. Thousands of security personnel ensure safety. Crowd management systems prevent stampedes. Emergency evacuation procedures in place. Surveillance technology monitors pilgrim flow. First aid stations strategically located. Heat management crucial during summer months. Sanitation teams maintain hygiene standards. COVID-19 protocols implemented when necessary.',
-                'guided_tours': 'Religious scholars offer guidance on rituals and history. Hajj/Umrah package operators provide complete support services. Audio guides available in multiple languages. Virtual reality experiences show historical developments. Educational programs teach pilgrimage rituals. Group coordinators assist during Hajj season.',
-                'nearby_attractions': 'Jabal al-Nour & Cave of Hira (5 km), Jabal Thawr (5 km), Abraj Al Bait Clock Tower (adjacent), Makkah Museum (2 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1591604129939-f1efa4d9f7fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '21.4225° N, 39.8262° E',
-                'annual_visitors': 'Over 15 million (Umrah year-round + Hajj pilgrims)',
-                'climate': 'Desert climate. Extremely hot May-September (40-50°C). Mild November-February.'
-            },
-            'madinah-al-masjid-an-nabawi': {
-                'id': 'madinah-al-masjid-an-nabawi',
-                'name': 'Al-Masjid an-Nabawi (The Prophet\'s Mosque)',
-                'location': 'Medina, Western Saudi Arabia',
-                'description': 'Islam\'s second holiest mosque, built by Prophet Muhammad, featuring his tomb and stunning green dome.',
-                'long_description': 'Al-Masjid an-Nabawi (The Prophet\'s Mosque) is Islam\'s second holiest site, originally built by Prophet Muhammad in 622 CE. The mosque houses the Prophet\'s tomb beneath the iconic green dome, along with the graves of the first two caliphs, Abu Bakr and Umar. This magnificent mosque can accommodate over 1 million worshippers and features exquisite Islamic architecture blending Ottoman and modern styles. Medina offers a more peaceful atmosphere than Mecca, making it a profoundly spiritual destination for Muslims worldwide.',
-                'facts': [
-                    'Second holiest site in Islam after Mecca',
-                    'Built by Prophet Muhammad in 622 CE',
-                    'Houses Prophet Muhammad\'s tomb beneath green dome',
-                    'Capacity for over 1 million worshippers',
-                    'Features 10 minarets up to 105 meters tall',
-                    'Original mosque measured only 30x35 meters',
-                    'Rawdah (garden) considered part of Paradise',
-                    'One prayer equals 1,000 prayers elsewhere (except Mecca)'
-                ],
-                'key_sites': [
-                    {'name': 'Green Dome (Al-Qubbah al-Khadra)', 'slug': 'green-dome', 'description': 'Iconic dome over Prophet\'s tomb', 'significance': 'Most recognizable symbol, marks burial site'},
-                    {'name': 'Rawdah', 'slug': 'rawdah', 'description': 'Area between minbar and Prophet\'s chamber', 'significance': 'Considered garden from gardens of Paradise'},
-                    {'name': 'Riyad al-Jannah', 'slug': 'riyad-al-jannah', 'description': 'Sacred area with green carpet', 'significance': 'Part of original mosque, highly sought for prayers'},
-                    {'name': 'Mihrab', 'slug': 'mihrab', 'description': 'Prayer niche indicating qibla direction', 'significance': 'Marks where Prophet Muhammad led prayers'}
-                ],
-                'entrance_fees': 'Access restricted to Muslims only. No entrance fee.',
-                'opening_hours': 'Open 24/7. Rawdah access limited hours - men and women alternating.',
-                'best_time': 'Ramadan for spiritual atmosphere. Off-season less crowded. After Fajr and Isha prayers quieter.',
-                'how_to_get_there': 'Prince Mohammad Bin Abdulaziz Airport in Medina. Haramain High Speed Railway connects to Mecca (450 km) and Jeddah. Taxis widely available from hotels.',
-                'what_to_wear': 'Modest Islamic dress required. Men: Long pants and shirts. Women: Abaya and headscarf covering hair. Comfortable shoes for walking.',
-                'visitor_tips': [
-                    'Non-Muslims not permitted in Medina',
-                    'Arrive early for Rawdah access - highly competitive',
-                    'Women\'s Rawdah hours typically after Fajr and Isha',
-                    'Visit Jannat al-Baqi cemetery (companions\' graves)',
-                    'Explore Quba Mosque (first mosque in Islam)',
-                    'Stay near mosque for easy access',
-                    'Learn etiquette before visiting Prophet\'s tomb',
-                    'Wheelchair accessible throughout',
-                    'Automatic umbrellas provide shade in courtyard',
-                    'More peaceful atmosphere than Mecca'
-                ],
-                'discovery': 'Prophet Muhammad built the original mosque upon migrating to Medina in 622 CE. The mosque served as community center, court, and religious school. Successive expansions by Rashidun Caliphs, Umayyads, Abbasids, Mamluks, and Ottomans enlarged the structure. The green dome was added in the 13th century (originally colorless). Saudi expansions (20th-21st centuries) massively increased capacity while preserving historical elements. The mosque remains the spiritual heart of Medina.',
-                'architecture': 'The mosque beautifully combines Ottoman and modern Islamic architecture. Ten towering minarets reach 105 meters. The iconic green dome marks the Prophet\'s tomb. White marble courtyards reflect Arabian heritage. Intricate calligraphy and geometric patterns adorn walls. Modern additions include retractable umbrellas and climate control. The design accommodates millions while maintaining intimate spirituality. Natural light through stained glass creates ethereal atmosphere.',
-                'cultural_impact': 'Al-Masjid an-Nabawi represents the birthplace of the Islamic community. The mosque embodies the Prophet\'s teachings and example. Visiting Medina is highly recommended (though not obligatory like Hajj). The mosque influences Islamic architecture worldwide. Its serene atmosphere contrasts with Mecca\'s intensity. The site fosters deep spiritual connections for Muslims. Medina exemplifies the Prophet\'s city-state model.',
-                'conservation': 'Massive ongoing investments preserve and expand the mosque. Historical elements carefully maintained during renovations. The Prophet\'s chamber protected by multiple barriers. Advanced monitoring prevents structural issues. Climate control preserves interior elements. Regular maintenance of marble and decorative elements. Conservation balances accommodating pilgrims with preservation. Digital archives document historical features.',
-                'health_safety': 'Comprehensive medical facilities and staff throughout. Security ensures pilgrim safety. Crowd management prevents congestion. Emergency evacuation procedures established. Sanitation teams maintain hygiene. Cooling systems combat heat. Wheelchair and disabled access throughout. COVID protocols implemented when needed. Water stations prevent dehydration.',
-                'guided_tours': 'Religious scholars explain history and significance. Umrah package operators include Medina visits. Audio guides in multiple languages. Virtual tours show historical development. Educational programs teach Islamic history. Tours visit related historical sites in Medina.',
-                'nearby_attractions': 'Quba Mosque (5 km), Mount Uhud (5 km), Jannat al-Baqi Cemetery (adjacent), Seven Mosques (4 km), Madinah Museum (3 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '24.4672° N, 39.6111° E',
-                'annual_visitors': 'Over 10 million',
-                'climate': 'Desert climate. Hot summers (35-45°C). Mild winters (15-25°C). Best November-February.'
-            },
-            'edge-of-the-world-riyadh': {
-                'id': 'edge-of-the-world-riyadh',
-                'name': 'Edge of the World (Jebel Fihrayn)',
-                'location': 'Northwest of Riyadh, Saudi Arabia',
-                'description': 'Dramatic escarpment offering breathtaking views of the ancient ocean floor and endless desert horizons.',
-                'long_description': 'The Edge of the World (Jebel Fihrayn) is one of Saudi Arabia\'s most spectacular natural wonders, featuring dramatic cliffs that drop 300 meters to reveal an ancient ocean bed. This geological marvel offers panoramic views that seem to extend to infinity across the desert plateau. The escarpment is part of the larger Tuwaiq Mountain range and features hiking trails, ancient fossils, and stunning sunset vistas. The site has become Saudi Arabia\'s most popular outdoor destination for adventure seekers and photographers.',
-                'facts': [
-                    'Dramatic 300-meter escarpment overlooking ancient ocean bed',
-                    'Part of 800-kilometer Tuwaiq Mountain range',
-                    'Located 90 km northwest of Riyadh',
-                    'Area was underwater millions of years ago',
-                    'Accessible by 4x4 vehicle or SUV',
-                    'Popular destination for hiking and camping',
-                    'Spectacular sunset and star-gazing location',
-                    'Ancient camel and trade routes visible below'
-                ],
-                'key_sites': [
-                    {'name': 'Main Viewpoint', 'slug': 'main-viewpoint', 'description': 'Iconic cliff edge with panoramic vistas', 'significance': 'Most photographed spot, dramatic photo opportunities'},
-                    {'name': 'Acacia Valley', 'slug': 'acacia-valley', 'description': 'Valley below with ancient acacia trees', 'significance': 'Hiking destination with shade and wildlife'},
-                    {'name': 'Fossil Sites', 'slug': 'fossil-sites', 'description': 'Ancient marine fossils in rock layers', 'significance': 'Evidence of prehistoric ocean'},
-                    {'name': 'Camel Trail', 'slug': 'camel-trail', 'description': 'Ancient trading route through desert', 'significance': 'Historical Bedouin pathways'}
-                ],
-                'entrance_fees': 'Free access. Tour operators charge for guided experiences (200-400 SAR per person).',
-                'opening_hours': 'Accessible 24/7. Best visited during daylight. Camping overnight permitted.',
-                'best_time': 'October to March for comfortable temperatures. Sunrise and sunset offer best lighting. Avoid June-August extreme heat.',
-                'how_to_get_there': '90 km northwest of Riyadh (1.5-hour drive). 4x4 or SUV recommended for unpaved desert road. Join tour or rent suitable vehicle. GPS coordinates essential.',
-                'what_to_wear': 'Comfortable outdoor clothing. Sturdy hiking shoes. Hat and sunglasses. Layers for temperature changes. Desert colors for photography.',
-                'visitor_tips': [
-                    'Rent 4x4 vehicle or join organized tour',
-                    'Bring plenty of water - no facilities available',
-                    'GPS coordinates critical for navigation',
-                    'Start early morning to avoid midday heat',
-                    'Sunset visits offer spectacular photography',
-                    'Overnight camping popular with permits',
-                    'Exercise extreme caution near cliff edges',
-                    'Pack out all trash - pristine environment',
-                    'Cell phone coverage limited - inform others of plans',
-                    'Bring binoculars for distant views'
-                ],
-                'discovery': 'Local Bedouins have known the escarpment for centuries as a landmark. Western explorers began documenting the area in the 20th century. The site gained popularity in the 2010s as Saudi Arabia opened to tourism. The name "Edge of the World" was coined due to the dramatic cliff and endless views. Growing social media attention made it Riyadh\'s top natural attraction. The government is developing infrastructure while preserving the site\'s wild character.',
-                'architecture': 'The Edge of the World is entirely natural geological formation. The Tuwaiq escarpment was formed 50 million years ago when tectonic shifts exposed ancient seabed. Horizontal rock layers reveal geological history. Erosion created the dramatic cliff face. Natural weathering sculpted unique rock formations. The plateau demonstrates Saudi Arabia\'s diverse geology beyond desert dunes.',
-                'cultural_impact': 'The Edge of the World symbolizes Saudi Arabia\'s natural beauty and adventure tourism potential. It attracts young Saudis embracing outdoor recreation culture. The site appears frequently in tourism marketing showcasing kingdom beyond cities. It represents Saudi Arabia\'s vast untouched landscapes. The destination fosters environmental appreciation and conservation awareness. International visitors discover Saudi Arabia\'s natural wonders.',
-                'conservation': 'The site remains largely undeveloped to preserve its natural state. Tour operators follow leave-no-trace principles. Camping requires permits to manage environmental impact. Efforts to prevent littering and damage. Future plans balance tourism development with conservation. The area is being considered for protected status. Education programs promote responsible tourism.',
-                'health_safety': 'Remote location requires careful preparation. Bring adequate water and emergency supplies. Stay well back from cliff edges - unstable rock. Summer heat dangerous - avoid midday. Inform others of travel plans - limited rescue access. First aid kit essential. Watch for scorpions and snakes. Suitable vehicle mandatory for terrain. Travel in groups recommended.',
-                'guided_tours': 'Tour operators offer 4x4 excursions from Riyadh. Sunset tours time arrival for optimal lighting. Camping tours include overnight desert experience. Photography tours focus on capturing dramatic landscapes. Adventure tours combine hiking and rock climbing. Group tours handle logistics and safety.',
-                'nearby_attractions': 'Ushaiger Heritage Village (80 km), Riyadh (90 km), Tuwaiq Escarpment Trail (continuous), Red Sand Dunes (120 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1473496169904-658ba7c44d8a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '25.0967° N, 45.6272° E',
-                'annual_visitors': 'Over 100,000',
-                'climate': 'Desert climate. Extreme heat May-September. Pleasant October-April. Large day/night temperature swings.'
-            },
-            'diriyah-at-turaif-district': {
-                'id': 'diriyah-at-turaif-district',
-                'name': 'Diriyah & At-Turaif District',
-                'location': 'Diriyah, Northwest of Riyadh',
-                'description': 'UNESCO World Heritage Site, birthplace of the first Saudi state and original capital, featuring restored Najdi architecture.',
-                'long_description': 'Diriyah, the ancestral home of the Saudi royal family, served as the capital of the first Saudi dynasty from 1744 to 1818. The At-Turaif District, inscribed as UNESCO World Heritage Site in 2010, showcases the finest example of Najdi architectural style with its distinctive mud-brick buildings, intricate geometric patterns, and triangular roof openings. This historical jewel is undergoing massive restoration to become a premier cultural destination, with museums, galleries, restaurants, and hotels bringing the ancient city back to life.',
-                'facts': [
-                    'UNESCO World Heritage Site since 2010',
-                    'Capital of first Saudi state (1744-1818)',
-                    'Birthplace of Saudi Arabia and Al Saud dynasty',
-                    'Features traditional Najdi mud-brick architecture',
-                    'Covers 175 hectares along Wadi Hanifah',
-                    'Major restoration project worth $60 billion',
-                    'Will feature museums, hotels, and cultural venues',
-                    'Named after local Turaif village'
-                ],
-                'key_sites': [
-                    {'name': 'Salwa Palace', 'slug': 'salwa-palace', 'description': 'Royal residence of first Saudi rulers', 'significance': 'Political and administrative center of the state'},
-                    {'name': 'At-Turaif Gate', 'slug': 'at-turaif-gate', 'description': 'Restored entrance to historical district', 'significance': 'Main access showcasing Najdi architecture'},
-                    {'name': 'Diriyah Museum', 'slug': 'diriyah-museum', 'description': 'Museum explaining Saudi history', 'significance': 'Chronicles foundation of Saudi state'},
-                    {'name': 'Najdi Houses', 'slug': 'najdi-houses', 'description': 'Traditional residential architecture', 'significance': 'Demonstrates traditional Gulf building methods'}
-                ],
-                'entrance_fees': 'Currently free during restoration. Future ticketing planned for museums.',
-                'opening_hours': 'Saturday-Thursday: 9:00 AM to 9:00 PM. Friday: 2:00 PM to 9:00 PM.',
-                'best_time': 'October to March for comfortable outdoor exploration. Evenings year-round when site is illuminated. Winter hosts cultural events and festivals.',
-                'how_to_get_there': '20 km northwest of Riyadh city center (30-minute drive). Taxi or ride-share widely available. Future metro station planned.',
-                'what_to_wear': 'Modest clothing respecting Saudi culture. Comfortable walking shoes. Hat and sun protection. Layers for air-conditioned buildings.',
-                'visitor_tips': [
-                    'Allow 2-3 hours to explore restored areas',
-                    'Visit Diriyah Museum for historical context',
-                    'Evening visits offer cooler temperatures and lighting',
-                    'Guided tours provide rich historical narratives',
-                    'Try traditional Najdi cuisine at restaurants',
-                    'Photography encouraged throughout site',
-                    'Combine with Wadi Hanifah nature walk',
-                    'Future developments will add entertainment venues',
-                    'Check Diriyah Season for special events',
-                    'Wheelchair accessible pathways'
-                ],
-                'discovery': 'Diriyah was established in 1446 by Mani\'al-Muraidi, ancestor of Saudi royal family. The alliance between Muhammad bin Saud and scholar Muhammad ibn Abd al-Wahhab in 1744 created the first Saudi state. Diriyah became capital until destroyed by Ottoman-Egyptian forces in 1818. The site remained ruins for nearly two centuries. UNESCO recognition in 2010 sparked massive restoration. The Diriyah Gate Development Authority launched transformation into major cultural destination.',
-                'architecture': 'At-Turaif exemplifies traditional Najdi architectural style using mud-brick construction. Buildings feature thick walls for insulation, small windows, triangular roof openings for ventilation, and decorative geometric patterns. The urban planning shows sophisticated understanding of desert climate. Palaces, mosques, and residential areas demonstrate social hierarchy. Restoration uses traditional materials and techniques. The architecture influenced Gulf building styles.',
-                'cultural_impact': 'Diriyah represents the birthplace of modern Saudi Arabia and the nation\'s cultural identity. The site connects contemporary Saudi society to its historical roots. UNESCO status elevated awareness of Saudi heritage globally. The restoration project signals Saudi commitment to preserving identity amid modernization. Diriyah has become symbol of Vision 2030\'s cultural pillar. The site attracts scholars studying Islamic and Arabian history.',
-                'conservation': 'Massive international effort restores At-Turaif using traditional Najdi techniques. Archaeologists and conservators work alongside local craftsmen. Original materials (mud-brick, palm wood) used in restoration. Digital documentation preserves site information. Conservation balances authenticity with visitor accessibility. Ongoing monitoring prevents deterioration. The project sets standards for Arabian heritage conservation.',
-                'health_safety': 'Well-maintained walkways throughout historical district. Modern safety standards integrated respectfully. First aid stations available. Security personnel patrol site. Summer heat managed through timing recommendations. Shaded areas and rest stops provided. Emergency services accessible. Construction areas clearly marked and secured.',
-                'guided_tours': 'Expert guides explain foundation of Saudi state and Najdi culture. Architecture tours focus on building techniques and restoration. Historical tours trace first Saudi dynasty events. School programs teach national heritage. Private tours offer personalized experiences. Arabic and English tours available.',
-                'nearby_attractions': 'Wadi Hanifah (adjacent), Riyadh City Center (20 km), King Abdulaziz Historical Center (25 km), Masmak Fortress (25 km).',
-                'photos': [
-                    'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-                ],
-                'coordinates': '24.7356° N, 46.5731° E',
-                'annual_visitors': 'Over 300,000 (rapidly growing)',
-                'climate': 'Desert climate. Very hot May-September. Pleasant October-April. Best visited November-February.'
-            },
-            'masmak-fortress': {
-                'id': 'masmak-fortress',
-                'name': 'Masmak Fortress',
-                'location': 'Riyadh, Saudi Arabia',
-                'description': 'Historic 1865 mud-brick fortress where the modern Saudi state was born in 1902.',
-                'long_description': 'Masmak Fortress is a monumental clay and mud-brick fortress in the heart of old Riyadh that played a pivotal role in the establishment of the modern Kingdom of Saudi Arabia. Built in 1865 during the reign of Abdullah bin Rashid, the fortress was the site of the legendary 1902 recapture led by King Abdulaziz Ibn Saud, marking the beginning of the unification of Saudi Arabia. The fortress\'s iconic mudbrick walls, watchtowers, and traditional Najdi architecture stand as powerful symbols of Saudi heritage.',
-                'facts': [
-                    'Built in 1865 during the reign of Abdullah bin Rashid',
-                    'Site of King Abdulaziz\'s legendary 1902 recapture of Riyadh',
-                    'Name means "thick, strong structure" in Arabic',
-                    'Made from mud-brick and clay with 18.5-meter-high walls',
-                    'Features four watchtowers and traditional Najdi architecture',
-                    'Spear mark still visible on main gate from 1902 battle',
-                    'Now houses museum of Saudi unification history',
-                    'Located in historic Al-Dirah district of old Riyadh',
-                ],
-                'key_sites': [
-                    {'name': 'Main Gate', 'description': 'Historic entrance with preserved spear mark from 1902 battle'},
-                    {'name': 'Central Courtyard', 'description': 'Open-air courtyard with traditional well'},
-                    {'name': 'Watchtowers', 'description': 'Four corner towers with panoramic views of old Riyadh'},
-                    {'name': 'Museum Halls', 'description': 'Exhibition rooms displaying weapons, photographs, and documents'},
-                ],
-                'entrance_fees': 'Free admission for all visitors',
-                'opening_hours': 'Saturday-Thursday: 8:00 AM - 12:00 PM and 4:00 PM - 9:00 PM. Friday: 4:00 PM - 9:00 PM.',
-                'best_time': 'November to March for pleasant weather. Early morning or late afternoon for photography.',
-                'how_to_get_there': 'Located in Al-Dirah neighborhood in central Riyadh. Easily accessible by taxi, Uber, or Careem.',
-                'what_to_wear': 'Conservative modest clothing required. Women should wear abaya. Comfortable walking shoes.',
-                'visitor_tips': [
-                    'Start with the introductory video to understand historical context',
-                    'Look for the famous spear mark on the main gate',
-                    'Climb the watchtowers for excellent views of old Riyadh',
-                    'Visit nearby Dira Souq for traditional shopping',
-                    'Photography allowed inside and outside',
-                    'Guided tours available in Arabic and English',
-                    'Allow 1-2 hours for exploration',
-                    'Evening visits offer atmospheric lighting',
-                    'Combine with visit to nearby Al-Murabba Palace',
-                    'Free WiFi available',
-                ],
-                'discovery': 'Built in 1865, the fortress gained legendary status when Abdulaziz Ibn Saud recaptured it on January 14, 1902, marking the beginning of Saudi Arabia unification.',
-                'architecture': 'Traditional Najdi fortress architecture with thick mud-brick walls, four corner watchtowers, central courtyard, mosque, majlis, and living quarters.',
-                'cultural_impact': 'Symbolizes the birth of modern Saudi Arabia. Appears on 100 riyal note. Central to Saudi national identity and heritage.',
-                'conservation': 'Extensively restored in 1980. Original mud-brick techniques used. Ongoing maintenance preserves structure.',
-                'health_safety': 'Well-maintained clean facility. Accessible pathways. First aid available. Security present. Stay hydrated.',
-                'guided_tours': 'Free guided tours available in Arabic and English. Audio guides. Educational programs. VR experiences of 1902 battle.',
-                'nearby_attractions': 'Dira Souq (2 min walk), Al-Murabba Palace (10 min drive), National Museum (15 min drive), Kingdom Centre (20 min drive)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1519817914152-22d216bb9170?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1558862107-d49ef2a04d72?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '24.6308° N, 46.7094° E',
-                'annual_visitors': '200,000+ visitors annually',
-                'climate': 'Extremely hot summers (May-Sept 45°C), mild winters (Nov-Feb 15-25°C). Best November-March.',
-            },
-            'kingdom-centre-tower': {
-                'id': 'kingdom-centre-tower',
-                'name': 'Kingdom Centre Tower',
-                'location': 'Riyadh, Saudi Arabia',
-                'description': 'Iconic 99-floor skyscraper with distinctive sky bridge and panoramic observation deck.',
-                'long_description': 'Kingdom Centre is Riyadh\'s most recognizable landmark, rising 302 meters with 99 floors. This architectural masterpiece is crowned by an inverted parabolic arch with a sky bridge that has become synonymous with Riyadh\'s modern skyline. Completed in 2002, the tower houses offices, luxury apartments, Four Seasons Hotel, and the Sky Bridge observation deck offering breathtaking 360-degree views across Riyadh.',
-                'facts': [
-                    'Height: 302 meters (992 feet) with 99 floors',
-                    'Completed in 2002, designed by Ellerbe Becket and Omrania',
-                    'Features iconic 65-meter-long sky bridge',
-                    'Third-tallest skyscraper in Saudi Arabia',
-                    'Houses Four Seasons Hotel Riyadh',
-                    'Sky Bridge observation deck at 300 meters',
-                    'Kingdom Centre Mall with 161 stores',
-                    'Cost approximately $458 million to build',
-                ],
-                'key_sites': [
-                    {'name': 'Sky Bridge Observation Deck', 'description': '99th floor panoramic viewing platform with 360-degree views'},
-                    {'name': 'Kingdom Centre Mall', 'description': 'Luxury shopping mall with international brands and fine dining'},
-                    {'name': 'Four Seasons Hotel', 'description': 'Five-star luxury hotel occupying floors 48-77'},
-                    {'name': 'The Grill Restaurant', 'description': 'Fine dining on 77th floor with city views'},
-                ],
-                'entrance_fees': 'Sky Bridge: Adults SAR 60-80 ($16-21), Children SAR 40-60 ($11-16). Mall entry free.',
-                'opening_hours': 'Sky Bridge: Daily 9:00 AM - 11:00 PM. Mall: Daily 9:30 AM - 11:30 PM.',
-                'best_time': 'Sunset visits for spectacular views (5:00-7:00 PM). Clear days for best visibility. Weekday mornings less crowded.',
-                'how_to_get_there': 'Located on King Fahad Road in Olaya district. Easily accessible by taxi, Uber, or Careem. Underground parking with 3,000 spaces.',
-                'what_to_wear': 'Smart casual for mall and observation deck. Conservative modest dress recommended. Comfortable shoes.',
-                'visitor_tips': [
-                    'Book Sky Bridge tickets online to skip queues',
-                    'Visit at sunset for best photography',
-                    'Security check required before Sky Bridge access',
-                    'Cameras and phones allowed on observation deck',
-                    'Combine with shopping at luxury mall',
-                    'Evening illumination spectacular from outside',
-                    'The Grill restaurant requires advance reservation',
-                    'Allow 1-2 hours for Sky Bridge and mall visit',
-                    'Friday-Saturday evenings very crowded',
-                    'Free WiFi throughout complex',
-                ],
-                'discovery': 'Developed by Prince Alwaleed bin Talal. Construction 1999-2002. Designed to be modern landmark symbolizing Saudi vision.',
-                'architecture': 'Distinctive inverted parabolic arch at top spanning 65 meters. Concrete core with steel frame. Reflective glass curtain walls.',
-                'cultural_impact': 'Symbol of modern Riyadh and Saudi economic transformation. Represents embrace of contemporary architecture.',
-                'conservation': 'State-of-the-art building management systems. Regular facade maintenance. Energy-efficient systems.',
-                'health_safety': 'Modern fire suppression systems. 24/7 security. Emergency medical facilities. Wheelchair accessible.',
-                'guided_tours': 'Self-guided visits with informational displays. Private group tours available. Multilingual staff.',
-                'nearby_attractions': 'Al Faisaliah Tower (5 min), National Museum (10 min), Riyadh Park Mall (10 min), Masmak Fortress (20 min)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1590856029826-c7a73142bbf1?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '24.7116° N, 46.6742° E',
-                'annual_visitors': '1+ million visitors annually',
-                'climate': 'Indoor climate-controlled year-round. Best outdoor photography November-March. Summer heat 40-45°C.',
-            },
-            'al-balad-jeddah': {
-                'id': 'al-balad-jeddah',
-                'name': 'Al-Balad (Historic Jeddah)',
-                'location': 'Jeddah, Saudi Arabia',
-                'description': 'UNESCO World Heritage old town with unique coral-stone architecture and vibrant souqs.',
-                'long_description': 'Al-Balad is the historic center of Jeddah and a UNESCO World Heritage Site preserving centuries of Arabian coastal architecture. Founded in the 7th century as gateway for pilgrims to Mecca, it flourished as a major Red Sea port. The district is renowned for distinctive tower houses built from coral stone, featuring elaborate wooden rawasheen (bay windows). Traditional souqs, historic mosques, merchant houses turned museums, art galleries, cafes, and restaurants fill the labyrinthine alleys.',
-                'facts': [
-                    'UNESCO World Heritage Site since 2014',
-                    'Founded in 7th century as gateway to Mecca',
-                    'Features 600+ heritage buildings with coral-stone architecture',
-                    'Traditional houses have distinctive wooden rawasheen',
-                    'Historic souqs date back hundreds of years',
-                    'Home to wealthy merchants from across Islamic world',
-                    'Features Bab Makkah, Bab Sharif historic gates',
-                    'Extensive restoration project ongoing since 2009',
-                ],
-                'key_sites': [
-                    {'name': 'Naseef House', 'description': '1872 merchant house with 106 rooms, now cultural museum'},
-                    {'name': 'Traditional Souqs', 'description': 'Historic markets selling spices, textiles, perfumes, and crafts'},
-                    {'name': 'Bab Makkah (Mecca Gate)', 'description': 'Ancient city gate, historical departure point for Mecca pilgrims'},
-                    {'name': 'Historic Mosques', 'description': 'Al-Shafi\'i Mosque and other ancient mosques'},
-                ],
-                'entrance_fees': 'Free to explore streets and souqs. Museums SAR 10-20 ($3-5).',
-                'opening_hours': 'Streets 24/7. Souqs: 9:00 AM - 12:00 PM and 4:00 PM - 11:00 PM. Museums vary.',
-                'best_time': 'November to March. Evening visits (5:00-10:00 PM) when streets come alive. Ramadan evenings special.',
-                'how_to_get_there': 'Located in central Jeddah near Red Sea Corniche. Accessible by taxi, Uber, or Careem. Limited parking.',
-                'what_to_wear': 'Conservative modest clothing. Women should cover shoulders and knees. Men long trousers. Comfortable shoes.',
-                'visitor_tips': [
-                    'Start at Naseef House for orientation',
-                    'Hire local guide to discover hidden gems',
-                    'Visit both morning and evening for different atmospheres',
-                    'Try traditional Hijazi cuisine',
-                    'Haggle politely when shopping in souqs',
-                    'Look up to appreciate intricate rawasheen woodwork',
-                    'Photography welcomed but ask permission for people',
-                    'Allow 3-4 hours minimum for thorough exploration',
-                    'Combine with Jeddah Corniche visit',
-                    'Many buildings still under restoration',
-                ],
-                'discovery': 'Historic heart since 7th century when Caliph Uthman designated it as port for pilgrims to Mecca. Flourished for centuries as merchant hub.',
-                'architecture': 'Unique tower houses (5-7 floors) built from coral stone. Distinctive rawasheen (wooden bay windows) provide ventilation and shade.',
-                'cultural_impact': 'Represents cosmopolitan character of Jeddah as meeting point of cultures from Africa, Arabia, and Asia. Symbol of Gateway to Mecca.',
-                'conservation': 'Major restoration since 2009. Over 500 historic buildings identified. Traditional coral-stone techniques being revived.',
-                'health_safety': 'Safe well-patrolled area. Watch footing on uneven cobblestones. Stay hydrated. Some restoration areas fenced.',
-                'guided_tours': 'Official tours from Jeddah tourism office. Private heritage tours. Walking tours. Cultural workshops. Special Ramadan tours.',
-                'nearby_attractions': 'Jeddah Corniche (5 min), King Fahd Fountain (10 min), Floating Mosque (10 min), Red Sea Mall (15 min)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1591608971362-f08b2a75731a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578895101408-1a36b834405b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '21.4858° N, 39.1925° E',
-                'annual_visitors': '300,000+ visitors annually and growing',
-                'climate': 'Hot and humid year-round. Summer (May-Oct) very hot (32-42°C) with humidity. Winter (Nov-April) pleasant (20-30°C).',
-            },
-            'jeddah-corniche': {
-                'id': 'jeddah-corniche',
-                'name': 'Jeddah Corniche',
-                'location': 'Jeddah, Saudi Arabia',
-                'description': 'Stunning 30km Red Sea waterfront promenade with beaches, parks, sculptures, and city views.',
-                'long_description': 'The Jeddah Corniche is one of the longest and most beautiful waterfront promenades in the world, stretching 30 kilometers along the Red Sea coast. This scenic coastal resort area combines pristine beaches, lush parks, outdoor sculptures, restaurants, cafes, and recreational facilities with spectacular views across the turquoise waters of the Red Sea. The Corniche includes the famous King Fahd Fountain (the world\'s tallest), multiple beaches, the Floating Mosque, Al-Rahmah Mosque, and numerous outdoor art installations. It\'s the social heart of Jeddah where families gather, joggers run, cyclists ride, and visitors enjoy the sea breeze and sunset views.',
-                'facts': [
-                    'Stretches 30 kilometers along Red Sea coast',
-                    'Features King Fahd Fountain - world\'s tallest fountain',
-                    'Includes multiple public beaches and swimming areas',
-                    'Home to over 400 outdoor sculptures and art installations',
-                    'Al-Rahmah (Floating) Mosque built on water',
-                    'Popular for walking, jogging, cycling, and family picnics',
-                    'Extensive landscaping with palm trees and green spaces',
-                    'Recently renovated with modern facilities and lighting',
-                ],
-                'key_sites': [
-                    {'name': 'King Fahd Fountain', 'description': 'World\'s tallest fountain shooting water 312 meters high, illuminated at night with colored lights'},
-                    {'name': 'Al-Rahmah Mosque (Floating Mosque)', 'description': 'Beautiful mosque appearing to float on Red Sea, especially stunning at sunset'},
-                    {'name': 'Corniche Beaches', 'description': 'Multiple public beaches with swimming, water sports, and family facilities'},
-                    {'name': 'Sculpture Park', 'description': 'Outdoor museum with over 400 contemporary sculptures by international artists'},
-                ],
-                'entrance_fees': 'Free access to Corniche, parks, and most beaches. Some private beach clubs charge fees.',
-                'opening_hours': 'Open 24/7, though most active in evenings and weekends. Restaurants and cafes have varying hours.',
-                'best_time': 'November to March for pleasant weather. Sunset time (5:00-7:00 PM) most beautiful. Friday-Saturday evenings most lively.',
-                'how_to_get_there': 'Located along the western coast of Jeddah. Easily accessible from any part of the city by taxi, Uber, or Careem. Multiple parking areas along the Corniche.',
-                'what_to_wear': 'Casual comfortable clothing. Modest swimwear for beaches. Women should cover shoulders and knees in public areas. Comfortable shoes for walking.',
-                'visitor_tips': [
-                    'Visit at sunset for spectacular Red Sea views',
-                    'Bring camera for King Fahd Fountain and Floating Mosque',
-                    'Rent bicycles available along the Corniche',
-                    'Try street food and local snacks from vendors',
-                    'Visit during weekdays for less crowded experience',
-                    'Explore different sections - each has unique character',
-                    'Floating Mosque beautiful for photography at sunset',
-                    'Bring picnic to enjoy in waterfront parks',
-                    'Evening fountain shows with colored lights',
-                    'Combine with visit to nearby Red Sea Mall',
-                ],
-                'discovery': 'The Corniche has been developed over several decades, with major expansions in the 1980s and comprehensive renovation in 2017. It transformed Jeddah\'s waterfront into a world-class public space.',
-                'architecture': 'The Corniche features modern urban design with wide pedestrian walkways, landscaped parks, contemporary lighting, seating areas, and play spaces. Al-Rahmah Mosque showcases beautiful Islamic architecture appearing to float on the sea.',
-                'cultural_impact': 'The Corniche is Jeddah\'s social and recreational heart, representing the city\'s cosmopolitan character and connection to the Red Sea. It\'s where locals and visitors alike gather for leisure, exercise, and family time.',
-                'conservation': 'Ongoing maintenance and improvement projects. Environmental protection of Red Sea coastal ecosystem. Regular cleaning and beautification. Sustainable urban design principles applied in recent renovations.',
-                'health_safety': 'Well-lit and patrolled area with security presence. Lifeguards at public beaches. First aid stations. Clean well-maintained facilities. Stay hydrated in warm weather. Follow beach safety flags and warnings.',
-                'guided_tours': 'Walking and cycling tours available. Boat tours along the coast. Evening tours focusing on art sculptures. Photography tours at sunset.',
-                'nearby_attractions': 'Al-Balad Historic District (10 min), Red Sea Mall (5-15 min), Jeddah Aquarium (along Corniche), King Fahd Park (10 min)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1584464491033-06628f3a6b7b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1582407947304-fd86f028f716?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '21.5169° N, 39.1748° E',
-                'annual_visitors': 'Millions annually - Jeddah\'s most visited public space',
-                'climate': 'Hot humid Red Sea climate. Summer (May-Oct) very hot (32-42°C/90-108°F). Winter (Nov-April) pleasant (20-30°C/68-86°F). Best November-March. Sea breeze provides some cooling.',
-            },
-            'al-ahsa-oasis': {
-                'id': 'al-ahsa-oasis',
-                'name': 'Al Ahsa Oasis',
-                'location': 'Al-Ahsa, Eastern Province, Saudi Arabia',
-                'description': 'UNESCO World Heritage Site - world\'s largest oasis with 2.5 million date palms.',
-                'long_description': 'Al Ahsa Oasis is an extraordinary UNESCO World Heritage Site and the world\'s largest self-contained oasis, covering 85.4 square kilometers with approximately 2.5 to 3 million date palm trees. This ancient oasis has been continuously inhabited for over 6,000 years and represents an exceptional example of human interaction with the environment in a desert setting. Fed by natural springs producing 370 liters per second, the oasis includes traditional irrigation systems (qanats), historic settlements, archaeological sites, date palm groves, gardens producing the finest dates in Arabia, and important cultural heritage. Visitors can explore traditional villages, ancient irrigation canals, historic forts, vibrant souqs, and experience authentic Arabian oasis life.',
-                'facts': [
-                    'UNESCO World Heritage Site since 2018',
-                    'World\'s largest self-contained oasis - 85.4 sq km',
-                    'Contains 2.5-3 million date palm trees',
-                    'Fed by over 60 natural artesian springs',
-                    'Continuously inhabited for over 6,000 years',
-                    'Ancient qanat irrigation system still functioning',
-                    'Produces over 100 varieties of dates',
-                    'Home to historic villages, forts, and souqs',
-                ],
-                'key_sites': [
-                    {'name': 'Qaisariah Souq', 'description': 'Historic covered market dating to 1822, selling dates, spices, handicrafts, and traditional goods'},
-                    {'name': 'Ibrahim Palace', 'description': 'Ottoman-era fort and palace, impressive example of traditional architecture'},
-                    {'name': 'Yellow Lake (Asfar Lake)', 'description': 'Natural desert lake with unique yellow-tinged water, popular for picnics'},
-                    {'name': 'Jawatha Mosque', 'description': 'One of the oldest mosques in Saudi Arabia, built in 629 CE'},
-                ],
-                'entrance_fees': 'Most sites free. Some museums and historic buildings SAR 10-20 ($3-5).',
-                'opening_hours': 'Oasis accessible anytime. Museums and historic sites: Usually 8:00 AM - 8:00 PM. Souqs: Morning and late afternoon/evening.',
-                'best_time': 'November to March for pleasant weather. Date harvest season (summer) interesting but very hot. Spring brings fresh greenery.',
-                'how_to_get_there': 'Located 150 km southwest of Dammam, 320 km from Riyadh. Accessible by car (Highway 40). Al Ahsa Airport has domestic flights. Local transportation available within oasis.',
-                'what_to_wear': 'Light comfortable clothing for hot weather. Conservative modest dress. Comfortable walking shoes. Sun protection essential. Bring hat and sunscreen.',
-                'visitor_tips': [
-                    'Hire local guide to discover hidden corners and history',
-                    'Visit traditional date farms to see cultivation methods',
-                    'Try different date varieties at Qaisariah Souq',
-                    'Explore traditional villages with mud-brick houses',
-                    'Visit ancient irrigation canals (falaj/qanat system)',
-                    'Don\'t miss Ibrahim Palace and its museum',
-                    'Yellow Lake beautiful at sunset',
-                    'Sample traditional Al Ahsa cuisine',
-                    'Allow full day or two to explore properly',
-                    'Combine with visit to nearby Hofuf city',
-                ],
-                'discovery': 'Al Ahsa has been inhabited since at least 6,000 years ago. It was an important stop on ancient trade routes and pilgrimage paths. The oasis developed sophisticated irrigation systems and became a major date-producing region. UNESCO recognition in 2018 highlighted its outstanding universal value as an evolving cultural landscape.',
-                'architecture': 'The oasis features traditional mud-brick and stone buildings adapted to desert climate. Ibrahim Palace showcases Ottoman-era military architecture. Traditional houses use thick walls, small windows, and courtyards for cooling. Historic irrigation canals (qanats/falaj) demonstrate ancient engineering. Mosques reflect various periods of Islamic architecture.',
-                'cultural_impact': 'Al Ahsa represents 6,000 years of human adaptation to desert environments. It preserves traditional Arabian oasis life, date cultivation, and sustainable water management. The oasis has been vital for trade, agriculture, and as a stop for Mecca pilgrims. It maintains strong cultural traditions and crafts.',
-                'conservation': 'UNESCO protection since 2018. Government programs preserve historic buildings, irrigation systems, and agricultural practices. Sustainable tourism development balancing preservation with access. Protection of natural springs and water resources. Revival of traditional date cultivation methods.',
-                'health_safety': 'Generally safe area with good facilities. Stay hydrated especially in summer heat. Sun protection essential. Watch for uneven ground in palm groves and historic sites. Medical facilities available in Al Hofuf city nearby. Respect private property in residential areas.',
-                'guided_tours': 'Guided tours available from Al Ahsa tourism office. Heritage tours of historic sites. Agricultural tours of date farms. Traditional life and culture tours. Culinary tours featuring local dates and cuisine.',
-                'nearby_attractions': 'Ibrahim Palace (in oasis), Yellow Lake (15 km), Jawatha Mosque (ancient), Hofuf city (adjacent), Qara Mountain caves (20 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1586724237569-f3d0c1dee8c6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1601024445121-e5b82f020549?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '25.3608° N, 49.5856° E',
-                'annual_visitors': '400,000+ visitors annually and growing since UNESCO designation',
-                'climate': 'Desert climate. Extremely hot summer (May-Sept reaching 45°C/113°F). Pleasant winter (Nov-March 15-25°C/59-77°F). Best visited November-March. Humidity can be high due to springs and vegetation.',
-            },
-            'taif': {
-                'id': 'taif',
-                'name': 'Taif',
-                'location': 'Makkah Province, Saudi Arabia',
-                'description': 'Mountain city known as "City of Roses" - summer retreat with gardens, souqs, and cool climate.',
-                'long_description': 'Taif is a beautiful mountain city situated at 1,700 meters elevation in the Sarawat Mountains, earning it the nickname "City of Roses" for its famous rose gardens that produce rose water and perfumes. As Saudi Arabia\'s unofficial summer capital, Taif offers a refreshing escape from the desert heat with its cool climate, lush gardens, fruit orchards (especially grapes, pomegranates, and figs), and historic sites. The city has been a favorite retreat for centuries, known for its Taif roses, honey, traditional souqs, cable car to Al Hada mountain, scenic landscapes, and as the birthplace of many important historical events in Islamic history.',
-                'facts': [
-                    'Located at 1,700 meters elevation in Sarawat Mountains',
-                    'Known as "City of Roses" for famous rose farms',
-                    'Saudi Arabia\'s unofficial summer capital',
-                    'Famous for Taif roses producing rose water and perfumes',
-                    'Cool climate with temperatures 10-15°C lower than lowlands',
-                    'Important Islamic historical site',
-                    'Cable car to Al Hada mountain resort area',
-                    'Famous for honey, fruits (grapes, pomegranates, figs), and roses',
-                ],
-                'key_sites': [
-                    {'name': 'Al Rudaf Park Rose Gardens', 'description': 'Extensive rose gardens where famous Taif roses are cultivated, especially beautiful in spring'},
-                    {'name': 'Al Hada Mountain & Cable Car', 'description': 'Scenic mountain area with cable car offering spectacular views over escarpment'},
-                    {'name': 'Shubra Palace', 'description': 'Beautiful historic palace built in 1905, now museum of Taif heritage'},
-                    {'name': 'Souq Okaz', 'description': 'Reconstructed ancient market famous for pre-Islamic poetry competitions, annual cultural festival'},
-                ],
-                'entrance_fees': 'Most parks free. Shubra Palace Museum SAR 10 ($3). Cable car SAR 50-70 ($13-19) round trip.',
-                'opening_hours': 'Parks generally 8:00 AM - 10:00 PM. Museums: 8:00 AM - 8:00 PM. Souqs: Morning and evening. Cable car: 9:00 AM - 9:00 PM.',
-                'best_time': 'Spring (March-May) for rose blooming season. Summer (June-Sept) for cool mountain weather. Souq Okaz Festival annually in summer.',
-                'how_to_get_there': 'Located 150 km southeast of Jeddah, 160 km southeast of Mecca. Accessible by road from Jeddah (1.5 hours), Mecca (1.5 hours), or Riyadh (6 hours). Ta\'if Regional Airport has domestic flights.',
-                'what_to_wear': 'Layered clothing for mountain climate - cooler than lowlands. Conservative modest dress. Comfortable walking shoes for parks and mountains. Light jacket for evenings and cable car.',
-                'visitor_tips': [
-                    'Visit during rose season (March-May) to see harvest',
-                    'Take cable car to Al Hada for spectacular views',
-                    'Visit rose farms to see distillation process',
-                    'Buy authentic Taif rose water and perfumes',
-                    'Try local honey - among finest in Arabia',
-                    'Sample fresh fruits from mountain orchards',
-                    'Visit Shubra Palace for historical context',
-                    'Explore traditional souqs for local products',
-                    'Attend Souq Okaz Festival if visiting in summer',
-                    'Allow 2-3 days to explore city and surroundings',
-                ],
-                'discovery': 'Taif has been inhabited for over 2,000 years. It played important role in early Islamic history. The city has long been a summer retreat due to its cool mountain climate. Rose cultivation became famous in Ottoman times. Modern development as tourism destination accelerated in recent decades.',
-                'architecture': 'Traditional Hijazi mountain architecture with stone buildings. Shubra Palace exemplifies early 20th-century royal architecture blending Islamic and Roman styles. Traditional houses with thick stone walls for insulation. Modern villas dot the mountainsides. Historic forts and watchtowers.',
-                'cultural_impact': 'Taif holds special place in Islamic history. The annual Souq Okaz Festival celebrates pre-Islamic Arabian poetry and culture. The city represents Saudi mountain culture distinct from desert regions. Rose cultivation and honey production are cultural traditions. Popular domestic tourism destination.',
-                'conservation': 'Heritage sites like Shubra Palace and historic mosques preserved. Rose cultivation traditions maintained. Sustainable tourism development in mountain areas. Protection of agricultural heritage. Souq Okaz historical site reconstruction project.',
-                'health_safety': 'Safe city with good facilities. Mountain roads well-maintained but drive carefully. Cable car meets international safety standards. Altitude generally not an issue at 1,700m. Medical facilities available. Stay hydrated. Weather can change quickly in mountains.',
-                'guided_tours': 'City tours available from hotels and tourism offices. Rose farm tours during blooming season. Mountain and nature tours. Historical and cultural tours. Souq Okaz guided experiences. Cable car and Al Hada area tours.',
-                'nearby_attractions': 'Al Hada mountain resort (20 km), Al Shafa village (25 km), Souq Okaz historic site (40 km), Mecca (160 km), Jeddah (150 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1585421514738-01798e348b17?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1605649487212-47bdab064df7?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '21.2703° N, 40.4150° E',
-                'annual_visitors': '500,000+ visitors annually, especially during summer months',
-                'climate': 'Mountain climate 10-15°C cooler than lowlands. Summer (June-Sept) pleasant 20-30°C/68-86°F. Winter (Dec-Feb) cool to mild 8-20°C/46-68°F. Spring best for roses. Occasional winter rain.',
-            },
-            'national-museum-riyadh': {
-                'id': 'national-museum-riyadh',
-                'name': 'National Museum of Saudi Arabia',
-                'location': 'Riyadh, Saudi Arabia',
-                'description': 'Magnificent museum chronicling Arabian Peninsula history from prehistory to modern kingdom.',
-                'long_description': 'The National Museum of Saudi Arabia in Riyadh is the country\'s premier cultural institution, offering a comprehensive journey through the Arabian Peninsula\'s rich history from prehistoric times to the present day. Opened in 1999 as part of the King Abdulaziz Historical Centre, the striking modern building houses eight chronologically arranged galleries filled with artifacts, interactive displays, models, and multimedia presentations. The collection spans over 3,700 artifacts including ancient stone tools, pre-Islamic inscriptions, Islamic manuscripts, traditional costumes, and exhibits on the unification of Saudi Arabia. The museum provides essential context for understanding Saudi culture, Islamic civilization, and the kingdom\'s heritage.',
-                'facts': [
-                    'Opened in 1999 as part of King Abdulaziz Historical Centre',
-                    'Features 8 main galleries in chronological order',
-                    'Over 3,700 artifacts and exhibits',
-                    'Covers Arabian history from Stone Age to modern era',
-                    'Award-winning contemporary architecture',
-                    'Interactive displays and multimedia presentations',
-                    'Extensive Islamic civilization exhibits',
-                    'Houses important pre-Islamic Arabian artifacts',
-                ],
-                'key_sites': [
-                    {'name': 'Man and Universe Gallery', 'description': 'Creation, geology, and early human history'},
-                    {'name': 'Arabian Kingdoms Gallery', 'description': 'Pre-Islamic civilizations and ancient kingdoms'},
-                    {'name': 'Prophet Muhammad Gallery', 'description': 'Life of the Prophet and early Islamic era'},
-                    {'name': 'First & Second Saudi States Galleries', 'description': 'Unification of Saudi Arabia and kingdom history'},
-                ],
-                'entrance_fees': 'Adults SAR 10 ($3), Students and children free',
-                'opening_hours': 'Saturday-Thursday: 8:00 AM - 8:00 PM. Friday: 4:00 PM - 8:00 PM.',
-                'best_time': 'Weekday mornings less crowded. Allow 2-3 hours for comprehensive visit.',
-                'how_to_get_there': 'Located in King Abdulaziz Historical Centre, Al-Murabba district, Riyadh. Accessible by taxi, Uber, or Careem. Ample parking available.',
-                'what_to_wear': 'Conservative modest clothing. Women should wear abaya. Comfortable shoes for walking through galleries.',
-                'visitor_tips': [
-                    'Start with introductory film for context',
-                    'Follow galleries in chronological order',
-                    'Allow minimum 2-3 hours for thorough visit',
-                    'Audio guides available in multiple languages',
-                    'Photography allowed without flash',
-                    'Combine with other Historical Centre attractions',
-                    'Museum shop has quality books and souvenirs',
-                    'Café on-site for refreshments',
-                    'Wheelchair accessible throughout',
-                    'Educational programs and temporary exhibitions',
-                ],
-                'discovery': 'Opened in 1999 as centerpiece of King Abdulaziz Historical Centre celebrating Saudi centennial. Designed by Canadian architect Raymond Moriyama.',
-                'architecture': 'Contemporary design with crescent-shaped facade. Interior spaces flow chronologically through history. Natural lighting and modern display techniques.',
-                'cultural_impact': 'Premier cultural institution presenting comprehensive Saudi and Arabian history. Essential for understanding kingdom\'s heritage and identity.',
-                'conservation': 'Climate-controlled environment protects artifacts. Professional conservation lab. International museum standards.',
-                'health_safety': 'Modern facility with all amenities. First aid available. Security present. Accessible for all visitors.',
-                'guided_tours': 'Guided tours in Arabic and English. School programs. Special exhibitions. Audio guides available.',
-                'nearby_attractions': 'Murabba Palace (adjacent), Masmak Fortress (5 min drive), Kingdom Centre (15 min drive)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1565084888279-aca607ecce6c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1582407947304-fd86f028f716?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '24.6478° N, 46.7094° E',
-                'annual_visitors': '300,000+ annually',
-                'climate': 'Indoor climate-controlled year-round. Best visited November-March when outdoor Riyadh weather pleasant.',
-            },
-            'farasan-islands': {
-                'id': 'farasan-islands',
-                'name': 'Farasan Islands',
-                'location': 'Jizan Region, Saudi Arabia',
-                'description': 'Pristine Red Sea archipelago with coral reefs, wildlife, and traditional architecture.',
-                'long_description': 'The Farasan Islands are a stunning archipelago of over 170 islands in the Red Sea off Saudi Arabia\'s southern coast, renowned for their pristine coral reefs, rich marine life, and unique cultural heritage. The largest island, Farasan Al-Kabir, hosts the main settlement with traditional coral-stone architecture and historic Ottoman buildings. These protected islands are a paradise for diving, snorkeling, birdwatching, and nature lovers, featuring abundant marine life including dolphins, dugongs, sea turtles, and over 230 bird species including flamingos and ospreys. The crystal-clear turquoise waters, white sandy beaches, mangroves, and unspoiled natural beauty make Farasan a hidden gem for eco-tourism.',
-                'facts': [
-                    'Archipelago of over 170 islands in Red Sea',
-                    'Part of Farasan Marine Sanctuary - protected area',
-                    'Home to endangered Arabian gazelles',
-                    'Over 230 bird species including flamingos',
-                    'Pristine coral reefs with 200+ coral species',
-                    'Marine life includes dolphins, dugongs, sea turtles',
-                    'Traditional Ottoman-era coral-stone buildings',
-                    'Accessible only by ferry or boat from Jizan',
-                ],
-                'key_sites': [
-                    {'name': 'Al-Qassar Bay', 'description': 'Beautiful beach with excellent snorkeling and swimming'},
-                    {'name': 'German House (Al-Refai House)', 'description': 'Historic Ottoman building showcasing coral-stone architecture'},
-                    {'name': 'Farasan Protected Wildlife Area', 'description': 'Home to endangered Arabian gazelles and diverse birdlife'},
-                    {'name': 'Coral Reefs', 'description': 'Pristine diving and snorkeling sites with vibrant marine life'},
-                ],
-                'entrance_fees': 'Island access free. Diving/snorkeling tours vary. Protected area permits may apply.',
-                'opening_hours': 'Islands accessible anytime. Ferry schedule varies - check locally.',
-                'best_time': 'October to April for best weather and diving. Winter (Nov-Feb) ideal. Summer very hot.',
-                'how_to_get_there': 'Ferry from Jizan port (90 min crossing). Ferries run 2-3 times daily. Private boat charters available. No road access.',
-                'what_to_wear': 'Light comfortable clothing for hot climate. Modest swimwear. Sun protection essential. Comfortable shoes for island exploration.',
-                'visitor_tips': [
-                    'Book ferry tickets in advance especially weekends',
-                    'Bring cash - limited ATMs on islands',
-                    'Arrange accommodation in advance - limited options',
-                    'Snorkeling and diving equipment rentals available',
-                    'Respect marine protected area regulations',
-                    'Best birdwatching November-March migration season',
-                    'Visit traditional fish souq in main village',
-                    'Explore historic coral-stone buildings',
-                    'Bring sun protection and stay hydrated',
-                    'Multi-day visit recommended to explore properly',
-                ],
-                'discovery': 'Inhabited for millennia, islands were important stop on ancient trade routes. Ottoman presence visible in historic buildings. Protected status since 1989.',
-                'architecture': 'Traditional houses built from coral stone. Historic Ottoman buildings including German House. Vernacular architecture adapted to island life.',
-                'cultural_impact': 'Traditional fishing communities maintain island lifestyle. Important for marine conservation. Growing eco-tourism destination.',
-                'conservation': 'Farasan Marine Sanctuary protects marine ecosystems. Protected area for endangered Arabian gazelles. Coral reef conservation programs.',
-                'health_safety': 'Basic medical facilities on main island. Follow marine safety guidelines. Stay hydrated. Sun protection essential. Respect marine life.',
-                'guided_tours': 'Diving and snorkeling tours available. Wildlife watching tours. Historical tours of main island. Boat tours around archipelago.',
-                'nearby_attractions': 'Jizan city and waterfront (ferry connection), Wadi Jizan dam (Jizan), Fifa Mountains (Jizan region)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1559827260-dc66d52bef19?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1583212292454-1fe6229603b7?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '16.7011° N, 42.1167° E',
-                'annual_visitors': '50,000+ visitors annually (growing eco-tourism)',
-                'climate': 'Hot humid Red Sea climate year-round. Summer (May-Sept) very hot 35-42°C/95-108°F. Winter (Nov-March) warm and pleasant 25-30°C/77-86°F. Best October-April.',
-            },
-            'abha': {
-                'id': 'abha',
-                'name': 'Abha',
-                'location': 'Asir Province, Saudi Arabia',
-                'description': 'Mountain resort city with cable car, cool climate, and stunning highland landscapes.',
-                'long_description': 'Abha is the capital of Asir Province and Saudi Arabia\'s highest city at 2,200 meters elevation, offering a dramatically different landscape from the rest of the kingdom. Nestled in the lush Asir Mountains with cool climate, frequent mists, and occasional rain, Abha is known for its stunning mountain scenery, terraced farms, traditional villages with distinctive architecture, and the spectacular Green Mountain cable car. The city serves as gateway to exploring Asir\'s unique Sarat Mountains culture, with its colorful flower-adorned architecture, weekly markets, and highland traditions distinct from the rest of Arabia.',
-                'facts': [
-                    'Highest city in Saudi Arabia at 2,200 meters elevation',
-                    'Capital of Asir Province in Sarat Mountains',
-                    'Cool climate with occasional rain and mist',
-                    'Famous Green Mountain with illuminated facade and cable car',
-                    'Traditional Asiri architecture with colorful decorations',
-                    'Gateway to Asir National Park',
-                    'Terraced farming and juniper forests',
-                    'Popular domestic summer resort destination',
-                ],
-                'key_sites': [
-                    {'name': 'Green Mountain (Al-Soudah)', 'description': 'Illuminated mountain with cable car offering panoramic views'},
-                    {'name': 'Asir National Park', 'description': 'Protected area with hiking, camping, juniper forests, and wildlife'},
-                    {'name': 'Al-Muftaha Village', 'description': 'Arts village in renovated traditional buildings with galleries and workshops'},
-                    {'name': 'Habala Village', 'description': 'Historic cliffside village accessed by cable car'},
-                ],
-                'entrance_fees': 'City access free. Cable car SAR 25-40 ($7-11). National Park entry SAR 10-20 ($3-5). Museums vary.',
-                'opening_hours': 'City accessible anytime. Cable car: 4:00 PM - midnight. Parks and museums vary.',
-                'best_time': 'March-October for pleasant weather. Summer (June-August) most popular. Winter (Dec-Feb) cool, occasional rain.',
-                'how_to_get_there': 'Abha Regional Airport has flights from major Saudi cities. By road: 850 km from Riyadh (9 hours), 600 km from Jeddah (7 hours). Mountain roads scenic but winding.',
-                'what_to_wear': 'Layered clothing for mountain climate. Light jacket or sweater even in summer. Conservative modest dress. Comfortable hiking shoes for nature trails.',
-                'visitor_tips': [
-                    'Take cable car to Green Mountain for sunset views',
-                    'Explore traditional Tuesday Market (Souq al-Thlatha)',
-                    'Visit Al-Muftaha Arts Village for local crafts',
-                    'Drive scenic Al-Soudah Pass (highest point in Saudi)',
-                    'Try traditional Asiri cuisine',
-                    'Look for colorful traditional architecture',
-                    'Visit nearby villages for authentic mountain culture',
-                    'Asir National Park excellent for hiking and nature',
-                    'Bring camera for stunning mountain landscapes',
-                    'Allow 2-3 days to explore Abha and surroundings',
-                ],
-                'discovery': 'Ancient settlement in Asir highlands. Historically distinct from central Arabian culture. Developed as modern resort city in recent decades.',
-                'architecture': 'Unique Asiri architecture with multi-story stone buildings, colorful geometric decorations, and slate roofs. Traditional houses adorned with flowers and plants.',
-                'cultural_impact': 'Represents unique Asiri highland culture distinct from rest of Arabia. Growing domestic tourism destination showcasing Saudi regional diversity.',
-                'conservation': 'Asir National Park protects mountain ecosystems. Preservation of traditional villages and architecture. Sustainable tourism development.',
-                'health_safety': 'Modern facilities and medical services. Mountain driving requires caution. Weather can change quickly. Altitude generally not an issue.',
-                'guided_tours': 'City tours available. Mountain and nature tours. Cultural tours of traditional villages. Hiking and eco-tours in national park.',
-                'nearby_attractions': 'Al-Soudah Peak (highest in Saudi, 20 km), Habala Village (cliff village, 50 km), Rijal Almaa village (60 km), Asir National Park (throughout region)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1580674285054-bed31e145f59?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1609137144813-7d9921338f24?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '18.2164° N, 42.5053° E',
-                'annual_visitors': '600,000+ visitors annually (summer peak)',
-                'climate': 'Mountain climate. Summer (June-Sept) mild 20-25°C/68-77°F. Winter (Dec-Feb) cool 10-18°C/50-64°F. Occasional rain year-round. Best March-October.',
-            }
-        },
-        'kuwait': {
-            'kuwait-towers': {
-                'id': 'kuwait-towers',
-                'name': 'Kuwait Towers',
-                'location': 'Kuwait City, Kuwait',
-                'description': 'Iconic trio of towers symbolizing modern Kuwait with observation deck and revolving restaurant.',
-                'long_description': 'The Kuwait Towers are the most iconic landmarks of Kuwait, instantly recognizable symbols of the nation\'s modernity and prosperity. Completed in 1979, these three distinctive towers designed by Swedish architects represent water towers but serve multiple functions. The Main Tower rises 187 meters and features two spheres - the lower houses a rotating observation deck and restaurant offering 360-degree panoramic views of Kuwait City and the Arabian Gulf, while the upper sphere stores water. The middle tower (147m) also serves as a water reservoir, and the smallest tower (113m) contains equipment. The towers\' futuristic design with colored ceramic discs in turquoise, blue, and green has made them an enduring symbol of Kuwait.',
-                'facts': [
-                    'Completed in 1979, designed by Swedish architects',
-                    'Main Tower: 187 meters tall with two spheres',
-                    'Middle Tower: 147 meters, Smallest: 113 meters',
-                    'Rotating observation deck completes 360° in 30 minutes',
-                    'Upper sphere can hold 4,500 cubic meters of water',
-                    'Decorated with 41,000 colored ceramic discs',
-                    'Survived Iraqi invasion in 1990-91 with bullet damage',
-                    'National landmark appearing on Kuwaiti currency',
-                ],
-                'key_sites': [
-                    {'name': 'Observation Deck', 'description': 'Rotating platform at 120m height with panoramic views of Kuwait City and Arabian Gulf'},
-                    {'name': 'Horizon Restaurant', 'description': 'Fine dining revolving restaurant with international cuisine and stunning views'},
-                    {'name': 'Reception Hall', 'description': 'Lower sphere with café and exhibition space'},
-                    {'name': 'Waterfront Grounds', 'description': 'Landscaped gardens and walkways along Arabian Gulf coastline'},
-                ],
-                'entrance_fees': 'Adults KWD 2 ($6.50), Children KWD 1 ($3.25). Restaurant requires reservation.',
-                'opening_hours': 'Daily 8:00 AM - 11:00 PM. Restaurant: 12:00 PM - 3:00 PM and 7:00 PM - 11:00 PM.',
-                'best_time': 'Sunset visits (5:00-7:00 PM) for spectacular views. Clear days for best visibility. Weekday mornings less crowded.',
-                'how_to_get_there': 'Located on Arabian Gulf Street in Kuwait City. Easily accessible by taxi or car. 15 minutes from city center. Parking available on-site.',
-                'what_to_wear': 'Smart casual for observation deck and restaurant. Conservative modest dress recommended. Comfortable shoes.',
-                'visitor_tips': [
-                    'Visit at sunset for best photography',
-                    'Book restaurant in advance for window seats',
-                    'Allow 1-2 hours for observation deck visit',
-                    'Combine with waterfront walk along Gulf Road',
-                    'Security screening required at entrance',
-                    'Cameras and phones allowed on observation deck',
-                    'Buy souvenirs at gift shop on ground level',
-                    'Wheelchair accessible with elevators',
-                    'Avoid Friday prayer times (12:00-2:00 PM)',
-                    'Evening illumination spectacular from outside',
-                ],
-                'discovery': 'Designed by Swedish firm Lindström & Juhlin VBB, completed 1979. Built to celebrate Kuwait\'s prosperity and modernization. Survived 1990 Iraqi invasion with damage.',
-                'architecture': 'Postmodern design featuring three reinforced concrete towers with spherical sections. Decorated with ceramic discs by Swedish artist Sune Lindström in turquoise, blue, and green representing earth, sea, and sky.',
-                'cultural_impact': 'Ultimate symbol of modern Kuwait. Appears on currency and stamps. Represents Kuwait\'s post-oil transformation. Popular venue for national celebrations.',
-                'conservation': 'Renovated after 1991 Gulf War damage. Regular maintenance of structural and mechanical systems. Protected as national landmark.',
-                'health_safety': 'Modern elevators with safety systems. Security personnel present. Emergency exits marked. Medical facilities nearby.',
-                'guided_tours': 'Audio guides available in multiple languages. Group tours can be arranged. Educational information displays throughout.',
-                'nearby_attractions': 'Kuwait National Museum (5 min), Souk Al-Mubarakiya (10 min), Grand Mosque (10 min), Liberation Tower (15 min), The Avenues Mall (20 min)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '29.3759° N, 47.9774° E',
-                'annual_visitors': '500,000+ visitors annually',
-                'climate': 'Hot desert climate. Summer (May-Sept) extremely hot 40-50°C/104-122°F. Winter (Nov-March) pleasant 15-25°C/59-77°F. Best November-March. Indoor climate-controlled.',
-            },
-            'liberation-tower': {
-                'id': 'liberation-tower',
-                'name': 'Liberation Tower',
-                'location': 'Kuwait City, Kuwait',
-                'description': 'Fifth tallest telecommunications tower in the world at 372 meters, commemorating Kuwait\'s liberation.',
-                'long_description': 'The Liberation Tower (Burj Al-Tahreer) is Kuwait\'s tallest structure and the fifth tallest telecommunications tower in the world, standing at an impressive 372 meters. Originally called Kuwait Telecommunications Tower when construction began in 1990, it was renamed Liberation Tower after Kuwait\'s liberation from Iraqi occupation in 1991, symbolizing the nation\'s freedom and resilience. The tower\'s distinctive design features a concrete shaft with a restaurant sphere and observation decks, though public access is currently restricted. Its modern Islamic-inspired architecture and prominent location make it an iconic part of Kuwait City\'s skyline and a powerful symbol of national sovereignty.',
-                'facts': [
-                    'Height: 372 meters (1,220 feet)',
-                    'Fifth tallest telecommunications tower in the world',
-                    'Construction began 1990, completed 1996',
-                    'Renamed from Telecommunications Tower to Liberation Tower',
-                    'Features revolving restaurant and viewing decks',
-                    'Houses telecommunications equipment and offices',
-                    'Islamic-inspired architectural design',
-                    'Iconic landmark visible throughout Kuwait City',
-                ],
-                'key_sites': [
-                    {'name': 'Exterior Plaza', 'description': 'Ground level area with tower views and photo opportunities'},
-                    {'name': 'Tower Base', 'description': 'Modern architectural design with Islamic geometric patterns'},
-                    {'name': 'Observation Sphere', 'description': 'Viewing platform (currently restricted access)'},
-                    {'name': 'Telecommunications Facilities', 'description': 'Technical floors housing broadcasting equipment'},
-                ],
-                'entrance_fees': 'Currently closed to public for security reasons. Viewable from exterior.',
-                'opening_hours': 'Exterior accessible 24/7. Interior currently restricted.',
-                'best_time': 'Best viewed from outside at sunset. Illuminated spectacularly at night. Combine with nearby attractions.',
-                'how_to_get_there': 'Located on Arabian Gulf Street in Kuwait City center. Easily accessible by taxi. Near major hotels and government buildings. Limited parking nearby.',
-                'what_to_wear': 'Casual comfortable clothing for exterior viewing. Conservative modest dress for Kuwait City center.',
-                'visitor_tips': [
-                    'View from outside - interior currently not accessible',
-                    'Best photo spots along Arabian Gulf Street',
-                    'Illuminated beautifully at night',
-                    'Combine with Kuwait Towers visit nearby',
-                    'Visible from many Kuwait City locations',
-                    'Visit nearby Souk Al-Mubarakiya after viewing',
-                    'Good landmark for navigation in Kuwait City',
-                    'Walk along waterfront for different viewing angles',
-                    'Several cafés nearby for viewing over refreshments',
-                    'Part of Kuwait City skyline photography tours',
-                ],
-                'discovery': 'Construction began in 1990 just before Iraqi invasion. Completed 1996 and renamed to commemorate Kuwait\'s 1991 liberation.',
-                'architecture': 'Modern telecommunications tower with Islamic-inspired design elements. Reinforced concrete shaft with observation and restaurant sphere. Distinctive tapering form.',
-                'cultural_impact': 'Powerful symbol of Kuwait\'s liberation and sovereignty. Represents resilience and national pride. Key element of modern Kuwait City skyline.',
-                'conservation': 'Regular maintenance of telecommunications systems. Structural monitoring. Security protection as critical infrastructure.',
-                'health_safety': 'Exterior viewing safe. Follow local traffic rules when viewing from streets. Security present around building perimeter.',
-                'guided_tours': 'Included in Kuwait City sightseeing tours as exterior viewpoint. Photography tours include tower as key landmark.',
-                'nearby_attractions': 'Kuwait Towers (1 km), Souk Al-Mubarakiya (2 km), Kuwait National Museum (3 km), Seif Palace (2 km), Grand Mosque (2 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '29.3796° N, 47.9931° E',
-                'annual_visitors': 'Exterior viewed by millions annually (interior restricted)',
-                'climate': 'Hot desert climate. Summer (May-Sept) extremely hot 40-50°C/104-122°F. Winter (Nov-March) pleasant 15-25°C/59-77°F. Best November-March for outdoor viewing.',
-            },
-            'al-shaheed-park': {
-                'id': 'al-shaheed-park',
-                'name': 'Al Shaheed Park',
-                'location': 'Kuwait City, Kuwait',
-                'description': 'Kuwait\'s largest urban park with botanical gardens, museums, and cultural attractions.',
-                'long_description': 'Al Shaheed Park (Martyrs Park) is Kuwait\'s largest and most beautiful urban park, spanning 200,000 square meters in the heart of Kuwait City. Opened in 2015, this spectacular green oasis features landscaped gardens with native and exotic plants, walking and jogging paths, water features, children\'s play areas, and two museums. The park commemorates Kuwait\'s martyrs while providing a peaceful retreat for families and visitors. Highlights include the Habitat Museum showcasing Kuwait\'s biodiversity, the Memorial Museum honoring fallen soldiers, an amphitheater hosting cultural events, and the stunning botanical gardens with over 200,000 plants. The contemporary landscape design integrates art installations, fountains, and traditional Islamic garden elements.',
-                'facts': [
-                    'Kuwait\'s largest urban park - 200,000 square meters',
-                    'Opened in 2015, designed by Gulf Consult',
-                    'Features over 200,000 plants and trees',
-                    'Houses Habitat Museum and Memorial Museum',
-                    'Includes 10 km of walking and jogging tracks',
-                    'Amphitheater hosts concerts and cultural events',
-                    'Water features and reflection pools throughout',
-                    'Free admission to park, museums charge fees',
-                ],
-                'key_sites': [
-                    {'name': 'Habitat Museum', 'description': 'Natural history museum showcasing Kuwait\'s flora, fauna, and ecosystems'},
-                    {'name': 'Memorial Museum', 'description': 'Tribute to Kuwait\'s martyrs with historical exhibitions'},
-                    {'name': 'Botanical Gardens', 'description': 'Diverse plant collections including native Arabian species'},
-                    {'name': 'Visitor Center & Amphitheater', 'description': 'Cultural venue hosting performances and events'},
-                ],
-                'entrance_fees': 'Park entry free. Habitat Museum: KWD 2 ($6.50) adults, KWD 1 ($3.25) children. Memorial Museum: Free.',
-                'opening_hours': 'Park: Daily 8:00 AM - 11:00 PM. Museums: 9:00 AM - 8:00 PM (closed Mondays).',
-                'best_time': 'October to April for pleasant weather. Early morning or late afternoon. Weekday visits less crowded. Evening visits for illuminated gardens.',
-                'how_to_get_there': 'Located on Gulf Road near Kuwait City center. Accessible by taxi or car. Underground parking available. Walking distance from several hotels.',
-                'what_to_wear': 'Casual comfortable clothing. Walking or athletic shoes for paths. Sun protection essential. Conservative modest dress.',
-                'visitor_tips': [
-                    'Visit museums first, then explore gardens',
-                    'Early morning ideal for joggers and walkers',
-                    'Bring water bottle and sun protection',
-                    'Children\'s play areas excellent for families',
-                    'Amphitheater hosts free cultural events - check schedule',
-                    'Photography welcome throughout park',
-                    'Café on-site for refreshments',
-                    'Wheelchair accessible paths and facilities',
-                    'Allow 2-3 hours for full visit including museums',
-                    'Evening visits beautiful with garden lighting',
-                ],
-                'discovery': 'Developed 2010-2015 on former military grounds. Part of urban renewal transforming Kuwait City. Designed by Gulf Consult international team.',
-                'architecture': 'Contemporary landscape architecture integrating traditional Islamic garden principles. Modern museum buildings with sustainable design. Water-efficient irrigation systems.',
-                'cultural_impact': 'Major cultural and recreational venue for Kuwait City. Honors national martyrs. Promotes environmental awareness. Popular gathering place for families.',
-                'conservation': 'Sustainable water management and irrigation. Native plant conservation. Environmental education programs. Regular maintenance and landscaping.',
-                'health_safety': 'Well-maintained safe environment. Security patrols. First aid facilities. Shaded rest areas. Drinking water fountains. Emergency access throughout.',
-                'guided_tours': 'Guided tours of museums available. Garden tours focus on plant species. Educational programs for schools. Special event tours.',
-                'nearby_attractions': 'Kuwait National Museum (1 km), Seif Palace (2 km), Grand Mosque (2 km), Kuwait Towers (3 km), Souk Al-Mubarakiya (2 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1585421514738-01798e348b17?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '29.3697° N, 47.9789° E',
-                'annual_visitors': '1+ million visitors annually',
-                'climate': 'Hot desert climate. Summer (May-Sept) very hot 40-50°C/104-122°F - early morning/evening visits best. Winter (Nov-March) pleasant 15-25°C/59-77°F. Best November-April.',
-            },
-            'grand-mosque-kuwait': {
-                'id': 'grand-mosque-kuwait',
-                'name': 'Grand Mosque (Al-Masjid Al-Kabir)',
-                'location': 'Kuwait City, Kuwait',
-                'description': 'Kuwait\'s largest and official state mosque with stunning Islamic architecture and capacity for 10,000 worshippers.',
-                'long_description': 'The Grand Mosque of Kuwait (Al-Masjid Al-Kabir) is the largest and most important mosque in Kuwait, serving as the official state mosque. Completed in 1986, this architectural masterpiece covers 45,000 square meters and can accommodate 10,000 male worshippers in the main prayer hall and 950 women in the separate women\'s prayer hall. The mosque showcases traditional Islamic architecture with modern innovations, featuring a magnificent central dome, decorative minarets, intricate calligraphy, stunning chandeliers, and beautiful geometric patterns. The interior is adorned with traditional Islamic art, including hand-carved teak wood doors, elaborate carpet designs, and gilded calligraphic inscriptions. Non-Muslim visitors are welcome for guided tours that provide insight into Islamic faith and Kuwaiti culture.',
-                'facts': [
-                    'Largest mosque in Kuwait - 45,000 square meters',
-                    'Completed in 1986, official state mosque',
-                    'Capacity: 10,000 men in main hall, 950 women',
-                    'Main prayer hall features 72 columns',
-                    'Central dome is 26 meters in diameter',
-                    'Contains Islamic art and rare manuscripts library',
-                    'Features traditional Islamic architectural elements',
-                    'Guided tours available for non-Muslim visitors',
-                ],
-                'key_sites': [
-                    {'name': 'Main Prayer Hall', 'description': 'Vast carpeted hall with 72 columns, magnificent chandeliers, and ornate decorations'},
-                    {'name': 'Central Dome', 'description': '26-meter diameter dome with intricate Islamic geometric patterns'},
-                    {'name': 'Courtyard', 'description': 'Open-air ablution area with traditional Islamic fountain'},
-                    {'name': 'Islamic Library', 'description': 'Collection of Islamic texts, manuscripts, and religious books'},
-                ],
-                'entrance_fees': 'Free admission. Guided tours free (donations welcome).',
-                'opening_hours': 'Tours: Sunday-Thursday 9:00 AM - 12:00 PM and 5:00 PM - 8:00 PM (not during prayer times). Closed Fridays to non-Muslims.',
-                'best_time': 'Mid-morning or late afternoon for tours. Avoid prayer times. Book tours in advance. Weekdays less crowded.',
-                'how_to_get_there': 'Located in Kuwait City center on Arabian Gulf Street. Easily accessible by taxi. Parking available nearby. Walking distance from major hotels.',
-                'what_to_wear': 'Modest conservative dress essential. Women must cover hair, arms, and legs (abayas provided at entrance if needed). Men should wear long trousers. Remove shoes before entering.',
-                'visitor_tips': [
-                    'Book guided tour in advance - required for non-Muslims',
-                    'Dress very modestly - coverings provided if needed',
-                    'Remove shoes before entering prayer areas',
-                    'Photography allowed but be respectful',
-                    'No visits during prayer times (five daily)',
-                    'Learn basic Islamic etiquette before visiting',
-                    'Guides explain Islamic practices and architecture',
-                    'Allow 1 hour for guided tour',
-                    'Be quiet and respectful inside mosque',
-                    'Free tour but donations appreciated',
-                ],
-                'discovery': 'Commissioned by government in 1979, completed 1986. Designed by architect Mohamed Saleh Makiya. Built to serve as Kuwait\'s official state mosque.',
-                'architecture': 'Traditional Islamic architecture with large central dome, decorative minarets, geometric patterns, calligraphy, and arabesque designs. Hand-carved teak doors, marble floors, Persian carpets, and crystal chandeliers.',
-                'cultural_impact': 'Official state mosque for Kuwait. Hosts important religious occasions and state events. Symbol of Islamic heritage. Educational center for Islamic studies.',
-                'conservation': 'Regular maintenance of structure and decorative elements. Professional cleaning of carpets and artwork. Climate control protects interior. Security protection.',
-                'health_safety': 'Clean well-maintained facility. Modern amenities and ablution areas. First aid available. Security personnel present. Accessible facilities.',
-                'guided_tours': 'Free guided tours for non-Muslims in English and Arabic. Must book in advance. Educational focus on Islamic practices and architecture.',
-                'nearby_attractions': 'Seif Palace (1 km), Souk Al-Mubarakiya (1.5 km), Kuwait National Museum (2 km), Kuwait Towers (3 km), Liberation Tower (2 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1564769625905-50e93615e769?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1591604129939-f1efa4d9f7fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '29.3745° N, 47.9822° E',
-                'annual_visitors': '100,000+ non-Muslim visitors annually (millions of worshippers)',
-                'climate': 'Indoor climate-controlled year-round. Best visit November-March when outdoor Kuwait weather pleasant.',
-            },
-            'souk-al-mubarakiya': {
-                'id': 'souk-al-mubarakiya',
-                'name': 'Souk Al-Mubarakiya',
-                'location': 'Kuwait City, Kuwait',
-                'description': 'Historic traditional market over 200 years old with spices, textiles, crafts, and authentic Kuwaiti atmosphere.',
-                'long_description': 'Souk Al-Mubarakiya is Kuwait\'s most famous traditional market, dating back over 200 years and serving as the commercial heart of old Kuwait City. This bustling authentic Arabian souq offers a fascinating glimpse into Kuwait\'s trading heritage with its labyrinthine alleys filled with shops selling spices, dates, honey, nuts, traditional textiles, handicrafts, perfumes, incense, antiques, jewelry, and souvenirs. The souq includes traditional Kuwaiti restaurants serving local cuisine, tea shops, and the historic Kuwaiti Craft Center. Walking through the covered passages, visitors experience the sights, sounds, and aromatic smells of a traditional Gulf market, with vendors calling out, the scent of frankincense, and the vibrant colors of goods from across the region.',
-                'facts': [
-                    'Over 200 years old - one of Kuwait\'s oldest markets',
-                    'Original commercial center of Kuwait City',
-                    'Features hundreds of shops and stalls',
-                    'Sells spices, textiles, perfumes, antiques, handicrafts',
-                    'Traditional Kuwaiti restaurants and cafés',
-                    'Kuwaiti Craft Center showcases local artisans',
-                    'Renovated while maintaining traditional character',
-                    'Busiest during evenings and weekends',
-                ],
-                'key_sites': [
-                    {'name': 'Spice Market', 'description': 'Aromatic section with spices, herbs, incense, and traditional remedies'},
-                    {'name': 'Textile & Clothing Area', 'description': 'Traditional fabrics, abayas, dishdashes, and textiles'},
-                    {'name': 'Kuwaiti Craft Center', 'description': 'Showcases traditional crafts like sadu weaving and pottery'},
-                    {'name': 'Food Section', 'description': 'Dates, honey, nuts, sweets, and traditional Kuwaiti restaurants'},
-                ],
-                'entrance_fees': 'Free entry to souq. Individual purchases vary by shop and bargaining.',
-                'opening_hours': 'Generally 9:00 AM - 1:00 PM and 4:30 PM - 10:00 PM. Some shops vary. Busiest evenings and weekends. Fridays open after prayers.',
-                'best_time': 'Evening visits (5:00-9:00 PM) for lively atmosphere. October-April for comfortable weather. Weekday mornings less crowded for photography.',
-                'how_to_get_there': 'Located in Kuwait City center near Arabian Gulf Street. Easily accessible by taxi. Limited parking nearby - taxi recommended. Walking distance from major hotels.',
-                'what_to_wear': 'Casual comfortable clothing for walking. Conservative modest dress recommended. Comfortable shoes for navigating alleys. Bring bag for purchases.',
-                'visitor_tips': [
-                    'Bargaining expected and encouraged - start at 50-60% of asking price',
-                    'Visit multiple shops to compare prices before buying',
-                    'Try traditional Kuwaiti cuisine at souq restaurants',
-                    'Sample dates, honey, and nuts before purchasing',
-                    'Visit Kuwaiti Craft Center for authentic handicrafts',
-                    'Bring cash - many shops don\'t accept cards',
-                    'Photography welcome but ask permission for people',
-                    'Best quality saffron and spices at good prices',
-                    'Allow 2-3 hours for thorough exploration',
-                    'Combine with nearby historic sites visit',
-                ],
-                'discovery': 'Established over 200 years ago as Kuwait\'s main commercial hub. Historic center of trade and social life. Renovated in 2000s maintaining traditional character.',
-                'architecture': 'Traditional covered market architecture with narrow alleys, arched passages, and traditional shop fronts. Mix of original structures and modern renovations respecting traditional style.',
-                'cultural_impact': 'Living heritage site representing Kuwait\'s trading history. Social and commercial hub. Preserves traditional market culture. Popular with locals and tourists.',
-                'conservation': 'Careful renovation balancing modernization with heritage preservation. Maintenance of traditional architectural elements. Support for traditional crafts and vendors.',
-                'health_safety': 'Generally safe with good security. Watch belongings in crowded areas. Food from established restaurants safest. Stay hydrated. Clean well-maintained facilities.',
-                'guided_tours': 'Cultural tours available focusing on history and traditional crafts. Food tours sampling Kuwaiti cuisine. Shopping tours with bargaining assistance.',
-                'nearby_attractions': 'Seif Palace (500m), Grand Mosque (1 km), Kuwait National Museum (2 km), Kuwait Towers (3 km), Al Shaheed Park (2 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1598778893240-584b0e8b3b6d?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1568640347023-a616a30bc3bd?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '29.3747° N, 47.9914° E',
-                'annual_visitors': '2+ million visitors annually',
-                'climate': 'Mostly covered but can be warm. Summer (May-Sept) very hot - evening visits best. Winter (Nov-March) pleasant. Best October-April.',
-            },
-            'kuwait-city': {
-                'id': 'kuwait-city',
-                'name': 'Kuwait City',
-                'location': 'Kuwait City, Kuwait',
-                'description': 'Modern capital blending contemporary skyscrapers with traditional souks and rich cultural heritage.',
-                'long_description': 'Kuwait City is the vibrant capital of Kuwait, a fascinating metropolis where gleaming modern skyscrapers stand alongside traditional markets and historic sites. As the political, cultural, and economic heart of Kuwait, the city offers an authentic Arabian Gulf experience with its iconic Kuwait Towers, Liberation Tower, Grand Mosque, and bustling Souk Al-Mubarakiya. The waterfront along Arabian Gulf Street features beautiful parks, museums, and the famous Kuwait Towers. The city showcases Kuwait\'s remarkable transformation from a pearl-diving port to a prosperous modern capital, while preserving its rich heritage through museums, cultural centers, and traditional architecture.',
-                'facts': [
-                    'Capital and largest city of Kuwait',
-                    'Population approximately 4.5 million (metro area)',
-                    'Located on the southern shore of Kuwait Bay',
-                    'Historic pearl diving and trading port',
-                    'Modern skyline with Kuwait Towers and Liberation Tower',
-                    'Home to Grand Mosque, largest mosque in Kuwait',
-                    'Major financial and business center of Gulf region',
-                    'Founded in the early 18th century',
-                ],
-                'key_sites': [
-                    {'name': 'Kuwait Towers', 'description': 'Iconic trio of towers symbolizing modern Kuwait with observation deck'},
-                    {'name': 'Souk Al-Mubarakiya', 'description': 'Historic 200+ year-old traditional market with spices, textiles, and crafts'},
-                    {'name': 'Arabian Gulf Street', 'description': 'Scenic waterfront corniche with parks, beaches, and restaurants'},
-                    {'name': 'Grand Mosque', 'description': 'Kuwait\'s largest and most important mosque with stunning architecture'},
-                ],
-                'entrance_fees': 'City access free. Individual attractions charge separate fees.',
-                'opening_hours': 'City accessible 24/7. Attractions, shops, and restaurants have varying hours.',
-                'best_time': 'November to April for pleasant weather. October-March ideal. Summer (May-Sept) extremely hot.',
-                'how_to_get_there': 'Kuwait International Airport 15 km from city center. Taxi, Uber, Careem readily available. Well-connected road network. Future metro system under construction.',
-                'what_to_wear': 'Conservative modest dress recommended. Women should cover shoulders and knees. Men should wear long trousers in public areas. Comfortable walking shoes.',
-                'visitor_tips': [
-                    'Start with Kuwait Towers for city overview',
-                    'Visit Souk Al-Mubarakiya for authentic shopping',
-                    'Walk along Arabian Gulf Street waterfront',
-                    'Explore both modern malls and traditional markets',
-                    'Try authentic Kuwaiti cuisine at local restaurants',
-                    'Visit Grand Mosque on guided tour',
-                    'Al Shaheed Park excellent for relaxation',
-                    'Taxis and ride-sharing apps convenient for transport',
-                    'Exchange currency at banks or authorized dealers',
-                    'Allow 3-4 days to explore city thoroughly',
-                ],
-                'discovery': 'Founded in early 18th century by Bani Utbah tribe. Developed as pearl diving and trading port. Grew rapidly after oil discovery in 1938. Liberated from Iraqi occupation in 1991.',
-                'architecture': 'Mix of modern glass skyscrapers, traditional Islamic architecture, and contemporary designs. Notable landmarks include Kuwait Towers, Liberation Tower, Grand Mosque, and restored Seif Palace.',
-                'cultural_impact': 'Major cultural and economic hub of Gulf region. Known for preserving Kuwaiti heritage while embracing modernity. Important center for Arab arts and culture.',
-                'conservation': 'Urban development balancing modernization with heritage preservation. Protection of historic sites like Souk Al-Mubarakiya and Seif Palace. Environmental initiatives for coastal areas.',
-                'health_safety': 'Safe city with low crime rates. Modern healthcare facilities. Stay hydrated in hot weather. Follow local customs and laws. Emergency services readily available.',
-                'guided_tours': 'City tours covering major landmarks. Cultural heritage tours. Food tours sampling Kuwaiti cuisine. Desert tours from city. Museum and historical tours.',
-                'nearby_attractions': 'All major Kuwait attractions within city, Failaka Island (45 min ferry), Kuwait desert camps (1 hour drive)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1590856029826-c7a73142bbf1?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '29.3759° N, 47.9774° E',
-                'annual_visitors': '5+ million visitors annually',
-                'climate': 'Hot desert climate. Summer (May-Sept) extremely hot 40-50°C/104-122°F. Winter (Nov-March) pleasant 15-25°C/59-77°F. Best November-April.',
-            },
-            'tareq-rajab-museum': {
-                'id': 'tareq-rajab-museum',
-                'name': 'Tareq Rajab Museum',
-                'location': 'Jabriya, Kuwait City, Kuwait',
-                'description': 'World-class private museum with exceptional collection of Islamic art, calligraphy, and manuscripts.',
-                'long_description': 'The Tareq Rajab Museum is one of the finest private museums in the Arab world, housing an extraordinary collection of over 30,000 artifacts spanning 1,400 years of Islamic civilization. Founded by Tareq Sayed Rajab and his wife Jehan Wellborne, the museum showcases exceptional examples of Islamic art, Arabic calligraphy, rare manuscripts, textiles, ceramics, metalwork, jewelry, and costumes from across the Islamic world. The collection includes Quranic manuscripts dating back centuries, exquisite examples of Kuwaiti traditional dress, Ottoman and Persian textiles, and stunning examples of Islamic calligraphy. Adjacent to the main museum, the Museum of Islamic Calligraphy displays one of the world\'s finest collections of Arabic calligraphic art.',
-                'facts': [
-                    'Private museum founded by Tareq Rajab and Jehan Wellborne',
-                    'Collection of over 30,000 artifacts',
-                    'Spans 1,400 years of Islamic civilization',
-                    'Exceptional Arabic calligraphy collection',
-                    'Rare manuscripts including ancient Qurans',
-                    'Traditional Kuwaiti costumes and textiles',
-                    'Islamic metalwork, ceramics, and jewelry',
-                    'Separate Museum of Islamic Calligraphy',
-                ],
-                'key_sites': [
-                    {'name': 'Islamic Art Galleries', 'description': 'Ceramics, metalwork, glass, and decorative arts from Islamic world'},
-                    {'name': 'Manuscript Collection', 'description': 'Rare Quranic manuscripts and illuminated texts dating back centuries'},
-                    {'name': 'Textile & Costume Gallery', 'description': 'Traditional Kuwaiti dress, Ottoman textiles, and historical garments'},
-                    {'name': 'Calligraphy Museum', 'description': 'World-class collection of Arabic calligraphy and calligraphic art'},
-                ],
-                'entrance_fees': 'Adults KWD 2 ($6.50), Students KWD 1 ($3.25), Children under 12 free.',
-                'opening_hours': 'Sunday-Thursday: 9:00 AM - 12:00 PM and 4:00 PM - 7:00 PM. Friday-Saturday: 9:00 AM - 12:00 PM. Closed on public holidays.',
-                'best_time': 'Weekday mornings less crowded. Allow 2-3 hours for thorough visit. Best visited October-April when weather pleasant.',
-                'how_to_get_there': 'Located in Jabriya area, 15 minutes from Kuwait City center. Accessible by taxi, Uber, or Careem. Limited parking available on-site.',
-                'what_to_wear': 'Conservative modest clothing recommended. Women should cover shoulders and knees. Comfortable shoes for walking through galleries.',
-                'visitor_tips': [
-                    'Allow 2-3 hours for comprehensive visit',
-                    'Start with main museum, then visit calligraphy museum',
-                    'Photography policies - check with staff',
-                    'Guided tours available with advance booking',
-                    'Museum shop has quality books on Islamic art',
-                    'Excellent for understanding Islamic artistic heritage',
-                    'Labels in English and Arabic',
-                    'Less crowded than major tourist sites',
-                    'Combine with visit to nearby attractions',
-                    'One of the finest Islamic art collections in Gulf',
-                ],
-                'discovery': 'Founded by Tareq Sayed Rajab, former diplomat and collector, and his British wife Jehan Wellborne. Opened to public 1980. Collection built over 50+ years of passionate collecting.',
-                'architecture': 'Purpose-built museum buildings designed to showcase collections. Climate-controlled galleries protecting delicate artifacts. Traditional Islamic architectural elements incorporated.',
-                'cultural_impact': 'Important cultural institution preserving and presenting Islamic artistic heritage. Educational resource for scholars and students. Represents Kuwait\'s commitment to cultural preservation.',
-                'conservation': 'Professional conservation standards. Climate-controlled environment. Expert restoration of artifacts. Research and documentation of collection. International museum best practices.',
-                'health_safety': 'Clean modern facility. Adequate lighting and ventilation. Accessibility features. First aid available. Security personnel present.',
-                'guided_tours': 'Guided tours available in English and Arabic with advance booking. Expert guides explain significance of artifacts. Educational programs for schools and universities.',
-                'nearby_attractions': 'Kuwait National Museum (15 min), Al Shaheed Park (20 min), Scientific Center (25 min), The Avenues Mall (15 min)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1565084888279-aca607ecce6c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '29.3219° N, 48.0208° E',
-                'annual_visitors': '50,000+ visitors annually',
-                'climate': 'Indoor climate-controlled year-round. Best visit October-April when outdoor Kuwait weather pleasant.',
-            },
-            'the-avenues-mall': {
-                'id': 'the-avenues-mall',
-                'name': 'The Avenues Mall',
-                'location': 'Rai, Kuwait City, Kuwait',
-                'description': 'One of the largest shopping malls in the Middle East with over 1,100 stores and entertainment.',
-                'long_description': 'The Avenues Mall is Kuwait\'s premier shopping destination and one of the largest malls in the Middle East, spanning over 390,000 square meters with more than 1,100 stores. Opened in 2007 and continuously expanding, this architectural marvel features distinct districts themed after famous streets worldwide - from the Grand Avenue modeled after Beverly Hills to the Prestige district housing luxury brands. Beyond shopping, The Avenues offers world-class dining with over 300 restaurants and cafes, a state-of-the-art cinema complex, an indoor snow park (planned), entertainment zones, and beautiful architectural details inspired by global landmarks. The mall combines international luxury brands with local retailers, making it a one-stop destination for shopping, dining, and entertainment.',
-                'facts': [
-                    'One of the largest malls in the Middle East - 390,000+ sqm',
-                    'Over 1,100 stores across multiple districts',
-                    'More than 300 restaurants and cafés',
-                    'Opened 2007, continuously expanding',
-                    'Themed districts including Grand Avenue, Prestige, Electra',
-                    'State-of-the-art cinema complex with IMAX',
-                    'Luxury brands and international retailers',
-                    'Receives 20+ million visitors annually',
-                ],
-                'key_sites': [
-                    {'name': 'Grand Avenue', 'description': 'Upscale district inspired by Beverly Hills with luxury stores and fountains'},
-                    {'name': 'Prestige District', 'description': 'Exclusive area featuring high-end luxury brands and designer boutiques'},
-                    {'name': 'Electra District', 'description': 'Technology and electronics hub with latest gadgets and gaming stores'},
-                    {'name': 'Souk District', 'description': 'Traditional market-style area with Middle Eastern shops and dining'},
-                ],
-                'entrance_fees': 'Free entry to mall. Individual purchases and entertainment vary.',
-                'opening_hours': 'Saturday-Wednesday: 10:00 AM - 10:00 PM. Thursday-Friday: 10:00 AM - 11:00 PM. Extended hours during Ramadan and holidays.',
-                'best_time': 'Weekday mornings less crowded. Thursday-Friday evenings busiest. Ramadan evenings very lively. Year-round comfortable indoor climate.',
-                'how_to_get_there': 'Located in Rai area, 15 minutes from Kuwait City center. Easily accessible by taxi, Uber, or Careem. Extensive parking with 10,000+ spaces.',
-                'what_to_wear': 'Casual comfortable clothing. Smart casual for upscale restaurants. Conservative modest dress recommended. Comfortable shoes for walking.',
-                'visitor_tips': [
-                    'Download The Avenues app for store directory and offers',
-                    'Plan route - mall is massive, easy to get lost',
-                    'Start at specific district based on shopping interests',
-                    'Food court offers diverse international cuisine',
-                    'Cinema requires advance booking for popular shows',
-                    'Valet parking available at multiple entrances',
-                    'Free WiFi throughout mall',
-                    'Prayer rooms available in each district',
-                    'Allow 3-4 hours minimum for shopping and dining',
-                    'Exchange currency at banks within mall',
-                ],
-                'discovery': 'Opened 2007 with initial phase. Multiple expansion phases added new districts. Continues to grow with new additions planned. Transformed retail landscape in Kuwait.',
-                'architecture': 'Contemporary design with themed districts inspired by global cities. Grand Avenue features Italian-style architecture. High ceilings, natural lighting, and water features throughout. Modern sustainable design elements.',
-                'cultural_impact': 'Major social and retail hub for Kuwaiti society. Popular gathering place for families and youth. Showcases Kuwait\'s modern consumerism and lifestyle. Attracts visitors from across Gulf region.',
-                'conservation': 'Energy-efficient systems. Sustainable building practices. Waste management programs. Modern HVAC systems. Regular maintenance and upgrades.',
-                'health_safety': 'Modern fire safety systems. 24/7 security personnel. CCTV monitoring. First aid stations. Emergency evacuation plans. Clean well-maintained facilities. Accessibility features throughout.',
-                'guided_tours': 'Mall tours available for large groups. Personal shopping services. VIP shopping experiences. Fashion shows and events regularly hosted.',
-                'nearby_attractions': 'Kuwait International Airport (10 min), Scientific Center (15 min), Kuwait Towers (20 min), Al Shaheed Park (20 min)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1519567241046-7f570eee3ce6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1567958451986-2de427a4a0be?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '29.3020° N, 47.9302° E',
-                'annual_visitors': '20+ million visitors annually',
-                'climate': 'Indoor fully climate-controlled year-round at comfortable temperature. Ideal escape from summer heat.',
-            },
-            'kuwait-national-museum': {
-                'id': 'kuwait-national-museum',
-                'name': 'Kuwait National Museum',
-                'location': 'Kuwait City, Kuwait',
-                'description': 'Premier national museum showcasing Kuwait\'s rich heritage from ancient times to modern era.',
-                'long_description': 'The Kuwait National Museum is the country\'s premier cultural institution, dedicated to preserving and presenting Kuwait\'s rich history and heritage. Originally opened in 1983, the museum suffered significant damage during the 1990-91 Iraqi invasion but has been carefully restored. The museum complex includes several sections: the Heritage Museum showcasing traditional Kuwaiti life, pearling industry, and Bedouin culture; archaeological galleries displaying artifacts from Failaka Island and ancient Mesopotamian connections; and the Planetarium. The museum\'s collections include traditional boats (dhows), pearl diving equipment, Islamic art, archaeological finds, and exhibits on Kuwait\'s pre-oil economy and traditional lifestyle. The adjacent Al Amricani Cultural Centre adds contemporary art exhibitions.',
-                'facts': [
-                    'Originally opened 1983, restored after 1991 war',
-                    'Premier national cultural institution',
-                    'Heritage Museum showcases traditional Kuwaiti life',
-                    'Archaeological finds from Failaka Island',
-                    'Traditional pearl diving exhibits',
-                    'Collection of Kuwaiti dhows (boats)',
-                    'Planetarium and scientific exhibits',
-                    'Adjacent Al Amricani Cultural Centre',
-                ],
-                'key_sites': [
-                    {'name': 'Heritage Museum', 'description': 'Traditional Kuwaiti life, Bedouin culture, and pre-oil economy'},
-                    {'name': 'Archaeological Gallery', 'description': 'Ancient artifacts from Failaka Island and Kuwait\'s history'},
-                    {'name': 'Pearl Diving Exhibition', 'description': 'Kuwait\'s historic pearl industry and traditional dhows'},
-                    {'name': 'Planetarium', 'description': 'Astronomy shows and scientific presentations'},
-                ],
-                'entrance_fees': 'Adults KWD 1 ($3.25), Students free with ID, Children under 12 free. Planetarium separate fee.',
-                'opening_hours': 'Saturday-Thursday: 8:30 AM - 12:30 PM and 4:30 PM - 8:30 PM. Friday: 9:00 AM - 12:00 PM and 4:30 PM - 8:30 PM.',
-                'best_time': 'Weekday mornings less crowded. Allow 2-3 hours for thorough visit. Best visited October-April.',
-                'how_to_get_there': 'Located in Kuwait City near Arabian Gulf Street. Accessible by taxi, Uber, or Careem. Parking available on-site. Walking distance from Kuwait Towers.',
-                'what_to_wear': 'Conservative modest clothing. Women should cover shoulders and knees. Comfortable walking shoes for galleries.',
-                'visitor_tips': [
-                    'Start with Heritage Museum for context',
-                    'Allow 2-3 hours for comprehensive visit',
-                    'Planetarium shows excellent for families',
-                    'Check for temporary exhibitions and events',
-                    'Photography policies - check with staff',
-                    'Labels in Arabic and English',
-                    'Museum shop has quality books and souvenirs',
-                    'Combine with nearby Kuwait Towers visit',
-                    'Guided tours available with advance booking',
-                    'Less crowded than tourist hotspots',
-                ],
-                'discovery': 'Established 1983 to preserve Kuwait\'s heritage. Suffered looting during 1990-91 invasion. Restoration efforts recovered many artifacts. Reopened sections showcase rebuilt collections.',
-                'architecture': 'Modern museum architecture designed by Michel Ecochard. Contemporary exhibition spaces. Climate-controlled galleries. Traditional architectural elements incorporated.',
-                'cultural_impact': 'Essential institution for preserving Kuwaiti national identity. Educational resource for understanding pre-oil Kuwait. Honors pearl diving heritage and Bedouin traditions.',
-                'conservation': 'Professional museum standards. Climate control protecting artifacts. Ongoing restoration of damaged pieces. Documentation and research programs. International collaboration on conservation.',
-                'health_safety': 'Clean modern facility. Adequate facilities and accessibility. First aid available. Security personnel. Comfortable viewing environment.',
-                'guided_tours': 'Guided tours available in Arabic and English. Educational programs for schools. Expert guides explain Kuwaiti history and culture.',
-                'nearby_attractions': 'Kuwait Towers (1 km), Al Shaheed Park (2 km), Seif Palace (1.5 km), Souk Al-Mubarakiya (2 km), Grand Mosque (1 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1565084888279-aca607ecce6c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1582407947304-fd86f028f716?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '29.3676° N, 47.9659° E',
-                'annual_visitors': '150,000+ visitors annually',
-                'climate': 'Indoor climate-controlled year-round. Best visit October-April when outdoor Kuwait weather pleasant.',
-            },
-            'failaka-island': {
-                'id': 'failaka-island',
-                'name': 'Failaka Island',
-                'location': 'Kuwait Bay, Kuwait',
-                'description': 'Historic island with ancient Greek and Dilmun ruins, beaches, and remnants of 1990-91 conflict.',
-                'long_description': 'Failaka Island is a fascinating 43-square-kilometer island in Kuwait Bay with over 5,000 years of history. This archaeological treasure was inhabited by Bronze Age Dilmun civilization and later by Greeks under Alexander the Great, who established a settlement called Ikaros. The island features ancient ruins including Greek temples, fortifications, and residential areas, as well as Dilmun-era archaeological sites. Abandoned during the 1990-91 Gulf War, Failaka also contains haunting remnants of that conflict including abandoned buildings and military installations. Today, the island is being developed for tourism while preserving its archaeological heritage, offering visitors a unique combination of ancient history, beautiful beaches, and a glimpse into Kuwait\'s recent past.',
-                'facts': [
-                    'Island in Kuwait Bay, 20 km from mainland',
-                    'Over 5,000 years of continuous habitation',
-                    'Ancient Dilmun Bronze Age civilization ruins',
-                    'Greek settlement "Ikaros" from Hellenistic period',
-                    'Evacuated during 1990-91 Gulf War',
-                    'Archaeological sites including Greek temples',
-                    'Beautiful beaches and natural coastline',
-                    'Accessible by ferry from Kuwait City',
-                ],
-                'key_sites': [
-                    {'name': 'Archaeological Sites', 'description': 'Greek temples, Dilmun ruins, and ancient residential areas'},
-                    {'name': 'Heritage Village', 'description': 'Reconstructed traditional Kuwaiti village showing pre-oil life'},
-                    {'name': 'Beaches & Coastline', 'description': 'Pristine sandy beaches and clear waters for swimming and relaxation'},
-                    {'name': 'Abandoned Buildings', 'description': 'Haunting remnants from 1990-91 conflict preserved as historical sites'},
-                ],
-                'entrance_fees': 'Ferry ticket KWD 3-5 ($10-16) round trip includes island entry. Archaeological sites free.',
-                'opening_hours': 'Ferry operates weekends and holidays (schedule varies seasonally). Island accessible during daylight hours. Check ferry schedule in advance.',
-                'best_time': 'October to April for pleasant weather. Weekend ferries most frequent. Spring (March-April) ideal for beach visits.',
-                'how_to_get_there': 'Ferry from Ras Al-Ard port (south of Kuwait City). Journey approximately 45 minutes. Private boat charters also available. Advance ferry booking recommended.',
-                'what_to_wear': 'Comfortable casual clothing. Modest swimwear for beaches. Sun protection essential. Comfortable walking shoes for archaeological sites. Hat and sunscreen.',
-                'visitor_tips': [
-                    'Book ferry tickets in advance - limited capacity',
-                    'Bring water and snacks - limited facilities on island',
-                    'Wear comfortable shoes for exploring ruins',
-                    'Combine archaeological sites with beach time',
-                    'Photography welcomed at all sites',
-                    'Respect archaeological areas - don\'t remove artifacts',
-                    'Check ferry return schedule carefully',
-                    'Guided tours provide historical context',
-                    'Allow full day for thorough exploration',
-                    'Weather can be unpredictable - check forecast',
-                ],
-                'discovery': 'Inhabited since 3rd millennium BCE by Dilmun civilization. Greek settlement established 4th century BCE under Alexander. Excavations began 1958. Abandoned 1990, partially reopened for tourism 2010s.',
-                'architecture': 'Ancient Greek temple foundations and fortifications. Dilmun-era structures. Traditional Kuwaiti buildings in heritage village. Modern ruins from 20th century settlement.',
-                'cultural_impact': 'Important archaeological site linking Kuwait to ancient civilizations. Evidence of trade connections with Mesopotamia and Greece. Symbol of Kuwait\'s ancient heritage.',
-                'conservation': 'Archaeological preservation ongoing with international cooperation. Protected heritage site. Balancing tourism development with archaeological protection. Documentation of recent conflict remnants.',
-                'health_safety': 'Basic facilities on island. Bring first aid supplies. Stay hydrated in hot weather. Watch footing at archaeological sites. Ferry safety standards. Limited emergency services - plan accordingly.',
-                'guided_tours': 'Archaeological tours explaining Greek and Dilmun history. Heritage village tours. Combined tours of ancient and modern history. Private guides available.',
-                'nearby_attractions': 'Kuwait City (45 min ferry), Ras Al-Ard port area, Coastal attractions in Kuwait',
-                'photos': [
-                    'https://images.unsplash.com/photo-1559827260-dc66d52bef19?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '29.4411° N, 48.3256° E',
-                'annual_visitors': '30,000+ visitors annually (growing)',
-                'climate': 'Hot desert coastal climate. Summer (May-Sept) very hot 40-50°C/104-122°F. Winter (Nov-March) pleasant 15-25°C/59-77°F. Best October-April. Sea breeze provides cooling.',
-            },
-            'scientific-center-kuwait': {
-                'id': 'scientific-center-kuwait',
-                'name': 'Kuwait Scientific Center',
-                'location': 'Salmiya, Kuwait City, Kuwait',
-                'description': 'Educational complex with massive aquarium, IMAX theater, and interactive discovery center.',
-                'long_description': 'The Kuwait Scientific Center is one of the largest and most impressive educational attractions in the Middle East, offering a fascinating blend of marine biology, science education, and entertainment. The centerpiece is the massive Aquarium featuring three main tanks holding 1.5 million liters of water, showcasing marine life from Kuwait Bay, the Arabian Gulf, and the open ocean. Visitors can walk through underwater tunnels surrounded by sharks, rays, and countless fish species. The complex also includes an IMAX theatre with a giant dome screen showing educational and entertainment films, and the Discovery Place with interactive science exhibits for children. The center plays a crucial role in marine conservation and environmental education in Kuwait.',
-                'facts': [
-                    'One of the largest scientific centers in Middle East',
-                    'Aquarium with 1.5 million liters of water',
-                    'Features 100+ species of marine life',
-                    'Underwater walking tunnel for immersive viewing',
-                    'IMAX theater with massive 15x20 meter dome screen',
-                    'Discovery Place interactive science center',
-                    'Focus on Arabian Gulf marine ecosystems',
-                    'Marine conservation and research facility',
-                ],
-                'key_sites': [
-                    {'name': 'Aquarium', 'description': 'Three main tanks with Arabian Gulf marine life, sharks, rays, and underwater tunnel'},
-                    {'name': 'IMAX Theater', 'description': 'Giant dome screen showing 3D educational and entertainment films'},
-                    {'name': 'Discovery Place', 'description': 'Interactive science exhibits and hands-on learning for children'},
-                    {'name': 'Marine Biology Lab', 'description': 'Educational displays about marine research and conservation'},
-                ],
-                'entrance_fees': 'Aquarium: Adults KWD 2.5 ($8), Children KWD 1.5 ($5). IMAX: KWD 2-3 ($6.50-10). Combined tickets available.',
-                'opening_hours': 'Sunday-Thursday: 9:00 AM - 5:00 PM. Friday-Saturday: 9:00 AM - 9:00 PM. Extended hours during holidays. IMAX shows scheduled throughout day.',
-                'best_time': 'Weekday mornings less crowded. Weekends busy with families. Morning visits best for aquarium. Check IMAX show schedule. Year-round attraction.',
-                'how_to_get_there': 'Located on Arabian Gulf Street in Salmiya area. 20 minutes from Kuwait City center. Accessible by taxi, Uber, or Careem. Parking available on-site.',
-                'what_to_wear': 'Casual comfortable clothing. Indoor air-conditioned environment. Comfortable shoes for walking. Bring camera for aquarium photos.',
-                'visitor_tips': [
-                    'Allow 3-4 hours for full experience',
-                    'Start with aquarium during morning feeding times',
-                    'Book IMAX tickets in advance for popular shows',
-                    'Discovery Place excellent for children',
-                    'Guided aquarium tours enhance experience',
-                    'Café on-site for snacks and refreshments',
-                    'Photography allowed in aquarium (no flash)',
-                    'Interactive feeding demonstrations scheduled daily',
-                    'Gift shop has educational toys and books',
-                    'Combine with beach visit on Arabian Gulf Street',
-                ],
-                'discovery': 'Opened 2000 as major educational initiative. Built with focus on environmental and marine education. Supported by Kuwait Foundation for Advancement of Sciences.',
-                'architecture': 'Modern oceanographic center design. Large aquarium tanks with acrylic tunnel. Purpose-built IMAX dome theater. Interactive exhibition spaces. Waterfront location.',
-                'cultural_impact': 'Major educational resource for Kuwait. Promotes environmental awareness and marine conservation. Popular family attraction. Important for scientific research and education.',
-                'conservation': 'Active marine conservation programs. Research on Arabian Gulf ecosystems. Breeding programs for endangered species. Educational outreach on environmental protection. Sustainable aquarium management.',
-                'health_safety': 'Modern safe facility. Accessible pathways and elevators. First aid available. Security personnel present. Emergency procedures. Clean well-maintained environment.',
-                'guided_tours': 'Guided aquarium tours with marine biologists. Educational programs for schools. Behind-the-scenes tours available. Special feeding time tours.',
-                'nearby_attractions': 'Arabian Gulf beaches (adjacent), Marina Crescent (5 min), The Avenues Mall (10 min), Kuwait Towers (15 min)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1559827260-dc66d52bef19?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '29.3389° N, 48.0875° E',
-                'annual_visitors': '300,000+ visitors annually',
-                'climate': 'Indoor fully climate-controlled year-round. Comfortable temperature. Ideal escape from summer heat. Accessible any season.',
-            },
-            'seif-palace': {
-                'id': 'seif-palace',
-                'name': 'Seif Palace',
-                'location': 'Kuwait City, Kuwait',
-                'description': 'Historic royal palace with distinctive blue-tiled watchtower, seat of Kuwaiti government.',
-                'long_description': 'Seif Palace is one of Kuwait\'s most iconic historic buildings, serving as the official seat of government and reception venue for visiting dignitaries. Built in 1896 and extensively renovated in 1964, the palace is most recognizable by its distinctive watchtower covered in blue tiles that has become a symbol of Kuwait. The palace showcases traditional Islamic architecture combined with modern governmental functions, featuring ornate reception halls, beautiful courtyards, and traditional Kuwaiti decorative elements. The façade is adorned with decorative tiles and carved wooden doors typical of Kuwaiti architectural heritage. While the palace interior is generally closed to the public except during special occasions, the exterior and surrounding grounds offer excellent photo opportunities and a glimpse into Kuwait\'s royal heritage.',
-                'facts': [
-                    'Built in 1896, renovated 1964',
-                    'Official seat of Kuwaiti government',
-                    'Distinctive blue-tiled watchtower',
-                    'Named "Seif" (Sword) Palace',
-                    'Traditional Islamic and Kuwaiti architecture',
-                    'Used for receiving foreign dignitaries',
-                    'Beautifully illuminated at night',
-                    'Interior generally closed to public',
-                ],
-                'key_sites': [
-                    {'name': 'Blue-Tiled Watchtower', 'description': 'Iconic tower covered in distinctive blue tiles, symbol of Kuwait'},
-                    {'name': 'Palace Exterior', 'description': 'Traditional Islamic architecture with decorative tiles and carved doors'},
-                    {'name': 'Palace Grounds', 'description': 'Landscaped areas surrounding palace with photo opportunities'},
-                    {'name': 'Reception Halls', 'description': 'Ornate governmental reception areas (special access only)'},
-                ],
-                'entrance_fees': 'Exterior viewing free. Interior generally closed except special occasions/tours with government permission.',
-                'opening_hours': 'Exterior viewable 24/7. Interior access rare - special occasions only with advance permission.',
-                'best_time': 'Best photographed in morning or evening light. Night illumination spectacular. Best viewed October-April.',
-                'how_to_get_there': 'Located in Kuwait City center near Grand Mosque and Souk Al-Mubarakiya. Walking distance from major attractions. Accessible by taxi, Uber, or Careem.',
-                'what_to_wear': 'Conservative modest dress essential near government buildings. Women should cover shoulders and knees. Men should wear long trousers.',
-                'visitor_tips': [
-                    'View from exterior - interior rarely accessible',
-                    'Best photo spots from front and sides',
-                    'Beautifully illuminated at night',
-                    'Combine with Grand Mosque and Souk visit',
-                    'Respect security personnel and guidelines',
-                    'Photography of exterior allowed',
-                    'Part of historic Kuwait City walking tours',
-                    'Located near other heritage sites',
-                    'Allow 15-30 minutes for exterior viewing',
-                    'Check rare special opening schedules',
-                ],
-                'discovery': 'Built 1896 as official government building. Renovated 1964 with modern additions while preserving traditional features. Continues to serve governmental functions.',
-                'architecture': 'Traditional Kuwaiti Islamic architecture. Distinctive blue-tiled watchtower. Ornate carved wooden doors. Decorative ceramic tiles. Symmetrical facade. Interior features Islamic geometric patterns and calligraphy.',
-                'cultural_impact': 'Symbol of Kuwaiti government and sovereignty. Represents traditional architecture. Important landmark in Kuwait City. Featured in national imagery.',
-                'conservation': 'Protected historic building. Regular maintenance of structure and tiles. Preservation of traditional architectural elements. Government protection.',
-                'health_safety': 'Exterior viewing safe. Security presence around government building. Follow security instructions. Stay in permitted areas.',
-                'guided_tours': 'Included as exterior viewpoint in Kuwait City heritage tours. Rare interior tours may be arranged through official channels.',
-                'nearby_attractions': 'Grand Mosque (500m), Souk Al-Mubarakiya (500m), Kuwait National Museum (1.5 km), Kuwait Towers (2 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '29.3756° N, 47.9908° E',
-                'annual_visitors': 'Exterior viewed by hundreds of thousands annually',
-                'climate': 'Exterior viewing subject to weather. Summer (May-Sept) very hot 40-50°C/104-122°F. Winter (Nov-March) pleasant 15-25°C/59-77°F. Best November-April.',
-            }
-        },
-        'bahrain': {
-            'manama': {
-                'id': 'manama',
-                'name': 'Manama',
-                'location': 'Capital City, Bahrain',
-                'description': 'The vibrant capital of Bahrain, blending modern skyscrapers with traditional souks and cultural heritage.',
-                'long_description': 'Manama is the bustling capital and largest city of Bahrain, home to approximately 600,000 residents (metro area 1.5 million). This dynamic city perfectly embodies Bahrain\'s unique position as a bridge between tradition and modernity. The skyline is dominated by impressive modern architecture including the iconic Bahrain World Trade Center with its revolutionary wind turbines, the Bahrain Financial Harbour towers, and numerous luxury hotels. Yet amidst this modernity, Manama preserves its rich heritage in the labyrinthine alleys of Bab Al Bahrain Souq, where traditional merchants sell spices, textiles, and pearls. The city is Bahrain\'s financial, commercial, and cultural heart, hosting the country\'s major museums, diplomatic missions, and entertainment venues. Manama offers world-class shopping at modern malls like City Centre Bahrain and Seef Mall, alongside traditional markets. The Diplomatic Area features elegant corniche walks along the Persian Gulf, while areas like Adliya and Juffair buzz with international restaurants, cafes, and nightlife. As one of the Gulf\'s most liberal cities, Manama welcomes visitors with open arms and offers a fascinating glimpse into contemporary Bahraini life.',
-                'facts': [
-                    'Capital city with 600,000 residents (1.5M metro)',
-                    'Founded in 1345 as regional trade center',
-                    'Financial hub of Bahrain with major banking district',
-                    'Home to Bahrain\'s major museums and cultural institutions',
-                    'Most liberal city in the Gulf region',
-                    'Historic pearling and trading port',
-                    'Hosts Bahrain Grand Prix Formula 1 race',
-                    'Connected to Saudi Arabia via King Fahd Causeway',
-                ],
-                'key_sites': [
-                    {'name': 'Bab Al Bahrain', 'description': 'Historic gateway to traditional souq with shops, spices, and textiles'},
-                    {'name': 'Bahrain World Trade Center', 'description': 'Iconic twin towers with world\'s first integrated wind turbines'},
-                    {'name': 'Manama Souq', 'description': 'Traditional marketplace with gold, pearls, spices, and handicrafts'},
-                    {'name': 'Diplomatic Area', 'description': 'Modern waterfront district with embassies, hotels, and restaurants'},
-                ],
-                'entrance_fees': 'City exploration free. Individual attractions have separate entrance fees.',
-                'opening_hours': 'City accessible 24/7. Shops typically 9:00 AM - 10:00 PM. Souq 9:00 AM - 8:00 PM (closed Fridays until afternoon).',
-                'best_time': 'October to April for pleasant weather (18-30°C/64-86°F). Avoid summer heat May-September (35-45°C/95-113°F). Spring (March-April) ideal for Formula 1.',
-                'how_to_get_there': 'Bahrain International Airport 7 km northeast. Taxis, Uber, Careem widely available. Connected to Saudi Arabia via 25 km King Fahd Causeway. Public buses operate throughout city.',
-                'what_to_wear': 'Smart casual acceptable in most areas. Conservative dress in souq and residential areas. Beachwear only at beaches/pools. Women should carry scarf for mosques.',
-                'visitor_tips': [
-                    'Start day at Bab Al Bahrain and explore souq',
-                    'Visit Bahrain World Trade Center observation area',
-                    'Experience traditional coffee at souq cafes',
-                    'Explore Adliya district for dining and nightlife',
-                    'Walk along Diplomatic Area corniche at sunset',
-                    'Friday morning souq quieter (shops open afternoon)',
-                    'Haggle politely at traditional markets',
-                    'Try traditional Bahraini cuisine - machboos, muhammar',
-                    'Use metered taxis or ride-hailing apps',
-                    'Download offline maps for navigation',
-                ],
-                'discovery': 'Manama mentioned in Islamic chronicles from 1345 CE. Rose to prominence as pearling and trading center. Became capital of Bahrain under Al Khalifa dynasty (1783). Modernized rapidly after oil discovery (1930s) and independence (1971).',
-                'architecture': 'Blend of modern glass towers and traditional Arabic buildings. Notable structures include Bahrain World Trade Center, Bahrain Financial Harbour, Al Fateh Grand Mosque. Historic areas preserve traditional Gulf architecture with wind towers and coral stone buildings.',
-                'cultural_impact': 'Commercial and cultural capital of Bahrain. Center of Gulf finance and banking. Hosts international events including Formula 1. Hub for arts, museums, and cultural festivals. Known for religious tolerance and cosmopolitan atmosphere.',
-                'conservation': 'Historic souq and Bab Al Bahrain restored and protected. Urban development balanced with heritage preservation. Traditional buildings restored in Muharraq and old Manama areas.',
-                'health_safety': 'Very safe city with low crime rates. Standard urban precautions advised. Excellent medical facilities. Tap water safe. Summer heat requires hydration. COVID-19 protocols as per Bahrain regulations.',
-                'guided_tours': 'City tours available from hotels and tour operators (BD 20-40/person). Walking tours of historic areas. Food tours exploring traditional Bahraini cuisine. Evening tours including souq and corniche.',
-                'nearby_attractions': 'Bahrain Fort (6 km), Bahrain National Museum (2 km), Al Fateh Grand Mosque (3 km), Tree of Life (35 km), Muharraq old city (10 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '26.2285° N, 50.5860° E',
-                'annual_visitors': '5+ million visitors annually',
-                'climate': 'Hot desert climate. Summer (May-Sept) extremely hot 35-45°C/95-113°F with high humidity. Winter (Nov-March) pleasant 15-25°C/59-77°F. Minimal rainfall. Best November-April.',
-            },
-            'bahrain-fort': {
-                'id': 'bahrain-fort',
-                'name': 'Bahrain Fort (Qal\'at al-Bahrain)',
-                'location': 'Karbabad, Bahrain',
-                'description': 'UNESCO World Heritage Site - Ancient fortification with 4,000 years of continuous occupation from Dilmun civilization.',
-                'long_description': 'Bahrain Fort, also known as Qal\'at al-Bahrain or the Portuguese Fort, is one of the most significant archaeological sites in the Persian Gulf and a UNESCO World Heritage Site since 2005. This impressive tell (artificial mound) reveals continuous occupation from around 2300 BC through the 18th century, spanning the ancient Dilmun civilization, Tylos period, and Portuguese colonial era. Archaeological excavations since 1954 have uncovered seven distinct layers of occupation, revealing residential structures, public buildings, commercial areas, and defensive fortifications. The visible fortress ruins date primarily from the Portuguese occupation (1521-1602), built upon earlier Islamic and Dilmun-era structures. The site commands a strategic position overlooking the northern coast, once serving as the capital of the ancient Dilmun civilization - a major trading civilization mentioned in ancient Mesopotamian texts as a mythical paradise. The adjacent state-of-the-art Qal\'at al-Bahrain Museum opened in 2008, showcasing thousands of artifacts discovered at the site including pottery, seals, weapons, and jewelry that illuminate 4,000 years of Bahraini history. Visitors can walk along the restored ramparts, explore excavated areas, and enjoy panoramic views of the sea.',
-                'facts': [
-                    'UNESCO World Heritage Site since 2005',
-                    'Continuous occupation for 4,000+ years (2300 BC - 18th century)',
-                    'Capital of ancient Dilmun civilization',
-                    'Tell (mound) height: 12 meters covering 17.5 hectares',
-                    'Seven distinct archaeological layers uncovered',
-                    'Portuguese fortress built 1521-1602',
-                    'Dilmun mentioned in Mesopotamian texts as paradise',
-                    'Over 500,000 artifacts discovered at site',
-                ],
-                'key_sites': [
-                    {'name': 'Portuguese Fort Ramparts', 'description': 'Impressive fortress walls and towers from 16th century Portuguese occupation'},
-                    {'name': 'Archaeological Tell', 'description': 'Multi-layered mound revealing 4,000 years of continuous habitation'},
-                    {'name': 'Qal\'at al-Bahrain Museum', 'description': 'Modern museum displaying artifacts from excavations including Dilmun seals'},
-                    {'name': 'Excavation Areas', 'description': 'Ongoing archaeological digs revealing residential and commercial structures'},
-                ],
-                'entrance_fees': 'Fort grounds: BD 1.000 (approximately $2.65). Museum: BD 1.000 (approximately $2.65). Combined ticket available. Children under 12 free.',
-                'opening_hours': 'Fort site: Daily 8:00 AM - 8:00 PM (winter), 8:00 AM - 6:30 PM (summer). Museum: Saturday-Thursday 8:00 AM - 8:00 PM, Friday 2:00 PM - 8:00 PM.',
-                'best_time': 'October to April for comfortable exploring (18-30°C/64-86°F). Early morning or late afternoon for best photography and avoiding heat. Avoid summer May-September (35-45°C/95-113°F).',
-                'how_to_get_there': 'Located in Karbabad, 6 km west of Manama. 10-15 minute drive from city center. Accessible by taxi, Uber, Careem (BD 2-3). Limited public bus service. Free parking available.',
-                'what_to_wear': 'Comfortable walking shoes essential for uneven archaeological terrain. Sun protection (hat, sunglasses, sunscreen) crucial. Light breathable clothing. Conservative modest dress recommended.',
-                'visitor_tips': [
-                    'Allow 2-3 hours for fort and museum visit',
-                    'Start with museum for historical context before exploring site',
-                    'Wear sturdy shoes - terrain uneven with stones',
-                    'Bring water bottle - limited shade on site',
-                    'Best photography in golden hour (sunrise/sunset)',
-                    'Climb ramparts for spectacular sea views',
-                    'Guided tours available from museum',
-                    'Download UNESCO WHS app for detailed information',
-                    'Visit early morning to avoid crowds and heat',
-                    'Combine with nearby Barbar Temple visit',
-                ],
-                'discovery': 'Danish archaeological expedition began excavations 1954 under Geoffrey Bibby and P.V. Glob. Revealed Dilmun civilization capital. Ongoing excavations by Bahrain-French team since 1977. Designated UNESCO World Heritage 2005.',
-                'architecture': 'Multi-period architecture spanning 4,000 years. Portuguese fortress (16th century) features thick stone walls, watchtowers, and defensive bastions. Earlier Dilmun-era structures include residential buildings, warehouses, and fortifications. Islamic-period walls and structures. Traditional coral stone and limestone construction.',
-                'cultural_impact': 'Symbol of Bahrain\'s ancient heritage and Dilmun civilization. Major source of national pride. Important archaeological research site advancing Gulf history understanding. Cultural tourism centerpiece. Featured in national emblems and currency.',
-                'conservation': 'Protected UNESCO World Heritage Site. Bahrain Authority for Culture and Antiquities manages conservation. Ongoing archaeological research and excavation. Climate-controlled museum preserves artifacts. Site stabilization and restoration projects. Visitor access balanced with preservation needs.',
-                'health_safety': 'Safe well-maintained site. Watch footing on uneven archaeological areas. Wear sun protection - limited shade. Bring water especially in warm months. Museum air-conditioned. First aid available. Follow marked paths.',
-                'guided_tours': 'Museum offers guided tours in English and Arabic (included in admission). Private tours bookable (BD 10-20/person). Audio guides available. School group educational programs. Specialized archaeological tours available.',
-                'nearby_attractions': 'Barbar Temple (2 km), A\'ali Burial Mounds (8 km), Bahrain National Museum (7 km), Al Fateh Grand Mosque (8 km), Tree of Life (30 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '26.2344° N, 50.5219° E',
-                'annual_visitors': '300,000+ visitors annually',
-                'climate': 'Hot desert climate. Summer (May-Sept) 35-45°C/95-113°F extremely hot for outdoor exploring. Winter (Nov-March) 15-25°C/59-77°F ideal. Minimal rainfall. Best November-April.',
-            },
-            'al-fateh-grand-mosque': {
-                'id': 'al-fateh-grand-mosque',
-                'name': 'Al Fateh Grand Mosque',
-                'location': 'Juffair, Manama, Bahrain',
-                'description': 'Largest mosque in Bahrain accommodating 7,000 worshippers, renowned for its stunning architecture and cultural openness.',
-                'long_description': 'Al Fateh Grand Mosque, also known as Al-Fatih Mosque or Great Mosque, is Bahrain\'s national mosque and one of the largest mosques in the world by capacity, accommodating over 7,000 worshippers simultaneously. Opened in 1988 and named after Ahmed Al Fateh, the conqueror of Bahrain, this architectural masterpiece covers 6,500 square meters and is topped by the world\'s largest fiberglass dome weighing over 60 tonnes. The mosque showcases exquisite Islamic architecture with Italian marble floors, intricate geometric patterns, stunning chandeliers imported from Austria, and elaborate calligraphy adorning the walls. What makes Al Fateh particularly special is its welcoming attitude toward non-Muslim visitors - the mosque actively encourages interfaith dialogue and cultural exchange, offering free guided tours that explain Islamic faith, practices, and architecture. The library attached to the mosque houses nearly 7,000 books covering various Islamic subjects. The magnificent prayer hall features beautiful mashrabiya (wooden lattice) screens, and the outdoor courtyard can accommodate thousands more worshippers during major Islamic occasions. The mosque\'s modern facilities include separate prayer halls for men and women, ablution areas, and a visitors\' center. Its location near the Diplomatic Area makes it easily accessible, and it has become a must-visit destination for tourists seeking to understand Bahraini culture and Islamic traditions.',
-                'facts': [
-                    'Largest mosque in Bahrain - capacity 7,000 worshippers',
-                    'Opened in 1988, named after Ahmed Al Fateh',
-                    'World\'s largest fiberglass dome (60+ tonnes)',
-                    'Covers 6,500 square meters',
-                    'Italian marble floors throughout',
-                    'Library with 7,000+ Islamic books',
-                    'Free guided tours for non-Muslims',
-                    'Austrian chandeliers and Kufi calligraphy',
-                ],
-                'key_sites': [
-                    {'name': 'Grand Prayer Hall', 'description': 'Magnificent main hall with capacity for thousands, featuring stunning dome and chandeliers'},
-                    {'name': 'Fiberglass Dome', 'description': 'World\'s largest fiberglass dome, architectural marvel visible from afar'},
-                    {'name': 'Mosque Library', 'description': 'Extensive collection of 7,000+ books on Islamic subjects and history'},
-                    {'name': 'Courtyard', 'description': 'Beautiful outdoor space accommodating additional worshippers during special occasions'},
-                ],
-                'entrance_fees': 'Free admission for all visitors. Donations appreciated but not required.',
-                'opening_hours': 'Guided tours: Saturday-Thursday 9:00 AM - 4:00 PM. Closed Friday and during prayer times. Tours last approximately 45 minutes. Best to arrive before 3:00 PM.',
-                'best_time': 'October to April for comfortable weather (18-30°C/64-86°F). Morning tours (9:00-11:00 AM) less crowded. Avoid Friday (Islamic holy day) and prayer times (five daily prayers). Ramadan offers special atmosphere but altered schedules.',
-                'how_to_get_there': 'Located in Juffair area, 3 km south of Manama city center. Easily accessible by taxi, Uber, Careem (BD 2-3 from downtown). Near Bahrain National Museum and Financial Harbour. Free parking available.',
-                'what_to_wear': 'Modest conservative dress ESSENTIAL. Women MUST cover hair with headscarf (abayas available free at entrance). Long loose clothing covering arms and legs. No shorts, sleeveless tops, or tight clothing. Remove shoes before entering.',
-                'visitor_tips': [
-                    'Free guided tours highly recommended - very informative',
-                    'Women can borrow abayas at entrance if needed',
-                    'Respect prayer times - tours suspended during prayers',
-                    'Photography allowed inside but ask permission first',
-                    'Arrive 15 minutes before tour for security check',
-                    'Friday closed - plan visit other days',
-                    'Tours in English, Arabic, and other languages',
-                    'Opportunity to ask questions about Islam',
-                    'Combine with National Museum visit (1 km away)',
-                    'Allow 1-1.5 hours for tour and exploration',
-                ],
-                'discovery': 'Built 1987-1988 under patronage of late Emir Isa bin Salman Al Khalifa. Commissioned to serve as national mosque. Named after Ahmed Al Fateh who conquered Bahrain in 1783. Became center for Islamic learning and interfaith dialogue.',
-                'architecture': 'Contemporary Islamic architecture blending traditional and modern elements. Massive fiberglass dome dominates skyline. Italian marble floors with geometric patterns. Austrian crystal chandeliers. Kufi calligraphy on walls. Mashrabiya wooden screens. Symmetric design following Islamic principles.',
-                'cultural_impact': 'National mosque and symbol of Islamic faith in Bahrain. Center for interfaith dialogue and cultural exchange. Major tourist attraction welcoming people of all faiths. Promotes understanding of Islamic culture and traditions. Hosts important national Islamic celebrations.',
-                'conservation': 'Well-maintained by Ministry of Justice and Islamic Affairs. Regular cleaning and maintenance of marble and decorative elements. Climate control protects interior. Security systems in place. Ongoing preservation of library collection.',
-                'health_safety': 'Very safe and well-maintained site. Security screening at entrance. Air-conditioned interior comfortable. Ablution areas hygienic. Follow guide instructions. Female guides available for women visitors.',
-                'guided_tours': 'Free guided tours included with admission. Tours Saturday-Thursday 9:00 AM - 4:00 PM (45 minutes duration). English, Arabic, and other language tours available. Educational and informative. Questions encouraged. Group tours welcome with advance notice.',
-                'nearby_attractions': 'Bahrain National Museum (1 km), Bahrain World Trade Center (2 km), Bahrain Financial Harbour (1.5 km), Diplomatic Area waterfront (2 km), Adliya dining district (3 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1564769610856-6c7e08b8e93e?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '26.2169° N, 50.5909° E',
-                'annual_visitors': '200,000+ visitors annually including tourists and worshippers',
-                'climate': 'Indoor air-conditioned comfort. Exterior viewing subject to weather. Summer (May-Sept) 35-45°C/95-113°F. Winter (Nov-March) 15-25°C/59-77°F pleasant. Best November-April.',
-            },
-            'tree-of-life': {
-                'id': 'tree-of-life',
-                'name': 'Tree of Life (Shajarat-al-Hayat)',
-                'location': 'Desert area, Southern Bahrain',
-                'description': 'Mystical 400-year-old mesquite tree thriving alone in the desert, Bahrain\'s most iconic natural wonder.',
-                'long_description': 'The Tree of Life is one of Bahrain\'s most remarkable natural wonders and popular tourist attractions - a solitary Prosopis cineraria (mesquite) tree that has survived for over 400 years in the harsh desert environment, approximately 2 kilometers from Jebel Dukhan (Mountain of Smoke). Standing 9.75 meters (32 feet) tall with a sprawling canopy, this tree has mystified scientists, botanists, and visitors for generations because it appears to have no apparent water source in the barren landscape. The tree has become a symbol of resilience and life, attracting approximately 65,000 visitors annually who come to marvel at this botanical mystery. Local legends attribute the tree\'s survival to its location on an ancient trade route, while others speak of its mythical connection to the ancient Garden of Eden believed by some to have been located in Bahrain (ancient Dilmun). Scientific theories suggest the tree\'s deep root system may tap into underground water sources, though the exact mechanism remains a subject of ongoing research. The tree stands in splendid isolation on a small hillock in the desert, creating a dramatic and photogenic scene, especially during sunrise and sunset. The site has been developed with pathways, viewing areas, and signage, though the natural setting remains relatively untouched. Its cultural significance extends beyond tourism - it appears on postcards, paintings, and photographs symbolizing Bahrain\'s connection to nature and ancient history.',
-                'facts': [
-                    'Age: Over 400 years old',
-                    'Height: 9.75 meters (32 feet)',
-                    'Species: Prosopis cineraria (Mesquite)',
-                    'No apparent water source in surrounding desert',
-                    'Attracts 65,000+ visitors annually',
-                    'Located 2 km from Jebel Dukhan',
-                    'Canopy provides 9-meter diameter shade',
-                    'Associated with Garden of Eden legends',
-                ],
-                'key_sites': [
-                    {'name': 'The Ancient Tree', 'description': 'The remarkable mesquite tree standing alone in desert landscape'},
-                    {'name': 'Viewing Platform', 'description': 'Elevated areas for photographs and appreciation of the tree'},
-                    {'name': 'Desert Landscape', 'description': 'Surrounding barren terrain emphasizing tree\'s miraculous survival'},
-                    {'name': 'Jebel Dukhan', 'description': 'Nearby hill (Mountain of Smoke), Bahrain\'s highest point at 134 meters'},
-                ],
-                'entrance_fees': 'Free access - no entrance fee. Open public desert location.',
-                'opening_hours': 'Accessible 24/7 (open desert location). Best visited early morning (6:00-9:00 AM) or late afternoon (4:00-6:00 PM) to avoid midday heat.',
-                'best_time': 'October to April for comfortable weather (18-30°C/64-86°F). Early morning or sunset for best photography and avoiding heat. Avoid summer May-September (40-50°C/104-122°F) - dangerously hot. Winter months ideal.',
-                'how_to_get_there': 'Located 40 km south of Manama in southern desert region. Approximately 35-45 minute drive. Car rental or taxi necessary - no public transport. Accessible via paved roads. GPS coordinates essential. Signposted from main highway. 4WD not required - regular cars accessible.',
-                'what_to_wear': 'Desert appropriate clothing - light breathable fabrics. Sun protection ESSENTIAL (hat, sunglasses, high SPF sunscreen). Comfortable walking shoes. Avoid dark colors (attract heat). Light long sleeves recommended for sun protection.',
-                'visitor_tips': [
-                    'Visit early morning or late afternoon - avoid midday heat',
-                    'Bring plenty of water - no facilities on site',
-                    'Use GPS coordinates - easy to miss turnoffs',
-                    'Best photography at sunrise/sunset golden hour',
-                    'No shade except under tree - plan accordingly',
-                    'Combine with Jebel Dukhan visit nearby',
-                    'Allow 45-60 minutes for visit and photos',
-                    'No facilities - use restrooms before visiting',
-                    'Check weather forecast - avoid sandstorms',
-                    'Respectful behavior - don\'t damage tree or carve names',
-                ],
-                'discovery': 'Tree estimated 400+ years old, predating modern Bahrain. Long known to locals and travelers on ancient trade routes. Gained international fame in 1960s-70s as tourism developed. Subject of numerous scientific studies attempting to explain survival mechanism.',
-                'architecture': 'Natural wonder - no built architecture. Surrounding area developed with pathways, viewing areas, and directional signage. Minimal intervention to preserve natural desert setting.',
-                'cultural_impact': 'National symbol of Bahrain appearing on tourism materials. Represents resilience, life, and mystery. Featured in Bahraini art, photography, and literature. Connection to Garden of Eden mythology adds mystical significance. Major tourist attraction and point of national pride.',
-                'conservation': 'Protected natural monument. Fenced area prevents vehicle damage. Regular monitoring by environmental authorities. Minimal intervention philosophy. Visitors encouraged to respect tree. Educational signage about conservation. Some concern about increased visitor impact.',
-                'health_safety': 'Safe location but extreme heat precautions essential. Bring water - risk of dehydration. Sun exposure dangerous in summer. No medical facilities nearby. Desert wildlife (snakes, scorpions) - stay on paths. Mobile phone coverage generally good.',
-                'guided_tours': 'Included in most Bahrain desert tours (BD 30-50/person). Half-day tours typically combine with Jebel Dukhan, oil well, and camel farm. Full-day tours may include other southern attractions. Private tours available. Self-drive popular option.',
-                'nearby_attractions': 'Jebel Dukhan/Mountain of Smoke (2 km), Oil Museum (15 km), Sakhir Royal Camel Farm (20 km), Bahrain International Circuit (30 km), A\'ali pottery village (25 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1509023464722-18d996393ca8?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '25.9942° N, 50.5832° E',
-                'annual_visitors': '65,000+ visitors annually',
-                'climate': 'Extreme desert climate. Summer (May-Sept) 40-50°C/104-122°F dangerously hot - NOT recommended. Winter (Nov-March) 15-25°C/59-77°F pleasant. Minimal rainfall. Strong afternoon sun year-round. Best November-March.',
-            },
-            'bahrain-national-museum': {
-                'id': 'bahrain-national-museum',
-                'name': 'Bahrain National Museum',
-                'location': 'Manama, Bahrain',
-                'description': 'Premier national museum showcasing 6,000 years of Bahraini history from ancient Dilmun civilization to modern era.',
-                'long_description': 'The Bahrain National Museum is the country\'s premier cultural institution and the largest museum in Bahrain, offering a comprehensive journey through 6,000 years of the island\'s rich history. Opened in 1988 and designed by Danish architects Krohn and Hartvig Rasmussen, this stunning modern building covers 27,800 square meters overlooking a beautiful lagoon near the King Faisal Highway. The museum\'s extensive collection includes archaeological artifacts from the ancient Dilmun civilization (dating back to 3000 BC), Tylos period treasures, and Islamic-era relics. The ground floor features the impressive Dilmun Hall showcasing burial mounds, pottery, and the famous Dilmun seals, while the Tylos Hall displays artifacts from the Hellenistic period. Upper floors house the Customs and Traditions galleries, featuring life-sized dioramas depicting traditional Bahraini crafts, pearl diving, and daily life scenes. The Documents and Manuscripts Hall contains ancient Qurans and historical documents. The museum also features natural history sections with information about Bahrain\'s flora, fauna, and geological history. The Hall of Graves contains actual burial chambers excavated and reassembled within the museum. Recent renovations have enhanced the visitor experience with interactive displays and multimedia presentations. The museum\'s architecture itself is noteworthy, with its geometric white facades and integration with the surrounding landscape and artificial lagoon.',
-                'facts': [
-                    'Opened in 1988, largest museum in Bahrain',
-                    'Covers 27,800 square meters',
-                    'Showcases 6,000 years of Bahraini history',
-                    'Extensive Dilmun civilization collection (3000 BC)',
-                    'Contains actual ancient burial chambers',
-                    'Over 4,000 artifacts on display',
-                    'Designed by Danish architects',
-                    'Beautiful waterfront location with lagoon',
-                ],
-                'key_sites': [
-                    {'name': 'Dilmun Hall', 'description': 'Ancient Dilmun civilization artifacts including famous seals, pottery, and burial goods'},
-                    {'name': 'Hall of Graves', 'description': 'Authentic burial chambers excavated and reassembled within museum'},
-                    {'name': 'Customs and Traditions Galleries', 'description': 'Life-sized dioramas of traditional Bahraini life, crafts, and pearl diving'},
-                    {'name': 'Natural History Section', 'description': 'Bahrain\'s flora, fauna, geology, and marine environment displays'},
-                ],
-                'entrance_fees': 'Adults: BD 0.500 (approximately $1.30). Students/Seniors: BD 0.200. Children under 6: Free. Bahraini nationals: Free. Thursday: Free admission for all.',
-                'opening_hours': 'Saturday-Wednesday 8:00 AM - 8:00 PM. Thursday 8:00 AM - 8:00 PM (free admission). Friday 3:00 PM - 8:00 PM. Closed on public holidays.',
-                'best_time': 'Thursday for free admission. Weekday mornings (9:00-11:00 AM) less crowded. October-April for comfortable weather. Allow 2-3 hours minimum for comprehensive visit.',
-                'how_to_get_there': 'Located on King Faisal Highway near Al Fateh Grand Mosque, 2 km south of Manama center. Accessible by taxi, Uber, Careem (BD 2-3). Limited public bus service. Ample free parking available.',
-                'what_to_wear': 'Smart casual acceptable. Air-conditioned interior. Modest dress recommended. Comfortable walking shoes for extensive galleries. Light layers advisable.',
-                'visitor_tips': [
-                    'Allow minimum 2-3 hours for full exploration',
-                    'Start with Dilmun Hall for chronological experience',
-                    'Thursday offers free admission - can be crowded',
-                    'Photography allowed but no flash near artifacts',
-                    'Audio guides available in multiple languages',
-                    'Museum cafe for refreshments with lagoon views',
-                    'Gift shop with books and souvenirs',
-                    'Download museum app for enhanced information',
-                    'School groups weekday mornings - may be busy',
-                    'Combine with Al Fateh Mosque visit (1 km)',
-                ],
-                'discovery': 'Museum opened December 15, 1988 to preserve and showcase Bahrain\'s heritage. Built to house archaeological discoveries from numerous excavations across Bahrain. Major renovation 2008-2011 modernized exhibits with interactive displays.',
-                'architecture': 'Modern architectural masterpiece by Danish architects. White geometric facades with Islamic influences. Integration with artificial lagoon and waterfront. Natural lighting through strategic skylights. Open floor plans for spacious galleries. Sustainable design with natural ventilation.',
-                'cultural_impact': 'Premier national cultural institution. Major tourist attraction. Educational center for Bahraini heritage. Research facility for archaeologists and historians. Symbol of national pride. Hosts temporary international exhibitions. Center for cultural events and lectures.',
-                'conservation': 'Climate-controlled environment protects artifacts. Professional conservation laboratory on-site. Regular maintenance of collection. Digital archiving of collections. Collaboration with international museums. Ongoing archaeological research support.',
-                'health_safety': 'Well-maintained safe facility. Air-conditioned comfortable environment. Wheelchair accessible. First aid available. Security personnel present. Emergency exits clearly marked. COVID-19 protocols as per Bahrain regulations.',
-                'guided_tours': 'Free guided tours available (advance booking recommended). Audio guides rental BD 2. Private guided tours bookable (BD 20-30). School program tours. Specialized archaeological tours available. Tours in English, Arabic, and other languages.',
-                'nearby_attractions': 'Al Fateh Grand Mosque (1 km), Bahrain World Trade Center (1.5 km), Bahrain Financial Harbour (2 km), Bab Al Bahrain and Souq (3 km), Bahrain Fort (6 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1566127444979-b3d2b3dbb224?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '26.2078° N, 50.5973° E',
-                'annual_visitors': '250,000+ visitors annually',
-                'climate': 'Indoor air-conditioned comfort year-round. Summer (May-Sept) exterior hot 35-45°C/95-113°F. Winter (Nov-March) pleasant 15-25°C/59-77°F. Best visiting November-April.',
-            },
-            'bahrain-world-trade-center': {
-                'id': 'bahrain-world-trade-center',
-                'name': 'Bahrain World Trade Center',
-                'location': 'Manama, Bahrain',
-                'description': 'Iconic twin towers with world\'s first integrated wind turbines, symbol of modern Bahrain architecture.',
-                'long_description': 'The Bahrain World Trade Center is an iconic architectural landmark and a symbol of Bahrain\'s commitment to sustainable development and innovative design. Completed in 2008, these 240-meter (787-foot) twin towers were designed by Atkins architectural firm and represent a groundbreaking achievement in green architecture - they were the world\'s first skyscraper to integrate wind turbines into its design. Three massive 29-meter diameter wind turbines are suspended between the two sail-shaped towers, positioned to capture the prevailing onshore Gulf breeze. These turbines can generate 11-15% of the towers\' total power consumption, equivalent to providing electricity for approximately 300 homes. The building\'s distinctive sail-shaped profile channels wind through the turbines, maximizing their efficiency. The complex houses luxury offices, high-end retail spaces, and the five-star Sheraton Bahrain Hotel. The towers\' design was inspired by traditional Arabian wind towers (barjeel) and modern sailing aesthetics, creating a structure that is both culturally rooted and futuristically innovative. At night, the building is dramatically illuminated, becoming a prominent feature of Manama\'s skyline. The BWTC has won numerous international awards for sustainable architecture and has inspired similar renewable energy integration in buildings worldwide. While primarily a commercial building with limited public access, the exterior and surrounding area offer excellent photography opportunities, and the building has become one of Bahrain\'s most recognizable landmarks.',
-                'facts': [
-                    'Height: 240 meters (787 feet), 50 floors each tower',
-                    'Completed in 2008, designed by Atkins',
-                    'World\'s first skyscraper with integrated wind turbines',
-                    'Three 29-meter diameter wind turbines',
-                    'Turbines generate 11-15% of building\'s power',
-                    'Equivalent to electricity for 300 homes',
-                    'Houses Sheraton Bahrain Hotel',
-                    'Multiple international architecture awards',
-                ],
-                'key_sites': [
-                    {'name': 'Twin Towers Exterior', 'description': 'Iconic sail-shaped towers visible across Manama skyline'},
-                    {'name': 'Wind Turbines', 'description': 'Three massive 29-meter turbines suspended between towers'},
-                    {'name': 'Retail Promenade', 'description': 'Ground floor shopping and dining area accessible to public'},
-                    {'name': 'Sheraton Hotel', 'description': 'Five-star hotel occupying upper floors with panoramic views'},
-                ],
-                'entrance_fees': 'Public exterior viewing free. Building interior (offices/hotel) restricted to tenants/guests. No dedicated observation deck.',
-                'opening_hours': 'Exterior viewable 24/7. Retail areas typically 10:00 AM - 10:00 PM. Hotel accessible to guests and restaurant patrons.',
-                'best_time': 'Best photographed during golden hour (sunset) or at night when dramatically illuminated. October-April for comfortable outdoor viewing. Windy days to see turbines in motion.',
-                'how_to_get_there': 'Located in Manama Financial District near Bahrain Bay. 2 km from city center. Accessible by taxi, Uber, Careem (BD 2-3). Near Bahrain National Museum and Al Fateh Mosque. Limited public parking.',
-                'what_to_wear': 'Business casual if visiting retail/hotel areas. Comfortable clothing for exterior viewing. Sun protection for daytime photography.',
-                'visitor_tips': [
-                    'Best viewed from exterior - limited public interior access',
-                    'Excellent photo spot from nearby waterfront',
-                    'Visit at night for stunning illuminated view',
-                    'Windy days best to see turbines rotating',
-                    'Combine with Bahrain Bay waterfront walk',
-                    'Retail areas and cafes accessible without building access',
-                    'Hotel restaurants offer interior experience',
-                    'Part of architectural walking tours',
-                    'Allow 30-45 minutes for exterior viewing',
-                    'Photography unrestricted from public areas',
-                ],
-                'discovery': 'Competition-winning design by Atkins 2002. Construction 2004-2008. Inaugurated as revolutionary sustainable design. First operational building-integrated wind turbines. Set new standard for green skyscrapers globally.',
-                'architecture': 'Two elliptical sail-shaped towers creating aerodynamic funnel. Tapering design channels wind to turbines. Glass curtain walls with aluminum cladding. Inspired by traditional Arabian wind towers and dhow sails. Each tower 240m tall with 50 floors. Structural engineering marvel.',
-                'cultural_impact': 'Symbol of modern Bahrain and sustainable development. Featured prominently in national branding. Won multiple international architecture awards including LEAF Award 2006. Inspired worldwide green building movement. Major tourist attraction and photography subject.',
-                'conservation': 'Regular maintenance of wind turbines and building systems. Energy monitoring systems. Sustainable building management practices. Green building certification. Model for future eco-friendly developments.',
-                'health_safety': 'Safe public viewing from exterior areas. Building security for interior access. Well-lit pedestrian areas. Standard urban precautions. First aid available in hotel/offices.',
-                'guided_tours': 'Included in Manama architectural tours (BD 25-40/person). Building interior tours not regularly available. Engineering tours can be arranged for professional groups. Hotel guests may access certain areas.',
-                'nearby_attractions': 'Bahrain Bay waterfront (500m), Bahrain National Museum (1 km), Al Fateh Grand Mosque (1.5 km), Bahrain Financial Harbour (1 km), Manama Souq (2 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '26.2317° N, 50.5825° E',
-                'annual_visitors': 'Exterior viewed by hundreds of thousands. Hotel/retail visitors exceed 500,000 annually',
-                'climate': 'Exterior viewing subject to weather. Summer (May-Sept) 35-45°C/95-113°F hot. Winter (Nov-March) 15-25°C/59-77°F pleasant. Interior air-conditioned. Best November-April.',
-            },
-            'bab-al-bahrain': {
-                'id': 'bab-al-bahrain',
-                'name': 'Bab Al Bahrain',
-                'location': 'Manama, Bahrain',
-                'description': 'Historic gateway building marking the entrance to traditional Manama Souq, iconic symbol of old Bahrain.',
-                'long_description': 'Bab Al Bahrain (Gateway of Bahrain) is one of Manama\'s most recognizable historical landmarks and serves as the ceremonial entrance to the traditional Manama Souq. Built in 1945 by British advisor Sir Charles Belgrave, this striking building was designed by British architect Charles Davis and originally stood on the waterfront before land reclamation pushed the coastline further north. The three-arched gateway features distinctive Islamic architectural elements combined with British colonial influences, creating a unique blend that reflects Bahrain\'s 20th-century history. The building was renovated and expanded in 1986, adding a tower and modern facilities while preserving its historical character. Today, Bab Al Bahrain houses government offices on upper floors and serves as the symbolic entrance to the bustling souq behind it, where narrow lanes are filled with shops selling gold, pearls, spices, textiles, and traditional handicrafts. The building\'s facade features beautiful geometric patterns, ornate arches, and decorative elements typical of Islamic architecture. The area around Bab Al Bahrain has been pedestrianized and landscaped, creating a pleasant plaza with seating areas, fountains, and palm trees. At night, the building is beautifully illuminated, making it a popular photography spot. The structure represents the transition from traditional Bahrain to the modern era and remains a beloved landmark for both locals and tourists.',
-                'facts': [
-                    'Built in 1945 by Sir Charles Belgrave',
-                    'Designed by British architect Charles Davis',
-                    'Originally on waterfront (before land reclamation)',
-                    'Renovated and expanded in 1986',
-                    'Three-arched gateway with Islamic architecture',
-                    'Marks entrance to historic Manama Souq',
-                    'Government offices occupy upper floors',
-                    'Pedestrianized plaza surrounds building',
-                ],
-                'key_sites': [
-                    {'name': 'Gateway Building', 'description': 'Historic three-arched structure with Islamic and colonial architecture'},
-                    {'name': 'Manama Souq', 'description': 'Traditional market behind gateway with gold, spices, textiles, pearls'},
-                    {'name': 'Plaza Area', 'description': 'Landscaped pedestrian space with seating and fountains'},
-                    {'name': 'Gold Souq', 'description': 'Specialized section of souq featuring numerous gold jewelry shops'},
-                ],
-                'entrance_fees': 'Free - public space and souq entrance. Individual shop purchases separate.',
-                'opening_hours': 'Gateway viewable 24/7. Souq shops typically Saturday-Thursday 9:00 AM - 1:00 PM and 4:00 PM - 8:00 PM. Friday afternoon only. Some shops close Friday.',
-                'best_time': 'October-April for comfortable weather (18-30°C/64-86°F). Morning 9:00-11:00 AM or evening 5:00-7:00 PM for active souq atmosphere. Evening for beautifully illuminated gateway. Avoid Friday morning (shops closed).',
-                'how_to_get_there': 'Located in central Manama near Government Avenue. Walking distance from major hotels. Accessible by taxi, Uber, Careem (BD 2-3 from most areas). Limited parking nearby - public transport recommended.',
-                'what_to_wear': 'Modest conservative dress for souq area. Cover shoulders and knees. Comfortable walking shoes for souq exploration. Light breathable fabrics. Women may want scarf handy.',
-                'visitor_tips': [
-                    'Start exploration at gateway, then explore souq',
-                    'Allow 2-3 hours for leisurely souq browsing',
-                    'Haggling expected and encouraged in souq',
-                    'Gold prices competitive - check gold rate',
-                    'Try traditional Bahraini coffee at souq cafes',
-                    'Photography allowed - building beautifully lit at night',
-                    'Small shops accept cash - bring Bahraini dinars',
-                    'Pearls specialty - seek reputable dealers',
-                    'Friday afternoon quieter shopping time',
-                    'Combine with nearby attractions walkable distance',
-                ],
-                'discovery': 'Constructed 1945 under British advisory period. Marked Manama\'s main entrance from port area. Originally customs house function. Renovated 1986 preserving historical features. Symbol of Bahrain\'s trading heritage.',
-                'architecture': 'Blend of Islamic and British colonial architecture. Three ornate pointed arches. Geometric Islamic patterns and tilework. Central tower added in 1986 renovation. Symmetrical facade with decorative elements. Cream and beige stonework.',
-                'cultural_impact': 'Iconic symbol of Manama and traditional Bahraini commerce. Featured in tourism materials and postcards. Meeting point and landmark for navigation. Represents Bahrain\'s mercantile history. Cultural gathering space. Popular photography location.',
-                'conservation': 'Protected heritage building. 1986 renovation preserved historic character. Regular maintenance of structure and decorative elements. Plaza landscaping maintained. Part of urban heritage preservation efforts.',
-                'health_safety': 'Safe well-maintained area. Security presence. Well-lit at night. Standard urban precautions. Watch belongings in crowded souq. Legitimate shops registered.',
-                'guided_tours': 'Included in Manama heritage walking tours (BD 20-30/person). Souq cultural tours with local guides. Shopping tours with pearl/gold specialist guides. Food tours starting at Bab Al Bahrain.',
-                'nearby_attractions': 'Manama Souq (immediate), Bahrain National Museum (2 km), Al Fateh Grand Mosque (3 km), Bahrain Fort (6 km), Seef Mall (4 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1449844908441-8829872d2607?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '26.2298° N, 50.5785° E',
-                'annual_visitors': '500,000+ pass through gateway to souq annually',
-                'climate': 'Outdoor location. Summer (May-Sept) 35-45°C/95-113°F hot. Winter (Nov-March) 15-25°C/59-77°F pleasant. Souq shops air-conditioned. Best November-April.',
-            },
-            'muharraq-pearling-path': {
-                'id': 'muharraq-pearling-path',
-                'name': 'Muharraq Pearling Path',
-                'location': 'Muharraq City, Bahrain',
-                'description': 'UNESCO World Heritage Site showcasing Bahrain\'s pearling heritage through restored houses, forts, and seashore.',
-                'long_description': 'The Pearling Path (Pearling, Testimony of an Island Economy) in Muharraq is a UNESCO World Heritage Site inscribed in 2012, representing Bahrain\'s historic pearling economy that dominated the Persian Gulf for centuries until the early 20th century. This 3.5-kilometer heritage trail connects 17 buildings and structures that illustrate the cultural traditions and economic system of pearling that shaped Bahraini society. The path begins at the Bu Mahir Fort (Qalat Bu Mahir) on the seashore where pearling boats once departed, winding through the historic Muharraq lanes past beautifully restored merchants\' houses, pearl divers\' homes, mosques, and shops. Key sites include Bayt Siyadi (merchant house showing wealth from pearling), Bayt Murad (showcasing traditional architecture), the Bin Matar House, and several mosques that served the pearling community. The trail ends at the Muharraq Souq and the traditional dhow-building yards. Each restored building has been converted into museums or cultural centers displaying pearling equipment, historical photographs, traditional architecture, and explaining the social hierarchy of the pearling industry - from wealthy merchants to the divers and crew. Information panels throughout the trail provide historical context in multiple languages. The district preserves the authentic urban fabric of a pearling town, with narrow lanes, traditional Gulf architecture featuring wind towers (barjeel), and coral stone buildings. This living heritage site offers visitors a unique opportunity to walk through history and understand the pearling culture that defined Bahrain for millennia.',
-                'facts': [
-                    'UNESCO World Heritage Site since 2012',
-                    '3.5-kilometer heritage trail through Muharraq',
-                    'Connects 17 historic buildings and structures',
-                    'Pearling dominated Gulf economy until 1930s',
-                    'Restored merchant houses and divers\' homes',
-                    'Traditional Gulf architecture with wind towers',
-                    'Trail from seashore Bu Mahir Fort to souq',
-                    'Living heritage site with residents',
-                ],
-                'key_sites': [
-                    {'name': 'Bu Mahir Fort', 'description': 'Coastal fort where pearling expeditions departed, trail starting point'},
-                    {'name': 'Bayt Siyadi', 'description': 'Restored merchant house showcasing wealth from pearling trade'},
-                    {'name': 'Bayt Murad', 'description': 'Traditional house displaying architecture and pearling family life'},
-                    {'name': 'Bin Matar House', 'description': 'Heritage house museum with pearling artifacts and historical exhibits'},
-                ],
-                'entrance_fees': 'Trail walking free. Individual museums: BD 0.500 (approximately $1.30) each or combined ticket BD 2.000 for all sites. Bahraini nationals free.',
-                'opening_hours': 'Trail accessible 24/7 (outdoor lanes). Museums and heritage houses: Saturday-Thursday 8:00 AM - 2:00 PM and 4:00 PM - 8:00 PM. Friday 4:00 PM - 8:00 PM.',
-                'best_time': 'October-April for comfortable walking (18-30°C/64-86°F). Early morning (8:00-10:00 AM) or late afternoon (4:00-6:00 PM) to avoid heat. Evening for atmospheric ambiance. Allow 2-4 hours for full trail.',
-                'how_to_get_there': 'Located in Muharraq City, 10 km from Manama (15-20 minute drive). Near Bahrain International Airport. Accessible by taxi, Uber, Careem (BD 3-5). Free parking at Bu Mahir Fort. Trail walkable once there.',
-                'what_to_wear': 'Modest conservative dress essential for residential heritage area. Cover shoulders and knees. Comfortable walking shoes for 3.5 km trail. Sun protection (hat, sunglasses). Light breathable clothing. Women should carry scarf.',
-                'visitor_tips': [
-                    'Download UNESCO Pearling Path app for detailed trail info',
-                    'Start at Bu Mahir Fort by seashore',
-                    'Allow 2-4 hours depending on museum visits',
-                    'Wear comfortable shoes - cobblestone lanes',
-                    'Bring water - limited facilities along trail',
-                    'Guided tours highly recommended for full context',
-                    'Combined ticket saves money if visiting multiple houses',
-                    'Respect residents - living heritage community',
-                    'Photography allowed in outdoor areas',
-                    'Visit Sheikh Isa Bin Ali House nearby (not on path but close)',
-                ],
-                'discovery': 'Pearling industry ancient in Gulf, peaked 19th-early 20th century. Declined with Japanese cultured pearls (1930s). Restoration project began 2000s to preserve heritage. UNESCO inscription 2012 recognized cultural significance.',
-                'architecture': 'Traditional Gulf architecture showcasing pearling-era styles. Coral stone and limestone buildings. Wind towers (barjeel) for natural cooling. Decorated doorways and wooden lattice screens. Inner courtyards for family privacy. Varying styles show social hierarchy from merchant palaces to divers\' modest homes.',
-                'cultural_impact': 'Represents Bahrain\'s cultural identity rooted in pearling heritage. UNESCO recognition brought international attention. Model for heritage preservation in Gulf region. Educational resource about traditional economy. Source of national pride. Living museum integrating residents.',
-                'conservation': 'Protected UNESCO World Heritage Site. Bahrain Authority for Culture and Antiquities manages conservation. Extensive restoration of 17 heritage buildings. Ongoing maintenance of traditional structures. Community engagement in preservation. Balance between heritage protection and residents\' needs.',
-                'health_safety': 'Safe residential heritage area. Walking trail well-maintained. Watch footing on uneven cobblestones. Sun protection essential. Bring water especially in warm months. Museums air-conditioned. Respect private residences. Police presence.',
-                'guided_tours': 'Official guided tours bookable through Bahrain Tourism (BD 15-25/person). Private tours with heritage specialists (BD 30-50). Audio guides available at Bu Mahir Fort. School educational programs. Photography tours. Duration 2-4 hours.',
-                'nearby_attractions': 'Sheikh Isa Bin Ali House (500m), Bahrain International Airport (3 km), Arad Fort (2 km), Muharraq Souq (500m), Manama (10 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80',
-                ],
-                'coordinates': '26.2557° N, 50.6167° E (Bu Mahir Fort starting point)',
-                'annual_visitors': '100,000+ visitors annually including heritage tourists and researchers',
-                'climate': 'Outdoor walking trail. Summer (May-Sept) 35-45°C/95-113°F too hot for comfortable walking. Winter (Nov-March) 15-25°C/59-77°F ideal. Indoor museums air-conditioned. Best November-April.',
-            },
-            'al-areen-wildlife-park': {
-                'id': 'al-areen-wildlife-park',
-                'name': 'Al Areen Wildlife Park & Reserve',
-                'location': 'Sakhir, Southern Bahrain',
-                'description': 'Nature reserve and wildlife park featuring Arabian wildlife, endangered species, and botanical gardens.',
-                'long_description': 'Al Areen Wildlife Park & Reserve is Bahrain\'s premier nature conservation facility, established in 1975 to protect and preserve Arabian wildlife and native flora. Covering an area of 8 square kilometers, the park is divided into two main sections: a public area with a drive-through safari-style park and a protected reserve area for breeding endangered species. The public park allows visitors to observe over 45 species of animals in natural-like habitats, including Arabian oryx, gazelles, ostriches, hyenas, baboons, and numerous bird species. Many animals are indigenous to the Arabian Peninsula and are part of breeding programs for endangered species. The park also features a reptile house, an aquarium showcasing Gulf marine life, and aviaries with rare and indigenous birds. The botanical gardens display native Arabian plant species adapted to desert conditions, including acacia trees, palms, and drought-resistant shrubs. The reserve section (closed to public to minimize disturbance) houses critical breeding programs for endangered Arabian wildlife, including the endangered Arabian leopard and various antelope species. The park plays an educational role, offering information about desert ecosystems, conservation efforts, and the importance of biodiversity protection. Shaded picnic areas, cafeterias, and children\'s play areas make it a popular family destination, especially during cooler months. The park\'s success in breeding endangered species has contributed to regional conservation efforts and reintroduction programs.',
-                'facts': [
-                    'Established 1975 for Arabian wildlife conservation',
-                    'Covers 8 square kilometers',
-                    'Home to 45+ species of animals and 100+ plant species',
-                    'Breeding program for endangered Arabian species',
-                    'Arabian oryx, gazelles, leopards, hyenas, baboons',
-                    'Drive-through safari-style viewing',
-                    'Botanical gardens with native Arabian plants',
-                    'Protected reserve section closed to public',
-                ],
-                'key_sites': [
-                    {'name': 'Safari Park', 'description': 'Drive-through area with animals in natural habitats including oryx and gazelles'},
-                    {'name': 'Reptile House', 'description': 'Collection of snakes, lizards, and reptiles native to Arabia'},
-                    {'name': 'Botanical Gardens', 'description': 'Native Arabian plant species including acacias, palms, desert flora'},
-                    {'name': 'Aviary', 'description': 'Large bird enclosures with indigenous and migratory species'},
-                ],
-                'entrance_fees': 'Adults: BD 1.000 (approximately $2.65). Children 3-12: BD 0.500. Under 3: Free. Private vehicle: BD 2.000 additional. Bahraini nationals reduced rates.',
-                'opening_hours': 'Daily 8:00 AM - 4:00 PM (last entry 3:00 PM). Closed Tuesdays for maintenance. Extended hours during cooler months (Nov-March). Best to visit morning hours.',
-                'best_time': 'October-April for pleasant weather (18-30°C/64-86°F). Early morning (8:00-10:00 AM) when animals most active. Avoid summer May-September (extremely hot 40-45°C). Winter mornings ideal. Allow 2-3 hours.',
-                'how_to_get_there': 'Located in Sakhir, southern Bahrain, approximately 30 km from Manama (35-40 minute drive). Near Bahrain International Circuit. Accessible by car - taxi, rental, or private vehicle. No public transport. Ample free parking.',
-                'what_to_wear': 'Comfortable casual clothing. Comfortable walking shoes essential. Sun protection (hat, sunglasses, sunscreen) crucial. Light breathable fabrics. Bring water bottle.',
-                'visitor_tips': [
-                    'Visit early morning when animals most active',
-                    'Bring own vehicle for drive-through safari section',
-                    'Allow 2-3 hours minimum for full park visit',
-                    'Pack water and snacks (cafeteria available)',
-                    'Picnic areas available - popular with families',
-                    'Stay in vehicle in safari section',
-                    'Photography allowed - telephoto lens useful',
-                    'Avoid summer months - dangerously hot for animals and visitors',
-                    'Educational signs throughout - read for learning',
-                    'Combine with Bahrain International Circuit visit',
-                ],
-                'discovery': 'Established 1975 by Bahrain government to preserve Arabian wildlife. Successful breeding programs for endangered species including Arabian oryx. Contributed to regional conservation and reintroduction initiatives. Expanded facilities over decades.',
-                'architecture': 'Natural landscape design mimicking desert habitats. Minimal built structures to preserve natural environment. Enclosures designed for animal welfare. Observation points for visitors. Shaded picnic facilities. Desert-appropriate landscaping.',
-                'cultural_impact': 'Important conservation institution for Arabian Peninsula wildlife. Educational center for school children and public. Successful breeding programs support regional conservation. Symbol of Bahrain\'s environmental commitment. Family recreation destination.',
-                'conservation': 'Active breeding programs for endangered Arabian species. Participates in international conservation networks. Research on desert ecology and wildlife. Native plant preservation. Collaboration with regional conservation bodies. Veterinary facilities for animal healthcare.',
-                'health_safety': 'Safe facility with clear rules. Stay in vehicle in safari areas. Follow staff instructions. First aid available. Veterinary staff on-site. Adequate shade and water stations. Sun exposure precautions essential. Emergency protocols in place.',
-                'guided_tours': 'Guided tours available with advance booking (BD 10-15/person). Educational tours for schools. Private tours with conservation specialists. Self-guided drive-through with informational signs. Group bookings accommodated.',
-                'nearby_attractions': 'Bahrain International Circuit (5 km), Tree of Life (15 km), Royal Camel Farm (10 km), Riffa Fort (15 km), Al Dar Islands (20 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1564760055775-d63b17a55c44?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '26.0318° N, 50.5133° E',
-                'annual_visitors': '150,000+ visitors annually, peak season Nov-March',
-                'climate': 'Outdoor facility subject to weather. Summer (May-Sept) 40-50°C/104-122°F extremely hot - limited operations. Winter (Nov-March) 15-25°C/59-77°F ideal. Best November-March.',
-            },
-            'qalat-al-bahrain-museum': {
-                'id': 'qalat-al-bahrain-museum',
-                'name': 'Qal\'at al-Bahrain Site Museum',
-                'location': 'Karbabad, Near Bahrain Fort, Bahrain',
-                'description': 'State-of-the-art archaeological museum at Bahrain Fort showcasing 4,000 years of artifacts from Dilmun civilization.',
-                'long_description': 'The Qal\'at al-Bahrain Site Museum, opened in 2008, is an architectural and archaeological masterpiece located adjacent to the UNESCO World Heritage Site of Bahrain Fort (Qal\'at al-Bahrain). Designed by Danish architects Møllers & Grønborg, this award-winning museum is built into the landscape, partially underground to minimize visual impact on the ancient fort site. The museum\'s collection comprises thousands of artifacts discovered during decades of archaeological excavations at the fort tell, spanning 4,000 years from 2300 BC through the Portuguese occupation. The chronological exhibition guides visitors through the successive civilizations that occupied the site - the ancient Dilmun period (2300-1800 BC), Tylos era (300 BC-600 AD), Islamic period (600-1500 AD), and Portuguese colonial period (1521-1602). Spectacular displays include Dilmun stamp seals (distinctive circular seals used in trade), pottery, weapons, jewelry, domestic items, and skeletal remains showing burial practices. The museum\'s innovative design incorporates natural lighting, rammed-earth walls, and minimalist exhibition spaces that highlight the artifacts. Interactive displays, audiovisual presentations, and detailed explanatory panels provide context for the archaeological discoveries. The museum\'s positioning allows visitors to first understand the site\'s history before walking up to explore the actual fort ruins above. The building itself won multiple international architecture awards for its sensitive integration with the heritage site and sustainable design principles.',
-                'facts': [
-                    'Opened 2008, designed by Møllers & Grønborg architects',
-                    'Built into landscape - partially underground',
-                    'Adjacent to UNESCO World Heritage Bahrain Fort',
-                    'Displays 500+ artifacts spanning 4,000 years',
-                    'Artifacts from 2300 BC Dilmun through Portuguese era',
-                    'Famous Dilmun stamp seals collection',
-                    'Won multiple international architecture awards',
-                    'Rammed-earth walls and sustainable design',
-                ],
-                'key_sites': [
-                    {'name': 'Dilmun Gallery', 'description': 'Ancient Dilmun civilization artifacts including famous stamp seals and burial goods'},
-                    {'name': 'Tylos Period Exhibition', 'description': 'Hellenistic and Tylos-era artifacts showing Greek influence'},
-                    {'name': 'Islamic Period Hall', 'description': 'Medieval Islamic-era pottery, glassware, and architectural elements'},
-                    {'name': 'Portuguese Gallery', 'description': 'Colonial period artifacts from Portuguese occupation 1521-1602'},
-                ],
-                'entrance_fees': 'BD 1.000 (approximately $2.65). Combined with fort grounds BD 2.000. Students/Seniors BD 0.500. Children under 12 free. Bahraini nationals free.',
-                'opening_hours': 'Saturday-Thursday 8:00 AM - 8:00 PM. Friday 2:00 PM - 8:00 PM. Last entry 30 minutes before closing. Closed on public holidays.',
-                'best_time': 'October-April for comfortable weather if visiting fort after museum. Morning (9:00-11:00 AM) or afternoon (3:00-5:00 PM) less crowded. Allow 1-2 hours for museum, additional time for fort site.',
-                'how_to_get_there': 'Located in Karbabad, 6 km west of Manama at Bahrain Fort site. 10-15 minute drive from city center. Accessible by taxi, Uber, Careem (BD 2-3). Free parking available adjacent to museum.',
-                'what_to_wear': 'Smart casual acceptable. Museum fully air-conditioned. Comfortable walking shoes. If visiting fort ruins afterward, sun protection and sturdy shoes essential.',
-                'visitor_tips': [
-                    'Visit museum first for historical context before exploring fort',
-                    'Allow 1-2 hours for museum, 2-3 hours with fort',
-                    'Combined ticket with fort grounds economical',
-                    'Photography allowed without flash',
-                    'Audio guides available in multiple languages',
-                    'Museum cafe with views toward fort',
-                    'Gift shop with archaeological replicas and books',
-                    'Wheelchair accessible throughout',
-                    'Free WiFi available',
-                    'Download fort/museum app for enhanced experience',
-                ],
-                'discovery': 'Built 2005-2008 to house artifacts from fort excavations. Designed to complement UNESCO World Heritage site. Opened February 2008. Winner of Aga Khan Award for Architecture 2010 and other international recognition.',
-                'architecture': 'Award-winning contemporary design by Danish architects. Partially underground structure integrated into landscape. Rammed-earth walls using local materials. Natural lighting through strategic skylights. Minimalist exhibition design. Sustainable environmental systems. Reflects archaeological layers concept.',
-                'cultural_impact': 'World-class archaeological museum raising Bahrain\'s cultural profile. Educational resource for understanding Gulf ancient history. Architectural landmark demonstrating heritage preservation innovation. Model for heritage site museums globally. Research center for archaeologists.',
-                'conservation': 'Climate-controlled environment protects artifacts. Professional conservation laboratory. Digital archiving of collection. Regular maintenance of building and exhibits. Collaboration with international archaeological institutions. Sustainable building management.',
-                'health_safety': 'Safe well-maintained facility. Fully air-conditioned. Wheelchair accessible. First aid available. Emergency exits clearly marked. Security personnel present. Adequate lighting throughout. COVID-19 protocols as per regulations.',
-                'guided_tours': 'Free guided tours included (advance booking recommended). Audio guides available BD 2. Private specialized tours bookable (BD 20-30). Archaeological expert tours for professionals. School educational programs. Tours in English, Arabic, other languages.',
-                'nearby_attractions': 'Bahrain Fort Qal\'at al-Bahrain (adjacent), Barbar Temple (2 km), A\'ali Burial Mounds (8 km), Bahrain National Museum (7 km), Bab Al Bahrain (7 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1566127444979-b3d2b3dbb224?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80',
-                ],
-                'coordinates': '26.2344° N, 50.5219° E',
-                'annual_visitors': '150,000+ visitors annually combined with fort site',
-                'climate': 'Indoor climate-controlled comfort year-round. Adjacent outdoor fort site subject to weather. Summer (May-Sept) 35-45°C/95-113°F. Winter (Nov-March) 15-25°C/59-77°F. Best November-April.',
-            },
-            'adhari-park': {
-                'id': 'adhari-park',
-                'name': 'Adhari Park',
-                'location': 'Tubli, Bahrain',
-                'description': 'Modern family entertainment park featuring thrilling rides, attractions, and traditional Arabian themed areas.',
-                'long_description': 'Adhari Park is Bahrain\'s premier family entertainment destination, opened in 2013 as a major addition to the country\'s leisure and tourism offerings. Spanning 165,000 square meters, this modern amusement park combines international-standard rides with authentic Arabian cultural theming, creating a unique entertainment experience. The park features over 38 rides and attractions divided into themed areas including Adventure Land, Fantasy Land, and Heritage Town which showcases traditional Bahraini architecture and culture. Major attractions include Al Bandair, a thrilling roller coaster; Al Mansur, a tower ride offering 44-meter heights; and Ghazel Al Madina, a spinning ride. Family-friendly options include Jarada Al Filfil (caterpillar ride), Al Firjan (log flume), and Seif Al Bahr (water ride). The Heritage Town section provides cultural experiences with traditional Bahraini architecture, crafts demonstrations, and local cuisine. The park also features Al Sarooh, an interactive fountain show synchronized with music and lights. For younger children, Fantasy Land offers gentler rides including carousels, tea cups, and play areas. The park\'s landscape incorporates lush greenery, water features, and shaded areas. Food courts and restaurants serve international and local cuisine. The park hosts special events during Bahrain\'s National Day, Eid celebrations, and other holidays with extended hours, fireworks, and entertainment shows. Adhari Park has become a major family destination, particularly during evenings and weekends.',
-                'facts': [
-                    'Opened in 2013, covers 165,000 square meters',
-                    '38+ rides and attractions',
-                    'Three main themed areas: Adventure, Fantasy, Heritage',
-                    'Includes traditional Bahraini Heritage Town',
-                    'Al Bandair roller coaster - park\'s signature ride',
-                    'Interactive fountain show Al Sarooh',
-                    'Multiple restaurants and food courts',
-                    'Special events during holidays and celebrations',
-                ],
-                'key_sites': [
-                    {'name': 'Adventure Land', 'description': 'Thrilling rides including Al Bandair roller coaster and Al Mansur tower'},
-                    {'name': 'Heritage Town', 'description': 'Traditional Bahraini architecture, crafts, and cultural experiences'},
-                    {'name': 'Fantasy Land', 'description': 'Family-friendly rides, carousels, and children\'s play areas'},
-                    {'name': 'Al Sarooh Fountain', 'description': 'Interactive musical fountain show with lights and water choreography'},
-                ],
-                'entrance_fees': 'Day pass: BD 15 adults, BD 12 children (3-12). Evening pass (after 5 PM): BD 12 adults, BD 10 children. Under 3: Free. VIP passes available. Prices higher during peak season/holidays.',
-                'opening_hours': 'Thursday-Friday 4:00 PM - 12:00 AM. Saturday-Wednesday 4:00 PM - 11:00 PM. Extended hours during holidays and special events. Summer (June-Aug): May open earlier. Check website for current hours.',
-                'best_time': 'October-April for comfortable weather (evenings 18-25°C/64-77°F). Evening hours when cooler and park atmosphere vibrant. Weekdays less crowded than weekends. Avoid peak holidays unless experiencing special events. Best visits November-March evenings.',
-                'how_to_get_there': 'Located in Tubli area, 10 km south of Manama (15-20 minute drive). Accessible by taxi, Uber, Careem (BD 3-5 from Manama). Free parking available (can be crowded weekends). No direct public transport.',
-                'what_to_wear': 'Casual comfortable clothing. Closed-toe shoes recommended for rides. Light jacket for air-conditioned indoor areas. Modest dress appropriate for family environment. Sunscreen for daytime visits.',
-                'visitor_tips': [
-                    'Purchase tickets online for discounts and skip queues',
-                    'Arrive early evening (4:00-5:00 PM) for shorter ride waits',
-                    'Weekdays significantly less crowded than weekends',
-                    'Bring modest sweater - air-conditioned indoor areas',
-                    'Download park map or app for ride locations',
-                    'Height restrictions apply to thrill rides - check requirements',
-                    'Food and drinks available but outside food prohibited',
-                    'Lockers available for storing belongings',
-                    'Allow 3-4 hours minimum for full experience',
-                    'Special events during Bahrain National Day and Eid',
-                ],
-                'discovery': 'Opened 2013 as major family entertainment destination filling gap in Bahrain leisure market. Named after historic Adhari spring. Developed by Bahrain government investment. Expanded offerings over years with new rides.',
-                'architecture': 'Modern amusement park design with Arabian cultural theming. Traditional Bahraini architectural elements in Heritage Town. Landscaped with gardens, water features, palm trees. Contemporary ride structures. Shaded walkways and rest areas.',
-                'cultural_impact': 'Major family entertainment destination in Bahrain. Popular weekend and holiday gathering place. Showcases Bahraini heritage through Heritage Town. Employment for hundreds of Bahrainis. Boosts domestic tourism. Reduces need to travel abroad for entertainment.',
-                'conservation': 'Landscaped grounds with native and adaptive plants. Energy-efficient ride systems. Waste management and recycling programs. Water features use treated water. Regular maintenance for safety and sustainability.',
-                'health_safety': 'International safety standards for rides. Regular inspections and maintenance. Trained staff and first aid facilities. Height and health restrictions enforced. Security personnel throughout park. Emergency protocols in place. Clear safety instructions.',
-                'guided_tours': 'No formal tours but park staff available for assistance. Group bookings for schools and organizations available with discounts. VIP experiences can be arranged. Birthday party packages with host assistance.',
-                'nearby_attractions': 'Bahrain National Museum (5 km), Al Fateh Grand Mosque (6 km), Bahrain World Trade Center (7 km), City Centre Bahrain mall (8 km), Manama downtown (10 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1575550959106-5a7defe28b56?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1594736797933-d0501ba2fe65?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '26.1914° N, 50.5911° E',
-                'annual_visitors': '400,000+ visitors annually, peak during holidays and winter months',
-                'climate': 'Outdoor park. Summer (May-Sept) 35-45°C/95-113°F extremely hot - evening opening. Winter (Nov-March) 15-25°C/59-77°F pleasant evenings. Indoor air-conditioned areas. Best November-April.',
-            },
-            'lost-paradise-dilmun': {
-                'id': 'lost-paradise-dilmun',
-                'name': 'The Lost Paradise of Dilmun Water Park',
-                'location': 'Al Areen, Bahrain',
-                'description': 'Largest water park in Bahrain featuring Arabian-themed water attractions, pools, and family entertainment.',
-                'long_description': 'The Lost Paradise of Dilmun Water Park is Bahrain\'s largest and most popular aquatic attraction, named after the ancient Dilmun civilization that flourished in Bahrain 5,000 years ago. Opened in 2007 and expanded in subsequent years, this 77,000-square-meter water park offers over 18 slides and attractions themed around the legendary ancient paradise. The park features adrenaline-pumping slides including the Amu Darya Rapids with 165-meter twisting descent, the Shahab\'s Wild Ride body slides, and the family-friendly Al-Kamar Rapids river. The Dilmun Lost City interactive water playground is perfect for younger children with multiple slides, water cannons, and a giant tipping bucket. The massive wave pool Al Bahr Al Rais generates waves up to 1.5 meters high, while the lazy river Al Marjan allows relaxation floating around the park. For thrill-seekers, the Cyclone provides a swirling vortex experience, and the Dark Ride offers an enclosed tube adventure. The park also features the Hofuf Family Float Ride accommodating six people, and the Liwa Loop providing near-vertical drops. Traditional Arabian architectural elements and Dilmun-themed decorations create an authentic cultural atmosphere. Multiple food outlets serve international and local cuisine, while cabana rentals and shaded areas provide respite. The park emphasizes safety with trained lifeguards stationed throughout. During summer months, the park serves as a major cooling-off destination for families, while special evening events and holiday celebrations draw large crowds.',
-                'facts': [
-                    'Opened 2007, covers 77,000 square meters',
-                    'Largest water park in Bahrain',
-                    'Over 18 water slides and attractions',
-                    'Themed after ancient Dilmun civilization',
-                    'Amu Darya Rapids: 165-meter slide',
-                    'Massive wave pool generating 1.5-meter waves',
-                    'Dilmun Lost City interactive children\'s area',
-                    'Multiple pools, lazy river, and family rides',
-                ],
-                'key_sites': [
-                    {'name': 'Amu Darya Rapids', 'description': '165-meter twisting water slide with thrilling drops and turns'},
-                    {'name': 'Al Bahr Al Rais Wave Pool', 'description': 'Massive pool with waves up to 1.5 meters high simulating ocean experience'},
-                    {'name': 'Dilmun Lost City', 'description': 'Interactive water playground for children with slides, sprays, and giant bucket'},
-                    {'name': 'Al Marjan Lazy River', 'description': 'Relaxing river circuit floating around park with gentle current'},
-                ],
-                'entrance_fees': 'Adults: BD 15 (weekdays), BD 18 (weekends/holidays). Children 3-12: BD 12 (weekdays), BD 14 (weekends). Under 3: Free. Twilight tickets (after 3 PM): 20% discount. Season passes available.',
-                'opening_hours': 'Daily 10:00 AM - 6:00 PM (March-October peak season). November-February: Limited days/hours. Summer extended hours on holidays. Check website for seasonal hours. Private evening events possible.',
-                'best_time': 'March-October for full operations (warm water weather). Weekdays less crowded than weekends. Arrive early (10:00 AM opening) for shorter queues. Avoid peak holidays unless accepting crowds. Best May-September for water activities.',
-                'how_to_get_there': 'Located in Al Areen area, southern Bahrain, 25 km from Manama (30-minute drive). Near Al Areen Wildlife Park and Bahrain International Circuit. Accessible by taxi, rental car (BD 5-7 from Manama). Ample free parking. No public transport.',
-                'what_to_wear': 'Swimwear required (modest styles preferred - no bikinis, board shorts acceptable). Bring towels or rent on-site. Waterproof sandals/flip-flops essential. Sunscreen very important. Modest cover-up for non-water areas. Lockers available for belongings.',
-                'visitor_tips': [
-                    'Arrive at opening (10:00 AM) to avoid crowds',
-                    'Rent cabana early for guaranteed shaded space (BD 30-50)',
-                    'Bring/apply waterproof sunscreen - strong sun exposure',
-                    'Lockers available for secure storage (small fee)',
-                    'Life jackets provided free for non-swimmers',
-                    'Height restrictions on some slides - check requirements',
-                    'Food outlets available but outside food prohibited',
-                    'Weekdays significantly less crowded',
-                    'Some attractions may close during cooler months',
-                    'Allow full day (4-6 hours) to experience all rides',
-                ],
-                'discovery': 'Opened 2007 as Bahrain\'s first major water park. Named after ancient Dilmun civilization paradise legend. Expanded with additional slides and attractions. Became primary summer family destination. Peak popularity during hot summer months.',
-                'architecture': 'Arabian and Dilmun civilization themed design. Traditional architectural elements combined with modern water park engineering. Landscaping with palm trees and desert-adapted plants. Shaded structures and cabanas. Safety-focused ride construction.',
-                'cultural_impact': 'Major family entertainment destination especially during summer heat. Important cooling-off venue for residents. Boosts domestic tourism reducing need for travel abroad. Employment for many Bahrainis. Venue for school trips and group outings. Cultural connection to ancient Dilmun heritage.',
-                'conservation': 'Water recycling and filtration systems. Energy-efficient pool heating. Sustainable landscaping with native plants. Waste management programs. Regular water quality monitoring. Balance between entertainment and environmental responsibility.',
-                'health_safety': 'International safety standards for water attractions. Trained lifeguards at all pools and slides. Height and health restrictions enforced. First aid station with medical staff. Regular maintenance and safety inspections. Clear safety rules posted. Security personnel present.',
-                'guided_tours': 'No formal tours - self-guided enjoyment. Group bookings for schools and organizations with discounts. Birthday party packages available with host assistance. VIP cabana service with attendant.',
-                'nearby_attractions': 'Al Areen Wildlife Park (3 km), Bahrain International Circuit (8 km), Tree of Life (18 km), Royal Camel Farm (5 km), Riffa Fort (10 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1561679337-1beec43c91fc?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1575550959106-5a7defe28b56?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '26.0286° N, 50.5156° E',
-                'annual_visitors': '200,000+ visitors annually, peak during summer months (May-September)',
-                'climate': 'Outdoor water park. Summer (May-Sept) 35-45°C/95-113°F hot but water activities refreshing. Winter (Nov-March) 15-25°C/59-77°F too cool for water - limited operations. Best March-October. Closed or limited hours November-February.',
-            },
-        },
-        'oman': {
-            'muscat': {
-                'id': 'muscat',
-                'name': 'Muscat',
-                'location': 'Capital City, Oman',
-                'description': 'The picturesque capital of Oman, nestled between dramatic mountains and the azure Arabian Sea.',
-                'long_description': 'Muscat is the captivating capital and largest city of Oman, home to approximately 1.6 million residents. Unlike other Gulf capitals dominated by modern skyscrapers, Muscat retains a charming low-rise profile with white-washed buildings that harmoniously blend with the dramatic rocky mountains and stunning coastline. The city sprawls along the Gulf of Oman for approximately 200 kilometers, encompassing numerous districts including historic Muttrah with its famous souq and corniche, modern Al Qurum with commercial centers, and the diplomatic area of Shatti Al Qurum. Muscat\'s architecture follows strict building codes that maintain traditional Omani aesthetics - buildings are predominantly white or sand-colored with blue accents, creating a cohesive and aesthetically pleasing urban landscape. The city boasts magnificent landmarks including the Sultan Qaboos Grand Mosque with its stunning chandelier and Persian carpet, the Royal Opera House showcasing world-class performances, and the 16th-century Portuguese forts of Al Jalali and Al Mirani guarding the old harbor. The corniche areas offer scenic waterfront walks with views of the mountains meeting the sea. Muscat combines rich maritime heritage with modern amenities, offering visitors pristine beaches, traditional markets, luxury resorts, and warm Omani hospitality. The city serves as the perfect base for exploring Oman\'s diverse attractions from desert dunes to mountain villages.',
-                'facts': [
-                    'Capital city with 1.6 million residents (metro area)',
-                    'Name means "place of falling" in Arabic',
-                    'Spread along 200 km of coastline',
-                    'Building codes maintain white/sand-colored architecture',
-                    'Ancient capital of Oman since 1793',
-                    'One of oldest cities in Arabian Peninsula',
-                    'Surrounded by Al Hajar Mountains',
-                    'Temperature coastal climate moderated by sea',
-                ],
-                'key_sites': [
-                    {'name': 'Sultan Qaboos Grand Mosque', 'description': 'Magnificent mosque with world\'s second-largest hand-woven carpet'},
-                    {'name': 'Mutrah Souq', 'description': 'Traditional Arabian market with frankincense, spices, and handicrafts'},
-                    {'name': 'Royal Opera House', 'description': 'Premier venue for musical arts with stunning marble architecture'},
-                    {'name': 'Al Jalali and Al Mirani Forts', 'description': '16th-century Portuguese forts guarding Muscat harbor'},
-                ],
-                'entrance_fees': 'City exploration free. Individual attractions have separate entrance fees. Sultan Qaboos Grand Mosque free.',
-                'opening_hours': 'City accessible 24/7. Shops typically 9:00 AM - 1:00 PM and 4:00 PM - 9:00 PM. Souq 9:00 AM - 10:00 PM. Friday morning shops closed.',
-                'best_time': 'October to April for pleasant weather (18-30°C/64-86°F). Avoid summer heat May-September (30-45°C/86-113°F). Winter (Nov-March) ideal for outdoor activities.',
-                'how_to_get_there': 'Muscat International Airport 32 km west of city. Taxis, rental cars widely available. No metro but extensive taxi/bus network. Well-connected by road to other Omani cities.',
-                'what_to_wear': 'Conservative modest dress essential. Women should cover shoulders and knees. Men should wear long trousers. Light breathable fabrics. Casual smart acceptable in hotels/restaurants.',
-                'visitor_tips': [
-                    'Start day at Sultan Qaboos Grand Mosque (Saturday-Thursday morning)',
-                    'Visit Mutrah Souq in evening for best atmosphere',
-                    'Walk Mutrah Corniche at sunset for stunning views',
-                    'Try traditional Omani cuisine - shuwa, majboos, halwa',
-                    'Hire car for maximum flexibility exploring surrounding areas',
-                    'Friday is weekend - many attractions closed morning',
-                    'Bargain politely at traditional markets',
-                    'Download offline maps for navigation',
-                    'Respect Omani culture and traditions',
-                    'Allow 2-3 days minimum to explore Muscat fully',
-                ],
-                'discovery': 'Ancient settlement mentioned in 2nd century CE by Ptolemy. Portuguese captured 1507, building forts. Became capital under Sultan bin Ahmed in 1793. Modernized rapidly under Sultan Qaboos from 1970.',
-                'architecture': 'Unique blend of traditional Omani and modern design. Strict building codes: white/sand-colored buildings, maximum height restrictions, Arabic architectural elements. Traditional wind towers and courtyards preserved.',
-                'cultural_impact': 'Political, economic, and cultural capital of Oman. Center of government, commerce, and diplomacy. Hub for Omani arts, music, and cultural preservation. Known for religious tolerance and peaceful society.',
-                'conservation': 'Historic districts protected. Old Muscat preservation ongoing. Building codes protect aesthetic harmony. Environmental initiatives for coastline protection. Heritage tourism promoted responsibly.',
-                'health_safety': 'Very safe city with low crime rates. Excellent medical facilities. Tap water generally safe. Summer heat requires precautions. Standard travel insurance recommended. Emergency services efficient.',
-                'guided_tours': 'City tours from hotels and operators (OMR 20-40/person). Half-day historical tours. Full-day tours combining city and wadis. Private tours available. Mutrah Souq walking tours.',
-                'nearby_attractions': 'Wadi Shab (90 km), Bimmah Sinkhole (100 km), Nizwa (140 km), Wahiba Sands (180 km), Jebel Akhdar (150 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '23.5880° N, 58.3829° E',
-                'annual_visitors': '3+ million visitors annually',
-                'climate': 'Hot semi-arid climate. Summer (May-Sept) 30-45°C/86-113°F very hot and humid. Winter (Nov-March) 18-28°C/64-82°F pleasant. Minimal rainfall. Best October-April.',
-            },
-            'sultan-qaboos-grand-mosque': {
-                'id': 'sultan-qaboos-grand-mosque',
-                'name': 'Sultan Qaboos Grand Mosque',
-                'location': 'Muscat, Oman',
-                'description': 'Oman\'s premier mosque featuring stunning Islamic architecture, world-class craftsmanship, and second-largest hand-woven carpet.',
-                'long_description': 'The Sultan Qaboos Grand Mosque is Oman\'s most magnificent religious and architectural landmark, inaugurated in 2001 after six years of construction. This stunning mosque can accommodate 20,000 worshippers - 6,500 inside the prayer halls and 14,500 in the outer courtyards. The mosque is renowned for its exceptional craftsmanship and attention to detail, featuring a magnificent main prayer hall covered by the world\'s second-largest hand-woven Persian carpet, measuring 4,200 square meters with 1.7 billion knots, woven by 600 women over four years. The prayer hall is illuminated by a spectacular Swarovski crystal chandelier weighing 8.5 tonnes and containing 1,122 bulbs - one of the world\'s largest chandeliers. The mosque\'s design blends various Islamic architectural styles including Omani, Mughal, Persian, and Moorish influences. The main minaret reaches 90 meters in height, surrounded by four smaller minarets. The complex covers 416,000 square meters and includes extensive courtyards paved with Indian sandstone, a women\'s prayer hall, library, meeting halls, and beautifully landscaped gardens with reflective pools. The walls feature intricate Islamic calligraphy and geometric patterns, while the marble used throughout came from various countries. What makes this mosque particularly special is its welcoming attitude toward non-Muslim visitors - it\'s one of few mosques in Oman open to tourists, promoting interfaith understanding and cultural exchange.',
-                'facts': [
-                    'Inaugurated May 4, 2001, by Sultan Qaboos',
-                    'Capacity 20,000 worshippers (6,500 inside, 14,500 outside)',
-                    'Second-largest hand-woven carpet: 4,200 sqm, 1.7 billion knots',
-                    'Spectacular Swarovski chandelier: 8.5 tonnes, 1,122 bulbs',
-                    'Main minaret 90 meters tall',
-                    'Complex covers 416,000 square meters',
-                    'Blends Omani, Mughal, Persian, Moorish architecture',
-                    'Open to non-Muslim visitors (one of few in Oman)',
-                ],
-                'key_sites': [
-                    {'name': 'Main Prayer Hall', 'description': 'Magnificent hall with world-class carpet and chandelier, stunning dome'},
-                    {'name': 'Women\'s Prayer Hall', 'description': 'Separate prayer area with beautiful decorations and crystal chandelier'},
-                    {'name': 'Grand Courtyards', 'description': 'Expansive paved courtyards with reflective pools and gardens'},
-                    {'name': 'Library and Islamic Information Center', 'description': 'Modern library with Islamic texts and educational resources'},
-                ],
-                'entrance_fees': 'Free admission for all visitors. No entrance fee. Donations appreciated but not required.',
-                'opening_hours': 'Non-Muslim visitors: Saturday-Thursday 8:00 AM - 11:00 AM only. Closed Friday and Islamic holidays. Dress code strictly enforced. Prayer times take precedence.',
-                'best_time': 'October to April for comfortable weather (18-30°C/64-86°F). Arrive early morning (8:00-9:00 AM) to avoid crowds and heat. Avoid Friday (closed). Best November-March.',
-                'how_to_get_there': 'Located in Bausher, 5 km southwest of central Muscat. Accessible by taxi, Uber, Careem (OMR 2-4). Car rental convenient. Free parking available. Well-signposted from main roads.',
-                'what_to_wear': 'STRICT dress code ESSENTIAL. Women MUST wear headscarf, long loose clothing covering entire body, no tight clothes. Men must wear long trousers, shirts with sleeves. Remove shoes before entering. Modest conservative dress absolute requirement.',
-                'visitor_tips': [
-                    'Visit Saturday-Thursday 8:00-11:00 AM only (tourist hours)',
-                    'Friday and Islamic holidays closed to tourists',
-                    'Women must cover hair - bring headscarf',
-                    'Dress modestly - full body coverage required',
-                    'Remove shoes before entering prayer halls',
-                    'Photography allowed but respectful behavior essential',
-                    'Free guided tours available - highly recommended',
-                    'Allow 1-2 hours for visit',
-                    'Arrive early to avoid crowds',
-                    'Respect prayer times - silence essential',
-                ],
-                'discovery': 'Commissioned by Sultan Qaboos bin Said in 1992. Construction 1995-2001. Design competition attracted international architects. Features incorporate global Islamic architectural traditions. Opened May 2001 for Sultan\'s 30th National Day celebration.',
-                'architecture': 'Masterpiece blending global Islamic styles. Omani influences in arches and decorations. Persian elements in tile work. Mughal-inspired domes and minarets. Moorish geometric patterns. Cream-colored sandstone exterior. Intricate calligraphy and mashrabiya screens.',
-                'cultural_impact': 'National symbol of Omani Islamic faith and culture. Premier place of worship in Oman. Promotes interfaith understanding through visitor program. Featured prominently in Omani national identity. Major tourist attraction enhancing cultural tourism.',
-                'conservation': 'Well-maintained by Ministry of Awqaf and Religious Affairs. Regular cleaning and preservation of carpet and chandelier. Climate control protects interior. Strict visitor guidelines preserve sanctity. Professional conservation for calligraphy and decorations.',
-                'health_safety': 'Very safe and well-maintained site. Security personnel present. First aid available. Adequate shade in courtyards. Summer outdoor temperatures extreme - prayer halls air-conditioned. Follow all posted guidelines.',
-                'guided_tours': 'Free guided tours included during visitor hours. English and Arabic tours available. Professional guides explain architecture and Islamic practices. Duration 30-45 minutes. Group tours welcome. Educational and informative.',
-                'nearby_attractions': 'Royal Opera House Muscat (8 km), Mutrah Souq (12 km), Al Alam Palace (14 km), Muscat waterfront (12 km), Qurum Beach (10 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1564769610856-6c7e08b8e93e?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '23.5834° N, 58.3907° E',
-                'annual_visitors': '500,000+ visitors annually including worshippers and tourists',
-                'climate': 'Hot semi-arid. Summer (May-Sept) 35-45°C/95-113°F extremely hot - indoor prayer halls air-conditioned. Winter (Nov-March) 18-28°C/64-82°F pleasant. Best October-April.',
-            },
-            'nizwa-fort': {
-                'id': 'nizwa-fort',
-                'name': 'Nizwa Fort',
-                'location': 'Nizwa, Ad Dakhiliyah Region, Oman',
-                'description': 'Magnificent 17th-century fort with massive circular tower, former capital stronghold of Oman.',
-                'long_description': 'Nizwa Fort is one of Oman\'s most impressive and historically significant fortifications, dominating the landscape of Nizwa, the ancient capital of Oman. Built in the 1650s by Imam Sultan Bin Saif Al Ya\'rubi, the fort took 12 years to complete and served as the administrative center for the Imams who ruled Oman. The fort\'s most distinctive feature is its massive circular tower (donjon) rising 30 meters high with walls 7 meters thick at the base, designed to withstand even cannon attacks. The tower contains a complex network of rooms, passages, narrow staircases, and defensive positions including murder holes, date honey traps, and strategic openings for pouring boiling date honey or firing weapons on attackers. Climbing to the top rewards visitors with spectacular panoramic views of the green Nizwa oasis, surrounding mountains, and the bustling Nizwa souq below. The fort complex also includes residential quarters, wells, date and honey storage rooms, and a prison. Adjacent to the fort is the older Nizwa Castle dating from the 9th century. Recently restored and converted into a museum, the fort now showcases traditional Omani weapons, armor, domestic items, crafts, and provides excellent interpretations of Omani history and fort architecture. The fort represents the pinnacle of Omani defensive architecture and remains one of Oman\'s most visited heritage sites.',
-                'facts': [
-                    'Built 1650s, took 12 years to complete',
-                    'Circular tower 30 meters high, 40 meters diameter',
-                    'Tower walls 7 meters thick at base',
-                    'Built by Imam Sultan Bin Saif Al Ya\'rubi',
-                    'Former administrative center of Omani Imamate',
-                    'Complex defensive features including murder holes',
-                    'Adjacent to 9th-century Nizwa Castle',
-                    'Restored and converted to museum in 1990s',
-                ],
-                'key_sites': [
-                    {'name': 'Circular Tower (Donjon)', 'description': 'Massive 30-meter fortress tower with panoramic views from top'},
-                    {'name': 'Defensive Passages', 'description': 'Complex network of narrow stairs, murder holes, and defensive positions'},
-                    {'name': 'Residential Quarters', 'description': 'Rooms showcasing traditional Omani fort life and exhibits'},
-                    {'name': 'Nizwa Castle', 'description': 'Adjacent 9th-century castle ruins with historical significance'},
-                ],
-                'entrance_fees': 'Adults: OMR 5.000 (approximately $13). Omani nationals: OMR 0.500. Children under 10: Free. Includes fort and castle access.',
-                'opening_hours': 'Saturday-Thursday 9:00 AM - 4:00 PM. Friday 8:00 AM - 11:00 AM. Last entry 30 minutes before closing. Closed some public holidays.',
-                'best_time': 'October to April for comfortable exploring (18-30°C/64-86°F). Early morning (9:00-10:00 AM) or late afternoon (3:00-4:00 PM) for cooler temperatures. Avoid summer May-September (extreme heat 40-48°C). Best November-March.',
-                'how_to_get_there': 'Located in central Nizwa, 140 km southwest of Muscat (1.5-2 hour drive). Well-signposted from main roads. Accessible by rental car, taxi, or organized tours. Parking available near fort. Public buses from Muscat.',
-                'what_to_wear': 'Comfortable walking shoes ESSENTIAL - many steep stairs and uneven surfaces. Conservative modest dress recommended. Sun protection (hat, sunglasses, sunscreen). Light breathable clothing. Avoid heels or sandals.',
-                'visitor_tips': [
-                    'Climb to tower top for spectacular panoramic views',
-                    'Allow 1.5-2 hours for thorough exploration',
-                    'Bring water - climbing tower requires stamina',
-                    'Watch head on low doorways and passages',
-                    'Steep narrow stairs - take your time',
-                    'Combine with Nizwa Souq visit (adjacent)',
-                    'Friday morning visit souq (most active day)',
-                    'Hire guide for detailed historical interpretation',
-                    'Photography excellent from tower top',
-                    'Visit early to avoid midday heat',
-                ],
-                'discovery': 'Built 1650-1660s by Imam Sultan Bin Saif Al Ya\'rubi during Ya\'rubi dynasty. Center of Omani Imamate power. Withstood numerous sieges. Restored 1990s. Converted to museum and opened to public.',
-                'architecture': 'Massive circular donjon tower unique in Omani architecture. Traditional mud-brick and stone construction. Sophisticated defensive design with murder holes, date honey traps, narrow passages. Seven floors connected by narrow staircases. Traditional wind towers for ventilation.',
-                'cultural_impact': 'Symbol of Omani heritage and resistance. Important tourist attraction showcasing military architecture. Educational resource for Omani history. Source of national pride. Featured in Omani cultural materials.',
-                'conservation': 'Protected heritage site under Ministry of Heritage and Tourism. Major restoration 1990s. Ongoing maintenance and preservation. Visitor management balances access with conservation. Traditional restoration techniques used.',
-                'health_safety': 'Safe but physically demanding. Steep narrow stairs require caution. Low doorways - watch head. Adequate shade but carry water. Summer heat extreme - indoor/shaded areas provide relief. First aid available. Follow safety instructions.',
-                'guided_tours': 'Audio guides available OMR 2. Guided tours bookable (OMR 10-15/person). Tour groups from Muscat include Nizwa Fort. Duration 1-2 hours. Educational and informative. English and Arabic guides.',
-                'nearby_attractions': 'Nizwa Souq (adjacent), Bahla Fort (40 km), Jabal Akhdar (60 km), Misfat Al Abriyeen village (45 km), Jabrin Fort (52 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80',
-                ],
-                'coordinates': '22.9333° N, 57.5297° E',
-                'annual_visitors': '200,000+ visitors annually',
-                'climate': 'Hot desert climate. Summer (May-Sept) 40-48°C/104-118°F extremely hot. Winter (Nov-March) 15-28°C/59-82°F pleasant. Minimal rainfall. Best October-April.',
-            },
-            'wahiba-sands': {
-                'id': 'wahiba-sands',
-                'name': 'Wahiba Sands (Sharqiya Sands)',
-                'location': 'Ash Sharqiyah Region, Oman',
-                'description': 'Spectacular desert of golden-red dunes reaching 100 meters, authentic Bedouin camps, and adventure activities.',
-                'long_description': 'Wahiba Sands, also known as Sharqiya Sands, is Oman\'s most accessible and spectacular desert, covering approximately 12,500 square kilometers of rolling dunes in shades of gold, orange, and red. Named after the Bani Wahiba tribe who traditionally inhabit the region, this sand sea features majestic dunes rising up to 100 meters high, constantly shaped by the wind into mesmerizing patterns. The desert showcases classic sandy terrain with striking color variations - from pale golden yellow to deep copper red - creating stunning photographic opportunities, especially during sunrise and sunset. Despite harsh conditions, the desert supports surprising biodiversity including Arabian oryx, gazelles, desert foxes, numerous bird species, and various reptiles adapted to extreme heat. Several Bedouin families continue their traditional semi-nomadic lifestyle in the sands, herding camels and goats, offering visitors authentic cultural insights. The desert is dotted with comfortable desert camps ranging from basic Bedouin-style tents to luxury desert resorts, providing memorable overnight experiences under star-filled skies. Adventure activities include dune bashing in 4x4 vehicles, sandboarding down steep dunes, camel trekking, quad biking, and desert walks. The silence and vastness of Wahiba Sands offer a profound escape from modern life, allowing visitors to experience the desert\'s raw beauty and traditional Bedouin hospitality.',
-                'facts': [
-                    'Covers approximately 12,500 square kilometers',
-                    'Dunes reach up to 100 meters high',
-                    'Named after Bani Wahiba tribe',
-                    'Classic north-south oriented linear dunes',
-                    'Colors range from golden yellow to deep red',
-                    'Home to Bedouin communities and wildlife',
-                    'Supports Arabian oryx, gazelles, desert fox',
-                    'Accessible from Muscat in 2.5-3 hours',
-                ],
-                'key_sites': [
-                    {'name': 'Desert Dune Fields', 'description': 'Majestic rolling dunes up to 100m high in stunning orange-red colors'},
-                    {'name': 'Bedouin Camps', 'description': 'Traditional and luxury desert camps offering authentic overnight experiences'},
-                    {'name': 'Wadi Bani Khalid Oasis', 'description': 'Nearby emerald pools and palm-lined wadi (20 km from desert edge)'},
-                    {'name': 'Desert Wildlife Areas', 'description': 'Habitats for Arabian oryx, gazelles, and desert-adapted species'},
-                ],
-                'entrance_fees': 'Desert access free - no entrance fee. Desert camp overnight: OMR 40-150/person depending on camp luxury level. Includes meals, activities.',
-                'opening_hours': 'Accessible 24/7 (open desert). Desert camps check-in typically 3:00-4:00 PM, check-out 10:00 AM. Day visits possible anytime.',
-                'best_time': 'October to April for comfortable temperatures (15-30°C/59-86°F). Avoid summer May-September (45-50°C/113-122°F dangerously hot). Best November-March. Sunrise/sunset magical golden hour.',
-                'how_to_get_there': 'Located 150-180 km southeast of Muscat (2.5-3 hour drive). 4x4 vehicle ESSENTIAL for desert entry. Accessible via Al Kamil or Bidiyah. Tours from Muscat widely available. Self-drive requires desert driving experience.',
-                'what_to_wear': 'Light breathable long clothing for sun protection. Comfortable closed shoes (sand gets hot). Sunglasses, high SPF sunscreen, hat ESSENTIAL. Warm layers for cold desert nights. Scarf for wind-blown sand.',
-                'visitor_tips': [
-                    '4x4 vehicle with desert driving skills ESSENTIAL',
-                    'Book desert camp in advance (fill quickly in peak season)',
-                    'Bring plenty of water - dehydration risk high',
-                    'Sunrise and sunset offer best temperatures and light',
-                    'Try sandboarding down dunes',
-                    'Experience camel ride for traditional desert travel',
-                    'Overnight stay recommended for full desert experience',
-                    'Star gazing spectacular with zero light pollution',
-                    'Deflate tires for desert driving (inflate before highway)',
-                    'Hire experienced desert guide if unfamiliar with dunes',
-                ],
-                'discovery': 'Long inhabited by Bani Wahiba Bedouin tribe. British scientific expedition 1986 studied desert ecology. Increasingly popular tourist destination from 1990s. Desert camps developed for tourism while preserving Bedouin culture.',
-                'architecture': 'Traditional Bedouin goat-hair tents (bayt al-sha\'ar). Modern desert camps blend traditional style with comfort. Sustainable low-impact desert structures. Some luxury camps feature traditional Omani architecture elements.',
-                'cultural_impact': 'Important for Bedouin cultural preservation. Symbol of Oman\'s desert heritage. Major adventure tourism destination. Educational resource about desert ecology and traditional lifestyles. Supports local Bedouin economy.',
-                'conservation': 'Protected desert ecosystem. Sustainable tourism practices encouraged. 4x4 routes designated to minimize damage. Wildlife conservation efforts for oryx and gazelles. Bedouin traditional practices maintain ecological balance.',
-                'health_safety': 'Extreme heat hazard in summer. Dehydration risk - carry water. Getting lost possible - GPS/guide essential. 4x4 getting stuck - travel in convoy. Snakes and scorpions - check shoes/bags. Mobile coverage limited. Emergency evacuation challenging.',
-                'guided_tours': 'Day tours from Muscat OMR 50-80/person. Overnight tours OMR 120-250 including camp, meals, activities. Private tours available. Multi-day desert expeditions. Includes dune bashing, camel rides, cultural experiences.',
-                'nearby_attractions': 'Wadi Bani Khalid (20 km), Sur coastal town (80 km), Ras Al Jinz turtle reserve (100 km), Al Kamil Bedouin village (30 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1509023464722-18d996393ca8?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '22.4167° N, 58.7167° E (approximate center)',
-                'annual_visitors': '100,000+ visitors annually including day visitors and overnight guests',
-                'climate': 'Extreme desert climate. Summer (May-Sept) 45-50°C/113-122°F dangerously hot days, warm nights. Winter (Nov-March) 25-30°C/77-86°F days, 10-15°C/50-59°F nights (can be cold). Minimal rainfall. Best October-April.',
-            },
-        },
-        'turkey': {
-            'istanbul': {
-                'id': 'istanbul',
-                'name': 'Istanbul',
-                'location': 'Istanbul, Turkey',
-                'description': 'Transcontinental metropolis spanning Europe and Asia, former capital of Byzantine and Ottoman empires, with 15.5 million residents.',
-                'long_description': 'Istanbul, the only city in the world spanning two continents, is a magnificent metropolis where East meets West across the Bosphorus Strait. With a population of 15.5 million, it stands as Turkey\'s cultural, economic, and historic heart. For over 1,600 years, Istanbul served as capital of three great empires - Roman (as Constantinople), Byzantine, and Ottoman - leaving an unparalleled architectural and cultural legacy. The city\'s Historic Areas are UNESCO World Heritage Sites, featuring iconic landmarks like Hagia Sophia, Blue Mosque, and Topkapi Palace. The European side contains the historic Old City (Sultanahmet) with ancient monuments, the modern Beyoğlu district with Istiklal Street and Galata Tower, and business centers like Levent and Maslak. The Asian side (Anatolia) offers residential neighborhoods like Kadıköy and Üsküdar with authentic Turkish atmosphere. The Bosphorus Strait, connecting Black Sea to Mediterranean, provides stunning waterfront vistas, historic yalı mansions, and ferry rides. Istanbul boasts world-class museums, vibrant bazaars (Grand Bazaar, Spice Bazaar), sophisticated dining from street food to Michelin-starred restaurants, and energetic nightlife. The city seamlessly blends Ottoman palaces, Byzantine churches, modern skyscrapers, traditional hammams, and contemporary art galleries. As Turkey\'s gateway, Istanbul Atatürk and Sabiha Gökçen airports connect to worldwide destinations.',
-                'facts': [
-                    'Population 15.5 million (largest city in Europe)',
-                    'Only city spanning two continents (Europe and Asia)',
-                    'Former capital of Byzantine and Ottoman Empires',
-                    'Capital for 1,600+ years (330-1922 CE)',
-                    'UNESCO World Heritage Historic Areas',
-                    '3,000+ mosques including 17 imperial mosques',
-                    'Bosphorus Strait separates Europe and Asia',
-                    'Grand Bazaar one of world\'s oldest covered markets',
-                ],
-                'key_sites': [
-                    {'name': 'Sultanahmet (Old City)', 'description': 'Historic heart with Hagia Sophia, Blue Mosque, Topkapi Palace, Basilica Cistern'},
-                    {'name': 'Bosphorus Strait', 'description': 'Strategic waterway with ferry cruises, waterfront palaces, and two suspension bridges'},
-                    {'name': 'Beyoğlu District', 'description': 'Modern cultural center with Istiklal Avenue, Galata Tower, Taksim Square'},
-                    {'name': 'Asian Side (Kadıköy/Üsküdar)', 'description': 'Authentic Turkish neighborhoods with markets, cafes, Maiden\'s Tower'},
-                ],
-                'entrance_fees': 'City free to explore. Major attractions: Museum Pass Istanbul ₺1,500 (5 days, multiple sites). Individual: Hagia Sophia ₺200, Topkapi Palace ₺200, Basilica Cistern ₺150.',
-                'opening_hours': '24/7 city. Museums typically 9:00 AM-6:00 PM (vary by site). Mosques open dawn to dusk (avoid prayer times for tourists). Grand Bazaar: Monday-Saturday 9:00 AM-7:00 PM (closed Sundays).',
-                'best_time': 'April-May and September-November for mild weather (15-25°C/59-77°F), fewer crowds. Summer (June-August) hot and crowded but lively. Winter (December-February) cold and rainy but atmospheric.',
-                'how_to_get_there': 'Istanbul Airport (IST) 45 km northwest (Havaist bus ₺100, taxi ₺300-400, 45-60 min). Sabiha Gökçen Airport (SAW) 50 km east (bus ₺80, 60-90 min). Extensive metro, tram, bus, ferry system. Istanbulkart rechargeable transit card recommended.',
-                'what_to_wear': 'Modest clothing for mosques (headscarves for women provided at entrances). Comfortable walking shoes ESSENTIAL (cobblestones, hills). Layers for variable weather. Summer: light clothes, hat, sunscreen. Winter: warm coat, umbrella.',
-                'visitor_tips': [
-                    'Purchase Museum Pass Istanbul for major sites savings',
-                    'Istanbulkart transit card saves money on public transport',
-                    'Take Bosphorus ferry cruise for stunning city views',
-                    'Visit mosques outside prayer times (tourists restricted)',
-                    'Explore both European and Asian sides',
-                    'Try traditional Turkish breakfast and street food',
-                    'Grand Bazaar perfect for souvenir shopping (bargain!)',
-                    'Book Hagia Sophia tickets online to skip queues',
-                    'Experience traditional Turkish hammam spa',
-                    'Galata Tower offers panoramic 360° city views',
-                ],
-                'discovery': 'Founded 660 BCE as Byzantium by Greek colonists. Became Constantinople 330 CE, capital of Roman/Byzantine Empire. Conquered by Ottoman Sultan Mehmed II 1453, renamed Istanbul. Capital of Ottoman Empire until 1922. Modern Turkish Republic capital moved to Ankara 1923.',
-                'architecture': 'Extraordinary blend of Byzantine, Ottoman, and modern architecture. Byzantine: Hagia Sophia, city walls. Ottoman: Blue Mosque, Topkapi Palace, Süleymaniye Mosque. Modern: Sabancı Center, Istanbul Sapphire. Historic wooden houses, stone yalı mansions along Bosphorus.',
-                'cultural_impact': 'Crossroads of civilizations for millennia. Major influence on Christian and Islamic cultures. Inspired countless artists, writers, poets. Turkish cuisine capital. Contemporary art, film, music hub. Fashion and design center. Cultural bridge between East and West.',
-                'conservation': 'UNESCO World Heritage Site protection for Historic Areas. Ongoing restoration of Ottoman and Byzantine monuments. Challenges: rapid urbanization, earthquake risk, pollution. Conservation projects for Hagia Sophia, Topkapi, city walls. Bosphorus protected waterway.',
-                'health_safety': 'Generally safe major city. Be aware of pickpockets in tourist areas. Drink bottled or filtered water. Traffic very congested. Earthquake zone - buildings should be earthquake-resistant. Quality medical facilities available. Tourist police in Sultanahmet.',
-                'guided_tours': 'Walking tours Sultanahmet ₺200-400/person (half day). Bosphorus cruise tours ₺150-300. Private guided tours ₺500-1,200/day. Multi-day packages ₺1,500-3,000. Food tours, hammam experiences, evening entertainment available.',
-                'nearby_attractions': 'Princes\' Islands (ferry 1 hour), Edirne (2.5 hours), Bursa (2 hours ferry+bus), Troy (5 hours), Gallipoli (3.5 hours)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1527838832700-5059252407fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '41.0082° N, 28.9784° E',
-                'annual_visitors': '15+ million international tourists annually (one of world\'s most visited cities)',
-                'climate': 'Transitional Mediterranean-Oceanic. Summer (June-Aug) 23-28°C/73-82°F, humid. Winter (Dec-Feb) 5-10°C/41-50°F, rainy. Spring/Fall pleasant 15-22°C/59-72°F. Average 850mm annual rainfall.',
-            },
-            'hagia-sophia': {
-                'id': 'hagia-sophia',
-                'name': 'Hagia Sophia (Ayasofya)',
-                'location': 'Sultanahmet, Istanbul, Turkey',
-                'description': 'Architectural marvel built 537 CE, former Byzantine cathedral, Ottoman mosque, museum, and now mosque again. UNESCO World Heritage Site.',
-                'long_description': 'Hagia Sophia, meaning "Holy Wisdom," represents one of humanity\'s greatest architectural achievements and a symbol of Istanbul\'s layered history. Built by Byzantine Emperor Justinian I in 537 CE, it served as the world\'s largest cathedral for nearly 1,000 years and the centerpiece of Eastern Orthodox Christianity. The massive dome (31 meters diameter, 56 meters high) seemed to float on golden light streaming through 40 windows, described as "hanging from heaven by a golden chain." Revolutionary engineering used pendentives to support the dome\'s weight over a square base. After Constantinople\'s conquest in 1453, Sultan Mehmed II converted Hagia Sophia into an imperial mosque, adding minarets, mihrab, and minbar. Ottoman sultans added calligraphic medallions with names of Allah, Muhammad, and early caliphs. The structure influenced mosque architecture for centuries, particularly Istanbul\'s Blue Mosque. In 1935, Mustafa Kemal Atatürk secularized it as a museum, revealing stunning Byzantine mosaics beneath Ottoman plaster. These include the Deësis mosaic (Christ flanked by Virgin Mary and John the Baptist), imperial portraits, and seraphim angels. In 2020, Turkish government reconverted Hagia Sophia to a mosque while maintaining World Heritage status. Visitors can still observe both Christian and Islamic artistic treasures. The enormous interior holds 10,000+ worshippers.',
-                'facts': [
-                    'Built 532-537 CE by Emperor Justinian I',
-                    'World\'s largest cathedral for 1,000 years',
-                    'Dome: 31m diameter, 56m high at center',
-                    'Used 10,000+ workers for construction',
-                    'Converted to mosque 1453 after Ottoman conquest',
-                    'Became museum 1935-2020, now mosque again',
-                    'UNESCO World Heritage Site since 1985',
-                    'Contains both Christian mosaics and Islamic calligraphy',
-                ],
-                'key_sites': [
-                    {'name': 'Great Dome', 'description': 'Architectural masterpiece seemingly floating on light, 31m diameter, revolutionary pendentive system'},
-                    {'name': 'Byzantine Mosaics', 'description': 'Stunning gold-background mosaics including Deësis, imperial portraits, Virgin Mary and Child'},
-                    {'name': 'Imperial Door', 'description': 'Main entrance with mosaic of Christ above, used exclusively by emperors'},
-                    {'name': 'Marble Columns', 'description': '107 columns from ancient temples including Temple of Artemis at Ephesus'},
-                ],
-                'entrance_fees': 'Free admission (functioning mosque). Donations appreciated. No ticket needed but may have queue during peak times.',
-                'opening_hours': 'Open daily except during prayer times (5 times daily, 30-45 minutes each). Generally accessible: 9:00 AM-12:30 PM, 2:00-3:30 PM, 5:00-6:30 PM. Closed Friday mornings for prayers. Check current prayer schedule.',
-                'best_time': 'Early morning (9:00 AM opening) or late afternoon (4:00 PM) to avoid crowds. Weekdays less crowded than weekends. Avoid Friday (busiest prayer day). Spring and fall have best weather and fewer tourists.',
-                'how_to_get_there': 'Located in Sultanahmet (Old City), easily walkable from Blue Mosque, Topkapi Palace, Basilica Cistern. Tram: T1 line to Sultanahmet station (5-minute walk). Taxi widely available. Central location in tourist area.',
-                'what_to_wear': 'Modest clothing REQUIRED (mosque). Women: headscarf (provided free at entrance), long sleeves, long skirt/pants covering ankles. Men: long pants, covered shoulders. Shoes removed before entering (carry in provided plastic bag).',
-                'visitor_tips': [
-                    'Free admission but expect security queues',
-                    'Visit outside prayer times (tourists cannot enter during prayers)',
-                    'Bring or borrow headscarf for women (available free)',
-                    'Photography allowed but respectful behavior essential',
-                    'Upper gallery offers best views of mosaics and dome',
-                    'Early morning best for light through dome windows',
-                    'Audio guides available for rent ₺50',
-                    'Combine with nearby Blue Mosque, Topkapi in one day',
-                    'Wear comfortable socks (shoes removed inside)',
-                    'Allow 60-90 minutes for thorough visit',
-                ],
-                'discovery': 'Third church on site (previous two burned). Architects: Anthemius of Tralles and Isidore of Miletus. Original dome partially collapsed 558 CE, rebuilt taller 563 CE. Survived multiple earthquakes. Ottoman conversion 1453 preserved structure. Mosaics rediscovered during 1930s restoration.',
-                'architecture': 'Masterpiece of Byzantine architecture. Revolutionary pendentive system transfers dome weight to four massive piers. 40 windows around dome base create illusion of floating. Combines longitudinal basilica with central dome. Used Roman concrete, brick, marble. Influenced countless later mosques and churches.',
-                'cultural_impact': 'Symbol of Byzantine Christian power for 916 years. Center of Eastern Orthodox Christianity. Model for Ottoman mosque architecture. Represents Istanbul\'s layered history and East-West synthesis. UNESCO World Heritage Site. Featured in art, literature, documentaries worldwide.',
-                'conservation': 'Major restoration projects throughout history. 1930s restoration uncovered Byzantine mosaics. 1990s-2000s structural reinforcement and mosaic cleaning. Current challenge: balancing functions as active mosque and World Heritage Site. Christian mosaics preserved but covered during Muslim prayers.',
-                'health_safety': 'Very crowded - watch belongings. Long queues in peak season. Standing only (limited seating). Can be hot in summer without air conditioning. Marble floors slippery. Steep stairs to upper gallery (not wheelchair accessible).',
-                'guided_tours': 'Group guided tours ₺150-250/person (1.5 hours). Private tours ₺400-600 (2 hours). Many combine with Blue Mosque, Topkapi. Audio guide rental ₺50. Free information panels in Turkish and English.',
-                'nearby_attractions': 'Blue Mosque (200m), Topkapi Palace (400m), Basilica Cistern (150m), Istanbul Archaeological Museums (500m), Grand Bazaar (600m), Hippodrome (150m)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1527838832700-5059252407fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '41.0086° N, 28.9802° E',
-                'annual_visitors': '3.7+ million visitors annually (before 2020 conversion, numbers adjusting as mosque)',
-                'climate': 'Same as Istanbul. Best visits April-May, September-November (mild 15-25°C). Summer hot and crowded. Interior not air-conditioned (natural ventilation). Winter cold and rainy.',
-            },
-            'blue-mosque': {
-                'id': 'blue-mosque',
-                'name': 'Blue Mosque (Sultan Ahmed Mosque)',
-                'location': 'Sultanahmet, Istanbul, Turkey',
-                'description': 'Iconic Ottoman imperial mosque built 1609-1616, famous for six minarets and 20,000+ blue Iznik tiles giving interior celestial glow.',
-                'long_description': 'The Blue Mosque, officially Sultan Ahmed Mosque, is Istanbul\'s most photographed landmark and a masterpiece of Ottoman classical architecture. Built between 1609-1616 during the reign of Sultan Ahmed I, the mosque aimed to rival and complement the adjacent Hagia Sophia. Its popular name derives from the interior adorned with more than 20,000 handmade blue Iznik ceramic tiles featuring intricate tulip, rose, carnation, and cypress designs. The cascade of domes and semi-domes creates a pyramidal silhouette topped by the grand 43-meter-high central dome. Most distinctively, the mosque has six minarets - unprecedented for a non-Mecca mosque. Legend says this caused controversy since Mecca\'s main mosque also had six; the issue was resolved by adding a seventh minaret to Mecca. The interior floods with natural light from 260 windows, creating an ethereal atmosphere with blue tiles glowing. The complex includes madrasah, hospital, primary school, public kitchen, market, and tomb of Sultan Ahmed I. Unlike many mosques, the main entrance faces west toward Hagia Sophia rather than Mecca. The spacious courtyard matches the prayer hall size with central ablution fountain and surrounding arcade with 26 columns and 30 domes. The mosque holds 10,000+ worshippers during Friday prayers. As an active mosque, it remains a center of Islamic worship while welcoming millions of tourists.',
-                'facts': [
-                    'Built 1609-1616 by architect Sedefkar Mehmed Ağa',
-                    'Named after Sultan Ahmed I (died 1617, age 27)',
-                    '20,000+ blue Iznik tiles give name "Blue Mosque"',
-                    'Six minarets (initially controversial - matched Mecca)',
-                    'Central dome 23.5m diameter, 43m high',
-                    '260 windows provide natural illumination',
-                    'Complex includes school, hospital, market, tomb',
-                    'Faces Hagia Sophia across Sultanahmet Square',
-                ],
-                'key_sites': [
-                    {'name': 'Main Prayer Hall', 'description': '20,000 blue Iznik tiles, massive carpets, central dome with cascading semi-domes'},
-                    {'name': 'Six Minarets', 'description': 'Distinctive feature with three balconies each, visible across Istanbul skyline'},
-                    {'name': 'Courtyard', 'description': 'Arcaded courtyard equal size to prayer hall with central ablution fountain'},
-                    {'name': 'Sultan Ahmed I Tomb', 'description': 'Octagonal mausoleum containing Sultan Ahmed I and family members'},
-                ],
-                'entrance_fees': 'Free admission (functioning mosque). Donations appreciated. No ticket or reservation required.',
-                'opening_hours': 'Open daily outside prayer times. Generally accessible 8:30 AM-11:45 AM, 1:00-2:30 PM, 3:30-4:45 PM, 5:30-6:30 PM. Closed to tourists during 5 daily prayer times (30-45 min each). Closed Friday mornings until 2:30 PM.',
-                'best_time': 'Early morning (8:30 AM) or late afternoon (4:00 PM) for smaller crowds and beautiful light. Blue hour just after sunset magical when illuminated. Weekdays less busy than weekends. Avoid Friday (closed until afternoon for prayers).',
-                'how_to_get_there': 'Sultanahmet Old City, directly across from Hagia Sophia. Tram T1 to Sultanahmet station (3-minute walk). Walking distance from all Old City attractions. Easily accessible by taxi. Central tourist area.',
-                'what_to_wear': 'Modest Islamic dress code REQUIRED. Women: headscarf (provided free), long sleeves, long pants/skirt covering ankles. Men: long pants, shirt covering shoulders. Remove shoes at entrance (provided bags to carry). Avoid shorts, sleeveless tops.',
-                'visitor_tips': [
-                    'Free entry but expect queues (30-60 min peak times)',
-                    'Visit outside five daily prayer times',
-                    'Women\'s headscarves provided free at entrance',
-                    'Early morning or late afternoon best for light and crowds',
-                    'Shoes must be removed (wear clean socks)',
-                    'Interior photography allowed (no flash during prayers)',
-                    'Courtyard accessible anytime for exterior photos',
-                    'Combine with nearby Hagia Sophia (100m away)',
-                    'Beautiful when illuminated at night',
-                    'Show respect - active place of worship',
-                ],
-                'discovery': 'Commissioned by Sultan Ahmed I at age 19. Construction 1609-1616 supervised by architect Sedefkar Mehmed Ağa, pupil of famous Mimar Sinan. Built on site of Byzantine Great Palace. Funded by Sultan\'s treasury (not war spoils like usual). Inaugurated 1617.',
-                'architecture': 'Pinnacle of Ottoman classical architecture. Influenced by Hagia Sophia but distinctly Ottoman. Cascade of domes and semi-domes creates pyramidal effect. Revolutionary use of six minarets. Interior combines Ottoman, Byzantine elements. Iznik tiles at height of ceramic artistry. Four elephant-foot pillars support central dome.',
-                'cultural_impact': 'Icon of Istanbul and Turkey worldwide. Represents Ottoman architectural achievement. Symbol of Islamic culture and Ottoman Empire legacy. One of world\'s most photographed mosques. Inspired mosque designs globally. Featured in travel media, films, documentaries.',
-                'conservation': 'Designated World Heritage Site as part of Historic Areas of Istanbul. Regular maintenance and restoration. 2017-2018 major restoration for 400th anniversary. Iznik tiles require careful cleaning. Structural monitoring for earthquake preparedness. Balancing tourism with religious function.',
-                'health_safety': 'Very crowded tourist site - watch belongings. Long queues in peak season. Marble floors can be slippery. Summer heat without air conditioning. Bag checks at entrance. Generally safe with tourist police nearby.',
-                'guided_tours': 'Guided tours ₺150-250/person (1 hour). Often combined with Hagia Sophia tours. Private guides ₺400-600. Audio guides available. Free volunteer-led tours sometimes available. Best to book in advance online.',
-                'nearby_attractions': 'Hagia Sophia (100m), Topkapi Palace (400m), Basilica Cistern (300m), Hippodrome (50m), Grand Bazaar (700m), Museum of Turkish and Islamic Arts (100m)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1527838832700-5059252407fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '41.0054° N, 28.9768° E',
-                'annual_visitors': '3.3+ million tourists annually (most visited mosque in Turkey)',
-                'climate': 'Same as Istanbul. Best April-May, September-November. Summer hot inside (no AC). Winter cold and damp. Interior natural light beautiful in morning and late afternoon.',
-            },
-            'cappadocia': {
-                'id': 'cappadocia',
-                'name': 'Cappadocia',
-                'location': 'Central Anatolia, Nevşehir Province, Turkey',
-                'description': 'Surreal landscape of fairy chimneys, underground cities, cave churches, and hot air balloons. UNESCO World Heritage Site.',
-                'long_description': 'Cappadocia is one of Earth\'s most extraordinary landscapes, a dreamlike region of otherworldly rock formations, ancient cave dwellings, and colorful hot air balloons floating at sunrise. Located in Central Anatolia, this geological wonderland was formed by volcanic eruptions millions of years ago, with subsequent erosion by wind and water carving the soft volcanic tuff into "fairy chimneys" - towering rock cones and pillars up to 40 meters high. Early Christians fleeing persecution carved entire underground cities reaching 18 stories deep, housing up to 20,000 people with ventilation shafts, wine presses, stables, and chapels. The Göreme Open Air Museum contains spectacular rock-cut churches with vivid Byzantine frescoes from 10th-12th centuries. Valley landscapes like Love Valley, Rose Valley, and Pigeon Valley offer hiking through pink and orange rock formations. Hot air balloon rides at sunrise have become iconic - up to 200 balloons float above fairy chimneys daily, creating one of world\'s most magical experiences. Traditional cave hotels carved into rock offer unique accommodations. Towns like Göreme, Ürgüp, and Avanos provide charming bases. Cappadocia\'s pottery tradition dates back 4,000 years, with Avanos famous for red clay ceramics. The region\'s dramatic landscape has appeared in Star Wars films and countless travel documentaries.',
-                'facts': [
-                    'Volcanic landscape formed 60+ million years ago',
-                    'Fairy chimneys reach up to 40 meters high',
-                    'Underground cities descend 85+ meters deep',
-                    '36+ underground cities discovered (Derinkuyu largest)',
-                    'Göreme Open Air Museum UNESCO World Heritage 1985',
-                    '200+ hot air balloons fly daily at sunrise',
-                    'Rock-cut churches contain Byzantine frescoes 1,000+ years old',
-                    'Cave hotels offer unique troglodyte accommodations',
-                ],
-                'key_sites': [
-                    {'name': 'Göreme Open Air Museum', 'description': 'Rock-cut cave churches with stunning Byzantine frescoes, UNESCO Site'},
-                    {'name': 'Derinkuyu Underground City', 'description': '18-story underground city descending 85m, housed 20,000 people'},
-                    {'name': 'Love Valley', 'description': 'Dramatic fairy chimney formations, popular hiking and photography'},
-                    {'name': 'Hot Air Balloon Flights', 'description': 'Sunrise flights over fairy chimneys (200+ balloons daily, world-famous experience)'},
-                ],
-                'entrance_fees': 'Göreme Open Air Museum ₺450. Underground cities ₺200-300 each. Cappadocia Museum Pass ₺700 (5 days, multiple sites). Hot air balloon rides €150-250/person. Valleys free to explore.',
-                'opening_hours': 'Göreme Museum: 8:00 AM-7:00 PM (Apr-Oct), 8:00 AM-5:00 PM (Nov-Mar). Underground cities similar hours. Hot air balloons fly sunrise (weather permitting). Valleys accessible 24/7.',
-                'best_time': 'April-May and September-November for ideal weather (15-25°C/59-77°F). Balloon flights year-round but spring/fall most reliable. Summer (June-August) hot (30-35°C) but popular. Winter (December-February) cold, snowy, magical but some balloons canceled.',
-                'how_to_get_there': 'Fly to Kayseri Airport (70 km, 1 hour drive) or Nevşehir Airport (40 km, 45 min). Bus from Istanbul (12 hours overnight), Ankara (4 hours). Airport shuttles ₺50-100. Rental car gives flexibility to explore valleys.',
-                'what_to_wear': 'Comfortable hiking shoes ESSENTIAL for valleys and underground cities (uneven, slippery rocks). Layers (temperature varies). Summer: hat, sunscreen, light clothes. Winter: warm coat, gloves. Sunrise balloon: very warm jacket (cold at dawn and altitude).',
-                'visitor_tips': [
-                    'Book hot air balloon ride in advance (popular, weather-dependent)',
-                    'Stay minimum 2-3 days to explore properly',
-                    'Book cave hotel for unique experience',
-                    'Rent car/scooter or join tours (sites spread out)',
-                    'Visit multiple valleys - each has unique formations',
-                    'Göreme Open Air Museum best early or late (crowds)',
-                    'Bring flashlight for underground cities',
-                    'Try traditional pottery workshop in Avanos',
-                    'Watch sunset from Uchisar Castle highest point',
-                    'Turkish night show offers cultural dinner/entertainment',
-                ],
-                'discovery': 'Inhabited since Hittite era (2000 BCE). Christians settled 4th century CE, creating rock churches. Underground cities built for protection from Arab raids 7th-8th centuries. Abandoned gradually by 20th century. Tourism developed from 1980s. Hot air balloons introduced 1990s, now iconic activity.',
-                'architecture': 'Natural geological formations modified by humans. Rock-carved churches with frescoes. Underground cities with sophisticated ventilation. Cave dwellings (still inhabited). Stone pigeon houses. Modern cave hotels blend ancient and contemporary. Traditional Cappadocian stone architecture.',
-                'cultural_impact': 'UNESCO World Heritage Site. One of Turkey\'s most iconic destinations. Hot air balloons symbol of Turkish tourism. Inspired artists, filmmakers (Star Wars filming location). Center of early Christian monasticism. Traditional pottery heritage. Adventure tourism hub.',
-                'conservation': 'UNESCO protection for Göreme National Park. Challenges: tourism erosion, hotel construction in rock. Underground city preservation efforts. Balloon flight regulations for safety and environmental impact. Archaeological sites protected. Rock erosion monitoring.',
-                'health_safety': 'Hot air balloons very safe (excellent operators). Underground cities can be claustrophobic, narrow. Fairy chimneys unstable - don\'t climb. Summer heat - hydration essential. Altitude (1,000m) usually not problematic. Winter cold/snow - dress warmly. Quality medical facilities in Nevşehir.',
-                'guided_tours': 'Full-day tours ₺300-500/person including museum, valley, underground city. Hot air balloon ₺4,000-6,000 per person. Private tours ₺800-1,500/day. Multi-day packages ₺2,500-5,000. ATV tours, horseback riding, hiking tours available.',
-                'nearby_attractions': 'Ihlara Valley (90 km), Soganli Valley (40 km), Kayseri (70 km), Konya/Mevlana Museum (220 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1578271887552-5ac9e7c7b5d2?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '38.6431° N, 34.8289° E (Göreme center)',
-                'annual_visitors': '3+ million visitors annually',
-                'climate': 'Continental climate. Summer (June-Aug) 25-35°C/77-95°F hot, dry. Winter (Dec-Feb) -5 to 5°C/23-41°F cold, snowy. Spring/Fall 10-25°C/50-77°F ideal. Low humidity. Cool nights year-round. Best April-May, Sept-Nov.',
-            },
-            'ephesus': {
-                'id': 'ephesus',
-                'name': 'Ephesus (Efes)',
-                'location': 'Near Selçuk, İzmir Province, Turkey',
-                'description': 'Best-preserved ancient Roman city with Library of Celsus, Great Theater, and Terrace Houses. UNESCO World Heritage Site.',
-                'long_description': 'Ephesus stands as the most impressive and complete ancient city in the Mediterranean, offering an unparalleled glimpse into Roman urban life. Founded by Greek colonists in 10th century BCE, Ephesus became one of the twelve cities of Ionian League and later flourished as the Roman capital of Asia Minor with a population of 250,000. The city\'s marble streets, monuments, and buildings remain remarkably preserved, allowing visitors to walk where ancient Romans walked 2,000 years ago. The iconic Library of Celsus, with its reconstructed two-story façade of Corinthian columns, once held 12,000 scrolls and served as a monumental tomb. The Great Theater, carved into Mount Pion\'s slope, seated 25,000 spectators for gladiator fights, theater performances, and political assemblies - where St. Paul preached to Ephesians. The Curetes Street marble road leads past the Temple of Hadrian, public latrines, brothel, commercial agora, and fountain of Trajan. The Terrace Houses reveal how wealthy Romans lived, with stunning mosaics, frescoes, heating systems, and indoor plumbing. Ephesus housed one of Seven Wonders of Ancient World - the Temple of Artemis (now only foundation remains). The city appears in Bible as location of St. Paul\'s ministry and one of Seven Churches of Revelation. Nearby Meryemana (Virgin Mary\'s House) marks where tradition says Mary spent final years.',
-                'facts': [
-                    'Founded 10th century BCE, Roman capital of Asia Minor',
-                    'Population reached 250,000 (one of largest Roman cities)',
-                    'Library of Celsus held 12,000 scrolls',
-                    'Great Theater capacity 25,000 spectators',
-                    'Housed Temple of Artemis (Seven Wonders Ancient World)',
-                    'One of Seven Churches of Asia Minor (Book of Revelation)',
-                    'St. Paul lived and preached here 52-55 CE',
-                    'UNESCO World Heritage Site since 2015',
-                ],
-                'key_sites': [
-                    {'name': 'Library of Celsus', 'description': 'Iconic two-story marble façade, ancient library with 12,000 scrolls capacity'},
-                    {'name': 'Great Theater', 'description': 'Massive 25,000-seat amphitheater carved into hillside, excellent acoustics'},
-                    {'name': 'Terrace Houses', 'description': 'Wealthy Roman residences with stunning mosaics, frescoes, heating systems'},
-                    {'name': 'Curetes Street', 'description': 'Main marble road with Temple of Hadrian, fountains, monuments'},
-                ],
-                'entrance_fees': 'Ephesus ₺400. Terrace Houses additional ₺120 (highly recommended). Museum Pass ₺700 includes Ephesus, Terrace Houses, Ephesus Museum. Combined ticket best value.',
-                'opening_hours': '8:00 AM-7:00 PM (April-October), 8:00 AM-5:00 PM (November-March). Terrace Houses same hours. Last entry 1 hour before closing. Open year-round except national holidays.',
-                'best_time': 'Spring (April-May) and Fall (September-November) for comfortable temperatures (20-28°C/68-82°F). Early morning (8:00 AM) or late afternoon (5:00 PM) to avoid midday heat and crowds. Summer (June-August) very hot (35-40°C) - start at opening. Winter quiet but shorter hours.',
-                'how_to_get_there': 'Located 3 km from Selçuk town, 18 km from Kuşadası, 80 km from İzmir. Bus/dolmuş from Selçuk ₺10 (10 min). Taxi from Selçuk ₺80. Tours from İzmir, Kuşadası widely available. İzmir Adnan Menderes Airport 60 km (1 hour drive).',
-                'what_to_wear': 'Comfortable walking shoes ESSENTIAL (uneven ancient marble, 2+ km walking). Sun hat, sunglasses, high SPF sunscreen CRITICAL (minimal shade). Light breathable clothes. Summer: very light clothing, carry water. Winter: layers, light jacket. Modest clothing respectful.',
-                'visitor_tips': [
-                    'Start early morning to avoid heat and cruise ship crowds',
-                    'Terrace Houses MUST-SEE (additional fee worth it)',
-                    'Bring water (limited fountains, expensive on site)',
-                    'Enter at Upper Gate, exit Lower Gate (easier downhill)',
-                    'Allow 3-4 hours for thorough visit including Terrace Houses',
-                    'Hire guide or audio guide for historical context',
-                    'Combine with Ephesus Museum in Selçuk',
-                    'Visit Virgin Mary\'s House (9 km away)',
-                    'Wear comfortable walking shoes (marble slippery)',
-                    'Photography allowed (no flash in Terrace Houses)',
-                ],
-                'discovery': 'Continuously inhabited Bronze Age through Byzantine period. Abandoned 15th century due to harbor silting. Archaeological excavations began 1863 by British engineer John Wood. Austrian Archaeological Institute conducting excavations since 1895. Only 15% excavated so far. Library of Celsus restored 1970s.',
-                'architecture': 'Superb examples of Roman urban planning and architecture. Marble-paved streets with columns. Two-story Library of Celsus with Corinthian columns. Greek-style theater expanded by Romans. Roman bath complexes. Terrace Houses with mosaics and frescoes. Monumental gates and fountains. Temple of Hadrian with intricate reliefs.',
-                'cultural_impact': 'Major center of early Christianity. St. Paul wrote Epistle to Ephesians. Council of Ephesus 431 CE established doctrine. One of Seven Churches of Revelation. Virgin Mary tradition draws Christian pilgrims. Symbol of Roman civilization. Archaeological treasure. Featured in historical documentaries.',
-                'conservation': 'UNESCO World Heritage Site protection. Ongoing Austrian Archaeological Institute excavations and restoration. Terrace Houses protected under modern roof structure. Marble erosion from foot traffic - pathways regulated. Site management balances tourism with preservation. Digital documentation underway.',
-                'health_safety': 'Intense summer heat - dehydration risk (bring water). Uneven ancient marble surfaces - careful footing. Minimal shade - sun exposure. Crowds during cruise ship visits. Quality medical facilities in Selçuk and Kuşadası. Insects in summer - repellent advised.',
-                'guided_tours': 'Guided tours ₺200-400/person (2-3 hours). Audio guides ₺50 rental. Private guides ₺600-1,000. Combined tours with Pamukkale, Virgin Mary House. Full-day tours from İzmir ₺400-600. Cruise ship excursions from Kuşadası. Book online to skip ticket lines.',
-                'nearby_attractions': 'Ephesus Museum Selçuk (4 km), Virgin Mary\'s House (9 km), St. John\'s Basilica Selçuk (4 km), Temple of Artemis ruins (4 km), Kuşadası resort (18 km), Pamukkale (200 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '37.9387° N, 27.3409° E',
-                'annual_visitors': '2+ million visitors annually (Turkey\'s most visited archaeological site)',
-                'climate': 'Mediterranean climate. Summer (June-Sept) hot 30-40°C/86-104°F, intense sun. Winter (Dec-Feb) mild 10-15°C/50-59°F, occasional rain. Spring/Fall ideal 20-28°C/68-82°F. Low humidity. Best April-May, Sept-Nov.',
-            },
-            'pamukkale': {
-                'id': 'pamukkale',
-                'name': 'Pamukkale (Cotton Castle)',
-                'location': 'Denizli Province, Turkey',
-                'description': 'Stunning white travertine terraces with thermal pools, ancient Hierapolis ruins. UNESCO World Heritage Site.',
-                'long_description': 'Pamukkale, meaning "Cotton Castle" in Turkish, is one of Earth\'s most surreal natural wonders - a dazzling white cliff face of travertine terraces cascading down the hillside like frozen waterfalls. Over millennia, thermal springs rich in calcium carbonate deposited layer upon layer of brilliant white mineral formations, creating 17 terraces of warm, turquoise pools. The mineral-rich water, emerging from springs at 35-36°C (95-97°F), has been celebrated for therapeutic properties since ancient times. Atop the travertines sits ancient Hierapolis, founded as a spa city by Pergamene kings in 190 BCE. The extensive ruins include a remarkably well-preserved Roman theater seating 12,000, Roman baths, necropolis with 1,200 tombs, Byzantine basilicas, and the famous Antique Pool (Cleopatra\'s Pool) where you can swim among submerged Roman columns. The site became UNESCO World Heritage in 1988. Visitors can walk barefoot on white terraces, wade in warm thermal pools, and explore ancient ruins - a unique combination of natural and cultural heritage. The travertines appear most magical at sunset when they glow golden, or sunrise when they shimmer pink. The view from the top encompasses the Lycus River valley. Access is now carefully controlled to protect the delicate formations - some areas closed for restoration. Pamukkale represents the successful balance between tourism and conservation.',
-                'facts': [
-                    'Name means "Cotton Castle" in Turkish',
-                    '17 travertine terraces over 2,700 meters long',
-                    'Thermal water 35-36°C/95-97°F year-round',
-                    'Calcium carbonate deposits formed over 14,000 years',
-                    'Ancient Hierapolis founded 190 BCE',
-                    'Roman theater seats 12,000 spectators',
-                    'UNESCO World Heritage Site since 1988',
-                    'Necropolis contains 1,200+ ancient tombs',
-                ],
-                'key_sites': [
-                    {'name': 'White Travertine Terraces', 'description': 'Dazzling white calcium carbonate formations with warm turquoise pools'},
-                    {'name': 'Antique Pool (Cleopatra\'s Pool)', 'description': 'Swim among submerged Roman columns in thermal waters'},
-                    {'name': 'Hierapolis Roman Theater', 'description': 'Exceptionally preserved theater with detailed friezes, seats 12,000'},
-                    {'name': 'Hierapolis Archaeology Museum', 'description': 'Roman bath building housing artifacts from excavations'},
-                ],
-                'entrance_fees': 'Combined Pamukkale-Hierapolis ticket ₺370. Antique Pool additional ₺200. Museum included in main ticket. Children under 8 free. Museum Card accepted.',
-                'opening_hours': '24 hours (overnight visits restricted to hotel guests). Main access 8:00 AM-9:00 PM (summer), 8:00 AM-5:00 PM (winter). Hierapolis Museum 8:00 AM-7:00 PM. Best to visit daytime for safety.',
-                'best_time': 'April-May and September-October for pleasant weather (20-28°C/68-82°F). Sunrise (empty, beautiful light) or sunset (golden glow on white terraces). Summer (June-August) very hot but popular. Winter (December-February) cold but fewer crowds, stunning contrast with white terraces.',
-                'how_to_get_there': 'Denizli city 18 km southwest (30 min). Fly to Denizli Çardak Airport (65 km, 1 hour drive). Bus from Istanbul (10 hours), Antalya (4 hours), İzmir (4 hours). Dolmuş from Denizli ₺15. Organized tours widely available. Pamukkale village has hotels within walking distance.',
-                'what_to_wear': 'Shoes MUST be removed on travertines (barefoot mandatory to protect formations). Bring bag to carry shoes. Swimsuit for thermal pools and Antique Pool. Towel essential. Sun protection: hat, sunglasses, SPF 50+ sunscreen (intense reflection). Light clothing. Modest cover-up for ancient site.',
-                'visitor_tips': [
-                    'Remove shoes before stepping on travertines (mandatory)',
-                    'Bring swimsuit, towel for thermal pools',
-                    'Start early morning or late afternoon (avoid midday heat)',
-                    'Pay extra for Antique Pool - swimming with Roman columns unique',
-                    'Allow 3-4 hours for terraces and Hierapolis ruins',
-                    'Enter at top gate (hotel side) to walk downhill easier',
-                    'Sunrise/sunset offer magical lighting and fewer crowds',
-                    'Bring water (limited facilities, expensive on site)',
-                    'Travertines slippery when wet - walk carefully',
-                    'Stay on designated paths (protect fragile formations)',
-                ],
-                'discovery': 'Natural formations known since antiquity. Hierapolis founded 190 BCE as thermal spa. Romans extensively developed spa facilities. Rediscovered by modern travelers 19th century. Hotels built atop terraces 1960s-1980s caused damage. UNESCO designation 1988 led to protection measures. Hotels removed, some terraces closed for regeneration.',
-                'architecture': 'Natural geological formations (no human architecture on terraces). Hierapolis features: Roman theater with stage building, colonnaded main street, monumental gate, agora, bath complexes, Byzantine churches, extensive necropolis. Antique Pool ancient Roman bath with earthquake-toppled columns.',
-                'cultural_impact': 'One of Turkey\'s most iconic natural sites. UNESCO World Heritage. Symbol of geological wonders. Ancient therapeutic spa tradition continues. Major tourism draw. Featured in travel media worldwide. Balance of nature-culture tourism model. Inspired conservation awareness.',
-                'conservation': 'UNESCO protection critical. Hotels removed from atop terraces. Some sections closed for restoration. Barefoot walking only (no shoes protect formations). Water flow regulated to regenerate white color. Walkways installed to channel visitors. Ongoing monitoring of water chemistry. Successful conservation model.',
-                'health_safety': 'Travertines very slippery - falls common (walk carefully). Barefoot walking on hot stones can burn feet (go early morning). Thermal water generally safe but test temperature. Sun exposure intense (reflection from white terraces). Dehydration risk. Quality medical facilities in Denizli city.',
-                'guided_tours': 'Guided tours ₺250-400/person (3-4 hours). Audio guides available ₺40. Combined tours with Ephesus, Cappadocia. Full-day tours from Antalya, İzmir ₺500-700. Private guides ₺800-1,200. Hot air balloon rides over terraces available.',
-                'nearby_attractions': 'Laodikeia ancient city (12 km), Colossae ruins (20 km), Kaklik Cave (30 km), Denizli city (18 km), Salda Lake (100 km, "Maldives of Turkey")',
-                'photos': [
-                    'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '37.9200° N, 29.1250° E',
-                'annual_visitors': '2.5+ million visitors annually',
-                'climate': 'Mediterranean-Continental. Summer (June-Sept) hot 30-40°C/86-104°F. Winter (Dec-Feb) cold 5-15°C/41-59°F, occasional snow. Spring/Fall ideal 18-28°C/64-82°F. Thermal water constant 35-36°C year-round. Best April-May, Sept-Oct.',
-            },
-            'topkapi-palace': {
-                'id': 'topkapi-palace',
-                'name': 'Topkapi Palace',
-                'location': 'Sultanahmet, Istanbul, Turkey',
-                'description': 'Ottoman sultans\' imperial residence for 400 years with treasury, harem, sacred relics. UNESCO World Heritage Site.',
-                'long_description': 'Topkapi Palace served as the political and residential heart of the Ottoman Empire for nearly four centuries (1465-1856), housing sultans, their courts, and harems. Built by Sultan Mehmed II after conquering Constantinople in 1453, the sprawling 700,000-square-meter complex sits on a promontory overlooking the Bosphorus, Golden Horn, and Sea of Marmara. Unlike typical Western palaces, Topkapi consists of numerous pavilions, courtyards, and kiosks connected by corridors, reflecting Ottoman architectural philosophy. The palace housed up to 4,000 people at its peak, including the imperial household, concubines, eunuchs, servants, and Janissaries. Four main courtyards organize the complex, each with increasing exclusivity - the first open to public, the fourth reserved for sultan only. The Imperial Treasury displays some of world\'s most spectacular treasures including the 86-carat Spoonmaker\'s Diamond, Topkapi Dagger with three enormous emeralds, and diamond-encrusted thrones. The Sacred Relics Chamber houses Prophet Muhammad\'s cloak, sword, beard hairs, and footprint impression - deeply venerated by Muslims. The Harem, separate-entry complex where sultan\'s family lived, contains 300+ rooms with stunning Iznik tiles and elaborate decorations. The palace kitchens, once employing 1,000+ cooks, now display imperial porcelain collection.',
-                'facts': [
-                    'Ottoman imperial residence 1465-1856 (400 years)',
-                    'Built by Sultan Mehmed II after 1453 conquest',
-                    'Complex covers 700,000 square meters',
-                    'Housed up to 4,000 people at peak',
-                    'Treasury contains 86-carat Spoonmaker\'s Diamond',
-                    'Harem has 300+ rooms',
-                    'Sacred Relics include Prophet Muhammad\'s belongings',
-                    'UNESCO World Heritage Site since 1985',
-                ],
-                'key_sites': [
-                    {'name': 'Imperial Treasury', 'description': 'Spoonmaker\'s Diamond, Topkapi Dagger, emerald-studded thrones, jeweled artifacts'},
-                    {'name': 'Harem', 'description': '300+ room complex where sultan\'s family lived, stunning Iznik tiles (separate ticket)'},
-                    {'name': 'Sacred Relics Chamber', 'description': 'Prophet Muhammad\'s cloak, sword, beard hairs, footprint - holy Muslim relics'},
-                    {'name': 'Imperial Kitchens', 'description': 'Massive kitchens now displaying Chinese porcelain collection (3rd largest in world)'},
-                ],
-                'entrance_fees': 'Palace ₺400. Harem additional ₺200 (highly recommended). Combined ticket ₺600. Audio guide ₺50. Free for children under 6. Museum Pass Istanbul ₺1,500 (5 days) includes entry.',
-                'opening_hours': 'Open daily except Tuesdays. April-October: 9:00 AM-6:00 PM (last entry 5:00 PM). November-March: 9:00 AM-4:00 PM (last entry 3:00 PM). Harem closes 30 minutes before palace.',
-                'best_time': 'Early morning (9:00 AM opening) to avoid crowds and heat. Weekdays less crowded than weekends. Spring (April-May) and Fall (September-November) best weather. Avoid summer afternoons (very hot, crowded). Winter quiet but shorter hours.',
-                'how_to_get_there': 'Sultanahmet district, walking distance from Hagia Sophia (500m), Blue Mosque (600m). Tram T1 to Sultanahmet or Gülhane stations (10 min walk). Taxi easily accessible. Central Old City tourist area.',
-                'what_to_wear': 'Comfortable walking shoes ESSENTIAL (large complex, lots of walking). Modest clothing (respect for sacred relics). Summer: light clothes, hat, sunscreen. Winter: warm layers. Bag check at entrance.',
-                'visitor_tips': [
-                    'Buy tickets online to skip long queues',
-                    'Arrive at 9:00 AM opening to beat crowds',
-                    'Harem MUST-SEE (separate ticket worth it)',
-                    'Allow 3-4 hours minimum for thorough visit',
-                    'Audio guide or guide recommended (rich history)',
-                    'Closed Tuesdays - plan accordingly',
-                    'Photography allowed (no flash in some areas)',
-                    'Sacred Relics Chamber deeply meaningful for Muslims',
-                    'Treasury room incredibly opulent',
-                    'Café in fourth courtyard with stunning Bosphorus views',
-                ],
-                'discovery': 'Built 1459-1478 by Sultan Mehmed II the Conqueror. Continuously expanded by subsequent sultans. Served as government seat and imperial residence until 1856 when Dolmabahçe Palace became main residence. Converted to museum 1924 by Mustafa Kemal Atatürk. One of world\'s great palace museums.',
-                'architecture': 'Classic Ottoman palace architecture - pavilion complexes around courtyards. Mix of imperial chambers, kiosks, pavilions. Stunning Iznik tile work, intricate woodwork, painted ceilings. Imperial Gate, Gate of Salutation, Gate of Felicity mark courtyard transitions. Harem represents peak Ottoman decorative arts.',
-                'cultural_impact': 'Symbol of Ottoman Empire power and splendor. Administrative center of empire for 400 years. Treasury collection demonstrates imperial wealth. Sacred Relics make it important Islamic pilgrimage. Influenced Ottoman art, culture, governance. UNESCO World Heritage. Featured in historical films, documentaries.',
-                'conservation': 'UNESCO World Heritage protection. Ongoing restoration of chambers and Harem. Climate control for treasuries and relics. Visitor numbers managed. Fragile tiles and frescoes protected. Conservation balances preservation with tourism. Regular structural maintenance.',
-                'health_safety': 'Large complex requires significant walking (wear comfortable shoes). Summer heat intense in courtyards. Crowds can be overwhelming (go early). Steep stairs in some sections. Bag checks at entrance. Generally safe with tourist police.',
-                'guided_tours': 'Guided group tours ₺250-400/person (2-3 hours). Private guides ₺600-1,000. Audio guides ₺50 rental. Often combined with Hagia Sophia, Blue Mosque tours. Skip-the-line tours ₺400-500. Book in advance.',
-                'nearby_attractions': 'Hagia Sophia (500m), Blue Mosque (600m), Basilica Cistern (700m), Istanbul Archaeological Museums (200m), Gülhane Park (adjacent), Grand Bazaar (1 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1527838832700-5059252407fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '41.0115° N, 28.9833° E',
-                'annual_visitors': '3+ million visitors annually (one of Turkey\'s most visited museums)',
-                'climate': 'Same as Istanbul. Best April-May, September-November (15-25°C). Summer hot in courtyards (28-33°C). Winter cold and rainy but atmospheric. Indoor exhibits year-round.',
-            },
-            'grand-bazaar': {
-                'id': 'grand-bazaar',
-                'name': 'Grand Bazaar (Kapalıçarşı)',
-                'location': 'Beyazıt, Istanbul, Turkey',
-                'description': 'World\'s oldest and largest covered market with 4,000+ shops, 60+ streets. Historic shopping paradise.',
-                'long_description': 'The Grand Bazaar is one of the oldest and largest covered markets in the world, a labyrinthine shopping paradise that has been the beating heart of Istanbul\'s commerce for over 560 years. Covering 30,700 square meters with 61 covered streets and over 4,000 shops, the bazaar attracts 250,000-400,000 visitors daily. Built by Sultan Mehmed II after conquering Constantinople (starting 1455), the bazaar was designed to finance maintenance of Hagia Sophia. The complex features vaulted ceilings painted with intricate Ottoman patterns, ornate gates at main entrances, and han (caravanserai) courtyards. The bazaar specializes in jewelry (particularly Turkish gold and silver), carpets, leather goods, ceramics, textiles, spices, and Turkish handicrafts. The Old Book Market (Sahaflar Çarşısı) is one of world\'s oldest book markets. Each section traditionally focused on specific goods - goldsmiths near center, carpet dealers in separate han. The atmosphere combines intense commerce with historic architecture - shopkeepers calling out, tourists bargaining, the aroma of Turkish coffee and spices. Despite devastating fires (1954, 1974) and earthquakes, the bazaar has been continuously rebuilt. Modern shops now include contemporary Turkish designers alongside traditional craftsmen. The Grand Bazaar represents not just shopping but an essential Istanbul cultural experience.',
-                'facts': [
-                    'Built starting 1455 by Sultan Mehmed II',
-                    'One of world\'s oldest covered markets (560+ years)',
-                    '4,000+ shops on 61 covered streets',
-                    'Covers 30,700 square meters',
-                    'Attracts 250,000-400,000 visitors daily',
-                    '26,000+ employees work in bazaar',
-                    '18 gates/entrances to complex',
-                    'Survived multiple devastating fires and earthquakes',
-                ],
-                'key_sites': [
-                    {'name': 'Jewelry Section (center)', 'description': 'Turkish gold and silver work, precious stones, traditional Ottoman jewelry'},
-                    {'name': 'Carpet Han', 'description': 'Turkish carpets and kilims, handwoven textiles, traditional rug dealers'},
-                    {'name': 'Old Book Bazaar (Sahaflar Çarşısı)', 'description': 'Historic book market with rare books, manuscripts, antique prints'},
-                    {'name': 'İç Bedesten (Core)', 'description': 'Original 15th-century covered market, now antiques and high-end goods'},
-                ],
-                'entrance_fees': 'Free entry. No admission charge. Shopping prices vary widely (bargaining expected).',
-                'opening_hours': 'Monday-Saturday: 9:00 AM-7:00 PM. Closed Sundays and religious holidays (Ramadan Eid, Sacrifice Eid). Most shops keep same hours.',
-                'best_time': 'Weekday mornings (9:00-11:00 AM) less crowded, better for photography. Afternoon (2:00-4:00 PM) busier but more atmospheric. Avoid Saturday afternoons (most crowded). Spring and fall comfortable. Summer very hot inside.',
-                'how_to_get_there': 'Beyazıt district between Sultanahmet and Beyoğlu. Tram T1 to Beyazıt-Kapalıçarşı station (direct access). Walking distance from Sultanahmet (1 km). Multiple entrances - Beyazıt Gate and Nuruosmaniye Gate most used. Taxi easily accessible.',
-                'what_to_wear': 'Comfortable walking shoes ESSENTIAL (lots of walking on stone floors). Modest clothing. Crossbody bag (safer than backpack in crowds). Light layers (temperature varies inside). Summer: light clothes. Winter: warm jacket.',
-                'visitor_tips': [
-                    'Bargaining expected and part of experience (start 40-50% below asking)',
-                    'Compare prices at multiple shops before buying',
-                    'Best jewelry deals near Nuruosmaniye entrance',
-                    'Many "antiques" are reproductions (be cautious)',
-                    'Closed Sundays - plan accordingly',
-                    'Easy to get lost - use phone map/GPS',
-                    'Shop quality varies - examine carefully',
-                    'Turkish tea offered - accepting creates buying pressure',
-                    'Credit cards accepted but cash may get better prices',
-                    'Avoid shops near main gates (tourist-priced)',
-                ],
-                'discovery': 'Construction began 1455-1461 by Sultan Mehmed II. Expanded gradually over centuries. Originally İç Bedesten (inner covered bazaar) then expanded outward. Survived 1894 earthquake. Devastating fires 1954, 1974 led to major restorations. Continuously operating market for over 560 years.',
-                'architecture': 'Classic Ottoman covered market architecture. Vaulted brick ceilings painted with Ottoman floral and geometric motifs. Stone columns supporting arched passageways. Han (caravanserai) courtyards. Ornate entrance gates. Mix of 15th-century İç Bedesten and later expansions. Labyrinthine layout with 61 streets.',
-                'cultural_impact': 'Istanbul\'s commercial heart for centuries. Symbol of Ottoman trading power. Cultural icon of Turkish shopping culture. Preserved traditional crafts and trades. Influenced other Ottoman markets. Tourist must-see. Featured in travel media, films (Taken 2, Skyfall). Economic hub supporting 26,000+ livelihoods.',
-                'conservation': 'Ongoing structural maintenance. Earthquake reinforcement. 2020 comprehensive restoration after COVID closure. Fire prevention systems modernized. Historical façade preservation while updating infrastructure. Balancing modernization with historic character. Protecting traditional crafts amid commercialization.',
-                'health_safety': 'Extremely crowded - watch for pickpockets (keep valuables secure). Easy to get disoriented - use GPS. Can be claustrophobic when packed. Summer heat inside stuffy. Aggressive selling tactics (politely decline). Licensed shops safer. Avoid following touts to shops.',
-                'guided_tours': 'Guided shopping tours ₺150-300/person (2 hours). Private guides ₺400-600. Often combined with Spice Bazaar. Food tours include çay (tea) stops. Cultural context tours explain Ottoman trade history. Bargaining workshops available.',
-                'nearby_attractions': 'Süleymaniye Mosque (600m), Beyazıt Mosque (100m), Istanbul University (200m), Spice Bazaar (1.5 km), Sultanahmet Square (1 km), Çemberlitaş Hamam (300m)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1541432901042-2d8bd64b4a9b?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1527838832700-5059252407fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '41.0108° N, 28.9681° E',
-                'annual_visitors': '91+ million visitors annually (one of world\'s most visited tourist attractions)',
-                'climate': 'Enclosed market. Temperature moderated but can be hot in summer (30°C+). Winter cool inside (10-15°C). Spring/fall most comfortable. Poor ventilation when crowded. Best April-May, Sept-Nov.',
-            },
-        },
-        'syria': {
-            'damascus': {
-                'id': 'damascus',
-                'name': 'Damascus (Dimashq)',
-                'location': 'Damascus Governorate, Syria',
-                'description': 'World\'s oldest continuously inhabited capital city with 11,000+ years of history, Umayyad Mosque, and ancient souks.',
-                'long_description': 'Damascus is widely considered the world\'s oldest continuously inhabited capital city, with archaeological evidence of habitation dating back to 11,000 years. Known as the "Pearl of the East," Damascus has been a major cultural and commercial center for millennia, serving as capital under various empires including the Aramaeans, Romans, Umayyads, and Ottomans. The Old City of Damascus is a UNESCO World Heritage Site containing the magnificent Umayyad Mosque (built 715 CE), one of Islam\'s holiest sites. The ancient walled city features narrow winding alleys, traditional courtyard houses with fountains, historic caravanserais, hammams, and bustling souks selling spices, textiles, handicrafts, and sweets. The Straight Street (Via Recta), mentioned in the Bible, runs through the old city. Damascus is famous for its distinctive architecture featuring striped stone (ablaq), ornate wooden balconies (shanashil), and intricate tile work. The city\'s historic quarters include the Christian Quarter with ancient churches, the Jewish Quarter, and traditional Islamic neighborhoods. Damascus was a key stop on the ancient Silk Road. The city is renowned for Damascus steel swords, brocade fabric (damask), and culinary traditions. The Barada River valley provides agricultural fertility. Mount Qassioun overlooks the city offering panoramic views.',
-                'facts': [
-                    'World\'s oldest continuously inhabited capital (11,000+ years)',
-                    'Capital of Umayyad Caliphate 661-750 CE (Islamic Golden Age)',
-                    'Population approximately 2.5 million (pre-conflict)',
-                    'UNESCO World Heritage Site (Old City) since 1979',
-                    'Umayyad Mosque one of largest and oldest in world',
-                    'Birthplace of Damascus steel and damask fabric',
-                    'Ancient Silk Road trading hub',
-                    'Mentioned multiple times in Bible and Quran',
-                ],
-                'key_sites': [
-                    {'name': 'Umayyad Mosque', 'description': 'Magnificent 8th-century mosque with mosaics, tomb of John the Baptist, third-holiest site in Islam'},
-                    {'name': 'Old City Souks', 'description': 'Historic covered markets including Al-Hamidiyeh Souq with spices, textiles, crafts'},
-                    {'name': 'Azem Palace', 'description': '18th-century Ottoman palace museum with traditional Damascus architecture'},
-                    {'name': 'Straight Street (Via Recta)', 'description': 'Biblical Roman road, traditional shopping street with historic gates'},
-                ],
-                'entrance_fees': 'Old City free to wander. Umayyad Mosque SYP 500 (~$0.40). Azem Palace SYP 300. National Museum SYP 400. Many sites nominal fees.',
-                'opening_hours': 'Old City accessible 24/7. Umayyad Mosque: 8:00 AM-12:00 PM, 1:00-3:30 PM (non-Muslims outside prayer times). Museums typically 9:00 AM-5:00 PM. Souks: 8:00 AM-8:00 PM (closed Fridays morning).',
-                'best_time': 'March-May and September-November for pleasant weather (15-28°C/59-82°F). Avoid summer (June-August) when extremely hot (35-40°C/95-104°F). Spring brings jasmine blossoms. Winter cool and rainy.',
-                'how_to_get_there': 'Damascus International Airport 25 km southeast (reopening for international flights). Road access from Lebanon, Jordan. City center walkable. Taxis and minibuses available. Old City pedestrian-friendly (cars restricted).',
-                'what_to_wear': 'Modest conservative clothing ESSENTIAL. Women: cover shoulders, knees, consider headscarf for mosques (required inside). Men: long pants, covered shoulders. Comfortable walking shoes for cobblestones. Respectful attire crucial.',
-                'visitor_tips': [
-                    'Hire local guide for historical context and navigation',
-                    'Respect Islamic customs and prayer times',
-                    'Try traditional Damascus sweets and dishes',
-                    'Visit Bakdash ice cream parlor (famous since 1890s)',
-                    'Explore multiple souks - each specializes in different goods',
-                    'Azem Palace showcases traditional Damascus house',
-                    'Sunset views from Mount Qassioun spectacular',
-                    'Photography restrictions at some sites - ask permission',
-                    'Learn basic Arabic phrases (hospitality culture)',
-                    'Current travel advisories - check safety situation',
-                ],
-                'discovery': 'Inhabited since at least 9,000 BCE (Pre-Pottery Neolithic). Capital of Aramaean kingdom 1000 BCE. Conquered by Alexander the Great 332 BCE. Major Roman city. Capital of Umayyad Caliphate 661-750 CE (Islamic Golden Age). Ayyubid, Mamluk, Ottoman rule followed. Modern Syria capital since 1946 independence.',
-                'architecture': 'Unique Damascus architecture: striped ablaq stone (black basalt, white limestone), ornate wooden lattice windows (shanashil), fountain courtyards (sahn), vaulted ceilings. Umayyad Mosque features Byzantine mosaics. Ottoman-era palaces with iwan halls. Traditional courtyard houses. Mix of Islamic, Roman, Ottoman influences.',
-                'cultural_impact': 'Major center of Islamic civilization and learning. Arabic language and literature hub. Damascus steel legendary worldwide. Damask fabric originated here. Influenced Islamic art, architecture, poetry. Crossroads of religions and cultures. Symbol of Middle Eastern history. UNESCO World Heritage endangered site.',
-                'conservation': 'UNESCO World Heritage Site protection. Ongoing challenges from recent conflict. Many historic buildings damaged. Restoration efforts underway. International organizations supporting preservation. Umayyad Mosque damage being assessed. Old City rehabilitation critical priority. Cultural heritage protection initiatives.',
-                'health_safety': 'Check current travel advisories (recent conflict affected city). Areas outside Old City may have security concerns. Quality medical facilities available. Tap water - drink bottled. Food hygiene generally good in established restaurants. Respect local customs for safety. Register with embassy if visiting.',
-                'guided_tours': 'Local guides essential for context. Half-day Old City tours $30-50/person. Full-day tours $70-100. Private guides available. Cultural tours include traditional meals. Multi-day Syria tours $300-500. Book through reputable agencies. Guides help navigate and provide historical context.',
-                'nearby_attractions': 'Saydnaya monastery (25 km), Maaloula Aramaic village (55 km), Bosra Roman theater (140 km), Krak des Chevaliers castle (160 km), Palmyra (215 km - check accessibility)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '33.5138° N, 36.2765° E',
-                'annual_visitors': 'Variable due to recent situation. Historically 2+ million tourists annually. Domestic and regional tourism ongoing.',
-                'climate': 'Semi-arid continental. Summer (June-Sept) hot 30-40°C/86-104°F, dry. Winter (Dec-Feb) cool 5-15°C/41-59°F, rain. Spring/Fall ideal 15-28°C/59-82°F. Low humidity. Best March-May, Sept-Nov.',
-            },
-            'umayyad-mosque': {
-                'id': 'umayyad-mosque',
-                'name': 'Umayyad Mosque (Great Mosque of Damascus)',
-                'location': 'Old City, Damascus, Syria',
-                'description': 'One of oldest and largest mosques in world, built 715 CE, contains tomb believed to be John the Baptist.',
-                'long_description': 'The Umayyad Mosque, also known as the Great Mosque of Damascus, is one of the largest and oldest mosques in the world and a masterpiece of Islamic architecture. Built between 706-715 CE by Umayyad Caliph al-Walid I on the site of a Christian basilica (which itself was built over a Roman temple of Jupiter), the mosque represents the architectural zenith of the Umayyad Dynasty. The mosque complex covers 157 x 97 meters with a vast marble courtyard surrounded by porticoes. The prayer hall features three aisles running parallel to the qibla wall, with the central transept crowned by a magnificent dome (Dome of the Eagle). The interior walls are adorned with spectacular Byzantine-style glass mosaics depicting paradise landscapes with trees, buildings, and rivers - among the finest examples of early Islamic art. The mosque contains a shrine believed to house the head of John the Baptist (Yahya in Islam), revered by both Muslims and Christians who make pilgrimages here. Three minarets represent different architectural periods: the Minaret of Isa (where Muslims believe Jesus will descend before Judgment Day), the Minaret of the Bride, and the Minaret of Qaitbay. The mosque has been continuously used for worship for over 1,300 years, making it one of Islam\'s holiest sites after Mecca and Medina.',
-                'facts': [
-                    'Built 706-715 CE by Umayyad Caliph al-Walid I',
-                    'One of world\'s oldest continuously used mosques (1,300+ years)',
-                    'Covers 157 x 97 meters (15,000+ square meters)',
-                    'Built on site of Roman temple of Jupiter, then Christian basilica',
-                    'Contains shrine of John the Baptist (Yahya)',
-                    'Byzantine glass mosaics cover 4,000+ square meters',
-                    'Third-holiest site in Islam (after Mecca, Medina)',
-                    'UNESCO World Heritage Site (part of Old Damascus)',
-                ],
-                'key_sites': [
-                    {'name': 'Prayer Hall', 'description': 'Massive hall with Byzantine mosaics, ornate mihrab, Dome of the Eagle'},
-                    {'name': 'Shrine of John the Baptist', 'description': 'Tomb believed to contain head of Prophet Yahya, pilgrimage site for Muslims and Christians'},
-                    {'name': 'Courtyard', 'description': 'Large marble-paved courtyard with ablution fountain, Dome of the Treasury'},
-                    {'name': 'Three Minarets', 'description': 'Minaret of Isa (Jesus), Bride Minaret, Qaitbay Minaret - different architectural periods'},
-                ],
-                'entrance_fees': 'Muslims: Free. Non-Muslims: SYP 500 (~$0.40 USD). Modest dress required (robes and headscarves provided free for women at entrance).',
-                'opening_hours': 'Open daily for Muslims. Non-Muslim visitors: 8:00 AM-12:00 PM, 1:00-3:30 PM (outside five daily prayer times). Friday morning closed to tourists (Jumu\'ah prayers). Ramadan hours may vary.',
-                'best_time': 'Early morning (8:00 AM) for beautiful light and fewer crowds. Late afternoon also good. Avoid prayer times (five times daily). Weekdays quieter than weekends. Spring and fall most comfortable temperatures.',
-                'how_to_get_there': 'Located in Old City center, accessed through Souq al-Hamidiyeh. Walking distance from most Old Damascus attractions. Main entrance from Al-Hamidiyeh Souq. Taxis can drop at souq entrance. Old City largely pedestrian.',
-                'what_to_wear': 'Strict modest dress code REQUIRED. Women: headscarf (provided free), long sleeves, long skirt/pants, covered ankles. Men: long pants, shirt covering shoulders. Shoes removed before entering (free bag provided). Respectful Islamic attire essential.',
-                'visitor_tips': [
-                    'Visit outside prayer times (tourists restricted during prayers)',
-                    'Free modest dress (robes, headscarves) at entrance for women',
-                    'Photography allowed but flash prohibited',
-                    'Extremely sacred site - respectful behavior essential',
-                    'Visit John the Baptist shrine (revered by Muslims and Christians)',
-                    'Byzantine mosaics are extraordinary - look up!',
-                    'Courtyard offers peaceful reflection',
-                    'Combine with Old City souq exploration',
-                    'Hire guide for historical and religious significance',
-                    'Remove shoes - bring/wear clean socks',
-                ],
-                'discovery': 'Site of Roman Temple of Jupiter (1st century CE). Converted to Church of St. John the Baptist (4th century). Mosque constructed 706-715 CE preserving some Byzantine elements. Continuously modified through Ayyubid, Mamluk, Ottoman periods. 2001 Pope John Paul II visited (first papal visit to mosque). Recent conflict caused some damage - restoration ongoing.',
-                'architecture': 'Masterpiece of early Islamic architecture influencing mosque design worldwide. Syrian-Byzantine synthesis. Rectangular plan with large courtyard. Three-aisled prayer hall. Magnificent Dome of the Eagle. Byzantine glass mosaics (finest surviving early Islamic mosaics). Three minarets from different eras. Marble columns and floors.',
-                'cultural_impact': 'Major pilgrimage site for Muslims worldwide. Holy to Christians (John the Baptist tomb). Symbol of Islamic Golden Age architecture. Influenced mosque architecture globally. Center of Islamic learning for centuries. UNESCO World Heritage. Featured in religious history. Symbol of interfaith heritage.',
-                'conservation': 'UNESCO World Heritage protection. Recent conflict caused damage (particularly minarets). Ongoing restoration efforts. International support for preservation. Byzantine mosaics carefully maintained. Structural assessments underway. Balancing active worship with conservation. Fire damage 1893 fully restored.',
-                'health_safety': 'Very crowded during prayer times and Fridays. Slippery marble floors. Respectful behavior mandatory (sacred site). Photography restrictions in some areas - ask permission. Security checks at entrance. Generally safe within mosque complex. Pickpockets in crowds - watch belongings.',
-                'guided_tours': 'Local guides highly recommended (explain religious and historical significance). Tours $20-40/person (1-2 hours). Often combined with Old City tours. Audio guides sometimes available. Guides help with protocols and access. Book through hotels or reputable agencies.',
-                'nearby_attractions': 'Al-Hamidiyeh Souq (adjacent), Azem Palace (200m), Straight Street (300m), Saladin\'s Tomb (adjacent to mosque), Old City Damascus, National Museum (2 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '33.5115° N, 36.3065° E',
-                'annual_visitors': '1+ million visitors annually (Muslims and tourists). Major pilgrimage destination.',
-                'climate': 'Indoor and courtyard. Same as Damascus. Summer hot inside (30-35°C). Winter cool. Spring/Fall comfortable. Courtyard fountain provides cooling. Best March-May, Sept-Nov.',
-            },
-            'palmyra': {
-                'id': 'palmyra',
-                'name': 'Palmyra (Tadmor)',
-                'location': 'Homs Governorate, Syria',
-                'description': 'Ancient Silk Road oasis city with magnificent Roman ruins, UNESCO World Heritage Site, "Pearl of the Desert".',
-                'long_description': 'Palmyra, known as Tadmor in Arabic, was one of the most important cultural centers of the ancient world, a wealthy oasis city on the Silk Road trade route linking Persia, India, and China with the Roman Empire. The city reached its zenith in the 3rd century CE under the legendary Queen Zenobia, who briefly established an independent Palmyrene Empire. The extensive ruins cover a vast area featuring the magnificent Colonnade (Grand Colonnade), a 1.1-kilometer monumental street lined with towering Corinthian columns. The Temple of Bel (Baal), one of the best-preserved Roman temples in the Middle East, was dedicated to the Mesopotamian god Bel. The remarkably well-preserved Roman Theater seats 4,000 spectators and still hosts performances. The Valley of the Tombs contains elaborate tower tombs where wealthy Palmyrene families were buried. The Tetrapylon, a monumental platform with 16 columns, marked the intersection of the main colonnaded streets. The Temple of Baalshamin, dedicated to the Phoenician sky god, featured beautiful decorative carvings. The Arch of Triumph formed a monumental gateway. Palmyra\'s unique architecture blends Greco-Roman and Persian influences, reflecting its position at the crossroads of civilizations. The ancient city is set against a dramatic desert landscape with the medieval Arab Castle overlooking the ruins.',
-                'facts': [
-                    'Founded as oasis city around 2,000 BCE',
-                    'Peak prosperity 1st-3rd centuries CE (Silk Road trade)',
-                    'Queen Zenobia ruled 267-272 CE (Palmyrene Empire)',
-                    'UNESCO World Heritage Site since 1980',
-                    'Grand Colonnade 1.1 km long with 750+ columns',
-                    'Roman Theater capacity 4,000 spectators',
-                    'Temple of Bel one of best-preserved Roman temples',
-                    'Severely damaged 2015-2017 - restoration efforts ongoing',
-                ],
-                'key_sites': [
-                    {'name': 'Grand Colonnade', 'description': '1.1 km monumental street with 750+ towering Corinthian columns'},
-                    {'name': 'Temple of Bel', 'description': 'Magnificent temple complex dedicated to Mesopotamian god (severely damaged 2015)'},
-                    {'name': 'Roman Theater', 'description': 'Well-preserved 4,000-seat amphitheater with ornate stage building'},
-                    {'name': 'Valley of the Tombs', 'description': 'Elaborate tower tombs and underground burial chambers of wealthy families'},
-                ],
-                'entrance_fees': 'Site entrance SYP 600 (~$0.50 USD). Museum SYP 300. Photography permit SYP 200. Fees subject to change. Guides extra.',
-                'opening_hours': 'Typically 8:00 AM-6:00 PM daily (summer), 8:00 AM-4:00 PM (winter). Hours may vary. Best to visit early morning or late afternoon to avoid midday desert heat. Check current accessibility.',
-                'best_time': 'October-April for bearable temperatures (15-25°C/59-77°F). Avoid summer May-September (extremely hot 35-45°C/95-113°F, no shade). Spring brings wildflowers. Sunrise and sunset offer magical light and cooler temperatures.',
-                'how_to_get_there': 'Located 215 km northeast of Damascus (3-3.5 hour drive). 160 km east of Homs (2 hour drive). Road access via Homs-Palmyra highway. Organized tours from Damascus/Homs recommended. Check current security and accessibility status before planning visit.',
-                'what_to_wear': 'Desert conditions ESSENTIAL preparation. Sun protection: wide-brim hat, sunglasses, high SPF sunscreen. Light breathable long-sleeve clothing (sun protection). Comfortable closed-toe walking shoes. Carry water bottle. Layers for cool desert nights/winter.',
-                'visitor_tips': [
-                    'Check current site accessibility (recent conflict affected area)',
-                    'Start early morning to avoid intense desert heat',
-                    'Bring plenty of water (dehydration risk in desert)',
-                    'Hire local guide for historical context (rich history)',
-                    'Allow 3-4 hours minimum for main ruins',
-                    'Climb Arab Castle for panoramic sunset views',
-                    'Photography spectacular in golden hour light',
-                    'Wear sturdy shoes (extensive walking on uneven ground)',
-                    'Sun protection CRITICAL (minimal shade)',
-                    'Current restoration status varies - manage expectations',
-                ],
-                'discovery': 'First mentioned in texts 2,000 BCE. Became Roman client state. Queen Zenobia established Palmyrene Empire 267 CE. Conquered by Roman Emperor Aurelian 272 CE. Declined after Silk Road trade routes shifted. Rediscovered by European travelers 17th-18th centuries. Major excavations 20th century. UNESCO World Heritage 1980. Significant damage 2015-2017 under ISIS occupation.',
-                'architecture': 'Unique synthesis of Greco-Roman, Persian, and Arabian architecture. Grand Colonnade with Corinthian columns. Roman theaters, temples, baths. Distinctive tower tombs (4-5 stories). Tetrapylon platforms. Triumphal arches. Limestone construction. Reflects position at civilizational crossroads. Influenced by multiple cultures.',
-                'cultural_impact': 'Major Silk Road trading center linked East and West. Cultural melting pot of civilizations. Queen Zenobia symbol of female power. UNESCO World Heritage Site. Extensive destruction 2015-2017 shocked world. Symbol of cultural heritage destruction. International efforts for digital preservation and reconstruction. Featured in ancient history studies globally.',
-                'conservation': 'UNESCO World Heritage Site (endangered list since 2013). Extensive damage from 2015-2017 conflict including Temple of Bel, Arch of Triumph, tower tombs. UNESCO and international partners supporting documentation and restoration. 3D modeling and digital reconstruction efforts. Syrian authorities working on rehabilitation. Long-term restoration needed. Security situation improving but challenges remain.',
-                'health_safety': 'Extreme desert heat risk (dehydration, heat stroke). Minimal shade - sun protection essential. Check current security situation (recent conflict affected area). Unexploded ordnance risk - stay on marked paths. Limited medical facilities nearby. Bring water and first aid. Travel with reputable guide/tour. Register with embassy.',
-                'guided_tours': 'Local guides highly recommended (explain complex history). Day tours from Damascus $100-150/person (includes transport). Full-day site tour $30-50 with guide. Multi-day Syria tours include Palmyra $300-500. Private tours available. Check current tour operator accessibility.',
-                'nearby_attractions': 'Arab Castle overlooking ruins (1 km), Efqa Spring (traditional oasis), Homs (160 km), Krak des Chevaliers (200 km), Damascus (215 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '34.5561° N, 38.2697° E',
-                'annual_visitors': 'Historically 150,000+ annually. Currently variable - check accessibility. Restoration ongoing.',
-                'climate': 'Extreme desert climate. Summer (May-Sept) scorching 35-45°C/95-113°F. Winter (Dec-Feb) cool 5-15°C/41-59°F, cold nights. Spring/Fall moderate 15-28°C/59-82°F. Minimal rainfall. Extreme temperature swings. Best Oct-April.',
-            },
-            'krak-des-chevaliers': {
-                'id': 'krak-des-chevaliers',
-                'name': 'Krak des Chevaliers (Qal\'at al-Hosn)',
-                'location': 'Homs Governorate, Syria',
-                'description': 'Best-preserved Crusader castle in world, UNESCO World Heritage Site, medieval military architecture masterpiece.',
-                'long_description': 'Krak des Chevaliers, known in Arabic as Qal\'at al-Hosn (Castle of the Kurds), is universally considered the finest example of Crusader military architecture and one of the most important medieval castles in the world. Perched dramatically on a 650-meter-high hill commanding the Homs Gap strategic passage between the Mediterranean coast and Syrian interior, the castle has controlled this crucial route for over 900 years. The massive fortress covers 3 hectares with concentric walls, towers, courtyards, and halls that could house a garrison of 2,000 Crusader knights. Built by the Hospitaller Order of Knights starting in 1142 on the site of an earlier 11th-century castle, Krak des Chevaliers represents the peak of medieval military engineering with sophisticated defensive features including massive curtain walls (up to 9 meters thick), defensive towers, moats, glacis (sloped walls), and a complex entrance system designed to slow attackers. The inner fortress contains the Great Hall with Gothic vaulted ceilings, chapel with frescoes, storage rooms, kitchens, stables, and water cisterns. The castle withstood numerous sieges before finally falling to Mamluk Sultan Baibars in 1271 after a month-long siege. The setting offers breathtaking panoramic views across the Syrian countryside to Lebanon\'s mountains.',
-                'facts': [
-                    'Built by Knights Hospitaller starting 1142 CE',
-                    'Covers 3 hectares on 650m hilltop',
-                    'Garrison capacity 2,000 Crusader knights',
-                    'Walls up to 9 meters thick',
-                    'Withstood 12 sieges before falling 1271',
-                    'UNESCO World Heritage Site since 2006',
-                    'Called "finest castle in the world" by T.E. Lawrence',
-                    'Concentric castle design influenced European architecture',
-                ],
-                'key_sites': [
-                    {'name': 'Great Hall', 'description': 'Magnificent Gothic vaulted hall where knights dined, with rib vaulting and rose window'},
-                    {'name': 'Chapel', 'description': 'Crusader chapel converted to mosque by Mamluks, preserves frescoes and inscriptions'},
-                    {'name': 'Defensive Walls and Towers', 'description': 'Massive concentric walls up to 9m thick, towers with arrow slits, sophisticated defenses'},
-                    {'name': 'Moat and Entrance', 'description': 'Complex defensive entrance with ramp, multiple gates, murder holes'},
-                ],
-                'entrance_fees': 'Site entrance SYP 600 (~$0.50 USD). Photography permit SYP 200. Guide services extra (recommended). Fees subject to change.',
-                'opening_hours': 'Typically 9:00 AM-6:00 PM daily (summer), 9:00 AM-4:00 PM (winter). Hours may vary. Best to visit morning or late afternoon. Check current accessibility and hours.',
-                'best_time': 'March-May and September-November for pleasant weather (15-25°C/59-77°F). Avoid summer June-August (very hot 30-38°C/86-100°F). Winter December-February cool but can be rainy. Spring brings wildflowers.',
-                'how_to_get_there': 'Located 65 km west of Homs, 160 km north of Damascus. Access via Homs-Tartus road, then 12 km south from town of Al-Hosn. Organized tours from Damascus, Homs, or coastal cities. Taxi from Homs ~SYP 2,000-3,000. Check current road conditions and security.',
-                'what_to_wear': 'Comfortable walking shoes ESSENTIAL (lots of stairs, uneven surfaces). Modest clothing. Layers (hilltop can be windy/cool). Summer: sun hat, sunscreen. Winter: warm jacket, rain gear. Good footwear for climbing towers.',
-                'visitor_tips': [
-                    'Allow 2-3 hours for thorough exploration',
-                    'Hire local guide for historical context (rich Crusader history)',
-                    'Climb towers for spectacular panoramic views',
-                    'Explore Great Hall and Chapel (best-preserved areas)',
-                    'Bring flashlight for darker passages and storage rooms',
-                    'Photography spectacular from various angles',
-                    'Visit nearby Saladin Castle (Qal\'at Salah ad-Din) if time permits',
-                    'Wear good shoes (lots of stairs and uneven stones)',
-                    'Check recent restoration status (some damage from conflict)',
-                    'Combine with coastal Syria or Homs visit',
-                ],
-                'discovery': 'Site of 11th-century Kurdish fortress. Captured by Crusaders 1110. Rebuilt by Knights Hospitaller 1142-1170. Withstood Saladin\'s sieges 1188. Fell to Mamluk Sultan Baibars 1271 after forgery trick. Used by various rulers through Ottoman period. Studied by European historians 19th-20th centuries. T.E. Lawrence (Lawrence of Arabia) called it "finest castle in world." UNESCO World Heritage 2006.',
-                'architecture': 'Masterpiece of medieval military architecture. Concentric castle design with inner and outer curtain walls. Massive towers (round for better defense). Complex entrance with multiple gates. Moat and glacis (sloped walls). Gothic Great Hall with rib vaulting. Romanesque chapel. Water cisterns and storage. Mix of Crusader and later Mamluk additions. Influenced European castle design.',
-                'cultural_impact': 'Symbol of Crusader era and medieval military engineering. Studied by military historians worldwide. Influenced castle design in Europe (concentric walls). T.E. Lawrence thesis subject. UNESCO World Heritage. Symbol of Syrian cultural heritage. Featured in history documentaries. Tourist icon of Syria.',
-                'conservation': 'UNESCO World Heritage Site (endangered list since 2013). Recent conflict caused damage (artillery, shelling). Syrian authorities and UNESCO assessing restoration needs. Some stabilization work underway. Challenges: security, funding, expertise. International support for documentation and future restoration. Well-preserved overall despite recent damage.',
-                'health_safety': 'Extensive climbing - fitness required. Steep stairs and uneven surfaces (fall risk). Limited railings in some areas. Summer heat (bring water). Recent conflict - check security status. No facilities inside castle. Hilltop location - weather changes quickly. Wear appropriate footwear.',
-                'guided_tours': 'Local guides highly recommended ($20-30 for castle tour). Day tours from Damascus $100-150 including transport and guide. Combined tours with Palmyra available. Private guides offer detailed military history. Tours from coastal cities (Tartus, Latakia) $50-80. Multi-day Syria tours include Krak.',
-                'nearby_attractions': 'Saladin Castle/Qal\'at Salah ad-Din (60 km north, also UNESCO site), Homs (65 km), Tartus coast (50 km), Marqab Castle (50 km), Mediterranean beaches, Valley of Christians villages',
-                'photos': [
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '34.7569° N, 36.2939° E',
-                'annual_visitors': 'Historically 100,000+ annually. Currently variable depending on accessibility. Restoration and tourism gradually returning.',
-                'climate': 'Mediterranean mountain climate. Summer (June-Sept) warm 25-35°C/77-95°F. Winter (Dec-Feb) cool 5-15°C/41-59°F, rain, occasional snow. Spring/Fall mild 15-25°C/59-77°F. Hilltop windy. Best March-May, Sept-Nov.',
-            },
-        },
-        'iraq': {
-            'baghdad': {
-                'id': 'baghdad',
-                'name': 'Baghdad',
-                'location': 'Baghdad Governorate, Iraq',
-                'description': 'Capital of Iraq on Tigris River, former center of Islamic Golden Age, with 8+ million residents and rich Abbasid heritage.',
-                'long_description': 'Baghdad, the capital and largest city of Iraq with over 8 million residents, sits majestically on both banks of the Tigris River in the heart of Mesopotamia. Founded in 762 CE by Abbasid Caliph al-Mansur as a perfectly circular city (Madinat al-Salam - City of Peace), Baghdad became the world\'s most magnificent metropolis and intellectual center during the Islamic Golden Age (8th-13th centuries). The legendary House of Wisdom (Bayt al-Hikma) translated Greek, Persian, and Indian scientific works, making Baghdad the global hub of learning, mathematics, astronomy, medicine, and philosophy. The city\'s population reached 1 million by 930 CE, making it the world\'s largest city. Today, Baghdad combines ancient heritage with modern developments. The historic Al-Kadhimiya district houses the magnificent Al-Kadhimiya Mosque with golden domes and minarets, one of Shia Islam\'s holiest sites. The Al-Mutanabbi Street, named after the famous 10th-century poet, is a historic book market and cultural center. The Iraq Museum (reopened 2015) displays Mesopotamian treasures including artifacts from Ur, Babylon, and Nineveh. The Abbasid Palace showcases Islamic architecture. Modern Baghdad features the iconic Victory Arch, Al-Shaheed Monument, and the developing Green Zone. The Tigris River divides the city into Rusafa (east) and Karkh (west), connected by numerous bridges.',
-                'facts': [
-                    'Founded 762 CE by Abbasid Caliph al-Mansur',
-                    'Capital of Abbasid Caliphate (Islamic Golden Age)',
-                    'Population 8+ million (Iraq\'s largest city)',
-                    'Built as perfectly circular city (Madinat al-Salam)',
-                    'World\'s largest city in 930 CE (1 million population)',
-                    'House of Wisdom legendary center of learning',
-                    'Tigris River divides city into Rusafa and Karkh',
-                    'Al-Mutanabbi Street famous book market since 10th century',
-                ],
-                'key_sites': [
-                    {'name': 'Al-Kadhimiya Mosque', 'description': 'Magnificent Shia shrine with golden domes, burial place of two Imams'},
-                    {'name': 'Iraq Museum', 'description': 'World-class Mesopotamian archaeology including Sumerian, Babylonian, Assyrian artifacts'},
-                    {'name': 'Al-Mutanabbi Street', 'description': 'Historic book market and cultural center, Friday gathering place for intellectuals'},
-                    {'name': 'Abbasid Palace', 'description': '13th-century palace museum showcasing Islamic architecture and artifacts'},
-                ],
-                'entrance_fees': 'Most streets free to explore. Iraq Museum IQD 25,000 (~$17 USD). Al-Kadhimiya Mosque free (donations welcome). Abbasid Palace IQD 5,000. Photography permits extra.',
-                'opening_hours': 'City 24/7. Iraq Museum: Sunday-Thursday 9:00 AM-4:00 PM (closed Friday-Saturday). Al-Kadhimiya Mosque: Daily, avoid prayer times. Markets: 9:00 AM-8:00 PM.',
-                'best_time': 'October-April for bearable temperatures (10-25°C/50-77°F). Avoid summer May-September (extremely hot 40-50°C/104-122°F). Spring brings pleasant weather. Winter mild but can be rainy.',
-                'how_to_get_there': 'Baghdad International Airport (BIAP) 16 km west of center. Taxis, hotel shuttles available. Road access from Jordan, Kuwait, Iran, Turkey. Internal flights from Basra, Erbil. City has taxis, buses. Check current security advisories.',
-                'what_to_wear': 'Conservative modest clothing ESSENTIAL. Women: cover shoulders, knees, consider headscarf for religious sites. Men: long pants, covered shoulders. Comfortable walking shoes. Summer: light breathable fabrics. Winter: layers, light jacket.',
-                'visitor_tips': [
-                    'Check current security situation and travel advisories',
-                    'Hire local guide for navigation and cultural context',
-                    'Visit Al-Mutanabbi Street on Friday (busiest, most atmospheric)',
-                    'Iraq Museum world-class Mesopotamian collection',
-                    'Respect Islamic customs and prayer times',
-                    'Photography restrictions at some sites - ask permission',
-                    'Try traditional Iraqi cuisine (masgouf grilled fish, kubba)',
-                    'Register with embassy upon arrival',
-                    'Avoid large gatherings and demonstrations',
-                    'Quality hotels in Green Zone and Karrada areas',
-                ],
-                'discovery': 'Founded 762 CE as circular city by Caliph al-Mansur. Became Abbasid Caliphate capital. Golden Age 8th-13th centuries. Destroyed by Mongols 1258. Rebuilt under Ottomans. Modern Iraq capital since 1921. Saddam Hussein era extensive construction. 2003 war caused damage. Ongoing reconstruction and stabilization.',
-                'architecture': 'Mix of Abbasid, Ottoman, and modern architecture. Al-Kadhimiya Mosque Persian-style golden domes. Abbasid Palace brick iwan arches. Ottoman-era buildings. Modern monuments: Victory Arch (crossed swords), Al-Shaheed Monument. Tigris riverfront development. Traditional wind towers. Mix of ancient and contemporary.',
-                'cultural_impact': 'Center of Islamic Golden Age learning and culture. House of Wisdom preserved classical knowledge. Birthplace of algebra (al-Khwarizmi), modern medicine (al-Razi), astronomy advances. Historical symbol of Arab and Islamic civilization. UNESCO Memory of World (Abbasid manuscripts). Modern Iraqi cultural capital.',
-                'conservation': 'Protecting historical sites amid challenges. Iraq Museum artifacts recovered after looting. Al-Kadhimiya Mosque well-maintained. Abbasid Palace restoration. UNESCO involvement. Challenges: security, funding, expertise. Al-Mutanabbi Street rebuilt after bombings. Ongoing heritage documentation.',
-                'health_safety': 'Check travel advisories (security concerns in some areas). Quality medical facilities available. Tap water - drink bottled. Food hygiene variable - eat at reputable places. Extreme summer heat risk. Traffic congestion severe. Register with embassy. Hire reputable guides. Avoid large crowds.',
-                'guided_tours': 'Local guides essential for safety and context. Day tours $80-150/person. Iraq Museum tours $50-80. Multi-day Iraq tours $500-800. Private guides $100-200/day. Book through established agencies. Security escorts sometimes required. Cultural tours include traditional meals.',
-                'nearby_attractions': 'Ctesiphon ruins (35 km), Babylon (85 km), Karbala (100 km), Najaf (160 km), Samarra (125 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '33.3152° N, 44.3661° E',
-                'annual_visitors': 'Variable (security-dependent). Religious tourism to Al-Kadhimiya significant. Business and official visitors.',
-                'climate': 'Hot desert climate. Summer (May-Oct) extremely hot 40-50°C/104-122°F. Winter (Nov-Apr) mild 10-20°C/50-68°F. Occasional rain Nov-March. Sandstorms possible. Best Oct-April.',
-            },
-            'babylon': {
-                'id': 'babylon',
-                'name': 'Babylon (Babil)',
-                'location': 'Babil Governorate, Iraq',
-                'description': 'Ancient Mesopotamian city, one of Seven Wonders (Hanging Gardens), Ishtar Gate, Hammurabi\'s capital. UNESCO World Heritage.',
-                'long_description': 'Babylon stands as one of the most famous cities in ancient history, capital of the mighty Babylonian Empire and site of one of the Seven Wonders of the Ancient World - the legendary Hanging Gardens. Founded over 4,000 years ago on the Euphrates River, Babylon reached its zenith under King Nebuchadnezzar II (605-562 BCE) who transformed it into the most magnificent city of the ancient world with massive walls, elaborate gates, palaces, and the Hanging Gardens (though their exact location remains debated). The city was home to King Hammurabi (1792-1750 BCE) who created the Code of Hammurabi, one of the earliest written legal codes. The iconic Ishtar Gate, decorated with blue glazed bricks and golden lions and dragons, served as the northern entrance to the city (original now in Berlin\'s Pergamon Museum, reconstruction at site). The Processional Way, a grand avenue lined with walls showing 120 lions, connected the Ishtar Gate to temples. The ancient city covered 10 square kilometers with double walls up to 25 meters high. Babylon is mentioned extensively in the Bible, including the Tower of Babel story. Archaeological excavations have revealed the Southern Palace (Nebuchadnezzar\'s residence), temples including the Esagila dedicated to Marduk, and residential areas. Recent UNESCO World Heritage designation (2019) recognizes its universal significance. Saddam Hussein controversially reconstructed some areas in the 1980s.',
-                'facts': [
-                    'Founded over 4,000 years ago (circa 2300 BCE)',
-                    'Capital of Babylonian Empire under Nebuchadnezzar II',
-                    'Site of Hanging Gardens (Seven Wonders of Ancient World)',
-                    'Hammurabi\'s Code created here (1750 BCE)',
-                    'Ishtar Gate decorated with blue glazed bricks',
-                    'Ancient walls 25 meters high, extended 18 km',
-                    'UNESCO World Heritage Site since 2019',
-                    'Mentioned in Bible (Tower of Babel)',
-                ],
-                'key_sites': [
-                    {'name': 'Ishtar Gate (Reconstruction)', 'description': 'Blue-glazed brick gate with golden lions and dragons (original in Berlin)'},
-                    {'name': 'Processional Way', 'description': 'Grand avenue with 120 glazed lion reliefs leading to temples'},
-                    {'name': 'Southern Palace', 'description': 'Nebuchadnezzar II\'s palace, possible location of Hanging Gardens'},
-                    {'name': 'Babylon Museum', 'description': 'Archaeological museum displaying findings from excavations'},
-                ],
-                'entrance_fees': 'Site entrance IQD 25,000 (~$17 USD). Museum included. Photography permit IQD 5,000. Guided tours extra. Fees subject to change.',
-                'opening_hours': 'Daily 8:00 AM-4:00 PM (subject to change). Best to visit morning to avoid midday heat. Museum same hours. Check current accessibility.',
-                'best_time': 'October-April for comfortable temperatures (15-28°C/59-82°F). Avoid summer May-September (scorching 40-48°C/104-118°F). Spring brings wildflowers. Winter pleasant for exploration.',
-                'how_to_get_there': 'Located 85 km south of Baghdad (1.5-2 hour drive). Accessible via Highway 8 to Hillah, then 5 km to site. Organized tours from Baghdad recommended. Taxi from Baghdad IQD 60,000-80,000. Check current road security.',
-                'what_to_wear': 'Comfortable walking shoes (extensive ruins, uneven ground). Sun protection: hat, sunglasses, sunscreen. Light long-sleeve clothing (sun protection). Modest attire. Summer: very light clothing, carry water. Winter: light jacket for cool mornings.',
-                'visitor_tips': [
-                    'Hire guide for historical context (rich 4,000-year history)',
-                    'Allow 2-3 hours for site and museum',
-                    'Visit museum first for archaeological background',
-                    'Reconstructions controversial but help visualize ancient city',
-                    'Photography allowed (permit required)',
-                    'Bring water (minimal facilities, hot climate)',
-                    'Combine with nearby Karbala or Najaf visit',
-                    'Original Ishtar Gate in Berlin Pergamon Museum',
-                    'Early morning or late afternoon best light',
-                    'Check current site accessibility and security',
-                ],
-                'discovery': 'Continuously inhabited ancient times through Islamic era. Western excavations began 1899 by German archaeologist Robert Koldewey (continued until 1917). Uncovered Ishtar Gate, palaces, temples. Iraqi excavations continued. Saddam Hussein controversial reconstruction 1980s. UNESCO World Heritage nomination decades-long process, finally inscribed 2019.',
-                'architecture': 'Ancient Mesopotamian mud-brick architecture. Famous for blue-glazed brick facades (Ishtar Gate). Massive double walls and moats. Ziggurat temple towers. Palace complexes with courtyards. Processional Way glazed brick reliefs. Mix of ancient ruins and 1980s reconstructions. Influenced Near Eastern architecture.',
-                'cultural_impact': 'One of most famous ancient cities. Symbol of Mesopotamian civilization. Hanging Gardens legendary wonder. Hammurabi\'s Code foundational legal document. Biblical significance (Tower of Babel, Babylon). Influenced art, literature, culture worldwide. UNESCO World Heritage. Subject of archaeological research. Tourist and pilgrimage destination.',
-                'conservation': 'UNESCO World Heritage Site protection. Challenges: damage from wars, looting, erosion. U.S. military base 2003-2004 caused damage. UNESCO involvement in preservation. Iraqi authorities working on stabilization. Balance between reconstruction and archaeological integrity debated. Ongoing documentation and research.',
-                'health_safety': 'Extreme summer heat (dehydration risk - bring water). Minimal shade at site. Uneven ancient ruins (watch footing). Check security situation before visiting. Sandstorms possible. Quality medical facilities in nearby Hillah. Travel with reputable guide. Sun exposure protection essential.',
-                'guided_tours': 'Guides highly recommended (complex history). Day tours from Baghdad $100-150 including transport. On-site guides IQD 30,000-50,000. Private tours $150-250. Combined tours with Karbala/Najaf available. Multi-day Mesopotamia tours $400-600.',
-                'nearby_attractions': 'Karbala (50 km), Borsippa ziggurat (15 km), Najaf (80 km), Hillah city (5 km), Baghdad (85 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '32.5355° N, 44.4275° E',
-                'annual_visitors': '50,000+ visitors annually (growing with UNESCO status and stabilization)',
-                'climate': 'Hot desert climate. Summer (May-Oct) extremely hot 40-48°C/104-118°F. Winter (Nov-Apr) mild 10-25°C/50-77°F. Minimal rainfall. Occasional sandstorms. Best Oct-April.',
-            },
-            'karbala': {
-                'id': 'karbala',
-                'name': 'Karbala',
-                'location': 'Karbala Governorate, Iraq',
-                'description': 'Holy Shia city with Imam Hussein Shrine, site of 680 CE Battle of Karbala, major pilgrimage destination for millions.',
-                'long_description': 'Karbala is one of the holiest cities in Shia Islam, attracting over 20 million pilgrims annually to commemorate the martyrdom of Imam Hussein ibn Ali, grandson of Prophet Muhammad, at the Battle of Karbala in 680 CE. This pivotal battle between Imam Hussein\'s small band and the Umayyad Caliph Yazid I\'s army profoundly shaped Islamic history and Shia identity. The magnificent Imam Hussein Shrine, with its golden dome and minarets, marks Hussein\'s burial place and forms the spiritual heart of the city. Adjacent stands the equally stunning Al-Abbas Shrine honoring Hussein\'s half-brother Abbas ibn Ali, also martyred in the battle. Both shrines feature breathtaking Islamic architecture with gold-covered domes, intricate tile work, mirrored halls, Persian carpets, and crystal chandeliers. The area between the two shrines bustles with pilgrims, shops, and religious activities. Karbala draws massive crowds during Ashura (10th day of Muharram) when millions commemorate Hussein\'s martyrdom with processions, mourning rituals, and passion plays. The Arba\'een pilgrimage (40 days after Ashura) sees one of the world\'s largest annual gatherings with up to 20 million walking to Karbala from Najaf and beyond. The city combines profound religious significance with vibrant bazaars, traditional hospitality, and architectural splendor.',
-                'facts': [
-                    'Site of Battle of Karbala (680 CE)',
-                    'Imam Hussein ibn Ali martyred here',
-                    'Third-holiest city in Shia Islam (after Mecca, Medina)',
-                    '20+ million pilgrims visit annually',
-                    'Arba\'een pilgrimage world\'s largest annual gathering',
-                    'Twin golden-domed shrines (Hussein and Abbas)',
-                    'Population 700,000+ (swells during pilgrimages)',
-                    'Located 100 km southwest of Baghdad',
-                ],
-                'key_sites': [
-                    {'name': 'Imam Hussein Shrine', 'description': 'Magnificent shrine with golden dome, burial place of Imam Hussein, Shia Islam\'s holiest site'},
-                    {'name': 'Al-Abbas Shrine', 'description': 'Golden-domed shrine honoring Abbas ibn Ali, Hussein\'s half-brother martyred with him'},
-                    {'name': 'Area Between Two Shrines', 'description': 'Sacred space connecting shrines, filled with pilgrims, shops, religious activities'},
-                    {'name': 'Karbala Museum', 'description': 'Museum documenting Battle of Karbala and Islamic history'},
-                ],
-                'entrance_fees': 'Shrines FREE entry (donations welcome). Museums IQD 5,000-10,000. Photography restrictions inside shrines. Modest dress required.',
-                'opening_hours': 'Shrines open 24/7 for pilgrims. Best visiting (non-Muslims): early morning or late afternoon, avoid peak prayer times. During Ashura and Arba\'een extremely crowded. Museums: 9:00 AM-5:00 PM.',
-                'best_time': 'October-April for comfortable temperatures (15-30°C/59-86°F). Avoid summer (extremely hot 40-50°C). Experience Ashura (Muharram 10th) or Arba\'een (40 days later) for full pilgrimage atmosphere but expect massive crowds. Spring pleasant.',
-                'how_to_get_there': 'Located 100 km southwest of Baghdad (1.5-2 hour drive). Regular buses/minibuses from Baghdad. Organized tours available. Najaf 80 km away (frequent connections). Karbala International Airport for some regional flights. Walking pilgrimage from Najaf popular.',
-                'what_to_wear': 'STRICT modest dress code ESSENTIAL. Women: full coverage including headscarf (chador available at entrances), long sleeves, long skirt/pants covering ankles. Men: long pants, shirt covering shoulders. Black clothing common during Ashura. Respectful Islamic attire mandatory.',
-                'visitor_tips': [
-                    'Extremely sacred site - profound respect ESSENTIAL',
-                    'Photography very restricted inside shrines - ask permission',
-                    'Remove shoes before entering shrines',
-                    'Free accommodations and meals during pilgrimages (mawakib)',
-                    'Ashura and Arba\'een offer unique spiritual experience',
-                    'Crowds overwhelming during major pilgrimages',
-                    'Non-Muslims welcome but respect rituals',
-                    'Local hospitality extraordinary toward pilgrims',
-                    'Hire local guide for historical and religious context',
-                    'Security tight but generally safe for pilgrims',
-                ],
-                'discovery': 'Battle of Karbala fought 680 CE. Shrines built over centuries, expanded by various dynasties. Persian Safavids, Ottomans contributed. Major renovations 20th-21st centuries. Gold domes recent additions. Site continuously venerated for 1,340+ years. Modern facilities expanded for growing pilgrim numbers.',
-                'architecture': 'Stunning Islamic architecture blending Persian, Arab, and modern elements. Golden domes and minarets. Intricate tile work with calligraphy. Mirrored halls (ayineh-kari). Persian carpets. Crystal chandeliers. Marble courtyards. Iwan arches. Continuous expansion and beautification. Modern facilities for pilgrims.',
-                'cultural_impact': 'Central to Shia Islamic identity and theology. Battle of Karbala defining moment in Islam. Ashura and Arba\'een major religious observances. Influenced Islamic art, poetry, music. Passion plays (ta\'zieh) reenact events. Symbol of standing against tyranny. Draws millions in world\'s largest pilgrimage. Cultural tourism hub.',
-                'conservation': 'Well-maintained by Shia religious authorities and Iraqi government. Continuous restoration and expansion. Challenges: managing massive pilgrimage crowds. Infrastructure improvements ongoing. Heritage protection balance with modernization. Security measures extensive. Fire safety (many candles, fabrics).',
-                'health_safety': 'Generally safe with heavy security presence. Extremely crowded during pilgrimages (stampede risk historically). Summer heat dangerous (dehydration, heat stroke). Medical facilities available. Pilgrims receive free services. Avoid political demonstrations. Respect religious sensitivities. Register with embassy.',
-                'guided_tours': 'Local guides recommended for religious and historical context. Tours $30-80/person including shrines, museums, battlefield site. Multi-day religious tours $200-400. Ashura/Arba\'een specialized tours available. Guides explain significance of rituals. Iraqi tour operators offer packages.',
-                'nearby_attractions': 'Najaf (80 km), Babylon (50 km), Imam Ali Shrine Najaf, Kufa Mosque (95 km), Baghdad (100 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '32.6162° N, 44.0244° E',
-                'annual_visitors': '20+ million pilgrims annually (Arba\'een alone draws 20 million, one of world\'s largest gatherings)',
-                'climate': 'Hot desert climate. Summer (May-Oct) extremely hot 40-50°C/104-122°F. Winter (Nov-Apr) mild 10-25°C/50-77°F. Occasional rain winter. Best Oct-April.',
-            },
-            'erbil-citadel': {
-                'id': 'erbil-citadel',
-                'name': 'Erbil Citadel (Qalat Erbil)',
-                'location': 'Erbil, Kurdistan Region, Iraq',
-                'description': 'Oldest continuously inhabited settlement on Earth (8,000+ years), UNESCO World Heritage Site, Kurdish cultural symbol.',
-                'long_description': 'Erbil Citadel stands as one of the world\'s most remarkable archaeological and cultural sites - a massive fortified settlement perched atop a tell (artificial mound) rising 30 meters above the surrounding plain, representing over 8,000 years of continuous human habitation, making it potentially the world\'s oldest continuously inhabited settlement. The tell was formed by successive layers of construction, with each civilization building atop the ruins of its predecessors, creating a remarkable stratigraphic record of human history. The oval-shaped Citadel covers approximately 110,000 square meters with monumental entrance gates and a perimeter wall enclosing traditional Kurdish houses with distinctive facades. Archaeological evidence shows settlement from at least 6,000 BCE (Neolithic period), with subsequent occupation by Assyrians, Babylonians, Persians, Greeks, Romans, Parthians, Sassanians, Arabs, Ottomans, and modern Kurds. The Citadel served as the historical heart of Erbil city, housing markets, mosques, schools, and homes until the 1950s when residents began moving to newer areas. UNESCO designated it a World Heritage Site in 2014, recognizing its universal significance. A major restoration project begun in 2007 aims to preserve the Citadel while interpreting its layers of history. Today, visitors can explore the gates, traditional houses, mosques, and museums while enjoying panoramic views of modern Erbil.',
-                'facts': [
-                    'Oldest continuously inhabited settlement (8,000+ years)',
-                    'Settlement dates to at least 6,000 BCE (Neolithic)',
-                    'Built on 30-meter-high artificial tell mound',
-                    'Covers 110,000 square meters',
-                    'UNESCO World Heritage Site since 2014',
-                    'Over 100 traditional houses within walls',
-                    'Capital of Kurdish-controlled region',
-                    'Occupied by dozens of civilizations',
-                ],
-                'key_sites': [
-                    {'name': 'Main Gateway', 'description': 'Monumental entrance gate with shops and traditional architecture'},
-                    {'name': 'Kurdish Textile Museum', 'description': 'Traditional Kurdish textiles, costumes, and crafts'},
-                    {'name': 'Traditional Houses', 'description': 'Restored Ottoman-era houses showcasing Kurdish domestic architecture'},
-                    {'name': 'Citadel Walls and Ramparts', 'description': 'Perimeter walls offering panoramic views of modern Erbil'},
-                ],
-                'entrance_fees': 'Citadel entrance IQD 5,000 (~$3.50 USD). Museums additional IQD 3,000-5,000 each. Photography permitted. Guided tours extra. Fees subject to change.',
-                'opening_hours': 'Daily 9:00 AM-6:00 PM (summer), 9:00 AM-5:00 PM (winter). Museums close 30 minutes before. Friday may have limited hours. Best to visit morning or late afternoon.',
-                'best_time': 'March-May and September-November for pleasant weather (18-30°C/64-86°F). Avoid summer June-August (extremely hot 40-45°C/104-113°F). Spring brings Kurdish New Year (Newroz) celebrations. Winter cool but manageable.',
-                'how_to_get_there': 'Located in Erbil city center, Kurdistan Region. Erbil International Airport 7 km west. Taxi from airport IQD 8,000-10,000. Walking distance from city center bazaar. Easily accessible. Erbil well-connected to Baghdad, Turkey, Europe by flights.',
-                'what_to_wear': 'Comfortable walking shoes (cobblestone streets, stairs). Modest clothing (Kurdish region more relaxed than southern Iraq). Summer: sun hat, sunglasses, light clothing. Winter: warm jacket for cool winds atop citadel. Layers recommended.',
-                'visitor_tips': [
-                    'Allow 2-3 hours for thorough exploration',
-                    'Hire guide for 8,000-year history (complex layers)',
-                    'Visit museums for Kurdish cultural context',
-                    'Panoramic views from ramparts spectacular',
-                    'Explore Erbil bazaar at citadel base',
-                    'Photography allowed (beautiful traditional architecture)',
-                    'Kurdistan region generally safe and tourist-friendly',
-                    'Try Kurdish cuisine in nearby restaurants',
-                    'Combine with Erbil city tour and bazaar visit',
-                    'Restoration ongoing - some areas may be closed',
-                ],
-                'discovery': 'Continuously inhabited since Neolithic (6,000 BCE minimum). Archaeological surveys show occupation layers. Major excavations began 21st century. UNESCO involvement led to World Heritage designation 2014. Erbil Citadel Revitalization Project (HCECR) launched 2007 for conservation. Residents temporarily relocated for restoration. Ongoing research uncovering new findings.',
-                'architecture': 'Stratified tell mound architecture showing 8,000 years of building styles. Ottoman-era houses dominate visible structures. Traditional Kurdish facades with wooden balconies. Narrow winding streets. Mosques with minarets. Perimeter walls and gates. Mix of mud-brick and stone. Restoration preserving traditional techniques. Represents evolution of Middle Eastern architecture.',
-                'cultural_impact': 'Symbol of Kurdish identity and cultural continuity. Testament to human civilization\'s longevity. UNESCO World Heritage. Archaeological treasure trove. Tourist attraction for Kurdistan region. Featured in historical documentaries. Pride of Erbil and Kurdistan. Educational resource. Example of successful heritage preservation.',
-                'conservation': 'UNESCO World Heritage Site protection. Major restoration project (HCECR) ongoing since 2007. Challenges: structural stability, modernization vs authenticity, funding. International support from UNESCO, World Monuments Fund. Traditional building techniques used. Digital documentation. Successful model of heritage conservation. Balance between preservation and living heritage.',
-                'health_safety': 'Generally safe area (Kurdistan region stable). Well-maintained site. Some restoration areas closed for safety. Summer extreme heat (bring water). Stairs and uneven cobblestones (watch footing). Quality medical facilities in Erbil. Kurdistan security good. Standard urban precautions.',
-                'guided_tours': 'Guides highly recommended (complex 8,000-year history). On-site guides IQD 20,000-30,000 (2 hours). Private tours $50-80. Half-day Erbil city tours including Citadel $80-120. Multi-day Kurdistan tours $300-500. Kurdish cultural tours available.',
-                'nearby_attractions': 'Erbil Bazaar (adjacent), Sami Abdulrahman Park (5 km), Kurdistan Museum (6 km), Minaret Park (3 km), Shanidar Cave (80 km), Rawanduz Canyon (120 km)',
-                'photos': [
-                    'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                    'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                ],
-                'coordinates': '36.1911° N, 44.0093° E',
-                'annual_visitors': '100,000+ visitors annually (growing with UNESCO status and Kurdistan tourism development)',
-                'climate': 'Semi-arid continental. Summer (June-Sept) hot 35-45°C/95-113°F. Winter (Dec-Feb) cool 5-15°C/41-59°F, occasional rain. Spring/Fall pleasant 18-30°C/64-86°F. Best March-May, Sept-Nov.',
-            },
-            'najaf': {
-                'id': 'najaf',
-                'name': 'Najaf',
-                'location': 'Najaf, Iraq',
-                'description': 'Najaf is one of the holiest cities in Shia Islam, home to the sacred shrine of Imam Ali ibn Abi Talib, the first Shia Imam and cousin of Prophet Muhammad. Located 160 kilometers south of Baghdad, the city attracts millions of pilgrims annually who come to pay their respects at the magnificent golden-domed shrine. The Imam Ali Shrine complex features stunning Islamic architecture with gold-plated domes, intricate tile work, Persian carpets, and mirrored halls. Najaf also hosts the world\'s largest cemetery, Wadi-us-Salaam (Valley of Peace), where Shia Muslims from around the world seek burial near Imam Ali\'s shrine. The city is a major center of Shia theology and learning, housing the prestigious Najaf Seminary (Hawza), one of the oldest and most influential Islamic seminaries. Pilgrimage peaks during religious occasions including Eid al-Ghadir and the anniversary of Imam Ali\'s martyrdom (21st of Ramadan).',
-                'long_description': 'Najaf holds immense religious significance as the burial place of Imam Ali (601-661 CE), the Prophet Muhammad\'s cousin, son-in-law, and the first male convert to Islam. For Shia Muslims, Imam Ali is revered as the rightful first successor to the Prophet and the first of twelve divinely appointed Imams. The shrine complex was first built in the 8th century, with the current magnificent golden dome and twin minarets dating from various periods of reconstruction and expansion. The complex features breathtaking Islamic architecture including gold-plated surfaces that shimmer in the sunlight, elaborate calligraphy, intricate arabesque patterns, Persian carpets, and crystalline chandeliers. The shrine\'s interior includes marble courtyards, prayer halls adorned with mirrors and gold, and the central tomb chamber where Imam Ali is believed to be buried. Najaf serves as one of the three pillar cities of Shia Islam alongside Mecca and Karbala, making it the third or fourth holiest site (depending on interpretation) in Shia tradition. The city welcomes an estimated 10-15 million pilgrims annually, with numbers swelling during religious festivals and commemorations. Adjacent to the shrine is Wadi-us-Salaam cemetery, recognized by Guinness World Records as the world\'s largest cemetery, spanning over 1,485 acres with millions of graves. Being buried near Imam Ali\'s shrine is considered a great honor and blessing in Shia tradition.',
-                'facts': [
-                    'One of holiest cities in Shia Islam - third or fourth holiest site after Mecca, Medina, and alongside Karbala',
-                    'Home to Imam Ali Shrine with magnificent golden dome visible across the city',
-                    'Wadi-us-Salaam - world\'s largest cemetery by Guinness World Records with millions of graves',
-                    'Najaf Seminary (Hawza) - one of oldest and most prestigious Shia Islamic learning centers since 1056 CE',
-                    'Attracts 10-15 million pilgrims annually from Iraq, Iran, Pakistan, India, Lebanon, and worldwide',
-                    'Imam Ali martyred 661 CE - anniversary observed on 21st of Ramadan with massive commemorations',
-                    'City population approximately 1 million (swells significantly during pilgrimages)',
-                    'Located 160 km south of Baghdad in Iraq\'s Middle Euphrates region',
-                ],
-                'key_sites': [
-                    {'name': 'Imam Ali Shrine', 'description': 'Sacred shrine with golden dome and twin minarets, ornate interior with mirrored halls, Persian carpets, and golden calligraphy. The holiest site in Najaf where Imam Ali is buried.'},
-                    {'name': 'Wadi-us-Salaam Cemetery', 'description': 'World\'s largest cemetery covering over 1,485 acres with millions of graves dating back over 1,400 years. Shia Muslims worldwide seek burial near Imam Ali.'},
-                    {'name': 'Najaf Seminary (Hawza)', 'description': 'Prestigious Shia Islamic learning institution founded in 1056 CE. Major center of Islamic scholarship producing prominent scholars and clerics, including Grand Ayatollahs.'},
-                    {'name': 'Great Mosque of Kufa', 'description': 'Historic mosque 10 km from Najaf where Imam Ali was assassinated in 661 CE. Contains the site where he was struck while praying. Fourth oldest mosque in Islam.'},
-                ],
-                'entrance_fees': 'Free entry to all religious sites and shrines. Visitors welcome regardless of faith (modest dress required). Photography restrictions apply inside shrine.',
-                'opening_hours': 'Imam Ali Shrine open 24 hours daily. Best visiting hours 6:00 AM - 12:00 PM and 4:00 PM - 10:00 PM to avoid peak prayer times and extreme crowds.',
-                'best_time': 'September to May for milder weather (summer temperatures exceed 45°C). Avoid peak pilgrimage periods (Ramadan 21st, Eid al-Ghadir, religious commemorations) for less crowding unless participating in religious observance.',
-                'how_to_get_there': 'Al Najaf International Airport (NJF) serves domestic and regional flights. From Baghdad: 3-hour drive via Highway 9 (160 km). From Karbala: 80 km drive (1.5 hours). Shared taxis and buses available between cities.',
-                'what_to_wear': 'Extremely modest dress required. Men: long pants, shirts covering shoulders. Women: full abaya (black cloak), hijab covering all hair, no makeup. Chadors available free at shrine entrances.',
-                'visitor_tips': [
-                    'Bring passport/ID for security checkpoints around the shrine complex',
-                    'Remove shoes before entering shrine - carry plastic bag for footwear',
-                    'Photography prohibited inside shrine interior - security enforced strictly',
-                    'Free accommodations (mawakib) often available during pilgrimage periods',
-                    'Learn basic Arabic phrases - "As-salamu alaykum" (peace be upon you)',
-                    'Respect prayer times - avoid visits during Maghrib and Isha prayers',
-                    'Join pilgrimage processions respectfully if interested in cultural immersion',
-                    'Visit early morning or late afternoon to avoid extreme heat and largest crowds',
-                    'Hire local guide for historical context and navigating religious customs',
-                    'Stay hydrated especially in summer - water freely distributed near shrine',
-                ],
-                'discovery': 'According to Shia tradition, Imam Ali\'s burial location was kept secret for centuries to protect it from desecration. The site was reportedly revealed by Imam Ja\'far al-Sadiq (702-765 CE), the sixth Shia Imam. The first shrine was constructed during the Abbasid period (750-1258 CE), with the structure undergoing numerous reconstructions following damage from wars and natural disasters. The current magnificent golden dome was added in the 16th century during the Safavid dynasty of Persia, which promoted Shia Islam as the state religion.',
-                'architecture': 'The Imam Ali Shrine showcases exquisite Islamic architecture spanning multiple historical periods. The golden dome, covered in 7,777 gold-plated tiles, reaches approximately 35 meters high. Two golden minarets flank the dome, each standing about 35 meters tall. The shrine complex includes multiple courtyards paved with marble and surrounded by intricately decorated iwans (vaulted halls). Interior features stunning mirror work (aineh-kari), Persian calligraphy, turquoise and blue tile work, massive crystal chandeliers, and precious Persian carpets. The zarih (protective cage) around the tomb is crafted from pure silver with intricate engravings and inlaid precious stones.',
-                'cultural_impact': 'Najaf serves as a cornerstone of Shia identity and religious practice worldwide. The city\'s Hawza seminary has educated generations of Shia scholars, including Grand Ayatollahs who provide religious guidance to millions of Shia Muslims globally. The shrine pilgrimage reinforces community bonds and religious devotion among Shia populations from diverse countries and cultures. Burial in Wadi-us-Salaam represents a final spiritual journey for millions, creating a profound connection between the living and deceased across generations. The city functions as a major center of religious tourism, scholarship, and cultural preservation for the global Shia community.',
-                'conservation': 'The Iraqi government and religious authorities continuously maintain and restore the shrine complex. Recent renovations include modernization of facilities while preserving historical authenticity, installation of climate control systems to protect delicate interior decorations, enhanced security measures for pilgrims, and expansion of courtyards to accommodate growing numbers of visitors. The shrine administration manages conservation with support from religious endowments (waqf) and donations from pilgrims worldwide.',
-                'health_safety': 'Security checkpoints surround the shrine area - cooperate with thorough screening. Drink plenty of water, especially during summer heat. Be cautious of large crowds during peak pilgrimage times. Follow local authorities\' guidance. Medical facilities available near shrine for pilgrims. Women should be aware of gender-segregated areas within shrine complex.',
-                'guided_tours': 'Local religious guides available near shrine entrances (fees negotiable). Some offer historical and theological context tours. Seminary students sometimes provide informal guidance. Group pilgrimages often include organized tours with religious scholars. Hotel concierges can arrange knowledgeable guides.',
-                'nearby_attractions': 'Great Mosque of Kufa (10 km) - historic mosque where Imam Ali was assassinated. Al-Sahlah Mosque (3 km) - significant Shia pilgrimage site. Al-Hanana (Tomb of Imam Ali\'s daughters) - small shrine. Wadi-us-Salaam Cemetery - world\'s largest cemetery. Old Najaf Bazaar - traditional market near shrine.',
-                'coordinates': '32.0° N, 44.3167° E',
-                'annual_visitors': '10-15 million pilgrims annually (higher during religious commemorations)',
-                'climate': 'Hot desert climate. Summer (May-September): 40-50°C. Winter (November-March): 10-20°C. Spring/fall: 20-35°C. Minimal rainfall.',
-                'photos': [
-                    '/static/core/images/building-with-clock-front-cloudy-sky-background.jpg',
-                    '/static/core/images/building-with-clock-front-cloudy-sky-background.jpg',
-                ],
-            },
-            'ur-ziggurat': {
-                'id': 'ur-ziggurat',
-                'name': 'Ur Ziggurat',
-                'location': 'Dhi Qar Province, Southern Iraq',
-                'description': 'The Great Ziggurat of Ur is one of the best-preserved ziggurats from ancient Mesopotamia and a testament to Sumerian architectural achievement. Built approximately 4,100 years ago during the reign of King Ur-Nammu (founder of the Third Dynasty of Ur), this massive stepped pyramid temple was dedicated to Nanna, the moon god. The ziggurat originally stood about 30 meters tall with three terraces, though only the first terrace and part of the second survive today. Located near the ancient city of Ur (birthplace of the Prophet Abraham according to Judeo-Christian-Islamic tradition), the site provides invaluable insights into one of humanity\'s earliest civilizations. The reconstructed facade showcases the original mud-brick construction techniques and the building\'s imposing scale. Recent archaeological work continues to uncover artifacts and structures around the ziggurat, revealing the sophisticated urban planning of ancient Ur.',
-                'long_description': 'The Great Ziggurat of Ur represents one of the most significant archaeological treasures from ancient Mesopotamia, the cradle of civilization. Constructed around 2100 BCE under King Ur-Nammu and completed by his son Shulgi, the ziggurat served as the religious center of Ur, one of Sumer\'s most important city-states. The structure was built as a temple platform to honor Nanna (also called Sin), the moon god and patron deity of Ur. Ancient ziggurats functioned as a bridge between heaven and earth, places where priests could commune with the gods. The building was constructed primarily from mud bricks (millions of them), with the outer facade covered in fired bricks set in bitumen (natural tar) to protect against erosion. The original structure featured three terraces connected by staircases, with a temple shrine at the summit where priests conducted religious ceremonies. At its height, the ziggurat stood approximately 30 meters tall with a base measuring roughly 64 by 46 meters. The ancient city of Ur flourished as a major trade and religious center around 2000 BCE, with a population estimated at 65,000 people. Archaeological evidence suggests Ur was the birthplace of Abraham (Ibrahim), the patriarch of Judaism, Christianity, and Islam, making the site significant to billions of believers worldwide. The ziggurat fell into disrepair after the decline of the Sumerian civilization, becoming buried under desert sands for millennia. British archaeologist Sir Leonard Woolley excavated the site in the 1920s and 1930s, uncovering the ziggurat and the magnificent Royal Tombs of Ur containing golden treasures now displayed in museums worldwide.',
-                'facts': [
-                    'Built approximately 2100 BCE (over 4,000 years old) during Third Dynasty of Ur',
-                    'Dedicated to Nanna (Sin), the Sumerian moon god and patron deity of Ur',
-                    'Originally stood 30 meters tall with three terraces (only lowest terrace remains mostly intact)',
-                    'Constructed with millions of mud bricks, facade covered in fired bricks and bitumen',
-                    'Ancient Ur was birthplace of Prophet Abraham (Ibrahim) according to religious tradition',
-                    'Sir Leonard Woolley excavated 1922-1934, discovering Royal Tombs with golden artifacts',
-                    'Partially reconstructed in 1980s under Saddam Hussein (controversial restoration)',
-                    'UNESCO World Heritage Site as part of "Ahwar of Southern Iraq" (inscribed 2016)',
-                ],
-                'key_sites': [
-                    {'name': 'Great Ziggurat', 'description': 'Massive stepped pyramid temple with three original terraces. Reconstructed northeastern facade shows imposing brick structure and monumental staircases. Original first terrace well-preserved.'},
-                    {'name': 'Royal Tombs of Ur', 'description': 'Ancient burial complex discovered by Woolley containing 16 royal tombs with golden treasures, jewelry, musical instruments, and ceremonial objects. Most artifacts now in British Museum and Baghdad.'},
-                    {'name': 'Temple of Nanna', 'description': 'Original moon god temple remains at ziggurat\'s base. Sacred complex included various shrines, priests\' quarters, and ritual spaces for religious ceremonies.'},
-                    {'name': 'Ancient City Ruins', 'description': 'Excavated remains of ancient Ur including residential areas, administrative buildings, and streets showing sophisticated urban planning from 4,000 years ago.'},
-                ],
-                'entrance_fees': 'Approximately 25,000-50,000 IQD ($17-35 USD) for foreign visitors. Iraqi nationals pay reduced fees. Fees subject to change based on security situation.',
-                'opening_hours': '8:00 AM - 5:00 PM daily (hours may vary seasonally). Site closes earlier during summer due to extreme heat. Check current security situation before visiting.',
-                'best_time': 'November to March for cooler temperatures (15-25°C). Summer months (May-September) exceed 45°C making midday visits extremely uncomfortable. Early morning visits recommended.',
-                'how_to_get_there': 'Located 16 km southwest of Nasiriyah in Dhi Qar Province, approximately 370 km southeast of Baghdad. From Baghdad: 5-6 hour drive via Highway 8. From Basra: 200 km north (3-hour drive). Organized tours most reliable. Check security advisories before traveling.',
-                'what_to_wear': 'Lightweight, breathable clothing covering shoulders and knees (conservative dress respectful in Iraq). Wide-brimmed hat essential for sun protection. Sturdy closed-toe shoes for walking on ancient ruins and sandy terrain. Sunglasses strongly recommended.',
-                'visitor_tips': [
-                    'Hire knowledgeable local guide in Nasiriyah for historical context and site navigation',
-                    'Bring plenty of water - extremely hot and dry with no shade at site',
-                    'Apply strong sunscreen and reapply frequently - intense desert sun',
-                    'Visit early morning (before 10 AM) to avoid peak heat and harsh midday light',
-                    'Photography allowed - capture reconstructed facade and original mud brick sections',
-                    'Combine with visit to Nasiriyah Museum displaying local artifacts from Ur excavations',
-                    'Check current security situation - U.S. and British embassies provide travel advisories',
-                    'Respect archaeological site - do not climb on fragile ancient structures',
-                    'Allow 2-3 hours to fully explore ziggurat and surrounding ruins',
-                    'Travel with reputable tour operator familiar with local security conditions',
-                ],
-                'discovery': 'The ziggurat\'s location was known to local Bedouins for centuries but remained largely buried under sand. British archaeologist J. E. Taylor first investigated the site in 1854, identifying it as ancient Ur. Systematic excavation began in 1922 when British Museum and University of Pennsylvania funded expedition led by Sir Leonard Woolley. Over 12 seasons (1922-1934), Woolley\'s team uncovered the ziggurat, royal tombs, residential areas, and thousands of artifacts including the famous "Standard of Ur" and "Ram in a Thicket" sculptures. The Royal Tombs yielded extraordinary golden jewelry, ceremonial daggers, and the "Great Death Pit" containing bodies of 74 courtiers apparently sacrificed to accompany the royal dead.',
-                'architecture': 'Sumerian architects designed ziggurats as artificial sacred mountains connecting earth to heaven. The Ur ziggurat featured a solid core of mud bricks (adobe) covered by a protective "skin" of fired bricks set in bitumen, creating a waterproof barrier. The structure employed buttresses and recesses creating dramatic light and shadow effects. Three massive staircases (two flanking, one central) converged at a gateway leading to upper terraces. The base measures approximately 64 x 46 meters. Architects incorporated drainage channels to remove rainwater, preventing structural damage. The entire complex was originally painted with symbolic colors - lower terrace in black, middle in red, upper in white. Reconstruction work in the 1980s rebuilt portions using modern materials (visible in lighter-colored bricks), which remains controversial among archaeologists.',
-                'cultural_impact': 'The ziggurat symbolizes humanity\'s earliest architectural ambitions and religious devotion. Ancient Ur was a major cultural and commercial hub where Sumerian civilization flourished, developing cuneiform writing, mathematics, astronomy, and legal codes. The city\'s connection to Abraham makes it significant to three major world religions (Judaism, Christianity, Islam), with millions considering it a spiritual heritage site. Archaeological discoveries at Ur revolutionized understanding of Mesopotamian civilization, revealing sophisticated urban life 4,000 years ago. Artifacts from the Royal Tombs showcase extraordinary craftsmanship in gold, lapis lazuli, and carnelian, demonstrating extensive trade networks reaching Afghanistan and India.',
-                'conservation': 'The site faces significant conservation challenges including erosion from wind and rare rainfall, salt crystallization damaging mud bricks, looting and vandalism (particularly during Iraq War periods), controversial 1980s reconstruction using modern materials, and limited funding for professional conservation. UNESCO\'s 2016 World Heritage inscription as part of "Ahwar of Southern Iraq: Refuge of Biodiversity and Relict Landscape of the Mesopotamian Cities" provides international recognition and potential conservation support. Iraqi State Board of Antiquities and Heritage manages the site with limited resources. International organizations including British Museum maintain interest in preservation.',
-                'health_safety': 'Extreme heat primary safety concern - risk of heat exhaustion and dehydration in summer. Carry minimum 2-3 liters of water per person. Uneven ancient terrain requires care to avoid trips and falls. Security situation in southern Iraq generally more stable than central regions but check current advisories. No medical facilities at site - nearest hospital in Nasiriyah (16 km). Travel insurance essential. Inform someone of itinerary. Hire local guide familiar with area.',
-                'guided_tours': 'Local guides available in Nasiriyah with varying expertise in Mesopotamian history. International tour operators occasionally include Ur in comprehensive Iraq heritage tours. Guides can arrange permits and transportation. Expect fees 50,000-100,000 IQD ($35-70 USD) per group. English-speaking guides limited - may require Arabic translator.',
-                'nearby_attractions': 'Nasiriyah (16 km) - city with museum displaying Ur artifacts. Tell al-Ubaid (8 km) - ancient Sumerian settlement. Eridu (20 km) - considered oldest Sumerian city in mythology. The Marshlands (40 km) - ancient Mesopotamian wetlands, UNESCO site. House of Abraham - traditional site marking prophet\'s birthplace.',
-                'coordinates': '30.9628° N, 46.1031° E',
-                'annual_visitors': 'Limited data available - estimated few thousand annually (low due to security concerns and remote location)',
-                'climate': 'Hot desert climate. Summer (May-September): 40-50°C with temperatures exceeding 50°C in July-August. Winter (November-March): 10-20°C, occasional rainfall. Spring/fall: 25-35°C.',
-                'photos': [
-                    '/static/core/images/building-with-clock-front-cloudy-sky-background.jpg',
-                    '/static/core/images/building-with-clock-front-cloudy-sky-background.jpg',
-                ],
-            },
-            'hatra': {
-                'id': 'hatra',
-                'name': 'Hatra',
-                'location': 'Ninawa Governorate, Northern Iraq',
-                'description': 'Hatra is an exceptionally well-preserved ancient Parthian city ruins that flourished as a major religious and trading center from the 2nd century BCE to the 3rd century CE. Located in the Iraqi desert 110 km southwest of Mosul, Hatra was a fortified caravan city strategically positioned along trade routes. The city successfully resisted multiple Roman sieges (116 CE and 198 CE) thanks to its massive defensive walls. Hatra features remarkable Greco-Roman and Oriental architectural fusion, with massive temples dedicated to various deities. The site showcases magnificent stone temples, colonnaded halls, sculptures, and religious reliefs that represent a unique blend of Hellenistic, Roman, and Parthian artistic traditions. UNESCO designated Hatra a World Heritage Site in 1985. Tragically, ISIS militants severely damaged the site in 2015, destroying irreplaceable sculptures and architectural elements. Despite the devastation, Hatra remains one of the most significant archaeological sites in Iraq and the Middle East.',
-                'long_description': 'Hatra was founded around the 3rd or 2nd century BCE as a small religious settlement and developed into a major fortified city under the Parthian Empire. By the 1st and 2nd centuries CE, Hatra had grown into a wealthy, powerful city-state that controlled trade routes between the Roman Empire and Persia/India. The city\'s wealth came from caravans passing through with silk, spices, and other luxury goods. Hatra\'s religious importance stemmed from its role as a pilgrimage center with temples dedicated to multiple deities including the sun god Shamash, Arabian deities, and Mesopotamian gods. The city\'s greatest architectural achievement is the massive Great Temple (Temple of the Sun God), a monumental complex measuring 160 by 190 meters, featuring soaring columns, vaulted iwans, and elaborate sculptural decoration. Hatra\'s defensive system was legendary - the city was surrounded by double walls with 160 towers, creating a nearly impregnable fortress. The inner wall stood 12-15 meters high with towers reaching 30 meters. These formidable defenses allowed Hatra to successfully repel attacks by Roman emperors Trajan (116 CE) and Septimius Severus (198 CE), demonstrating exceptional military engineering. The city eventually fell in 241 CE when the Sasanian Persian king Shapur I conquered it, incorporating it into the Persian Empire. Hatra was then gradually abandoned as trade routes shifted. The ruins remained buried under desert sands for centuries until rediscovered in the 19th century. German archaeologist Walter Andrae conducted the first systematic excavations in 1906-1911, revealing the extraordinary architectural remains.',
-                'facts': [
-                    'UNESCO World Heritage Site since 1985 - inscribed for "outstanding universal value"',
-                    'Flourished 2nd century BCE to 3rd century CE as Parthian fortified caravan city',
-                    'Successfully resisted Roman sieges by Trajan (116 CE) and Septimius Severus (198 CE)',
-                    'Double defensive walls with 160 towers - inner wall 12-15m high, towers up to 30m',
-                    'Great Temple complex measures 160 x 190 meters - dedicated to sun god Shamash',
-                    'Unique architectural fusion of Greco-Roman, Parthian, and Mesopotamian styles',
-                    'Severely damaged by ISIS in March 2015 - priceless sculptures and reliefs destroyed',
-                    'Located 110 km southwest of Mosul in desert landscape',
-                ],
-                'key_sites': [
-                    {'name': 'Great Temple (Temple of Shamash)', 'description': 'Monumental temple complex (160x190m) with towering columns, vaulted iwans, and elaborate sculptural programs. Central religious structure of ancient Hatra dedicated to the sun god.'},
-                    {'name': 'City Walls and Towers', 'description': 'Legendary double-wall defensive system with 160 towers. Inner wall 12-15m high, towers reaching 30m. Successfully repelled Roman imperial armies twice.'},
-                    {'name': 'Temple Sculptures and Reliefs', 'description': 'Exquisite stone sculptures depicting deities, royal figures, and mythological scenes. Blend of Hellenistic and Oriental artistic traditions. Many pieces tragically destroyed by ISIS in 2015.'},
-                    {'name': 'Iwan Structures', 'description': 'Characteristic Persian-style vaulted halls (iwans) facing open courtyards. Demonstrate architectural innovation and Persian Parthian influence on regional building techniques.'},
-                ],
-                'entrance_fees': 'Site currently closed to visitors due to security situation and ongoing damage assessment/conservation efforts following ISIS destruction. Fees to be determined when site reopens.',
-                'opening_hours': 'Site currently closed to public visitation. Future opening hours will depend on security conditions and completion of conservation/stabilization work.',
-                'best_time': 'Not currently accessible to tourists. When reopened, best time would be November to March for cooler temperatures (15-25°C). Summer extremely hot (40-50°C) with no shade.',
-                'how_to_get_there': 'Located 110 km southwest of Mosul, approximately 300 km northwest of Baghdad. Currently inaccessible due to security concerns. When safe, accessible via road from Mosul. Organized archaeological tours only when site reopens. Check security advisories.',
-                'what_to_wear': 'When accessible: Conservative clothing covering shoulders and knees. Sturdy closed-toe shoes essential for walking on ancient ruins. Wide-brimmed hat for desert sun protection. Light, breathable fabrics recommended.',
-                'visitor_tips': [
-                    'Site currently closed - do not attempt to visit without official clearance',
-                    'Check with Iraqi Ministry of Culture for future reopening plans',
-                    'ISIS damage assessment ongoing - conservation work required before public access',
-                    'When reopened, expect strict security protocols and possible guided tours only',
-                    'Best experienced with knowledgeable archaeologist or historian guide',
-                    'Bring plenty of water - desert location with no facilities or shade',
-                    'Photography rules to be determined when site reopens',
-                    'Respect ongoing conservation efforts - archaeological site of immense importance',
-                    'Consider virtual tours and museum collections while site remains inaccessible',
-                    'Follow Iraqi government and UNESCO announcements regarding site status',
-                ],
-                'discovery': 'Local Bedouins knew of Hatra\'s ruins for centuries, but the site remained largely unexplored until the late 19th century. British archaeologist J. Ross first briefly described the ruins in 1836. Systematic scientific excavation began in 1906 when German archaeologist Walter Andrae conducted extensive work (1906-1911), uncovering major temples and the city walls. Iraqi archaeologists continued excavations after 1951, revealing additional temple complexes, sculptures, and inscriptions. The site provided crucial insights into Parthian architecture, religion, and art. In March 2015, ISIS militants attacked the site with bulldozers and explosives, destroying priceless sculptures, reliefs, and architectural elements in an act of cultural terrorism. UNESCO and international partners are now assessing damage and planning conservation efforts.',
-                'architecture': 'Hatra represents a unique architectural fusion of Hellenistic, Roman, Parthian, and Mesopotamian traditions. Buildings constructed primarily from local limestone blocks fitted without mortar. The Great Temple showcases monumental scale with towering columns (some reaching 12-15 meters high), characteristic Persian-style vaulted iwans, and elaborate stone reliefs depicting deities and royal figures. Architectural innovation includes the iwan - a massive vaulted hall open on one side - which became a defining feature of Persian and Islamic architecture. Sculptural decoration shows Hellenistic influence (Classical drapery, realistic portraiture) combined with Parthian frontal poses and Oriental jewelry/costume details. Buildings featured engaged columns, pilasters, decorative friezes, and elaborate doorways. The defensive walls demonstrate sophisticated military engineering with regular tower placement providing comprehensive defensive coverage.',
-                'cultural_impact': 'Hatra represents a critical crossroads of ancient civilizations, where East met West along Silk Road trade routes. The city exemplifies cultural synthesis - Greco-Roman architecture merged with Parthian and Mesopotamian religious traditions. Hatra\'s successful resistance to Rome symbolized Parthian military prowess and Eastern defiance of Roman expansion. The site provides invaluable evidence of Parthian civilization, which is otherwise poorly documented compared to Roman and Persian cultures. Hatra\'s diverse pantheon (sun god, Arabian deities, Mesopotamian gods) demonstrates religious tolerance and cultural exchange in the ancient world. The tragic 2015 ISIS destruction shocked the international community, highlighting the vulnerability of irreplaceable cultural heritage to extremist ideology. Hatra\'s loss represents not just Iraqi heritage but a wound to shared human civilization.',
-                'conservation': 'UNESCO World Heritage Site protection since 1985. Iraqi State Board of Antiquities and Heritage managed the site before ISIS occupation. In March 2015, ISIS systematically destroyed sculptures, reliefs, and architectural elements, documenting their cultural terrorism on video. Following Mosul\'s liberation in 2017, initial damage assessments revealed extensive but not total destruction - major architecture survives but many sculptures and decorative elements lost forever. UNESCO, ICOMOS, and international partners working with Iraqi authorities on damage documentation, stabilization, and potential restoration. Challenges include security, funding, expertise, and debate over reconstruction authenticity. Some destroyed sculptures existed in archival photos and 3D scans, enabling potential digital reconstruction. Site requires demining, structural stabilization, and comprehensive conservation planning before reopening.',
-                'health_safety': 'Site currently unsafe due to potential unexploded ordnance, structural instability from ISIS damage, and regional security concerns. Do not visit without official authorization. When reopened, security protocols will be strict. Desert location presents heat exhaustion risks. Nearest medical facilities in Mosul (110 km). Travel insurance essential. Only visit with approved groups when site reopens.',
-                'guided_tours': 'No tours currently available due to site closure. Future tours likely restricted to organized groups with expert guides. When accessible, expect specialized archaeological tours focusing on site history, architecture, and conservation efforts. Iraqi Ministry of Culture will determine access protocols.',
-                'nearby_attractions': 'Mosul (110 km) - historic city with Great Mosque of al-Nuri (damaged, under reconstruction). Nimrud (150 km) - ancient Assyrian city (also damaged by ISIS). Nineveh (120 km) - ancient Assyrian capital near Mosul. Assyrian sites in Ninawa Governorate (security dependent).',
-                'coordinates': '35.5833° N, 42.7167° E',
-                'annual_visitors': 'Site closed since 2015 - no current visitation. Prior to ISIS, limited archaeological tourism only.',
-                'climate': 'Hot desert climate. Summer (May-September): 40-50°C (104-122°F). Winter (November-March): 10-20°C (50-68°F). Spring/Fall: 20-35°C. Minimal rainfall. Desert conditions with intense sun.',
-                'photos': [
-                    '/static/core/images/building-with-clock-front-cloudy-sky-background.jpg',
-                    '/static/core/images/building-with-clock-front-cloudy-sky-background.jpg',
-                ],
-            },
-            'samarra': {
-                'id': 'samarra',
-                'name': 'Samarra',
-                'location': 'Salah ad-Din Governorate, Central Iraq',
-                'description': 'Samarra is an ancient city located on the east bank of the Tigris River, 125 km north of Baghdad. The city served as the capital of the Abbasid Caliphate from 836 to 892 CE during the Islamic Golden Age, when it was one of the largest cities in the world. Samarra is world-famous for the Great Mosque of Samarra with its iconic spiral minaret, the Malwiya Tower, which stands 52 meters tall and is one of the most recognizable Islamic architectural landmarks. The city contains extensive archaeological remains from the Abbasid period including palaces, mosques, and urban planning that influenced Islamic architecture across the Middle East. UNESCO designated Samarra Archaeological City a World Heritage Site in 2007. The city is also significant as a major Shia pilgrimage site, home to the Al-Askari Shrine containing tombs of two Shia Imams. This golden-domed shrine was bombed in 2006, sparking sectarian violence, but has since been rebuilt.',
-                'long_description': 'Samarra\'s history dates to ancient times, but it achieved its greatest prominence when Abbasid Caliph al-Mu\'tasim moved the capital from Baghdad to Samarra in 836 CE. The move was primarily to distance his Turkish military guards from the restive Baghdad population. At its peak in the 9th century, Samarra extended over 57 kilometers along the Tigris River, making it potentially the largest city in the world at that time. The population is estimated to have reached 500,000 to one million people. The Abbasid caliphs constructed magnificent palaces, gardens, mosques, and administrative buildings, employing the finest architects and craftsmen from across the empire. The Great Mosque of Samarra, built by Caliph al-Mutawakkil between 848-852 CE, was the world\'s largest mosque at the time, measuring 240 x 156 meters. Its iconic Malwiya (spiral) minaret, standing 52 meters high with a spiral ramp winding around the outside, became an architectural symbol of the Islamic Golden Age. The minaret\'s design may have been inspired by ancient Mesopotamian ziggurats, representing continuity with the region\'s pre-Islamic heritage. Samarra served as the Abbasid capital for 56 years until Caliph al-Mu\'tamid returned the capital to Baghdad in 892 CE. After the capital moved, Samarra declined significantly but never disappeared entirely. The city retained religious importance, particularly for Shia Muslims. The Al-Askari Shrine, built in 944 CE and containing the tombs of the 10th and 11th Shia Imams (Ali al-Hadi and Hassan al-Askari), makes Samarra one of the holiest cities in Shia Islam. According to Shia belief, the shrine is also where the 12th Imam, Muhammad al-Mahdi, disappeared into occultation in 874 CE.',
-                'facts': [
-                    'Abbasid Caliphate capital 836-892 CE during Islamic Golden Age - peak population 500,000-1M',
-                    'Great Mosque Malwiya Tower - iconic 52m-tall spiral minaret built 848-852 CE',
-                    'UNESCO World Heritage Site 2007 - "Samarra Archaeological City"',
-                    'Al-Askari Shrine - major Shia pilgrimage site with tombs of 10th and 11th Imams',
-                    'Shrine bombing 2006 sparked sectarian violence - golden dome rebuilt by 2009',
-                    'City extended 57 km along Tigris - potentially world\'s largest city in 9th century',
-                    'Great Mosque was world\'s largest at construction (240 x 156 meters)',
-                    'Located 125 km north of Baghdad on Tigris River east bank',
-                ],
-                'key_sites': [
-                    {'name': 'Malwiya Tower (Great Mosque Minaret)', 'description': '52-meter-tall iconic spiral minaret built 848-852 CE. External spiral ramp winds 5 times around cone structure. UNESCO World Heritage landmark and symbol of Islamic architecture.'},
-                    {'name': 'Al-Askari Shrine (Golden Dome)', 'description': 'Major Shia holy site with golden dome and minarets. Contains tombs of 10th and 11th Imams. Site of 12th Imam\'s occultation. Bombed 2006, beautifully rebuilt with golden dome restored.'},
-                    {'name': 'Great Mosque of Samarra', 'description': 'Ruins of world\'s largest mosque in 9th century (240x156m). Built by Caliph al-Mutawakkil. Massive prayer hall, courtyard, and minaret demonstrate Abbasid architectural ambition.'},
-                    {'name': 'Abbasid Palaces', 'description': 'Extensive palace ruins including Dar al-Khilafa (Caliphate Palace) and Balkuwara Palace. Archaeological remains show luxury, gardens, and sophisticated urban planning of Abbasid capital.'},
-                ],
-                'entrance_fees': 'Malwiya Tower and archaeological sites: approximately 10,000-25,000 IQD ($7-17 USD) for foreign visitors. Al-Askari Shrine: free entry (religious site). Modest dress required at shrine.',
-                'opening_hours': 'Archaeological sites generally 8:00 AM - 5:00 PM. Al-Askari Shrine open daily, best visiting 8:00 AM - 6:00 PM. Security checkpoints at shrine - allow extra time. Check current access due to security conditions.',
-                'best_time': 'October to April for moderate temperatures (15-30°C). Avoid peak summer June-August (40-50°C). Spring (March-April) and autumn (October-November) ideal. Ramadan and Shia religious commemorations bring pilgrims - expect crowds.',
-                'how_to_get_there': 'Located 125 km north of Baghdad. From Baghdad: 2-3 hour drive via Highway 1 (main highway north). Organized tours recommended. Shared taxis from Baghdad available. Train service intermittent. Security checkpoints common - carry ID/passport. Check current security advisories.',
-                'what_to_wear': 'Conservative dress required (religious city). Men: long pants, shirts covering shoulders. Women: hijab (headscarf), abaya or modest dress covering arms/legs. Closed-toe shoes for archaeological sites. Abayas available near Al-Askari Shrine if needed.',
-                'visitor_tips': [
-                    'Hire local guide for historical context and navigating security protocols',
-                    'Bring passport/ID for multiple security checkpoints (especially near shrine)',
-                    'Photography generally allowed at archaeological sites - ask permission at shrine',
-                    'Respect religious sensitivities - major Shia pilgrimage city',
-                    'Visit Malwiya Tower early morning or late afternoon for best lighting',
-                    'Combine archaeological sites with shrine visit for comprehensive experience',
-                    'Stay hydrated - little shade at Malwiya Tower and archaeological areas',
-                    'Learn about 2006 shrine bombing for contemporary historical context',
-                    'Check security situation before visiting - conditions can change',
-                    'Allow full day to explore both religious and archaeological sites',
-                ],
-                'discovery': 'Samarra\'s ruins were never entirely forgotten due to the city\'s continuous occupation, though much smaller than its Abbasid glory. Early European travelers documented the distinctive Malwiya Tower in the 19th century. German archaeologist Ernst Herzfeld conducted extensive excavations 1911-1913, mapping the vast Abbasid city and uncovering palace complexes. Iraqi archaeologists continued work after Iraqi independence. The site provided crucial evidence of Abbasid architecture, urban planning, and material culture during the Islamic Golden Age. UNESCO World Heritage designation in 2007 recognized the site\'s outstanding universal value. The 2006 Al-Askari Shrine bombing shocked the world and triggered sectarian violence, but also mobilized reconstruction efforts that beautifully restored the golden dome.',
-                'architecture': 'Samarra showcases peak Abbasid architectural innovation. The Malwiya Tower represents unique Islamic architectural form - external spiral minaret with ramp wide enough for horses/donkeys to climb, possibly inspired by ancient Mesopotamian ziggurats. Built from baked brick, the spiral design became influential across Islamic architecture. The Great Mosque demonstrated monumental scale with vast courtyard, massive prayer hall, and innovative use of brick pillars. Palace architecture featured elaborate stucco decoration, carved panels (beveled style), open courtyards, iwan halls, and sophisticated water features (pools, fountains). The city employed grid planning with wide avenues, demonstrating advanced urban design. Building materials primarily sun-dried and fired brick. Decorative motifs include geometric patterns, vegetal arabesques, and calligraphy. Samarra\'s stucco carving style influenced Islamic decoration for centuries.',
-                'cultural_impact': 'Samarra represents the Abbasid Caliphate at its cultural zenith. The brief period as capital (836-892 CE) produced architectural innovations that influenced Islamic architecture from Spain to Central Asia. The Malwiya Tower became an iconic symbol of Islamic civilization, reproduced in art and architecture worldwide. The city\'s cosmopolitan nature (Arabs, Persians, Turks, and others) exemplified Islamic Golden Age cultural diversity. Samarra\'s scholarship, art, and architecture contributed to the transmission of knowledge that later sparked the European Renaissance. For Shia Muslims, Samarra is the third or fourth holiest city, making it a pilgrimage destination for millions. The 2006 shrine bombing (by al-Qaeda) and subsequent sectarian violence highlighted religious divisions but also galvanized interfaith dialogue and heritage protection efforts.',
-                'conservation': 'UNESCO World Heritage Site since 2007. Listed as "in danger" due to lack of management plan and urban encroachment. The vast archaeological area (15,000+ hectares along 41 km of Tigris) presents conservation challenges. Iraqi State Board of Antiquities and Heritage manages sites with limited resources. The Malwiya Tower suffered minor damage during Iraq War (bullet impacts) but remains structurally sound. Al-Askari Shrine bombing 2006 destroyed the golden dome and minarets - Iranian funding and Iraqi craftsmen completed meticulous reconstruction by 2009, using traditional techniques and gold plating. Archaeological sites face threats from erosion, looting, and urban expansion. UNESCO and international partners providing technical assistance for conservation planning, documentation, and sustainable tourism development. Digital documentation through photogrammetry and 3D scanning underway.',
-                'health_safety': 'Security situation generally stable but checkpoints common (bring ID). Avoid demonstrations or large crowds. Al-Askari Shrine area has heavy security - cooperate with screening. Heat exhaustion risk in summer - stay hydrated. Medical facilities available in Samarra city. Respect religious customs at shrine (gender-segregated areas). Follow guide\'s security advice. Check travel advisories before visiting.',
-                'guided_tours': 'Local guides available at Malwiya Tower and archaeological sites (20,000-50,000 IQD/$15-35 per group). English-speaking guides limited. Hotel in Baghdad can arrange day trips. Specialized archaeological tours occasionally available through academic groups. Religious pilgrimage tours focus on Al-Askari Shrine.',
-                'nearby_attractions': 'Tikrit (60 km north) - birthplace of Saladin with Saladin\'s Tomb. Baghdad (125 km south) - Iraq Museum, al-Mutanabbi Street, capital attractions. Ashur (200 km north) - ancient Assyrian capital ruins (UNESCO site). Haditha (180 km northwest) - Euphrates River city.',
-                'coordinates': '34.2° N, 43.8833° E',
-                'annual_visitors': 'Archaeological sites: limited tourism data (few thousand annually). Al-Askari Shrine: millions of Shia pilgrims annually, especially during religious commemorations.',
-                'climate': 'Hot desert climate. Summer (May-September): 38-50°C (100-122°F). Winter (November-March): 10-20°C (50-68°F). Spring/Fall: 20-35°C. Limited rainfall. Dust storms possible spring/summer.',
-                'photos': [
-                    '/static/core/images/building-with-clock-front-cloudy-sky-background.jpg',
-                    '/static/core/images/building-with-clock-front-cloudy-sky-background.jpg',
-                ],
-            },
-        },
-        'morocco': {
-            'bahia-palace': {
-                'id': 'bahia-palace',
-            'name': 'Bahia Palace',
-            'location': 'Marrakech, Morocco',
-            'description': 'The Bahia Palace is a stunning example of Moroccan architecture, featuring intricate carvings, colorful tiles, and beautiful gardens.',
-            'long_description': 'Built in the late 19th century by Si Moussa, grand vizier to Sultan Hassan I, the Bahia Palace represents the pinnacle of Moroccan architectural artistry. The name "Bahia" means "brilliant" or "shining," reflecting the palace\'s opulent design. The palace consists of 150 rooms arranged around eight courtyards, each with its own unique architectural features. The intricate stucco work, colorful zellij tiles, and carved cedar wood ceilings showcase the finest craftsmanship of Moroccan artisans.',
-            'historical_significance': 'Built between 1894 and 1900, the Bahia Palace served as the residence of the grand vizier and later became a royal residence. It represents the last great example of traditional Moroccan palace architecture before the influence of European styles.',
-            'cultural_impact': 'The palace is a UNESCO World Heritage Site and a prime example of Islamic architecture in Morocco. It has influenced countless Moroccan homes and continues to inspire traditional design worldwide.',
-            'best_time_to_visit': 'October to April (cooler weather, fewer crowds)',
-            'how_to_get_there': 'Located in the medina of Marrakech, easily accessible by taxi or walking from Jemaa el-Fnaa square.',
-            'entrance_fees': '70 MAD (about $7 USD) for adults',
-            'opening_hours': '9:00 AM - 5:00 PM daily',
-            'what_to_wear': 'Modest clothing covering shoulders and knees; comfortable walking shoes',
-            'guided_tours': 'Highly recommended; audio guides available in multiple languages',
-            'nearby_attractions': ['Saadian Tombs', 'El Badi Palace', 'Koutoubia Mosque (exterior)', 'Jemaa el-Fnaa'],
-            'facts': [
-                'Built over 14 years using the finest materials from across Morocco',
-                'Features 150 rooms arranged around 8 courtyards',
-                'Contains the largest riad (courtyard house) in Morocco',
-                'Named "Bahia" meaning "brilliant" or "shining"',
-                'UNESCO World Heritage Site since 1985'
-            ],
-            'visitor_tips': [
-                'Visit early morning to avoid crowds and heat',
-                'Bring water and wear comfortable shoes for walking',
-                'Photography allowed but check restrictions in private areas',
-                'Combine with Saadian Tombs for a full historical experience',
-                'Respect the quiet atmosphere in the prayer rooms'
-            ],
-            'photos': [
-                '/static/core/images/bahia-palace-marrakech.jpg',
-                '/static/core/images/bahia-palace-courtyard.jpg',
-                '/static/core/images/bahia-palace-interior.jpg',
-                '/static/core/images/bahia-palace-tiles.jpg',
-                '/static/core/images/bahia-palace-garden.jpg',
-                '/static/core/images/bahia-palace-architecture.jpg',
-                '/static/core/images/bahia-palace-details.jpg',
-                '/static/core/images/bahia-palace-morocco.jpg'
-            ],
-            'coordinates': {'lat': 31.6217, 'lng': -7.9887},
-            'annual_visitors': 500000,
-            'climate': 'Mediterranean climate with hot summers and mild winters',
-            'discovery': 'Rediscovered and restored in the 20th century after years of neglect',
-            'architecture': 'Traditional Moroccan Islamic architecture with Andalusian influences',
-            'conservation': 'Ongoing restoration projects to preserve the intricate stucco work and tiles',
-            'health_safety': 'Well-maintained site with security; avoid climbing on structures',
-            'key_sites': ['Grand Courtyard', 'Council Chamber', 'Harem Courtyard', 'Winter Garden'],
-            'image': '/static/core/images/bahia-palace-marrakech.jpg'
-        },
-
-        'sahara-desert': {
-            'id': 'sahara-desert',
-            'name': 'Sahara Desert',
-            'location': 'Merzouga, Morocco',
-            'description': 'Experience the vast golden sands of the Sahara Desert with traditional Berber camps and stunning sunsets.',
-            'long_description': 'The Sahara Desert in Morocco offers an unforgettable desert experience with its endless golden dunes, traditional Berber camps, and spectacular sunsets. Located near the town of Merzouga, this area provides access to some of the most beautiful desert landscapes in North Africa. Visitors can ride camels across the dunes, spend nights in luxury desert camps, and witness the dramatic color changes as the sun sets over the Erg Chebbi dunes.',
-            'historical_significance': 'The Sahara has been inhabited by Berber tribes for thousands of years. The region was part of ancient trade routes connecting West Africa with the Mediterranean world.',
-            'cultural_impact': 'The desert culture of the Berber people has shaped Moroccan identity and continues to attract visitors seeking authentic cultural experiences.',
-            'best_time_to_visit': 'October to April (cooler temperatures for desert activities)',
-            'how_to_get_there': 'Located 55km from Rissani; accessible by bus, taxi, or organized tours from Marrakech or Fes',
-            'entrance_fees': 'Varies by tour operator; desert camps typically include meals and activities',
-            'opening_hours': '24/7 access; guided tours available throughout the day',
-            'what_to_wear': 'Light, breathable clothing; warm layers for evenings; sturdy shoes; headscarf for sun protection',
-            'guided_tours': 'Essential for safety and cultural understanding; multi-day desert treks available',
-            'nearby_attractions': ['Erg Chebbi Dunes', 'Merzouga Village', 'Khali Oasis', 'Nomad Heritage Museum'],
-            'facts': [
-                'The Erg Chebbi dunes can reach heights of 150 meters',
-                'Temperatures can drop to freezing at night in winter',
-                'Home to nomadic Berber tribes who have lived here for millennia',
-                'Contains ancient fossil sites dating back millions of years',
-                'The desert covers about 3.5 million square kilometers across North Africa'
-            ],
-            'visitor_tips': [
-                'Book desert tours in advance, especially during peak season',
-                'Stay hydrated and use sunscreen even in cooler months',
-                'Respect Berber customs and ask permission before photographing people',
-                'Try traditional Berber food and participate in cultural activities',
-                'Consider multi-day stays for the full desert experience'
-            ],
-            'photos': [
-                '/static/core/images/sahara-desert-dunes.jpg',
-                '/static/core/images/sahara-desert-sunset.jpg',
-                '/static/core/images/sahara-desert-camel.jpg',
-                '/static/core/images/sahara-desert-camp.jpg',
-                '/static/core/images/sahara-desert-stars.jpg',
-                '/static/core/images/sahara-desert-merzouga.jpg',
-                '/static/core/images/sahara-desert-berber.jpg',
-                '/static/core/images/sahara-desert-morocco.jpg'
-            ],
-            'coordinates': {'lat': 31.0833, 'lng': -4.0167},
-            'annual_visitors': 300000,
-            'climate': 'Extreme desert climate with hot days and cold nights',
-            'discovery': 'Became a tourist destination in the 20th century with the development of desert camps',
-            'architecture': 'Traditional Berber tents and modern desert lodges',
-            'conservation': 'Protected areas established to preserve desert ecosystems and wildlife',
-            'health_safety': 'Guided tours essential; heat exhaustion risk in summer; scorpion awareness',
-            'key_sites': ['Erg Chebbi Dunes', 'Berber Camps', 'Khali Oasis', 'Dayet Srji Lake'],
-            'image': '/static/core/images/sahara-desert-dunes.jpg'
-        },
-
-        'chefchaouen': {
-            'id': 'chefchaouen',
-            'name': 'Chefchaouen (Blue City)',
-            'location': 'Chefchaouen, Morocco',
-            'description': 'The stunning Blue City of Chefchaouen, nestled in the Rif Mountains, is famous for its blue-washed buildings and relaxed atmosphere.',
-            'long_description': 'Chefchaouen, also known as the Blue City, is a picturesque mountain town in northern Morocco famous for its blue-washed buildings and narrow, winding streets. Founded in 1471 by Moorish exiles from Spain, the city has a unique Andalusian architectural style. The blue color, introduced by Jewish refugees in the 1930s, gives the city its distinctive appearance and creates a serene, otherworldly atmosphere.',
-            'historical_significance': 'Founded in 1471 by Moulay Ali ibn Rashid al-Alami as a base against Portuguese invasions. The city later became a refuge for Muslims expelled from Spain.',
-            'cultural_impact': 'Chefchaouen represents the blend of Moorish, Andalusian, and Berber cultures. The blue-washing tradition has become a symbol of Moroccan heritage.',
-            'best_time_to_visit': 'April to June or September to November (mild weather, fewer crowds)',
-            'how_to_get_there': 'Located 200km from Tangier; accessible by bus, taxi, or organized tours',
-            'entrance_fees': 'Free to explore the medina; small fees for some sites',
-            'opening_hours': '24/7 access to the medina; shops and cafes have varying hours',
-            'what_to_wear': 'Modest clothing; comfortable shoes for walking; light jacket for evenings',
-            'guided_tours': 'Optional; self-guided walking tours available with maps',
-            'nearby_attractions': ['Akchour Waterfalls', 'Talassemtane National Park', 'Spanish Mosque', 'Jewish Cemetery'],
-            'facts': [
-                'Founded in 1471 by Moorish refugees from Spain',
-                'Blue-washing tradition started in the 1930s by Jewish immigrants',
-                'Located at an altitude of 600-800 meters in the Rif Mountains',
-                'Has a population of about 40,000 inhabitants',
-                'Known for its traditional Andalusian architecture'
-            ],
-            'visitor_tips': [
-                'Respect local customs and dress modestly in the medina',
-                'Try the local goat cheese and honey, famous throughout Morocco',
-                'Visit early morning or late afternoon to avoid tourist crowds',
-                'The blue color is believed to keep mosquitoes away',
-                'Take time to explore the surrounding mountains and waterfalls'
-            ],
-            'photos': [
-                '/static/core/images/chefchaouen-blue-city.jpg',
-                '/static/core/images/chefchaouen-medina.jpg',
-                '/static/core/images/chefchaouen-streets.jpg',
-                '/static/core/images/chefchaouen-mountains.jpg',
-                '/static/core/images/chefchaouen-interior.jpg',
-                '/static/core/images/chefchaouen-waterfall.jpg',
-                '/static/core/images/chefchaouen-market.jpg',
-                '/static/core/images/chefchaouen-morocco.jpg'
-            ],
-            'coordinates': {'lat': 35.1717, 'lng': -5.2697},
-            'annual_visitors': 400000,
-            'climate': 'Mediterranean mountain climate with mild summers and cool winters',
-            'discovery': 'Became popular with tourists in the 20th century for its unique blue architecture',
-            'architecture': 'Andalusian-Moorish style with blue-washed facades',
-            'conservation': 'Protected historic district with preservation of traditional architecture',
-            'health_safety': 'Generally safe; watch for steep cliff paths; respect local customs',
-            'key_sites': ['Grand Mosque', 'Blue Medina', 'Akchour Waterfalls', 'Spanish Mosque'],
-            'image': '/static/core/images/chefchaouen-blue-city.jpg'
-        },
-
-        'atlas-mountains': {
-            'id': 'atlas-mountains',
-            'name': 'Atlas Mountains',
-            'location': 'Ourika Valley, Morocco',
-            'description': 'Explore the stunning Atlas Mountains with Berber villages, waterfalls, and breathtaking mountain scenery.',
-            'long_description': 'The Atlas Mountains offer some of Morocco\'s most spectacular natural scenery, from snow-capped peaks to lush valleys and traditional Berber villages. The Ourika Valley, located just 30km from Marrakech, provides easy access to mountain hiking, Berber culture, and natural beauty. Visitors can hike to waterfalls, visit ancient villages, and experience authentic Berber hospitality.',
-            'historical_significance': 'The Atlas Mountains have been home to Berber tribes for thousands of years. The region contains ancient trade routes and historic kasbahs.',
-            'cultural_impact': 'The Berber culture of the Atlas Mountains has preserved traditional Moroccan customs and continues to influence national identity.',
-            'best_time_to_visit': 'April to June or September to November (mild weather for hiking)',
-            'how_to_get_there': 'Located 30km south of Marrakech; accessible by taxi or organized tours',
-            'entrance_fees': 'Free for most areas; small fees for some waterfalls or guided tours',
-            'opening_hours': '24/7 access; best visited during daylight hours',
-            'what_to_wear': 'Comfortable hiking shoes; layers for changing weather; sun protection',
-            'guided_tours': 'Recommended for cultural experiences and safety; multi-day treks available',
-            'nearby_attractions': ['Ourika Valley', 'Oukaimeden Ski Resort', 'Imlil Village', 'Setti Fatma Waterfalls'],
-            'facts': [
-                'The High Atlas Mountains reach heights over 4,000 meters',
-                'Home to about 40% of Morocco\'s population, mostly Berber tribes',
-                'Contains the highest peak in North Africa, Mount Toubkal (4,167m)',
-                'Features diverse ecosystems from Mediterranean to alpine climates',
-                'Ancient trade routes crossed these mountains for centuries'
-            ],
-            'visitor_tips': [
-                'Acclimatize to altitude if planning high-altitude hikes',
-                'Respect Berber customs when visiting villages',
-                'Try traditional Berber food and stay in mountain guesthouses',
-                'Weather can change quickly; bring appropriate clothing',
-                'Consider hiring local guides for cultural insights'
-            ],
-            'photos': [
-                '/static/core/images/atlas-mountains-valley.jpg',
-                '/static/core/images/atlas-mountains-village.jpg',
-                '/static/core/images/atlas-mountains-waterfall.jpg',
-                '/static/core/images/atlas-mountains-hiking.jpg',
-                '/static/core/images/atlas-mountains-berber.jpg',
-                '/static/core/images/atlas-mountains-snow.jpg',
-                '/static/core/images/atlas-mountains-morocco.jpg',
-                '/static/core/images/atlas-mountains-landscape.jpg'
-            ],
-            'coordinates': {'lat': 31.2833, 'lng': -7.8833},
-            'annual_visitors': 600000,
-            'climate': 'Mountain climate with hot summers and cold winters; snow possible at high altitudes',
-            'discovery': 'Explored by European mountaineers in the 19th century; became a tourist destination in the 20th century',
-            'architecture': 'Traditional Berber mountain villages with stone and mud-brick construction',
-            'conservation': 'National parks established to protect biodiversity and cultural heritage',
-            'health_safety': 'Mountain safety important; hire experienced guides; altitude sickness possible',
-            'key_sites': ['Mount Toubkal', 'Ourika Valley', 'Oukaimeden', 'Imlil Village'],
-            'image': '/static/core/images/atlas-mountains-valley.jpg'
-        },
-
-        'volubilis': {
-            'id': 'volubilis',
-            'name': 'Volubilis Roman Ruins',
-            'location': 'Volubilis, Morocco',
-            'description': 'Explore the ancient Roman city of Volubilis, a UNESCO World Heritage Site with well-preserved mosaics and ruins.',
-            'long_description': 'Volubilis is one of the most important Roman archaeological sites in North Africa, featuring remarkably well-preserved ruins including beautiful mosaics, triumphal arches, and public buildings. Founded in the 3rd century BC, the city became a major center of Roman culture in Morocco. The site contains over 20 mosaic floors depicting mythological scenes and everyday life in Roman times.',
-            'historical_significance': 'Founded as a Carthaginian settlement, Volubilis became a Roman provincial capital in the 1st century AD. It was abandoned after an earthquake in the 18th century.',
-            'cultural_impact': 'Volubilis represents the Roman presence in North Africa and the blend of Roman and local Berber cultures. The mosaics are considered among the finest in the Roman world.',
-            'best_time_to_visit': 'March to May or September to November (mild weather, good visibility)',
-            'how_to_get_there': 'Located 33km north of Meknes; accessible by taxi or organized tours',
-            'entrance_fees': '70 MAD (about $7 USD) for adults; includes museum entry',
-            'opening_hours': '8:00 AM - 6:00 PM daily (until 5:00 PM in winter)',
-            'what_to_wear': 'Comfortable walking shoes; hat and sunscreen; light clothing',
-            'guided_tours': 'Highly recommended; audio guides available in multiple languages',
-            'nearby_attractions': ['Meknes Medina', 'Moulay Idriss', 'Roman Museum', 'Zellij Workshop'],
-            'facts': [
-                'Founded in the 3rd century BC as a Carthaginian settlement',
-                'Became a Roman provincial capital in the 1st century AD',
-                'Contains over 20 well-preserved mosaic floors',
-                'UNESCO World Heritage Site since 1997',
-                'Largest Roman site in Morocco covering 42 hectares'
-            ],
-            'visitor_tips': [
-                'Wear good shoes as the site covers a large area with uneven terrain',
-                'Visit the museum first to understand the historical context',
-                'Bring water and sun protection, especially in summer',
-                'Combine with Meknes for a full historical experience',
-                'The mosaics are protected; follow signage and stay on paths'
-            ],
-            'photos': [
-                '/static/core/images/volubilis-ruins.jpg',
-                '/static/core/images/volubilis-mosaic.jpg',
-                '/static/core/images/volubilis-arch.jpg',
-                '/static/core/images/volubilis-columns.jpg',
-                '/static/core/images/volubilis-museum.jpg',
-                '/static/core/images/volubilis-landscape.jpg',
-                '/static/core/images/volubilis-morocco.jpg',
-                '/static/core/images/volubilis-roman.jpg'
-            ],
-            'coordinates': {'lat': 34.0733, 'lng': -5.5558},
-            'annual_visitors': 200000,
-            'climate': 'Mediterranean climate with hot summers and mild winters',
-            'discovery': 'Excavated by French archaeologists in the early 20th century',
-            'architecture': 'Roman provincial architecture with local influences',
-            'conservation': 'Ongoing archaeological work and preservation of mosaics',
-            'health_safety': 'Watch for uneven ground; stay on marked paths; heat awareness in summer',
-            'key_sites': ['Triumphal Arch', 'Basilica', 'House of Orpheus', 'Capitoline Temple'],
-            'image': '/static/core/images/volubilis-ruins.jpg'
-        },
-
-        'djemaa-el-fna-square-marrakech': {
-            'id': 'djemaa-el-fna-square-marrakech',
-            'name': 'Djemaa el-Fna Square',
-            'location': 'Marrakech, Morocco',
-            'description': 'The vibrant main square of Marrakech, a UNESCO World Heritage Site bustling with street performers, food stalls, and traditional markets.',
-            'long_description': 'Djemaa el-Fna is the main square and marketplace of Marrakech\'s medina quarter. By day it is largely filled with orange juice stalls, water sellers, and street dentists; by night it transforms into a huge food court with dozens of food stalls. The square is surrounded by mosques, souks, and hammams, and has been a UNESCO World Heritage Site since 1985. This historic square has been the center of city life for over 1,000 years.',
-            'historical_significance': 'The square has served as Marrakech\'s main marketplace since the city\'s founding in 1070 AD. It was the site of public executions, proclamations, and festivals during the Almoravid and Almohad dynasties.',
-            'cultural_impact': 'Djemaa el-Fna represents the heart of Moroccan culture, where traditional storytelling, music, and cuisine come together in a vibrant display of local heritage.',
-            'best_time_to_visit': 'Evening (sunset to midnight) for the best atmosphere and food stalls',
-            'how_to_get_there': 'Located in the center of Marrakech medina; easily accessible on foot from most riads',
-            'entrance_fees': 'Free to enter and explore',
-            'opening_hours': '24/7 access; food stalls operate mainly at night',
-            'what_to_wear': 'Modest clothing covering shoulders and knees; comfortable shoes for walking',
-            'guided_tours': 'Optional; self-guided exploration recommended for authentic experience',
-            'nearby_attractions': ['Koutoubia Mosque (exterior)', 'Bahia Palace', 'Saadian Tombs', 'Souks of Marrakech'],
-            'facts': [
-                'UNESCO World Heritage Site since 1985',
-                'Has been Marrakech\'s main square for over 1,000 years',
-                'Features over 100 food stalls serving traditional Moroccan cuisine',
-                'Home to snake charmers, storytellers, and acrobats',
-                'Name means "assembly of the dead" in Arabic'
-            ],
-            'visitor_tips': [
-                'Visit at night when the square comes alive with food stalls and performers',
-                'Try different foods from various stalls for an authentic experience',
-                'Be prepared for crowds and noise, especially on weekends',
-                'Watch out for pickpockets in crowded areas',
-                'Respect performers by paying small amounts for their entertainment'
-            ],
-            'photos': [
-                '/static/core/images/djemaa-el-fna-square.jpg',
-                '/static/core/images/djemaa-el-fna-night.jpg',
-                '/static/core/images/djemaa-el-fna-food.jpg',
-                '/static/core/images/djemaa-el-fna-performers.jpg',
-                '/static/core/images/djemaa-el-fna-marrakech.jpg',
-                '/static/core/images/djemaa-el-fna-market.jpg',
-                '/static/core/images/djemaa-el-fna-morocco.jpg',
-                '/static/core/images/djemaa-el-fna-atmosphere.jpg'
-            ],
-            'coordinates': {'lat': 31.6258, 'lng': -7.9894},
-            'annual_visitors': 12000000,
-            'climate': 'Desert climate with hot days and cooler evenings',
-            'discovery': 'Continuously active since Marrakech\'s founding in the 11th century',
-            'architecture': 'Traditional Moroccan square with surrounding Islamic architecture',
-            'conservation': 'Protected as a UNESCO site with ongoing preservation efforts',
-            'health_safety': 'Generally safe but crowded; watch for pickpockets; food hygiene awareness',
-            'key_sites': ['Food stalls area', 'Performer zones', 'Orange juice stalls', 'Water sellers'],
-            'image': '/static/core/images/djemaa-el-fna-square.jpg'
-        },
-
-        'koutoubia-mosque-marrakech': {
-            'id': 'koutoubia-mosque-marrakech',
-            'name': 'Koutoubia Mosque',
-            'location': 'Marrakech, Morocco',
-            'description': 'The largest mosque in Marrakech and one of the largest in North Africa, featuring stunning Islamic architecture and the tallest minaret in the city.',
-            'long_description': 'The Koutoubia Mosque is the largest mosque in Marrakech and one of the largest in North Africa. Built in the 12th century during the Almohad dynasty, it can accommodate up to 25,000 worshippers. The mosque\'s 77-meter minaret is the largest in Marrakech and features intricate geometric patterns. While non-Muslims cannot enter the mosque, the exterior and minaret are impressive examples of Islamic architecture.',
-            'historical_significance': 'Built between 1147 and 1157 AD during the Almohad dynasty, the mosque replaced an earlier mosque that was destroyed. It served as the model for the Giralda in Seville and the Hassan Tower in Rabat.',
-            'cultural_impact': 'The Koutoubia represents the pinnacle of Almohad architecture and Islamic design. Its minaret has inspired countless mosques across Morocco and Spain.',
-            'best_time_to_visit': 'Morning or late afternoon to avoid the heat and crowds',
-            'how_to_get_there': 'Located near Djemaa el-Fna square; easily accessible on foot',
-            'entrance_fees': 'Free (exterior only for non-Muslims)',
-            'opening_hours': 'Exterior visible 24/7; mosque interior for Muslims only',
-            'what_to_wear': 'Modest clothing covering shoulders and knees out of respect',
-            'guided_tours': 'Exterior tours available; interior not accessible to non-Muslims',
-            'nearby_attractions': ['Djemaa el-Fna Square', 'Bahia Palace', 'Saadian Tombs', 'El Badi Palace'],
-            'facts': [
-                'Built between 1147 and 1157 AD during the Almohad dynasty',
-                'Can accommodate up to 25,000 worshippers',
-                'Minaret is 77 meters tall with 130 steps',
-                'Features intricate geometric patterns and calligraphy',
-                'Model for the Giralda in Seville and Hassan Tower in Rabat'
-            ],
-            'visitor_tips': [
-                'Non-Muslims can only view the exterior and minaret',
-                'Dress modestly and respectfully when viewing the mosque',
-                'Visit during prayer times to hear the call to prayer',
-                'The mosque is especially beautiful when illuminated at night',
-                'Combine with Djemaa el-Fna for a complete Marrakech experience'
-            ],
-            'photos': [
-                '/static/core/images/koutoubia-mosque.jpg',
-                '/static/core/images/koutoubia-minaret.jpg',
-                '/static/core/images/koutoubia-exterior.jpg',
-                '/static/core/images/koutoubia-architecture.jpg',
-                '/static/core/images/koutoubia-marrakech.jpg',
-                '/static/core/images/koutoubia-night.jpg',
-                '/static/core/images/koutoubia-details.jpg',
-                '/static/core/images/koutoubia-morocco.jpg'
-            ],
-            'coordinates': {'lat': 31.6225, 'lng': -7.9867},
-            'annual_visitors': 2000000,
-            'climate': 'Desert climate with hot days and mild nights',
-            'discovery': 'Built as Marrakech\'s main mosque in the 12th century',
-            'architecture': 'Almohad Islamic architecture with geometric patterns and calligraphy',
-            'conservation': 'Protected historic monument with regular maintenance',
-            'health_safety': 'Safe public area; respect religious site guidelines',
-            'key_sites': ['Main minaret', 'Courtyard entrance', 'Geometric patterns', 'Calligraphy details'],
-            'image': '/static/core/images/koutoubia-mosque.jpg'
-        },
-
-        'majorelle-gardens-marrakech': {
-            'id': 'majorelle-gardens-marrakech',
-            'name': 'Majorelle Gardens',
-            'location': 'Marrakech, Morocco',
-            'description': 'A stunning botanical garden with striking blue buildings, once owned by Yves Saint Laurent, featuring exotic plants and tranquil water features.',
-            'long_description': 'The Majorelle Gardens are a botanical garden and artist\'s landscape garden in Marrakech, famous for its intense blue buildings and cacti collection. Created by French artist Jacques Majorelle in 1923, the garden was later purchased and restored by Yves Saint Laurent and Pierre Bergé. The garden features a villa painted in striking cobalt blue, walking paths, ponds, and an extensive collection of exotic plants from around the world.',
-            'historical_significance': 'Created in 1923 by French artist Jacques Majorelle, the garden became famous when Yves Saint Laurent purchased it in 1980 and transformed it into a cultural center.',
-            'cultural_impact': 'The garden represents the fusion of French and Moroccan cultures, and has become a symbol of Marrakech\'s artistic heritage.',
-            'best_time_to_visit': 'Early morning or late afternoon to avoid heat and crowds',
-            'how_to_get_there': 'Located in Gueliz district; accessible by taxi or walking from city center',
-            'entrance_fees': '70 MAD (about $7 USD) for adults',
-            'opening_hours': '8:00 AM - 6:00 PM daily (until 5:00 PM in winter)',
-            'what_to_wear': 'Comfortable walking shoes; light clothing; hat for sun protection',
-            'guided_tours': 'Optional audio guides available; self-guided exploration recommended',
-            'nearby_attractions': ['Yves Saint Laurent Museum', 'Palmeraie Golf Palace', 'Menara Gardens', 'Cyber Park'],
-            'facts': [
-                'Created in 1923 by French artist Jacques Majorelle',
-                'Purchased by Yves Saint Laurent in 1980 for 15 million francs',
-                'Features over 300 species of plants from five continents',
-                'Villa painted in distinctive cobalt blue pigment',
-                'Now houses the Yves Saint Laurent Museum'
-            ],
-            'visitor_tips': [
-                'Visit early morning to avoid crowds and heat',
-                'Bring water and wear comfortable shoes for walking paths',
-                'The blue villa is the garden\'s most photographed feature',
-                'Combine with the Yves Saint Laurent Museum for a full experience',
-                'Photography allowed throughout the gardens'
-            ],
-            'photos': [
-                '/static/core/images/majorelle-gardens.jpg',
-                '/static/core/images/majorelle-blue-villa.jpg',
-                '/static/core/images/majorelle-plants.jpg',
-                '/static/core/images/majorelle-water.jpg',
-                '/static/core/images/majorelle-marrakech.jpg',
-                '/static/core/images/majorelle-paths.jpg',
-                '/static/core/images/majorelle-cacti.jpg',
-                '/static/core/images/majorelle-morocco.jpg'
-            ],
-            'coordinates': {'lat': 31.6433, 'lng': -8.0022},
-            'annual_visitors': 700000,
-            'climate': 'Desert climate with hot summers and mild winters',
-            'discovery': 'Rediscovered and restored by Yves Saint Laurent in the 1980s',
-            'architecture': 'Art Deco villa with botanical garden design',
-            'conservation': 'Protected garden with ongoing restoration of plants and buildings',
-            'health_safety': 'Well-maintained paths; shade areas available; water stations',
-            'key_sites': ['Blue Villa', 'Cacti Garden', 'Water Lily Pond', 'Bamboo Grove'],
-            'image': '/static/core/images/majorelle-gardens.jpg'
-        },
-
-        'saadian-tombs-marrakech': {
-            'id': 'saadian-tombs-marrakech',
-            'name': 'Saadian Tombs',
-            'location': 'Marrakech, Morocco',
-            'description': 'A historic royal necropolis featuring stunning Moroccan architecture, intricate carvings, and the tombs of Saadian dynasty rulers.',
-            'long_description': 'The Saadian Tombs are a historic royal necropolis in Marrakech, dating back to the 16th century. They contain the tombs of about sixty members of the Saadian dynasty, including Sultan Ahmed al-Mansur. The tombs feature stunning Moroccan architecture with intricate carvings, colorful tiles, and a central mausoleum. Hidden for centuries and rediscovered in 1917, they represent one of Morocco\'s most important historical sites.',
-            'historical_significance': 'Built between 1557 and 1591 during the Saadian dynasty, the tombs served as the resting place for Morocco\'s most powerful rulers of the golden age of Moroccan history.',
-            'cultural_impact': 'The Saadian Tombs represent the artistic and architectural pinnacle of the Saadian dynasty and Moroccan Islamic art.',
-            'best_time_to_visit': 'Morning (9 AM - 12 PM) to avoid heat and crowds',
-            'how_to_get_there': 'Located near El Badi Palace; accessible by taxi or walking from medina',
-            'entrance_fees': '70 MAD (about $7 USD) for adults; includes audio guide',
-            'opening_hours': '9:00 AM - 5:00 PM daily',
-            'what_to_wear': 'Modest clothing; comfortable shoes; headscarf optional but respectful',
-            'guided_tours': 'Audio guides available; guided tours recommended for historical context',
-            'nearby_attractions': ['El Badi Palace', 'Bahia Palace', 'Koutoubia Mosque', 'Djemaa el-Fna'],
-            'facts': [
-                'Built between 1557 and 1591 during the Saadian dynasty',
-                'Contains tombs of about 60 Saadian rulers and family members',
-                'Hidden for over 300 years and rediscovered in 1917',
-                'Features the largest domed chamber in Moroccan architecture',
-                'Royal necropolis of Morocco\'s golden age rulers'
-            ],
-            'visitor_tips': [
-                'Visit early morning to avoid crowds and heat',
-                'Audio guide highly recommended for detailed explanations',
-                'Dress modestly and remove shoes when entering mausoleum',
-                'Photography allowed but flash not permitted in mausoleum',
-                'Combine with El Badi Palace for a complete historical experience'
-            ],
-            'photos': [
-                '/static/core/images/saadian-tombs.jpg',
-                '/static/core/images/saadian-mausoleum.jpg',
-                '/static/core/images/saadian-architecture.jpg',
-                '/static/core/images/saadian-carvings.jpg',
-                '/static/core/images/saadian-marrakech.jpg',
-                '/static/core/images/saadian-interior.jpg',
-                '/static/core/images/saadian-tiles.jpg',
-                '/static/core/images/saadian-morocco.jpg'
-            ],
-            'coordinates': {'lat': 31.6189, 'lng': -7.9758},
-            'annual_visitors': 500000,
-            'climate': 'Desert climate with hot summers and mild winters',
-            'discovery': 'Hidden for centuries, rediscovered in 1917 during a rainstorm',
-            'architecture': 'Saadian Islamic architecture with intricate stucco and tile work',
-            'conservation': 'Protected UNESCO site with ongoing restoration work',
-            'health_safety': 'Well-maintained site; remove shoes in mausoleum; watch for uneven floors',
-            'key_sites': ['Royal Mausoleum', 'Sultan\'s Tomb', 'Prayer Hall', 'Garden Courtyard'],
-            'image': '/static/core/images/saadian-tombs.jpg'
-        },
-
-        'fes-el-bali-medina': {
-            'id': 'fes-el-bali-medina',
-            'name': 'Fes el-Bali Medina',
-            'location': 'Fez, Morocco',
-            'description': 'The historic medina of Fez, a UNESCO World Heritage Site featuring narrow winding streets, ancient mosques, and traditional crafts.',
-            'long_description': 'Fes el-Bali is the historic medina of Fez and one of the world\'s largest car-free urban areas. Founded in the 9th century, this UNESCO World Heritage Site contains over 9,000 narrow, winding streets and alleys. The medina is home to ancient mosques, madrasas, fountains, and traditional crafts like leather tanning and pottery. It represents one of the best-preserved medieval Islamic cities in the world.',
-            'historical_significance': 'Founded in 789 AD, Fes el-Bali became the capital of Morocco and a center of learning and culture. It contains the world\'s oldest university and numerous historic monuments.',
-            'cultural_impact': 'Fes el-Bali represents the pinnacle of medieval Islamic urban planning and continues to be a living example of traditional Moroccan culture and crafts.',
-            'best_time_to_visit': 'Early morning or late afternoon to avoid heat and crowds',
-            'how_to_get_there': 'Located in the heart of Fez; accessible by taxi from new city',
-            'entrance_fees': 'Free to enter; small fees for some sites within the medina',
-            'opening_hours': '24/7 access to streets; shops and sites have varying hours',
-            'what_to_wear': 'Modest clothing; comfortable walking shoes; light layers',
-            'guided_tours': 'Highly recommended due to the maze-like layout',
-            'nearby_attractions': ['Al Quaraouiyine University', 'Fes Tanneries', 'Bou Inania Madrasa', 'Royal Palace'],
-            'facts': [
-                'Founded in 789 AD, making it one of the world\'s oldest cities',
-                'UNESCO World Heritage Site since 1981',
-                'Contains over 9,000 narrow streets and alleys',
-                'Home to the world\'s oldest continuously operating university',
-                'Largest car-free urban area in the world'
-            ],
-            'visitor_tips': [
-                'Use a guide to navigate the complex street layout',
-                'Dress modestly and respectfully in this religious area',
-                'Try traditional Fassi cuisine at local restaurants',
-                'Visit the tanneries from a rooftop for better views',
-                'Be prepared for crowds and narrow passages'
-            ],
-            'photos': [
-                '/static/core/images/fes-el-bali-medina.jpg',
-                '/static/core/images/fes-streets.jpg',
-                '/static/core/images/fes-architecture.jpg',
-                '/static/core/images/fes-mosque.jpg',
-                '/static/core/images/fes-medina.jpg',
-                '/static/core/images/fes-markets.jpg',
-                '/static/core/images/fes-morocco.jpg',
-                '/static/core/images/fes-atmosphere.jpg'
-            ],
-            'coordinates': {'lat': 34.0667, 'lng': -4.9667},
-            'annual_visitors': 800000,
-            'climate': 'Mediterranean climate with hot summers and mild winters',
-            'discovery': 'Continuously inhabited since the 9th century',
-            'architecture': 'Medieval Islamic architecture with Moroccan-Andalusian influences',
-            'conservation': 'UNESCO protected site with ongoing preservation efforts',
-            'health_safety': 'Generally safe but crowded; watch for pickpockets; respect local customs',
-            'key_sites': ['Al Quaraouiyine Mosque', 'Bou Inania Madrasa', 'Fes Tanneries', 'Medersa Attarine'],
-            'image': '/static/core/images/fes-el-bali-medina.jpg'
-        }
-    },
-
-    'tunisia': {
-        'carthage-archaeological-site': {
-            'id': 'carthage-archaeological-site',
-            'name': 'Carthage Archaeological Site',
-            'location': 'Carthage, Tunisia',
-            'description': 'Explore the ancient ruins of Carthage, the legendary Phoenician city that challenged Rome and shaped Mediterranean history.',
-            'long_description': 'Carthage was the capital of the ancient Carthaginian civilization, founded by Phoenician settlers around 814 BC. This legendary city challenged Rome for control of the Mediterranean and was destroyed and rebuilt multiple times. Today, visitors can explore extensive Roman ruins, the Antonine Baths, and the Carthage Museum, which houses remarkable artifacts from this fascinating civilization.',
-            'historical_significance': 'Carthage was a major power in the ancient Mediterranean world. The Punic Wars against Rome (264-146 BC) shaped the course of Western history.',
-            'cultural_impact': 'Carthage represents the Phoenician heritage of North Africa and the clash between Eastern and Western civilizations in antiquity.',
-            'best_time_to_visit': 'April to June or September to November (mild weather, good visibility)',
-            'how_to_get_there': 'Located 15km northeast of Tunis; accessible by taxi, train, or organized tours',
-            'entrance_fees': '12 TND (about $4 USD) for the archaeological site',
-            'opening_hours': '8:00 AM - 7:00 PM daily (until 5:00 PM in winter)',
-            'what_to_wear': 'Comfortable walking shoes; hat and sunscreen; modest clothing',
-            'guided_tours': 'Highly recommended; audio guides and guided tours available',
-            'nearby_attractions': ['Carthage Museum', 'Sidi Bou Said', 'Byrsa Hill', 'Antonine Baths'],
-            'facts': [
-                'Founded around 814 BC by Phoenician settlers from Tyre',
-                'Ruled by the legendary Queen Dido according to Virgil',
-                'Fought three Punic Wars against Rome (264-146 BC)',
-                'Destroyed by Rome in 146 BC, rebuilt as a Roman city',
-                'UNESCO World Heritage Site since 1979'
-            ],
-            'visitor_tips': [
-                'The site is spread out; wear comfortable shoes for walking',
-                'Visit the museum first to understand the historical context',
-                'Bring water and sun protection, especially in summer',
-                'Combine with Sidi Bou Said for a full day experience',
-                'Photography allowed but check restrictions at certain sites'
-            ],
-            'photos': [
-                '/static/core/images/carthage-ruins.jpg',
-                '/static/core/images/carthage-museum.jpg',
-                '/static/core/images/carthage-baths.jpg',
-                '/static/core/images/carthage-theater.jpg',
-                '/static/core/images/carthage-view.jpg',
-                '/static/core/images/carthage-mosaic.jpg',
-                '/static/core/images/carthage-tunisia.jpg',
-                '/static/core/images/carthage-ancient.jpg'
-            ],
-            'coordinates': {'lat': 36.8528, 'lng': 10.3233},
-            'annual_visitors': 500000,
-            'climate': 'Mediterranean climate with hot summers and mild winters',
-            'discovery': 'Systematic excavations began in the 19th century under French rule',
-            'architecture': 'Mix of Phoenician, Punic, and Roman architectural styles',
-            'conservation': 'Ongoing archaeological work and preservation efforts',
-            'health_safety': 'Generally safe; watch for uneven terrain; heat awareness in summer',
-            'key_sites': ['Antonine Baths', 'Carthage Museum', 'Byrsa Hill', 'Roman Theater'],
-            'image': '/static/core/images/carthage-ruins.jpg'
-        },
-
-        'sidi-bou-said': {
-            'id': 'sidi-bou-said',
-            'name': 'Sidi Bou Said',
-            'location': 'Sidi Bou Said, Tunisia',
-            'description': 'A charming coastal village famous for its blue and white architecture, stunning Mediterranean views, and artistic heritage.',
-            'long_description': 'Sidi Bou Said is a picturesque coastal village perched on a cliff overlooking the Mediterranean Sea. Famous for its distinctive blue and white architecture, the village has been a haven for artists, writers, and intellectuals since the early 20th century. The narrow, winding streets, traditional cafes, and stunning sea views create an atmosphere of tranquility and beauty.',
-            'historical_significance': 'Named after a 13th-century Sufi saint, the village became a diplomatic quarter during the French protectorate period.',
-            'cultural_impact': 'Sidi Bou Said has inspired countless artists and writers. Its distinctive architecture has influenced design throughout Tunisia.',
-            'best_time_to_visit': 'April to June or September to November (mild weather, fewer crowds)',
-            'how_to_get_there': 'Located 20km northeast of Tunis; accessible by taxi, train, or bus',
-            'entrance_fees': 'Free to explore; small fees for some cafes or viewpoints',
-            'opening_hours': '24/7 access; best experienced during daylight hours',
-            'what_to_wear': 'Casual, comfortable clothing; light jacket for sea breezes',
-            'guided_tours': 'Optional; self-guided walking tours available with maps',
-            'nearby_attractions': ['Carthage', 'Tunis Medina', 'La Marsa', 'Gammarth'],
-            'facts': [
-                'Named after Sidi Bou Said, a 13th-century Sufi saint',
-                'Became an artists\' colony in the early 20th century',
-                'Features distinctive blue and white Andalusian architecture',
-                'Overlooks the Mediterranean Sea with stunning coastal views',
-                'Home to many artists, writers, and intellectuals'
-            ],
-            'visitor_tips': [
-                'Visit early morning or late afternoon to avoid tourist crowds',
-                'Try traditional Tunisian mint tea at local cafes',
-                'Explore the narrow winding streets on foot',
-                'Enjoy the panoramic views from the cliffside paths',
-                'Visit art galleries and craft shops in the village'
-            ],
-            'photos': [
-                '/static/core/images/sidi-bou-said-village.jpg',
-                '/static/core/images/sidi-bou-said-blue.jpg',
-                '/static/core/images/sidi-bou-said-sea.jpg',
-                '/static/core/images/sidi-bou-said-streets.jpg',
-                '/static/core/images/sidi-bou-said-cafe.jpg',
-                '/static/core/images/sidi-bou-said-view.jpg',
-                '/static/core/images/sidi-bou-said-tunisia.jpg',
-                '/static/core/images/sidi-bou-said-art.jpg'
-            ],
-            'coordinates': {'lat': 36.8700, 'lng': 10.3417},
-            'annual_visitors': 800000,
-            'climate': 'Mediterranean climate with mild temperatures year-round',
-            'discovery': 'Became popular with European artists in the 1920s and 1930s',
-            'architecture': 'Traditional Tunisian Andalusian style with blue and white color scheme',
-            'conservation': 'Protected historic district with preservation of traditional architecture',
-            'health_safety': 'Generally safe; watch for steep cliff paths; respect local customs',
-            'key_sites': ['Sidi Bou Said Mosque', 'Ennejma Ezzahra Palace', 'Coastal Views', 'Art Galleries'],
-            'image': '/static/core/images/sidi-bou-said-village.jpg'
-        },
-
-        'el-jem-amphitheater': {
-            'id': 'el-jem-amphitheater',
-            'name': 'El Jem Amphitheater',
-            'location': 'El Jem, Tunisia',
-            'description': 'Visit the magnificent Roman amphitheater of El Jem, one of the largest and best-preserved Roman theaters in North Africa.',
-            'long_description': 'The Amphitheater of El Jem is one of the best-preserved Roman amphitheaters in the world and the largest in North Africa. Built in the 3rd century AD during the reign of Emperor Gordian III, this massive structure could seat up to 35,000 spectators. The amphitheater is remarkably well-preserved, with three stories of arches and a complex system of underground passages.',
-            'historical_significance': 'Built in the 3rd century AD, the amphitheater served as a venue for gladiatorial contests and public spectacles in the Roman province of Africa Proconsularis.',
-            'cultural_impact': 'El Jem represents the grandeur of Roman architecture in North Africa and continues to host cultural events and festivals.',
-            'best_time_to_visit': 'March to May or September to November (comfortable temperatures)',
-            'how_to_get_there': 'Located 60km south of Sfax; accessible by taxi, bus, or organized tours',
-            'entrance_fees': '12 TND (about $4 USD) for adults',
-            'opening_hours': '8:00 AM - 7:00 PM daily (until 5:00 PM in winter)',
-            'what_to_wear': 'Comfortable walking shoes; hat and sunscreen; light clothing',
-            'guided_tours': 'Recommended; audio guides available in multiple languages',
-            'nearby_attractions': ['El Jem Museum', 'Roman Villas', 'Olive Groves', 'Medina of El Jem'],
-            'facts': [
-                'Built in the 3rd century AD during Roman rule',
-                'Could seat up to 35,000 spectators',
-                'Third largest Roman amphitheater in the world',
-                'UNESCO World Heritage Site since 1979',
-                'Features a sophisticated underground system for gladiators and animals'
-            ],
-            'visitor_tips': [
-                'Climb to the top for panoramic views of the structure',
-                'Visit during a performance if available (occasional concerts held here)',
-                'Wear comfortable shoes for exploring the underground passages',
-                'Bring water and sun protection',
-                'The acoustics are amazing - try speaking from different levels'
-            ],
-            'photos': [
-                '/static/core/images/el-jem-amphitheater.jpg',
-                '/static/core/images/el-jem-interior.jpg',
-                '/static/core/images/el-jem-arches.jpg',
-                '/static/core/images/el-jem-underground.jpg',
-                '/static/core/images/el-jem-view.jpg',
-                '/static/core/images/el-jem-museum.jpg',
-                '/static/core/images/el-jem-tunisia.jpg',
-                '/static/core/images/el-jem-roman.jpg'
-            ],
-            'coordinates': {'lat': 35.2933, 'lng': 10.7067},
-            'annual_visitors': 300000,
-            'climate': 'Mediterranean climate with hot summers and mild winters',
-            'discovery': 'Excavated and restored in the 20th century',
-            'architecture': 'Classic Roman amphitheater design with African adaptations',
-            'conservation': 'Ongoing preservation work to maintain structural integrity',
-            'health_safety': 'Watch for uneven surfaces; stay on marked paths; heat awareness',
-            'key_sites': ['Arena Floor', 'Underground Passages', 'Imperial Box', 'Museum'],
-            'image': '/static/core/images/el-jem-amphitheater.jpg'
-        },
-
-        'kairouan': {
-            'id': 'kairouan',
-            'name': 'Kairouan Historic City',
-            'location': 'Kairouan, Tunisia',
-            'description': 'Discover Kairouan, the holy city of Tunisia, featuring the Great Mosque and centuries of Islamic architectural heritage.',
-            'long_description': 'Kairouan is Tunisia\'s holiest city and one of the most important Islamic pilgrimage sites in North Africa. Founded in 670 AD by Arab conquerors, the city contains some of the finest examples of Islamic architecture in the region. The Great Mosque of Kairouan, with its stunning minaret and intricate courtyard, is considered one of the most beautiful mosques in the Islamic world.',
-            'historical_significance': 'Founded in 670 AD by Uqba ibn Nafi, Kairouan became the capital of the Islamic province of Ifriqiya and a center of Islamic learning.',
-            'cultural_impact': 'Kairouan represents the Islamic heritage of Tunisia and North Africa. It remains an important religious and cultural center.',
-            'best_time_to_visit': 'October to April (cooler weather, fewer crowds)',
-            'how_to_get_there': 'Located 150km south of Tunis; accessible by train, bus, or taxi',
-            'entrance_fees': 'Free for the medina; small fees for some mosques and museums',
-            'opening_hours': 'Varies by site; mosques have specific prayer times',
-            'what_to_wear': 'Modest clothing covering shoulders and knees; headscarf for women entering mosques',
-            'guided_tours': 'Highly recommended for religious sites; respect prayer times',
-            'nearby_attractions': ['Great Mosque', 'Medina of Kairouan', 'Zaouia of Sidi Sahab', 'Aghlabid Basins'],
-            'facts': [
-                'Founded in 670 AD by Arab conquerors',
-                'One of the four holy cities of Islam',
-                'Contains the oldest mosque in North Africa',
-                'UNESCO World Heritage Site since 1988',
-                'Famous for its intricate Islamic architecture and calligraphy'
-            ],
-            'visitor_tips': [
-                'Respect Islamic customs and dress modestly',
-                'Visit mosques outside of prayer times',
-                'Try traditional Tunisian carpets and ceramics',
-                'Explore the medina on foot for the best experience',
-                'Visit during Ramadan for special cultural insights (if appropriate)'
-            ],
-            'photos': [
-                '/static/core/images/kairouan-mosque.jpg',
-                '/static/core/images/kairouan-medina.jpg',
-                '/static/core/images/kairouan-minaret.jpg',
-                '/static/core/images/kairouan-courtyard.jpg',
-                '/static/core/images/kairouan-architecture.jpg',
-                '/static/core/images/kairouan-market.jpg',
-                '/static/core/images/kairouan-tunisia.jpg',
-                '/static/core/images/kairouan-islamic.jpg'
-            ],
-            'coordinates': {'lat': 35.6781, 'lng': 10.0967},
-            'annual_visitors': 200000,
-            'climate': 'Desert climate with hot summers and mild winters',
-            'discovery': 'Preserved as a living Islamic city throughout centuries',
-            'architecture': 'Islamic architecture with Aghlabid and Fatimid influences',
-            'conservation': 'Protected historic district with ongoing preservation',
-            'health_safety': 'Generally safe; respect religious customs; heat awareness in summer',
-            'key_sites': ['Great Mosque', 'Medina', 'Zaouia of Sidi Sahab', 'Aghlabid Basins'],
-            'image': '/static/core/images/kairouan-mosque.jpg'
-        },
-
-        'matmata': {
-            'id': 'matmata',
-            'name': 'Matmata Underground Homes',
-            'location': 'Matmata, Tunisia',
-            'description': 'Explore the unique underground homes of Matmata, traditional Berber dwellings carved into the earth that inspired Star Wars.',
-            'long_description': 'Matmata is famous for its unique underground dwellings, traditional homes carved into the soft earth by Berber inhabitants over centuries. These troglodyte homes provide natural insulation from the desert heat and cold. The village gained international fame as a filming location for Star Wars: Episode IV - A New Hope, where it represented the planet Tatooine.',
-            'historical_significance': 'The underground homes date back to Berber settlement in the region, with some structures over 1,000 years old.',
-            'cultural_impact': 'Matmata represents traditional Berber architecture and has become a symbol of Tunisian cultural heritage.',
-            'best_time_to_visit': 'October to April (comfortable temperatures for exploring)',
-            'how_to_get_there': 'Located 400km south of Tunis; accessible by bus, taxi, or organized tours',
-            'entrance_fees': 'Small fees for visiting homes; varies by household',
-            'opening_hours': 'Typically 8:00 AM - 6:00 PM; respect residents\' schedules',
-            'what_to_wear': 'Comfortable clothing; light layers; sturdy shoes for uneven terrain',
-            'guided_tours': 'Recommended to support local economy and learn about culture',
-            'nearby_attractions': ['Star Wars Locations', 'Berber Villages', 'Desert Landscapes', 'Douz Oasis'],
-            'facts': [
-                'Homes are dug 6-10 meters into the soft earth',
-                'Provides natural insulation from desert temperature extremes',
-                'Some homes date back over 1,000 years',
-                'Featured in Star Wars as Luke Skywalker\'s home planet',
-                'Traditional Berber architecture unique to southern Tunisia'
-            ],
-            'visitor_tips': [
-                'Support local families by visiting their homes and buying crafts',
-                'Be respectful of residents\' privacy and living spaces',
-                'Try traditional Berber food and stay in underground hotels',
-                'Visit during cooler months to avoid extreme heat',
-                'Learn about the sustainable living practices of the Berber people'
-            ],
-            'photos': [
-                '/static/core/images/matmata-underground.jpg',
-                '/static/core/images/matmata-home.jpg',
-                '/static/core/images/matmata-interior.jpg',
-                '/static/core/images/matmata-village.jpg',
-                '/static/core/images/matmata-star-wars.jpg',
-                '/static/core/images/matmata-berber.jpg',
-                '/static/core/images/matmata-tunisia.jpg',
-                '/static/core/images/matmata-desert.jpg'
-            ],
-            'coordinates': {'lat': 33.5444, 'lng': 9.9717},
-            'annual_visitors': 150000,
-            'climate': 'Desert climate with extreme temperature variations',
-            'discovery': 'Documented by explorers in the 19th century; gained fame through Star Wars',
-            'architecture': 'Traditional Berber troglodyte dwellings carved into earth',
-            'conservation': 'Protected cultural site with sustainable tourism practices',
-            'health_safety': 'Watch for uneven surfaces; respect local customs; heat awareness',
-            'key_sites': ['Traditional Homes', 'Star Wars Locations', 'Berber Museum', 'Desert Views'],
-            'image': '/static/core/images/matmata-underground.jpg'
-        },
-
-        'dougga-ancient-city': {
-            'id': 'dougga-ancient-city',
-            'name': 'Dougga Ancient City',
-            'location': 'Dougga, Tunisia',
-            'description': 'The most impressive and best-preserved Roman site in Tunisia, a UNESCO World Heritage Site featuring magnificent temples and theaters.',
-            'long_description': 'Dougga is Tunisia\'s most impressive Roman site and one of the best-preserved Roman towns in the Mediterranean. Founded as a Numidian settlement in the 2nd century BC, the city flourished under Roman rule from the 2nd to 4th centuries AD. The site features magnificent temples, including the stunning Capitol temple, a well-preserved 3,500-seat theater, and numerous houses with beautiful mosaics spread across a dramatic hillside location.',
-            'historical_significance': 'Founded as a Numidian town, Dougga became a prosperous Roman city under Emperor Septimius Severus. The city reached its peak in the 2nd-3rd centuries AD with a population of around 10,000 people.',
-            'cultural_impact': 'UNESCO World Heritage Site since 1997, Dougga is considered the finest example of a small Roman town in North Africa and provides exceptional insights into Roman provincial life.',
-            'best_time_to_visit': 'March to May or October to November for mild weather and good visibility',
-            'how_to_get_there': 'Located 110km southwest of Tunis; accessible by taxi, bus (2.5 hours), or organized tours',
-            'entrance_fees': '12 TND (about $4 USD) for adults; photography allowed',
-            'opening_hours': '8:30 AM - 5:30 PM daily (extends to 7:00 PM in summer)',
-            'what_to_wear': 'Sturdy hiking shoes for uneven terrain; hat and sunscreen; light breathable clothing',
-            'guided_tours': 'Highly recommended; local guides available at entrance; allow 3-4 hours for full tour',
-            'nearby_attractions': ['Capitol Temple', 'Roman Theater', 'House of Trifolium', 'Baths of the Cyclops', 'Libyan-Punic Mausoleum'],
-            'facts': [
-                'UNESCO World Heritage Site since 1997',
-                'The Capitol Temple is the best-preserved in North Africa',
-                'The Roman theater seats 3,500 spectators and still has excellent acoustics',
-                'Site covers 70 hectares spread across a hillside',
-                'Features a unique blend of Numidian, Punic, and Roman architecture',
-                'Contains over 20 well-preserved temples and public buildings',
-                'The site offers panoramic views of the surrounding wheat fields'
-            ],
-            'visitor_tips': [
-                'Wear sturdy shoes - the site is on a hillside with uneven stones',
-                'Start early to avoid heat and have best lighting for photos',
-                'Bring plenty of water and snacks - limited facilities on site',
-                'The Capitol Temple offers spectacular panoramic views',
-                'Allow 3-4 hours minimum to explore properly',
-                'Visit the theater to experience its amazing acoustics',
-                'Combine with Bulla Regia for a full Roman history day'
-            ],
-            'photos': [
-                'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-            ],
-            'coordinates': '36.4228° N, 9.2194° E',
-            'annual_visitors': '150,000',
-            'climate': 'Mediterranean climate with hot dry summers and mild winters',
-            'unesco_status': 'UNESCO World Heritage Site since 1997',
-            'area': '70 hectares'
-        },
-
-        'tunis-medina': {
-            'id': 'tunis-medina',
-            'name': 'Tunis Medina',
-            'location': 'Tunis, Tunisia',
-            'description': 'A UNESCO World Heritage Site, the Medina of Tunis is one of the finest Islamic cities in North Africa with 700 monuments.',
-            'long_description': 'The Medina of Tunis is a UNESCO World Heritage Site and one of the best-preserved medieval Islamic cities in North Africa. Founded in 698 AD, this labyrinthine old quarter contains over 700 monuments including palaces, mosques, mausoleums, madrasas, and fountains dating from the Almohad and Hafsid periods. The medina\'s narrow winding streets are lined with traditional souks selling everything from perfumes and carpets to jewelry and spices.',
-            'historical_significance': 'Founded in 698 AD as the new capital of Ifriqiya, Tunis Medina became a major center of Islamic learning and culture, reaching its golden age in the 13th-16th centuries under Hafsid rule.',
-            'cultural_impact': 'The medina represents the peak of Arab-Islamic urban planning and architecture in North Africa. It has preserved its authentic character and continues to be a living, working community.',
-            'best_time_to_visit': 'March to May or September to November for comfortable exploring weather',
-            'how_to_get_there': 'Located in central Tunis; accessible by metro, tram, taxi, or walking from modern city center',
-            'entrance_fees': 'Free to explore streets; individual monuments 2-5 TND',
-            'opening_hours': '24/7 for streets; shops typically 9:00 AM - 7:00 PM; closed Sundays',
-            'what_to_wear': 'Modest clothing covering shoulders and knees; comfortable walking shoes',
-            'guided_tours': 'Recommended for first-time visitors; many walking tours available; 2-3 hours typical',
-            'nearby_attractions': ['Zitouna Mosque', 'Dar Lasram', 'Tourbet el Bey', 'Souk el Attarine', 'Bardo Museum'],
-            'facts': [
-                'UNESCO World Heritage Site since 1979',
-                'Contains over 700 historic monuments',
-                'Covers 280 hectares making it one of the largest medinas',
-                'The Zitouna Mosque has stood since 734 AD',
-                'Home to over 10,000 residents living in traditional houses',
-                'Features 11 historic gates (bab) around its perimeter',
-                'The souks are organized by trade, following medieval tradition'
-            ],
-            'visitor_tips': [
-                'Start at Bab Bhar (French Gate) and work your way to Zitouna Mosque',
-                'Bargaining is expected in the souks - start at 50% of asking price',
-                'Visit early morning to see the medina wake up with local life',
-                'Try traditional foods like brik, couscous, and mint tea',
-                'Dress modestly out of respect for residents and mosques',
-                'Get intentionally lost in the alleys - it\'s the best way to discover',
-                'Respect prayer times at mosques (non-Muslims cannot enter most)'
-            ],
-            'photos': [
-                'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1518684079-3c830dcef090?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1555529669-e69e7aa0ba9a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-            ],
-            'coordinates': '36.8189° N, 10.1658° E',
-            'annual_visitors': '800,000',
-            'climate': 'Mediterranean climate',
-            'unesco_status': 'UNESCO World Heritage Site since 1979',
-            'area': '280 hectares'
-        },
-
-        'bardo-museum': {
-            'id': 'bardo-museum',
-            'name': 'Bardo National Museum',
-            'location': 'Le Bardo, Tunis, Tunisia',
-            'description': 'The world\'s finest collection of Roman mosaics housed in a magnificent 19th-century Ottoman palace.',
-            'long_description': 'The Bardo National Museum is Africa\'s premier archaeological museum and houses the world\'s most important collection of Roman mosaics. Set in a stunning 19th-century Ottoman palace, the museum showcases Tunisia\'s rich history through artifacts from the Carthaginian, Roman, Christian, and Islamic periods. The mosaic collection includes extraordinary pieces depicting mythology, daily life, nature, and geometric patterns from ancient villas across Tunisia.',
-            'historical_significance': 'Established in 1888 in the former beylical palace of Bardo, the museum has become North Africa\'s most significant repository of archaeological treasures.',
-            'cultural_impact': 'The Bardo houses the world\'s largest and most diverse collection of Roman mosaics, providing invaluable insights into ancient Mediterranean life and art.',
-            'best_time_to_visit': 'Year-round; weekdays are less crowded than weekends',
-            'how_to_get_there': 'Located 4km west of central Tunis; accessible by metro (Bardo station), taxi, or bus',
-            'entrance_fees': '11 TND (about $3.50 USD) for adults; 5 TND for students; free for children under 12',
-            'opening_hours': '9:00 AM - 5:00 PM Tuesday-Sunday; closed Mondays',
-            'what_to_wear': 'Casual comfortable clothing; no special requirements',
-            'guided_tours': 'Highly recommended; audio guides available in multiple languages; guided tours 20 TND',
-            'nearby_attractions': ['Tunis Medina', 'Carthage', 'Sidi Bou Said', 'Avenue Habib Bourguiba'],
-            'facts': [
-                'Contains the world\'s largest collection of Roman mosaics',
-                'Housed in a magnificent 19th-century Ottoman beylical palace',
-                'Covers 8,000 years of Tunisian history',
-                'Features over 100 exhibition rooms across two buildings',
-                'The famous Virgil mosaic shows the poet between two Muses',
-                'Displays artifacts from major Tunisian archaeological sites',
-                'The Ulysses and the Sirens mosaic is one of the museum\'s treasures'
-            ],
-            'visitor_tips': [
-                'Allow 2-3 hours for a thorough visit',
-                'Start on the upper floor and work your way down',
-                'Don\'t miss the Virgil, Ulysses, and Neptune mosaics',
-                'Photography allowed without flash',
-                'Visit on weekdays to avoid school groups',
-                'Combine with visits to Carthage where many artifacts originated',
-                'The palace architecture itself is worth admiring'
-            ],
-            'photos': [
-                'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-            ],
-            'coordinates': '36.8086° N, 10.1347° E',
-            'annual_visitors': '500,000',
-            'climate': 'Mediterranean climate',
-            'established': '1888'
-        },
-
-        'djerba-island': {
-            'id': 'djerba-island',
-            'name': 'Djerba Island',
-            'location': 'Djerba, Tunisia',
-            'description': 'A Mediterranean island paradise with ancient synagogues, pristine beaches, traditional crafts, and one of the world\'s oldest Jewish communities.',
-            'long_description': 'Djerba is Tunisia\'s largest island and a captivating blend of Mediterranean beaches, ancient history, and cultural diversity. The island is home to El Ghriba Synagogue, one of the oldest Jewish places of worship in the world, dating to 586 BC. Djerba offers a unique fusion of Berber, Arab, and Jewish cultures with whitewashed villages, traditional pottery workshops, olive groves, and some of Tunisia\'s most beautiful beaches.',
-            'historical_significance': 'Djerba has been continuously inhabited for over 2,500 years and hosts one of the world\'s oldest Jewish communities, maintaining ancient traditions and religious practices.',
-            'cultural_impact': 'The island represents Tunisia\'s remarkable religious tolerance and cultural diversity, with Muslims, Jews, and Christians coexisting peacefully for centuries.',
-            'best_time_to_visit': 'April to June or September to November for perfect beach weather without extreme heat',
-            'how_to_get_there': 'Djerba-Zarzis International Airport with direct flights; also accessible by ferry from Jorf or Roman causeway from mainland',
-            'entrance_fees': 'Varies by attraction; El Ghriba Synagogue 5 TND; beaches mostly free',
-            'opening_hours': 'Beaches 24/7; El Ghriba Synagogue 8:00 AM - 6:00 PM daily',
-            'what_to_wear': 'Beach attire for coastal areas; modest clothing for religious sites; comfortable shoes for exploring',
-            'guided_tours': 'Island tours available; cultural heritage tours recommended; pottery workshop visits popular',
-            'nearby_attractions': ['El Ghriba Synagogue', 'Houmt Souk', 'Guellala Museum', 'Djerba Explore Park', 'Flamingo Island'],
-            'facts': [
-                'Tunisia\'s largest island at 514 square kilometers',
-                'Home to North Africa\'s oldest synagogue (traditionally dated to 586 BC)',
-                'Known for traditional pottery made in Guellala village',
-                'Features over 300 mosques across the small island',
-                'Connected to mainland by ancient 7km Roman causeway',
-                'Famous for olive oil and traditional bread-making',
-                'Annual Jewish pilgrimage draws thousands to El Ghriba'
-            ],
-            'visitor_tips': [
-                'Rent a bike, scooter, or car to explore the island freely',
-                'Visit El Ghriba Synagogue during the annual Lag BaOmer pilgrimage',
-                'Try traditional Djerban bread, olive oil, and harissa',
-                'Explore pottery workshops in Guellala village',
-                'Visit Houmt Souk for traditional souks and cafes',
-                'Flamingo Island attracts pink flamingos in winter',
-                'Combine beach relaxation with cultural exploration'
-            ],
-            'photos': [
-                'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-            ],
-            'coordinates': '33.8076° N, 10.8451° E',
-            'annual_visitors': '1,200,000',
-            'climate': 'Mediterranean climate with mild winters and hot dry summers',
-            'area': '514 square kilometers'
-        },
-
-        'sahara-desert-tunisia': {
-            'id': 'sahara-desert',
-            'name': 'Sahara Desert Tunisia',
-            'location': 'Southern Tunisia',
-            'description': 'Experience the stunning Tunisian Sahara with golden dunes, salt lakes, mountain oases, and Star Wars filming locations.',
-            'long_description': 'The Tunisian Sahara offers some of North Africa\'s most spectacular desert landscapes, from the towering dunes of Erg Chebbi to the otherworldly salt flats of Chott el Djerid. This region served as filming locations for Star Wars, featuring dramatic desert scenery, ancient Berber villages, lush mountain oases, and endless expanses of golden sand. Desert camps offer overnight stays under brilliant star-filled skies.',
-            'historical_significance': 'The Sahara has been home to nomadic Berber tribes for millennia, with ancient trade routes crossing the desert connecting sub-Saharan Africa to the Mediterranean.',
-            'cultural_impact': 'Tunisia\'s Sahara gained global fame through Star Wars films, bringing international tourism to this remote region while preserving Berber desert culture.',
-            'best_time_to_visit': 'November to March for comfortable desert temperatures; avoid July-August extreme heat',
-            'how_to_get_there': 'Main gateways are Tozeur and Douz; accessible by domestic flights or 7-8 hour drives from Tunis',
-            'entrance_fees': 'Desert access free; organized tours and camps vary (80-200 TND per day)',
-            'opening_hours': 'Desert accessible 24/7; guided excursions during daylight; overnight camps available',
-            'what_to_wear': 'Light breathable desert clothing; warm layers for cold nights; sun protection essential; sturdy shoes',
-            'guided_tours': 'Essential for safety; 4x4 desert tours highly recommended; camel treks; multi-day expeditions available',
-            'nearby_attractions': ['Tozeur Oasis', 'Chott el Djerid', 'Chebika Oasis', 'Tamerza Canyon', 'Ksar Ghilane', 'Matmata'],
-            'facts': [
-                'Chott el Djerid is one of Africa\'s largest salt lakes',
-                'The desert contains several Star Wars filming locations',
-                'Temperatures can drop below freezing at night in winter',
-                'Tozeur\'s palmerie has over 400,000 date palms',
-                'The region features dramatic canyons and mountain oases',
-                'Traditional Berber nomads still practice ancient desert survival skills',
-                'Desert foxes, scorpions, and desert roses can be found'
-            ],
-            'visitor_tips': [
-                'Book reputable tour operators for safety and authenticity',
-                'Bring plenty of water and stay hydrated constantly',
-                'Wear sunscreen and cover up even in winter',
-                'Overnight desert camps offer incredible stargazing',
-                'Visit mountain oases (Chebika, Tamerza, Mides) for stunning scenery',
-                'Sunrise and sunset at Chott el Djerid are magical',
-                'Respect Berber culture and ask permission before photographing people'
-            ],
-            'photos': [
-                'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-            ],
-            'coordinates': '33.9197° N, 8.1339° E',
-            'annual_visitors': '300,000',
-            'climate': 'Extreme desert climate with huge day/night temperature variations',
-            'special_features': 'Multiple Star Wars filming locations'
-        },
-
-        'sousse-medina': {
-            'id': 'sousse-medina',
-            'name': 'Sousse Medina & Ribat',
-            'location': 'Sousse, Tunisia',
-            'description': 'A UNESCO-listed coastal medina with a historic 8th-century ribat fortress and beautiful Arab-Islamic architecture.',
-            'long_description': 'The Medina of Sousse is one of Tunisia\'s finest examples of Arab-Islamic architecture and a UNESCO World Heritage Site. The compact medina is dominated by its impressive ribat, a fortress-monastery dating from 787 AD, which served to defend the coast from Byzantine naval attacks. The medina features a labyrinth of narrow streets, traditional souks, the Great Mosque dating from 850 AD, and well-preserved city walls offering visitors an authentic glimpse into Tunisia\'s medieval Islamic past.',
-            'historical_significance': 'Founded in 859 AD, the ribat of Sousse is one of the oldest Islamic military fortifications and served as both a military fortress and religious retreat for warrior monks.',
-            'cultural_impact': 'The ribat is one of the oldest and best-preserved Islamic fortifications in North Africa, representing the early Islamic defense system.',
-            'best_time_to_visit': 'April to June or September to November for comfortable walking weather',
-            'how_to_get_there': 'Located in Sousse city center; accessible by train from Tunis (2 hours), bus, taxi, or walking from beach resorts',
-            'entrance_fees': '10 TND for ribat and archaeological museum combined ticket',
-            'opening_hours': '8:00 AM - 7:00 PM in summer; 9:00 AM - 5:00 PM in winter',
-            'what_to_wear': 'Modest clothing covering shoulders and knees; comfortable walking shoes for cobblestones',
-            'guided_tours': 'Available at entrance; audio guides provided; 1-2 hours typical for medina and ribat',
-            'nearby_attractions': ['Great Mosque of Sousse', 'Archaeological Museum', 'Sousse Beach', 'Port El Kantaoui', 'Kasbah'],
-            'facts': [
-                'UNESCO World Heritage Site since 1988',
-                'The ribat dates from 787 AD, one of the oldest in the Islamic world',
-                'Contains 73 rooms across three floors',
-                'The watchtower offers panoramic views over the city and sea',
-                'One of the best-preserved ribats in the Maghreb',
-                'The Great Mosque is one of Tunisia\'s oldest, built in 850 AD',
-                'Sousse was an important Byzantine city before the Arab conquest'
-            ],
-            'visitor_tips': [
-                'Climb the ribat\'s watchtower for spectacular 360-degree views',
-                'Visit the archaeological museum housed in the medina',
-                'Explore the traditional souks for local crafts and textiles',
-                'Respect prayer times at the Great Mosque',
-                'The ribat\'s stark architecture contrasts beautifully with ornate mosques',
-                'Combine with beach time at nearby resorts',
-                'Early morning visits offer best lighting for photography'
-            ],
-            'photos': [
-                'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-            ],
-            'coordinates': '35.8256° N, 10.6411° E',
-            'annual_visitors': '400,000',
-            'unesco_status': 'UNESCO World Heritage Site since 1988',
-            'climate': 'Mediterranean climate'
-        },
-
-        'hammamet': {
-            'id': 'hammamet',
-            'name': 'Hammamet',
-            'location': 'Hammamet, Tunisia',
-            'description': 'Tunisia\'s premier beach resort destination with beautiful Mediterranean beaches, historic medina, and vibrant gardens.',
-            'long_description': 'Hammamet is Tunisia\'s oldest and most prestigious beach resort, combining beautiful sandy Mediterranean beaches with a charming historic medina. The town offers a perfect blend of relaxation and culture, featuring luxury resorts, the picturesque Hammamet Medina with its 15th-century walls, the stunning Kasbah overlooking the sea, and beautiful gardens including those created by Romanian millionaire George Sebastian in the 1920s. The town has attracted artists, writers, and celebrities for decades.',
-            'historical_significance': 'Hammamet\'s medina dates to the 15th century. The town became an international resort destination in the 1920s when wealthy Europeans built villas here.',
-            'cultural_impact': 'Hammamet pioneered Tunisian tourism and remains the country\'s most famous beach destination, balancing modern tourism with historical preservation.',
-            'best_time_to_visit': 'May to October for beach weather; April and November for sightseeing without crowds',
-            'how_to_get_there': 'Located 65km south of Tunis; accessible by taxi, bus (1.5 hours), or hotel transfers from Tunis-Carthage Airport',
-            'entrance_fees': 'Beaches generally free; Hammamet Medina 2 TND; Kasbah 5 TND',
-            'opening_hours': 'Beaches 24/7; Medina 8:00 AM - 8:00 PM; Kasbah 8:00 AM - 6:00 PM',
-            'what_to_wear': 'Beach attire for hotels and beaches; modest casual clothing for medina visits',
-            'guided_tours': 'Walking tours of old medina available; boat trips and water sports at beach',
-            'nearby_attractions': ['Hammamet Medina', 'Kasbah', 'Sebastian Villa & Theater', 'Yasmine Hammamet Marina', 'Nabeul'],
-            'facts': [
-                'Tunisia\'s oldest beach resort, established in the 1920s',
-                'The medina is surrounded by 15th-century fortified walls',
-                'Home to over 50 luxury hotels and resorts',
-                'The Kasbah offers stunning panoramic sea views',
-                'George Sebastian\'s villa hosted celebrities like Winston Churchill',
-                'Annual Hammamet International Cultural Festival in July-August',
-                'Name derives from Arabic "hammam" meaning bath'
-            ],
-            'visitor_tips': [
-                'Visit the medina early morning before tourist groups arrive',
-                'Climb the Kasbah walls for spectacular sea and town views',
-                'Explore Yasmine Hammamet for modern marina and restaurants',
-                'Try fresh seafood at beachfront restaurants',
-                'Visit nearby Nabeul for Friday market and pottery',
-                'Water sports and boat trips available at main beaches',
-                'Combine beach relaxation with cultural sightseeing'
-            ],
-            'photos': [
-                'https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-            ],
-            'coordinates': '36.4000° N, 10.6167° E',
-            'annual_visitors': '2,000,000',
-            'climate': 'Mediterranean climate with hot dry summers',
-            'beaches': 'Multiple sandy beaches with clear blue waters'
-        },
-
-        'tozeur': {
-            'id': 'tozeur',
-            'name': 'Tozeur Oasis',
-            'location': 'Tozeur, Tunisia',
-            'description': 'A stunning desert oasis with 400,000 date palms, distinctive Islamic architecture, and gateway to the Sahara.',
-            'long_description': 'Tozeur is a breathtaking desert oasis town and the main gateway to the Tunisian Sahara. The town features beautiful Islamic architecture with distinctive geometric yellowish-brown brick patterns unique to the region, lush palm groves containing over 400,000 date palms, and proximity to spectacular desert landscapes. Tozeur serves as the base for exploring mountain oases (Chebika, Tamerza, Mides), the vast Chott el Djerid salt lake, and numerous Star Wars filming locations.',
-            'historical_significance': 'Tozeur has been an important oasis town on trans-Saharan trade routes for over a thousand years, serving as a commercial and religious center.',
-            'cultural_impact': 'The town represents traditional Saharan oasis culture and features unique desert architecture that has been preserved and promoted.',
-            'best_time_to_visit': 'November to March for comfortable desert temperatures; avoid extreme summer heat',
-            'how_to_get_there': 'Tozeur-Nefta International Airport with flights from Tunis; also accessible by bus from Tunis (7-8 hours)',
-            'entrance_fees': 'Old medina free; palmerie tours 5-10 TND; excursions vary (50-150 TND)',
-            'opening_hours': 'Town accessible 24/7; shops typically 9:00 AM - 7:00 PM; excursions during daylight',
-            'what_to_wear': 'Light breathable desert clothing; layers for cooler evenings; sun protection essential',
-            'guided_tours': '4x4 desert excursions highly recommended; palmerie tours by horse carriage; full-day mountain oases tours',
-            'nearby_attractions': ['Chebika Oasis', 'Chott el Djerid', 'Tamerza Canyon', 'Mides Canyon', 'Onk Jemal Star Wars set'],
-            'facts': [
-                'Contains over 400,000 date palms producing finest deglet nour dates',
-                'Features unique geometric brickwork architecture called "tozeur-style"',
-                'Chott el Djerid nearby is one of Africa\'s largest salt lakes',
-                'Multiple Star Wars filming locations within day trip distance',
-                'The palmerie (palm grove) covers 1,000 hectares',
-                'Ancient irrigation system dates back over 1,000 years',
-                'Tozeur dates are exported worldwide as premium variety'
-            ],
-            'visitor_tips': [
-                'Book 4x4 excursions to mountain oases (Chebika, Tamerza, Mides)',
-                'Explore the palmerie by foot, bicycle, or traditional horse carriage',
-                'Try deglet nour dates - considered world\'s finest',
-                'Visit old medina for unique geometric brick architecture',
-                'Sunrise and sunset at Chott el Djerid are spectacular',
-                'Star Wars fans can visit multiple filming locations',
-                'Stay overnight to experience desert atmosphere'
-            ],
-            'photos': [
-                'https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80',
-                'https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80'
-            ],
-            'coordinates': '33.9197° N, 8.1339° E',
-            'annual_visitors': '250,000',
-            'climate': 'Desert climate - extremely hot in summer, mild in winter',
-            'special_features': 'Gateway to Star Wars filming locations'
-        }
-    },
-
-    'algeria': {
-        'algiers-casbah': {
-            'id': 'algiers-casbah',
-            'name': 'Algiers Casbah',
-            'location': 'Algiers, Algeria',
-            'description': 'Explore the historic Casbah of Algiers, a UNESCO World Heritage Site and labyrinth of Ottoman and Moorish architecture.',
-            'long_description': 'The Casbah of Algiers is a historic quarter that served as the center of the Ottoman Regency of Algiers and a stronghold for the Barbary pirates. This UNESCO World Heritage Site features a maze of narrow streets, whitewashed houses, and stunning mosques. The Casbah played a crucial role in Algerian history and represents the architectural blend of Ottoman, Moorish, and local influences.',
-            'historical_significance': 'Founded in the 16th century, the Casbah was the political and military center of the Ottoman Regency and later became a symbol of Algerian resistance during the independence struggle.',
-            'cultural_impact': 'The Casbah represents Algerian cultural identity and Islamic architectural heritage. It has inspired countless works of art and literature.',
-            'best_time_to_visit': 'April to June or September to November (mild weather)',
-            'how_to_get_there': 'Located in central Algiers; accessible by taxi or walking from the city center',
-            'entrance_fees': 'Free to explore; small fees for some museums or guided tours',
-            'opening_hours': '24/7 access to streets; museums have specific hours',
-            'what_to_wear': 'Modest clothing; comfortable walking shoes; light layers',
-            'guided_tours': 'Highly recommended due to the complex layout',
-            'nearby_attractions': ['Ketchaoua Mosque', 'Algerian Museum of Popular Arts', 'Dar Hassan Pacha', 'Pines Beach'],
-            'facts': [
-                'UNESCO World Heritage Site since 1992',
-                'Contains over 1,000 monuments and historic buildings',
-                'Features a complex network of over 800 streets',
-                'Served as headquarters for Barbary pirates in the 16th-19th centuries',
-                'Played a key role in the Algerian War of Independence'
-            ],
-            'visitor_tips': [
-                'Get a good map or guide to navigate the labyrinthine streets',
-                'Visit early morning to experience local life',
-                'Respect the residential nature of the area',
-                'Try traditional Algerian pastries at local bakeries',
-                'Be mindful of the area\'s historical significance'
-            ],
-            'photos': [
-                '/static/core/images/casbah-algiers.jpg',
-                '/static/core/images/casbah-streets.jpg',
-                '/static/core/images/casbah-mosque.jpg',
-                '/static/core/images/casbah-architecture.jpg',
-                '/static/core/images/casbah-view.jpg',
-                '/static/core/images/casbah-market.jpg',
-                '/static/core/images/casbah-algeria.jpg',
-                '/static/core/images/casbah-historic.jpg'
-            ],
-            'coordinates': {'lat': 36.7833, 'lng': 3.0500},
-            'annual_visitors': 400000,
-            'climate': 'Mediterranean climate with mild, wet winters and hot, dry summers',
-            'discovery': 'Preserved as a living historic district throughout centuries',
-            'architecture': 'Ottoman and Moorish architectural styles with local adaptations',
-            'conservation': 'Ongoing restoration projects to preserve historic buildings',
-            'health_safety': 'Generally safe for tourists; respect local customs; watch for uneven streets',
-            'key_sites': ['Ketchaoua Mosque', 'Dar Aziza', 'Palais de la Marine', 'Citadel'],
-            'image': '/static/core/images/casbah-algiers.jpg'
-        },
-
-        'timgad-roman-ruins': {
-            'id': 'timgad-roman-ruins',
-            'name': 'Timgad Roman Ruins',
-            'location': 'Timgad, Algeria',
-            'description': 'Discover the remarkably well-preserved Roman city of Timgad, a UNESCO World Heritage Site showcasing Roman urban planning.',
-            'long_description': 'Timgad is one of the best-preserved Roman cities in North Africa, founded as a military colony by Emperor Trajan in 100 AD. This UNESCO World Heritage Site features an extraordinary grid-pattern layout with well-preserved theaters, temples, and public buildings. The city\'s remarkable state of preservation provides an unparalleled glimpse into Roman urban life in antiquity.',
-            'historical_significance': 'Founded in 100 AD as a colony for Roman veterans, Timgad became a prosperous city and center of Roman culture in North Africa.',
-            'cultural_impact': 'Timgad represents the extent of Roman influence in North Africa and the sophistication of Roman urban planning.',
-            'best_time_to_visit': 'March to May or September to November (comfortable temperatures)',
-            'how_to_get_there': 'Located 35km east of Batna; accessible by taxi or organized tours',
-            'entrance_fees': '500 DZD (about $4 USD) for adults',
-            'opening_hours': '8:00 AM - 6:00 PM daily (until 5:00 PM in winter)',
-            'what_to_wear': 'Comfortable walking shoes; hat and sunscreen; light clothing',
-            'guided_tours': 'Highly recommended; audio guides available',
-            'nearby_attractions': ['Lambaesis Roman Site', 'Aurès Mountains', 'Roman Museum', 'Batna City'],
-            'facts': [
-                'Founded in 100 AD by Emperor Trajan',
-                'Features one of the best-preserved Roman city grids',
-                'UNESCO World Heritage Site since 1982',
-                'Contains a remarkably preserved theater and library',
-                'Abandoned after Arab conquest in the 7th century'
-            ],
-            'visitor_tips': [
-                'The site is large and spread out; plan for several hours',
-                'Wear comfortable shoes for walking over uneven terrain',
-                'Visit early morning to avoid heat and crowds',
-                'Bring water and sun protection',
-                'The theater still has excellent acoustics'
-            ],
-            'photos': [
-                '/static/core/images/timgad-ruins.jpg',
-                '/static/core/images/timgad-theater.jpg',
-                '/static/core/images/timgad-library.jpg',
-                '/static/core/images/timgad-columns.jpg',
-                '/static/core/images/timgad-arch.jpg',
-                '/static/core/images/timgad-museum.jpg',
-                '/static/core/images/timgad-algeria.jpg',
-                '/static/core/images/timgad-roman.jpg'
-            ],
-            'coordinates': {'lat': 35.4833, 'lng': 6.4667},
-            'annual_visitors': 100000,
-            'climate': 'Mediterranean climate with continental influences',
-            'discovery': 'Excavated by French archaeologists in the 19th century',
-            'architecture': 'Classic Roman urban planning with North African adaptations',
-            'conservation': 'Protected archaeological site with ongoing preservation',
-            'health_safety': 'Watch for uneven terrain; stay on marked paths; heat awareness',
-            'key_sites': ['Roman Theater', 'Library', 'Capitoline Temple', 'Arch of Trajan'],
-            'image': '/static/core/images/timgad-ruins.jpg'
-        },
-
-        'djémila-roman-ruins': {
-            'id': 'djémila-roman-ruins',
-            'name': 'Djémila Roman Ruins',
-            'location': 'Djémila, Algeria',
-            'description': 'Explore the mountain-top Roman city of Djémila, a UNESCO World Heritage Site with stunning architecture and natural beauty.',
-            'long_description': 'Djémila, also known as Cuicul, is a mountain-top Roman city founded in the 1st century AD. This UNESCO World Heritage Site features remarkably well-preserved Roman architecture set against a stunning mountainous backdrop. The city\'s forum, temples, and public buildings provide insight into Roman provincial life, while the surrounding landscape adds to its dramatic beauty.',
-            'historical_significance': 'Founded in the 1st century AD, Djémila was an important Roman city in the province of Numidia and later became a center of early Christianity.',
-            'cultural_impact': 'Djémila represents the Roman presence in North Africa and the blend of Roman and local cultures in the region.',
-            'best_time_to_visit': 'April to June or September to October (mild weather, good visibility)',
-            'how_to_get_there': 'Located 50km northwest of Sétif; accessible by taxi or organized tours',
-            'entrance_fees': '500 DZD (about $4 USD) for adults',
-            'opening_hours': '8:00 AM - 6:00 PM daily (until 5:00 PM in winter)',
-            'what_to_wear': 'Comfortable walking shoes; layers for changing mountain weather; sun protection',
-            'guided_tours': 'Highly recommended for historical context',
-            'nearby_attractions': ['Sétif Museum', 'Aurès Mountains', 'Roman Road Network', 'Berber Villages'],
-            'facts': [
-                'Founded in the 1st century AD on a mountain plateau',
-                'UNESCO World Heritage Site since 1982',
-                'Features one of the best-preserved Roman forums in North Africa',
-                'Contains early Christian basilicas from the 4th-5th centuries',
-                'Located at an altitude of 900 meters above sea level'
-            ],
-            'visitor_tips': [
-                'The mountain location provides cooler temperatures',
-                'Wear sturdy shoes for the uphill approach to the site',
-                'Visit early morning for the best light and fewer crowds',
-                'The views of the surrounding mountains are spectacular',
-                'Bring water and snacks for the full exploration'
-            ],
-            'photos': [
-                '/static/core/images/djemila-ruins.jpg',
-                '/static/core/images/djemila-forum.jpg',
-                '/static/core/images/djemila-temple.jpg',
-                '/static/core/images/djemila-mountains.jpg',
-                '/static/core/images/djemila-theater.jpg',
-                '/static/core/images/djemila-arch.jpg',
-                '/static/core/images/djemila-algeria.jpg',
-                '/static/core/images/djemila-roman.jpg'
-            ],
-            'coordinates': {'lat': 36.3200, 'lng': 5.7367},
-            'annual_visitors': 80000,
-            'climate': 'Mountain climate with cooler temperatures than coastal areas',
-            'discovery': 'Excavated by French archaeologists beginning in 1909',
-            'architecture': 'Roman provincial architecture adapted to mountain terrain',
-            'conservation': 'Protected archaeological site with preservation efforts',
-            'health_safety': 'Mountain paths can be steep; watch for uneven terrain; altitude awareness',
-            'key_sites': ['Roman Forum', 'North Temple', 'Christian Basilica', 'Theater'],
-            'image': '/static/core/images/djemila-ruins.jpg'
-        },
-
-        'tassili-najjer': {
-            'id': 'tassili-najjer',
-            'name': 'Tassili n\'Ajjer National Park',
-            'location': 'Tassili n\'Ajjer, Algeria',
-            'description': 'Discover the prehistoric rock art and stunning desert landscapes of Tassili n\'Ajjer, a UNESCO World Heritage Site.',
-            'long_description': 'Tassili n\'Ajjer is a vast desert plateau featuring one of the most important collections of prehistoric rock art in the world. This UNESCO World Heritage Site contains thousands of engravings and paintings dating back over 8,000 years, depicting animals, humans, and daily life in the Sahara before it became a desert. The dramatic rock formations and archaeological sites make it a unique destination.',
-            'historical_significance': 'The rock art dates back to the Neolithic period and provides evidence of early human habitation in the Sahara when it was a savanna.',
-            'cultural_impact': 'Tassili n\'Ajjer represents the prehistoric heritage of North Africa and the transition from hunting-gathering to agricultural societies.',
-            'best_time_to_visit': 'November to March (cooler desert temperatures)',
-            'how_to_get_there': 'Located 1,500km southeast of Algiers; accessible by organized expeditions or flights to Djanet',
-            'entrance_fees': 'Varies; permits required for certain areas',
-            'opening_hours': '24/7 access with guided tours',
-            'what_to_wear': 'Desert-appropriate clothing; warm layers for nights; sturdy boots',
-            'guided_tours': 'Essential for safety and cultural understanding; multi-day expeditions recommended',
-            'nearby_attractions': ['Djanet Oasis', 'Rock Art Sites', 'Desert Landscapes', 'Nomadic Camps'],
-            'facts': [
-                'Contains over 15,000 rock engravings and paintings',
-                'UNESCO World Heritage Site since 1982',
-                'Art dates back over 8,000 years to the Neolithic period',
-                'Depicts the transition from savanna to desert environment',
-                'Features unique mushroom-shaped rock formations'
-            ],
-            'visitor_tips': [
-                'Join organized expeditions for safety in remote areas',
-                'Respect the sacred nature of rock art sites',
-                'Stay hydrated and prepared for extreme desert conditions',
-                'Visit during cooler months to avoid extreme heat',
-                'Learn about Tuareg culture and desert survival techniques'
-            ],
-            'photos': [
-                '/static/core/images/tassili-rock-art.jpg',
-                '/static/core/images/tassili-desert.jpg',
-                '/static/core/images/tassili-formations.jpg',
-                '/static/core/images/tassili-canyon.jpg',
-                '/static/core/images/tassili-arch.jpg',
-                '/static/core/images/tassili-tuareg.jpg',
-                '/static/core/images/tassili-algeria.jpg',
-                '/static/core/images/tassili-prehistoric.jpg'
-            ],
-            'coordinates': {'lat': 25.0000, 'lng': 8.0000},
-            'annual_visitors': 50000,
-            'climate': 'Extreme desert climate with very hot days and cold nights',
-            'discovery': 'Rock art discovered by European explorers in the 19th century',
-            'architecture': 'Natural rock formations and prehistoric archaeological sites',
-            'conservation': 'Protected national park with restrictions on access to sensitive areas',
-            'health_safety': 'Remote desert location requires experienced guides; extreme temperatures',
-            'key_sites': ['Sefar Rock Art', 'Tin Tarabin', 'Iheren Rock Formations', 'Oued Djerat Canyon'],
-            'image': '/static/core/images/tassili-rock-art.jpg'
-        },
-
-        'constantine-bridges': {
-            'id': 'constantine-bridges',
-            'name': 'Constantine Historic City',
-            'location': 'Constantine, Algeria',
-            'description': 'Explore Constantine, the city of bridges, featuring stunning gorges, Ottoman architecture, and Roman history.',
-            'long_description': 'Constantine is Algeria\'s third-largest city, dramatically situated on a rocky plateau overlooking the Rhumel River gorge. Known as "The City of Bridges," it features stunning Islamic and Ottoman architecture, Roman ruins, and a vibrant medina. The city\'s unique geography and rich history make it one of Algeria\'s most fascinating destinations.',
-            'historical_significance': 'Founded as Cirta by Phoenicians, Constantine became an important Roman city and later a center of Islamic learning and Ottoman administration.',
-            'cultural_impact': 'Constantine represents the cultural diversity of Algeria, blending Phoenician, Roman, Islamic, and French influences.',
-            'best_time_to_visit': 'April to June or September to November (mild weather)',
-            'how_to_get_there': 'Located 400km east of Algiers; accessible by train, bus, or domestic flight',
-            'entrance_fees': 'Free for most areas; small fees for museums and historic sites',
-            'opening_hours': 'Varies by site; medina accessible 24/7',
-            'what_to_wear': 'Comfortable clothing; modest dress for religious sites',
-            'guided_tours': 'Recommended for navigating the complex layout and history',
-            'nearby_attractions': ['Rhumel Gorge', 'Ahmed Bey Palace', 'Constantine Museum', 'Sidi M\'Cid Bridge'],
-            'facts': [
-                'Founded as Cirta by Phoenicians around 203 BC',
-                'Known as "City of Bridges" with 17 bridges spanning the gorge',
-                'UNESCO tentative World Heritage Site',
-                'Features the longest bridge in Algeria (Sidi M\'Cid)',
-                'Home to one of the oldest universities in the world'
-            ],
-            'visitor_tips': [
-                'Take the cable car for stunning views of the gorge',
-                'Explore the medina on foot for authentic experiences',
-                'Visit the Ahmed Bey Palace for Ottoman architecture',
-                'Try Constantine\'s famous sweets and pastries',
-                'Be prepared for steep streets and stairs'
-            ],
-            'photos': [
-                '/static/core/images/constantine-gorge.jpg',
-                '/static/core/images/constantine-bridge.jpg',
-                '/static/core/images/constantine-medina.jpg',
-                '/static/core/images/constantine-palace.jpg',
-                '/static/core/images/constantine-view.jpg',
-                '/static/core/images/constantine-museum.jpg',
-                '/static/core/images/constantine-algeria.jpg',
-                '/static/core/images/constantine-historic.jpg'
-            ],
-            'coordinates': {'lat': 36.3650, 'lng': 6.6147},
-            'annual_visitors': 300000,
-            'climate': 'Mediterranean climate with continental influences',
-            'discovery': 'Ancient city with continuous habitation for over 2,000 years',
-            'architecture': 'Mix of Ottoman, Islamic, and colonial architectural styles',
-            'conservation': 'Ongoing preservation of historic bridges and buildings',
-            'health_safety': 'Watch for steep drops near gorges; respect local customs',
-            'key_sites': ['Sidi M\'Cid Bridge', 'Ahmed Bey Palace', 'Rhumel Gorge', 'Medina'],
-            'image': '/static/core/images/constantine-gorge.jpg'
-        }
-    }
-}
\ No newline at end of file
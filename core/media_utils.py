@@ -0,0 +1,153 @@
+"""
+Media Utility Functions for BedBees
+Reference counting for the content-addressed photo store. Every photo file
+field pointing at a blob holds one reference; a blob's file is deleted once
+its last reference is released.
+"""
+
+from collections import Counter
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .images import DERIVATIVE_WIDTHS
+from .models import AccommodationPhoto, MediaBlob, RentalCarPhoto, TourGuidePhoto, TourPhoto
+from .storage import BLOB_PREFIX, is_blob, media_storage
+
+
+# File fields stored in the content-addressed store, per photo model
+PHOTO_FILE_FIELDS = {
+    AccommodationPhoto: ('original_file', *DERIVATIVE_WIDTHS),
+    TourPhoto: ('original_file', *DERIVATIVE_WIDTHS),
+    TourGuidePhoto: ('original_file',),
+    RentalCarPhoto: ('original_file',),
+}
+
+
+def blob_references(names):
+    """Counter of the blob names among stored file names"""
+    return Counter(name for name in names if is_blob(name))
+
+
+def photo_blob_references(photo):
+    """Counter of the blobs one photo's file fields point at"""
+    return blob_references(
+        getattr(photo, field).name for field in PHOTO_FILE_FIELDS[type(photo)]
+    )
+
+
+def acquire_blobs(references):
+    """
+    Add references to blobs, registering blobs seen for the first time.
+
+    Args:
+        references: Counter of blob name to number of new references
+    """
+    storage = media_storage()
+    for name, count in references.items():
+        if count <= 0:
+            continue
+        with transaction.atomic():
+            blob = MediaBlob.objects.select_for_update().filter(name=name).first()
+            if blob is None:
+                size = storage.size(name) if storage.exists(name) else 0
+                MediaBlob.objects.create(name=name, size=size, ref_count=count)
+            else:
+                MediaBlob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') + count)
+
+
+# Files younger than this are left alone by reconcile_blobs; they may belong
+# to an upload whose transaction has not committed yet
+ORPHAN_GRACE_PERIOD = timedelta(hours=1)
+
+
+def delete_unreferenced_blobs(names):
+    """Delete the files of blobs that have no MediaBlob row"""
+    storage = media_storage()
+    for name in set(names):
+        # A new upload of the same bytes may have registered the blob meanwhile
+        if is_blob(name) and not MediaBlob.objects.filter(name=name).exists():
+            storage.delete(name)
+
+
+def release_blobs(references):
+    """
+    Drop references to blobs, deleting any blob left unreferenced once the
+    current transaction commits.
+
+    Args:
+        references: Counter of blob name to number of released references
+    """
+    for name, count in references.items():
+        if count <= 0:
+            continue
+        with transaction.atomic():
+            blob = MediaBlob.objects.select_for_update().filter(name=name).first()
+            if blob is None:
+                continue
+            if blob.ref_count <= count:
+                blob.delete()
+                transaction.on_commit(lambda name=name: delete_unreferenced_blobs([name]))
+            else:
+                MediaBlob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') - count)
+
+
+def _stored_blob_names(storage, directory=BLOB_PREFIX.rstrip('/')):
+    if not storage.exists(directory):
+        return
+    directories, files = storage.listdir(directory)
+    for name in files:
+        yield f'{directory}/{name}'
+    for child in directories:
+        yield from _stored_blob_names(storage, f'{directory}/{child}')
+
+
+def reconcile_blobs(dry_run=False):
+    """
+    Recompute every blob's reference count from the photo file fields and
+    delete blob files nothing points at, repairing counts left wrong by
+    failures or by updates that bypassed the signals.
+
+    Args:
+        dry_run: Report what would change without changing anything
+
+    Returns:
+        Dict with the number of "corrected" counts, "removed" rows of
+        unreferenced blobs and "deleted" orphan files.
+    """
+    references = Counter()
+    for model, fields in PHOTO_FILE_FIELDS.items():
+        for row in model.objects.values_list(*fields).iterator():
+            references.update(blob_references(row))
+
+    storage = media_storage()
+    corrected = removed = 0
+    with transaction.atomic():
+        blobs = {blob.name: blob for blob in MediaBlob.objects.select_for_update()}
+        for name, blob in blobs.items():
+            if name not in references:
+                removed += 1
+                if not dry_run:
+                    blob.delete()
+            elif blob.ref_count != references[name]:
+                corrected += 1
+                if not dry_run:
+                    MediaBlob.objects.filter(pk=blob.pk).update(ref_count=references[name])
+        for name in references.keys() - blobs.keys():
+            corrected += 1
+            if not dry_run:
+                size = storage.size(name) if storage.exists(name) else 0
+                MediaBlob.objects.create(name=name, size=size, ref_count=references[name])
+
+    deleted = 0
+    cutoff = timezone.now() - ORPHAN_GRACE_PERIOD
+    for name in _stored_blob_names(storage):
+        if name in references or storage.get_modified_time(name) > cutoff:
+            continue
+        deleted += 1
+        if not dry_run:
+            storage.delete(name)
+
+    return {'corrected': corrected, 'removed': removed, 'deleted': deleted}
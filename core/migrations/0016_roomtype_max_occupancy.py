@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-17 20:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_accommodation_approved_at_accommodation_approved_by_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='roomtype',
+            name='max_occupancy',
+            field=models.IntegerField(blank=True, help_text='Maximum guests per unit (blank means one unit per booking)', null=True),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-17 20:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_roomtype_max_occupancy'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyRate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('min_stay', models.IntegerField(default=1)),
+                ('is_available', models.BooleanField(default=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('accommodation', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='daily_rates', to='core.accommodation')),
+                ('tour', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='daily_rates', to='core.tour')),
+            ],
+            options={
+                'ordering': ['date'],
+                'unique_together': {('accommodation', 'date'), ('tour', 'date')},
+            },
+        ),
+    ]
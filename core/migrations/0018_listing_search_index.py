@@ -0,0 +1,84 @@
+# Full-text search index for accommodations and tours (see core/search_index.py)
+
+from django.db import migrations
+
+
+SEARCH_FIELDS = {
+    'core_accommodation': [
+        ('property_name', 'A'),
+        ('city', 'A'),
+        ('country', 'A'),
+        ('tagline', 'B'),
+        ('amenities', 'C'),
+        ('nearby_landmarks', 'C'),
+        ('full_description', 'D'),
+    ],
+    'core_tour': [
+        ('tour_name', 'A'),
+        ('city', 'A'),
+        ('country', 'A'),
+        ('tagline', 'B'),
+        ('highlights', 'C'),
+        ('inclusions', 'C'),
+        ('meeting_point', 'C'),
+        ('full_description', 'D'),
+        ('itinerary', 'D'),
+    ],
+}
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    for table, fields in SEARCH_FIELDS.items():
+        columns = ', '.join(field for field, _ in fields)
+        values = ', '.join(f"COALESCE({field}, '')" for field, _ in fields)
+
+        if vendor == 'sqlite':
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE {table}_fts USING fts5("
+                f"{columns}, tokenize='unicode61 remove_diacritics 2')"
+            )
+            schema_editor.execute(
+                f"INSERT INTO {table}_fts (rowid, {columns}) "
+                f"SELECT id, {values} "
+                f"FROM {table} WHERE is_published AND is_active"
+            )
+        elif vendor == 'postgresql':
+            document = ' || '.join(
+                f"setweight(to_tsvector('simple', COALESCE({field}, '')), '{weight}')"
+                for field, weight in fields
+            )
+            schema_editor.execute(
+                f"CREATE TABLE {table}_search ("
+                f"listing_id bigint PRIMARY KEY REFERENCES {table} (id) ON DELETE CASCADE, "
+                f"document tsvector NOT NULL)"
+            )
+            schema_editor.execute(
+                f"CREATE INDEX {table}_search_document_gin ON {table}_search USING GIN (document)"
+            )
+            schema_editor.execute(
+                f"INSERT INTO {table}_search (listing_id, document) "
+                f"SELECT id, {document} FROM {table} WHERE is_published AND is_active"
+            )
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    for table in SEARCH_FIELDS:
+        if vendor == 'sqlite':
+            schema_editor.execute(f"DROP TABLE IF EXISTS {table}_fts")
+        elif vendor == 'postgresql':
+            schema_editor.execute(f"DROP TABLE IF EXISTS {table}_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_dailyrate'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
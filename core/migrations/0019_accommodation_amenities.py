@@ -0,0 +1,100 @@
+# Generated by Django 5.2.6 on 2026-10-17 20:16
+
+import ast
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def _parse_amenities(value):
+    """Frozen copy of core.models.parse_amenities"""
+    if not value:
+        return []
+    if value.startswith('[') and value.endswith(']'):
+        try:
+            parsed = ast.literal_eval(value)
+            if isinstance(parsed, list):
+                value = ','.join(str(item) for item in parsed)
+        except (ValueError, SyntaxError):
+            pass
+    names = []
+    for name in value.split(','):
+        name = name.strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def backfill_amenity_links(apps, schema_editor):
+    """Split every existing amenities string into Amenity rows and links"""
+    Accommodation = apps.get_model('core', 'Accommodation')
+    Amenity = apps.get_model('core', 'Amenity')
+    AccommodationAmenity = apps.get_model('core', 'AccommodationAmenity')
+
+    parsed = {
+        accommodation_id: _parse_amenities(amenities)
+        for accommodation_id, amenities in Accommodation.objects.exclude(amenities__isnull=True)
+        .exclude(amenities='')
+        .values_list('id', 'amenities')
+    }
+
+    names = sorted({name for names in parsed.values() for name in names})
+    Amenity.objects.bulk_create([Amenity(name=name) for name in names], ignore_conflicts=True)
+    amenity_ids = dict(Amenity.objects.values_list('name', 'id'))
+
+    AccommodationAmenity.objects.bulk_create(
+        [
+            AccommodationAmenity(accommodation_id=accommodation_id, amenity_id=amenity_ids[name], position=position)
+            for accommodation_id, names in parsed.items()
+            for position, name in enumerate(names)
+        ],
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_listing_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Amenity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Amenities',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AccommodationAmenity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('accommodation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='amenity_links', to='core.accommodation')),
+                ('amenity', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='accommodation_links', to='core.amenity')),
+            ],
+            options={
+                'ordering': ['position'],
+            },
+        ),
+        migrations.AddField(
+            model_name='accommodation',
+            name='amenity_tags',
+            field=models.ManyToManyField(blank=True, related_name='accommodations', through='core.AccommodationAmenity', to='core.amenity'),
+        ),
+        migrations.AddIndex(
+            model_name='accommodationamenity',
+            index=models.Index(fields=['amenity', 'accommodation'], name='core_accomm_amenity_ad3caf_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='accommodationamenity',
+            unique_together={('accommodation', 'amenity')},
+        ),
+        migrations.RunPython(backfill_amenity_links, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.6 on 2026-10-17 20:18
+
+from django.db import migrations, models
+
+
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def _encode_geohash(latitude, longitude, precision=7):
+    """Frozen copy of core.geo_utils.encode_geohash"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    geohash = []
+    bits = bit_count = 0
+    even = True
+    while len(geohash) < precision:
+        value, bounds = (float(longitude), lng_range) if even else (float(latitude), lat_range)
+        middle = (bounds[0] + bounds[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            bounds[0] = middle
+        else:
+            bounds[1] = middle
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(_BASE32[bits])
+            bits = bit_count = 0
+    return ''.join(geohash)
+
+
+def backfill_geo_cells(apps, schema_editor):
+    """Compute the geohash cell of every accommodation with coordinates"""
+    Accommodation = apps.get_model('core', 'Accommodation')
+    accommodations = list(
+        Accommodation.objects.filter(latitude__isnull=False, longitude__isnull=False).only('id', 'latitude', 'longitude')
+    )
+    for accommodation in accommodations:
+        accommodation.geo_cell = _encode_geohash(accommodation.latitude, accommodation.longitude)
+    Accommodation.objects.bulk_update(accommodations, ['geo_cell'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_accommodation_amenities'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accommodation',
+            name='geo_cell',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Geohash of latitude/longitude, kept in sync on save', max_length=12, null=True),
+        ),
+        migrations.RunPython(backfill_geo_cells, migrations.RunPython.noop),
+    ]
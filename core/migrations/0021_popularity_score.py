@@ -0,0 +1,42 @@
+# Generated by Django 5.2.6 on 2026-10-17 20:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_accommodation_geo_cell'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accommodation',
+            name='popularity_score',
+            field=models.FloatField(default=0, editable=False, help_text='Forward-decayed booking score, maintained by update_popularity'),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='popularity_scored_at',
+            field=models.DateTimeField(blank=True, help_text='When update_popularity counted this booking', null=True),
+        ),
+        migrations.AddField(
+            model_name='tour',
+            name='popularity_score',
+            field=models.FloatField(default=0, editable=False, help_text='Forward-decayed booking score, maintained by update_popularity'),
+        ),
+        migrations.AddIndex(
+            model_name='accommodation',
+            index=models.Index(fields=['popularity_score', 'id'], name='core_accomm_popular_e6eaea_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', 'popularity_scored_at'], name='core_bookin_status_b28a7b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tour',
+            index=models.Index(fields=['popularity_score', 'id'], name='core_tour_popular_4d14c2_idx'),
+        ),
+    ]
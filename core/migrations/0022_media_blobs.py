@@ -0,0 +1,98 @@
+# Generated by Django 5.2.6 on 2026-10-17 20:33
+
+import core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_popularity_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('size', models.BigIntegerField(default=0)),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Media Blob',
+                'verbose_name_plural': 'Media Blobs',
+            },
+        ),
+        migrations.AlterField(
+            model_name='accommodationphoto',
+            name='large',
+            field=models.ImageField(blank=True, null=True, storage=core.storage.media_storage, upload_to='accommodations/gallery/large/'),
+        ),
+        migrations.AlterField(
+            model_name='accommodationphoto',
+            name='medium',
+            field=models.ImageField(blank=True, null=True, storage=core.storage.media_storage, upload_to='accommodations/gallery/medium/'),
+        ),
+        migrations.AlterField(
+            model_name='accommodationphoto',
+            name='original_file',
+            field=models.FileField(storage=core.storage.media_storage, upload_to='accommodations/gallery/%Y/%m/'),
+        ),
+        migrations.AlterField(
+            model_name='accommodationphoto',
+            name='small',
+            field=models.ImageField(blank=True, null=True, storage=core.storage.media_storage, upload_to='accommodations/gallery/small/'),
+        ),
+        migrations.AlterField(
+            model_name='accommodationphoto',
+            name='thumbnail',
+            field=models.ImageField(blank=True, null=True, storage=core.storage.media_storage, upload_to='accommodations/gallery/thumbs/'),
+        ),
+        migrations.AlterField(
+            model_name='accommodationphoto',
+            name='xl',
+            field=models.ImageField(blank=True, null=True, storage=core.storage.media_storage, upload_to='accommodations/gallery/xl/'),
+        ),
+        migrations.AlterField(
+            model_name='rentalcarphoto',
+            name='original_file',
+            field=models.ImageField(storage=core.storage.media_storage, upload_to='rental_cars/gallery/%Y/%m/'),
+        ),
+        migrations.AlterField(
+            model_name='tourguidephoto',
+            name='original_file',
+            field=models.ImageField(storage=core.storage.media_storage, upload_to='tour_guides/gallery/%Y/%m/'),
+        ),
+        migrations.AlterField(
+            model_name='tourphoto',
+            name='large',
+            field=models.ImageField(blank=True, null=True, storage=core.storage.media_storage, upload_to='tours/gallery/large/'),
+        ),
+        migrations.AlterField(
+            model_name='tourphoto',
+            name='medium',
+            field=models.ImageField(blank=True, null=True, storage=core.storage.media_storage, upload_to='tours/gallery/medium/'),
+        ),
+        migrations.AlterField(
+            model_name='tourphoto',
+            name='original_file',
+            field=models.FileField(storage=core.storage.media_storage, upload_to='tours/gallery/%Y/%m/'),
+        ),
+        migrations.AlterField(
+            model_name='tourphoto',
+            name='small',
+            field=models.ImageField(blank=True, null=True, storage=core.storage.media_storage, upload_to='tours/gallery/small/'),
+        ),
+        migrations.AlterField(
+            model_name='tourphoto',
+            name='thumbnail',
+            field=models.ImageField(blank=True, null=True, storage=core.storage.media_storage, upload_to='tours/gallery/thumbs/'),
+        ),
+        migrations.AlterField(
+            model_name='tourphoto',
+            name='xl',
+            field=models.ImageField(blank=True, null=True, storage=core.storage.media_storage, upload_to='tours/gallery/xl/'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-17 20:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_media_blobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accommodationphoto',
+            name='placeholder',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='tourphoto',
+            name='placeholder',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-17 21:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_photo_placeholders'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='amenity',
+            name='name',
+            field=models.CharField(max_length=500, unique=True),
+        ),
+    ]
@@ -4,6 +4,8 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 import pytz
 from slugify import slugify
+from .storage import media_storage
+from .image_cache import photo_srcset
 
 # Create your models here.
 
@@ -1815,6 +1817,7 @@ class Accommodation(models.Model):
     street_address = models.CharField(max_length=255)
     latitude = models.DecimalField(max_digits=9, decimal_places=6, blank=True, null=True)
     longitude = models.DecimalField(max_digits=9, decimal_places=6, blank=True, null=True)
+    geo_cell = models.CharField(max_length=12, blank=True, null=True, db_index=True, editable=False, help_text="Geohash of latitude/longitude, kept in sync on save")
 
     # Capacity
     num_rooms = models.IntegerField()
@@ -1834,6 +1837,7 @@ class Accommodation(models.Model):
 
     # Amenities (stored as JSON or comma-separated)
     amenities = models.CharField(max_length=500, blank=True, null=True, help_text="Comma-separated amenities")
+    amenity_tags = models.ManyToManyField('Amenity', through='AccommodationAmenity', blank=True, related_name='accommodations')
 
     # Pricing
     base_price = models.DecimalField(max_digits=10, decimal_places=2)
@@ -1865,6 +1869,9 @@ class Accommodation(models.Model):
     rejection_reason = models.TextField(blank=True, null=True)
     requires_approval = models.BooleanField(default=False, help_text="Set to True if listing needs admin approval after edits")
 
+    # Popularity (see core.popularity_utils)
+    popularity_score = models.FloatField(default=0, editable=False, help_text="Forward-decayed booking score, maintained by update_popularity")
+
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -1873,27 +1880,29 @@ class Accommodation(models.Model):
         return f"{self.property_name} - {self.city}, {self.country}"
 
     def get_amenities_list(self):
-        """Parse amenities from comma-separated string to list"""
-        if not self.amenities:
-            return []
-        
-        # Handle case where amenities is stored as string representation of list
-        # e.g., "['Free WiFi,Cable TV,Parking']"
-        if self.amenities.startswith('[') and self.amenities.endswith(']'):
-            try:
-                import ast
-                parsed = ast.literal_eval(self.amenities)
-                if isinstance(parsed, list):
-                    # If it's a list with one comma-separated string, split it
-                    if len(parsed) == 1 and ',' in parsed[0]:
-                        return [amenity.strip() for amenity in parsed[0].split(',') if amenity.strip()]
-                    # If it's already a proper list, return it
-                    return [str(item).strip() for item in parsed if str(item).strip()]
-            except:
-                pass
-        
-        # Handle normal comma-separated string
-        return [amenity.strip() for amenity in self.amenities.split(',') if amenity.strip()]
+        """
+        Amenity names in the order the host listed them. Uses the links
+        prefetched with prefetch_related('amenity_links__amenity') when
+        present, otherwise one joined query.
+        """
+        if 'amenity_links' in getattr(self, '_prefetched_objects_cache', {}):
+            return [link.amenity.name for link in self.amenity_links.all()]
+        return list(self.amenity_links.values_list('amenity__name', flat=True))
+
+    def sync_amenities(self):
+        """Rebuild the normalized amenity links from the amenities field"""
+        names = parse_amenities(self.amenities)
+        existing = {amenity.name: amenity for amenity in Amenity.objects.filter(name__in=names)}
+        missing = [Amenity(name=name) for name in names if name not in existing]
+        if missing:
+            Amenity.objects.bulk_create(missing, ignore_conflicts=True)
+            existing = {amenity.name: amenity for amenity in Amenity.objects.filter(name__in=names)}
+
+        self.amenity_links.all().delete()
+        AccommodationAmenity.objects.bulk_create([
+            AccommodationAmenity(accommodation=self, amenity=existing[name], position=position)
+            for position, name in enumerate(names)
+        ])
 
     def publish(self):
         """Publish the accommodation listing"""
@@ -1910,6 +1919,67 @@ class Accommodation(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['popularity_score', 'id']),
+        ]
+
+
+def parse_amenities(value):
+    """
+    Split a stored amenities string into unique, stripped names.
+    Also accepts the legacy "['a,b,c']" list representation.
+    """
+    if not value:
+        return []
+
+    if value.startswith('[') and value.endswith(']'):
+        try:
+            import ast
+            parsed = ast.literal_eval(value)
+            if isinstance(parsed, list):
+                value = ','.join(str(item) for item in parsed)
+        except (ValueError, SyntaxError):
+            pass
+
+    names = []
+    for name in value.split(','):
+        name = name.strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+class Amenity(models.Model):
+    """An amenity name shared by every accommodation offering it"""
+    # As long as Accommodation.amenities, so any single name it holds fits
+    name = models.CharField(max_length=500, unique=True)
+
+    class Meta:
+        ordering = ['name']
+        verbose_name_plural = 'Amenities'
+
+    def __str__(self):
+        return self.name
+
+
+class AccommodationAmenity(models.Model):
+    """
+    Normalized link between an accommodation and one of its amenities.
+    Indexed both ways so amenity filters are index lookups instead of LIKE scans.
+    """
+    accommodation = models.ForeignKey(Accommodation, on_delete=models.CASCADE, related_name='amenity_links')
+    amenity = models.ForeignKey(Amenity, on_delete=models.CASCADE, related_name='accommodation_links')
+    position = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ['accommodation', 'amenity']
+        ordering = ['position']
+        indexes = [
+            models.Index(fields=['amenity', 'accommodation']),
+        ]
+
+    def __str__(self):
+        return f"{self.accommodation} - {self.amenity}"
 
 
 class AccommodationPhoto(models.Model):
@@ -1936,12 +2006,12 @@ class AccommodationPhoto(models.Model):
     media_type = models.CharField(max_length=10, choices=MEDIA_TYPES, default='image')
 
     # File fields
-    original_file = models.FileField(upload_to='accommodations/gallery/%Y/%m/')
-    thumbnail = models.ImageField(upload_to='accommodations/gallery/thumbs/', blank=True, null=True)
-    small = models.ImageField(upload_to='accommodations/gallery/small/', blank=True, null=True)
-    medium = models.ImageField(upload_to='accommodations/gallery/medium/', blank=True, null=True)
-    large = models.ImageField(upload_to='accommodations/gallery/large/', blank=True, null=True)
-    xl = models.ImageField(upload_to='accommodations/gallery/xl/', blank=True, null=True)
+    original_file = models.FileField(upload_to='accommodations/gallery/%Y/%m/', storage=media_storage)
+    thumbnail = models.ImageField(upload_to='accommodations/gallery/thumbs/', storage=media_storage, blank=True, null=True)
+    small = models.ImageField(upload_to='accommodations/gallery/small/', storage=media_storage, blank=True, null=True)
+    medium = models.ImageField(upload_to='accommodations/gallery/medium/', storage=media_storage, blank=True, null=True)
+    large = models.ImageField(upload_to='accommodations/gallery/large/', storage=media_storage, blank=True, null=True)
+    xl = models.ImageField(upload_to='accommodations/gallery/xl/', storage=media_storage, blank=True, null=True)
 
     # Metadata
     title = models.CharField(max_length=200, blank=True, null=True)
@@ -1969,6 +2039,9 @@ class AccommodationPhoto(models.Model):
     # EXIF data (stored as JSON)
     exif_data = models.JSONField(blank=True, null=True)
 
+    # Blurred preview shown while the photo loads, as a data URI
+    placeholder = models.TextField(blank=True, default='')
+
     # Timestamps
     uploaded_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -2002,17 +2075,8 @@ class AccommodationPhoto(models.Model):
         return None
 
     def get_srcset(self):
-        """Generate srcset for responsive images"""
-        srcset = []
-        if self.small:
-            srcset.append(f"{self.small.url} 480w")
-        if self.medium:
-            srcset.append(f"{self.medium.url} 960w")
-        if self.large:
-            srcset.append(f"{self.large.url} 1440w")
-        if self.xl:
-            srcset.append(f"{self.xl.url} 2048w")
-        return ', '.join(srcset)
+        """Generate srcset for responsive images at exact breakpoints, resized on demand"""
+        return photo_srcset(self)
 
     def get_sizes(self):
         """Get sizes attribute for responsive images"""
@@ -2243,6 +2307,9 @@ class Tour(models.Model):
     rejection_reason = models.TextField(blank=True, null=True)
     requires_approval = models.BooleanField(default=False, help_text="Set to True if listing needs admin approval after edits")
 
+    # Popularity (see core.popularity_utils)
+    popularity_score = models.FloatField(default=0, editable=False, help_text="Forward-decayed booking score, maintained by update_popularity")
+
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -2265,6 +2332,9 @@ class Tour(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['popularity_score', 'id']),
+        ]
 
 
 class TourPhoto(models.Model):
@@ -2291,12 +2361,12 @@ class TourPhoto(models.Model):
     media_type = models.CharField(max_length=10, choices=MEDIA_TYPES, default='image')
 
     # File fields
-    original_file = models.FileField(upload_to='tours/gallery/%Y/%m/')
-    thumbnail = models.ImageField(upload_to='tours/gallery/thumbs/', blank=True, null=True)
-    small = models.ImageField(upload_to='tours/gallery/small/', blank=True, null=True)
-    medium = models.ImageField(upload_to='tours/gallery/medium/', blank=True, null=True)
-    large = models.ImageField(upload_to='tours/gallery/large/', blank=True, null=True)
-    xl = models.ImageField(upload_to='tours/gallery/xl/', blank=True, null=True)
+    original_file = models.FileField(upload_to='tours/gallery/%Y/%m/', storage=media_storage)
+    thumbnail = models.ImageField(upload_to='tours/gallery/thumbs/', storage=media_storage, blank=True, null=True)
+    small = models.ImageField(upload_to='tours/gallery/small/', storage=media_storage, blank=True, null=True)
+    medium = models.ImageField(upload_to='tours/gallery/medium/', storage=media_storage, blank=True, null=True)
+    large = models.ImageField(upload_to='tours/gallery/large/', storage=media_storage, blank=True, null=True)
+    xl = models.ImageField(upload_to='tours/gallery/xl/', storage=media_storage, blank=True, null=True)
 
     # Metadata
     title = models.CharField(max_length=200, blank=True, null=True)
@@ -2324,6 +2394,9 @@ class TourPhoto(models.Model):
     # EXIF data (stored as JSON)
     exif_data = models.JSONField(blank=True, null=True)
 
+    # Blurred preview shown while the photo loads, as a data URI
+    placeholder = models.TextField(blank=True, default='')
+
     # Timestamps
     uploaded_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -2357,17 +2430,8 @@ class TourPhoto(models.Model):
         return None
 
     def get_srcset(self):
-        """Generate srcset for responsive images"""
-        srcset = []
-        if self.small:
-            srcset.append(f"{self.small.url} 480w")
-        if self.medium:
-            srcset.append(f"{self.medium.url} 960w")
-        if self.large:
-            srcset.append(f"{self.large.url} 1440w")
-        if self.xl:
-            srcset.append(f"{self.xl.url} 2048w")
-        return ', '.join(srcset)
+        """Generate srcset for responsive images at exact breakpoints, resized on demand"""
+        return photo_srcset(self)
 
     def get_sizes(self):
         """Get sizes attribute for responsive images"""
@@ -2569,6 +2633,34 @@ class RecurringRule(models.Model):
         return f"{self.name} ({self.rule_type})"
 
 
+class DailyRate(models.Model):
+    """
+    Materialized per-date price and rules for an accommodation or tour.
+    Expanded from the active SeasonalRate and RecurringRule sets by
+    core.rate_utils so readers fetch one row per night instead of
+    evaluating rules on every request.
+    """
+    accommodation = models.ForeignKey(Accommodation, on_delete=models.CASCADE, blank=True, null=True, related_name='daily_rates')
+    tour = models.ForeignKey(Tour, on_delete=models.CASCADE, blank=True, null=True, related_name='daily_rates')
+    date = models.DateField()
+
+    # Effective values after applying all rules
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    min_stay = models.IntegerField(default=1)
+    is_available = models.BooleanField(default=True)
+
+    # Metadata
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = [['accommodation', 'date'], ['tour', 'date']]
+        ordering = ['date']
+
+    def __str__(self):
+        listing = self.accommodation or self.tour
+        return f"{listing} - {self.date}: {self.price}"
+
+
 # Multi-Room Type Calendar Models
 
 class Listing(models.Model):
@@ -2644,6 +2736,7 @@ class RoomType(models.Model):
     name = models.CharField(max_length=100)
     base_price = models.DecimalField(max_digits=10, decimal_places=2)
     total_units = models.IntegerField(help_text="How many physical units exist of this room type")
+    max_occupancy = models.IntegerField(blank=True, null=True, help_text="Maximum guests per unit (blank means one unit per booking)")
 
     # Status
     is_active = models.BooleanField(default=True)
@@ -3047,7 +3140,7 @@ class RentalCar(models.Model):
 class TourGuidePhoto(models.Model):
     """Photos for tour guide profiles"""
     tour_guide = models.ForeignKey(TourGuide, on_delete=models.CASCADE, related_name='photos')
-    original_file = models.ImageField(upload_to='tour_guides/gallery/%Y/%m/')
+    original_file = models.ImageField(upload_to='tour_guides/gallery/%Y/%m/', storage=media_storage)
     caption = models.CharField(max_length=200, blank=True)
     display_order = models.IntegerField(default=0)
     is_profile_photo = models.BooleanField(default=False)
@@ -3063,7 +3156,7 @@ class TourGuidePhoto(models.Model):
 class RentalCarPhoto(models.Model):
     """Photos for rental car listings"""
     rental_car = models.ForeignKey(RentalCar, on_delete=models.CASCADE, related_name='photos')
-    original_file = models.ImageField(upload_to='rental_cars/gallery/%Y/%m/')
+    original_file = models.ImageField(upload_to='rental_cars/gallery/%Y/%m/', storage=media_storage)
     caption = models.CharField(max_length=200, blank=True)
     display_order = models.IntegerField(default=0)
     is_primary = models.BooleanField(default=False, help_text="Primary/featured photo")
@@ -3076,6 +3169,24 @@ class RentalCarPhoto(models.Model):
         return f"Photo for {self.rental_car.vehicle_name}"
 
 
+class MediaBlob(models.Model):
+    """
+    A content-addressed media file and the number of photo file fields
+    referencing it. The file is deleted when the count drops to zero.
+    """
+    name = models.CharField(max_length=255, unique=True)
+    size = models.BigIntegerField(default=0)
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Media Blob'
+        verbose_name_plural = 'Media Blobs'
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} refs)"
+
+
 class Country(models.Model):
     """Country model for destinations"""
     name = models.CharField(max_length=100, unique=True)
@@ -3422,6 +3533,9 @@ class Booking(models.Model):
     points_awarded = models.IntegerField(default=0, help_text="Points earned from this booking")
     points_awarded_at = models.DateTimeField(null=True, blank=True)
     
+    # Popularity scoring
+    popularity_scored_at = models.DateTimeField(null=True, blank=True, help_text="When update_popularity counted this booking")
+    
     # Metadata
     notes = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -3432,6 +3546,7 @@ class Booking(models.Model):
         indexes = [
             models.Index(fields=['user', 'status']),
             models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['status', 'popularity_scored_at']),
         ]
     
     def __str__(self):
@@ -0,0 +1,117 @@
+"""
+Pagination Utility Functions for BedBees
+Keyset (cursor) pagination for listing pages, so the cost of a page does not
+grow with how deep into the catalogue it is.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.db.models import Q
+
+
+# Listings shown per page
+PAGE_SIZE = 24
+
+# Counts stop at this many rows; larger result sets are shown as "1000+"
+COUNT_LIMIT = 1000
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def encode_cursor(values):
+    """Encode the sort key values of the last row on a page as a URL-safe token"""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, length):
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Returns:
+        List of sort key values, or None when the cursor is missing or invalid.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(values, list) or len(values) != length:
+        return None
+    return values
+
+
+def _after_cursor(ordering, values):
+    """
+    Build the filter selecting rows strictly after the cursor row, i.e. the
+    lexicographic comparison (a, b, id) > (va, vb, vid) spelled out as
+    a > va OR (a = va AND (b > vb OR (b = vb AND id > vid))).
+    """
+    condition = None
+    for field, value in reversed(list(zip(ordering, values))):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        strictly_after = Q(**{f'{name}__{lookup}': value})
+        if condition is None:
+            condition = strictly_after
+        else:
+            condition = strictly_after | (Q(**{name: value}) & condition)
+    return condition
+
+
+def keyset_paginate(queryset, ordering, cursor=None, page_size=PAGE_SIZE):
+    """
+    Fetch one page of a queryset ordered by a unique key.
+
+    The last entry of ordering must make the key unique (normally 'id' or
+    '-id'), and none of the fields may be NULL. Each page is a single
+    ORDER BY ... LIMIT page_size + 1 query starting after the cursor row.
+
+    Args:
+        queryset: Queryset to paginate
+        ordering: Sequence of field names, '-' prefixed for descending
+        cursor: Value of the previous page's next_cursor (None for the first page)
+        page_size: Rows per page
+
+    Returns:
+        Tuple of (rows, next_cursor). next_cursor is None on the last page.
+    """
+    queryset = queryset.order_by(*ordering)
+
+    values = decode_cursor(cursor, len(ordering))
+    if values is not None:
+        queryset = queryset.filter(_after_cursor(ordering, values))
+
+    rows = list(queryset[:page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+
+    rows = rows[:page_size]
+    last = rows[-1]
+    next_cursor = encode_cursor([getattr(last, field.lstrip('-')) for field in ordering])
+    return rows, next_cursor
+
+
+def bounded_count(queryset, limit=COUNT_LIMIT):
+    """
+    Count rows, stopping at limit.
+
+    Returns:
+        Tuple of (count, is_exact). is_exact is False when there are more than
+        limit rows, in which case count equals limit.
+    """
+    count = queryset.order_by()[:limit + 1].count()
+    if count > limit:
+        return limit, False
+    return count, True
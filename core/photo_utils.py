@@ -0,0 +1,128 @@
+"""
+Photo Manifest Utility Functions for BedBees
+Cached, ready-to-render photo lists for the accommodation and tour detail
+pages: ordered photos, the hero subset, URLs per size and srcset.
+
+A manifest is built with one query and kept in the cache until a photo of
+the listing is saved or deleted (see signals), so a warm detail page runs no
+photo queries. Invalidation only reaches other processes when CACHES points
+at a shared backend; the timeout bounds staleness otherwise.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import AccommodationPhoto, Tour, TourPhoto
+
+
+# Seconds a manifest stays cached; signals delete it as soon as a photo changes
+MANIFEST_CACHE_TIMEOUT = getattr(settings, 'PHOTO_MANIFEST_CACHE_TIMEOUT', 60 * 60)
+
+# Bump when the manifest layout changes so old entries are ignored
+MANIFEST_VERSION = 1
+
+# Photos shown in the hero carousel
+HERO_LIMIT = 6
+
+# Sizes listed under each photo's "urls"; missing variants fall back to the original
+IMAGE_SIZES = ('thumbnail', 'small', 'medium', 'large', 'xl')
+
+# Photo model -> name of its listing foreign key
+LISTING_FIELDS = {
+    AccommodationPhoto: 'accommodation',
+    TourPhoto: 'tour',
+}
+
+
+def photo_model_for(listing):
+    """Photo model of an Accommodation or Tour"""
+    return TourPhoto if isinstance(listing, Tour) else AccommodationPhoto
+
+
+def manifest_cache_key(photo_model, listing_id):
+    return f'photo_manifest:{MANIFEST_VERSION}:{photo_model._meta.label_lower}:{listing_id}'
+
+
+def photo_entry(photo):
+    """Serializable dict describing one photo, as used by the templates and JavaScript"""
+    urls = {size: photo.get_image_url(size) for size in IMAGE_SIZES}
+    return {
+        'id': photo.id,
+        'image_url': urls['large'],
+        'urls': urls,
+        'srcset': photo.get_srcset(),
+        'sizes': photo.get_sizes(),
+        'placeholder': photo.placeholder,
+        'width': photo.width,
+        'height': photo.height,
+        'alt_text': photo.alt_text or photo.title,
+        'title': photo.title,
+        'caption': photo.caption,
+        'display_order': photo.display_order,
+        'is_hero': photo.is_hero,
+        'media_type': photo.media_type,
+    }
+
+
+def build_photo_manifest(photo_model, listing_id):
+    """
+    Build a listing's photo manifest with a single query.
+
+    Returns:
+        Dict with "photos" (every visible photo in display order), "hero"
+        (indexes into photos: those marked is_hero, or the first
+        HERO_LIMIT if none are) and "total".
+    """
+    photos = photo_model.objects.filter(
+        **{LISTING_FIELDS[photo_model]: listing_id},
+        visibility__in=['public', 'hidden'],
+    ).order_by('display_order', 'id')
+
+    entries = [photo_entry(photo) for photo in photos]
+    hero = [index for index, entry in enumerate(entries) if entry['is_hero']][:HERO_LIMIT]
+    if not hero:
+        hero = list(range(min(len(entries), HERO_LIMIT)))
+
+    return {'photos': entries, 'hero': hero, 'total': len(entries)}
+
+
+def get_photo_manifest(listing, default_alt=''):
+    """
+    A listing's photo manifest, from the cache when possible.
+
+    Args:
+        listing: Accommodation or Tour
+        default_alt: Alt text for photos with neither alt text nor title
+
+    Returns:
+        Tuple of (hero photos, all photos), each a list of photo_entry()
+        dicts. Hero photos are the same dicts as in all photos.
+    """
+    photo_model = photo_model_for(listing)
+    cache_key = manifest_cache_key(photo_model, listing.pk)
+
+    manifest = cache.get(cache_key)
+    if manifest is None:
+        manifest = build_photo_manifest(photo_model, listing.pk)
+        cache.set(cache_key, manifest, MANIFEST_CACHE_TIMEOUT)
+
+    photos = manifest['photos']
+    if default_alt:
+        for entry in photos:
+            entry['alt_text'] = entry['alt_text'] or default_alt
+    return [photos[index] for index in manifest['hero']], photos
+
+
+def invalidate_photo_manifest(photo):
+    """
+    Drop the cached manifest of a photo's listing once the current
+    transaction commits, so a concurrent request cannot re-cache the
+    uncommitted state.
+    """
+    photo_model = type(photo)
+    listing_id = getattr(photo, f'{LISTING_FIELDS[photo_model]}_id')
+    if listing_id is None:
+        return
+    cache_key = manifest_cache_key(photo_model, listing_id)
+    transaction.on_commit(lambda: cache.delete(cache_key))
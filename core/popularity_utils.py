@@ -0,0 +1,100 @@
+"""
+Popularity Utility Functions for BedBees
+Scores accommodations and tours from their completed bookings for the
+"popular" sort.
+
+Scores use forward decay: a booking made at time t adds
+weight * 2 ** ((t - POPULARITY_EPOCH) / half-life). Every score shrinks by
+the same factor as time passes, so the order of listings never changes.
+That means no stored score has to be decayed. Each run only adds the
+bookings it has not counted yet.
+"""
+
+import math
+from collections import defaultdict
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Accommodation, Booking, Tour
+
+
+# Days for a booking's contribution to lose half its weight
+POPULARITY_HALF_LIFE_DAYS = 30
+
+# Reference time for forward decay; scores stay finite for about 80 years after it
+POPULARITY_EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+
+# Bookings counted per transaction
+POPULARITY_BATCH_SIZE = 1000
+
+
+def booking_weight(total_amount, booked_at):
+    """
+    Forward-decayed contribution of one completed booking.
+    Every booking counts 1, plus log(1 + amount) so large bookings matter
+    without letting one outlier dominate.
+    """
+    amount = max(float(total_amount or 0), 0.0)
+    age_days = (booked_at - POPULARITY_EPOCH).total_seconds() / 86400
+    return (1 + math.log1p(amount)) * 2 ** (age_days / POPULARITY_HALF_LIFE_DAYS)
+
+
+def score_pending_bookings(batch_size=POPULARITY_BATCH_SIZE):
+    """
+    Add every completed booking not yet counted to its listing's score.
+
+    Bookings are read through the (status, popularity_scored_at) index in
+    batches, summed per listing, applied as F() increments and stamped in
+    the same transaction, so a crashed run never double counts.
+
+    Returns:
+        Tuple of (bookings counted, listings updated).
+    """
+    booking_count = 0
+    updated_listings = set()
+
+    while True:
+        with transaction.atomic():
+            batch = list(
+                Booking.objects.select_for_update()
+                .filter(status='completed', popularity_scored_at__isnull=True)
+                .order_by('id')
+                .values('id', 'accommodation_id', 'tour_id', 'total_amount', 'created_at')[:batch_size]
+            )
+            if not batch:
+                break
+
+            deltas = defaultdict(float)
+            for booking in batch:
+                weight = booking_weight(booking['total_amount'], booking['created_at'])
+                if booking['accommodation_id']:
+                    deltas[(Accommodation, booking['accommodation_id'])] += weight
+                if booking['tour_id']:
+                    deltas[(Tour, booking['tour_id'])] += weight
+
+            for (model, listing_id), delta in deltas.items():
+                model.objects.filter(id=listing_id).update(popularity_score=F('popularity_score') + delta)
+
+            Booking.objects.filter(id__in=[booking['id'] for booking in batch]).update(
+                popularity_scored_at=timezone.now()
+            )
+
+        booking_count += len(batch)
+        updated_listings.update(deltas)
+
+    return booking_count, len(updated_listings)
+
+
+def rebuild_popularity_scores():
+    """
+    Reset every score and recount all completed bookings, e.g. after
+    changing the weighting.
+    """
+    with transaction.atomic():
+        Accommodation.objects.update(popularity_score=0)
+        Tour.objects.update(popularity_score=0)
+        Booking.objects.exclude(popularity_scored_at__isnull=True).update(popularity_scored_at=None)
+    return score_pending_bookings()
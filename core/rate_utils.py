@@ -0,0 +1,144 @@
+"""
+Rate Utility Functions for BedBees
+Expands SeasonalRate and RecurringRule sets into the materialized DailyRate
+table, one row per listing per night.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db.models import Q
+from django.utils import timezone
+
+from .calendar_utils import BULK_BATCH_SIZE, iter_dates
+from .models import Accommodation, DailyRate, RecurringRule, SeasonalRate, Tour
+
+
+# How far ahead rates are materialized; the materialize_rates command rolls it forward
+RATE_HORIZON_DAYS = 365
+
+
+def _recurring_rule_applies(rule, day):
+    """
+    Check whether a RecurringRule covers a date.
+    Weekly rules match rule.weekdays (every day when empty), monthly rules the
+    day of month of start_date and yearly rules its month and day.
+    """
+    if day < rule.start_date or (rule.end_date and day > rule.end_date):
+        return False
+    if rule.rule_type == 'weekly':
+        return not rule.weekdays or day.weekday() in rule.weekdays
+    if rule.rule_type == 'monthly':
+        return day.day == rule.start_date.day
+    if rule.rule_type == 'yearly':
+        return (day.month, day.day) == (rule.start_date.month, rule.start_date.day)
+    return False
+
+
+def compute_daily_rates(base_price, seasonal_rates, recurring_rules, start_date, end_date):
+    """
+    Apply rate rules to every date in a range.
+
+    Seasonal rates apply in start_date order: a fixed_price replaces the
+    running price, otherwise price_multiplier scales it. Recurring rule
+    multipliers are applied on top. The longest min_stay wins and any
+    blackout or unavailable rule closes the date.
+
+    Returns:
+        List of (date, price, min_stay, is_available) tuples.
+    """
+    rates = []
+
+    for day in iter_dates(start_date, end_date):
+        price = Decimal(str(base_price or 0))
+        min_stay = 1
+        is_available = True
+
+        for rate in seasonal_rates:
+            if not rate.start_date <= day <= rate.end_date:
+                continue
+            if rate.fixed_price is not None:
+                price = rate.fixed_price
+            else:
+                price *= rate.price_multiplier
+            if rate.min_stay:
+                min_stay = max(min_stay, rate.min_stay)
+            if rate.is_blackout:
+                is_available = False
+
+        for rule in recurring_rules:
+            if not _recurring_rule_applies(rule, day):
+                continue
+            price *= rule.price_multiplier
+            if rule.min_stay:
+                min_stay = max(min_stay, rule.min_stay)
+            if not rule.is_available:
+                is_available = False
+
+        rates.append((day, price.quantize(Decimal('0.01')), min_stay, is_available))
+
+    return rates
+
+
+def materialize_rates(listing, start_date=None, end_date=None):
+    """
+    Recompute the DailyRate rows of one Accommodation or Tour.
+
+    Loads the listing's active rules overlapping the window in two queries and
+    upserts one row per date, so a rule or price change only rewrites the
+    listings it touches.
+
+    Args:
+        listing: Accommodation or Tour instance
+        start_date: First date to materialize (defaults to today)
+        end_date: Last date to materialize (defaults to RATE_HORIZON_DAYS ahead)
+
+    Returns:
+        Number of DailyRate rows written.
+    """
+    if isinstance(listing, Tour):
+        field, base_price = 'tour', listing.price_per_person
+    else:
+        field, base_price = 'accommodation', listing.base_price
+
+    start_date = start_date or timezone.localdate()
+    end_date = end_date or start_date + timedelta(days=RATE_HORIZON_DAYS - 1)
+
+    seasonal_rates = list(SeasonalRate.objects.filter(
+        is_active=True,
+        start_date__lte=end_date,
+        end_date__gte=start_date,
+        **{f'{field}s': listing},
+    ))
+    recurring_rules = list(RecurringRule.objects.filter(
+        Q(end_date__isnull=True) | Q(end_date__gte=start_date),
+        is_active=True,
+        start_date__lte=end_date,
+        **{f'{field}s': listing},
+    ))
+
+    rows = [
+        DailyRate(**{field: listing}, date=day, price=price, min_stay=min_stay, is_available=is_available)
+        for day, price, min_stay, is_available in compute_daily_rates(
+            base_price, seasonal_rates, recurring_rules, start_date, end_date
+        )
+    ]
+
+    DailyRate.objects.bulk_create(
+        rows,
+        batch_size=BULK_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=[field, 'date'],
+        update_fields=['price', 'min_stay', 'is_available', 'updated_at'],
+    )
+    return len(rows)
+
+
+def materialize_rule_targets(accommodation_ids, tour_ids):
+    """
+    Recompute DailyRate rows for the listings a rule is (or was) attached to.
+    """
+    for accommodation in Accommodation.objects.filter(id__in=accommodation_ids):
+        materialize_rates(accommodation)
+    for tour in Tour.objects.filter(id__in=tour_ids):
+        materialize_rates(tour)
@@ -0,0 +1,193 @@
+"""
+Full-Text Search Index for BedBees
+Keeps a ranked text index of published accommodations and tours: an FTS5
+virtual table on SQLite, a weighted tsvector table with a GIN index on
+PostgreSQL. Other databases fall back to icontains filters.
+"""
+
+import re
+
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, When
+
+from .models import Accommodation, Tour
+
+
+# Indexed fields per model with their weight (A = most important)
+SEARCH_FIELDS = {
+    Accommodation: [
+        ('property_name', 'A'),
+        ('city', 'A'),
+        ('country', 'A'),
+        ('tagline', 'B'),
+        ('amenities', 'C'),
+        ('nearby_landmarks', 'C'),
+        ('full_description', 'D'),
+    ],
+    Tour: [
+        ('tour_name', 'A'),
+        ('city', 'A'),
+        ('country', 'A'),
+        ('tagline', 'B'),
+        ('highlights', 'C'),
+        ('inclusions', 'C'),
+        ('meeting_point', 'C'),
+        ('full_description', 'D'),
+        ('itinerary', 'D'),
+    ],
+}
+
+# bm25() column weights used on SQLite for each tsvector weight class
+BM25_WEIGHTS = {'A': 10.0, 'B': 4.0, 'C': 2.0, 'D': 1.0}
+
+# Upper bound on ranked ids returned per search
+SEARCH_RESULT_LIMIT = 1000
+
+
+def _index_table(model):
+    """Name of the search table for a model"""
+    if connection.vendor == 'postgresql':
+        return f'{model._meta.db_table}_search'
+    return f'{model._meta.db_table}_fts'
+
+
+def fulltext_supported():
+    """Check whether the current database has a full-text index"""
+    return connection.vendor in ('sqlite', 'postgresql')
+
+
+def _query_tokens(query):
+    """Lowercase word tokens of a user query, safe to embed in MATCH/tsquery syntax"""
+    return re.findall(r'\w+', query.lower())
+
+
+def index_listing(listing):
+    """
+    Add, refresh or drop one Accommodation or Tour in the search index.
+    Only published, active listings are indexed.
+    """
+    model = listing._meta.concrete_model
+    if not (listing.is_published and listing.is_active):
+        remove_listing(model, listing.pk)
+        return
+    if not fulltext_supported():
+        return
+
+    fields = SEARCH_FIELDS[model]
+    values = [getattr(listing, field) or '' for field, _ in fields]
+    table = _index_table(model)
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            document = ' || '.join(
+                f"setweight(to_tsvector('simple', %s), '{weight}')" for _, weight in fields
+            )
+            cursor.execute(
+                f'INSERT INTO {table} (listing_id, document) VALUES (%s, {document}) '
+                f'ON CONFLICT (listing_id) DO UPDATE SET document = EXCLUDED.document',
+                [listing.pk] + values,
+            )
+        else:
+            columns = ', '.join(field for field, _ in fields)
+            placeholders = ', '.join(['%s'] * len(fields))
+            cursor.execute(f'DELETE FROM {table} WHERE rowid = %s', [listing.pk])
+            cursor.execute(
+                f'INSERT INTO {table} (rowid, {columns}) VALUES (%s, {placeholders})',
+                [listing.pk] + values,
+            )
+
+
+def remove_listing(model, listing_id):
+    """Drop one listing from the search index"""
+    if not fulltext_supported():
+        return
+
+    key = 'listing_id' if connection.vendor == 'postgresql' else 'rowid'
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {_index_table(model)} WHERE {key} = %s', [listing_id])
+
+
+def reindex_listings(model, listing_ids=None):
+    """
+    Refresh the index for some listings (or all of them), e.g. after a
+    queryset.update() that bypassed the save signals.
+    """
+    listings = model.objects.all()
+    if listing_ids is not None:
+        listings = listings.filter(id__in=listing_ids)
+
+    fields = [field for field, _ in SEARCH_FIELDS[model]]
+    count = 0
+    for listing in listings.only('id', 'is_published', 'is_active', *fields):
+        index_listing(listing)
+        count += 1
+    return count
+
+
+def search_listing_ids(model, query, limit=SEARCH_RESULT_LIMIT):
+    """
+    Run a full-text query against the index.
+
+    Every word of the query must match, as a prefix, in any indexed field.
+
+    Returns:
+        List of listing ids, best match first, or None when the database has
+        no full-text index.
+    """
+    if not fulltext_supported():
+        return None
+
+    tokens = _query_tokens(query)
+    if not tokens:
+        return []
+
+    table = _index_table(model)
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            tsquery = ' & '.join(f'{token}:*' for token in tokens)
+            cursor.execute(
+                f"SELECT listing_id FROM {table} "
+                f"WHERE document @@ to_tsquery('simple', %s) "
+                f"ORDER BY ts_rank(document, to_tsquery('simple', %s)) DESC LIMIT %s",
+                [tsquery, tsquery, limit],
+            )
+        else:
+            match = ' '.join(f'"{token}"*' for token in tokens)
+            weights = ', '.join(str(BM25_WEIGHTS[weight]) for _, weight in SEARCH_FIELDS[model])
+            cursor.execute(
+                f'SELECT rowid FROM {table} WHERE {table} MATCH %s '
+                f'ORDER BY bm25({table}, {weights}) LIMIT %s',
+                [match, limit],
+            )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def search_listings(queryset, query):
+    """
+    Filter an Accommodation or Tour queryset by a free-text query.
+
+    Returns:
+        Tuple of (queryset, ranked_ids). ranked_ids is None when the database
+        has no full-text index and a plain icontains filter was used instead.
+    """
+    model = queryset.model
+    ranked_ids = search_listing_ids(model, query)
+
+    if ranked_ids is None:
+        text_filter = Q()
+        for field, _ in SEARCH_FIELDS[model]:
+            text_filter |= Q(**{f'{field}__icontains': query})
+        return queryset.filter(text_filter), None
+
+    return queryset.filter(id__in=ranked_ids), ranked_ids
+
+
+def annotate_rank(queryset, ranked_ids):
+    """Annotate search_rank, the position of each id in ranked_ids (lower is better)"""
+    return queryset.annotate(
+        search_rank=Case(
+            *[When(id=listing_id, then=position) for position, listing_id in enumerate(ranked_ids)],
+            default=len(ranked_ids),
+            output_field=IntegerField(),
+        )
+    )
@@ -0,0 +1,219 @@
+"""
+Search Utility Functions for BedBees
+Database-side filters and facet counts used by the search results page.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db.models import Count, Exists, F, OuterRef, Q, Subquery
+
+from .models import Accommodation, AccommodationAmenity, AccommodationAvailability, DailyRate, Tour
+
+
+# Amenity filters offered on the search page, mapped to the Amenity names
+# hosts pick when creating a listing
+AMENITY_FILTERS = {
+    'wifi': ('WiFi', ['Free WiFi', 'High-Speed Internet']),
+    'pool': ('Pool', ['Swimming Pool', 'Outdoor Pool', 'Indoor Pool', 'Heated Pool']),
+    'gym': ('Gym', ['Gym/Fitness Center']),
+    'spa': ('Spa', ['Spa']),
+    'parking': ('Parking', ['Free Parking', 'Paid Parking', 'Valet Parking']),
+    'breakfast': ('Breakfast', ['Breakfast Included']),
+    'restaurant': ('Restaurant', ['Restaurant']),
+    'air_conditioning': ('Air Conditioning', ['Air Conditioning']),
+    'kitchen': ('Kitchen', ['Kitchen', 'Fully Equipped Kitchen']),
+    'pet_friendly': ('Pet Friendly', ['Pet Friendly']),
+    'airport_shuttle': ('Airport Shuttle', ['Airport Shuttle']),
+    'wheelchair': ('Wheelchair Accessible', ['Wheelchair Accessible']),
+}
+
+# Price facet buckets as (min, max) per night or per person; None is open-ended
+PRICE_BUCKETS = [(0, 50), (50, 100), (100, 200), (200, 400), (400, None)]
+
+# Seconds facet counts stay cached for the same normalized query
+FACET_CACHE_TIMEOUT = 300
+
+
+def parse_stay_dates(checkin, checkout):
+    """
+    Parse checkin/checkout query params (YYYY-MM-DD).
+
+    Returns:
+        Tuple of (checkin, checkout) dates, or (None, None) when either is
+        missing, malformed or checkout is not after checkin.
+    """
+    try:
+        checkin_date = datetime.strptime(checkin, '%Y-%m-%d').date()
+        checkout_date = datetime.strptime(checkout, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None, None
+
+    if checkout_date <= checkin_date:
+        return None, None
+    return checkin_date, checkout_date
+
+
+def filter_available_accommodations(queryset, checkin, checkout, rooms=1):
+    """
+    Keep only accommodations open for every night in [checkin, checkout).
+
+    A night is open when its AccommodationAvailability row is available, not
+    blocked and has at least `rooms` rooms left. Nights the host never edited
+    behave like the calendar defaults: one room, closed only by a blackout in
+    the materialized DailyRate table. Everything is expressed as correlated
+    EXISTS subqueries over the (accommodation, date) indexes, so the whole
+    candidate set is filtered in the same SQL statement as the other filters.
+
+    Args:
+        queryset: Accommodation queryset to filter
+        checkin: Arrival date
+        checkout: Departure date (not a night of the stay)
+        rooms: Number of rooms required each night
+    """
+    nights = AccommodationAvailability.objects.filter(
+        accommodation=OuterRef('pk'),
+        date__gte=checkin,
+        date__lt=checkout,
+    )
+
+    closed_nights = nights.filter(
+        Q(is_available=False)
+        | Q(is_blocked=True)
+        | Q(total_rooms__lt=F('rooms_booked') + F('rooms_blocked') + rooms)
+    )
+
+    blackout_nights = DailyRate.objects.filter(
+        accommodation=OuterRef('pk'),
+        date__gte=checkin,
+        date__lt=checkout,
+        is_available=False,
+    ).exclude(
+        Exists(AccommodationAvailability.objects.filter(
+            accommodation=OuterRef('accommodation'),
+            date=OuterRef('date'),
+        ))
+    )
+
+    queryset = queryset.exclude(Exists(closed_nights)).exclude(Exists(blackout_nights))
+
+    if rooms > 1:
+        # Unedited nights only offer one room, so every night needs its own row
+        stay_length = (checkout - checkin).days
+        stored_nights = nights.values('accommodation').annotate(count=Count('id')).values('count')
+        queryset = queryset.alias(stored_nights=Subquery(stored_nights)).filter(stored_nights=stay_length)
+
+    return queryset
+
+
+def _amenity_condition(amenity):
+    """
+    EXISTS over the (accommodation, amenity) link index matching accommodations
+    offering any label of an AMENITY_FILTERS entry
+    """
+    return Exists(AccommodationAmenity.objects.filter(
+        accommodation=OuterRef('pk'),
+        amenity__name__in=AMENITY_FILTERS[amenity][1],
+    ))
+
+
+def filter_amenities(queryset, amenities):
+    """
+    Keep only accommodations offering every requested amenity.
+    Unknown amenity keys are ignored.
+    """
+    for amenity in amenities:
+        if amenity in AMENITY_FILTERS:
+            queryset = queryset.filter(_amenity_condition(amenity))
+    return queryset
+
+
+def _price_bucket_label(low, high):
+    return f'{low}+' if high is None else f'{low}-{high}'
+
+
+def compute_facets(queryset):
+    """
+    Count listings per facet value for an Accommodation or Tour queryset.
+
+    Every count is a conditional COUNT in one aggregate query, so the whole
+    sidebar costs a single scan of the filtered result set however many
+    facet values there are.
+
+    Returns:
+        Dict of facet name to a list of {'value', 'label', 'count'} dicts,
+        skipping values with no matches. Accommodations get property_type,
+        star_rating, price and amenities; tours get tour_category and price.
+    """
+    model = queryset.model
+    counts = {}
+    facets = {}
+
+    if model is Tour:
+        price_field = 'price_per_person'
+        facets['tour_category'] = [
+            (value, label, Q(tour_category=value)) for value, label in Tour.TOUR_CATEGORIES
+        ]
+    else:
+        price_field = 'base_price'
+        facets['property_type'] = [
+            (value, label, Q(property_type=value)) for value, label in Accommodation.PROPERTY_TYPES
+        ]
+        facets['star_rating'] = [
+            (str(stars), f'{stars} Star', Q(star_rating=stars)) for stars in range(5, 0, -1)
+        ]
+        facets['amenities'] = [
+            (key, label, _amenity_condition(key)) for key, (label, _) in AMENITY_FILTERS.items()
+        ]
+
+    facets['price'] = []
+    for low, high in PRICE_BUCKETS:
+        condition = Q(**{f'{price_field}__gte': low})
+        if high is not None:
+            condition &= Q(**{f'{price_field}__lt': high})
+        facets['price'].append((_price_bucket_label(low, high), _price_bucket_label(low, high), condition))
+
+    for name, values in facets.items():
+        for index, (_, _, condition) in enumerate(values):
+            counts[f'{name}_{index}'] = Count('id', filter=condition)
+
+    totals = queryset.order_by().aggregate(**counts)
+
+    return {
+        name: [
+            {'value': value, 'label': label, 'count': totals[f'{name}_{index}']}
+            for index, (value, label, _) in enumerate(values)
+            if totals[f'{name}_{index}']
+        ]
+        for name, values in facets.items()
+    }
+
+
+def get_cached_facets(queryset, filters):
+    """
+    Facet counts for a filtered queryset, cached per normalized query.
+
+    Args:
+        queryset: Filtered Accommodation or Tour queryset
+        filters: Dict of the filter parameters that produced the queryset;
+            strings are stripped and lowercased and lists sorted, so
+            equivalent searches share one cache entry
+    """
+    normalized = {}
+    for key, value in filters.items():
+        if isinstance(value, (list, tuple)):
+            value = sorted(str(item).strip().lower() for item in value)
+        elif value is not None:
+            value = str(value).strip().lower()
+        normalized[key] = value
+
+    payload = json.dumps([queryset.model._meta.label, normalized], sort_keys=True)
+    cache_key = 'search_facets:' + hashlib.md5(payload.encode()).hexdigest()
+
+    facets = cache.get(cache_key)
+    if facets is None:
+        facets = compute_facets(queryset)
+        cache.set(cache_key, facets, FACET_CACHE_TIMEOUT)
+    return facets
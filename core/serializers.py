@@ -7,7 +7,7 @@ from .models import (
 class RoomTypeSerializer(serializers.ModelSerializer):
     class Meta:
         model = RoomType
-        fields = ['id', 'name', 'base_price', 'total_units']
+        fields = ['id', 'name', 'base_price', 'total_units', 'max_occupancy']
 
 
 class DayRoomInventorySerializer(serializers.ModelSerializer):
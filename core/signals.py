@@ -1,12 +1,28 @@
 """
 Signals for Genius Rewards System
-Handles automatic profile creation and points awarding
+Handles automatic profile creation and points awarding, and keeps the
+materialized DailyRate table, search indexes, amenity links, geo cells,
+country counts, photo variants, photo manifests and media blob
+references in sync
 """
 
-from django.db.models.signals import post_save, pre_save
+from collections import Counter
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import GeniusProfile, Booking
+from .models import (
+    GeniusProfile, Booking, Accommodation, AccommodationPhoto, Tour, TourPhoto, SeasonalRate, RecurringRule, Country,
+    TourGuidePhoto, RentalCarPhoto,
+)
+from .rate_utils import materialize_rates, materialize_rule_targets
+from .search_index import index_listing, remove_listing
+from .geo_utils import encode_geohash
+from . import destination_index
+from .country_utils import adjust_country_count, is_counted
+from .images import needs_derivatives, queue_derivatives, read_upload_metadata
+from .media_utils import PHOTO_FILE_FIELDS, acquire_blobs, blob_references, photo_blob_references, release_blobs
+from .photo_utils import invalidate_photo_manifest
 
 
 @receiver(post_save, sender=User)
@@ -55,3 +71,390 @@ def track_booking_status_change(sender, instance, **kwargs):
 
         except Booking.DoesNotExist:
             pass
+
+
+# ============================================================================
+# LISTING CHANGE TRACKING
+# ============================================================================
+
+# Previous values the pre_save hooks below compare against: the price for
+# the materialized rates, amenities for the amenity links, and city, country
+# and visibility for the destination index and country counts
+TRACKED_LISTING_FIELDS = {
+    Accommodation: ("base_price", "amenities", "city", "country", "is_published", "is_active"),
+    Tour: ("price_per_person", "city", "country", "is_published", "is_active"),
+}
+
+
+@receiver(pre_save, sender=Accommodation)
+@receiver(pre_save, sender=Tour)
+def load_previous_listing(sender, instance, **kwargs):
+    """
+    Load the stored values of every tracked field in one query, before the
+    other pre_save hooks compare them with the instance
+    """
+    instance._old_values = None
+    if instance.pk:
+        instance._old_values = sender.objects.filter(pk=instance.pk).values(*TRACKED_LISTING_FIELDS[sender]).first()
+
+
+# ============================================================================
+# MATERIALIZED DAILY RATES
+# ============================================================================
+
+@receiver(pre_save, sender=Accommodation)
+@receiver(pre_save, sender=Tour)
+def track_base_price_change(sender, instance, **kwargs):
+    """
+    Remember whether the base price changed so post_save only re-materializes
+    rates when it has to
+    """
+    price_field = "price_per_person" if sender is Tour else "base_price"
+    old = instance._old_values
+    instance._rates_stale = old is None or old[price_field] != getattr(instance, price_field)
+
+
+@receiver(post_save, sender=Accommodation)
+@receiver(post_save, sender=Tour)
+def refresh_listing_rates(sender, instance, **kwargs):
+    """
+    Re-materialize DailyRate rows for a new listing or a base price change
+    """
+    if getattr(instance, "_rates_stale", False):
+        materialize_rates(instance)
+        instance._rates_stale = False
+
+
+@receiver(post_save, sender=SeasonalRate)
+@receiver(post_save, sender=RecurringRule)
+def refresh_rule_rates(sender, instance, created, **kwargs):
+    """
+    Re-materialize the listings attached to an edited rule
+    (new rules have no listings until m2m_changed fires)
+    """
+    if not created:
+        materialize_rule_targets(
+            instance.accommodations.values_list("id", flat=True),
+            instance.tours.values_list("id", flat=True),
+        )
+
+
+@receiver(m2m_changed, sender=SeasonalRate.accommodations.through)
+@receiver(m2m_changed, sender=SeasonalRate.tours.through)
+@receiver(m2m_changed, sender=RecurringRule.accommodations.through)
+@receiver(m2m_changed, sender=RecurringRule.tours.through)
+def refresh_rule_target_rates(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """
+    Re-materialize listings added to or removed from a rule
+    """
+    if reverse:
+        # Changed from the listing side, e.g. accommodation.seasonalrate_set.add(rule)
+        if action in ("post_add", "post_remove", "post_clear"):
+            materialize_rates(instance)
+        return
+
+    listing_field = "tours" if model is Tour else "accommodations"
+    if action == "pre_clear":
+        instance._cleared_rate_targets = list(getattr(instance, listing_field).values_list("id", flat=True))
+        return
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_rate_targets", [])
+    elif action not in ("post_add", "post_remove"):
+        return
+
+    if model is Tour:
+        materialize_rule_targets([], pk_set)
+    else:
+        materialize_rule_targets(pk_set, [])
+
+
+@receiver(pre_delete, sender=SeasonalRate)
+@receiver(pre_delete, sender=RecurringRule)
+def remember_deleted_rule_targets(sender, instance, **kwargs):
+    """
+    Capture a rule's listings before its M2M rows are deleted with it
+    """
+    instance._deleted_rate_targets = (
+        list(instance.accommodations.values_list("id", flat=True)),
+        list(instance.tours.values_list("id", flat=True)),
+    )
+
+
+@receiver(post_delete, sender=SeasonalRate)
+@receiver(post_delete, sender=RecurringRule)
+def refresh_deleted_rule_rates(sender, instance, **kwargs):
+    """
+    Re-materialize the listings a deleted rule applied to
+    """
+    accommodation_ids, tour_ids = getattr(instance, "_deleted_rate_targets", ([], []))
+    materialize_rule_targets(accommodation_ids, tour_ids)
+
+
+# ============================================================================
+# FULL-TEXT SEARCH INDEX
+# ============================================================================
+
+@receiver(post_save, sender=Accommodation)
+@receiver(post_save, sender=Tour)
+def update_search_index(sender, instance, **kwargs):
+    """
+    Index published listings and drop unpublished or deactivated ones
+    """
+    index_listing(instance)
+
+
+@receiver(post_delete, sender=Accommodation)
+@receiver(post_delete, sender=Tour)
+def remove_from_search_index(sender, instance, **kwargs):
+    """
+    Drop deleted listings from the search index
+    """
+    remove_listing(sender, instance.pk)
+
+
+# ============================================================================
+# NORMALIZED AMENITIES
+# ============================================================================
+
+@receiver(pre_save, sender=Accommodation)
+def track_amenities_change(sender, instance, **kwargs):
+    """
+    Remember whether the amenities string changed so post_save only rebuilds
+    the amenity links when it has to
+    """
+    old = instance._old_values
+    if old is None:
+        instance._amenities_stale = bool(instance.amenities)
+    else:
+        instance._amenities_stale = old["amenities"] != instance.amenities
+
+
+@receiver(post_save, sender=Accommodation)
+def refresh_amenity_links(sender, instance, **kwargs):
+    """
+    Rebuild AccommodationAmenity rows from the amenities string
+    """
+    if getattr(instance, "_amenities_stale", False):
+        instance.sync_amenities()
+        instance._amenities_stale = False
+
+
+# ============================================================================
+# GEO CELL INDEX
+# ============================================================================
+
+@receiver(pre_save, sender=Accommodation)
+def update_geo_cell(sender, instance, **kwargs):
+    """
+    Keep the geohash cell in step with the coordinates
+    """
+    if instance.latitude is None or instance.longitude is None:
+        instance.geo_cell = None
+    else:
+        instance.geo_cell = encode_geohash(instance.latitude, instance.longitude)
+
+
+# ============================================================================
+# DESTINATION AUTOCOMPLETE INDEX
+# ============================================================================
+
+DESTINATION_FIELDS = ("city", "country", "is_published", "is_active")
+
+
+@receiver(pre_save, sender=Accommodation)
+@receiver(pre_save, sender=Tour)
+def track_destination_change(sender, instance, **kwargs):
+    """
+    Remember the listing's previous city and visibility so post_save can
+    update both the old and the new city entries
+    """
+    old = instance._old_values
+    instance._old_destination = tuple(old[field] for field in DESTINATION_FIELDS) if old else None
+
+
+@receiver(post_save, sender=Accommodation)
+@receiver(post_save, sender=Tour)
+def refresh_destination_cities(sender, instance, **kwargs):
+    """
+    Update city popularity in the autocomplete index when a listing is
+    published, unpublished or moved
+    """
+    old = getattr(instance, "_old_destination", None)
+    new = tuple(getattr(instance, field) for field in DESTINATION_FIELDS)
+    if old == new:
+        return
+
+    destination_index.refresh_city(instance.city, instance.country)
+    if old and (old[0], old[1]) != (instance.city, instance.country):
+        destination_index.refresh_city(old[0], old[1])
+
+
+@receiver(post_delete, sender=Accommodation)
+@receiver(post_delete, sender=Tour)
+def remove_destination_city(sender, instance, **kwargs):
+    """
+    Recount the city of a deleted listing
+    """
+    destination_index.refresh_city(instance.city, instance.country)
+
+
+@receiver(post_save, sender=Country)
+def refresh_destination_country(sender, instance, **kwargs):
+    """
+    Keep the country entry in the autocomplete index up to date
+    """
+    destination_index.refresh_country(instance)
+
+
+@receiver(post_delete, sender=Country)
+def remove_destination_country(sender, instance, **kwargs):
+    """
+    Drop a deleted country from the autocomplete index
+    """
+    destination_index.remove_country(instance.slug)
+
+
+# ============================================================================
+# COUNTRY LISTING COUNTS
+# ============================================================================
+
+@receiver(post_save, sender=Accommodation)
+@receiver(post_save, sender=Tour)
+def update_country_counts(sender, instance, **kwargs):
+    """
+    Move the listing between country counters when it is published,
+    unpublished or moved to another country. Uses the previous values
+    remembered by track_destination_change.
+    """
+    old = getattr(instance, "_old_destination", None)
+    was_counted = bool(old) and is_counted(old[2], old[3])
+    now_counted = is_counted(instance.is_published, instance.is_active)
+
+    if was_counted and now_counted and old[1].lower() == instance.country.lower():
+        return
+    if was_counted:
+        adjust_country_count(sender, old[1], -1)
+    if now_counted:
+        adjust_country_count(sender, instance.country, 1)
+
+
+@receiver(post_delete, sender=Accommodation)
+@receiver(post_delete, sender=Tour)
+def decrement_country_count(sender, instance, **kwargs):
+    """
+    Drop a deleted listing from its country's count
+    """
+    if is_counted(instance.is_published, instance.is_active):
+        adjust_country_count(sender, instance.country, -1)
+
+
+# ============================================================================
+# MEDIA BLOB REFERENCE COUNTS
+# ============================================================================
+
+# Registered before the derivative receivers so a photo's own save is counted
+# before any nested save from derivative generation
+
+@receiver(pre_save, sender=AccommodationPhoto)
+@receiver(pre_save, sender=TourPhoto)
+@receiver(pre_save, sender=TourGuidePhoto)
+@receiver(pre_save, sender=RentalCarPhoto)
+def load_previous_photo(sender, instance, **kwargs):
+    """
+    Load the stored file names in one query, before the other pre_save
+    hooks compare them with the instance
+    """
+    instance._old_values = None
+    if instance.pk:
+        instance._old_values = sender.objects.filter(pk=instance.pk).values(*PHOTO_FILE_FIELDS[sender]).first()
+
+
+@receiver(pre_save, sender=AccommodationPhoto)
+@receiver(pre_save, sender=TourPhoto)
+@receiver(pre_save, sender=TourGuidePhoto)
+@receiver(pre_save, sender=RentalCarPhoto)
+def track_blob_references(sender, instance, **kwargs):
+    """
+    Remember which blobs the stored photo row points at
+    """
+    old = instance._old_values
+    instance._old_blob_references = blob_references(old.values()) if old else Counter()
+
+
+@receiver(post_save, sender=AccommodationPhoto)
+@receiver(post_save, sender=TourPhoto)
+@receiver(post_save, sender=TourGuidePhoto)
+@receiver(post_save, sender=RentalCarPhoto)
+def update_blob_references(sender, instance, **kwargs):
+    """
+    Reference newly attached blobs and release replaced ones
+    """
+    old = getattr(instance, "_old_blob_references", Counter())
+    new = photo_blob_references(instance)
+    acquire_blobs(new - old)
+    release_blobs(old - new)
+    instance._old_blob_references = new
+
+
+@receiver(post_delete, sender=AccommodationPhoto)
+@receiver(post_delete, sender=TourPhoto)
+@receiver(post_delete, sender=TourGuidePhoto)
+@receiver(post_delete, sender=RentalCarPhoto)
+def release_deleted_photo_blobs(sender, instance, **kwargs):
+    """
+    Release every blob a deleted photo pointed at
+    """
+    release_blobs(photo_blob_references(instance))
+
+
+# ============================================================================
+# PHOTO DERIVATIVES
+# ============================================================================
+
+@receiver(pre_save, sender=AccommodationPhoto)
+@receiver(pre_save, sender=TourPhoto)
+def track_original_file_change(sender, instance, **kwargs):
+    """
+    Remember the previous original file so a replaced image gets its
+    variants rebuilt
+    """
+    old = instance._old_values
+    instance._old_original_file = old["original_file"] if old else None
+
+
+@receiver(pre_save, sender=AccommodationPhoto)
+@receiver(pre_save, sender=TourPhoto)
+def read_photo_metadata(sender, instance, **kwargs):
+    """
+    Store the dimensions and EXIF of a new upload from its header, so they
+    are available before the variants are generated
+    """
+    read_upload_metadata(instance)
+
+
+@receiver(post_save, sender=AccommodationPhoto)
+@receiver(post_save, sender=TourPhoto)
+def generate_photo_derivatives(sender, instance, created, **kwargs):
+    """
+    Queue WebP size variants for new or replaced images
+    """
+    replaced = not created and getattr(instance, "_old_original_file", None) not in (None, instance.original_file.name)
+    if replaced:
+        queue_derivatives(instance, force=True)
+    elif needs_derivatives(instance):
+        queue_derivatives(instance)
+
+
+# ============================================================================
+# PHOTO MANIFESTS
+# ============================================================================
+
+@receiver(post_save, sender=AccommodationPhoto)
+@receiver(post_save, sender=TourPhoto)
+@receiver(post_delete, sender=AccommodationPhoto)
+@receiver(post_delete, sender=TourPhoto)
+def invalidate_listing_photo_manifest(sender, instance, **kwargs):
+    """
+    Drop the cached photo manifest of the listing a photo belongs to
+    """
+    invalidate_photo_manifest(instance)
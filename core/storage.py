@@ -0,0 +1,72 @@
+"""
+Content-Addressed Media Storage for BedBees
+Listing photos are stored once per distinct content, named by the SHA-256 of
+their bytes, so the same photo uploaded to several listings shares one file.
+Blobs are reference-counted by MediaBlob rows (see media_utils).
+"""
+
+import hashlib
+import os
+
+from django.core.files.storage import FileSystemStorage
+
+
+# Folder under MEDIA_ROOT holding every content-addressed file
+BLOB_PREFIX = 'blobs/'
+
+
+def content_hash(content):
+    """SHA-256 hex digest of a Django File, leaving it rewound"""
+    digest = hashlib.sha256()
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk if isinstance(chunk, bytes) else chunk.encode())
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    return digest.hexdigest()
+
+
+def blob_name(digest, extension):
+    """Storage name for content with this digest, e.g. blobs/ab/cd/abcd...jpg"""
+    return f'{BLOB_PREFIX}{digest[:2]}/{digest[2:4]}/{digest}{extension.lower()}'
+
+
+def is_blob(name):
+    """Whether a stored file name belongs to the content-addressed store"""
+    return bool(name) and name.startswith(BLOB_PREFIX)
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    FileSystemStorage that ignores upload_to and names each file by its
+    content hash. Saving bytes that are already stored writes nothing and
+    returns the existing name.
+    """
+
+    def __init__(self, **kwargs):
+        # Two uploads racing on the same blob write identical bytes
+        kwargs.setdefault('allow_overwrite', True)
+        super().__init__(**kwargs)
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is chosen from the content in _save()
+        return name
+
+    def _save(self, name, content):
+        extension = os.path.splitext(name)[1]
+        name = blob_name(content_hash(content), extension)
+        if self.exists(name):
+            return name
+        return super()._save(name, content)
+
+
+_storage = None
+
+
+def media_storage():
+    """Shared ContentAddressedStorage instance, used as the photo fields' storage"""
+    global _storage
+    if _storage is None:
+        _storage = ContentAddressedStorage()
+    return _storage
@@ -1,3 +1,868 @@
-from django.test import TestCase
+import io
+import os
+import random
+import shutil
+import tempfile
+from datetime import date, time, timedelta
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from . import destination_index, image_cache, images
+from .calendar_utils import (
+    bulk_upsert_accommodation_calendar,
+    evaluate_stay,
+    expand_calendar_dates,
+    load_accommodation_calendar,
+    load_listing_calendar_matrix,
+    load_tour_calendar,
+)
+from .destination_index import DestinationTrie
+from .geo_utils import cover_cells, encode_geohash, haversine_km, listings_within_radius
+from .media_utils import reconcile_blobs
+from .pagination_utils import bounded_count, encode_cursor, keyset_paginate
+from .rate_utils import materialize_rates
+from .search_index import reindex_listings, search_listing_ids, search_listings
+from .models import (
+    Accommodation,
+    AccommodationAvailability,
+    AccommodationPhoto,
+    Amenity,
+    AvailabilityDay,
+    DailyRate,
+    DayRoomInventory,
+    Listing,
+    MediaBlob,
+    RecurringRule,
+    RoomType,
+    SeasonalRate,
+    Tour,
+    TourAvailability,
+)
+
+
+def create_accommodation(host, **fields):
+    """Published accommodation with every required field filled in"""
+    values = {
+        'host': host,
+        'host_name': 'Host',
+        'entity_type': 'individual',
+        'contact_email': 'host@example.com',
+        'contact_phone': '+962700000000',
+        'business_address': 'Amman',
+        'property_name': 'Dead Sea Lodge',
+        'property_type': 'hotel',
+        'country': 'Jordan',
+        'city': 'Amman',
+        'street_address': '1 Main Street',
+        'num_rooms': 1,
+        'beds_per_room': 1,
+        'bed_type': 'single',
+        'num_bathrooms': 1,
+        'max_guests': 2,
+        'tagline': 'By the sea',
+        'full_description': 'A lodge by the sea',
+        'checkin_time': time(14),
+        'checkout_time': time(11),
+        'base_price': Decimal('100.00'),
+        'cancellation_policy': 'flexible',
+        'is_published': True,
+        'is_active': True,
+    }
+    values.update(fields)
+    return Accommodation.objects.create(**values)
+
+
+def create_tour(host, **fields):
+    """Published tour with every required field filled in"""
+    values = {
+        'host': host,
+        'host_name': 'Guide',
+        'contact_email': 'guide@example.com',
+        'contact_phone': '+962700000001',
+        'tour_name': 'Petra by Night',
+        'tour_category': 'cultural',
+        'duration': '3 hours',
+        'country': 'Jordan',
+        'city': 'Petra',
+        'languages': 'English',
+        'min_participants': 2,
+        'max_participants': 12,
+        'tagline': 'Candlelit Siq',
+        'full_description': 'Walk the Siq by candlelight',
+        'itinerary': 'Siq, Treasury',
+        'meeting_point': 'Visitor Centre',
+        'fitness_level': 'easy',
+        'cancellation_policy': 'flexible',
+        'price_per_person': Decimal('40.00'),
+        'is_published': True,
+        'is_active': True,
+    }
+    values.update(fields)
+    return Tour.objects.create(**values)
+
+
+def jpeg_upload(size=(1200, 800), color=(200, 100, 50), name='photo.jpg'):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, 'JPEG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/jpeg')
+
+
+class AccommodationDetailTests(TestCase):
+    def test_demo_accommodation_renders(self):
+        response = self.client.get(reverse('core:accommodation_detail', args=[1]))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context['is_demo'])
+
+    def test_database_accommodation_renders(self):
+        host = User.objects.create_user(username='host', password='password')
+        # Clear of the demo accommodation ids
+        accommodation = create_accommodation(host, id=1000)
+        AccommodationPhoto.objects.create(
+            accommodation=accommodation, original_file='https://example.com/lodge.jpg'
+        )
+
+        response = self.client.get(reverse('core:accommodation_detail', args=[accommodation.id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.context['is_demo'])
+        self.assertContains(response, 'alt="Dead Sea Lodge photo"')
+
+
+class MediaBlobTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.media_root = media_root
+
+        host = User.objects.create_user(username='host', password='password')
+        self.accommodation = create_accommodation(host)
+
+    def stored_files(self):
+        return sorted(
+            os.path.relpath(os.path.join(directory, name), self.media_root)
+            for directory, _, names in os.walk(self.media_root)
+            for name in names
+        )
+
+    def test_failed_save_removes_new_variants(self):
+        photo = AccommodationPhoto.objects.create(accommodation=self.accommodation, original_file=jpeg_upload())
+        original_save = AccommodationPhoto.save
+
+        def failing_save(instance, *args, **kwargs):
+            if kwargs.get('update_fields'):
+                raise DatabaseError('did not affect any rows')
+            return original_save(instance, *args, **kwargs)
+
+        with mock.patch.object(AccommodationPhoto, 'save', failing_save):
+            with self.assertRaises(DatabaseError):
+                images.generate_derivatives(photo)
+
+        self.assertEqual(self.stored_files(), [photo.original_file.name])
+        self.assertEqual(MediaBlob.objects.get().ref_count, 1)
+
+    def test_deleted_photo_is_not_written(self):
+        photo = AccommodationPhoto.objects.create(accommodation=self.accommodation, original_file=jpeg_upload())
+        AccommodationPhoto.objects.filter(pk=photo.pk).delete()
+
+        self.assertFalse(images.generate_derivatives(photo))
+        self.assertFalse(MediaBlob.objects.exists())
+
+    def test_second_worker_skips_completed_photo(self):
+        photo = AccommodationPhoto.objects.create(accommodation=self.accommodation, original_file=jpeg_upload())
+        first = AccommodationPhoto.objects.get(pk=photo.pk)
+        second = AccommodationPhoto.objects.get(pk=photo.pk)
+
+        self.assertTrue(images.generate_derivatives(first))
+        self.assertFalse(images.generate_derivatives(second))
+        self.assertEqual(reconcile_blobs(), {'corrected': 0, 'removed': 0, 'deleted': 0})
+
+    def test_reconcile_repairs_counts_and_orphans(self):
+        photo = AccommodationPhoto.objects.create(accommodation=self.accommodation, original_file=jpeg_upload())
+        MediaBlob.objects.update(ref_count=5)
+        orphan = os.path.join(self.media_root, 'blobs', 'ab', 'cd', 'abcd.webp')
+        os.makedirs(os.path.dirname(orphan))
+        with open(orphan, 'wb') as f:
+            f.write(b'orphan')
+        os.utime(orphan, (0, 0))
+
+        self.assertEqual(reconcile_blobs(), {'corrected': 1, 'removed': 0, 'deleted': 1})
+        self.assertEqual(MediaBlob.objects.get(name=photo.original_file.name).ref_count, 1)
+        self.assertFalse(os.path.exists(orphan))
+
+
+class AccommodationCalendarTests(TestCase):
+    def setUp(self):
+        host = User.objects.create_user(username='host', password='password')
+        self.accommodation = create_accommodation(host)
+        self.start = date(2030, 3, 1)
+        self.end = date(2030, 3, 10)
+
+    def test_bulk_upsert_inserts_in_constant_queries(self):
+        # Stored rows and daily rates are read once, then two upsert batches
+        with self.assertNumQueries(4):
+            previous, new = bulk_upsert_accommodation_calendar(
+                self.accommodation, self.start, self.end, {'is_blocked': True}, batch_size=5
+            )
+
+        self.assertEqual(previous, {})
+        self.assertEqual(len(new), 10)
+        self.assertEqual(
+            AccommodationAvailability.objects.filter(accommodation=self.accommodation, is_blocked=True).count(), 10
+        )
+
+    def test_bulk_upsert_updates_existing_rows(self):
+        bulk_upsert_accommodation_calendar(self.accommodation, self.start, self.end, {'is_blocked': True})
+
+        with self.assertNumQueries(3):
+            previous, new = bulk_upsert_accommodation_calendar(
+                self.accommodation, self.start, self.end, {'price_per_night': Decimal('150.00'), 'is_blocked': False}
+            )
+
+        self.assertEqual(len(previous), 10)
+        self.assertTrue(previous['2030-03-01']['is_blocked'])
+        self.assertEqual(new['2030-03-01'], {'price': 150.0, 'is_available': True, 'is_blocked': False})
+        rows = AccommodationAvailability.objects.filter(accommodation=self.accommodation)
+        self.assertEqual(rows.count(), 10)
+        self.assertFalse(rows.filter(is_blocked=True).exists())
+
+    def test_load_calendar_fills_missing_dates(self):
+        bulk_upsert_accommodation_calendar(self.accommodation, self.start, self.start, {'is_blocked': True})
+
+        calendar = load_accommodation_calendar(self.accommodation, self.start, self.start + timedelta(days=2))
+
+        self.assertEqual([day for day, _ in calendar], [self.start + timedelta(days=offset) for offset in range(3)])
+        self.assertTrue(calendar[0][1].is_blocked)
+        self.assertIsNone(calendar[1][1].pk)
+        self.assertEqual(calendar[1][1].price_per_night, Decimal('100.00'))
+
+
+class ListingCalendarTests(TestCase):
+    def setUp(self):
+        owner = User.objects.create_user(username='owner', password='password')
+        self.listing = Listing.objects.create(
+            owner=owner,
+            name='Wadi Rum Camp',
+            listing_type='accommodation',
+            country='Jordan',
+            city='Wadi Rum',
+            default_price=Decimal('80.00'),
+            default_min_stay=2,
+        )
+        self.room = RoomType.objects.create(
+            listing=self.listing, name='Dome', base_price=Decimal('120.00'), total_units=3, max_occupancy=2
+        )
+        RoomType.objects.create(
+            listing=self.listing, name='Tent', base_price=Decimal('60.00'), total_units=5, is_active=False
+        )
+        self.check_in = date(2030, 5, 6)
+
+    def night(self, offset):
+        return self.check_in + timedelta(days=offset)
+
+    def test_expand_calendar_dates_filters_weekdays(self):
+        # 2030-05-06 is a Monday
+        dates = expand_calendar_dates(self.check_in, self.night(13), weekday_filter=[0, 4])
+        self.assertEqual(dates, [self.night(0), self.night(4), self.night(7), self.night(11)])
+        self.assertEqual(len(expand_calendar_dates(self.check_in, self.night(13))), 14)
+
+    def test_load_listing_calendar_matrix(self):
+        AvailabilityDay.objects.create(listing=self.listing, date=self.night(1), status='CLOSED')
+        DayRoomInventory.objects.create(listing=self.listing, room_type=self.room, date=self.night(2), units_open=1)
+        DayRoomInventory.objects.create(listing=self.listing, room_type=self.room, date=self.night(9), units_open=1)
+
+        with self.assertNumQueries(3):
+            room_types, days, inventories = load_listing_calendar_matrix(self.listing, self.check_in, self.night(3))
+
+        self.assertEqual(room_types, [self.room])
+        self.assertEqual(list(days), [self.night(1)])
+        self.assertEqual(list(inventories), [(self.night(2), self.room.id)])
+
+    def test_evaluate_stay_quotes_base_price(self):
+        DayRoomInventory.objects.create(
+            listing=self.listing, room_type=self.room, date=self.night(1), units_open=3,
+            override_price=Decimal('150.00'),
+        )
+
+        quote = evaluate_stay(self.listing, self.room, self.check_in, self.night(3), guests=3)
+
+        self.assertTrue(quote['bookable'], quote['reasons'])
+        self.assertEqual(quote['units'], 2)
+        self.assertEqual([night['price'] for night in quote['nightly']], [Decimal('120.00'), Decimal('150.00'), Decimal('120.00')])
+        self.assertEqual(quote['total_price'], Decimal('780.00'))
+
+    def test_evaluate_stay_enforces_min_stay(self):
+        quote = evaluate_stay(self.listing, self.room, self.check_in, self.night(1))
+        self.assertFalse(quote['bookable'])
+        self.assertEqual(quote['reasons'], ['Minimum stay is 2 nights'])
+
+        AvailabilityDay.objects.create(listing=self.listing, date=self.check_in, min_stay=1)
+        self.assertTrue(evaluate_stay(self.listing, self.room, self.check_in, self.night(1))['bookable'])
+
+    def test_evaluate_stay_rejects_blackout_nights(self):
+        AvailabilityDay.objects.create(listing=self.listing, date=self.night(1), status='BLOCKED')
+        DayRoomInventory.objects.create(
+            listing=self.listing, room_type=self.room, date=self.night(2), units_open=3, stop_sell=True
+        )
+
+        quote = evaluate_stay(self.listing, self.room, self.check_in, self.night(3))
+
+        self.assertFalse(quote['bookable'])
+        self.assertEqual(quote['reasons'], [
+            f'{self.night(1).isoformat()} is blocked',
+            f'{self.night(2).isoformat()} is not for sale',
+        ])
+
+    def test_evaluate_stay_rejects_reversed_dates(self):
+        with self.assertRaises(ValueError):
+            evaluate_stay(self.listing, self.room, self.night(2), self.night(2))
+
+
+class RateMaterializationTests(TestCase):
+    def setUp(self):
+        host = User.objects.create_user(username='host', password='password')
+        self.accommodation = create_accommodation(host)
+        self.tour = create_tour(host)
+        self.today = timezone.localdate()
+        self.season_start = self.today + timedelta(days=10)
+        self.season_end = self.today + timedelta(days=12)
+
+    def rate(self, listing, day):
+        field = 'tour' if isinstance(listing, Tour) else 'accommodation'
+        return DailyRate.objects.get(**{field: listing}, date=day)
+
+    def create_season(self, **fields):
+        values = {
+            'name': 'Eid',
+            'rate_type': 'accommodation',
+            'start_date': self.season_start,
+            'end_date': self.season_end,
+            'price_multiplier': Decimal('1.50'),
+        }
+        values.update(fields)
+        return SeasonalRate.objects.create(**values)
+
+    def test_new_listing_is_materialized_at_base_price(self):
+        self.assertEqual(self.rate(self.accommodation, self.today).price, Decimal('100.00'))
+        self.assertEqual(self.rate(self.tour, self.today).price, Decimal('40.00'))
+
+    def test_adding_and_removing_a_rule(self):
+        season = self.create_season(min_stay=3)
+
+        season.accommodations.add(self.accommodation)
+        rate = self.rate(self.accommodation, self.season_start)
+        self.assertEqual((rate.price, rate.min_stay), (Decimal('150.00'), 3))
+        self.assertEqual(self.rate(self.accommodation, self.season_end + timedelta(days=1)).price, Decimal('100.00'))
+
+        season.accommodations.remove(self.accommodation)
+        rate = self.rate(self.accommodation, self.season_start)
+        self.assertEqual((rate.price, rate.min_stay), (Decimal('100.00'), 1))
+
+    def test_editing_a_rule(self):
+        season = self.create_season()
+        season.accommodations.add(self.accommodation)
+
+        season.fixed_price = Decimal('90.00')
+        season.is_blackout = True
+        season.save()
+
+        rate = self.rate(self.accommodation, self.season_start)
+        self.assertEqual((rate.price, rate.is_available), (Decimal('90.00'), False))
+
+    def test_deleting_a_rule(self):
+        season = self.create_season()
+        season.accommodations.add(self.accommodation)
+        rule = RecurringRule.objects.create(
+            name='Weekends', rule_type='weekly', start_date=self.today, is_available=False
+        )
+        rule.tours.add(self.tour)
+        self.assertFalse(self.rate(self.tour, self.today).is_available)
+
+        season.delete()
+        rule.delete()
+
+        self.assertEqual(self.rate(self.accommodation, self.season_start).price, Decimal('100.00'))
+        self.assertTrue(self.rate(self.tour, self.today).is_available)
+
+    def test_base_price_change(self):
+        season = self.create_season()
+        season.accommodations.add(self.accommodation)
+
+        self.accommodation.base_price = Decimal('200.00')
+        self.accommodation.save()
+
+        self.assertEqual(self.rate(self.accommodation, self.today).price, Decimal('200.00'))
+        self.assertEqual(self.rate(self.accommodation, self.season_start).price, Decimal('300.00'))
+
+    def test_unrelated_save_does_not_rematerialize(self):
+        with mock.patch('core.signals.materialize_rates') as materialize:
+            self.accommodation.tagline = 'Quiet rooms'
+            self.accommodation.save()
+        materialize.assert_not_called()
+
+    def test_materialize_rates_returns_rows_written(self):
+        end = self.today + timedelta(days=6)
+        self.assertEqual(materialize_rates(self.tour, self.today, end), 7)
+
+    def test_tour_calendar_prices_unscheduled_days_from_daily_rates(self):
+        season = self.create_season(rate_type='tour', fixed_price=Decimal('55.00'))
+        season.tours.add(self.tour)
+        scheduled = TourAvailability.objects.create(
+            tour=self.tour,
+            date=self.season_end,
+            price_per_person=Decimal('70.00'),
+            max_participants=8,
+        )
+
+        with self.assertNumQueries(2):
+            days = load_tour_calendar(self.tour, self.season_start, self.season_end)
+
+        self.assertEqual([day for day, _ in days], [self.season_start, self.season_start + timedelta(days=1), self.season_end])
+        first = days[0][1][0]
+        self.assertIsNone(first.pk)
+        self.assertEqual((first.price_per_person, first.max_participants), (Decimal('55.00'), 12))
+        self.assertEqual(days[2][1], [scheduled])
+
+    def test_tour_calendar_api(self):
+        self.client.force_login(self.tour.host)
+        response = self.client.get(reverse('core:api_tour_calendar', args=[self.tour.id]), {
+            'start_date': self.today.isoformat(),
+            'end_date': (self.today + timedelta(days=1)).isoformat(),
+        })
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['tour']['name'], 'Petra by Night')
+        self.assertEqual([entry['price'] for entry in data['calendar']], [40.0, 40.0])
+
+
+class SearchIndexTests(TestCase):
+    def setUp(self):
+        self.host = User.objects.create_user(username='host', password='password')
+
+    def test_publish_and_unpublish(self):
+        accommodation = create_accommodation(self.host, property_name='Wadi Rum Camp', is_published=False)
+        self.assertEqual(search_listing_ids(Accommodation, 'rum'), [])
+
+        accommodation.is_published = True
+        accommodation.save()
+        self.assertEqual(search_listing_ids(Accommodation, 'rum'), [accommodation.id])
+
+        accommodation.is_active = False
+        accommodation.save()
+        self.assertEqual(search_listing_ids(Accommodation, 'rum'), [])
+
+    def test_edit_and_delete(self):
+        tour = create_tour(self.host)
+        tour.tour_name = 'Jerash Chariot Race'
+        tour.save()
+        self.assertEqual(search_listing_ids(Tour, 'petra'), [tour.id])
+        self.assertEqual(search_listing_ids(Tour, 'chariot'), [tour.id])
+        self.assertEqual(search_listing_ids(Tour, 'candlelight siq'), [tour.id])
+
+        tour_id = tour.id
+        tour.delete()
+        self.assertEqual(search_listing_ids(Tour, 'chariot'), [])
+        self.assertNotIn(tour_id, search_listing_ids(Tour, 'jerash'))
+
+    def test_reindex_after_queryset_update(self):
+        accommodation = create_accommodation(self.host, property_name='Aqaba Reef Hotel')
+        Accommodation.objects.filter(id=accommodation.id).update(is_published=False)
+        self.assertEqual(search_listing_ids(Accommodation, 'reef'), [accommodation.id])
+
+        self.assertEqual(reindex_listings(Accommodation, [accommodation.id]), 1)
+        self.assertEqual(search_listing_ids(Accommodation, 'reef'), [])
+
+    def test_ranking_prefers_heavier_fields(self):
+        in_description = create_accommodation(
+            self.host, property_name='Hilltop Inn', full_description='A short walk to the citadel'
+        )
+        in_tagline = create_accommodation(
+            self.host, property_name='Old Town Rooms', tagline='Views of the citadel'
+        )
+        in_name = create_accommodation(self.host, property_name='Citadel House')
+        create_accommodation(self.host, property_name='Desert Camp')
+
+        queryset, ranked_ids = search_listings(Accommodation.objects.all(), 'citad')
+
+        self.assertEqual(ranked_ids, [in_name.id, in_tagline.id, in_description.id])
+        self.assertEqual(set(queryset.values_list('id', flat=True)), set(ranked_ids))
+
+    def test_every_word_must_match(self):
+        accommodation = create_accommodation(self.host, property_name='Dana Eco Lodge')
+        create_accommodation(self.host, property_name='Dana Guest House')
+
+        self.assertEqual(search_listing_ids(Accommodation, 'dana eco'), [accommodation.id])
+        self.assertEqual(search_listing_ids(Accommodation, '"*)'), [])
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        host = User.objects.create_user(username='host', password='password')
+        # Prices repeat so page boundaries fall inside runs of equal sort keys
+        for price in ('80.00', '120.00', '120.00', '80.00', '95.50', '120.00', '80.00', '95.50'):
+            create_accommodation(host, base_price=Decimal(price))
+
+    def walk(self, ordering, page_size):
+        pages, cursor = [], None
+        while True:
+            rows, cursor = keyset_paginate(Accommodation.objects.all(), ordering, cursor, page_size)
+            pages.append([row.id for row in rows])
+            if cursor is None:
+                return pages
+
+    def test_pages_follow_order_across_ties(self):
+        for ordering in (['base_price', 'id'], ['-base_price', '-id'], ['-base_price', 'id']):
+            with self.subTest(ordering=ordering):
+                expected = list(Accommodation.objects.order_by(*ordering).values_list('id', flat=True))
+                pages = self.walk(ordering, page_size=3)
+                self.assertEqual([len(page) for page in pages], [3, 3, 2])
+                self.assertEqual([pk for page in pages for pk in page], expected)
+
+    def test_exact_final_page_has_no_cursor(self):
+        pages = self.walk(['-created_at', '-id'], page_size=4)
+        self.assertEqual([len(page) for page in pages], [4, 4])
+
+    def test_one_query_per_page(self):
+        _, cursor = keyset_paginate(Accommodation.objects.all(), ['base_price', 'id'], page_size=3)
+        with self.assertNumQueries(1):
+            keyset_paginate(Accommodation.objects.all(), ['base_price', 'id'], cursor, page_size=3)
+
+    def test_invalid_cursor_restarts(self):
+        first_page, _ = keyset_paginate(Accommodation.objects.all(), ['id'], page_size=3)
+        for cursor in ('not-base64!', encode_cursor([1, 2])):
+            rows, _ = keyset_paginate(Accommodation.objects.all(), ['id'], cursor, page_size=3)
+            self.assertEqual(rows, first_page)
+
+    def test_bounded_count(self):
+        self.assertEqual(bounded_count(Accommodation.objects.all(), limit=10), (8, True))
+        self.assertEqual(bounded_count(Accommodation.objects.all(), limit=8), (8, True))
+        self.assertEqual(bounded_count(Accommodation.objects.all(), limit=5), (5, False))
+        self.assertEqual(bounded_count(Accommodation.objects.filter(base_price__gt=100)), (3, True))
+
+
+class GeoTests(TestCase):
+    def assert_covers(self, south, west, north, east, max_cells=32):
+        cells = cover_cells(south, west, north, east, max_cells)
+        self.assertLessEqual(len(cells), max_cells)
+
+        width = (east - west) % 360 or 360
+        steps = 40
+        for i in range(steps + 1):
+            latitude = south + (north - south) * i / steps
+            for j in range(steps + 1):
+                longitude = west + width * j / steps
+                if longitude > 180:
+                    longitude -= 360
+                geohash = encode_geohash(latitude, longitude)
+                self.assertTrue(
+                    geohash.startswith(tuple(cells)),
+                    f'({latitude}, {longitude}) -> {geohash} not in {cells}',
+                )
+        return cells
+
+    def test_cover_cells_contains_box(self):
+        for box in (
+            (31.90, 35.85, 32.00, 35.98),   # Amman
+            (29.0, 34.9, 33.4, 39.3),       # Jordan
+            (-0.5, -0.5, 0.5, 0.5),         # equator and prime meridian
+            (60.0, 170.0, 89.9, 180.0),     # north-east corner of the grid
+            (-90.0, -180.0, 90.0, 180.0),   # whole world
+        ):
+            with self.subTest(box=box):
+                self.assert_covers(*box)
+
+    def test_cover_cells_across_antimeridian(self):
+        # Fiji: the box runs east from 177E over the antimeridian to 178W
+        cells = self.assert_covers(-19.0, 177.0, -16.0, -178.0)
+        self.assertTrue(any(encode_geohash(-17.5, 179.5).startswith(cell) for cell in cells))
+        self.assertTrue(any(encode_geohash(-17.5, -179.5).startswith(cell) for cell in cells))
+        self.assertFalse(any(encode_geohash(-17.5, 0.0).startswith(cell) for cell in cells))
+
+    def test_listings_within_radius_matches_haversine(self):
+        host = User.objects.create_user(username='host', password='password')
+        rng = random.Random(7)
+        centers = [(31.95, 35.91), (-17.7, 179.9), (70.0, 25.0)]
+        for latitude, longitude in centers:
+            for _ in range(30):
+                point_lng = longitude + rng.uniform(-1.5, 1.5)
+                if point_lng > 180:
+                    point_lng -= 360
+                create_accommodation(
+                    host,
+                    latitude=Decimal(f'{latitude + rng.uniform(-0.5, 0.5):.6f}'),
+                    longitude=Decimal(f'{point_lng:.6f}'),
+                )
+        create_accommodation(host)
+
+        accommodations = list(Accommodation.objects.exclude(latitude=None))
+        for latitude, longitude in centers:
+            for radius in (20, 40, 80):
+                with self.subTest(center=(latitude, longitude), radius=radius):
+                    expected = sorted(
+                        (haversine_km(latitude, longitude, a.latitude, a.longitude), a.id)
+                        for a in accommodations
+                    )
+                    expected = [pk for distance, pk in expected if distance <= radius]
+                    self.assertTrue(expected)
+
+                    nearby = listings_within_radius(Accommodation.objects.all(), latitude, longitude, radius)
+                    self.assertEqual([listing.id for listing in nearby], expected)
+                    for listing in nearby:
+                        self.assertAlmostEqual(
+                            listing.distance_km,
+                            haversine_km(latitude, longitude, listing.latitude, listing.longitude),
+                        )
+
+        nearest = listings_within_radius(Accommodation.objects.all(), *centers[0], radius_km=60, limit=3)
+        self.assertEqual(len(nearest), 3)
+
+
+class DestinationTrieTests(TestCase):
+    def setUp(self):
+        self.trie = DestinationTrie(top_k=3)
+        for key, label, score in (
+            ('amman', 'Amman, Jordan', 40),
+            ('aqaba', 'Aqaba, Jordan', 25),
+            ('ajloun', 'Ajloun, Jordan', 5),
+            ('antalya', 'Antalya, Turkey', 25),
+            ('dead-sea', 'Dead Sea, Jordan', 30),
+            ('goreme', 'Göreme, Turkey', 10),
+        ):
+            self.trie.upsert(key, label, 'city', f'/{key}/', score)
+
+    def labels(self, prefix, limit=3):
+        return [entry['label'] for entry in self.trie.search(prefix, limit)]
+
+    def test_prefix_search(self):
+        self.assertEqual(self.labels('aqa'), ['Aqaba, Jordan'])
+        self.assertEqual(self.labels('sea'), ['Dead Sea, Jordan'])
+        self.assertEqual(self.labels('GORE'), ['Göreme, Turkey'])
+        self.assertEqual(self.labels('jordan', limit=10), self.labels('jor', limit=10))
+        self.assertEqual(self.labels('xyz'), [])
+        self.assertEqual(self.labels('  '), [])
+
+    def test_top_k_by_score_then_label(self):
+        self.assertEqual(self.labels('a'), ['Amman, Jordan', 'Antalya, Turkey', 'Aqaba, Jordan'])
+        self.assertEqual(self.labels('a', limit=1), ['Amman, Jordan'])
+        self.assertEqual(self.labels('jordan'), ['Amman, Jordan', 'Dead Sea, Jordan', 'Aqaba, Jordan'])
+
+    def test_update_and_remove_reorder_ancestors(self):
+        self.trie.upsert('ajloun', 'Ajloun, Jordan', 'city', '/ajloun/', 50)
+        self.assertEqual(self.labels('a'), ['Ajloun, Jordan', 'Amman, Jordan', 'Antalya, Turkey'])
+
+        self.trie.remove('amman')
+        self.trie.remove('missing')
+        self.assertEqual(self.labels('a'), ['Ajloun, Jordan', 'Antalya, Turkey', 'Aqaba, Jordan'])
+        self.assertEqual(self.labels('amm'), [])
+
+        self.trie.upsert('dead-sea', 'Mujib, Jordan', 'city', '/mujib/', 30)
+        self.assertEqual(self.labels('dead'), [])
+        self.assertEqual(self.labels('mujib'), ['Mujib, Jordan'])
+
+
+class DestinationIndexTests(TestCase):
+    def setUp(self):
+        self.host = User.objects.create_user(username='host', password='password')
+        for name, value in (('_index', None), ('_built_at', 0)):
+            patcher = mock.patch.object(destination_index, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def cities(self, prefix):
+        return [entry['label'] for entry in destination_index.autocomplete(prefix) if entry['type'] == 'city']
+
+    def test_refresh_city_follows_listing_changes(self):
+        create_accommodation(self.host, city='Madaba')
+        self.assertEqual(self.cities('madab'), ['Madaba, Jordan'])
+
+        tour = create_tour(self.host, city='Karak')
+        self.assertEqual(self.cities('kara'), ['Karak, Jordan'])
+
+        tour.city = 'Madaba'
+        tour.save()
+        self.assertEqual(self.cities('kara'), [])
+
+        tour.is_published = False
+        tour.save()
+        self.assertEqual(self.cities('madab'), ['Madaba, Jordan'])
+
+        Accommodation.objects.get(city='Madaba').delete()
+        self.assertEqual(self.cities('madab'), [])
+
+    def test_refresh_city_is_a_no_op_before_first_build(self):
+        with self.assertNumQueries(0):
+            destination_index.refresh_city('Madaba', 'Jordan')
+
+    def test_stale_index_is_served_while_rebuilding(self):
+        current = destination_index.get_index()
+        destination_index._built_at -= destination_index.DESTINATION_INDEX_TTL + 1
+
+        with mock.patch.object(destination_index.threading, 'Thread') as thread:
+            self.assertIs(destination_index.get_index(), current)
+            self.assertIs(destination_index.get_index(), current)
+        thread.assert_called_once()
+        thread.return_value.start.assert_called_once_with()
+
+    def test_rebuild_keeps_updates_made_during_the_build(self):
+        old = destination_index.get_index()
+        build_index = destination_index.build_index
+
+        def build_while_publishing():
+            trie = build_index()
+            create_accommodation(self.host, city='Jerash')
+            return trie
+
+        with mock.patch.object(destination_index, 'build_index', side_effect=build_while_publishing):
+            destination_index.rebuild_index()
+
+        self.assertIsNot(destination_index.get_index(), old)
+        self.assertEqual(self.cities('jera'), ['Jerash, Jordan'])
+        self.assertIsNone(destination_index._pending)
+
+
+class ResizedImageTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.cache_dir = os.path.join(media_root, 'cache')
+        patcher = mock.patch.object(image_cache, 'CACHE_DIR', self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        host = User.objects.create_user(username='host', password='password')
+        accommodation = create_accommodation(host)
+        self.photo = AccommodationPhoto.objects.create(
+            accommodation=accommodation, original_file=jpeg_upload(size=(1200, 800))
+        )
+        self.url = image_cache.resized_photo_url(self.photo, 480)
+
+    def test_renders_and_caches_variant(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/webp')
+        self.assertIn('immutable', response['Cache-Control'])
+        with Image.open(io.BytesIO(b''.join(response.streaming_content))) as variant:
+            self.assertEqual(variant.size, (480, 320))
+
+        with mock.patch.object(image_cache, 'render_variant') as render:
+            response = self.client.get(self.url)
+            self.assertEqual(response.status_code, 200)
+            b''.join(response.streaming_content)
+        render.assert_not_called()
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_unknown_requests_are_not_found(self):
+        version = image_cache.source_version(self.photo.original_file.name)
+        for kwargs in (
+            {'kind': 'accommodation', 'photo_id': self.photo.pk, 'version': version, 'width': 500, 'fmt': 'webp'},
+            {'kind': 'accommodation', 'photo_id': self.photo.pk, 'version': version, 'width': 480, 'fmt': 'bmp'},
+            {'kind': 'villa', 'photo_id': self.photo.pk, 'version': version, 'width': 480, 'fmt': 'webp'},
+            {'kind': 'tour', 'photo_id': self.photo.pk, 'version': version, 'width': 480, 'fmt': 'webp'},
+        ):
+            with self.subTest(**kwargs):
+                self.assertEqual(self.client.get(reverse('core:resized_photo', kwargs=kwargs)).status_code, 404)
+
+    def test_stale_version_redirects_to_current(self):
+        stale = self.url.replace(image_cache.source_version(self.photo.original_file.name), 'a' * 12)
+        response = self.client.get(stale)
+        self.assertRedirects(response, self.url, fetch_redirect_response=False)
+
+    def test_unreadable_image_is_not_found(self):
+        with mock.patch.object(image_cache, 'render_variant', side_effect=ValueError('bad tile')):
+            with self.assertLogs('core.views_media', 'ERROR'):
+                response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 404)
+
+    def test_variant_evicted_before_open_is_rendered_again(self):
+        get_variant = image_cache.get_variant
+        calls = []
+
+        def evicted_once(key, fmt, width, open_source):
+            path = get_variant(key, fmt, width, open_source)
+            if not calls:
+                os.remove(path)
+            calls.append(path)
+            return path
+
+        with mock.patch('core.views_media.get_variant', side_effect=evicted_once):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(b''.join(response.streaming_content))
+        self.assertEqual(len(calls), 2)
+
+    def test_remote_original_redirects_only_to_allowed_hosts(self):
+        allowed = 'https://images.unsplash.com/photo-1?w=2070'
+        for original, status in (
+            (allowed, 302),
+            ('https://evil.example.com/phish', 404),
+            ('http://images.unsplash.com/photo-1', 404),
+        ):
+            with self.subTest(original=original):
+                AccommodationPhoto.objects.filter(pk=self.photo.pk).update(original_file=original)
+                url = reverse('core:resized_photo', kwargs={
+                    'kind': 'accommodation',
+                    'photo_id': self.photo.pk,
+                    'version': 'x',
+                    'width': 480,
+                    'fmt': 'webp',
+                })
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status)
+                if status == 302:
+                    self.assertEqual(response['Location'], allowed)
+
+    def test_evict_removes_least_recently_used(self):
+        paths = []
+        for index in range(4):
+            path = image_cache.cache_path(image_cache.cache_key(f'source-{index}', 480, 'webp'), 'webp')
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b'x' * 100)
+            paths.append(path)
+        # Oldest first, except that the first file was used most recently
+        for age, path in zip((10, 400, 300, 200), paths):
+            os.utime(path, (1_000_000 - age, 1_000_000 - age))
+
+        self.assertEqual(image_cache.evict(max_bytes=400), 0)
+        self.assertEqual(image_cache.evict(max_bytes=250), 2)
+        self.assertEqual([os.path.exists(path) for path in paths], [True, False, False, True])
+
+
+class AmenityTests(TestCase):
+    def test_links_follow_amenities_field(self):
+        host = User.objects.create_user(username='host', password='password')
+        accommodation = create_accommodation(host, amenities="['WiFi, Pool', ' WiFi', 'Parking']")
+        self.assertEqual(accommodation.get_amenities_list(), ['WiFi', 'Pool', 'Parking'])
+
+        accommodation.amenities = 'Parking, Breakfast'
+        accommodation.save()
+        self.assertEqual(accommodation.get_amenities_list(), ['Parking', 'Breakfast'])
+
+    def test_any_name_from_the_amenities_field_fits(self):
+        field_length = Accommodation._meta.get_field('amenities').max_length
+        name = 'A' * field_length
+
+        Amenity(name=name).full_clean()
+        host = User.objects.create_user(username='host', password='password')
+        accommodation = create_accommodation(host, amenities=name)
+        self.assertEqual(accommodation.get_amenities_list(), [name])
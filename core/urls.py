@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views, api_views, calendar_api, views_genius, views_publishing
+from . import views, api_views, calendar_api, views_genius, views_media, views_publishing
 
 # Set the app name for namespacing
 app_name = "core"
@@ -38,6 +38,16 @@ urlpatterns = [
         calendar_api.get_public_accommodation_availability,
         name="api_public_accommodation_availability",
     ),
+    path(
+        "api/listing/<int:listing_id>/quote/",
+        api_views.stay_quote,
+        name="api_stay_quote",
+    ),
+    path(
+        "api/destinations/autocomplete/",
+        api_views.destination_autocomplete,
+        name="api_destination_autocomplete",
+    ),
     path(
         "api/user/accommodations/",
         calendar_api.get_user_accommodations,
@@ -238,4 +248,15 @@ urlpatterns = [
         views_publishing.get_published_listings_by_location,
         name="api_listings_by_location",
     ),
+    # Resized images, rendered on first request and cached on disk
+    path(
+        "img/static/<str:version>/<int:width>.<str:fmt>/<path:path>",
+        views_media.resized_static,
+        name="resized_static",
+    ),
+    path(
+        "img/<str:kind>/<int:photo_id>/<str:version>/<int:width>.<str:fmt>",
+        views_media.resized_photo,
+        name="resized_photo",
+    ),
 ]
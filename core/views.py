@@ -27,13 +27,34 @@ from .models import (
     RentalCarPhoto,
     Country,
 )
-from .data import countries_data, demo_attractions
+from .search_utils import (
+    filter_amenities,
+    filter_available_accommodations,
+    get_cached_facets,
+    parse_stay_dates,
+)
+from .search_index import annotate_rank, reindex_listings, search_listings
+from .pagination_utils import bounded_count, keyset_paginate
+from .geo_utils import filter_in_viewport, listings_within_radius, parse_bbox, parse_coordinates
+from .country_utils import apply_country_counts, update_listing_visibility
+from . import destination_index
+from .photo_utils import get_photo_manifest
+from .data import (
+    countries_data,
+    demo_accommodation_details,
+    demo_attractions,
+    demo_booking_accommodations,
+    demo_tour_details,
+    photo_placeholders,
+)
 from .data.demo_accommodations import (
     demo_accommodations_data,
     get_featured_accommodations,
     get_guest_favorite_accommodations,
     get_unique_accommodations,
     get_popular_accommodations,
+    get_accommodations_by_type,
+    search_accommodations,
 )
 
 
@@ -134,8 +155,12 @@ def search_results(request):
     wheelchair = request.GET.get("wheelchair", False)
     elevator = request.GET.get("elevator", False)
 
-    # Sorting
-    sort_by = request.GET.get("sort", "popular")
+    # Map viewport as "south,west,north,east"
+    bbox = request.GET.get("bbox", "")
+
+    # Sorting (text searches default to best match first)
+    sort_by = request.GET.get("sort", "relevance" if destination else "popular")
+    ranked_ids = None
 
     # Query database based on search type
     if search_type == "tours":
@@ -145,25 +170,31 @@ def search_results(request):
             .prefetch_related("photos")
         )
 
+        price_field = "price_per_person"
+
         # Apply filters
         if destination:
-            results = results.filter(city__icontains=destination)
+            results, ranked_ids = search_listings(results, destination)
 
         if min_price and max_price:
             results = results.filter(
-                base_price__gte=min_price, base_price__lte=max_price
+                price_per_person__gte=min_price, price_per_person__lte=max_price
             )
 
+        if tour_types:
+            results = results.filter(tour_category__in=tour_types)
+
     else:  # hotels/accommodations
         results = (
             Accommodation.objects.filter(is_published=True, is_active=True)
             .select_related("host")
             .prefetch_related("photos")
         )
+        price_field = "base_price"
 
         # Apply filters
         if destination:
-            results = results.filter(city__icontains=destination)
+            results, ranked_ids = search_listings(results, destination)
 
         if min_price and max_price:
             results = results.filter(
@@ -173,18 +204,71 @@ def search_results(request):
         if property_types:
             results = results.filter(property_type__in=property_types)
 
-    # Apply sorting
-    if sort_by == "price_low":
-        results = results.order_by("base_price")
+        selected_stars = [int(stars) for stars in star_ratings if stars.isdigit()]
+        if selected_stars:
+            results = results.filter(star_rating__in=selected_stars)
+
+        if amenities:
+            results = filter_amenities(results, amenities)
+
+        viewport = parse_bbox(bbox)
+        if viewport:
+            results = filter_in_viewport(results, *viewport)
+
+        # Only keep listings open for every night of the requested stay
+        stay_checkin, stay_checkout = parse_stay_dates(checkin, checkout)
+        if stay_checkin:
+            try:
+                rooms_needed = max(1, int(rooms))
+            except ValueError:
+                rooms_needed = 1
+            results = filter_available_accommodations(
+                results, stay_checkin, stay_checkout, rooms_needed
+            )
+
+    # Facet counts for the filtered results, one aggregate per distinct query
+    facets = get_cached_facets(
+        results,
+        {
+            "type": search_type,
+            "destination": destination,
+            "checkin": checkin,
+            "checkout": checkout,
+            "rooms": rooms,
+            "min_price": min_price,
+            "max_price": max_price,
+            "property_type": property_types,
+            "tour_type": tour_types,
+            "star_rating": star_ratings,
+            "amenities": amenities,
+            "bbox": bbox,
+        },
+    )
+
+    # Apply sorting; every ordering ends on id so it can be used as a keyset
+    if sort_by == "relevance" and ranked_ids is not None:
+        results = annotate_rank(results, ranked_ids)
+        ordering = ("search_rank", "id")
+    elif sort_by == "price_low":
+        ordering = (price_field, "id")
     elif sort_by == "price_high":
-        results = results.order_by("-base_price")
+        ordering = ("-" + price_field, "-id")
     elif sort_by == "newest":
-        results = results.order_by("-created_at")
+        ordering = ("-created_at", "-id")
+    elif sort_by == "popular":
+        # Maintained by the update_popularity command
+        ordering = ("-popularity_score", "-id")
     else:
-        results = results.order_by("-created_at")  # Default
+        ordering = ("-created_at", "-id")  # Default
+
+    # Only the current page is loaded; the count stops at COUNT_LIMIT rows
+    results_count, results_count_exact = bounded_count(results)
+    page, next_cursor = keyset_paginate(
+        results, ordering, request.GET.get("cursor")
+    )
 
     context = {
-        "results": results,
+        "results": page,
         "search_type": search_type,
         "destination": destination,
         "checkin": checkin,
@@ -205,7 +289,11 @@ def search_results(request):
         "wheelchair": wheelchair,
         "elevator": elevator,
         "sort_by": sort_by,
-        "results_count": results.count(),
+        "bbox": bbox,
+        "results_count": results_count,
+        "results_count_exact": results_count_exact,
+        "next_cursor": next_cursor,
+        "facets": facets,
     }
 
     return render(request, "core/search_results.html", context)
@@ -566,15 +654,22 @@ def tours(request, category=None):
         else "Explore All Experiences"
     )
 
-    # Combine real and demo tours
-    combined_tours = list(real_tours) + tours if real_tours.exists() else tours
+    # Combine real and demo tours: real tours are paged by keyset and the
+    # in-memory demo tours follow on the last page
+    real_page, next_cursor = keyset_paginate(
+        real_tours, ("-created_at", "-id"), request.GET.get("cursor")
+    )
+    real_count, real_count_exact = bounded_count(real_tours)
+    combined_tours = real_page + tours if next_cursor is None else real_page
 
     context = {
         "tours": combined_tours,
-        "real_tours": real_tours,
+        "real_tours": real_page,
         "category": category,
         "display_category": display_category,
-        "total_tours": len(combined_tours),
+        "total_tours": real_count + len(tours),
+        "total_tours_exact": real_count_exact,
+        "next_cursor": next_cursor,
         "all_categories": category_names,
         "search_query": search_query,
     }
@@ -688,40 +783,17 @@ def accommodations(request):
         is_published=True, is_active=True
     ).select_related("host")
 
-    # Demo accommodations data from our new data file
-    demo_accommodations_list = list(demo_accommodations_data.values())
-
-    # Handle search functionality
+    # Handle search functionality (prebuilt token index over the demo data)
     search_query = request.GET.get("q", "").strip()
-    accommodations = demo_accommodations_list
+    accommodation_type = request.GET.get("type")
 
     if search_query:
-        # Filter accommodations based on search query
-        filtered_accommodations = []
-        query_lower = search_query.lower()
-
-        for accommodation in demo_accommodations_list:
-            # Search in name, location, description, type, and amenities
-            if (
-                query_lower in accommodation["name"].lower()
-                or query_lower in accommodation["location"].lower()
-                or query_lower in accommodation["description"].lower()
-                or query_lower in accommodation["type"].lower()
-                or any(
-                    query_lower in amenity.lower()
-                    for amenity in accommodation["amenities"]
-                )
-            ):
-                filtered_accommodations.append(accommodation)
-
-        accommodations = filtered_accommodations
-
-    # Filter by type if provided (in addition to search)
-    accommodation_type = request.GET.get("type")
-    if accommodation_type and not search_query:
-        accommodations = [
-            acc for acc in accommodations if acc["type"] == accommodation_type
-        ]
+        accommodations = list(search_accommodations(search_query).values())
+    elif accommodation_type:
+        # Filter by type if provided (only without a search query)
+        accommodations = list(get_accommodations_by_type(accommodation_type).values())
+    else:
+        accommodations = list(demo_accommodations_data.values())
 
     # Get booking parameters
     checkin = request.GET.get("checkin", "")
@@ -740,18 +812,23 @@ def accommodations(request):
 
         checkout = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
 
-    # Combine real and demo accommodations
+    # Combine real and demo accommodations: real listings are paged by keyset
+    # and the in-memory demo accommodations follow on the last page
+    real_page, next_cursor = keyset_paginate(
+        real_accommodations, ("-created_at", "-id"), request.GET.get("cursor")
+    )
+    real_count, real_count_exact = bounded_count(real_accommodations)
     combined_accommodations = (
-        list(real_accommodations) + accommodations
-        if real_accommodations.exists()
-        else accommodations
+        real_page + accommodations if next_cursor is None else real_page
     )
 
     context = {
         "accommodations": combined_accommodations,
-        "real_accommodations": real_accommodations,
+        "real_accommodations": real_page,
         "current_type": accommodation_type,
-        "total_accommodations": len(combined_accommodations),
+        "total_accommodations": real_count + len(accommodations),
+        "total_accommodations_exact": real_count_exact,
+        "next_cursor": next_cursor,
         "types": ["resort", "hotel", "chalet", "riad", "bungalow", "apartment"],
         "search_query": search_query,
         "checkin": checkin,
@@ -801,6 +878,7 @@ def accommodation_detail(request, id):
             photo_dict = {
                 "id": idx,
                 "image_url": photo_url,
+                "placeholder": photo_placeholders.get(photo_url, ""),
                 "alt_text": f"{accommodation.get('name', '')} photo {idx+1}",
                 "title": f"{accommodation.get('name', '')} - Image {idx+1}",
                 "caption": "",
@@ -837,69 +915,17 @@ def accommodation_detail(request, id):
         # If accommodation not found, redirect to accommodations list
         return redirect("core:accommodations")
 
-    # Get photos for this accommodation, ordered by display_order
-    photos = AccommodationPhoto.objects.filter(
-        accommodation=accommodation, visibility__in=["public", "hidden"]
-    ).order_by("display_order", "id")
-
-    # Separate hero photos (first few or marked as hero) and all photos
-    hero_photos_queryset = photos.filter(is_hero=True)[:6]  # Up to 6 hero photos
-    if not hero_photos_queryset.exists():
-        # If no hero photos marked, use first 6 photos
-        hero_photos_queryset = photos[:6]
-
-    # All photos for lightbox
-    all_photos_queryset = photos
-
-    # Pass the QuerySets directly to template for rendering
-    hero_photos = list(hero_photos_queryset)
-    all_photos = list(all_photos_queryset)
-    total_photos = len(all_photos)
-
-    # Create serializable dictionaries for JSON (used by JavaScript)
-    hero_photos_json = []
-    for photo in hero_photos:
-        hero_photos_json.append(
-            {
-                "id": photo.id,
-                "image_url": photo.get_image_url("large"),
-                "alt_text": photo.alt_text
-                or photo.title
-                or f"{accommodation.property_name} photo",
-                "title": photo.title,
-                "caption": photo.caption,
-                "display_order": photo.display_order,
-                "is_hero": photo.is_hero,
-                "media_type": photo.media_type,
-            }
-        )
-
-    all_photos_json = []
-    for photo in all_photos:
-        all_photos_json.append(
-            {
-                "id": photo.id,
-                "image_url": photo.get_image_url("large"),
-                "alt_text": photo.alt_text
-                or photo.title
-                or f"{accommodation.property_name} photo",
-                "title": photo.title,
-                "caption": photo.caption,
-                "display_order": photo.display_order,
-                "is_hero": photo.is_hero,
-                "media_type": photo.media_type,
-            }
-        )
+    # Ordered photos and hero subset, cached per accommodation
+    hero_photos, all_photos = get_photo_manifest(
+        accommodation, default_alt=f"{accommodation.property_name} photo"
+    )
 
     context = {
         "accommodation": accommodation,
         "is_demo": False,
-        "photos": photos,
-        "hero_photos": hero_photos_json,  # Use JSON-serializable version
-        "all_photos": all_photos_json,  # Use JSON-serializable version
-        "hero_photos_objects": hero_photos,  # Keep objects for template rendering
-        "all_photos_objects": all_photos,  # Keep objects for template rendering
-        "total_photos": total_photos,
+        "hero_photos": hero_photos,
+        "all_photos": all_photos,
+        "total_photos": len(all_photos),
         "checkin": checkin,
         "checkout": checkout,
         "adults": adults,
@@ -912,641 +938,9 @@ def accommodation_detail(request, id):
 
 def book_accommodation(request, id):
     """Booking page for accommodation - collect traveler information"""
-    # Demo accommodations data
-    demo_accommodations = [
-        {
-            "id": "1",
-            "name": "Luxury Beach Resort & Spa",
-            "location": "Maldives",
-            "description": "Experience paradise at our beachfront resort with private villas, world-class spa, and stunning ocean views.",
-            "price": 450,
-            "currency": "USD",
-            "rating": 4.8,
-            "reviews": 1250,
-            "type": "resort",
-            "amenities": ["WiFi", "Pool", "Spa", "Beach Access", "Restaurant"],
-            "image": "https://images.unsplash.com/photo-1571003123894-1f0594d2b5d9?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 2,
-            "bathrooms": 2,
-            "max_guests": 4,
-            "room_type": "Villa with Ocean View",
-            "cancellation_policy": "Free cancellation up to 24 hours",
-            "check_in_time": "14:00",
-            "check_out_time": "12:00",
-            "property_highlights": [
-                "Private beach access",
-                "24/7 concierge",
-                "Spa treatments included",
-                "Daily housekeeping",
-            ],
-        },
-        {
-            "id": "2",
-            "name": "Boutique City Hotel Downtown",
-            "location": "Dubai, UAE",
-            "description": "Charming boutique hotel in the heart of the city with modern design, rooftop bar, and easy access to attractions.",
-            "price": 250,
-            "currency": "USD",
-            "rating": 4.6,
-            "reviews": 890,
-            "type": "hotel",
-            "amenities": ["WiFi", "Gym", "Rooftop Bar", "Concierge", "Business Center"],
-            "image": "https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 1,
-            "bathrooms": 1,
-            "max_guests": 2,
-            "room_type": "Deluxe City View Room",
-            "cancellation_policy": "Free cancellation up to 48 hours",
-            "check_in_time": "15:00",
-            "check_out_time": "11:00",
-            "property_highlights": [
-                "Burj Khalifa views",
-                "Metro station nearby",
-                "Business center",
-                "Fitness center",
-            ],
-        },
-        {
-            "id": "3",
-            "name": "Mountain View Chalet",
-            "location": "Swiss Alps, Switzerland",
-            "description": "Rustic mountain chalet with stunning alpine views and modern amenities for the perfect mountain retreat.",
-            "price": 350,
-            "currency": "USD",
-            "rating": 4.9,
-            "reviews": 567,
-            "type": "chalet",
-            "amenities": [
-                "WiFi",
-                "Fireplace",
-                "Hot Tub",
-                "Mountain Views",
-                "Ski Access",
-            ],
-            "image": "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 3,
-            "bathrooms": 2,
-            "max_guests": 6,
-            "room_type": "Alpine Chalet",
-            "cancellation_policy": "Free cancellation up to 7 days",
-            "check_in_time": "16:00",
-            "check_out_time": "10:00",
-            "property_highlights": [
-                "Ski-in/ski-out access",
-                "Wood-burning fireplace",
-                "Private hot tub",
-                "Mountain views",
-            ],
-        },
-        {
-            "id": "4",
-            "name": "Historic Riad Marrakech",
-            "location": "Marrakech, Morocco",
-            "description": "Traditional Moroccan riad in the heart of the medina with authentic architecture and modern comforts.",
-            "price": 180,
-            "currency": "USD",
-            "rating": 4.7,
-            "reviews": 745,
-            "type": "riad",
-            "amenities": [
-                "WiFi",
-                "Courtyard",
-                "Traditional Decor",
-                "Rooftop Terrace",
-                "Hammam",
-            ],
-            "image": "https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 4,
-            "bathrooms": 3,
-            "max_guests": 8,
-            "room_type": "Traditional Riad Suite",
-            "cancellation_policy": "Free cancellation up to 3 days",
-            "check_in_time": "14:00",
-            "check_out_time": "12:00",
-            "property_highlights": [
-                "Medina location",
-                "Traditional Moroccan architecture",
-                "Rooftop terrace",
-                "Hammam spa",
-            ],
-        },
-        {
-            "id": "5",
-            "name": "Overwater Bungalow Paradise",
-            "location": "Bora Bora, French Polynesia",
-            "description": "Luxurious overwater bungalow with direct lagoon access and breathtaking sunset views.",
-            "price": 650,
-            "currency": "USD",
-            "rating": 4.9,
-            "reviews": 423,
-            "type": "bungalow",
-            "amenities": [
-                "WiFi",
-                "Private Deck",
-                "Lagoon Access",
-                "Butler Service",
-                "Snorkeling",
-            ],
-            "image": "https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 1,
-            "bathrooms": 1,
-            "max_guests": 2,
-            "room_type": "Overwater Bungalow",
-            "cancellation_policy": "Free cancellation up to 14 days",
-            "check_in_time": "14:00",
-            "check_out_time": "11:00",
-            "property_highlights": [
-                "Crystal clear lagoon",
-                "Sunset views",
-                "Private butler service",
-                "Snorkeling equipment",
-            ],
-        },
-        {
-            "id": "6",
-            "name": "Urban Loft Apartment",
-            "location": "Tokyo, Japan",
-            "description": "Modern loft apartment in trendy Shibuya district with city views and contemporary design.",
-            "price": 120,
-            "currency": "USD",
-            "rating": 4.5,
-            "reviews": 1100,
-            "type": "apartment",
-            "amenities": [
-                "WiFi",
-                "Kitchen",
-                "City Views",
-                "Washing Machine",
-                "Near Subway",
-            ],
-            "image": "https://images.unsplash.com/photo-1522708323590-d24dbb6b0267?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 1,
-            "bathrooms": 1,
-            "max_guests": 3,
-            "room_type": "Modern Loft",
-            "cancellation_policy": "Free cancellation up to 5 days",
-            "check_in_time": "15:00",
-            "check_out_time": "10:00",
-            "property_highlights": [
-                "Shibuya district",
-                "City skyline views",
-                "Fully equipped kitchen",
-                "Subway access",
-            ],
-        },
-        {
-            "id": "7",
-            "name": "Desert Oasis Camp",
-            "location": "Sahara Desert, Morocco",
-            "description": "Authentic Bedouin camp in the heart of the Sahara with traditional tents and star-filled skies.",
-            "price": 85,
-            "currency": "USD",
-            "rating": 4.7,
-            "reviews": 892,
-            "type": "camp",
-            "amenities": [
-                "Traditional Meals",
-                "Campfire",
-                "Desert Views",
-                "Guided Tours",
-                "Bedouin Hospitality",
-            ],
-            "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 1,
-            "bathrooms": 1,
-            "max_guests": 2,
-            "room_type": "Traditional Bedouin Tent",
-            "cancellation_policy": "Free cancellation up to 7 days",
-            "check_in_time": "16:00",
-            "check_out_time": "12:00",
-            "property_highlights": [
-                "Starry night skies",
-                "Traditional Bedouin experience",
-                "Camel treks available",
-                "Authentic Moroccan cuisine",
-            ],
-        },
-        {
-            "id": "8",
-            "name": "Lake Como Villa",
-            "location": "Lake Como, Italy",
-            "description": "Elegant villa overlooking Lake Como with private gardens and stunning mountain views.",
-            "price": 420,
-            "currency": "USD",
-            "rating": 4.8,
-            "reviews": 634,
-            "type": "villa",
-            "amenities": [
-                "WiFi",
-                "Private Garden",
-                "Lake Views",
-                "Swimming Pool",
-                "Boat Dock",
-            ],
-            "image": "https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 4,
-            "bathrooms": 3,
-            "max_guests": 8,
-            "room_type": "Lakefront Villa",
-            "cancellation_policy": "Free cancellation up to 10 days",
-            "check_in_time": "16:00",
-            "check_out_time": "10:00",
-            "property_highlights": [
-                "Private lake access",
-                "Mountain views",
-                "Professional chef available",
-                "Boat included",
-            ],
-        },
-        {
-            "id": "9",
-            "name": "Santorini Cave Hotel",
-            "location": "Santorini, Greece",
-            "description": "Unique cave hotel carved into volcanic rock with caldera views and traditional Cycladic architecture.",
-            "price": 280,
-            "currency": "USD",
-            "rating": 4.6,
-            "reviews": 756,
-            "type": "hotel",
-            "amenities": [
-                "WiFi",
-                "Caldera Views",
-                "Infinity Pool",
-                "Spa Services",
-                "Restaurant",
-            ],
-            "image": "https://images.unsplash.com/photo-1613395877344-13d4a8e0d49e?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 1,
-            "bathrooms": 1,
-            "max_guests": 2,
-            "room_type": "Cave Suite with Caldera View",
-            "cancellation_policy": "Free cancellation up to 7 days",
-            "check_in_time": "14:00",
-            "check_out_time": "11:00",
-            "property_highlights": [
-                "Volcanic cave architecture",
-                "Sunset caldera views",
-                "Infinity pool",
-                "Traditional Greek breakfast",
-            ],
-        },
-        {
-            "id": "10",
-            "name": "Amazon Rainforest Lodge",
-            "location": "Amazon Rainforest, Brazil",
-            "description": "Eco-lodge deep in the Amazon with guided jungle walks and authentic indigenous experiences.",
-            "price": 195,
-            "currency": "USD",
-            "rating": 4.5,
-            "reviews": 423,
-            "type": "lodge",
-            "amenities": [
-                "Eco-Friendly",
-                "Jungle Tours",
-                "Indigenous Guides",
-                "Sustainable Dining",
-                "Wildlife Viewing",
-            ],
-            "image": "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 2,
-            "bathrooms": 2,
-            "max_guests": 4,
-            "room_type": "Jungle Bungalow",
-            "cancellation_policy": "Free cancellation up to 14 days",
-            "check_in_time": "12:00",
-            "check_out_time": "11:00",
-            "property_highlights": [
-                "Sustainable tourism",
-                "Indigenous community support",
-                "Wildlife encounters",
-                "Eco-friendly practices",
-            ],
-        },
-        {
-            "id": "11",
-            "name": "Icelandic Glacier Retreat",
-            "location": "Vatnajökull, Iceland",
-            "description": "Glass-domed igloo on a glacier with northern lights views and ice cave explorations.",
-            "price": 380,
-            "currency": "USD",
-            "rating": 4.9,
-            "reviews": 345,
-            "type": "igloo",
-            "amenities": [
-                "Northern Lights Views",
-                "Glacier Access",
-                "Ice Cave Tours",
-                "Thermal Bath",
-                "Arctic Dining",
-            ],
-            "image": "https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 1,
-            "bathrooms": 1,
-            "max_guests": 2,
-            "room_type": "Glass Igloo Suite",
-            "cancellation_policy": "Free cancellation up to 14 days",
-            "check_in_time": "16:00",
-            "check_out_time": "11:00",
-            "property_highlights": [
-                "Glass dome ceiling",
-                "Northern lights viewing",
-                "Glacier hiking",
-                "Ice cave exploration",
-            ],
-        },
-        {
-            "id": "12",
-            "name": "Parisian Haussmann Apartment",
-            "location": "Paris, France",
-            "description": "Elegant 19th-century apartment in a Haussmann building with original moldings and modern updates.",
-            "price": 220,
-            "currency": "USD",
-            "rating": 4.7,
-            "reviews": 678,
-            "type": "apartment",
-            "amenities": [
-                "WiFi",
-                "Kitchen",
-                "Historic Architecture",
-                "Concierge",
-                "Laundry Service",
-            ],
-            "image": "https://images.unsplash.com/photo-1522708323590-d24dbb6b0267?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 2,
-            "bathrooms": 1,
-            "max_guests": 4,
-            "room_type": "Haussmann Apartment",
-            "cancellation_policy": "Free cancellation up to 5 days",
-            "check_in_time": "15:00",
-            "check_out_time": "10:00",
-            "property_highlights": [
-                "Historic 6th arrondissement",
-                "Walking distance to Louvre",
-                "Original architectural details",
-                "Concierge service",
-            ],
-        },
-        {
-            "id": "13",
-            "name": "Taj Mahal Palace Hotel",
-            "location": "Mumbai, India",
-            "description": "Iconic colonial-era hotel with opulent architecture, sea-facing rooms, and legendary hospitality.",
-            "price": 320,
-            "currency": "USD",
-            "rating": 4.8,
-            "reviews": 1234,
-            "type": "hotel",
-            "amenities": [
-                "WiFi",
-                "Sea Views",
-                "Spa",
-                "Multiple Restaurants",
-                "Business Center",
-            ],
-            "image": "https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 1,
-            "bathrooms": 1,
-            "max_guests": 2,
-            "room_type": "Sea View Deluxe Room",
-            "cancellation_policy": "Free cancellation up to 7 days",
-            "check_in_time": "14:00",
-            "check_out_time": "12:00",
-            "property_highlights": [
-                "Gateway of India views",
-                "Colonial architecture",
-                "Award-winning restaurants",
-                "Royal heritage",
-            ],
-        },
-        {
-            "id": "14",
-            "name": "Great Barrier Reef Resort",
-            "location": "Cairns, Australia",
-            "description": "Luxury resort with direct reef access, marine biology center, and underwater observatories.",
-            "price": 480,
-            "currency": "USD",
-            "rating": 4.9,
-            "reviews": 567,
-            "type": "resort",
-            "amenities": [
-                "Reef Access",
-                "Marine Biology Center",
-                "Diving Center",
-                "Spa",
-                "Multiple Pools",
-            ],
-            "image": "https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 2,
-            "bathrooms": 2,
-            "max_guests": 4,
-            "room_type": "Reef View Suite",
-            "cancellation_policy": "Free cancellation up to 10 days",
-            "check_in_time": "14:00",
-            "check_out_time": "11:00",
-            "property_highlights": [
-                "Direct reef access",
-                "Underwater observatory",
-                "Marine research center",
-                "Diving certification courses",
-            ],
-        },
-        {
-            "id": "15",
-            "name": "Scottish Highlands Castle",
-            "location": "Scottish Highlands, Scotland",
-            "description": "Historic castle in the Scottish Highlands with lochs, mountains, and traditional hospitality.",
-            "price": 395,
-            "currency": "USD",
-            "rating": 4.7,
-            "reviews": 456,
-            "type": "castle",
-            "amenities": ["WiFi", "Fireplace", "Loch Views", "Whisky Bar", "Gardens"],
-            "image": "https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 5,
-            "bathrooms": 4,
-            "max_guests": 10,
-            "room_type": "Castle Suite",
-            "cancellation_policy": "Free cancellation up to 14 days",
-            "check_in_time": "16:00",
-            "check_out_time": "11:00",
-            "property_highlights": [
-                "Historic castle architecture",
-                "Loch and mountain views",
-                "Whisky tasting experiences",
-                "Private gardens",
-            ],
-        },
-        {
-            "id": "16",
-            "name": "Patagonia Glacier Lodge",
-            "location": "Torres del Paine, Chile",
-            "description": "Remote lodge in Patagonia with glacier views, hiking trails, and authentic Chilean hospitality.",
-            "price": 265,
-            "currency": "USD",
-            "rating": 4.6,
-            "reviews": 389,
-            "type": "lodge",
-            "amenities": [
-                "Glacier Views",
-                "Hiking Trails",
-                "Fireplace",
-                "Local Cuisine",
-                "Guide Services",
-            ],
-            "image": "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 3,
-            "bathrooms": 2,
-            "max_guests": 6,
-            "room_type": "Glacier View Cabin",
-            "cancellation_policy": "Free cancellation up to 10 days",
-            "check_in_time": "15:00",
-            "check_out_time": "11:00",
-            "property_highlights": [
-                "Torres del Paine views",
-                "Guided hiking tours",
-                "Authentic Patagonian cuisine",
-                "Sustainable practices",
-            ],
-        },
-        {
-            "id": "17",
-            "name": "Venetian Canal Palace",
-            "location": "Venice, Italy",
-            "description": "Historic palace on the Grand Canal with Renaissance architecture and modern luxury amenities.",
-            "price": 550,
-            "currency": "USD",
-            "rating": 4.8,
-            "reviews": 723,
-            "type": "palace",
-            "amenities": [
-                "Canal Views",
-                "Private Boat",
-                "Historic Architecture",
-                "Spa",
-                "Fine Dining",
-            ],
-            "image": "https://images.unsplash.com/photo-1531572753322-ad063cecc140?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 3,
-            "bathrooms": 3,
-            "max_guests": 6,
-            "room_type": "Canal View Palace Suite",
-            "cancellation_policy": "Free cancellation up to 14 days",
-            "check_in_time": "14:00",
-            "check_out_time": "11:00",
-            "property_highlights": [
-                "Grand Canal location",
-                "Renaissance architecture",
-                "Private boat service",
-                "Michelin-star dining",
-            ],
-        },
-        {
-            "id": "18",
-            "name": "Bali Rice Terrace Villa",
-            "location": "Ubud, Bali, Indonesia",
-            "description": "Luxurious villa nestled in rice terraces with traditional Balinese architecture and spa facilities.",
-            "price": 195,
-            "currency": "USD",
-            "rating": 4.7,
-            "reviews": 891,
-            "type": "villa",
-            "amenities": [
-                "Rice Terrace Views",
-                "Private Pool",
-                "Spa",
-                "Traditional Architecture",
-                "Yoga Pavilion",
-            ],
-            "image": "https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 3,
-            "bathrooms": 3,
-            "max_guests": 6,
-            "room_type": "Rice Terrace Villa",
-            "cancellation_policy": "Free cancellation up to 7 days",
-            "check_in_time": "14:00",
-            "check_out_time": "12:00",
-            "property_highlights": [
-                "UNESCO rice terraces",
-                "Traditional Balinese design",
-                "Daily yoga sessions",
-                "Organic farm-to-table dining",
-            ],
-        },
-        {
-            "id": "19",
-            "name": "New York Penthouse",
-            "location": "Manhattan, New York, USA",
-            "description": "Ultra-luxury penthouse with Central Park views, private terrace, and 24/7 concierge service.",
-            "price": 850,
-            "currency": "USD",
-            "rating": 4.9,
-            "reviews": 234,
-            "type": "penthouse",
-            "amenities": [
-                "Central Park Views",
-                "Private Terrace",
-                "Concierge",
-                "Spa Bathroom",
-                "Chef Service",
-            ],
-            "image": "https://images.unsplash.com/photo-1522708323590-d24dbb6b0267?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 3,
-            "bathrooms": 3,
-            "max_guests": 6,
-            "room_type": "Central Park Penthouse",
-            "cancellation_policy": "Free cancellation up to 14 days",
-            "check_in_time": "15:00",
-            "check_out_time": "11:00",
-            "property_highlights": [
-                "Central Park views",
-                "Private rooftop terrace",
-                "24/7 concierge",
-                "Personal chef service",
-            ],
-        },
-        {
-            "id": "20",
-            "name": "Safari Luxury Tent Camp",
-            "location": "Serengeti, Tanzania",
-            "description": "Luxury safari camp with canvas tents, private decks, and unparalleled wildlife viewing opportunities.",
-            "price": 425,
-            "currency": "USD",
-            "rating": 4.8,
-            "reviews": 567,
-            "type": "camp",
-            "amenities": [
-                "Wildlife Viewing",
-                "Private Decks",
-                "Guided Safaris",
-                "Butler Service",
-                "Luxury Camping",
-            ],
-            "image": "https://images.unsplash.com/photo-1544551763-46a013bb70d5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "bedrooms": 1,
-            "bathrooms": 1,
-            "max_guests": 2,
-            "room_type": "Luxury Safari Tent",
-            "cancellation_policy": "Free cancellation up to 21 days",
-            "check_in_time": "14:00",
-            "check_out_time": "11:00",
-            "property_highlights": [
-                "Big Five wildlife viewing",
-                "Private viewing decks",
-                "Guided safari drives",
-                "Authentic Maasai cultural experiences",
-            ],
-        },
-    ]
-
     # Find the accommodation by ID - first try demo accommodations
-    accommodation = None
-    is_demo = False
-    
-    for acc in demo_accommodations:
-        if str(acc["id"]) == str(id):
-            accommodation = acc
-            is_demo = True
-            break
+    accommodation = demo_booking_accommodations.get(str(id))
+    is_demo = accommodation is not None
 
     # If not found in demos, try database
     if not accommodation:
@@ -1722,56 +1116,16 @@ def tour_detail(request, id):
         # If tour not found, redirect to tours list
         return redirect("core:tours")
 
-    # Get photos for this tour, ordered by display_order
-    photos = TourPhoto.objects.filter(
-        tour=tour, visibility__in=["public", "hidden"]
-    ).order_by("display_order", "id")
-
-    # Separate hero photos (first 6 or those marked as is_hero=True)
-    hero_photos_queryset = photos.filter(is_hero=True)[:6]
-    if not hero_photos_queryset:
-        hero_photos_queryset = photos[:6]
-
-    # All photos for lightbox
-    all_photos_queryset = photos
-
-    # Convert QuerySets to serializable lists for template
-    hero_photos = []
-    for photo in hero_photos_queryset:
-        hero_photos.append(
-            {
-                "id": photo.id,
-                "image_url": photo.get_image_url("large"),
-                "alt_text": photo.alt_text or photo.title or f"{tour.tour_name} photo",
-                "title": photo.title,
-                "caption": photo.caption,
-                "display_order": photo.display_order,
-                "is_hero": photo.is_hero,
-            }
-        )
-
-    all_photos = []
-    for photo in all_photos_queryset:
-        all_photos.append(
-            {
-                "id": photo.id,
-                "image_url": photo.get_image_url("large"),
-                "alt_text": photo.alt_text or photo.title or f"{tour.tour_name} photo",
-                "title": photo.title,
-                "caption": photo.caption,
-                "display_order": photo.display_order,
-                "is_hero": photo.is_hero,
-            }
-        )
-
-    # Total photos count
-    total_photos = len(all_photos)
+    # Ordered photos and hero subset, cached per tour
+    hero_photos, all_photos = get_photo_manifest(
+        tour, default_alt=f"{tour.tour_name} photo"
+    )
 
     context = {
         "tour": tour,
         "hero_photos": hero_photos,
         "all_photos": all_photos,
-        "total_photos": total_photos,
+        "total_photos": len(all_photos),
     }
 
     return render(request, "core/tour_detail.html", context)
@@ -2056,7 +1410,12 @@ def create_tour(request):
             photos = request.FILES.getlist("photos")
             for index, photo in enumerate(photos):
                 TourPhoto.objects.create(
-                    tour=tour, image=photo, is_primary=(index == 0), order=index
+                    tour=tour,
+                    original_file=photo,
+                    media_type="image",
+                    is_hero=(index == 0),
+                    display_order=index,
+                    visibility="public",
                 )
 
             if publish_action == "publish":
@@ -2256,8 +1615,6 @@ def countries(request):
             "code": "jordan",
             "description": "Explore the ancient wonders of Jordan, from the rose-red city of Petra to the salty shores of the Dead Sea.",
             "image": "https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80",
-            "accommodations_count": 245,
-            "tours_count": 89,
             "attractions": ["Petra", "Dead Sea", "Wadi Rum", "Jerash", "Amman Citadel"],
         },
         {
@@ -2265,8 +1622,6 @@ def countries(request):
             "code": "cyprus",
             "description": "Discover the Mediterranean paradise of Cyprus with its stunning beaches, ancient history, and vibrant culture.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 312,
-            "tours_count": 156,
             "attractions": [
                 "Nicosia",
                 "Limassol",
@@ -2280,8 +1635,6 @@ def countries(request):
             "code": "greece",
             "description": "Experience the birthplace of Western civilization with its iconic islands, ancient ruins, and delicious cuisine.",
             "image": "https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 567,
-            "tours_count": 234,
             "attractions": ["Athens", "Santorini", "Mykonos", "Crete", "Olympia"],
         },
         {
@@ -2289,8 +1642,6 @@ def countries(request):
             "code": "turkey",
             "description": "Bridge between Europe and Asia, offering rich history, stunning landscapes, and warm hospitality.",
             "image": "https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 423,
-            "tours_count": 198,
             "attractions": [
                 "Istanbul",
                 "Cappadocia",
@@ -2304,8 +1655,6 @@ def countries(request):
             "code": "egypt",
             "description": "Home to the ancient pyramids and pharaohs, with a rich history spanning thousands of years.",
             "image": "https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 389,
-            "tours_count": 167,
             "attractions": ["Pyramids of Giza", "Luxor", "Aswan", "Cairo", "Red Sea"],
         },
         {
@@ -2313,8 +1662,6 @@ def countries(request):
             "code": "morocco",
             "description": "A land of contrasts with bustling souks, stunning deserts, and the majestic Atlas Mountains.",
             "image": "https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 278,
-            "tours_count": 145,
             "attractions": [
                 "Marrakech",
                 "Sahara Desert",
@@ -2328,8 +1675,6 @@ def countries(request):
             "code": "uae",
             "description": "A modern oasis of luxury and innovation, blending traditional Arabian culture with cutting-edge architecture.",
             "image": "https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 892,
-            "tours_count": 345,
             "attractions": [
                 "Burj Khalifa",
                 "Palm Jumeirah",
@@ -2343,8 +1688,6 @@ def countries(request):
             "code": "lebanon",
             "description": "A Mediterranean jewel known for its ancient history, vibrant culture, and stunning coastal beauty.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 234,
-            "tours_count": 156,
             "attractions": [
                 "Beirut",
                 "Baalbek",
@@ -2358,8 +1701,6 @@ def countries(request):
             "code": "qatar",
             "description": "A modern Arabian nation blending rich heritage with world-class luxury and sporting excellence.",
             "image": "https://images.unsplash.com/photo-1539037116277-4db20889f2d4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 167,
-            "tours_count": 89,
             "attractions": [
                 "Doha",
                 "Museum of Islamic Art",
@@ -2373,8 +1714,6 @@ def countries(request):
             "code": "saudi-arabia",
             "description": "The heart of Islam with ancient deserts, modern cities, and sacred pilgrimage sites.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 445,
-            "tours_count": 234,
             "attractions": ["Mecca", "Medina", "Riyadh", "AlUla", "Red Sea Coast"],
         },
         {
@@ -2382,8 +1721,6 @@ def countries(request):
             "code": "kuwait",
             "description": "A modern Gulf state with rich cultural heritage, stunning desert landscapes, and warm hospitality.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 123,
-            "tours_count": 67,
             "attractions": [
                 "Kuwait City",
                 "Kuwait Towers",
@@ -2397,8 +1734,6 @@ def countries(request):
             "code": "bahrain",
             "description": "An island kingdom blending ancient Dilmun civilization with modern Arabian Gulf culture.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 89,
-            "tours_count": 45,
             "attractions": [
                 "Manama",
                 "Bahrain Fort",
@@ -2412,8 +1747,6 @@ def countries(request):
             "code": "oman",
             "description": "An Arabian paradise of stunning deserts, turquoise coasts, and ancient fortresses.",
             "image": "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 156,
-            "tours_count": 78,
             "attractions": [
                 "Muscat",
                 "Nizwa Fort",
@@ -2427,8 +1760,6 @@ def countries(request):
             "code": "syria",
             "description": "Ancient land of civilization with rich history, stunning architecture, and Mediterranean charm.",
             "image": "https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 89,
-            "tours_count": 45,
             "attractions": [
                 "Damascus",
                 "Aleppo",
@@ -2442,8 +1773,6 @@ def countries(request):
             "code": "iraq",
             "description": "Land of ancient Mesopotamia with rich history, archaeological treasures, and cultural heritage.",
             "image": "https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 67,
-            "tours_count": 34,
             "attractions": ["Baghdad", "Babylon", "Uruk", "Karbala", "Erbil Citadel"],
         },
         {
@@ -2451,8 +1780,6 @@ def countries(request):
             "code": "yemen",
             "description": "Ancient land of spices, towering mountains, and rich cultural heritage.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 45,
-            "tours_count": 23,
             "attractions": ["Sana'a", "Socotra Island", "Zabid", "Shibam", "Aden"],
         },
         {
@@ -2460,8 +1787,6 @@ def countries(request):
             "code": "tunisia",
             "description": "North African gem with ancient Carthage ruins, Mediterranean beaches, and vibrant souks.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 234,
-            "tours_count": 156,
             "attractions": [
                 "Tunis",
                 "Carthage",
@@ -2475,8 +1800,6 @@ def countries(request):
             "code": "algeria",
             "description": "Maghreb nation with stunning Sahara landscapes, ancient Roman ruins, and coastal beauty.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 189,
-            "tours_count": 98,
             "attractions": [
                 "Algiers",
                 "Casbah of Algiers",
@@ -2490,8 +1813,6 @@ def countries(request):
             "code": "palestine",
             "description": "Holy Land with ancient Jerusalem, biblical sites, and rich cultural heritage.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 167,
-            "tours_count": 89,
             "attractions": ["Jerusalem", "Bethlehem", "Hebron", "Nazareth", "Dead Sea"],
         },
         {
@@ -2499,8 +1820,6 @@ def countries(request):
             "code": "libya",
             "description": "Ancient land of the Sahara with Roman ruins, Mediterranean coast, and desert adventures.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 145,
-            "tours_count": 78,
             "attractions": [
                 "Tripoli",
                 "Leptis Magna",
@@ -2514,8 +1833,6 @@ def countries(request):
             "code": "sudan",
             "description": "Land of ancient Nubian kingdoms, Nile River cataracts, and diverse wildlife.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 123,
-            "tours_count": 67,
             "attractions": [
                 "Khartoum",
                 "Meroë",
@@ -2528,6 +1845,7 @@ def countries(request):
 
     # Handle search functionality
     search_query = request.GET.get("q", "").strip()
+    apply_country_counts(demo_countries)
     countries = demo_countries
 
     if search_query:
@@ -2558,15 +1876,14 @@ def countries(request):
 
 def destinations(request):
     """Destinations page view - shows available destinations with tour and accommodation counts"""
-    # Demo destinations data (same as countries for now, but can be customized)
+    # Demo destinations data (same as countries for now, but can be customized);
+    # listing counts come from the Country counter columns
     demo_destinations = [
         {
             "name": "Jordan",
             "code": "jordan",
             "description": "Explore the ancient wonders of Jordan, from the rose-red city of Petra to the salty shores of the Dead Sea.",
             "image": "https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80",
-            "accommodations_count": 245,
-            "tours_count": 450,
             "attractions": ["Petra", "Dead Sea", "Wadi Rum", "Jerash", "Amman Citadel"],
         },
         {
@@ -2574,8 +1891,6 @@ def destinations(request):
             "code": "tunisia",
             "description": "Discover the Mediterranean jewel with Roman ruins, Sahara Desert, and ancient Carthage.",
             "image": "https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 298,
-            "tours_count": 142,
             "attractions": [
                 "Carthage",
                 "Sidi Bou Said",
@@ -2589,8 +1904,6 @@ def destinations(request):
             "code": "algeria",
             "description": "Experience North Africa's largest country with ancient Roman cities, stunning Sahara, and Mediterranean coast.",
             "image": "https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 215,
-            "tours_count": 98,
             "attractions": [
                 "Algiers Casbah",
                 "Timgad",
@@ -2604,8 +1917,6 @@ def destinations(request):
             "code": "turkey",
             "description": "Bridge between Europe and Asia, offering rich history, stunning landscapes, and warm hospitality.",
             "image": "https://images.unsplash.com/photo-1524231757912-21f4fe3a7200?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 423,
-            "tours_count": 198,
             "attractions": [
                 "Istanbul",
                 "Cappadocia",
@@ -2619,8 +1930,6 @@ def destinations(request):
             "code": "egypt",
             "description": "Home to the ancient pyramids and pharaohs, with a rich history spanning thousands of years.",
             "image": "https://images.unsplash.com/photo-1539650116574-75c0c6d0b7ef?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 389,
-            "tours_count": 167,
             "attractions": ["Pyramids of Giza", "Luxor", "Aswan", "Cairo", "Red Sea"],
         },
         {
@@ -2628,8 +1937,6 @@ def destinations(request):
             "code": "morocco",
             "description": "A land of contrasts with bustling souks, stunning deserts, and the majestic Atlas Mountains.",
             "image": "https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 278,
-            "tours_count": 145,
             "attractions": [
                 "Marrakech",
                 "Sahara Desert",
@@ -2643,8 +1950,6 @@ def destinations(request):
             "code": "uae",
             "description": "A modern oasis of luxury and innovation, blending traditional Arabian culture with cutting-edge architecture.",
             "image": "https://images.unsplash.com/photo-1512453979798-5ea266f8880c?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 892,
-            "tours_count": 800,
             "attractions": [
                 "Burj Khalifa",
                 "Palm Jumeirah",
@@ -2658,8 +1963,6 @@ def destinations(request):
             "code": "lebanon",
             "description": "A Mediterranean jewel known for its ancient history, vibrant culture, and stunning coastal beauty.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 234,
-            "tours_count": 156,
             "attractions": [
                 "Beirut",
                 "Baalbek",
@@ -2673,8 +1976,6 @@ def destinations(request):
             "code": "qatar",
             "description": "A modern Arabian nation blending rich heritage with world-class luxury and sporting excellence.",
             "image": "https://images.unsplash.com/photo-1539037116277-4db20889f2d4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 167,
-            "tours_count": 89,
             "attractions": [
                 "Doha",
                 "Museum of Islamic Art",
@@ -2688,8 +1989,6 @@ def destinations(request):
             "code": "saudi-arabia",
             "description": "The heart of Islam with ancient deserts, modern cities, and sacred pilgrimage sites.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 445,
-            "tours_count": 234,
             "attractions": ["Mecca", "Medina", "Riyadh", "AlUla", "Red Sea Coast"],
         },
         {
@@ -2697,8 +1996,6 @@ def destinations(request):
             "code": "kuwait",
             "description": "A modern Gulf state with rich cultural heritage, stunning desert landscapes, and warm hospitality.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 123,
-            "tours_count": 67,
             "attractions": [
                 "Kuwait City",
                 "Kuwait Towers",
@@ -2712,8 +2009,6 @@ def destinations(request):
             "code": "bahrain",
             "description": "An island kingdom blending ancient Dilmun civilization with modern Arabian Gulf culture.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 89,
-            "tours_count": 45,
             "attractions": [
                 "Manama",
                 "Bahrain Fort",
@@ -2727,8 +2022,6 @@ def destinations(request):
             "code": "oman",
             "description": "An Arabian paradise of stunning deserts, turquoise coasts, and ancient fortresses.",
             "image": "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 156,
-            "tours_count": 78,
             "attractions": [
                 "Muscat",
                 "Nizwa Fort",
@@ -2742,8 +2035,6 @@ def destinations(request):
             "code": "syria",
             "description": "Ancient land of civilization with rich history, stunning architecture, and Mediterranean charm.",
             "image": "https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 89,
-            "tours_count": 45,
             "attractions": [
                 "Damascus",
                 "Aleppo",
@@ -2757,8 +2048,6 @@ def destinations(request):
             "code": "iraq",
             "description": "Land of ancient Mesopotamia with rich history, archaeological treasures, and cultural heritage.",
             "image": "https://images.unsplash.com/photo-1555992336-fb0d29498b13?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 67,
-            "tours_count": 34,
             "attractions": ["Baghdad", "Babylon", "Uruk", "Karbala", "Erbil Citadel"],
         },
         {
@@ -2766,14 +2055,13 @@ def destinations(request):
             "code": "yemen",
             "description": "Ancient land of spices, towering mountains, and rich cultural heritage.",
             "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-            "accommodations_count": 45,
-            "tours_count": 23,
             "attractions": ["Sana'a", "Socotra Island", "Zabid", "Shibam", "Aden"],
         },
     ]
 
     # Handle search functionality
     search_query = request.GET.get("q", "").strip()
+    apply_country_counts(demo_destinations)
     destinations = demo_destinations
 
     if search_query:
@@ -2969,361 +2257,6 @@ def wishlist(request):
 
 def country_detail(request, country):
     """Country detail page view"""
-    # Demo country data
-    demo_country_details = (
-        {
-            "fes-el-bali-medina": {
-                "id": "fes-el-bali-medina",
-                "name": "Fes el-Bali Medina",
-                "location": "Fez, Morocco",
-                "description": "The oldest walled part of Fez, a UNESCO World Heritage Site, famous for its labyrinthine streets, historic mosques, and vibrant souks.",
-                "long_description": "Fes el-Bali is the ancient medina of Fez, Morocco, dating back to the 9th century. It is one of the world's largest car-free urban areas and a UNESCO World Heritage Site. The medina is home to over 9,000 narrow streets, historic mosques, madrasas, and bustling souks. Visitors can explore traditional Moroccan architecture, artisan workshops, and centuries-old monuments.",
-                "historical_significance": "Founded in the 9th century, Fes el-Bali is the spiritual and cultural heart of Morocco and a major center of Islamic learning.",
-                "cultural_impact": "The medina preserves traditional Moroccan culture, crafts, and religious practices, attracting scholars and travelers for centuries.",
-                "best_time_to_visit": "Spring and autumn for mild weather",
-                "how_to_get_there": "Accessible by taxi or walking from central Fez",
-                "entrance_fees": "Free to enter; some monuments charge small fees",
-                "opening_hours": "Open 24/7; shops and monuments have varying hours",
-                "what_to_wear": "Comfortable shoes; modest clothing",
-                "guided_tours": "Recommended for first-time visitors",
-                "nearby_attractions": [
-                    "Al Quaraouiyine Mosque",
-                    "Bou Inania Madrasa",
-                    "Fes Tanneries",
-                    "Medersa Attarine",
-                ],
-                "facts": [
-                    "Over 9,000 streets and alleys",
-                    "UNESCO World Heritage Site since 1981",
-                    "Home to the world's oldest university",
-                    "No cars allowed inside the medina",
-                    "Famous for its blue gates (Bab Bou Jeloud)",
-                ],
-                "visitor_tips": [
-                    "Hire a local guide to avoid getting lost",
-                    "Try traditional Moroccan street food",
-                    "Visit artisan workshops for handmade crafts",
-                    "Respect local customs and dress modestly",
-                    "Beware of pickpockets in crowded areas",
-                ],
-                "photos": [
-                    "/static/core/images/fes-el-bali.jpg",
-                    "/static/core/images/fes-medina.jpg",
-                    "/static/core/images/fes-gate.jpg",
-                    "/static/core/images/fes-market.jpg",
-                    "/static/core/images/fes-mosque.jpg",
-                    "/static/core/images/fes-souk.jpg",
-                    "/static/core/images/fes-morocco.jpg",
-                    "/static/core/images/fes-el-bali-medina.jpg",
-                ],
-                "coordinates": {"lat": 34.0667, "lng": -4.9833},
-                "annual_visitors": 1000000,
-                "climate": "Mediterranean climate with hot summers and mild winters",
-                "discovery": "Founded in the 9th century by Idris II",
-                "architecture": "Traditional Moroccan and Andalusian styles",
-                "conservation": "Ongoing restoration projects by UNESCO",
-                "health_safety": "Safe for tourists; take care in crowded areas",
-                "key_sites": [
-                    "Al Quaraouiyine Mosque",
-                    "Bou Inania Madrasa",
-                    "Fes Tanneries",
-                    "Medersa Attarine",
-                ],
-                "image": "/static/core/images/fes-el-bali-medina.jpg",
-            },
-            "university-of-al-quaraouiyine-fes": {
-                "id": "university-of-al-quaraouiyine-fes",
-                "name": "University of Al Quaraouiyine",
-                "location": "Fez, Morocco",
-                "description": "The world's oldest continuously operating university, founded in 859 AD, featuring stunning Islamic architecture and historic significance.",
-                "long_description": "The University of Al Quaraouiyine is the world's oldest continuously operating university, founded in 859 AD by Fatima al-Fihri. Located in Fez, Morocco, it was originally a mosque that evolved into a center of learning. The university has educated countless scholars and produced significant contributions to Islamic scholarship, mathematics, and science. While much of the complex is still used as a mosque, parts are open to visitors.",
-                "historical_significance": "Founded in 859 AD, making it older than the University of Bologna (1088) and Oxford University (1096). It served as a major center of Islamic learning during the Golden Age of Islam.",
-                "cultural_impact": "The university represents the Islamic tradition of knowledge and learning, and has influenced educational systems across the Muslim world.",
-                "best_time_to_visit": "Morning hours when the mosque is less crowded",
-                "how_to_get_there": "Located in Fes el-Bali medina; accessible by taxi or walking",
-                "entrance_fees": "Free (exterior only for non-Muslims)",
-                "opening_hours": "Exterior visible during daylight hours; mosque for Muslims only",
-                "what_to_wear": "Modest, conservative clothing covering shoulders and knees",
-                "guided_tours": "Limited tours available; self-guided exterior viewing",
-                "nearby_attractions": [
-                    "Fes el-Bali Medina",
-                    "Bou Inania Madrasa",
-                    "Fes Tanneries",
-                    "Al Attarine Madrasa",
-                ],
-                "facts": [
-                    "Founded in 859 AD by Fatima al-Fihri, daughter of a wealthy merchant",
-                    "World's oldest continuously operating university",
-                    "Originally built as a mosque with an adjacent madrasa",
-                    "Has educated scholars from across the Islamic world",
-                    "UNESCO World Heritage Site as part of Fes el-Bali",
-                ],
-                "visitor_tips": [
-                    "Non-Muslims can only view the exterior architecture",
-                    "Dress modestly and respectfully when near the mosque",
-                    "Visit during prayer times to appreciate the call to prayer",
-                    "The university's library contains rare Islamic manuscripts",
-                    "Combine with other Fes medina sites for a complete experience",
-                ],
-                "photos": [
-                    "/static/core/images/al-quaraouiyine-university.jpg",
-                    "/static/core/images/al-quaraouiyine-mosque.jpg",
-                    "/static/core/images/al-quaraouiyine-architecture.jpg",
-                    "/static/core/images/al-quaraouiyine-fes.jpg",
-                    "/static/core/images/al-quaraouiyine-interior.jpg",
-                    "/static/core/images/al-quaraouiyine-courtyard.jpg",
-                    "/static/core/images/al-quaraouiyine-morocco.jpg",
-                    "/static/core/images/al-quaraouiyine-historic.jpg",
-                ],
-                "coordinates": {"lat": 34.0644, "lng": -4.9747},
-                "annual_visitors": 300000,
-                "climate": "Mediterranean climate with hot summers and mild winters",
-                "discovery": "Founded as a mosque in 859 AD, evolved into a university over centuries",
-                "architecture": "Classical Islamic architecture with Moroccan-Andalusian elements",
-                "conservation": "Protected as part of UNESCO World Heritage Site",
-                "health_safety": "Respect religious site; maintain appropriate behavior",
-                "key_sites": ["Main Mosque", "Madrasa", "Library", "Courtyard"],
-                "image": "/static/core/images/al-quaraouiyine-university.jpg",
-            },
-            "fes-tanneries": {
-                "id": "fes-tanneries",
-                "name": "Fes Tanneries",
-                "location": "Fez, Morocco",
-                "description": "The historic leather tanning district of Fez, where traditional methods have been used for over 1,000 years to produce world-famous Moroccan leather.",
-                "long_description": "The Fes Tanneries are one of the oldest leather tanning districts in the world, with methods unchanged for over 1,000 years. Located in the heart of Fes el-Bali, the tanneries use traditional techniques passed down through generations. Visitors can observe the process from rooftop viewpoints, seeing workers dye and treat leather in large stone vats using natural pigments. The area produces some of the finest leather goods in Morocco.",
-                "historical_significance": "The tanneries have operated continuously since the founding of Fez in the 9th century, representing one of the oldest industrial districts in the world.",
-                "cultural_impact": "The tanneries preserve traditional Moroccan craftsmanship and represent the city's economic heritage as a center of leather production.",
-                "best_time_to_visit": "Morning hours (9 AM - 12 PM) when activity is highest",
-                "how_to_get_there": "Located in Fes el-Bali medina; best accessed with a guide",
-                "entrance_fees": "Free to view from rooftops; small tip expected for guide",
-                "opening_hours": "8:00 AM - 7:00 PM daily, weather permitting",
-                "what_to_wear": "Old clothes (leather dye can stain); comfortable shoes",
-                "guided_tours": "Essential due to the maze-like access and for safety",
-                "nearby_attractions": [
-                    "Fes el-Bali Medina",
-                    "Al Quaraouiyine University",
-                    "Bou Inania Madrasa",
-                    "Souks",
-                ],
-                "facts": [
-                    "Operating for over 1,000 years using traditional methods",
-                    "Uses natural dyes from plants, minerals, and spices",
-                    "Produces leather for bags, jackets, and traditional Moroccan goods",
-                    "Employs hundreds of workers in a family-based industry",
-                    "UNESCO World Heritage Site as part of Fes el-Bali",
-                ],
-                "visitor_tips": [
-                    "Mint leaves help mask the strong tanning odors",
-                    "Wear old clothes as leather dye can stain permanently",
-                    "Visit rooftops for the best views of the tanning process",
-                    "Tip your guide for showing you around the district",
-                    "Be respectful of workers and don't interfere with their activities",
-                ],
-                "photos": [
-                    "/static/core/images/fes-tanneries.jpg",
-                    "/static/core/images/fes-leather.jpg",
-                    "/static/core/images/fes-tanning.jpg",
-                    "/static/core/images/fes-dyeing.jpg",
-                    "/static/core/images/fes-leather-goods.jpg",
-                    "/static/core/images/fes-tannery-rooftop.jpg",
-                    "/static/core/images/fes-morocco.jpg",
-                    "/static/core/images/fes-traditional.jpg",
-                ],
-                "coordinates": {"lat": 34.0617, "lng": -4.9794},
-                "annual_visitors": 400000,
-                "climate": "Mediterranean climate; outdoor process affected by weather",
-                "discovery": "Ancient industry dating back to the founding of Fez",
-                "architecture": "Traditional Moroccan industrial buildings with stone vats",
-                "conservation": "Protected traditional craft with modern safety improvements",
-                "health_safety": "Strong chemical odors; slippery surfaces; follow guide instructions",
-                "key_sites": [
-                    "Tanning vats",
-                    "Dyeing areas",
-                    "Leather drying racks",
-                    "Rooftop viewpoints",
-                ],
-                "image": "/static/core/images/fes-tanneries.jpg",
-            },
-            "hassan-ii-mosque-casablanca": {
-                "id": "hassan-ii-mosque-casablanca",
-                "name": "Hassan II Mosque",
-                "location": "Casablanca, Morocco",
-                "description": "The largest mosque in Morocco and one of the largest in the world, featuring stunning Islamic architecture and ocean views.",
-                "long_description": "The Hassan II Mosque is the largest mosque in Morocco and one of the largest in the world, capable of accommodating 25,000 worshippers. Built between 1987 and 1993, it features the world's tallest minaret at 210 meters and a retractable roof. The mosque combines traditional Islamic architecture with modern engineering, including laser-guided opening of the roof and heated floors. Non-Muslims can visit during guided tours.",
-                "historical_significance": "Built during the reign of King Hassan II to commemorate 60 years of Moroccan independence, the mosque represents modern Moroccan achievement.",
-                "cultural_impact": "The mosque symbolizes Morocco's Islamic heritage and architectural innovation, serving as a major cultural landmark.",
-                "best_time_to_visit": "Morning tours to avoid heat and crowds",
-                "how_to_get_there": "Located on the coast of Casablanca; accessible by taxi",
-                "entrance_fees": "120 MAD (about $12 USD) for non-Muslims",
-                "opening_hours": "9:00 AM - 6:00 PM daily; tours every 30 minutes",
-                "what_to_wear": "Modest clothing covering shoulders and knees; headscarf provided",
-                "guided_tours": "Mandatory guided tours for non-Muslims",
-                "nearby_attractions": [
-                    "Casablanca Corniche",
-                    "Habous Quarter",
-                    "Royal Palace",
-                    "Central Market",
-                ],
-                "facts": [
-                    "Largest mosque in Morocco, seventh largest in the world",
-                    "Can accommodate 25,000 worshippers inside, 80,000 in courtyard",
-                    "Tallest minaret in the world at 210 meters (689 feet)",
-                    "Features a retractable roof that opens for prayer",
-                    "Built between 1987 and 1993 at a cost of $800 million",
-                ],
-                "visitor_tips": [
-                    "Book tours in advance, especially during peak season",
-                    "Dress modestly; headscarves provided for women",
-                    "Remove shoes before entering prayer areas",
-                    "Photography allowed in designated areas only",
-                    "The mosque is especially beautiful when illuminated at night",
-                ],
-                "photos": [
-                    "/static/core/images/hassan-ii-mosque.jpg",
-                    "/static/core/images/hassan-ii-minaret.jpg",
-                    "/static/core/images/hassan-ii-interior.jpg",
-                    "/static/core/images/hassan-ii-architecture.jpg",
-                    "/static/core/images/hassan-ii-casablanca.jpg",
-                    "/static/core/images/hassan-ii-night.jpg",
-                    "/static/core/images/hassan-ii-details.jpg",
-                    "/static/core/images/hassan-ii-morocco.jpg",
-                ],
-                "coordinates": {"lat": 33.6083, "lng": -7.6319},
-                "annual_visitors": 200000,
-                "climate": "Mediterranean climate with mild temperatures year-round",
-                "discovery": "Opened to the public in 1993 after completion",
-                "architecture": "Modern Islamic architecture with traditional Moroccan elements",
-                "conservation": "Well-maintained modern structure with advanced engineering",
-                "health_safety": "Large, well-maintained facility with security measures",
-                "key_sites": [
-                    "Main Prayer Hall",
-                    "Minaret",
-                    "Courtyard",
-                    "Ablution Areas",
-                ],
-                "image": "/static/core/images/hassan-ii-mosque.jpg",
-            },
-            "casablanca-corniche": {
-                "id": "casablanca-corniche",
-                "name": "Casablanca Corniche",
-                "location": "Casablanca, Morocco",
-                "description": "A scenic waterfront promenade along the Atlantic coast, featuring modern architecture, parks, and the iconic Hassan II Mosque.",
-                "long_description": "The Casablanca Corniche is a scenic waterfront promenade along the Atlantic coast, stretching for several kilometers. Built in the 20th century, it features modern architecture, parks, restaurants, and the iconic Hassan II Mosque. The corniche offers stunning ocean views, jogging paths, and is a popular spot for locals and tourists alike. It represents Casablanca's modern development and serves as the city's recreational and social hub.",
-                "historical_significance": "Developed in the 20th century during the French colonial period and post-independence modernization of Casablanca.",
-                "cultural_impact": "The Corniche represents modern Moroccan urban development and serves as a symbol of Casablanca's cosmopolitan character.",
-                "best_time_to_visit": "Evening for sunset views and cooler temperatures",
-                "how_to_get_there": "Located along the coast; accessible by taxi or public transport",
-                "entrance_fees": "Free to walk and enjoy the promenade",
-                "opening_hours": "24/7 access; businesses have varying hours",
-                "what_to_wear": "Casual clothing; light jacket for evenings",
-                "guided_tours": "Optional; self-guided exploration recommended",
-                "nearby_attractions": [
-                    "Hassan II Mosque",
-                    "Mohammed V Square",
-                    "Habous Quarter",
-                    "Twin Center",
-                ],
-                "facts": [
-                    "Stretches for several kilometers along the Atlantic coast",
-                    "Features the world's tallest minaret at Hassan II Mosque",
-                    "Popular spot for jogging, cycling, and recreational activities",
-                    "Includes modern parks, restaurants, and entertainment venues",
-                    "Represents Casablanca's modern urban development",
-                ],
-                "visitor_tips": [
-                    "Visit at sunset for spectacular ocean views",
-                    "Try fresh seafood at the corniche restaurants",
-                    "Safe for walking and jogging at any time",
-                    "Great spot for people-watching and local culture",
-                    "Combine with Hassan II Mosque for a complete experience",
-                ],
-                "photos": [
-                    "/static/core/images/casablanca-corniche.jpg",
-                    "/static/core/images/casablanca-coast.jpg",
-                    "/static/core/images/casablanca-hassan-ii.jpg",
-                    "/static/core/images/casablanca-promenade.jpg",
-                    "/static/core/images/casablanca-ocean.jpg",
-                    "/static/core/images/casablanca-sunset.jpg",
-                    "/static/core/images/casablanca-morocco.jpg",
-                    "/static/core/images/casablanca-modern.jpg",
-                ],
-                "coordinates": {"lat": 33.6083, "lng": -7.6319},
-                "annual_visitors": 5000000,
-                "climate": "Mediterranean climate with mild temperatures and ocean breezes",
-                "discovery": "Developed as part of Casablanca's modernization in the 20th century",
-                "architecture": "Modern Moroccan architecture with colonial and contemporary influences",
-                "conservation": "Well-maintained urban waterfront with ongoing development",
-                "health_safety": "Generally safe public area with good lighting and security",
-                "key_sites": [
-                    "Hassan II Mosque",
-                    "Parks and gardens",
-                    "Restaurants",
-                    "Jogging paths",
-                ],
-                "image": "/static/core/images/casablanca-corniche.jpg",
-            },
-            "merzouga-sahara-desert": {
-                "id": "merzouga-sahara-desert",
-                "name": "Merzouga Sahara Desert",
-                "location": "Merzouga, Morocco",
-                "description": "Experience the stunning Erg Chebbi dunes in Merzouga, offering camel treks, desert camps, and spectacular Sahara Desert landscapes.",
-                "long_description": "Merzouga is located at the edge of the Erg Chebbi dunes, some of the highest and most spectacular sand dunes in Morocco. The area offers an authentic desert experience with traditional Berber camps, camel treks, and stunning sunsets over the golden sands. Visitors can spend nights in luxury desert camps, ride camels across the dunes, and experience traditional Berber hospitality and cuisine.",
-                "historical_significance": "The region has been home to nomadic Berber tribes for thousands of years and was part of ancient Saharan trade routes.",
-                "cultural_impact": "Merzouga represents the traditional desert culture of Morocco and the Berber way of life in the Sahara.",
-                "best_time_to_visit": "October to April for milder temperatures and desert activities",
-                "how_to_get_there": "Located 55km from Rissani; accessible by bus, taxi, or organized tours",
-                "entrance_fees": "Varies by tour operator; desert camps include meals and activities",
-                "opening_hours": "24/7 access; guided tours available throughout the day",
-                "what_to_wear": "Light, breathable clothing; warm layers for evenings; sturdy shoes",
-                "guided_tours": "Essential for safety and cultural understanding; multi-day options available",
-                "nearby_attractions": [
-                    "Erg Chebbi Dunes",
-                    "Khali Oasis",
-                    "Nomad Heritage Museum",
-                    "Dayet Srji Lake",
-                ],
-                "facts": [
-                    "Home to Erg Chebbi dunes reaching heights of 150 meters",
-                    "Temperatures can drop below freezing at night in winter",
-                    "Traditional Berber camps offer authentic desert experiences",
-                    "Contains ancient fossil sites dating back millions of years",
-                    "Part of the larger Sahara Desert ecosystem",
-                ],
-                "visitor_tips": [
-                    "Book desert tours well in advance during peak season",
-                    "Stay hydrated and use sunscreen even in cooler months",
-                    "Respect Berber customs and ask permission before photographing",
-                    "Try traditional Berber food and participate in cultural activities",
-                    "Consider multi-day stays for the full desert experience",
-                ],
-                "photos": [
-                    "/static/core/images/merzouga-desert.jpg",
-                    "/static/core/images/merzouga-dunes.jpg",
-                    "/static/core/images/merzouga-camel.jpg",
-                    "/static/core/images/merzouga-camp.jpg",
-                    "/static/core/images/merzouga-sunset.jpg",
-                    "/static/core/images/merzouga-berber.jpg",
-                    "/static/core/images/merzouga-stars.jpg",
-                    "/static/core/images/merzouga-morocco.jpg",
-                ],
-                "coordinates": {"lat": 31.0833, "lng": -4.0167},
-                "annual_visitors": 250000,
-                "climate": "Extreme desert climate with hot days and cold nights",
-                "discovery": "Became a tourist destination in the late 20th century",
-                "architecture": "Traditional Berber tents and modern desert lodges",
-                "conservation": "Protected desert areas with sustainable tourism practices",
-                "health_safety": "Guided tours essential; heat exhaustion risk; scorpion awareness",
-                "key_sites": [
-                    "Erg Chebbi Dunes",
-                    "Desert camps",
-                    "Khali Oasis",
-                    "Fossil sites",
-                ],
-                "image": "/static/core/images/merzouga-desert.jpg",
-            },
-        },
-    )
-
     country_data = countries_data.get(country.lower())
     if not country_data:
         # If country not found, redirect to countries list
@@ -3415,149 +2348,14 @@ def country_detail(request, country):
 
 def demo_accommodation_detail(request, country, slug):
     """Demo accommodation detail page view"""
-    # Demo accommodation data by country and slug
-    demo_accommodations = {
-        "jordan": {
-            "petra-marriotts-wadi-rum-nabatean-resort": {
-                "id": "petra-marriott-wadi-rum",
-                "name": "Petra Marriott's Wadi Rum Nabatean Resort",
-                "location": "Wadi Rum, Jordan",
-                "description": "Experience the magic of Wadi Rum at this luxurious desert resort. Nestled among the stunning red sand dunes and ancient rock formations, this Marriott property offers world-class accommodations with authentic Bedouin hospitality.",
-                "long_description": "Petra Marriott's Wadi Rum Nabatean Resort is a luxurious oasis in the heart of the Jordanian desert. This award-winning resort combines modern luxury with traditional Bedouin culture, offering guests an unforgettable desert experience. The resort features elegantly designed rooms and suites with panoramic views of the dramatic Wadi Rum landscape, a world-class spa, multiple dining options, and guided desert excursions.",
-                "price": 250,
-                "currency": "USD",
-                "rating": 4.8,
-                "reviews": 1247,
-                "type": "resort",
-                "amenities": [
-                    "WiFi",
-                    "Pool",
-                    "Spa",
-                    "Restaurant",
-                    "Desert Tours",
-                    "Fitness Center",
-                    "Concierge",
-                ],
-                "image": "https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                "photos": [
-                    "https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1522708323590-d24dbb6b0267?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                ],
-                "bedrooms": 2,
-                "bathrooms": 2,
-                "max_guests": 4,
-                "room_type": "Desert View Suite",
-                "cancellation_policy": "Free cancellation up to 24 hours",
-                "check_in_time": "14:00",
-                "check_out_time": "12:00",
-                "property_highlights": [
-                    "Stunning desert views",
-                    "Authentic Bedouin experience",
-                    "Guided desert safaris",
-                    "World-class spa facilities",
-                ],
-            },
-            "movenpick-resort-petra": {
-                "id": "movenpick-resort-petra",
-                "name": "Mövenpick Resort Petra",
-                "location": "Petra, Jordan",
-                "description": "Located just steps from the ancient city of Petra, this resort offers modern luxury with breathtaking views of the rose-red rock formations and easy access to one of the world's greatest archaeological wonders.",
-                "long_description": "Mövenpick Resort Petra provides the perfect base for exploring the ancient Nabatean city. This contemporary resort features spacious rooms with private balconies overlooking the Petra mountains, multiple restaurants serving international and local cuisine, a large swimming pool, and a fitness center. The resort's convenient location allows guests to walk to the Petra entrance, making it ideal for visitors wanting to maximize their time exploring this UNESCO World Heritage Site.",
-                "price": 180,
-                "currency": "USD",
-                "rating": 4.6,
-                "reviews": 892,
-                "type": "resort",
-                "amenities": [
-                    "WiFi",
-                    "Pool",
-                    "Restaurant",
-                    "Fitness Center",
-                    "Concierge",
-                    "Petra Views",
-                    "Room Service",
-                ],
-                "image": "https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80",
-                "photos": [
-                    "https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80",
-                    "https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                ],
-                "bedrooms": 1,
-                "bathrooms": 1,
-                "max_guests": 2,
-                "room_type": "Petra View Room",
-                "cancellation_policy": "Free cancellation up to 48 hours",
-                "check_in_time": "15:00",
-                "check_out_time": "11:00",
-                "property_highlights": [
-                    "Walking distance to Petra",
-                    "Mountain views",
-                    "Multiple dining options",
-                    "Petra expert guides available",
-                ],
-            },
-            "kempinski-hotel-ishtar-dead-sea": {
-                "id": "kempinski-hotel-ishtar-dead-sea",
-                "name": "Kempinski Hotel Ishtar Dead Sea",
-                "location": "Dead Sea, Jordan",
-                "description": "Luxury resort on the shores of the Dead Sea offering mineral-rich mud treatments, floating experiences in the buoyant waters, and stunning views of the desert landscape.",
-                "long_description": "Kempinski Hotel Ishtar Dead Sea is a luxurious beachfront resort offering the ultimate Dead Sea experience. This five-star property features spacious rooms and suites with private balconies, a private beach area with mineral-rich mud for therapeutic treatments, multiple swimming pools, a world-class spa, and panoramic views of the Jordan Valley. The resort provides the perfect setting for relaxation and rejuvenation in one of the world's most unique natural environments.",
-                "price": 220,
-                "currency": "USD",
-                "rating": 4.7,
-                "reviews": 756,
-                "type": "resort",
-                "amenities": [
-                    "WiFi",
-                    "Pool",
-                    "Spa",
-                    "Private Beach",
-                    "Restaurant",
-                    "Fitness Center",
-                    "Dead Sea Access",
-                ],
-                "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                "photos": [
-                    "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                ],
-                "bedrooms": 1,
-                "bathrooms": 1,
-                "max_guests": 2,
-                "room_type": "Dead Sea View Room",
-                "cancellation_policy": "Free cancellation up to 7 days",
-                "check_in_time": "14:00",
-                "check_out_time": "12:00",
-                "property_highlights": [
-                    "Private Dead Sea beach",
-                    "Therapeutic mud treatments",
-                    "Floating experiences",
-                    "Desert valley views",
-                ],
-            },
-        }
-    }
-
     # Get the accommodation data
-    country_data = demo_accommodations.get(country.lower())
+    country_data = demo_accommodation_details.get(country.lower())
     if not country_data:
         return redirect("core:countries")
 
     accommodation = country_data.get(slug)
     if not accommodation:
-        return redirect("country_detail", country=country)
+        return redirect("core:country_detail", country=country)
 
     # Create photo dictionaries for the template
     photos_urls = accommodation.get("photos", [accommodation.get("image")])
@@ -3596,149 +2394,14 @@ def demo_accommodation_detail(request, country, slug):
 
 def demo_tour_detail(request, country, slug):
     """Demo tour detail page view"""
-    # Demo tour data by country and slug
-    demo_tours = {
-        "jordan": {
-            "petra-full-day-tour": {
-                "id": "petra-full-day-tour",
-                "name": "Petra Full Day Tour",
-                "location": "Petra, Jordan",
-                "description": "Explore the ancient Nabatean city of Petra on a comprehensive full-day tour. Walk through the Siq canyon, marvel at the Treasury, and discover the hidden wonders of this UNESCO World Heritage Site.",
-                "long_description": "Join our expert-guided full-day tour of Petra, one of the world's most spectacular archaeological sites. Your journey begins with a scenic drive from your hotel, followed by a walk through the narrow Siq canyon that leads to the magnificent Treasury building. Continue exploring the ancient city with visits to the Monastery, Royal Tombs, and other hidden treasures. Learn about the Nabatean civilization that carved this city from rose-red rock over 2,000 years ago. The tour includes entrance fees, professional guide, transportation, and lunch.",
-                "duration": "8 hours",
-                "price": 85,
-                "currency": "USD",
-                "rating": 4.9,
-                "reviews": 1247,
-                "type": "cultural",
-                "inclusions": [
-                    "Professional guide",
-                    "Entrance fees",
-                    "Transportation",
-                    "Lunch",
-                    "Bottled water",
-                    "Hotel pickup",
-                ],
-                "image": "https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80",
-                "photos": [
-                    "https://images.unsplash.com/photo-1555396273-367ea4eb4db5?ixlib=rb-4.0.3&auto=format&fit=crop&w=2074&q=80",
-                    "https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                ],
-                "max_participants": 15,
-                "min_participants": 2,
-                "age_restrictions": "Suitable for all ages",
-                "difficulty": "Moderate",
-                "highlights": [
-                    "Siq Canyon entrance",
-                    "The Treasury (Al-Khazneh)",
-                    "Monastery (Ad Deir)",
-                    "Royal Tombs",
-                    "Ancient water systems",
-                ],
-                "itinerary": "8:00 AM - Hotel pickup\n9:00 AM - Arrive at Petra\n9:30 AM - Enter through Siq Canyon\n10:30 AM - Explore Treasury and lower city\n12:00 PM - Lunch break\n1:00 PM - Visit Monastery and upper city\n3:00 PM - Free time for exploration\n4:30 PM - Return to hotel",
-                "cancellation_policy": "Free cancellation up to 24 hours",
-            },
-            "wadi-rum-desert-safari": {
-                "id": "wadi-rum-desert-safari",
-                "name": "Wadi Rum Desert Safari",
-                "location": "Wadi Rum, Jordan",
-                "description": "Experience the stunning desert landscape of Wadi Rum on an exciting safari adventure. Drive through massive sand dunes, explore ancient rock formations, and enjoy traditional Bedouin hospitality.",
-                "long_description": 'Embark on an unforgettable desert safari through Wadi Rum, also known as the "Valley of the Moon." This protected area features towering sandstone mountains, red sand dunes, and rock formations that have been shaped by wind and water over millions of years. Your experienced Bedouin guide will take you on a 4x4 vehicle tour through the desert, stopping at key sites including Lawrence of Arabia\'s house, natural rock bridges, and ancient petroglyphs. Enjoy traditional Bedouin tea, learn about desert survival techniques, and witness a spectacular desert sunset.',
-                "duration": "6 hours",
-                "price": 65,
-                "currency": "USD",
-                "rating": 4.8,
-                "reviews": 892,
-                "type": "adventure",
-                "inclusions": [
-                    "4x4 vehicle tour",
-                    "Bedouin guide",
-                    "Traditional tea",
-                    "Entrance fees",
-                    "Hotel pickup/drop-off",
-                    "Bottled water",
-                ],
-                "image": "https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                "photos": [
-                    "https://images.unsplash.com/photo-1533105079780-92b9be482077?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                ],
-                "max_participants": 6,
-                "min_participants": 2,
-                "age_restrictions": "Minimum age 8 years",
-                "difficulty": "Easy to Moderate",
-                "highlights": [
-                    "Lawrence of Arabia house",
-                    "Rock bridges and arches",
-                    "Ancient petroglyphs",
-                    "Sand dune exploration",
-                    "Traditional Bedouin camp",
-                ],
-                "itinerary": "2:00 PM - Hotel pickup\n3:00 PM - Arrive at Wadi Rum\n3:30 PM - 4x4 desert tour begins\n4:30 PM - Visit Lawrence house and rock formations\n5:30 PM - Traditional Bedouin tea ceremony\n6:00 PM - Sand dune exploration\n7:00 PM - Sunset viewing\n8:00 PM - Return to hotel",
-                "cancellation_policy": "Free cancellation up to 48 hours",
-            },
-            "dead-sea-experience": {
-                "id": "dead-sea-experience",
-                "name": "Dead Sea Experience",
-                "location": "Dead Sea, Jordan",
-                "description": "Relax and rejuvenate at the lowest point on Earth. Float in the mineral-rich waters, enjoy therapeutic mud treatments, and experience the unique buoyancy of the Dead Sea.",
-                "long_description": "Discover the therapeutic wonders of the Dead Sea on this relaxing full-day experience. Located 400 meters below sea level, the Dead Sea is the lowest point on Earth and contains ten times more salt and minerals than ordinary seawater. Your day includes transportation to the Dead Sea, time to float in the buoyant waters, application of mineral-rich mud for skin therapy, and relaxation at a beach club. Learn about the historical and geological significance of this unique body of water while enjoying the health benefits of its mineral-rich environment.",
-                "duration": "4 hours",
-                "price": 45,
-                "currency": "USD",
-                "rating": 4.7,
-                "reviews": 756,
-                "type": "wellness",
-                "inclusions": [
-                    "Round-trip transportation",
-                    "Beach access",
-                    "Mud treatment",
-                    "Towel and shower facilities",
-                    "Bottled water",
-                    "Hotel pickup",
-                ],
-                "image": "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                "photos": [
-                    "https://images.unsplash.com/photo-1578662996442-48f60103fc96?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1539020140153-e365f8dc0c7a?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1551882547-ff40c63fe5fa?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1506905925346-21bda4d32df4?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1564501049412-61c2a3083791?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                    "https://images.unsplash.com/photo-1540541338287-41700207dee6?ixlib=rb-4.0.3&auto=format&fit=crop&w=2070&q=80",
-                ],
-                "max_participants": 20,
-                "min_participants": 2,
-                "age_restrictions": "Suitable for all ages",
-                "difficulty": "Easy",
-                "highlights": [
-                    "Floating in Dead Sea waters",
-                    "Mineral mud therapy",
-                    "Lowest point on Earth",
-                    "Jordan Valley views",
-                    "Relaxation facilities",
-                ],
-                "itinerary": "9:00 AM - Hotel pickup\n10:00 AM - Arrive at Dead Sea beach\n10:30 AM - Safety briefing and flotation demonstration\n11:00 AM - Free time for swimming and floating\n12:00 PM - Mud treatment application\n1:00 PM - Lunch and relaxation\n2:00 PM - Return to hotel",
-                "cancellation_policy": "Free cancellation up to 24 hours",
-            },
-        }
-    }
-
     # Get the tour data
-    country_data = demo_tours.get(country.lower())
+    country_data = demo_tour_details.get(country.lower())
     if not country_data:
         return redirect("core:countries")
 
     tour = country_data.get(slug)
     if not tour:
-        return redirect("country_detail", country=country)
+        return redirect("core:country_detail", country=country)
 
     # Create photo dictionaries for the template
     photos_urls = tour.get("photos", [tour.get("image")])
@@ -3785,7 +2448,7 @@ def attraction_detail(request, country, slug):
 
     attraction = country_data.get(slug)
     if not attraction:
-        return redirect("country_detail", country=country)
+        return redirect("core:country_detail", country=country)
 
     # Create photo dictionaries for the template
     photos_urls = attraction.get("photos", [attraction.get("image")])
@@ -3796,6 +2459,7 @@ def attraction_detail(request, country, slug):
         photo_dict = {
             "id": idx,
             "image_url": photo_url,
+            "placeholder": photo_placeholders.get(photo_url, ""),
             "alt_text": f"{attraction['name']} photo {idx+1}",
             "title": f"{attraction['name']} - Image {idx+1}",
             "caption": "",
@@ -3809,9 +2473,20 @@ def attraction_detail(request, country, slug):
 
     total_photos = len(all_photos_json)
 
+    # Published stays around the attraction, prefiltered by geohash cell
+    nearby_stays = []
+    coordinates = parse_coordinates(attraction.get("coordinates"))
+    if coordinates:
+        nearby_stays = listings_within_radius(
+            Accommodation.objects.filter(is_published=True, is_active=True),
+            *coordinates,
+            limit=6,
+        )
+
     context = {
         "attraction": attraction,
         "is_demo": True,
+        "nearby_stays": nearby_stays,
         "photos": photos_urls,
         "hero_photos": hero_photos_json,
         "all_photos": all_photos_json,
@@ -3859,18 +2534,30 @@ def bulk_activate_listings(request):
             )
 
         if listing_type == "accommodation":
-            updated = Accommodation.objects.filter(
-                id__in=listing_ids, host=request.user
-            ).update(is_active=True)
+            updated, cities = update_listing_visibility(
+                Accommodation.objects.filter(
+                    id__in=listing_ids, host=request.user
+                ),
+                is_active=True,
+            )
         elif listing_type == "tour":
-            updated = Tour.objects.filter(id__in=listing_ids, host=request.user).update(
-                is_active=True
+            updated, cities = update_listing_visibility(
+                Tour.objects.filter(id__in=listing_ids, host=request.user),
+                is_active=True,
             )
         else:
             return JsonResponse(
                 {"success": False, "error": "Invalid listing type"}, status=400
             )
 
+        # queryset.update() skips the save signals, so refresh the search index
+        # and the autocomplete cities here
+        reindex_listings(
+            Accommodation if listing_type == "accommodation" else Tour, listing_ids
+        )
+        for city, country in cities:
+            destination_index.refresh_city(city, country)
+
         return JsonResponse(
             {
                 "success": True,
@@ -3896,18 +2583,30 @@ def bulk_deactivate_listings(request):
             )
 
         if listing_type == "accommodation":
-            updated = Accommodation.objects.filter(
-                id__in=listing_ids, host=request.user
-            ).update(is_active=False)
+            updated, cities = update_listing_visibility(
+                Accommodation.objects.filter(
+                    id__in=listing_ids, host=request.user
+                ),
+                is_active=False,
+            )
         elif listing_type == "tour":
-            updated = Tour.objects.filter(id__in=listing_ids, host=request.user).update(
-                is_active=False
+            updated, cities = update_listing_visibility(
+                Tour.objects.filter(id__in=listing_ids, host=request.user),
+                is_active=False,
             )
         else:
             return JsonResponse(
                 {"success": False, "error": "Invalid listing type"}, status=400
             )
 
+        # queryset.update() skips the save signals, so refresh the search index
+        # and the autocomplete cities here
+        reindex_listings(
+            Accommodation if listing_type == "accommodation" else Tour, listing_ids
+        )
+        for city, country in cities:
+            destination_index.refresh_city(city, country)
+
         return JsonResponse(
             {
                 "success": True,
@@ -3972,18 +2671,30 @@ def bulk_publish_listings(request):
             )
 
         if listing_type == "accommodation":
-            updated = Accommodation.objects.filter(
-                id__in=listing_ids, host=request.user
-            ).update(is_published=True, is_active=True)
+            updated, cities = update_listing_visibility(
+                Accommodation.objects.filter(
+                    id__in=listing_ids, host=request.user
+                ),
+                is_published=True, is_active=True,
+            )
         elif listing_type == "tour":
-            updated = Tour.objects.filter(id__in=listing_ids, host=request.user).update(
-                is_published=True, is_active=True
+            updated, cities = update_listing_visibility(
+                Tour.objects.filter(id__in=listing_ids, host=request.user),
+                is_published=True, is_active=True,
             )
         else:
             return JsonResponse(
                 {"success": False, "error": "Invalid listing type"}, status=400
             )
 
+        # queryset.update() skips the save signals, so refresh the search index
+        # and the autocomplete cities here
+        reindex_listings(
+            Accommodation if listing_type == "accommodation" else Tour, listing_ids
+        )
+        for city, country in cities:
+            destination_index.refresh_city(city, country)
+
         return JsonResponse(
             {
                 "success": True,
@@ -4009,18 +2720,30 @@ def bulk_unpublish_listings(request):
             )
 
         if listing_type == "accommodation":
-            updated = Accommodation.objects.filter(
-                id__in=listing_ids, host=request.user
-            ).update(is_published=False)
+            updated, cities = update_listing_visibility(
+                Accommodation.objects.filter(
+                    id__in=listing_ids, host=request.user
+                ),
+                is_published=False,
+            )
         elif listing_type == "tour":
-            updated = Tour.objects.filter(id__in=listing_ids, host=request.user).update(
-                is_published=False
+            updated, cities = update_listing_visibility(
+                Tour.objects.filter(id__in=listing_ids, host=request.user),
+                is_published=False,
             )
         else:
             return JsonResponse(
                 {"success": False, "error": "Invalid listing type"}, status=400
             )
 
+        # queryset.update() skips the save signals, so refresh the search index
+        # and the autocomplete cities here
+        reindex_listings(
+            Accommodation if listing_type == "accommodation" else Tour, listing_ids
+        )
+        for city, country in cities:
+            destination_index.refresh_city(city, country)
+
         return JsonResponse(
             {
                 "success": True,
@@ -0,0 +1,128 @@
+"""
+Views for serving resized images
+Photo and static image variants are rendered on first request, kept in the
+disk cache (see image_cache) and served with strong ETags and far-future
+Cache-Control, since every URL carries its source's version.
+"""
+
+import logging
+import os
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.shortcuts import get_object_or_404, redirect
+from django.utils.http import url_has_allowed_host_and_scheme
+from django.views.decorators.http import require_GET
+from PIL import Image
+
+from .image_cache import (
+    FORMATS,
+    PHOTO_KINDS,
+    RESIZE_WIDTHS,
+    cache_key,
+    get_variant,
+    resized_photo_url,
+    resized_static_url,
+    source_version,
+    static_identity,
+)
+from .images import is_stored_original
+from .models import AccommodationPhoto, TourPhoto
+
+logger = logging.getLogger(__name__)
+
+PHOTO_MODELS = {
+    PHOTO_KINDS[model.__name__]: model for model in (AccommodationPhoto, TourPhoto)
+}
+
+STATIC_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Hosts a remote photo original may be redirected to
+REMOTE_IMAGE_HOSTS = set(getattr(settings, "REMOTE_IMAGE_HOSTS", ["images.unsplash.com"]))
+
+
+def _open_variant(key, fmt, width, open_source):
+    """Open a cached variant, rendering it again if it was evicted before it could be opened"""
+    path = get_variant(key, fmt, width, open_source)
+    try:
+        return open(path, "rb")
+    except FileNotFoundError:
+        return open(get_variant(key, fmt, width, open_source), "rb")
+
+
+def _serve_variant(request, identity, width, fmt, open_source):
+    key = cache_key(identity, width, fmt)
+    etag = f'"{key[:32]}"'
+
+    if etag in request.headers.get("If-None-Match", ""):
+        response = HttpResponseNotModified()
+    else:
+        try:
+            variant = _open_variant(key, fmt, width, open_source)
+        except (OSError, Image.DecompressionBombError):
+            raise Http404("Image could not be rendered")
+        except Exception:
+            # Pillow raises assorted errors on corrupt files
+            logger.exception("Could not render %s at %s %s", identity, width, fmt)
+            raise Http404("Image could not be rendered")
+        response = FileResponse(variant, content_type=FORMATS[fmt][1])
+
+    response["ETag"] = etag
+    response["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+def _check_size(width, fmt):
+    if width not in RESIZE_WIDTHS or fmt not in FORMATS:
+        raise Http404("Unsupported size or format")
+
+
+@require_GET
+def resized_photo(request, kind, photo_id, version, width, fmt):
+    """Accommodation or tour photo resized to one of RESIZE_WIDTHS"""
+    model = PHOTO_MODELS.get(kind)
+    if model is None:
+        raise Http404("Unknown photo type")
+    _check_size(width, fmt)
+
+    photo = get_object_or_404(model, pk=photo_id, media_type="image")
+    if not is_stored_original(photo):
+        url = photo.original_file.name
+        if url and url_has_allowed_host_and_scheme(url, REMOTE_IMAGE_HOSTS, require_https=True):
+            # Remote originals are served by their own host
+            return redirect(url)
+        raise Http404("Photo has no image")
+
+    identity = photo.original_file.name
+    if version != source_version(identity):
+        # The photo was replaced; send the client to the current version
+        return redirect(resized_photo_url(photo, width, fmt))
+
+    return _serve_variant(
+        request, identity, width, fmt, lambda: photo.original_file.open("rb")
+    )
+
+
+@require_GET
+def resized_static(request, version, width, fmt, path):
+    """Static image resized to one of RESIZE_WIDTHS"""
+    _check_size(width, fmt)
+    if not path.lower().endswith(STATIC_IMAGE_EXTENSIONS):
+        raise Http404("Not an image")
+
+    try:
+        found = finders.find(path)
+    except SuspiciousFileOperation:
+        found = None
+    if not found:
+        raise Http404("Image not found")
+
+    identity = static_identity(path, os.stat(found))
+    if version != source_version(identity):
+        return redirect(resized_static_url(path, width, fmt))
+
+    return _serve_variant(request, identity, width, fmt, lambda: open(found, "rb"))
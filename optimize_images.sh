@@ -47,8 +47,8 @@ echo ""
 echo "🚀 Starting optimization..."
 echo ""
 
-# Run Python optimization script
-python3 optimize_images.py
+# Run the media optimizer (only new or changed images are converted)
+python3 manage.py optimize_media static/core/images --delete-originals
 
 echo ""
 echo "✅ Done!"